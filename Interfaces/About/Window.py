@@ -10,6 +10,8 @@ These windows are made so that they fit the content rather than the content fits
 from PySide2 import QtWidgets, QtCore
 
 # Local project
+import misc.Constants as ProjectConstants
+from misc.Diagnostics import call_log, worker_stats
 from Interfaces.About.Ui_Info import Ui_Info
 from Interfaces.About.Ui_Credits import Ui_Credits
 
@@ -35,3 +37,69 @@ class CreditsWindow(QtWidgets.QDialog, Ui_Credits):
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
 
         self.setupUi(self)
+
+
+class DiagnosticsWindow(QtWidgets.QDialog):
+    """
+    This class is the window that shows how calls to the node are performing.
+
+    For every endpoint it shows latency percentiles, calls, errors and average payload. It also shows workers waiting
+    and running for every service and how many calls were served by an identical one already in flight.
+    Content is refreshed every second.
+    """
+    columns = ["Service", "Endpoint", "Calls", "Errors", "Avg. payload (B)", "p50 (ms)", "p95 (ms)", "p99 (ms)"]
+
+    def __init__(self, parent: QtWidgets.QWidget):
+        super().__init__(parent, QtCore.Qt.WindowCloseButtonHint)
+
+        # Anti memory leak
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+
+        self.setWindowTitle("Diagnostics")
+        self.resize(800, 400)
+
+        # Setup interface
+        main_layout = QtWidgets.QVBoxLayout(self)
+
+        self.label_workers = QtWidgets.QLabel()
+        main_layout.addWidget(self.label_workers)
+
+        self.label_coalesced = QtWidgets.QLabel()
+        main_layout.addWidget(self.label_coalesced)
+
+        self.tableWidget = QtWidgets.QTableWidget(0, len(self.columns))
+        self.tableWidget.setHorizontalHeaderLabels(self.columns)
+        self.tableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tableWidget.verticalHeader().setVisible(False)
+        self.tableWidget.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
+        main_layout.addWidget(self.tableWidget)
+        # End setup
+
+        refresh_timer = QtCore.QTimer(self)
+        refresh_timer.timeout.connect(self.refresh)
+        refresh_timer.start(1000)
+
+        self.refresh()
+
+    @QtCore.Slot()
+    def refresh(self):
+        queued, running = worker_stats.queued(), worker_stats.running()
+        self.label_workers.setText(
+            "Workers -  " + "   ".join(
+                f"{service}: {queued.get(service, 0)} queued, {running.get(service, 0)} in flight"
+                for service in ProjectConstants.max_threads_per_service
+            )
+        )
+        self.label_coalesced.setText(
+            f"Coalesced calls: {worker_stats.coalesced_rate():.0%} of {worker_stats.keyed_calls()} keyed calls"
+        )
+
+        summary = call_log.summary()
+        self.tableWidget.setRowCount(len(summary))
+        for row, entry in enumerate(summary):
+            values = [
+                entry["service"], entry["endpoint"], str(entry["calls"]), str(entry["errors"]), str(entry["payload"]),
+                f"{entry['p50']:.1f}", f"{entry['p95']:.1f}", f"{entry['p99']:.1f}"
+            ]
+            for column, value in enumerate(values):
+                self.tableWidget.setItem(row, column, QtWidgets.QTableWidgetItem(value))
@@ -8,33 +8,31 @@ from algosdk.encoding import is_valid_address
 import misc.Constants as ProjectConstants
 from misc.Entities import Contact
 from Interfaces.Contacts.ManageContact.Ui_ManageContact import Ui_ManageContact
-from Interfaces.Contacts.Widgets import ContactListWidget
+from Interfaces.Contacts.Widgets import ContactListDelegate
+from Interfaces.Contacts.Thumbnails import ContactThumbnails
 
 # Python standard libraries
 import os
+from functools import lru_cache
 from shutil import copyfile
-from string import ascii_letters, digits
-from random import sample
+from sys import stderr
 
 
 class ContactManaging(QtWidgets.QDialog, Ui_ManageContact):
     """
     This class implements the window to edit / create a contact.
     """
-    character_pool = frozenset(ascii_letters + digits)
-
     @staticmethod
-    def random_file_name(length: int = 16):
-        """
-        Returns a random string of default length = 16 with characters contained inside character_pool.
+    @lru_cache(None)
+    def pixmap(name: str) -> QtGui.QPixmap:
         """
-        return "".join(sample(ContactManaging.character_pool, length))
+        This method returns the image name from the resources.
 
-    # Static images to avoid IO bottleneck
-    icon_valid = QtGui.QPixmap(":icons/valid.png")
-    icon_not_valid = QtGui.QPixmap(":/icons/not_valid.png")
+        Images are static to avoid IO bottleneck. They are created the first time they are needed.
+        """
+        return QtGui.QPixmap(f":/icons/{name}.png")
 
-    def __init__(self, parent: QtWidgets.QWidget, pre_filled: ContactListWidget = None):
+    def __init__(self, parent: QtWidgets.QWidget, pre_filled: Contact = None):
         super().__init__(parent, QtCore.Qt.WindowCloseButtonHint)
 
         # Anti memory leak
@@ -45,7 +43,7 @@ class ContactManaging(QtWidgets.QDialog, Ui_ManageContact):
         # This value is set if the user selects a new picture.
         self.external_pic_full_path = None
 
-        # This value holds the new ContactListWidget that will be read from ContactsWindow.
+        # This value holds the new Contact that will be read from ContactsWindow.
         self.return_value = None
 
         self.setupUi(self)
@@ -57,18 +55,18 @@ class ContactManaging(QtWidgets.QDialog, Ui_ManageContact):
         self.lineEditAction_address = self.lineEdit_Address.addAction(
             QtGui.QIcon(), QtWidgets.QLineEdit.TrailingPosition
         )
-        self.set_label_pixmap(ContactListWidget.pixmap_generic_user)
+        self.set_label_pixmap(ContactListDelegate.generic_user())
 
         # Initial state
         if pre_filled:
             self.setWindowTitle("Edit contact")
-            self.lineEdit_Name.setText(pre_filled.contact.name)
-            self.lineEdit_Address.setText(pre_filled.contact.info)
-            if pre_filled.contact.pic_name:
+            self.lineEdit_Name.setText(pre_filled.name)
+            self.lineEdit_Address.setText(pre_filled.info)
+            if pre_filled.pic_name:
                 self.set_label_pixmap(
-                    QtGui.QPixmap(os.path.join(ProjectConstants.fullpath_thumbnails, pre_filled.contact.pic_name))
+                    QtGui.QPixmap(os.path.join(ProjectConstants.fullpath_thumbnails, pre_filled.pic_name))
                 )
-                self.external_pic_full_path = ProjectConstants.fullpath_thumbnails + pre_filled.contact.pic_name
+                self.external_pic_full_path = os.path.join(ProjectConstants.fullpath_thumbnails, pre_filled.pic_name)
                 self.pushButton_Delete.setEnabled(True)
 
         # Connections
@@ -82,42 +80,44 @@ class ContactManaging(QtWidgets.QDialog, Ui_ManageContact):
     @QtCore.Slot()
     def accept(self):
         """
-        This method sets the return value of self with a valid widget constructed following user inputs and then calls
+        This method sets the return value of self with a valid contact constructed following user inputs and then calls
         super().accept()
         """
-        # If there is a picture for the widget
+        # If there is a picture for the contact
         if self.external_pic_full_path:
             # Picture has to be updated if:
-            # - widget had no picture or
-            # - widget picture is different from the one selected now
-            # This truth evaluation is risky because at this point self.pre_filled.contact.pic_name could be None
-            #  so trying to concatenate a string + NoneType would result in an error. However if
-            #  self.pre_filled.contact.pic_name is None the first condition would return True and, since it's an
-            #  or statement, that's enough to stop evaluating the truth and the second evaluation should never
-            #  take place.
-            #  If it does take place then self.pre_filled.contact.pic_name was not None and the concatenation
-            #  can take place.
-            #  I am just learning not that this process is called short-circuit.
+            # - contact is new or had no picture or
+            # - contact picture is different from the one selected now
             if (
-                    not self.pre_filled.contact.pic_name or
-                    self.external_pic_full_path != ProjectConstants.fullpath_thumbnails + self.pre_filled.contact.pic_name
+                    not self.pre_filled or not self.pre_filled.pic_name or
+                    self.external_pic_full_path !=
+                    os.path.join(ProjectConstants.fullpath_thumbnails, self.pre_filled.pic_name)
             ):
-                old_extension = "." + self.external_pic_full_path.split(".")[-1]
-                while True:
-                    rnd_file_name = self.random_file_name() + old_extension
-                    if not os.path.exists(os.path.join(ProjectConstants.fullpath_thumbnails, rnd_file_name)):
-                        break
-                copyfile(
-                    self.external_pic_full_path,
-                    os.path.join(ProjectConstants.fullpath_thumbnails, rnd_file_name)
-                )
-                new_pic_name = rnd_file_name
+                # Pictures are named after their content. This way a picture chosen for many contacts (i.e.: the logo
+                #  of a company) is saved only once.
+                try:
+                    new_pic_hash = ContactThumbnails.content_hash(self.external_pic_full_path)
+                    new_pic_name = new_pic_hash + os.path.splitext(self.external_pic_full_path)[1].lower()
+                    new_pic_full_path = os.path.join(ProjectConstants.fullpath_thumbnails, new_pic_name)
+                    if not os.path.exists(new_pic_full_path):
+                        # Copied aside and then moved so that a picture is never found half written.
+                        copyfile(self.external_pic_full_path, new_pic_full_path + ".tmp")
+                        os.replace(new_pic_full_path + ".tmp", new_pic_full_path)
+                except Exception as e:
+                    if __debug__:
+                        print(type(e), str(e), file=stderr)
+                    QtWidgets.QMessageBox.critical(self, "Could not save picture", str(e))
+                    return
+                # The thumbnail is derived right away so that the contact list never has to decode the full picture.
+                new_pic_hash = ContactThumbnails.create(new_pic_full_path, new_pic_hash)
             else:
-                new_pic_name = self.pre_filled.contact.pic_name
+                new_pic_name = self.pre_filled.pic_name
+                new_pic_hash = self.pre_filled.pic_hash
         else:
             new_pic_name = None
-        self.return_value = ContactListWidget(
-            Contact(new_pic_name, self.lineEdit_Name.text(), self.lineEdit_Address.text())
+            new_pic_hash = None
+        self.return_value = Contact(
+            new_pic_name, self.lineEdit_Name.text(), self.lineEdit_Address.text(), new_pic_hash
         )
 
         super().accept()
@@ -135,11 +135,11 @@ class ContactManaging(QtWidgets.QDialog, Ui_ManageContact):
         }
 
         self.lineEditAction_name.setIcon(
-            self.icon_valid if states["name"] else self.icon_not_valid
+            self.pixmap("valid" if states["name"] else "not_valid")
         )
 
         self.lineEditAction_address.setIcon(
-            self.icon_valid if states["address"] else self.icon_not_valid
+            self.pixmap("valid" if states["address"] else "not_valid")
         )
 
         self.buttonBox.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(
@@ -165,7 +165,7 @@ class ContactManaging(QtWidgets.QDialog, Ui_ManageContact):
     @QtCore.Slot()
     def pushbutton_delete(self):
         self.external_pic_full_path = None
-        self.set_label_pixmap(ContactListWidget.pixmap_generic_user)
+        self.set_label_pixmap(ContactListDelegate.generic_user())
         self.pushButton_Delete.setEnabled(False)
 
     def set_label_pixmap(self, pixmap: QtGui.QPixmap):
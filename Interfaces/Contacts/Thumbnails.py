@@ -0,0 +1,260 @@
+"""
+This file contains the caches of contact thumbnails, on disk and in memory.
+
+Pictures chosen by the user can be several MB. The small circular thumbnail shown in the contact list is derived from
+them only once, when the picture is chosen, and saved as a PNG of a few KB in misc.Storage.thumbnail_store().
+Thumbnails are keyed by the hash of the picture content. See misc.Entities.Contact.thumbnail_file_name
+"""
+
+
+# PySide 2
+from PySide2 import QtGui, QtCore
+
+# Local project
+import misc.Constants as ProjectConstants
+from misc.Entities import Contact, WorkerPriority
+from misc.Functions import find_main_window, ProjectException
+from misc.Storage import thumbnail_store
+
+# Python standard libraries
+from collections import OrderedDict
+from functools import lru_cache, partial
+from hashlib import sha256
+from os import path
+from sys import stderr
+from typing import Optional, Tuple
+
+
+class ContactThumbnails:
+    """
+    This class derives thumbnails of contact pictures and keeps them on disk.
+
+    Only QImage is used so that thumbnails can be derived outside of the GUI thread.
+    """
+    hash_chunk_size = 2**20
+
+    @staticmethod
+    @lru_cache(1)
+    def image_user_mask() -> QtGui.QImage:
+        """
+        This method returns the mask of thumbnails, black where the picture is visible. It's static and created the
+        first time it's needed.
+        """
+        return QtGui.QImage(":/masks/user_pic_mask.png")
+
+    @staticmethod
+    def content_hash(file: str) -> str:
+        digest = sha256()
+        with open(file, 'rb') as f:
+            for chunk in iter(lambda: f.read(ContactThumbnails.hash_chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def derive(image: QtGui.QImage) -> QtGui.QImage:
+        """
+        This method returns the circular thumbnail of a full picture.
+        """
+        size = ProjectConstants.thumbnail_size
+
+        # Crop the maximum square possible from the middle of the picture.
+        width, height = image.width(), image.height()
+        side = min(width, height)
+        result = image.copy(QtCore.QRect(width//2 - side//2, height//2 - side//2, side, side)).scaled(
+            size, size, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation
+        ).convertToFormat(QtGui.QImage.Format_ARGB32)
+
+        # Clipping a circle. The mask is scaled smoothly so the border of the circle is anti-aliased.
+        alpha = ContactThumbnails.image_user_mask().scaled(
+            size, size, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation
+        ).convertToFormat(QtGui.QImage.Format_Grayscale8)
+        alpha.invertPixels()
+        result.setAlphaChannel(alpha)
+
+        return result
+
+    @staticmethod
+    def create(picture_path: str, pic_hash: str = None) -> Optional[str]:
+        """
+        This method derives the thumbnail of a picture, unless it already exists, and returns the hash of the picture.
+        The hash is computed unless it's given.
+
+        It returns None if the picture can't be read.
+        """
+        if pic_hash is None:
+            try:
+                pic_hash = ContactThumbnails.content_hash(picture_path)
+            except Exception as e:
+                if __debug__:
+                    print(type(e), str(e), file=stderr)
+                return None
+
+        key = Contact.thumbnail_file_name(pic_hash)
+        if key in thumbnail_store():
+            return pic_hash
+
+        image = QtGui.QImage(picture_path)
+        if image.isNull():
+            print("Could not read picture {}".format(picture_path), file=stderr)
+            return None
+
+        buffer = QtCore.QBuffer()
+        buffer.open(QtCore.QIODevice.WriteOnly)
+        if not ContactThumbnails.derive(image).save(buffer, "PNG"):
+            print("Could not encode thumbnail of {}".format(picture_path), file=stderr)
+            return None
+
+        try:
+            thumbnail_store().store(key, bytes(buffer.data()))
+        except Exception as e:
+            if __debug__:
+                print(type(e), str(e), file=stderr)
+            print("Could not save thumbnail of {}".format(picture_path), file=stderr)
+            return None
+
+        return pic_hash
+
+    @staticmethod
+    def read(pic_hash: str) -> QtGui.QImage:
+        """
+        This method returns the thumbnail with pic_hash. The image is null if there's no such thumbnail.
+        """
+        data = thumbnail_store().read(Contact.thumbnail_file_name(pic_hash))
+        if data is None:
+            return QtGui.QImage()
+        return QtGui.QImage.fromData(QtCore.QByteArray(data), "PNG")
+
+    @staticmethod
+    def load(pic_name: str, pic_hash: Optional[str]) -> Tuple[str, QtGui.QImage]:
+        """
+        This method returns the hash of a contact picture and its thumbnail.
+
+        The thumbnail is derived again if it was never derived, was deleted or is from an older version.
+        This method is meant to run inside a worker.
+        """
+        if pic_hash:
+            image = ContactThumbnails.read(pic_hash)
+            if not image.isNull():
+                return pic_hash, image
+
+        pic_hash = ContactThumbnails.create(path.join(ProjectConstants.fullpath_thumbnails, pic_name))
+        if pic_hash is None:
+            raise ProjectException(f"Could not derive thumbnail of {pic_name}")
+
+        image = ContactThumbnails.read(pic_hash)
+        if image.isNull():
+            raise ProjectException(f"Could not read thumbnail of {pic_name}")
+
+        return pic_hash, image
+
+
+class ContactThumbnailCache(QtCore.QObject):
+    """
+    This class holds the thumbnails of the contacts being shown and loads the missing ones in background.
+
+    A contact is painted with the generic user until its thumbnail is ready. Only the most recently used thumbnails
+    are kept in memory so a long list doesn't keep every pixmap resident.
+    Thumbnails are read by workers of MainWindow in the "thumbnails" thread pool.
+    """
+    # New thumbnails are ready to be painted.
+    loaded = QtCore.Signal()
+    # A contact got a new pic_hash because its thumbnail had to be derived again.
+    contact_changed = QtCore.Signal(Contact)
+
+    capacity = 500
+
+    def __init__(self, parent: QtCore.QObject):
+        super().__init__(parent)
+
+        # key -> QPixmap from least to most recently used. (See key())
+        self.pixmaps = OrderedDict()
+        # key -> worker for the thumbnails being loaded.
+        self.workers = dict()
+
+    @staticmethod
+    def key(contact: Contact) -> str:
+        """
+        This method returns the key of the thumbnail of contact. Contacts with the same picture share the same pixmap.
+
+        Contacts saved before thumbnails were cached don't know the hash of their picture until it's loaded.
+        """
+        return contact.pic_hash or contact.pic_name
+
+    @staticmethod
+    @lru_cache(1)
+    def placeholder() -> QtGui.QPixmap:
+        """
+        This method returns the generic user cut as a thumbnail. It's static and derived the first time it's needed.
+        """
+        return QtGui.QPixmap.fromImage(ContactThumbnails.derive(QtGui.QImage(":/icons/generic_user.png")))
+
+    def pixmap(self, contact: Contact) -> QtGui.QPixmap:
+        """
+        This method returns the thumbnail of contact if it's ready. Otherwise it asks for it and returns the generic
+        user in the meantime.
+        """
+        if not contact.pic_name:
+            return self.placeholder()
+
+        key = self.key(contact)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            self.request(contact, WorkerPriority.foreground)
+            return self.placeholder()
+
+        self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def request(self, contact: Contact, priority: int = WorkerPriority.background):
+        """
+        This method starts loading the thumbnail of contact unless it's already loaded or being loaded.
+        """
+        key = self.key(contact)
+        if not contact.pic_name or key in self.pixmaps or key in self.workers:
+            return
+
+        self.workers[key] = find_main_window().start_worker(
+            partial(ContactThumbnails.load, contact.pic_name, contact.pic_hash),
+            partial(self.load_success, key, contact),
+            partial(self.load_error, key),
+            service="thumbnails", priority=priority, timeout=None
+        )
+
+    def load_success(self, key: str, contact: Contact, result: Tuple[str, QtGui.QImage]):
+        self.workers.pop(key, None)
+
+        pic_hash, image = result
+        if pic_hash != contact.pic_hash:
+            contact.pic_hash = pic_hash
+            self.contact_changed.emit(contact)
+
+        # QPixmap can only be created in the GUI thread.
+        self.pixmaps[self.key(contact)] = QtGui.QPixmap.fromImage(image)
+        while len(self.pixmaps) > self.capacity:
+            self.pixmaps.popitem(last=False)
+
+        self.loaded.emit()
+
+    def load_error(self, key: str, e: Exception):
+        self.workers.pop(key, None)
+        if __debug__:
+            print(type(e), str(e), file=stderr)
+
+        # The generic user is painted from now on instead of trying again at every paint.
+        self.pixmaps[key] = self.placeholder()
+
+    def forget(self, contact: Contact):
+        key = self.key(contact)
+        self.pixmaps.pop(key, None)
+        worker = self.workers.pop(key, None)
+        if worker:
+            worker.cancel()
+
+    @QtCore.Slot()
+    def cancel(self):
+        """
+        This method stops every thumbnail being loaded. Nothing is signaled after this.
+        """
+        for worker in self.workers.values():
+            worker.cancel()
+        self.workers.clear()
@@ -1,9 +1,9 @@
 """
-Custom classes for QListWidget in ContactsWindow.
+Custom classes for the list in ContactsWindow.
 
-Subclass of QWidget is the actual representation.
-Subclass of QListWidgetItem is the item that goes into the list and holds the space for the widget.
-It also offers functionality for the ordering of the items inside ContactsWindow contact list.
+The list holds misc.Entities.Contact objects inside a misc.Models.ObjectListModel, in the order given by the search
+(misc.Search.ContactIndex): most relevant first, or by name when there's no query.
+Subclass of QStyledItemDelegate is the actual representation of a contact.
 """
 
 
@@ -12,88 +12,89 @@ from PySide2 import QtWidgets, QtGui, QtCore
 
 # Local project
 import misc.Constants as ProjectConstants
-from misc.Entities import Contact
+from misc.Models import ObjectListModel
+from Interfaces.Contacts.Thumbnails import ContactThumbnailCache
 
 # Python standard libraries
-from os import path
+from functools import lru_cache
 
 
-class ContactListItem(QtWidgets.QListWidgetItem):
+class ContactListDelegate(QtWidgets.QStyledItemDelegate):
     """
-    Item used in the contacts list.
+    This delegate represents a contact inside ContactWindow.
 
-    Most of its features are only available when a ContactListWidget is inside it.
+    It paints the profile picture, the name and the address of the contact. Nothing is allocated for rows that are not
+    visible. Profile pictures come from thumbnail_cache which loads them in background, the view is updated as they
+    arrive.
     """
-    def __lt__(self, other) -> bool:
-        return self.listWidget().itemWidget(self) < other.listWidget().itemWidget(other)
+    pic_size = ProjectConstants.thumbnail_size
+    margins = QtCore.QMargins(9, 9, 9, 9)
+    spacing = 5
 
+    @staticmethod
+    @lru_cache(1)
+    def generic_user() -> QtGui.QPixmap:
+        """
+        This method returns the picture of contacts without one. It's static and created the first time it's needed.
+        """
+        return QtGui.QPixmap(":/icons/generic_user.png")
 
-class ContactListWidget(QtWidgets.QWidget):
-    """
-    This widget represents a contact inside ContactWindow.
-    """
-    pixmap_generic_user = QtGui.QPixmap(":/icons/generic_user.png")
-    bitmap_user_mask = QtGui.QBitmap.fromImage(QtGui.QImage(":/masks/user_pic_mask.png"))
-
-    def __init__(self, contact: Contact):
-        super().__init__()
-
-        # We might need to extract this reference to the contact when we want to delete the contact and not just
-        #  the widget.
-        self.contact = contact
-
-        # Setup interface
-        main_layout = QtWidgets.QHBoxLayout(self)
-
-        self.label_pixmap = QtWidgets.QLabel()
-        self.label_pixmap.setPixmap(
-                ContactListWidget.derive_profile_pic(
-                    QtGui.QPixmap(path.join(ProjectConstants.fullpath_thumbnails, self.contact.pic_name))
-                    if self.contact.pic_name else
-                    self.pixmap_generic_user
-            )
-        )
-        main_layout.addWidget(self.label_pixmap)
+    def __init__(self, parent: QtWidgets.QAbstractItemView, thumbnail_cache: ContactThumbnailCache):
+        super().__init__(parent)
 
-        main_layout.addSpacing(5)
+        self.thumbnail_cache = thumbnail_cache
+        self.thumbnail_cache.loaded.connect(parent.viewport().update)
 
-        label_layout = QtWidgets.QVBoxLayout()
-        main_layout.addLayout(label_layout)
+        self.font_name = QtGui.QFont(parent.font())
+        self.font_name.setPointSize(13)
+        self.font_info = QtGui.QFont(parent.font())
+        self.font_info.setPointSize(8)
 
-        #   Name label
-        self.label_name = QtWidgets.QLabel(self.contact.name)
-        self.label_name.setStyleSheet("font: 13pt;")
-        label_layout.addWidget(self.label_name)
+        self.metrics_name = QtGui.QFontMetrics(self.font_name)
+        self.metrics_info = QtGui.QFontMetrics(self.font_info)
 
-        #   Info label
-        self.label_info = QtWidgets.QLabel(self.contact.info)
-        self.label_info.setStyleSheet("font: 8pt;")
-        label_layout.addWidget(self.label_info)
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        return QtCore.QSize(
+            self.pic_size + self.spacing + self.metrics_info.horizontalAdvance("W" * 58) +
+            self.margins.left() + self.margins.right(),
+            max(self.pic_size, self.metrics_name.height() + self.metrics_info.height()) +
+            self.margins.top() + self.margins.bottom()
+        )
 
-        main_layout.addStretch(1)
-        # End setup
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex):
+        contact = index.data(ObjectListModel.ObjectRole)
 
-    def __lt__(self, other) -> bool:
-        return self.contact.name < other.contact.name
+        # Background, selection and focus are drawn by the style just like for any other list.
+        style = option.widget.style() if option.widget else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, option, painter, option.widget)
 
-    @staticmethod
-    def derive_profile_pic(pixmap: QtGui.QPixmap) -> QtGui.QPixmap:
-        """
-        This method returns the icon for the profile picture starting from a full picture.
-        """
-        # Crop a the maximum square possible from the middle of the QPixmap.
-        width, height = pixmap.width(), pixmap.height()
-        side = min(width, height)
-        square_top_left_corner = QtCore.QPoint(width//2 - side//2, height//2 - side//2)
-        cropping_rect = QtCore.QRect(square_top_left_corner, QtCore.QSize(side, side))
-        result = pixmap.copy(cropping_rect)
-
-        # Clipping a circle
-        temp_mask = ContactListWidget.bitmap_user_mask.scaled(
-            side, side,
-            QtCore.Qt.IgnoreAspectRatio,
-            QtCore.Qt.SmoothTransformation
+        rect = option.rect.marginsRemoved(self.margins)
+        painter.drawPixmap(
+            rect.left(), rect.top() + (rect.height() - self.pic_size) // 2, self.thumbnail_cache.pixmap(contact)
+        )
+
+        text_left = rect.left() + self.pic_size + self.spacing
+        text_top = rect.top() + (rect.height() - self.metrics_name.height() - self.metrics_info.height()) // 2
+        text_width = rect.right() - text_left
+        rect_name = QtCore.QRect(text_left, text_top, text_width, self.metrics_name.height())
+        rect_info = QtCore.QRect(text_left, rect_name.bottom() + 1, text_width, self.metrics_info.height())
+
+        painter.save()
+        painter.setPen(
+            option.palette.color(QtGui.QPalette.HighlightedText)
+            if option.state & QtWidgets.QStyle.State_Selected else
+            option.palette.color(QtGui.QPalette.Text)
         )
-        result.setMask(temp_mask)
 
-        return result.scaled(40, 40, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        painter.setFont(self.font_name)
+        painter.drawText(
+            rect_name, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            self.metrics_name.elidedText(contact.name, QtCore.Qt.ElideRight, text_width)
+        )
+
+        painter.setFont(self.font_info)
+        painter.drawText(
+            rect_info, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            self.metrics_info.elidedText(contact.info, QtCore.Qt.ElideMiddle, text_width)
+        )
+        painter.restore()
@@ -15,7 +15,7 @@ from PySide2.QtGui import (QBrush, QColor, QConicalGradient, QCursor, QFont,
     QPixmap, QRadialGradient)
 from PySide2.QtWidgets import *
 
-from misc.Widgets import CustomListWidget
+from misc.Widgets import CustomListView
 
 
 class Ui_ContactsWindow(object):
@@ -39,11 +39,11 @@ class Ui_ContactsWindow(object):
 
         self.verticalLayout.addWidget(self.lineEdit)
 
-        self.listWidget = CustomListWidget(ContactsWindow)
-        self.listWidget.setObjectName(u"listWidget")
-        self.listWidget.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.listView = CustomListView(ContactsWindow)
+        self.listView.setObjectName(u"listView")
+        self.listView.setContextMenuPolicy(Qt.CustomContextMenu)
 
-        self.verticalLayout.addWidget(self.listWidget)
+        self.verticalLayout.addWidget(self.listView)
 
 
         self.retranslateUi(ContactsWindow)
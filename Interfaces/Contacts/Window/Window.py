@@ -8,12 +8,20 @@ from PySide2 import QtWidgets, QtGui, QtCore
 
 # Local project
 from misc.DataStructures import ListJsonContacts
+import misc.Database as Database
+from misc.Entities import Contact, WorkerPriority
+from misc.Models import ObjectListModel
+from misc.Search import ContactIndex
 from Interfaces.Contacts.Window.Ui_Window import Ui_ContactsWindow
-from Interfaces.Contacts.ManageContact.ContactManaging import ContactManaging
-from Interfaces.Contacts.Widgets import ContactListItem, ContactListWidget
+from Interfaces.Contacts.Widgets import ContactListDelegate
+from Interfaces.Contacts.Thumbnails import ContactThumbnailCache
 
 # Python standard libraries
-from functools import partial
+import sqlite3
+from functools import lru_cache, partial
+from itertools import chain
+from os import path
+from sys import stderr
 
 
 # TODO Make sure the window is narrower and the address get collapsed like "AAAAAA.....AAAAAA" if the width exceeds
@@ -25,27 +33,26 @@ class ContactsWindow(QtWidgets.QDialog, Ui_ContactsWindow):
     This class also manage all information about contacts. It will load at the start of the program all permanent
     information about user contacts so that other classes that need those information will find it here.
     """
-    # These icons are static because we want to avoid having to reload them from the disk each time this class is
-    #  instantiated.
-    icon_search = QtGui.QIcon(":/icons/search.png")
-    icon_edit = QtGui.QIcon(":/icons/edit.png")
-    icon_delete = QtGui.QIcon(":/icons/delete.png")
-
-    # This list will host the content of the contacts.json file. This is static because other classes might need to
+    # This list will host the contacts saved in contact_database. This is static because other classes might need to
     #  read contacts and create their own widgets.
     #  However this class will be the only one to load it and change it. Other classes shall only read from it.
-    # A crucial point is that this list gets loaded with the static method load_contacts_json_file as soon as this
-    #  class is done with the definition because other class might need its data even if this class never
-    #  gets instantiated.
+    # A crucial point is that this list gets loaded in background by misc.Database.contact_loader, started by
+    #  MainWindow.initialize. Whoever reads it has to call wait_for_contacts first, even if this class never gets
+    #  instantiated.
     contacts_from_json_file = ListJsonContacts()
+    # Every change to contacts_from_json_file is written here right away. (See misc.Database)
+    contact_database = None
 
-    # We make a list of ContactListWidget static because each item has a profile pic that could create IO bottleneck
-    #  if it has to be loaded each time this class is instantiated.
-    # However we create the list of widget for Contacts only the first time that this class is
-    #  instantiated because only this class needs its ContactListWidget.
-    # This list remains coherent with contacts_from_json_file and DOES NOT need to be fully updated as long as
+    # The search index over contacts is static so that it's built only once for the whole run of the application.
+    # However we create it only the first time that this class is instantiated because only this class needs it.
+    # This index remains coherent with contacts_from_json_file and DOES NOT need to be rebuilt as long as
     #  contacts are managed through this class methods.
-    contact_widgets = list()
+    contact_index = None
+
+    # The list is filtered once the user stops typing for this long.
+    filter_delay_ms = 100
+    # Thumbnails around the visible contacts are loaded once the list stops moving for this long.
+    prefetch_delay_ms = 50
 
     def __init__(self, parent: QtWidgets.QWidget):
         # This line is necessary because a widget gets it's own window if it doesn't have a parent OR
@@ -57,7 +64,19 @@ class ContactsWindow(QtWidgets.QDialog, Ui_ContactsWindow):
 
         self.setupUi(self)
 
-        self.listWidget.set_item_type(ContactListItem)
+        # The list only shows the contacts that match the search bar.
+        self.contact_model = ObjectListModel(self, display=lambda contact: contact.name)
+        self.listView.setModel(self.contact_model)
+        self.thumbnail_cache = ContactThumbnailCache(self)
+        self.listView.setItemDelegate(ContactListDelegate(self.listView, self.thumbnail_cache))
+
+        self.filter_timer = QtCore.QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(self.filter_delay_ms)
+
+        self.prefetch_timer = QtCore.QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(self.prefetch_delay_ms)
 
         # Setup interface
         #   MenuBar
@@ -67,126 +86,188 @@ class ContactsWindow(QtWidgets.QDialog, Ui_ContactsWindow):
         self.menuBar.setNativeMenuBar(False)
 
         #   Search bar
-        self.lineEdit.addAction(self.icon_search, QtWidgets.QLineEdit.LeadingPosition)
+        self.lineEdit.addAction(self.icon("search"), QtWidgets.QLineEdit.LeadingPosition)
         # End setup
 
         # Connections
-        self.lineEdit.textChanged.connect(self.filter_contacts)
-        self.listWidget.customContextMenuRequested.connect(self.show_context_menu)
+        #   Every keystroke restarts the timer so we filter only once the user pauses.
+        self.lineEdit.textChanged.connect(lambda: self.filter_timer.start())
+        self.filter_timer.timeout.connect(self.filter_contacts)
+        #   Visible thumbnails are asked for by the delegate, the ones around them are prefetched.
+        self.listView.verticalScrollBar().valueChanged.connect(lambda: self.prefetch_timer.start())
+        self.contact_model.modelReset.connect(lambda: self.prefetch_timer.start())
+        self.prefetch_timer.timeout.connect(self.prefetch_thumbnails)
+        #   Contacts saved before thumbnails were cached get the hash of their picture when it's first loaded.
+        self.thumbnail_cache.contact_changed.connect(self.save_contact)
+        #   Workers still loading thumbnails must not call back into a closed window.
+        self.finished.connect(self.thumbnail_cache.cancel)
+        self.listView.customContextMenuRequested.connect(self.show_context_menu)
         self.menuBarAction.triggered.connect(self.new_contact)
 
         QtCore.QTimer.singleShot(0, self.setup_logic)
 
-    def setup_logic(self):
-        # Populate contact_widgets with info from json file.
-        if not ContactsWindow.contact_widgets:
-            for contact in ContactsWindow.contacts_from_json_file:
-                ContactsWindow.contact_widgets.append(ContactListWidget(contact))
+    @staticmethod
+    def wait_for_contacts():
+        """
+        This method makes sure that contacts_from_json_file and contact_database are loaded.
 
-        # Populate list
-        for widget in self.contact_widgets:
-            self.listWidget.add_widget(widget)
+        It only blocks if misc.Database.contact_loader is not done yet. If contacts can't be loaded the error is shown
+        and the application quits. The loader only keeps the error, this is where it's reported since this runs in the
+        GUI thread.
+        """
+        loader = Database.contact_loader
+        if loader is None or ContactsWindow.contact_database is not None:
+            return
+
+        try:
+            ContactsWindow.contact_database, ContactsWindow.contacts_from_json_file = loader.result()
+        except Exception as e:
+            if __debug__:
+                print(type(e), str(e), file=stderr)
+            QtWidgets.QMessageBox.critical(
+                None, "Could not load contacts", "Could not load {}\n{}".format(path.basename(loader.file), e)
+            )
+            quit()
+
+    @staticmethod
+    @lru_cache(None)
+    def icon(name: str) -> QtGui.QIcon:
+        """
+        This method returns the icon name from the resources.
+
+        Icons are static because we want to avoid having to reload them from the disk each time this class is
+        instantiated. They are created the first time they are needed.
+        """
+        return QtGui.QIcon(f":/icons/{name}.png")
 
-        # If we enable sorting we get an error when we add an item without widget because list doesn't know
-        #  how to compare ContactsListItem without a ContactsListWidget inside.
-        #  You can't insert the widget inside the item and then insert item inside the list.
-        self.listWidget.sortItems()
+    def setup_logic(self):
+        ContactsWindow.wait_for_contacts()
 
-    def closeEvent(self, arg__1: QtGui.QCloseEvent):
-        # If we don't do this the widgets get deleted from their parent when the window closes.
-        #  Typically this would be fine but since we are storing the widgets statically we don't want them deleted.
-        for contact in ContactsWindow.contact_widgets:
-            contact.setParent(None)
+        # Build the search index with info from json file.
+        if ContactsWindow.contact_index is None:
+            ContactsWindow.contact_index = ContactIndex(ContactsWindow.contacts_from_json_file)
 
-        arg__1.accept()
+        self.filter_contacts()
 
     @QtCore.Slot(QtCore.QPoint)
     def show_context_menu(self, pos: QtCore.QPoint):
-        item = self.listWidget.itemAt(pos)
-        if item:
-            widget = self.listWidget.itemWidget(item)
-
+        contact = self.listView.object_at(pos)
+        if contact:
             menu = QtWidgets.QMenu(self)
-            menu.addAction(self.icon_edit, "Edit", partial(self.edit_contact, item))
-            menu.addAction(self.icon_delete, "Delete", partial(self.delete_contact, item))
+            menu.addAction(self.icon("edit"), "Edit", partial(self.edit_contact, contact))
+            menu.addAction(self.icon("delete"), "Delete", partial(self.delete_contact, contact))
             menu.addAction("Copy address to clipboard", partial(
-                QtGui.QGuiApplication.clipboard().setText, widget.contact.info)
+                QtGui.QGuiApplication.clipboard().setText, contact.info)
             )
 
-            global_pos = self.listWidget.mapToGlobal(pos)
+            global_pos = self.listView.mapToGlobal(pos)
             menu.exec_(global_pos)
 
             # This should get rid of the whole object along with the partial.
             menu.deleteLater()
 
-    @QtCore.Slot(str)
-    def filter_contacts(self, new_text: str):
+    @QtCore.Slot()
+    def filter_contacts(self):
+        """
+        This method shows only those contacts that fit the search bar content.
+        """
+        # Every word typed has to match its own part of the name, in any order. (Eg.: search_text="py mo"
+        #  name="Monty Python") Addresses can be looked up by their beginning.
+        # The best matches come first. (i.e.: beginning of the name, then beginning of a word)
+        self.contact_model.set_objects(self.contact_index.search(self.lineEdit.text()))
+
+    @QtCore.Slot()
+    def prefetch_thumbnails(self):
         """
-        This method show only those ContactListItems that fit the new search bar content. Hides the rest.
+        This method loads in background the thumbnails of the contacts right above and below the visible ones.
+
+        This way they are usually ready by the time the user scrolls to them.
         """
-        new_text_splitted = new_text.split(' ')
-
-        # TODO right now if the user inputs the same word twice it gets mapped to the same word in the contact
-        #  This makes no sense. There should be a bijection between the word typed and substrings in the name.
-        for i in range(self.listWidget.count()):
-            # We do matching this way because "in" operator search for exact correspondence. Instead we would like to
-            #  filter all the item for which every single word matches against some part of label_name. This is because
-            #  the user might look for a contact using a string that doesnt exists in any label_name.
-            #  Eg.: search_text="py mo" label_name="Monty Python"
-            # This is a slightly convoluted way to split the search text into bits separated by space then math each
-            #  of these bits against the widget name. (Both strings get lowered of course)
-            #  Then if every bit matches the item is shown otherwise is hidden.
-            widget = self.listWidget.itemWidget(self.listWidget.item(i))
-            if all([
-                match.lower() in widget.contact.name.lower() for match in new_text_splitted
-            ]):
-                self.listWidget.item(i).setHidden(False)
-            else:
-                self.listWidget.item(i).setHidden(True)
+        rows = self.contact_model.rowCount()
+        viewport = self.listView.viewport().rect()
+        first = self.listView.indexAt(viewport.topLeft()).row()
+        if first == -1:
+            return
+        last = self.listView.indexAt(viewport.bottomLeft()).row()
+        if last == -1:
+            last = rows - 1
+
+        # As many rows as a page in both directions. Rows below first since lists are mostly scrolled down.
+        margin = last - first + 1
+        below, above = range(last + 1, min(last + 1 + margin, rows)), range(max(first - margin, 0), first)
+        for row in chain(below, above):
+            self.thumbnail_cache.request(self.contact_model.object_at(row), WorkerPriority.background)
 
     @QtCore.Slot()
     def new_contact(self):
+        from Interfaces.Contacts.ManageContact.ContactManaging import ContactManaging
         new_contact_window = ContactManaging(self)
 
         if new_contact_window.exec_() == QtWidgets.QDialog.Accepted:
-            new_widget = new_contact_window.return_value
+            new_contact = new_contact_window.return_value
 
-            self.contacts_from_json_file.append(new_widget.contact)
-            self.contact_widgets.append(new_widget)
-            self.listWidget.add_widget(new_widget)
-
-        self.listWidget.sortItems()
+            if not self.write_database(self.contact_database.add, new_contact):
+                return
+            self.contacts_from_json_file.append(new_contact)
+            self.contact_index.add(new_contact)
+            self.filter_contacts()
 
-    @QtCore.Slot(ContactListItem)
-    def edit_contact(self, item: ContactListItem):
-        edit_contact_window = ContactManaging(self, self.listWidget.itemWidget(item))
+    @QtCore.Slot(Contact)
+    def edit_contact(self, old_contact: Contact):
+        from Interfaces.Contacts.ManageContact.ContactManaging import ContactManaging
+        edit_contact_window = ContactManaging(self, old_contact)
 
         if edit_contact_window.exec_() == QtWidgets.QDialog.Accepted:
-            old_widget, new_widget = self.listWidget.itemWidget(item), edit_contact_window.return_value
-            old_contact, new_contact = old_widget.contact, new_widget.contact
+            new_contact = edit_contact_window.return_value
 
-            self.remove_item(item)
+            if not self.write_database(self.contact_database.replace, old_contact, new_contact):
+                return
+            self.contact_index.remove(old_contact)
             self.contacts_from_json_file.remove(old_contact)
-            if old_contact.pic_name != new_contact.pic_name:
-                old_contact.release()
             self.contacts_from_json_file.append(new_contact)
-            ContactsWindow.contact_widgets.append(new_widget)
-            self.listWidget.add_widget(new_widget)
-
-        self.listWidget.sortItems()
-
-    @QtCore.Slot(ContactListItem)
-    def delete_contact(self, item: ContactListItem):
-        contact = self.listWidget.itemWidget(item).contact
-
-        self.remove_item(item)
+            self.release_picture(old_contact)
+            self.contact_index.add(new_contact)
+            self.filter_contacts()
+
+    @QtCore.Slot(Contact)
+    def delete_contact(self, contact: Contact):
+        if not self.write_database(self.contact_database.remove, contact):
+            return
+        self.contact_index.remove(contact)
         self.contacts_from_json_file.remove(contact)
-        contact.release()
+        self.release_picture(contact)
+
+        self.filter_contacts()
 
-    # N.B.: The next method that end in "_item" is only "macro" to manage items in the list
-    #  to really delete a contact from persistent memory use methods that end in "_contact".
-    def remove_item(self, item: ContactListItem):
-        widget = self.listWidget.itemWidget(item)
+    @QtCore.Slot(Contact)
+    def save_contact(self, contact: Contact):
+        """
+        This method saves a contact that was changed in place. (i.e.: it got the hash of its picture)
+        """
+        # A contact that was edited or deleted in the meantime is not in the database anymore.
+        if contact.row_id is not None:
+            self.write_database(self.contact_database.update, contact)
 
-        self.listWidget.takeItem(self.listWidget.row(item))
-        ContactsWindow.contact_widgets.remove(widget)
+    def write_database(self, fn: callable, *args) -> bool:
+        """
+        This method runs a change to the database of contacts. It tells the user and returns False if it fails.
+        """
+        try:
+            fn(*args)
+        except sqlite3.Error as e:
+            if __debug__:
+                print(type(e), str(e), file=stderr)
+            QtWidgets.QMessageBox.critical(self, "Could not save contacts", str(e))
+            return False
+        return True
+
+    def release_picture(self, contact: Contact):
+        """
+        This method deletes the picture of a contact that was removed unless other contacts are using it. The same goes
+        for its thumbnail.
+        """
+        if contact.pic_name and not self.contacts_from_json_file.picture_references(contact.pic_name):
+            keep_thumbnail = self.contacts_from_json_file.uses_thumbnail(contact.pic_hash)
+            if not keep_thumbnail:
+                self.thumbnail_cache.forget(contact)
+            contact.release(keep_thumbnail)
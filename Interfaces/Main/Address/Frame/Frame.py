@@ -9,13 +9,14 @@ from PySide2 import QtWidgets, QtCore, QtGui
 from algosdk.mnemonic import from_private_key, to_private_key
 
 # Local project
-from misc.Entities import Wallet
+from misc.Entities import Wallet, WorkerPriority
 from misc.Functions import find_main_window
+from misc.Models import ObjectListModel
 from Interfaces.Main.Address.Frame.Ui_Frame import Ui_AddressFrame
-from Interfaces.Main.Address.BalanceWindow.BalanceWindow import BalanceWindow
 
 # Python standard libraries
 from functools import partial
+from sys import stderr
 
 
 class AddressFrame(QtWidgets.QFrame, Ui_AddressFrame):
@@ -27,12 +28,18 @@ class AddressFrame(QtWidgets.QFrame, Ui_AddressFrame):
 
         self.wallet = wallet
 
+        self.worker = None
+
         self.setupUi(self)
 
+        # Addresses are plain strings so the default delegate of the view is enough.
+        self.address_model = ObjectListModel(self)
+        self.listView.setModel(self.address_model)
+
         # Connections
-        #   listWidget
-        self.listWidget.itemDoubleClicked.connect(self.show_balance)
-        self.listWidget.customContextMenuRequested.connect(self.show_context_menu)
+        #   listView
+        self.listView.doubleClicked.connect(self.show_balance)
+        self.listView.customContextMenuRequested.connect(self.show_context_menu)
 
         #   pushButtons
         self.pushButton_Return.clicked.connect(self.close)
@@ -45,61 +52,89 @@ class AddressFrame(QtWidgets.QFrame, Ui_AddressFrame):
         QtCore.QTimer.singleShot(0, self.setup_logic)
 
     def setup_logic(self):
-        # Worker
-        # We load the addresses in a non threaded way for now. It's reasonable because if we are at this point we know
-        #  there is a working kmd server online.
-        addresses = self.wallet.algo_wallet.list_keys()
-
-        for address in addresses:
-            self.listWidget.addItem(address)
+        self.set_busy(True)
+        self.listView.activate_timer()
 
-        if len(addresses) >= 1:
-            self.listWidget.setCurrentRow(0)
+        self.worker = find_main_window().start_worker(
+            self.wallet.algo_wallet.list_keys,
+            self.address_loading_success,
+            self.address_loading_failed
+        )
 
-            for widget in [self.pushButton_Balance, self.pushButton_Forget, self.pushButton_Export]:
-                widget.setEnabled(True)
+    def closeEvent(self, arg__1: QtGui.QCloseEvent):
+        if self.worker:
+            self.worker.signals.success.disconnect()
+            self.worker.signals.error.disconnect()
+        arg__1.accept()
 
     def keyPressEvent(self, event: QtGui.QKeyEvent):
         key = event.key()
         if key == int(QtCore.Qt.Key_Return):
-            if self.listWidget.hasFocus():
+            if self.listView.hasFocus():
                 self.show_balance()
         elif key == int(QtCore.Qt.Key_Escape):
             self.close()
 
+    @QtCore.Slot(list)
+    def address_loading_success(self, addresses: list):
+        self.listView.clear_loading()
+
+        self.address_model.extend(addresses)
+
+        if len(addresses) >= 1:
+            self.listView.set_current_row(0)
+
+        self.set_busy(False)
+
+    @QtCore.Slot(Exception)
+    def address_loading_failed(self, error: Exception):
+        self.listView.clear_loading()
+
+        self.operation_failed("Could not load addresses", error)
+
     @QtCore.Slot()
-    def show_balance(self, item: QtWidgets.QListWidgetItem = None):
-        if not item:
-            item = self.listWidget.currentItem()
+    def show_balance(self):
+        # Double click and Return key are just shortcuts for the balance button so they follow its state.
+        #  This way there can't be more than one call in flight from this frame.
+        if not self.pushButton_Balance.isEnabled():
+            return
+
+        address = self.listView.current_object()
 
         if not find_main_window().wallet_frame.algod_client:
             QtWidgets.QMessageBox.critical(self, "algod settings", "Please check algod settings.")
             return
 
-        try:
-            account_info = find_main_window().wallet_frame.algod_client.account_info(item.text())
-        except Exception as e:
-            if __debug__:
-                print(type(e), str(e), file=stderr)
-            QtWidgets.QMessageBox.critical(self, "Could not load balance", str(e))
-        else:
-            dialog = BalanceWindow(self, account_info)
-            dialog.exec_()
+        self.set_busy(True)
+        self.worker = find_main_window().start_worker(
+            partial(find_main_window().wallet_frame.algod_client.account_info, address),
+            self.show_balance_success,
+            partial(self.operation_failed, "Could not load balance"),
+            service="algod", priority=WorkerPriority.interactive, key=("algod", "account_info", address)
+        )
+
+    @QtCore.Slot(dict)
+    def show_balance_success(self, account_info: dict):
+        self.set_busy(False)
+
+        # Dialogs are imported the first time they are opened so that they don't slow down the start.
+        from Interfaces.Main.Address.BalanceWindow.BalanceWindow import BalanceWindow
+        dialog = BalanceWindow(self, account_info)
+        dialog.exec_()
 
     @QtCore.Slot()
     def new_address(self):
-        try:
-            self.wallet.algo_wallet.generate_key()
-        except Exception as e:
-            if __debug__:
-                print(type(e), str(e), file=stderr)
-            QtWidgets.QMessageBox.critical(self, "Could not generate new address", str(e))
-        else:
-            self.restart()
+        self.set_busy(True)
+        self.worker = find_main_window().start_worker(
+            self.wallet.algo_wallet.generate_key,
+            self.restart,
+            partial(self.operation_failed, "Could not generate new address"),
+            priority=WorkerPriority.interactive
+        )
 
     @QtCore.Slot()
     def forget_address(self):
-        item = self.listWidget.currentItem()
+        address = self.listView.current_object()
 
         if QtWidgets.QMessageBox.question(
             self, "Forget address from KMD",
@@ -109,14 +144,13 @@ class AddressFrame(QtWidgets.QFrame, Ui_AddressFrame):
         ) != QtWidgets.QDialogButtonBox.StandardButton.Yes:
             return
 
-        try:
-            self.wallet.algo_wallet.delete_key(item.text())
-        except Exception as e:
-            if __debug__:
-                print(type(e), str(e), file=stderr)
-            QtWidgets.QMessageBox.critical(self, "Could not forget address", str(e))
-        else:
-            self.restart()
+        self.set_busy(True)
+        self.worker = find_main_window().start_worker(
+            partial(self.wallet.algo_wallet.delete_key, address),
+            self.restart,
+            partial(self.operation_failed, "Could not forget address"),
+            priority=WorkerPriority.interactive
+        )
 
     @QtCore.Slot()
     def import_address(self):
@@ -134,42 +168,83 @@ class AddressFrame(QtWidgets.QFrame, Ui_AddressFrame):
             "Please fill in with the address mnemonic private key"
         )
         if new_address[1]:
+            # Decoding the mnemonic doesn't involve the node so it's fine to do it here.
             try:
-                self.wallet.algo_wallet.import_key(to_private_key(new_address[0]))
+                private_key = to_private_key(new_address[0])
             except Exception as e:
-                if __debug__:
-                    print(type(e), str(e), file=stderr)
-                QtWidgets.QMessageBox.critical(self, "Could not import address", str(e))
-            else:
-                self.restart()
+                self.operation_failed("Could not import address", e)
+                return
+
+            self.set_busy(True)
+            self.worker = find_main_window().start_worker(
+                partial(self.wallet.algo_wallet.import_key, private_key),
+                self.restart,
+                partial(self.operation_failed, "Could not import address"),
+                priority=WorkerPriority.interactive
+            )
 
     @QtCore.Slot()
     def export_address(self):
-        item = self.listWidget.currentItem()
-
-        try:
-            private_key = self.wallet.algo_wallet.export_key(item.text())
-        except Exception as e:
-            if __debug__:
-                print(type(e), str(e), file=stderr)
-            QtWidgets.QMessageBox.critical(self, "Could not export address", str(e))
-        else:
-            QtGui.QGuiApplication.clipboard().setText(from_private_key(private_key))
-            QtWidgets.QMessageBox.information(self, "Success", "Private key copied into clipboard")
+        address = self.listView.current_object()
+
+        self.set_busy(True)
+        self.worker = find_main_window().start_worker(
+            partial(self.wallet.algo_wallet.export_key, address),
+            self.export_address_success,
+            partial(self.operation_failed, "Could not export address"),
+            priority=WorkerPriority.interactive
+        )
+
+    @QtCore.Slot(str)
+    def export_address_success(self, private_key: str):
+        self.set_busy(False)
+
+        QtGui.QGuiApplication.clipboard().setText(from_private_key(private_key))
+        QtWidgets.QMessageBox.information(self, "Success", "Private key copied into clipboard")
+
+    @QtCore.Slot(str, Exception)
+    def operation_failed(self, title: str, error: Exception):
+        """
+        This method is the common error route for every call to the node issued from this frame.
+        """
+        if __debug__:
+            print(type(error), str(error), file=stderr)
+
+        self.set_busy(False)
+        QtWidgets.QMessageBox.critical(self, title, str(error))
 
     @QtCore.Slot(QtCore.QPoint)
     def show_context_menu(self, pos: QtCore.QPoint):
-        item = self.listWidget.itemAt(pos)
-        if item:
+        address = self.listView.object_at(pos)
+        if address:
             menu = QtWidgets.QMenu(self)
 
-            menu.addAction("Copy to clipboard", partial(QtGui.QGuiApplication.clipboard().setText, item.text()))
+            menu.addAction("Copy to clipboard", partial(QtGui.QGuiApplication.clipboard().setText, address))
 
-            global_pos = self.listWidget.mapToGlobal(pos)
+            global_pos = self.listView.mapToGlobal(pos)
             menu.exec_(global_pos)
 
             menu.deleteLater()
 
+    def set_busy(self, value: bool):
+        """
+        This method shows the user that a call to the node is in progress and prevents any other operation until
+        it's done.
+
+        Widgets that only make sense for the existence of at least one address are enabled only if that is the case.
+        """
+        if value:
+            self.setCursor(QtCore.Qt.BusyCursor)
+        else:
+            self.unsetCursor()
+
+        for widget in [self.pushButton_New, self.pushButton_Import]:
+            widget.setEnabled(not value)
+
+        for widget in [self.pushButton_Balance, self.pushButton_Forget, self.pushButton_Export]:
+            widget.setEnabled(not value and self.listView.count() >= 1)
+
+    @QtCore.Slot()
     def restart(self):
         queued_widget = find_main_window().queuedWidget
 
@@ -15,7 +15,7 @@ from PySide2.QtGui import (QBrush, QColor, QConicalGradient, QCursor, QFont,
     QPixmap, QRadialGradient)
 from PySide2.QtWidgets import *
 
-from misc.Widgets import CustomListWidget
+from misc.Widgets import CustomListView
 
 
 class Ui_AddressFrame(object):
@@ -25,11 +25,11 @@ class Ui_AddressFrame(object):
         AddressFrame.resize(737, 353)
         self.horizontalLayout = QHBoxLayout(AddressFrame)
         self.horizontalLayout.setObjectName(u"horizontalLayout")
-        self.listWidget = CustomListWidget(AddressFrame)
-        self.listWidget.setObjectName(u"listWidget")
-        self.listWidget.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.listView = CustomListView(AddressFrame)
+        self.listView.setObjectName(u"listView")
+        self.listView.setContextMenuPolicy(Qt.CustomContextMenu)
 
-        self.horizontalLayout.addWidget(self.listWidget)
+        self.horizontalLayout.addWidget(self.listView)
 
         self.verticalLayout = QVBoxLayout()
         self.verticalLayout.setObjectName(u"verticalLayout")
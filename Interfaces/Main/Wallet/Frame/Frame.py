@@ -13,16 +13,16 @@ from algosdk.v2client.indexer import IndexerClient
 from algosdk.mnemonic import to_master_derivation_key
 
 # Local project
-from misc.Entities import Wallet
+from misc.Entities import Wallet, WorkerPriority
 from misc.Functions import find_main_window
+from misc.Models import ObjectListModel
 from Interfaces.Main.Wallet.Frame.Ui_Frame import Ui_WalletFrame
-from Interfaces.Main.Wallet.UnlockWallet.UnlockWallet import UnlockWallet
-from Interfaces.Main.Wallet.NewImportWallet.NewImportWallet import NewImportWallet
-from Interfaces.Main.Wallet.Widgets import WalletListItem, WalletListWidget
+from Interfaces.Main.Wallet.Widgets import WalletListDelegate
 from Interfaces.Main.Address.Frame.Frame import AddressFrame
 from Interfaces.Settings.Window.Window import SettingsWindow
 
 # Python standard libraries
+from functools import partial
 from sys import stderr
 
 
@@ -45,11 +45,14 @@ class WalletsFrame(QtWidgets.QFrame, Ui_WalletFrame):
 
         self.setupUi(self)
 
-        self.listWidget.set_item_type(WalletListItem)
-        self.listWidget.activate_timer()
+        # Wallets of the node. The view only paints the ones that are visible.
+        self.wallet_model = ObjectListModel(self, display=lambda wallet: wallet.info["name"])
+        self.listView.setModel(self.wallet_model)
+        self.listView.setItemDelegate(WalletListDelegate(self.listView))
+        self.listView.activate_timer()
 
         # Connections
-        self.listWidget.itemDoubleClicked.connect(self.manage_wallet)
+        self.listView.doubleClicked.connect(self.manage_wallet)
         self.pushButton_Manage.clicked.connect(self.manage_wallet)
         self.pushButton_LockUnlock.clicked.connect(self.lock_unlock_wallet)
         self.pushButton_Rename.clicked.connect(self.rename_wallet)
@@ -74,7 +77,7 @@ class WalletsFrame(QtWidgets.QFrame, Ui_WalletFrame):
                 self.wallet_loading_failed
             )
         else:
-            self.listWidget.clear_loading()
+            self.listView.clear_loading()
             find_main_window().exec_settings()
 
         if "algod" in SettingsWindow.rest_endpoints:
@@ -101,106 +104,125 @@ class WalletsFrame(QtWidgets.QFrame, Ui_WalletFrame):
         arg__1.accept()
 
     def keyPressEvent(self, event: QtGui.QKeyEvent):
-        if event.key() == int(QtCore.Qt.Key_Return) and self.listWidget.hasFocus():
+        if event.key() == int(QtCore.Qt.Key_Return) and self.listView.hasFocus():
             self.manage_wallet()
 
     @QtCore.Slot()
-    def manage_wallet(self, item: WalletListItem = None):
+    def manage_wallet(self):
         """
         This method opens up the AddressFrame of a given wallet.
         """
-        if not item:
-            item = self.listWidget.currentItem()
+        # Double click and Return key are just shortcuts for the manage button so they follow its state.
+        if not self.pushButton_Manage.isEnabled():
+            return
 
-        if self.unlock_item(item):
-            widget = self.listWidget.itemWidget(item)
+        wallet = self.listView.current_object()
 
+        if self.unlock_wallet(wallet):
             queued_widget = find_main_window().queuedWidget
             queued_widget.add_widget(
-                AddressFrame(queued_widget, widget.wallet)
+                AddressFrame(queued_widget, wallet)
             )
 
     @QtCore.Slot()
     def rename_wallet(self):
-        item = self.listWidget.currentItem()
-
-        if self.unlock_item(item):
-            widget = self.listWidget.itemWidget(item)
+        wallet = self.listView.current_object()
 
+        if self.unlock_wallet(wallet):
             new_name = QtWidgets.QInputDialog.getText(
                 self, "Rename", "New name",
                 QtWidgets.QLineEdit.EchoMode.Normal,
-                widget.wallet.info["name"]
+                wallet.info["name"]
             )
             if new_name[1]:
-                try:
-                    # FIXME These functions could both raise an error and we wouldn't know at which point occurred.
-                    # FIXME Put this bad boi in a thread because these calls last quite a while.
-                    # Actually if only one of this operation fails it's not clear how to revert the one that succeeded.
-                    widget.wallet.algo_wallet.rename(new_name[0])
-                    widget.wallet.info = widget.wallet.algo_wallet.info()["wallet"]
-                except Exception as e:
-                    if __debug__:
-                        print(type(e), str(e), file=stderr)
-                    QtWidgets.QMessageBox.critical(self, "Could not rename", str(e))
-                else:
-                    widget.label_primary.setText(new_name[0])
+                # FIXME These functions could both raise an error and we wouldn't know at which point occurred.
+                # Actually if only one of this operation fails it's not clear how to revert the one that succeeded.
+                def rename_and_refresh() -> dict:
+                    wallet.algo_wallet.rename(new_name[0])
+                    return wallet.algo_wallet.info()["wallet"]
+
+                self.set_busy(True)
+                self.worker = find_main_window().start_worker(
+                    rename_and_refresh,
+                    partial(self.rename_wallet_success, wallet),
+                    partial(self.operation_failed, "Could not rename"),
+                    priority=WorkerPriority.interactive
+                )
+
+    @QtCore.Slot(Wallet, dict)
+    def rename_wallet_success(self, wallet: Wallet, info: dict):
+        self.set_busy(False)
+
+        wallet.info = info
+        self.wallet_model.refresh(wallet)
 
     @QtCore.Slot()
     def new_import_wallet(self):
         # TODO when importing a wallet ask the user how many addresses must be recovered.
+        # Dialogs are imported the first time they are opened so that they don't slow down the start.
+        from Interfaces.Main.Wallet.NewImportWallet.NewImportWallet import NewImportWallet
         input_dialog = NewImportWallet(self)
 
         if input_dialog.exec_() == QtWidgets.QDialog.Accepted:
+            name, password, mnemonic_mdk = input_dialog.return_value
+
+            # Decoding the mnemonic doesn't involve the node so it's fine to do it here.
             try:
-                new_wallet = self.kmd_client.create_wallet(
-                    input_dialog.return_value[0], input_dialog.return_value[1],
-                    master_deriv_key=to_master_derivation_key(
-                        input_dialog.return_value[2] if input_dialog.return_value[2] != "" else None
-                    )
-                )
+                mdk = to_master_derivation_key(mnemonic_mdk) if mnemonic_mdk != "" else None
             except Exception as e:
-                if __debug__:
-                    print(type(e), str(e), file=stderr)
-                QtWidgets.QMessageBox.critical(self, "Could not create wallet", str(e))
-            else:
-                self.listWidget.add_widget(
-                    WalletListWidget(
-                        Wallet(new_wallet)
-                    )
-                )
+                self.operation_failed("Could not create wallet", e)
+                return
+
+            self.set_busy(True)
+            self.worker = find_main_window().start_worker(
+                partial(self.kmd_client.create_wallet, name, password, master_deriv_key=mdk),
+                self.new_import_wallet_success,
+                partial(self.operation_failed, "Could not create wallet"),
+                priority=WorkerPriority.interactive
+            )
+
+    @QtCore.Slot(dict)
+    def new_import_wallet_success(self, new_wallet: dict):
+        self.wallet_model.add(Wallet(new_wallet))
+
+        if self.listView.count() == 1:
+            self.listView.set_current_row(0)
+
+        self.set_busy(False)
 
     @QtCore.Slot()
     def export_wallet(self):
-        item = self.listWidget.currentItem()
+        wallet = self.listView.current_object()
 
-        if self.unlock_item(item):
-            widget = self.listWidget.itemWidget(item)
+        if self.unlock_wallet(wallet):
+            self.set_busy(True)
+            self.worker = find_main_window().start_worker(
+                wallet.algo_wallet.get_mnemonic,
+                self.export_wallet_success,
+                partial(self.operation_failed, "Could not export wallet"),
+                priority=WorkerPriority.interactive
+            )
 
-            try:
-                mnemonic_mdk = widget.wallet.algo_wallet.get_mnemonic()
-            except Exception as e:
-                if __debug__:
-                    print(type(e), str(e), file=stderr)
-                QtWidgets.QMessageBox.critical(self, "Could not export wallet", str(e))
-            else:
-                QtGui.QGuiApplication.clipboard().setText(mnemonic_mdk)
-                QtWidgets.QMessageBox.information(
-                    self, "Success", "Mnemonic master derivation key copied into clipboard"
-                )
+    @QtCore.Slot(str)
+    def export_wallet_success(self, mnemonic_mdk: str):
+        self.set_busy(False)
+
+        QtGui.QGuiApplication.clipboard().setText(mnemonic_mdk)
+        QtWidgets.QMessageBox.information(
+            self, "Success", "Mnemonic master derivation key copied into clipboard"
+        )
 
     @QtCore.Slot()
     def lock_unlock_wallet(self):
         """
-        This method unlocks a locked item and viceversa.
+        This method unlocks a locked wallet and viceversa.
         """
-        item = self.listWidget.currentItem()
-        widget = self.listWidget.itemWidget(item)
+        wallet = self.listView.current_object()
 
-        if widget.wallet.algo_wallet:
-            self.lock_item(item)
+        if wallet.algo_wallet:
+            self.lock_wallet(wallet)
         else:
-            self.unlock_item(item)
+            self.unlock_wallet(wallet)
 
     @QtCore.Slot(list)
     def wallet_loading_success(self, wallets: list):
@@ -209,61 +231,78 @@ class WalletsFrame(QtWidgets.QFrame, Ui_WalletFrame):
 
         This slot is connected to the result of the thread that.
         """
-        self.listWidget.clear_loading()
+        self.listView.clear_loading()
 
-        for wallet in wallets:
-            self.listWidget.add_widget(
-                WalletListWidget(
-                    Wallet(wallet)
-                )
-            )
+        # All rows are inserted at once so that the view lays them out a single time.
+        self.wallet_model.extend(Wallet(wallet) for wallet in wallets)
 
-        # Enable widgets that allow operation on an active node
-        for widget in [self.pushButton_NewImport]:
-            widget.setEnabled(True)
-
-        # Also enable widgets that only make sense for the existence of at least one wallet.
         if len(wallets) >= 1:
-            self.listWidget.setCurrentRow(0)
+            self.listView.set_current_row(0)
 
-            for widget in [self.pushButton_Manage, self.pushButton_LockUnlock, self.pushButton_Rename,
-                           self.pushButton_Export, find_main_window().menuAction_NewTransaction]:
-                widget.setEnabled(True)
+        self.set_busy(False)
 
     @QtCore.Slot(Exception)
     def wallet_loading_failed(self, error: Exception):
-        self.listWidget.clear_loading()
+        self.listView.clear_loading()
 
         QtWidgets.QMessageBox.critical(self, "Could not load wallets", str(error))
 
-    def unlock_item(self, item: WalletListItem) -> bool:
+    @QtCore.Slot(str, Exception)
+    def operation_failed(self, title: str, error: Exception):
+        """
+        This method is the common error route for every call to the node issued from this frame.
+        """
+        if __debug__:
+            print(type(error), str(error), file=stderr)
+
+        self.set_busy(False)
+        QtWidgets.QMessageBox.critical(self, title, str(error))
+
+    def set_busy(self, value: bool):
+        """
+        This method shows the user that a call to the node is in progress and prevents any other operation until
+        it's done.
+
+        Widgets that allow operation on an active node are enabled when not busy. Widgets that only make sense for the
+        existence of at least one wallet are enabled only if that is also the case.
         """
-        This method takes an item with a misc.Entities.Wallet and creates an algosdk.wallet.Wallet creating a point for
+        if value:
+            self.setCursor(QtCore.Qt.BusyCursor)
+        else:
+            self.unsetCursor()
+
+        for widget in [self.pushButton_NewImport]:
+            widget.setEnabled(not value)
+
+        for widget in [self.pushButton_Manage, self.pushButton_LockUnlock, self.pushButton_Rename,
+                       self.pushButton_Export, find_main_window().menuAction_NewTransaction]:
+            widget.setEnabled(not value and self.listView.count() >= 1)
+
+    def unlock_wallet(self, wallet: Wallet) -> bool:
+        """
+        This method takes a misc.Entities.Wallet and creates an algosdk.wallet.Wallet creating a point for
         managing the kmd wallet.
 
         This method returns true if the wallet is already unlocked otherwise it tries to unlock it.
         """
-        widget = self.listWidget.itemWidget(item)
-
-        if widget.wallet.algo_wallet:
+        if wallet.algo_wallet:
             return True
 
-        unlock_wallet_dialog = UnlockWallet(self, widget.wallet)
+        from Interfaces.Main.Wallet.UnlockWallet.UnlockWallet import UnlockWallet
+        unlock_wallet_dialog = UnlockWallet(self, wallet)
         if unlock_wallet_dialog.exec_() == QtWidgets.QDialog.Accepted:
-            widget.wallet.algo_wallet = unlock_wallet_dialog.return_value
-            widget.set_locked(False)
+            wallet.unlock(unlock_wallet_dialog.return_value)
+            self.wallet_model.refresh(wallet)
             return True
 
         return False
 
-    def lock_item(self, item: WalletListItem):
+    def lock_wallet(self, wallet: Wallet):
         """
-        This methods destroys the algosdk.wallet.Wallet object saved inside Entities.Wallet and marks the corresponding
-        widget as locked.
+        This methods destroys the algosdk.wallet.Wallet object saved inside Entities.Wallet and repaints its row as
+        locked.
         """
-        widget = self.listWidget.itemWidget(item)
-
-        widget.wallet.lock()
-        widget.set_locked(True)
+        wallet.lock()
+        self.wallet_model.refresh(wallet)
 
 
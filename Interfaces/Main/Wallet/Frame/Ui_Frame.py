@@ -15,7 +15,7 @@ from PySide2.QtGui import (QBrush, QColor, QConicalGradient, QCursor, QFont,
     QPixmap, QRadialGradient)
 from PySide2.QtWidgets import *
 
-from misc.Widgets import CustomListWidget
+from misc.Widgets import CustomListView
 
 
 class Ui_WalletFrame(object):
@@ -25,10 +25,10 @@ class Ui_WalletFrame(object):
         WalletFrame.resize(874, 366)
         self.horizontalLayout = QHBoxLayout(WalletFrame)
         self.horizontalLayout.setObjectName(u"horizontalLayout")
-        self.listWidget = CustomListWidget(WalletFrame)
-        self.listWidget.setObjectName(u"listWidget")
+        self.listView = CustomListView(WalletFrame)
+        self.listView.setObjectName(u"listView")
 
-        self.horizontalLayout.addWidget(self.listWidget)
+        self.horizontalLayout.addWidget(self.listView)
 
         self.verticalLayout = QVBoxLayout()
         self.verticalLayout.setObjectName(u"verticalLayout")
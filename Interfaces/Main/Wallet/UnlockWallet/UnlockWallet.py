@@ -1,11 +1,8 @@
 # PySide2
 from PySide2 import QtWidgets, QtCore, QtGui
 
-# Algorand
-from algosdk.wallet import Wallet as AlgosdkWallet
-
 # Local project
-from misc.Entities import Wallet
+from misc.Entities import Wallet, LeasedAlgosdkWallet, WorkerPriority
 from misc.Functions import find_main_window
 from Interfaces.Main.Wallet.UnlockWallet.Ui_UnlockWallet import Ui_UnlockWallet
 
@@ -47,13 +44,14 @@ class UnlockWallet(QtWidgets.QDialog, Ui_UnlockWallet):
             # We have to use partial because for some reason the creation of an object is not considered a callable.
             #  I still have to look into this.
             partial(
-                AlgosdkWallet,
+                LeasedAlgosdkWallet,
                 self.wallet.info["name"],
                 self.lineEdit.text(),
                 find_main_window().wallet_frame.kmd_client
             ),
             self.unlock_success,
-            self.unlock_failure
+            self.unlock_failure,
+            priority=WorkerPriority.interactive
         )
 
     @QtCore.Slot(object)
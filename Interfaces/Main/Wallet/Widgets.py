@@ -1,55 +1,80 @@
 """
-Custom classes for QListWidget for WalletFrame
+Custom classes for the list in WalletFrame
 
-Subclass for QWidget is the representation inside the list in WalletFrame
-Subclass for QListWidgetItem is not really needed right now because there is not ordering inside WalletFrame list.
-However it is still used in the code because one day we might need to implement functionality.
+The list holds misc.Entities.Wallet objects inside a misc.Models.ObjectListModel.
+Subclass for QStyledItemDelegate is the representation of a wallet inside the list in WalletFrame.
 """
 
 # PySide2
-from PySide2 import QtWidgets, QtCore
+from PySide2 import QtWidgets, QtCore, QtGui
 
 # Local project
-from misc.Entities import Wallet
+from misc.Models import ObjectListModel
 
 
-class WalletListItem(QtWidgets.QListWidgetItem):
+class WalletListDelegate(QtWidgets.QStyledItemDelegate):
     """
-    Dummy class for items in list_wallet. It's kept for the event in which we need to implement
-    functionality in the future.
+    Wallet representation for the list in WalletFrame.
+
+    It paints the name of the wallet, its id and whether it's unlocked. Nothing is allocated for rows that are not
+    visible.
     """
-    pass
+    margins = QtCore.QMargins(10, 5, 10, 5)
 
+    def __init__(self, parent: QtWidgets.QWidget):
+        super().__init__(parent)
 
-class WalletListWidget(QtWidgets.QWidget):
-    """
-    Wallet widget for the list in WalletFrame.
-    """
-    def __init__(self, wallet: Wallet):
-        super().__init__()
+        self.font_primary = QtGui.QFont(parent.font())
+        self.font_primary.setPointSize(13)
+        self.font_secondary = QtGui.QFont(parent.font())
+        self.font_secondary.setPointSize(8)
 
-        # Anti memory leak
-        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.metrics_primary = QtGui.QFontMetrics(self.font_primary)
+        self.metrics_secondary = QtGui.QFontMetrics(self.font_secondary)
 
-        self.wallet = wallet
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        return QtCore.QSize(
+            self.metrics_primary.horizontalAdvance("W" * 20) + self.margins.left() + self.margins.right(),
+            self.metrics_primary.height() + self.metrics_secondary.height() +
+            self.margins.top() + self.margins.bottom()
+        )
 
-        # Setup interface
-        main_layout = QtWidgets.QGridLayout(self)
-        main_layout.setContentsMargins(10, 5, 10, 5)
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex):
+        wallet = index.data(ObjectListModel.ObjectRole)
 
-        self.label_primary = QtWidgets.QLabel(self.wallet.info["name"])
-        self.label_primary.setStyleSheet("font: 13pt;")
-        main_layout.addWidget(self.label_primary, 0, 0, rowSpan=2)
+        # Background, selection and focus are drawn by the style just like for any other list.
+        style = option.widget.style() if option.widget else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, option, painter, option.widget)
 
-        self.label_secondary = QtWidgets.QLabel(self.wallet.info["id"])
-        self.label_secondary.setStyleSheet("font: 8pt;")
-        main_layout.addWidget(self.label_secondary, 1, 0)
+        rect = option.rect.marginsRemoved(self.margins)
+        rect_primary = QtCore.QRect(rect.left(), rect.top(), rect.width(), self.metrics_primary.height())
+        rect_secondary = QtCore.QRect(
+            rect.left(), rect_primary.bottom() + 1, rect.width(), self.metrics_secondary.height()
+        )
+
+        painter.save()
+        painter.setPen(
+            option.palette.color(QtGui.QPalette.HighlightedText)
+            if option.state & QtWidgets.QStyle.State_Selected else
+            option.palette.color(QtGui.QPalette.Text)
+        )
+
+        painter.setFont(self.font_primary)
+        painter.drawText(
+            rect_primary, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            self.metrics_primary.elidedText(wallet.info["name"], QtCore.Qt.ElideRight, rect.width())
+        )
 
-        self.label_state = QtWidgets.QLabel()
-        main_layout.addWidget(self.label_state, 1, 1, alignment=QtCore.Qt.AlignRight)
-        # End setup
+        painter.setFont(option.font)
+        state = "" if wallet.algo_wallet is None else "(unlocked)"
+        state_width = option.fontMetrics.horizontalAdvance(state)
+        painter.drawText(rect_secondary, QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, state)
 
-    def set_locked(self, value: bool):
-        self.label_state.setText(
-            "" if value else "(unlocked)"
+        painter.setFont(self.font_secondary)
+        painter.drawText(
+            rect_secondary.adjusted(0, 0, -state_width - 10, 0), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            self.metrics_secondary.elidedText(
+                wallet.info["id"], QtCore.Qt.ElideRight, rect_secondary.width() - state_width - 10
+            )
         )
+        painter.restore()
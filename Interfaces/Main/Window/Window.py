@@ -9,25 +9,30 @@ Main class is the fundamental interface from which the program offers its functi
 from PySide2 import QtWidgets, QtGui, QtCore
 
 # Local project
-from graphics import resources
+# Imported for its side effect: it registers the graphics with Qt. (i.e.: ":/icons/search.png")
+from graphics import resources  # noqa: F401
 
 import misc.Constants as ProjectConstants
-from misc.Functions import load_json_file, dump_json_file, find_main_window
-from misc.Entities import AlgorandWorker
+import misc.Transport as Transport
+from misc.Functions import find_main_window
+from misc.Autosave import SettingsAutosave
+from misc.Codec import load_settings_file, dump_settings_file
+from misc.Database import start_contact_loader
+from misc.Entities import AlgorandWorker, AlgorandStreamWorker, WorkerPriority
+from misc.Transport import CancelToken
+from misc.Diagnostics import worker_stats
 from misc.Widgets import LoadingWidget
 
-from Interfaces.Transaction.Window.Window import TransactionWindow
+# Secondary windows (Contacts, TransactionWindow, About) are imported the first time they are opened so that they
+#  don't slow down the start. (See exec_contacts, exec_transaction and exec_info)
 from Interfaces.Main.Window.Ui_Window import Ui_MainWindow
 from Interfaces.Main.Wallet.Frame.Frame import WalletsFrame
-from Interfaces.Contacts.Window.Window import ContactsWindow, ListJsonContacts
 from Interfaces.Settings.Window.Window import SettingsWindow, DictJsonSettings
-from Interfaces.About.Window import InfoWindow, CreditsWindow
 
 # Python standard libraries
 from os import path, mkdir
 from functools import partial
-from typing import Type
-import jsonpickle
+from typing import Type, Hashable
 
 
 class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
@@ -42,14 +47,25 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         # Anti memory leak
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
 
-        # This thread pool will be used to issue blocking calls of algosdk.
-        # If we want to setup a timeout timer for a algosdk blocking call, a technique could be to start thread A
-        #  that starts a timer.
-        #  Then thread A starts a thread B with the algosdk blocking call. Then only two things can happen:
-        #   1. thread B responds to thread A within the timer timeout
-        #   2. thread B does not respond to thread A within the timer timeout
-        #  Either way we get an answer from thread A within some fixed time.
-        self.thread_pool = QtCore.QThreadPool(self)
+        # These thread pools will be used to issue blocking calls of algosdk. There is one for each service so that
+        #  a slow service can't starve the others. Inside a pool workers are started by priority.
+        # It's not possible to dirty kill a QRunnable so every worker is given a deadline that misc.Transport
+        #  enforces on each socket operation. On top of that every worker's cancel token is a child of this one so that
+        #  cancelling it stops them all.
+        self.thread_pools = dict()
+        for service, max_threads in ProjectConstants.max_threads_per_service.items():
+            self.thread_pools[service] = QtCore.QThreadPool(self)
+            self.thread_pools[service].setMaxThreadCount(max_threads)
+        self.cancel_token = CancelToken()
+
+        # Calls started with a key are coalesced. For every key in flight we hold the worker that actually runs, its
+        #  service and priority and the workers of every caller that asked for the same call. See start_worker.
+        self.workers_in_flight = dict()
+
+        # Settings are saved in background shortly after they change.
+        self.settings_autosave = SettingsAutosave(
+            self, ProjectConstants.fullpath_settings_json, SettingsWindow.saved_json_settings
+        )
 
         self.setupUi(self)
 
@@ -66,6 +82,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.menu_About = self.menuBar().addMenu("About")
         self.menuAction_Info = self.menu_About.addAction("Info")
         self.menuAction_Credits = self.menu_About.addAction("Credits")
+        self.menuAction_Diagnostics = self.menu_About.addAction("Diagnostics")
 
         # Initial state
         self.menuAction_NewTransaction.setEnabled(False)
@@ -78,13 +95,16 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
             self.exec_settings
         )
         self.menuAction_Contacts.triggered.connect(
-            partial(self.exec_dialog, ContactsWindow)
+            self.exec_contacts
         )
         self.menuAction_Info.triggered.connect(
-            partial(self.exec_dialog, InfoWindow)
+            self.exec_info
         )
         self.menuAction_Credits.triggered.connect(
-            partial(self.exec_dialog, CreditsWindow)
+            self.exec_credits
+        )
+        self.menuAction_Diagnostics.triggered.connect(
+            self.exec_diagnostics
         )
 
         QtCore.QTimer.singleShot(0, self.restart)
@@ -95,8 +115,29 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
             QtWidgets.QMessageBox.critical(self, "algod settings", "Please check algod settings.")
             return
 
+        from Interfaces.Transaction.Window.Window import TransactionWindow
         self.exec_dialog(TransactionWindow)
 
+    @QtCore.Slot()
+    def exec_contacts(self):
+        from Interfaces.Contacts.Window.Window import ContactsWindow
+        self.exec_dialog(ContactsWindow)
+
+    @QtCore.Slot()
+    def exec_info(self):
+        from Interfaces.About.Window import InfoWindow
+        self.exec_dialog(InfoWindow)
+
+    @QtCore.Slot()
+    def exec_credits(self):
+        from Interfaces.About.Window import CreditsWindow
+        self.exec_dialog(CreditsWindow)
+
+    @QtCore.Slot()
+    def exec_diagnostics(self):
+        from Interfaces.About.Window import DiagnosticsWindow
+        self.exec_dialog(DiagnosticsWindow)
+
     @QtCore.Slot()
     def exec_settings(self):
         settings_window = SettingsWindow(self)
@@ -125,12 +166,29 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
             self.queuedWidget.clear_queue()
 
         SettingsWindow.calculate_rest_endpoints()
+        # Connections toward old endpoints are useless now.
+        Transport.pool_manager.clear()
 
         self.wallet_frame = WalletsFrame(self)
         self.queuedWidget.add_widget(self.wallet_frame)
 
-    def start_worker(self, fn: callable, fn_success: callable, fn_error: callable) -> AlgorandWorker:
-        worker = AlgorandWorker(fn)
+    def start_worker(self, fn: callable, fn_success: callable, fn_error: callable,
+                     service: str = "kmd", priority: int = WorkerPriority.foreground,
+                     key: Hashable = None, timeout: float = ProjectConstants.timeout_node_call) -> AlgorandWorker:
+        """
+        This method runs fn inside the thread pool of service and connects its outcome to fn_success and fn_error.
+
+        Workers waiting in queue are started by priority. (See misc.Entities.WorkerPriority)
+
+        If key is given and a call with the same key is still in flight, fn is not run again. The caller will receive
+        the outcome of the call already in flight instead. So key must identify the call and its arguments.
+        (i.e.: ("account_info", address))
+
+        fn has timeout seconds to complete otherwise fn_error receives the timeout error.
+
+        The returned worker always belongs to the caller alone so it's safe to disconnect its signals or cancel it.
+        """
+        worker = self.new_worker(fn, timeout, service)
 
         if fn_success:
             worker.signals.success.connect(fn_success)
@@ -138,30 +196,106 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         if fn_error:
             worker.signals.error.connect(fn_error)
 
-        self.thread_pool.start(worker)
+        thread_pool = self.thread_pools[service]
+
+        if key is not None:
+            worker_stats.keyed_call(key in self.workers_in_flight)
+
+        if key is None:
+            worker_stats.worker_queued(service)
+            thread_pool.start(worker, priority)
+        elif key in self.workers_in_flight:
+            running_worker, running_priority, workers = self.workers_in_flight[key]
+            workers.append(worker)
+
+            # If the call has not started yet it must not wait in queue more than this caller would.
+            if priority > running_priority and thread_pool.tryTake(running_worker):
+                self.workers_in_flight[key] = (running_worker, priority, workers)
+                thread_pool.start(running_worker, priority)
+        else:
+            # The worker that runs is never given to a caller. Otherwise a caller disconnecting its slots would also
+            #  disconnect every other caller.
+            running_worker = self.new_worker(fn, timeout, service)
+            running_worker.signals.success.connect(partial(self.fan_out, key, "success"))
+            running_worker.signals.error.connect(partial(self.fan_out, key, "error"))
+
+            # We also keep a reference to the running worker so that its signals outlive the QRunnable.
+            self.workers_in_flight[key] = (running_worker, priority, [worker])
+            worker_stats.worker_queued(service)
+            thread_pool.start(running_worker, priority)
 
         return worker
 
+    def fan_out(self, key: Hashable, signal_name: str, value: object):
+        """
+        This method forwards the outcome of a coalesced call to every caller that asked for it.
+
+        Both this method and start_worker run in the GUI thread so no caller can be added after the result is out.
+        """
+        running_worker, priority, workers = self.workers_in_flight.pop(key)
+
+        for worker in workers:
+            if not worker.cancel_token.is_cancelled():
+                getattr(worker.signals, signal_name).emit(value)
+
+    def start_stream_worker(self, fn: callable, fn_progress: callable, fn_success: callable, fn_error: callable,
+                            service: str = "kmd", priority: int = WorkerPriority.foreground,
+                            timeout: float = ProjectConstants.timeout_node_call) -> AlgorandStreamWorker:
+        """
+        This method runs the generator function fn inside the thread pool of service.
+
+        fn_progress receives lists of items as they are produced. fn_success receives the total number of items.
+        Streams are never coalesced.
+        """
+        worker = self.new_worker(fn, timeout, service, AlgorandStreamWorker)
+
+        if fn_progress:
+            worker.signals.progress.connect(fn_progress)
+
+        if fn_success:
+            worker.signals.success.connect(fn_success)
+
+        if fn_error:
+            worker.signals.error.connect(fn_error)
+
+        worker_stats.worker_queued(service)
+        self.thread_pools[service].start(worker, priority)
+
+        return worker
+
+    def new_worker(self, fn: callable, timeout: float, service: str,
+                   worker_type: Type[AlgorandWorker] = AlgorandWorker) -> AlgorandWorker:
+        worker = worker_type(fn)
+        worker.service = service
+        worker.cancel_token.parent = self.cancel_token
+        if timeout is not None:
+            worker.set_timeout(timeout)
+
+        return worker
+
+    def active_thread_count(self) -> int:
+        return sum(thread_pool.activeThreadCount() for thread_pool in self.thread_pools.values())
+
     def closeEvent(self, event: QtGui.QCloseEvent):
         """
         This overridden method gets called before actually destroying self.
 
         It's used to finalize some resources and then it passes the event up the chain to let PySide2 deal with it.
         """
-        if ContactsWindow.contacts_from_json_file.has_changed():
-            dump_json_file(
-                ProjectConstants.fullpath_contacts_json,
-                ContactsWindow.contacts_from_json_file
-            )
-        if SettingsWindow.saved_json_settings.has_changed():
-            dump_json_file(
-                ProjectConstants.fullpath_settings_json,
-                SettingsWindow.saved_json_settings
-            )
-
-        # We have no choice but to do it this way because i have no control over how much time a call through algosdk
-        #  could take and it's not possible to dirty kill a QRunnable.
-        if self.thread_pool.activeThreadCount() > 0:
+        # Contacts are saved as soon as they are changed. (See ContactsWindow)
+        # Settings are saved in background. Changes still waiting are written now, it's only the lines that changed.
+        self.settings_autosave.flush()
+        self.thread_pools["persistence"].waitForDone(ProjectConstants.timeout_shutdown * 1000)
+
+        # Nobody is interested in the outcome of background tasks anymore. Those that have not started yet are removed
+        #  from the queue. Those waiting for the node are woken up by aborting their requests.
+        # Since it's not possible to dirty kill a QRunnable we still wait for them but for a bounded amount of time.
+        self.cancel_token.cancel()
+        for thread_pool in self.thread_pools.values():
+            thread_pool.clear()
+        Transport.pool_manager.abort()
+
+        if self.active_thread_count() > 0:
             self.setVisible(False)
             self.exec_dialog(ClosingWindow)
 
@@ -174,37 +308,38 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         the filesystem.
 
         This method is meant to be called before Main instantiation however it's convenient that it is a method here
-        because SettingsWindow and ContactsWindow needs to be imported.
+        because SettingsWindow needs to be imported.
         """
         # Create user data folders
         if not path.exists(ProjectConstants.path_user_data):
             mkdir(ProjectConstants.path_user_data)
         if not path.exists(ProjectConstants.fullpath_thumbnails):
             mkdir(ProjectConstants.fullpath_thumbnails)
+        if not path.exists(ProjectConstants.fullpath_thumbnail_cache):
+            mkdir(ProjectConstants.fullpath_thumbnail_cache)
 
         # Create json files
-        file = ProjectConstants.fullpath_contacts_json
-        if not path.exists(file):
-            with open(file, 'w') as f:
-                f.write(jsonpickle.encode(ListJsonContacts(), indent='\t'))
         file = ProjectConstants.fullpath_settings_json
         if not path.exists(file):
-            with open(file, 'w') as f:
-                f.write(jsonpickle.encode(DictJsonSettings(), indent='\t'))
+            dump_settings_file(file, DictJsonSettings())
+
+        # Every algosdk client will reuse keep-alive connections.
+        Transport.install()
 
-        ContactsWindow.contacts_from_json_file = load_json_file(ProjectConstants.fullpath_contacts_json)
-        ContactsWindow.contacts_from_json_file.save_state()
+        # Contacts are loaded in background while the main window is built. They are only needed once Contacts or
+        #  TransactionWindow are opened. (See ContactsWindow.wait_for_contacts)
+        start_contact_loader(ProjectConstants.fullpath_contacts_db, ProjectConstants.fullpath_contacts_json)
 
-        SettingsWindow.saved_json_settings = load_json_file(ProjectConstants.fullpath_settings_json)
+        SettingsWindow.saved_json_settings = load_settings_file(ProjectConstants.fullpath_settings_json)
         SettingsWindow.saved_json_settings.save_state()
 
 
-# TODO disconnect all threads from their signals since they could raise an error that we don't care about
-#  because the application is about to close.
 class ClosingWindow(QtWidgets.QDialog):
     """
     This class is a window that signals to the user that some tasks are still running and
     the application can't be closed right now.
+
+    This window closes itself once all tasks are done or after ProjectConstants.timeout_shutdown seconds anyway.
     """
     def __init__(self, parent: QtWidgets.QWidget):
         super().__init__(parent, QtCore.Qt.CustomizeWindowHint)
@@ -216,10 +351,16 @@ class ClosingWindow(QtWidgets.QDialog):
 
         main_layout.addWidget(LoadingWidget(self, "Waiting for all tasks to close..."))
 
+        self.elapsed_timer = QtCore.QElapsedTimer()
+        self.elapsed_timer.start()
+
         closing_timer = QtCore.QTimer(self)
         closing_timer.timeout.connect(self.terminate)
-        closing_timer.start(500)
+        closing_timer.start(50)
 
     def terminate(self):
-        if find_main_window().thread_pool.activeThreadCount() == 0:
+        if (
+                find_main_window().active_thread_count() == 0 or
+                self.elapsed_timer.hasExpired(ProjectConstants.timeout_shutdown * 1000)
+        ):
             self.close()
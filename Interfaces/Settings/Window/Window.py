@@ -90,13 +90,20 @@ class SettingsWindow(QtWidgets.QDialog, Ui_SettingsWindow):
 
         settings["local"] = self.lineEdit_Local.text()
 
-        settings["algod"]["url"] = self.lineEdit_AlgodUrl.text()
-        settings["algod"]["port"] = self.lineEdit_AlgodPort.text()
-        settings["algod"]["token"] = self.lineEdit_AlgodToken.text()
-
-        settings["kmd"]["url"] = self.lineEdit_KmdUrl.text()
-        settings["kmd"]["port"] = self.lineEdit_KmdPort.text()
-        settings["kmd"]["token"] = self.lineEdit_KmdToken.text()
+        # Nested values are assigned as a whole so that settings can tell they changed.
+        settings["algod"] = dict(
+            settings["algod"],
+            url=self.lineEdit_AlgodUrl.text(),
+            port=self.lineEdit_AlgodPort.text(),
+            token=self.lineEdit_AlgodToken.text()
+        )
+
+        settings["kmd"] = dict(
+            settings["kmd"],
+            url=self.lineEdit_KmdUrl.text(),
+            port=self.lineEdit_KmdPort.text(),
+            token=self.lineEdit_KmdToken.text()
+        )
 
         super().accept()
 
@@ -13,11 +13,15 @@ from algosdk.future.transaction import SuggestedParams
 
 # Local project
 from misc.Functions import ProjectException, find_main_window
+from misc.Widgets import LoadingWidget
+from misc.Entities import Wallet, WorkerPriority
 from Interfaces.Transaction.Window.Ui_Window import Ui_TransactionWindow
 from Interfaces.Contacts.Window.Window import ContactsWindow
 
 # Python standard libraries
+from functools import partial
 from sys import stderr
+from typing import Iterator, Tuple
 
 
 # TODO use monospaced font to make all addresses long the same amount.
@@ -42,17 +46,17 @@ class TransactionWindow(QtWidgets.QDialog, Ui_TransactionWindow):
         self.comboBox_Receiver.addItem("Type in a valid Algorand address or select one...")
         self.comboBox_CloseTo.addItem("Type in a valid Algorand address or select one...")
 
-        wallet_list = find_main_window().wallet_frame.listWidget
-        for i in range(wallet_list.count()):
-            item = wallet_list.item(i)
-            widget = wallet_list.itemWidget(item)
+        #   This is shown while waiting for the node. It sits next to the buttons just like in UnlockWallet.
+        self.loading_widget = LoadingWidget(self, "Waiting for the node...")
+        self.loading_widget.setVisible(False)
+        self.formLayout.setWidget(8, QtWidgets.QFormLayout.LabelRole, self.loading_widget)
 
-            if widget.wallet.algo_wallet:
-                for address in widget.wallet.algo_wallet.list_keys():
-                    self.comboBox_Sender.addItem(f"{widget.wallet.info['name']} - {address}", widget.wallet.algo_wallet)
-                    self.comboBox_Receiver.addItem(f"Wallet: {widget.wallet.info['name']} - {address}")
-                    self.comboBox_CloseTo.addItem(f"Wallet: {widget.wallet.info['name']} - {address}")
+        # Addresses from the unlocked wallets are loaded in a worker. Contacts are loaded in background since startup.
+        unlocked_wallets = [
+            wallet for wallet in find_main_window().wallet_frame.wallet_model.objects() if wallet.algo_wallet
+        ]
 
+        ContactsWindow.wait_for_contacts()
         for contact in ContactsWindow.contacts_from_json_file:
             self.comboBox_Receiver.addItem(f"Contact: {contact.name} - {contact.info}")
             self.comboBox_CloseTo.addItem(f"Contact: {contact.name} - {contact.info}")
@@ -76,30 +80,121 @@ class TransactionWindow(QtWidgets.QDialog, Ui_TransactionWindow):
 
         self.validate_inputs()
 
+        # Wallet addresses go before contacts which are already in the comboBoxes.
+        self.next_wallet_row = 1
+
+        if unlocked_wallets:
+            self.set_busy(True)
+            self.worker = find_main_window().start_stream_worker(
+                partial(self.list_wallets_keys, unlocked_wallets),
+                self.addresses_loading_progress,
+                self.addresses_loading_success,
+                partial(self.operation_failed, "Could not load addresses")
+            )
+
+    def closeEvent(self, arg__1: QtGui.QCloseEvent):
+        if self.worker:
+            self.worker.cancel()
+            self.worker.signals.success.disconnect()
+            self.worker.signals.error.disconnect()
+        arg__1.accept()
+
+    @staticmethod
+    def list_wallets_keys(wallets: list) -> Iterator[Tuple[Wallet, str]]:
+        """
+        This generator yields a pair (wallet, address) for every address in every wallet in input.
+
+        This method is meant to be run inside a stream worker so that addresses show up one wallet at a time.
+        """
+        for wallet in wallets:
+            for address in wallet.algo_wallet.list_keys():
+                yield wallet, address
+
+    @QtCore.Slot(list)
+    def addresses_loading_progress(self, wallets_keys: list):
+        for wallet, address in wallets_keys:
+            self.comboBox_Sender.addItem(f"{wallet.info['name']} - {address}", wallet.algo_wallet)
+            self.comboBox_Receiver.insertItem(self.next_wallet_row, f"Wallet: {wallet.info['name']} - {address}")
+            self.comboBox_CloseTo.insertItem(self.next_wallet_row, f"Wallet: {wallet.info['name']} - {address}")
+            self.next_wallet_row += 1
+
+    @QtCore.Slot(int)
+    def addresses_loading_success(self, count: int):
+        self.set_busy(False)
+
+    # We override accept of this class and don't use super().accept() directly.
+    #  The transaction goes through three calls to the node (suggested params, signing and sending) and each one of them
+    #  is issued in a worker once the previous one is done. super().accept() is called only when the last one succeeds.
     def accept(self):
-        try:
-            sp = find_main_window().wallet_frame.algod_client.suggested_params()
-            wallet = self.comboBox_Sender.currentData()
-            s_txn = wallet.sign_transaction(self.get_transaction(sp))
-        except Exception as e:
-            if __debug__:
-                print(type(e), str(e), file=stderr)
-            QtWidgets.QMessageBox.critical(self, "Could not sign transaction", str(e))
-            return
+        self.set_busy(True)
+        self.worker = find_main_window().start_worker(
+            find_main_window().wallet_frame.algod_client.suggested_params,
+            self.accept_sign,
+            partial(self.operation_failed, "Could not sign transaction"),
+            service="algod", priority=WorkerPriority.interactive, key=("algod", "suggested_params")
+        )
 
+    @QtCore.Slot(SuggestedParams)
+    def accept_sign(self, sp: SuggestedParams):
+        wallet = self.comboBox_Sender.currentData()
+
+        # Reading the user inputs has to happen here since widgets can't be accessed from a worker.
         try:
-            addr_txn = find_main_window().wallet_frame.algod_client.send_transaction(s_txn)
+            txn = self.get_transaction(sp)
         except Exception as e:
-            if __debug__:
-                print(type(e), str(e), file=stderr)
-            QtWidgets.QMessageBox.critical(self, "Could not send transaction", str(e))
+            self.operation_failed("Could not sign transaction", e)
             return
 
+        self.worker = find_main_window().start_worker(
+            partial(wallet.sign_transaction, txn),
+            self.accept_send,
+            partial(self.operation_failed, "Could not sign transaction"),
+            priority=WorkerPriority.interactive
+        )
+
+    @QtCore.Slot(object)
+    def accept_send(self, s_txn: object):
+        self.worker = find_main_window().start_worker(
+            partial(find_main_window().wallet_frame.algod_client.send_transaction, s_txn),
+            self.accept_success,
+            partial(self.operation_failed, "Could not send transaction"),
+            service="algod", priority=WorkerPriority.interactive
+        )
+
+    @QtCore.Slot(str)
+    def accept_success(self, addr_txn: str):
+        self.set_busy(False)
+
         QtGui.QGuiApplication.clipboard().setText(addr_txn)
         QtWidgets.QMessageBox.information(self, "Transaction", "Transaction sent to the node.\n"
                                                                "Transaction address copied into clipboard")
         super().accept()
 
+    @QtCore.Slot(str, Exception)
+    def operation_failed(self, title: str, error: Exception):
+        """
+        This method is the common error route for every call to the node issued from this window.
+        """
+        if __debug__:
+            print(type(error), str(error), file=stderr)
+
+        self.set_busy(False)
+        QtWidgets.QMessageBox.critical(self, title, str(error))
+
+    def set_busy(self, value: bool):
+        """
+        This method shows the loading widget while a call to the node is in progress and prevents the user from
+        issuing another one until it's done.
+        """
+        self.loading_widget.setVisible(value)
+        self.buttonBox.setEnabled(not value)
+
+        if value:
+            self.pushButton_SuggestedFee.setEnabled(False)
+        else:
+            # OK button and "suggested fee" button have their own rules.
+            self.validate_inputs()
+
     @QtCore.Slot()
     def checkbox_close_to(self):
         if self.checkBox_CloseTo.isChecked():
@@ -152,13 +247,22 @@ class TransactionWindow(QtWidgets.QDialog, Ui_TransactionWindow):
         This method compiles an unsigned transaction with the parameters and then uses .estimate_size() on
         the transaction. Then uses .suggested_params() from algod client to get fee per byte. Then it's easy math.
         """
+        self.set_busy(True)
+        self.worker = find_main_window().start_worker(
+            find_main_window().wallet_frame.algod_client.suggested_params,
+            self.pushbutton_sf_success,
+            partial(self.operation_failed, "Could not load suggested fee"),
+            service="algod", priority=WorkerPriority.interactive, key=("algod", "suggested_params")
+        )
+
+    @QtCore.Slot(SuggestedParams)
+    def pushbutton_sf_success(self, sp: SuggestedParams):
+        self.set_busy(False)
+
         try:
-            sp = find_main_window().wallet_frame.algod_client.suggested_params()
             temp_txn = self.get_transaction(sp)
         except Exception as e:
-            if __debug__:
-                print(type(e), str(e), file=stderr)
-            QtWidgets.QMessageBox.critical(self, "Could not load suggested fee", str(e))
+            self.operation_failed("Could not load suggested fee", e)
             return
 
         # We do this because we don't want the current fee to change the size of the transaction.
@@ -0,0 +1,90 @@
+"""
+This file is a benchmark of contacts.json: load time, dump time and file size with jsonpickle (version 1, how the file
+used to be written) and with misc.Codec (version 2).
+
+Run it from the project folder with:
+    python -m benchmarks.codec [--contacts 1000 10000 100000]
+"""
+
+
+# Local project
+from misc.Codec import dump_contacts_file, load_contacts_file
+from misc.DataStructures import ListJsonContacts
+from misc.Entities import Contact
+
+# Python standard libraries
+import argparse
+import jsonpickle
+import os
+import random
+import shutil
+import string
+import tempfile
+from time import perf_counter
+
+
+def synthetic_contacts(count: int) -> ListJsonContacts:
+    generator = random.Random(0)
+    base32 = string.ascii_uppercase + "234567"
+    contacts = ListJsonContacts()
+    contacts.extend(
+        Contact(
+            # One contact in four has a picture.
+            f"{generator.getrandbits(256):064x}.png" if i % 4 == 0 else None,
+            f"Contact {i}",
+            "".join(generator.choices(base32, k=58))
+        )
+        for i in range(count)
+    )
+    return contacts
+
+
+def measure_jsonpickle(file: str, contacts: ListJsonContacts) -> tuple:
+    start = perf_counter()
+    with open(file, 'w') as f:
+        f.write(jsonpickle.encode(contacts, indent='\t'))
+    dump_time = perf_counter() - start
+
+    start = perf_counter()
+    with open(file) as f:
+        loaded = jsonpickle.decode(f.read())
+    load_time = perf_counter() - start
+    assert len(loaded) == len(contacts)
+
+    return load_time, dump_time, os.path.getsize(file)
+
+
+def measure_codec(file: str, contacts: ListJsonContacts) -> tuple:
+    start = perf_counter()
+    dump_contacts_file(file, contacts)
+    dump_time = perf_counter() - start
+
+    start = perf_counter()
+    loaded = load_contacts_file(file)
+    load_time = perf_counter() - start
+    assert len(loaded) == len(contacts)
+
+    return load_time, dump_time, os.path.getsize(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load time, dump time and size of contacts.json.")
+    parser.add_argument("--contacts", type=int, nargs="+", default=[1000, 10000, 100000])
+    arguments = parser.parse_args()
+
+    folder = tempfile.mkdtemp()
+    try:
+        print("{:<12} {:>8} {:>10} {:>10} {:>10}".format("codec", "contacts", "load (ms)", "dump (ms)", "size (KB)"))
+        for count in arguments.contacts:
+            contacts = synthetic_contacts(count)
+            for name, measure in [("jsonpickle", measure_jsonpickle), ("version 2", measure_codec)]:
+                load_time, dump_time, size = measure(os.path.join(folder, "contacts.json"), contacts)
+                print("{:<12} {:>8} {:>10.1f} {:>10.1f} {:>10.0f}".format(
+                    name, count, load_time * 1000, dump_time * 1000, size / 1024
+                ))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+This file is a check of the start of the application: how long it takes to import the main window, measured with
+python -X importtime.
+
+It fails (exit status 1) if the imports take longer than the budget or if a module that should be imported the first
+time it's used is imported at start. (i.e.: secondary windows, see deferred_modules)
+Every run is a new process. The first run also compiles modules to bytecode so the fastest run is the one compared
+with the budget.
+Run it from the project folder with:
+    python -m benchmarks.importtime [--budget-ms 1000] [--runs 5] [--top 15]
+"""
+
+
+# Python standard libraries
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+
+# What the application imports before the first window is shown. (See main.py)
+start_imports = "import Interfaces.Main.Window.Window"
+
+# These are imported the first time their window is opened. Finding them at start means that someone imported them
+#  at module level again.
+deferred_modules = [
+    "Interfaces.About.Window",
+    "Interfaces.Contacts.Window.Window",
+    "Interfaces.Contacts.ManageContact.ContactManaging",
+    "Interfaces.Transaction.Window.Window",
+    "Interfaces.Main.Wallet.UnlockWallet.UnlockWallet",
+    "Interfaces.Main.Wallet.NewImportWallet.NewImportWallet",
+    "Interfaces.Main.Address.BalanceWindow.BalanceWindow",
+]
+
+# import time: self [us] | cumulative | imported package
+line_pattern = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure() -> tuple:
+    """
+    This function imports the main window in a new process and returns the total import time in milliseconds and
+    the self time in microseconds of every module imported.
+    """
+    project_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", start_imports],
+        cwd=project_folder, check=True, stderr=subprocess.PIPE, universal_newlines=True
+    ).stderr
+
+    total, modules = 0, dict()
+    for line in output.splitlines():
+        match = line_pattern.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        modules[name] = self_us
+        # Only modules imported directly add up to the total, the others are inside their cumulative time.
+        if len(indent) == 1:
+            total += cumulative_us
+
+    return total / 1000, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time of the application start against a budget.")
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="how many of the slowest modules to show")
+    arguments = parser.parse_args()
+
+    total, modules = min((measure() for _ in range(arguments.runs)), key=lambda result: result[0])
+
+    print("{:<60} {:>10}".format("module", "self (ms)"))
+    for name, self_us in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:arguments.top]:
+        print("{:<60} {:>10.1f}".format(name, self_us / 1000))
+    print("{:<60} {:>10.1f}".format("total (fastest of {} runs)".format(arguments.runs), total))
+
+    failures = [f"{name} is imported at start" for name in deferred_modules if name in modules]
+    if total > arguments.budget_ms:
+        failures.append(f"imports took {total:.1f} ms, the budget is {arguments.budget_ms:.1f} ms")
+
+    for failure in failures:
+        print("FAIL:", failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+This file is a benchmark that compares insertion time and memory of the contact list with one widget per row
+(QListWidget.setItemWidget, how lists used to work) and with a model painted by a delegate (CustomListView).
+
+Every measurement runs in its own process so that memory of one doesn't pollute the next.
+Run it from the project folder with:
+    python -m benchmarks.lists [--rows 1000 10000 100000] [--max-widget-rows 10000]
+It needs no display: Qt runs on the offscreen platform unless QT_QPA_PLATFORM says otherwise.
+"""
+
+
+# Python standard libraries
+import argparse
+import json
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+
+def rss_mb() -> float:
+    """
+    This function returns the resident memory of this process in MB.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # Not Linux. Peak memory is the best we can get without extra packages. (KB on Linux, bytes on macOS)
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def measure(mode: str, rows: int) -> dict:
+    """
+    This function fills a contact list with rows contacts and returns insertion time, time of the first paint and
+    memory used by the list.
+    """
+    # PySide2
+    from PySide2 import QtWidgets
+
+    app = QtWidgets.QApplication([])
+
+    # Local project
+    # Imported for its side effect: it registers the graphics with Qt. (i.e.: ":/icons/generic_user.png")
+    from graphics import resources  # noqa: F401
+    from misc.Entities import Contact
+    from misc.Models import ObjectListModel
+    from misc.Widgets import CustomListView
+    from Interfaces.Contacts.Thumbnails import ContactThumbnailCache
+    from Interfaces.Contacts.Widgets import ContactListDelegate
+
+    contacts = [Contact(None, f"Contact {i:06}", f"{i:058}") for i in range(rows)]
+    generic_user = ContactThumbnailCache.placeholder()
+
+    window = QtWidgets.QWidget()
+    window.resize(560, 700)
+    layout = QtWidgets.QVBoxLayout(window)
+    window.show()
+    app.processEvents()
+
+    rss_before = rss_mb()
+    start = perf_counter()
+
+    if mode == "model":
+        view = CustomListView(window)
+        view.setItemDelegate(ContactListDelegate(view, ContactThumbnailCache(view)))
+        model = ObjectListModel(view, display=lambda contact: contact.name)
+        model.extend(contacts)
+        view.setModel(model)
+    else:
+        view = QtWidgets.QListWidget(window)
+        for contact in contacts:
+            # Same structure as the widgets that used to represent a contact.
+            widget = QtWidgets.QWidget()
+            main_layout = QtWidgets.QHBoxLayout(widget)
+            label_pixmap = QtWidgets.QLabel()
+            label_pixmap.setPixmap(generic_user)
+            main_layout.addWidget(label_pixmap)
+            main_layout.addSpacing(5)
+            label_layout = QtWidgets.QVBoxLayout()
+            main_layout.addLayout(label_layout)
+            label_name = QtWidgets.QLabel(contact.name)
+            label_name.setStyleSheet("font: 13pt;")
+            label_layout.addWidget(label_name)
+            label_info = QtWidgets.QLabel(contact.info)
+            label_info.setStyleSheet("font: 8pt;")
+            label_layout.addWidget(label_info)
+            main_layout.addStretch(1)
+
+            item = QtWidgets.QListWidgetItem()
+            item.setSizeHint(widget.minimumSizeHint())
+            view.addItem(item)
+            view.setItemWidget(item, widget)
+
+    insert_time = perf_counter() - start
+
+    layout.addWidget(view)
+    start = perf_counter()
+    app.processEvents()
+    view.viewport().repaint()
+    paint_time = perf_counter() - start
+
+    return {
+        "mode": mode,
+        "rows": rows,
+        "insert_ms": insert_time * 1000,
+        "first_paint_ms": paint_time * 1000,
+        "rss_mb": rss_mb() - rss_before
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Insertion time and memory of the contact list.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--max-widget-rows", type=int, default=10000,
+                        help="one widget per row gets very slow, larger sizes are only measured with the model")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "ROWS"), help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    if arguments.child:
+        print(json.dumps(measure(arguments.child[0], int(arguments.child[1]))))
+        return
+
+    print("{:<8} {:>8} {:>12} {:>16} {:>10}".format("mode", "rows", "insert (ms)", "first paint (ms)", "RSS (MB)"))
+    for rows in arguments.rows:
+        for mode in ["widgets", "model"]:
+            if mode == "widgets" and rows > arguments.max_widget_rows:
+                continue
+
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.lists", "--child", mode, str(rows)],
+                check=True, stdout=subprocess.PIPE, universal_newlines=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print("{mode:<8} {rows:>8} {insert_ms:>12.1f} {first_paint_ms:>16.1f} {rss_mb:>10.1f}".format(**result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+"""
+This file contains a local stand-in for kmd, algod and indexer that only implements the endpoints this application uses.
+
+It's meant to measure the application without a real node (i.e.: on CI or on air-gapped machines). Latency, jitter,
+error rate and the amount of synthetic data are configurable.
+Run it from the project folder with:
+    python -m benchmarks.node --wallets 500 --addresses 100 --latency 200 --jitter 50
+then choose "Remote" in Settings and fill in the printed urls, ports and token.
+"""
+
+
+# Algorand
+import msgpack
+from algosdk import encoding
+
+# Python standard libraries
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Dict
+from urllib.parse import urlsplit, parse_qs
+
+
+class StandInNode:
+    """
+    This class holds synthetic data for a node and serves kmd, algod and indexer APIs on three local ports.
+
+    Every wallet has the same password and the same number of addresses. Addresses are valid Algorand addresses.
+    """
+    def __init__(self, wallets: int = 10, addresses: int = 10, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0, token: str = "a" * 64, password: str = "password", host: str = "127.0.0.1"):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.token = token
+        self.password = password
+        self.host = host
+
+        self.lock = Lock()
+        self.random = random.Random(0)
+        self.handles = dict()
+        self.last_round = 1000
+
+        self.wallets = dict()
+        for i in range(wallets):
+            wallet_id = hashlib.md5(str(i).encode()).hexdigest()
+            self.wallets[wallet_id] = {
+                "info": {
+                    "id": wallet_id, "name": f"wallet-{i:05}", "driver_name": "sqlite", "driver_version": 1,
+                    "mnemonic_ux": False, "supported_txs": ["pay", "keyreg"]
+                },
+                "addresses": [self.synthetic_address(f"{i}-{j}") for j in range(addresses)]
+            }
+
+        self.servers = dict()
+
+    @staticmethod
+    def synthetic_address(seed: str) -> str:
+        return encoding.encode_address(hashlib.sha512(seed.encode()).digest()[:32])
+
+    def start(self, kmd_port: int = 0, algod_port: int = 0, indexer_port: int = 0):
+        """
+        This method starts serving in background threads. Port 0 means any free port.
+        """
+        for service, port, auth_header in [("kmd", kmd_port, "X-KMD-API-Token"),
+                                           ("algod", algod_port, "X-Algo-API-Token"),
+                                           ("indexer", indexer_port, "X-Indexer-API-Token")]:
+            handler = type(f"{service}Handler", (StandInHandler, ), {
+                "node": self, "service": service, "auth_header": auth_header
+            })
+            server = ThreadingHTTPServer((self.host, port), handler)
+            server.daemon_threads = True
+            Thread(target=server.serve_forever, daemon=True).start()
+            self.servers[service] = server
+
+    def stop(self):
+        for server in self.servers.values():
+            server.shutdown()
+            server.server_close()
+
+    def port(self, service: str) -> int:
+        return self.servers[service].server_address[1]
+
+    def address(self, service: str) -> str:
+        return f"http://{self.host}:{self.port(service)}"
+
+    def delay(self):
+        time.sleep(max(self.latency + self.random.uniform(-self.jitter, self.jitter), 0))
+
+    # kmd
+    def wallet_of(self, body: Dict) -> Dict:
+        handle = self.handles.get(body.get("wallet_handle_token"))
+        if handle is None or handle[1] < time.time():
+            raise StandInError(401, "invalid or expired wallet handle")
+        return self.wallets[handle[0]]
+
+    def check_password(self, body: Dict):
+        if body.get("wallet_password") != self.password:
+            raise StandInError(401, "wrong password")
+
+    def wallet_handle(self, wallet: Dict, handle: str) -> Dict:
+        return {"expires_seconds": int(self.handles[handle][1] - time.time()), "wallet": wallet["info"]}
+
+    def kmd(self, method: str, path: str, body: Dict) -> Dict:
+        with self.lock:
+            if (method, path) == ("GET", "/versions"):
+                return {"versions": ["v1"]}
+            if (method, path) == ("GET", "/v1/wallets"):
+                return {"wallets": [wallet["info"] for wallet in self.wallets.values()]}
+            if (method, path) == ("POST", "/v1/wallet/init"):
+                if body.get("wallet_id") not in self.wallets:
+                    raise StandInError(404, "wallet not found")
+                self.check_password(body)
+                handle = hashlib.sha256(str(self.random.random()).encode()).hexdigest()
+                self.handles[handle] = (body["wallet_id"], time.time() + 60)
+                return {"wallet_handle_token": handle}
+            if (method, path) == ("POST", "/v1/wallet/renew"):
+                wallet = self.wallet_of(body)
+                handle = body["wallet_handle_token"]
+                self.handles[handle] = (self.handles[handle][0], time.time() + 60)
+                return {"wallet_handle": self.wallet_handle(wallet, handle)}
+            if (method, path) == ("POST", "/v1/wallet/info"):
+                wallet = self.wallet_of(body)
+                return {"wallet_handle": self.wallet_handle(wallet, body["wallet_handle_token"])}
+            if (method, path) == ("POST", "/v1/wallet/release"):
+                self.handles.pop(body.get("wallet_handle_token"), None)
+                return {}
+            if (method, path) == ("POST", "/v1/key/list"):
+                return {"addresses": list(self.wallet_of(body)["addresses"])}
+            if (method, path) == ("POST", "/v1/key"):
+                wallet = self.wallet_of(body)
+                address = self.synthetic_address(f"{wallet['info']['id']}-{len(wallet['addresses'])}-new")
+                wallet["addresses"].append(address)
+                return {"address": address}
+            if (method, path) == ("POST", "/v1/transaction/sign"):
+                self.wallet_of(body)
+                self.check_password(body)
+                # The signature is fake. It only has the right size.
+                txn = msgpack.unpackb(base64.b64decode(body["transaction"]), raw=False)
+                signed = msgpack.packb({"sig": bytes(64), "txn": txn}, use_bin_type=True)
+                return {"signed_transaction": base64.b64encode(signed).decode()}
+
+        raise StandInError(404, f"{method} {path} is not implemented by the stand-in kmd")
+
+    # algod
+    def algod(self, method: str, path: str, body: bytes) -> Dict:
+        if (method, path) == ("GET", "/v2/status"):
+            return {"last-round": self.last_round, "last-version": "future", "time-since-last-round": 0,
+                    "catchup-time": 0, "next-version": "future", "next-version-round": self.last_round + 1,
+                    "next-version-supported": True, "stopped-at-unsupported-round": False}
+        if (method, path) == ("GET", "/v2/transactions/params"):
+            return {"consensus-version": "future", "fee": 0, "genesis-hash": base64.b64encode(bytes(32)).decode(),
+                    "genesis-id": "stand-in-v1", "last-round": self.last_round, "min-fee": 1000}
+        if (method, path) == ("POST", "/v2/transactions"):
+            return {"txId": base64.b32encode(hashlib.sha512(body or b"").digest()[:32]).decode().strip("=")}
+
+        match = re.fullmatch(r"/v2/accounts/([A-Z2-7]{58})", path)
+        if method == "GET" and match:
+            amount = int(hashlib.md5(match.group(1).encode()).hexdigest()[:8], 16)
+            return {"address": match.group(1), "amount": amount + 1000, "amount-without-pending-rewards": amount,
+                    "pending-rewards": 1000, "rewards": 0, "round": self.last_round, "status": "Offline",
+                    "assets": [{"asset-id": 1, "amount": amount // 2, "creator": "", "is-frozen": False}]}
+
+        raise StandInError(404, f"{method} {path} is not implemented by the stand-in algod")
+
+    # indexer
+    def indexer(self, method: str, path: str, query: Dict) -> Dict:
+        if (method, path) == ("GET", "/health"):
+            return {"data": {}, "db-available": True, "is-migrating": False, "message": "", "round": self.last_round}
+        if (method, path) == ("GET", "/v2/accounts"):
+            # Accounts are paged. The "next" token is simply the index of the first account of the next page.
+            with self.lock:
+                addresses = [address for wallet in self.wallets.values() for address in wallet["addresses"]]
+            start = int(query.get("next", ["0"])[0])
+            limit = int(query.get("limit", ["100"])[0])
+            page = addresses[start:start + limit]
+            result = {"accounts": [{"address": address, "amount": 0} for address in page],
+                      "current-round": self.last_round}
+            if start + limit < len(addresses):
+                result["next-token"] = str(start + limit)
+            return result
+
+        raise StandInError(404, f"{method} {path} is not implemented by the stand-in indexer")
+
+
+class StandInError(Exception):
+    """
+    Exception that becomes an HTTP error with a json message, the way a real node answers.
+    """
+    def __init__(self, status: int, message: str):
+        self.status = status
+        self.message = message
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Handler shared by the three services. node, service and auth_header are set by StandInNode.start.
+    """
+    protocol_version = "HTTP/1.1"
+    # Buffered writes so that headers and body leave in a single segment, like a real node would do.
+    wbufsize = -1
+
+    node = None
+    service = None
+    auth_header = None
+
+    def handle_any(self):
+        split_url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        raw_body = self.rfile.read(length) if length else b""
+
+        self.node.delay()
+
+        try:
+            if self.node.random.random() < self.node.error_rate:
+                raise StandInError(500, "stand-in random error")
+            if self.headers.get(self.auth_header) != self.node.token and split_url.path != "/health":
+                raise StandInError(401, "invalid API token")
+
+            if self.service == "kmd":
+                status, result = 200, self.node.kmd(self.command, split_url.path,
+                                                     json.loads(raw_body) if raw_body else {})
+            elif self.service == "algod":
+                status, result = 200, self.node.algod(self.command, split_url.path, raw_body)
+            else:
+                status, result = 200, self.node.indexer(self.command, split_url.path, parse_qs(split_url.query))
+        except StandInError as e:
+            status, result = e.status, {"message": e.message}
+
+        self.send_json(status, result)
+
+    def send_json(self, status: int, result: Dict):
+        body = json.dumps(result).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_DELETE = handle_any
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for kmd, algod and indexer.")
+    parser.add_argument("--wallets", type=int, default=10)
+    parser.add_argument("--addresses", type=int, default=10, help="addresses per wallet")
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0, help="milliseconds of uniform jitter around latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of requests that fail with 500")
+    parser.add_argument("--kmd-port", type=int, default=0)
+    parser.add_argument("--algod-port", type=int, default=0)
+    parser.add_argument("--indexer-port", type=int, default=0)
+    arguments = parser.parse_args()
+
+    node = StandInNode(arguments.wallets, arguments.addresses, arguments.latency, arguments.jitter,
+                       arguments.error_rate)
+    node.start(arguments.kmd_port, arguments.algod_port, arguments.indexer_port)
+
+    print(f"Wallet password: {node.password}")
+    print(f"Token (all services): {node.token}")
+    for service in ["kmd", "algod", "indexer"]:
+        print(f"{service:<8} url: {node.host}  port: {node.port(service)}")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        node.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+This file is a benchmark of how graphics are registered at startup: embedded in a Python module as bytes (how
+graphics/resources.py used to be generated by pyside2-rcc) and as the binary bundle graphics/resources.rcc registered
+with QResource.registerResource.
+
+The embedded module is generated from resources.rcc so that both hold exactly the same graphics.
+Every measurement runs in its own process. The first run of the embedded module also compiles it to bytecode, so
+that's reported apart from the others.
+Run it from the project folder with:
+    python -m benchmarks.resources [--runs 10]
+It needs no display: the icon is read as a QImage so no QGuiApplication is created.
+"""
+
+
+# Local project
+from benchmarks.lists import rss_mb
+
+# Python standard libraries
+import argparse
+import importlib
+import json
+import os
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+
+fullpath_rcc = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "graphics", "resources.rcc")
+
+
+def escape(chunk: bytes) -> str:
+    return "".join(
+        chr(byte) if 32 <= byte < 127 and byte not in (ord('"'), ord("\\")) else f"\\x{byte:02x}" for byte in chunk
+    )
+
+
+def write_embedded_module(file: str):
+    """
+    This function writes the Python module that pyside2-rcc would generate for the content of resources.rcc.
+    """
+    with open(fullpath_rcc, "rb") as f:
+        bundle = f.read()
+    version, tree_offset, data_offset, names_offset = struct.unpack(">IIII", bundle[4:20])
+    blocks = {
+        "qt_resource_data": bundle[data_offset:names_offset],
+        "qt_resource_name": bundle[names_offset:tree_offset],
+        "qt_resource_struct": bundle[tree_offset:],
+    }
+
+    with open(file, "w") as f:
+        f.write("from PySide2 import QtCore\n\n")
+        for name, block in blocks.items():
+            f.write(f'{name} = b"\\\n')
+            for i in range(0, len(block), 16):
+                f.write(escape(block[i:i + 16]) + "\\\n")
+            f.write('"\n\n')
+        f.write(
+            f"QtCore.qRegisterResourceData({version:#04x}, qt_resource_struct, qt_resource_name, qt_resource_data)\n"
+        )
+
+
+def measure(mode: str, folder: str) -> dict:
+    """
+    This function registers the graphics with mode and returns how long it took, the memory it took and how long it
+    takes to read the first icon.
+    """
+    # PySide2
+    from PySide2 import QtCore, QtGui
+
+    rss_before = rss_mb()
+    start = perf_counter()
+    if mode == "embedded":
+        sys.path.insert(0, folder)
+        # Importing the module registers the graphics.
+        importlib.import_module("resources_embedded")
+    else:
+        if not QtCore.QResource.registerResource(fullpath_rcc):
+            raise RuntimeError(f"Could not register {fullpath_rcc}")
+    register_time = perf_counter() - start
+    rss_after = rss_mb()
+
+    start = perf_counter()
+    image = QtGui.QImage(":/icons/search.png")
+    first_icon_time = perf_counter() - start
+    assert not image.isNull()
+
+    return {
+        "mode": mode,
+        "register_ms": register_time * 1000,
+        "first_icon_ms": first_icon_time * 1000,
+        "rss_mb": rss_after - rss_before
+    }
+
+
+def run_child(mode: str, folder: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.resources", "--child", mode, folder],
+        check=True, stdout=subprocess.PIPE, universal_newlines=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup cost of the graphics of the application.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "FOLDER"), help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.child:
+        print(json.dumps(measure(*arguments.child)))
+        return
+
+    folder = tempfile.mkdtemp()
+    try:
+        write_embedded_module(os.path.join(folder, "resources_embedded.py"))
+
+        print("{:<22} {:>14} {:>16} {:>10}".format("mode", "register (ms)", "first icon (ms)", "RSS (MB)"))
+        first = run_child("embedded", folder)
+        print("{:<22} {register_ms:>14.1f} {first_icon_ms:>16.2f} {rss_mb:>10.1f}".format(
+            "embedded (first run)", **first
+        ))
+        for mode in ["embedded", "rcc"]:
+            results = [run_child(mode, folder) for _ in range(arguments.runs)]
+            print("{:<22} {:>14.1f} {:>16.2f} {:>10.1f}".format(
+                f"{mode} (median)",
+                *(statistics.median(result[key] for result in results)
+                  for key in ["register_ms", "first_icon_ms", "rss_mb"])
+            ))
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    main()
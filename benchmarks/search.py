@@ -0,0 +1,93 @@
+"""
+This file is a benchmark of the contact search index. (misc.Search.ContactIndex)
+
+It builds the index over synthetic contacts and then types some queries one character at a time, just like a user in
+the search bar of ContactsWindow would do. Time includes ranking the results and, for queries whose words could share
+characters (i.e.: "an an"), giving every word its own substring. Every keystroke should take less than a frame. (16 ms)
+Every query is typed several times and each keystroke counts with its fastest run, so that a pause of the machine
+(or of the garbage collector) is not taken for the cost of the search.
+It fails (exit status 1) if a keystroke of any query takes longer than the budget.
+Run it from the project folder with:
+    python -m benchmarks.search [--contacts N] [--runs 5] [--budget-ms 16]
+"""
+
+
+# Local project
+from misc.Search import ContactIndex
+
+# Python standard libraries
+import argparse
+import random
+import statistics
+import string
+import sys
+from time import perf_counter
+
+
+class SyntheticContact:
+    """
+    Stand-in for misc.Entities.Contact which can't be imported without PySide2.
+    """
+    def __init__(self, name: str, info: str):
+        self.pic_name = None
+        self.name = name
+        self.info = info
+
+
+first_names = ["Monty", "Guido", "Ada", "Alan", "Grace", "Linus", "Ken", "Dennis", "Barbara", "Edsger", "Donald",
+               "John", "Mary", "Sofia", "Luca", "Giorgio", "Anna", "Marco", "Giulia", "Paolo"]
+last_names = ["Python", "Rossum", "Lovelace", "Turing", "Hopper", "Torvalds", "Thompson", "Ritchie", "Liskov",
+              "Dijkstra", "Knuth", "Smith", "Rossi", "Bianchi", "Ferrari", "Russo", "Romano", "Colombo"]
+base32 = string.ascii_uppercase + "234567"
+
+
+def synthetic_contacts(count: int) -> list:
+    generator = random.Random(0)
+    return [
+        SyntheticContact(
+            f"{generator.choice(first_names)} {generator.choice(last_names)} {i}",
+            "".join(generator.choices(base32, k=58))
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time of a contact search for every keystroke.")
+    parser.add_argument("--contacts", type=int, default=100000)
+    parser.add_argument("--runs", type=int, default=5, help="how many times every query is typed")
+    parser.add_argument("--budget-ms", type=float, default=16, help="milliseconds a keystroke may take")
+    arguments = parser.parse_args()
+
+    contacts = synthetic_contacts(arguments.contacts)
+
+    start = perf_counter()
+    index = ContactIndex(contacts)
+    print("index of {} contacts built in {:.0f} ms".format(len(index), (perf_counter() - start) * 1000))
+
+    queries = ["monty python", "py mo", "ross 12", "grace", "an an", "a", contacts[len(contacts) // 2].info[:8].lower()]
+    print("{:<16} {:>10} {:>10} {:>10}".format("query", "max (ms)", "mean (ms)", "results"))
+    failures = list()
+    for query in queries:
+        timings = [float("inf")] * len(query)
+        for _ in range(arguments.runs):
+            index.forget_last_search()
+            for length in range(1, len(query) + 1):
+                start = perf_counter()
+                result = index.search(query[:length])
+                timings[length - 1] = min(timings[length - 1], (perf_counter() - start) * 1000)
+        print("{:<16} {:>10.2f} {:>10.2f} {:>10}".format(
+            query[:16], max(timings), statistics.mean(timings), len(result)
+        ))
+        if max(timings) > arguments.budget_ms:
+            failures.append(
+                f'a keystroke of "{query}" took {max(timings):.1f} ms, the budget is {arguments.budget_ms:.1f} ms'
+            )
+
+    for failure in failures:
+        print("FAIL:", failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""
+This file is a benchmark of the start of the application: how long main.main() takes to show the main window, to paint
+it for the first time and to fill the list of wallets. (WalletsFrame.wallet_loading_success)
+
+The application runs against benchmarks.node.StandInNode with 1, 100 and 5000 wallets by default. Every run is a new
+process with its own empty user folder whose settings point at the stand-in node.
+Results are printed and written as JSON so that they can be compared between releases.
+Run it from the project folder with:
+    python -m benchmarks.startup [--wallets 1 100 5000] [--runs 5] [--latency 0] [--output startup.json]
+It needs no display: Qt runs on the offscreen platform unless QT_QPA_PLATFORM says otherwise.
+"""
+
+
+# Local project
+from benchmarks.node import StandInNode
+
+# Python standard libraries
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from time import perf_counter
+
+
+timings = ["show_ms", "first_paint_ms", "wallets_ms"]
+
+
+def measure(timeout_ms: int) -> dict:
+    """
+    This function runs main.main() and returns, in milliseconds from the start of this function, when the main window
+    was shown, painted and when its list of wallets was filled.
+
+    The main window module is imported before main.main() is called so that its methods can be timed. The clock starts
+    before that import so times still include it.
+    """
+    start = perf_counter()
+
+    # PySide2
+    import PySide2
+    from PySide2 import QtCore, QtWidgets
+
+    # Local project
+    import main
+    from Interfaces.Main.Window.Window import MainWindow
+    from Interfaces.Main.Wallet.Frame.Frame import WalletsFrame
+
+    result = {"qt": QtCore.qVersion(), "pyside2": PySide2.__version__, "error": None}
+
+    def elapsed_ms() -> float:
+        return (perf_counter() - start) * 1000
+
+    class PaintFilter(QtCore.QObject):
+        """
+        This class notices the first paint of any widget inside the main window.
+        """
+        def __init__(self, main_window: QtWidgets.QMainWindow):
+            super().__init__()
+            self.main_window = main_window
+
+        def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+            if event.type() == QtCore.QEvent.Paint and isinstance(watched, QtWidgets.QWidget) \
+                    and watched.window() is self.main_window and "first_paint_ms" not in result:
+                result["first_paint_ms"] = elapsed_ms()
+                QtWidgets.QApplication.instance().removeEventFilter(self)
+            return False
+
+    def finish(main_window: QtWidgets.QMainWindow, error: str = None):
+        # Only the first outcome counts. (i.e.: the timeout firing while the window is closing)
+        if "finished" in result:
+            return
+        result["finished"] = True
+        result["error"] = error
+        QtCore.QTimer.singleShot(0, main_window.close)
+
+    original_show = MainWindow.show
+    original_success = WalletsFrame.wallet_loading_success
+
+    def show(self: MainWindow):
+        # The filter has to outlive this function.
+        self.benchmark_paint_filter = PaintFilter(self)
+        QtWidgets.QApplication.instance().installEventFilter(self.benchmark_paint_filter)
+        original_show(self)
+        result["show_ms"] = elapsed_ms()
+        QtCore.QTimer.singleShot(timeout_ms, lambda: finish(self, f"No wallets after {timeout_ms} ms"))
+
+    def wallet_loading_success(self: WalletsFrame, wallets: list):
+        original_success(self, wallets)
+        result["wallets_ms"] = elapsed_ms()
+        result["wallets"] = self.wallet_model.rowCount()
+        finish(self.window())
+
+    def wallet_loading_failed(self: WalletsFrame, error: Exception):
+        # The message box would wait for a click.
+        finish(self.window(), f"{type(error).__name__}: {error}")
+
+    MainWindow.show = show
+    WalletsFrame.wallet_loading_success = wallet_loading_success
+    WalletsFrame.wallet_loading_failed = wallet_loading_failed
+
+    main.main()
+
+    return result
+
+
+def write_settings(user_folder: str, node: StandInNode):
+    """
+    This function writes the settings of a new user that point at node. (The "Remote" choice in Settings)
+    """
+    # Local project
+    import misc.Constants as ProjectConstants
+    from misc.Codec import dump_settings_file
+    from misc.DataStructures import DictJsonSettings
+
+    settings = DictJsonSettings()
+    settings["selected"] = 2
+    for service in ["algod", "kmd", "indexer"]:
+        settings[service] = {"url": node.host, "port": str(node.port(service)), "token": node.token}
+
+    folder = os.path.join(user_folder, os.path.basename(ProjectConstants.path_user_data))
+    os.mkdir(folder)
+    dump_settings_file(os.path.join(folder, ProjectConstants.filename_settings_json), settings)
+
+
+def run_child(node: StandInNode, timeout_ms: int) -> dict:
+    user_folder = tempfile.mkdtemp()
+    try:
+        write_settings(user_folder, node)
+
+        # misc.Constants finds the user folder through the home folder.
+        environment = dict(os.environ, HOME=user_folder, USERPROFILE=user_folder)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.startup", "--child", "--timeout", str(timeout_ms)],
+            env=environment, check=True, stdout=subprocess.PIPE, universal_newlines=True
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+    finally:
+        shutil.rmtree(user_folder)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to show the main window and to fill the list of wallets.")
+    parser.add_argument("--wallets", type=int, nargs="+", default=[1, 100, 5000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds the stand-in node adds to requests")
+    parser.add_argument("--timeout", type=int, default=60000, help="milliseconds a run may wait for the wallets")
+    parser.add_argument("--output", default="startup.json", help="JSON file with every run and the medians")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    if arguments.child:
+        print(json.dumps(measure(arguments.timeout)))
+        return
+
+    report = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "qt_platform": os.environ["QT_QPA_PLATFORM"],
+        "latency_ms": arguments.latency,
+        "results": list()
+    }
+
+    print("{:>8} {:>10} {:>17} {:>13} {:>7}".format("wallets", "show (ms)", "first paint (ms)", "wallets (ms)", "errors"))
+    for wallets in arguments.wallets:
+        node = StandInNode(wallets=wallets, addresses=1, latency_ms=arguments.latency)
+        node.start()
+        try:
+            runs = [run_child(node, arguments.timeout) for _ in range(arguments.runs)]
+        finally:
+            node.stop()
+
+        successful = [run for run in runs if not run["error"]]
+        medians = dict()
+        for timing in timings:
+            values = [run[timing] for run in successful if timing in run]
+            medians[timing] = statistics.median(values) if values else None
+        report["qt"] = runs[0]["qt"]
+        report["pyside2"] = runs[0]["pyside2"]
+        report["results"].append({"wallets": wallets, "median": medians, "runs": runs})
+
+        print("{:>8} {:>10} {:>17} {:>13} {:>7}".format(
+            wallets,
+            *("{:.1f}".format(medians[timing]) if medians[timing] is not None else "-" for timing in timings),
+            len(runs) - len(successful)
+        ))
+        for run in runs:
+            if run["error"]:
+                print("  error:", run["error"], file=sys.stderr)
+
+    with open(arguments.output, "w") as f:
+        json.dump(report, f, indent=4)
+    print("Results written to", arguments.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+This file is a benchmark of the two stores of contact thumbnails. (misc.Storage)
+
+It saves the same synthetic thumbnails as one file each and packed in an atlas, then measures opening the store and
+reading all of them, which is what Contacts does while scrolling the whole list.
+Run it from the project folder with:
+    python -m benchmarks.thumbnails [--thumbnails 1000 10000] [--folder PATH]
+Pointing --folder to a network home directory shows the difference best. Page cache is not dropped so reads from a
+local disk are warm.
+"""
+
+
+# Local project
+from misc.Storage import FileThumbnailStore, ThumbnailAtlas
+
+# Python standard libraries
+import argparse
+import os
+import shutil
+import tempfile
+from time import perf_counter
+
+
+def measure(store_type: str, folder: str, keys: list) -> float:
+    """
+    This function returns the milliseconds needed to open the store in folder and read every key.
+    """
+    start = perf_counter()
+    if store_type == "files":
+        store = FileThumbnailStore(folder)
+    else:
+        store = ThumbnailAtlas(os.path.join(folder, "thumbnails.atlas"))
+    for key in keys:
+        assert store.read(key) is not None
+    elapsed = perf_counter() - start
+
+    if store_type == "atlas":
+        store.close()
+    return elapsed * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to read every contact thumbnail from each store.")
+    parser.add_argument("--thumbnails", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--size", type=int, default=3000, help="bytes of a thumbnail")
+    parser.add_argument("--folder", default=None, help="where stores are created, a temporary folder by default")
+    arguments = parser.parse_args()
+
+    print("{:>10} {:>12} {:>12}".format("thumbnails", "files (ms)", "atlas (ms)"))
+    for count in arguments.thumbnails:
+        root = tempfile.mkdtemp(dir=arguments.folder)
+        try:
+            folder_files, folder_atlas = os.path.join(root, "files"), os.path.join(root, "atlas")
+            os.mkdir(folder_files)
+            os.mkdir(folder_atlas)
+
+            keys = [f"{i:064x}-40px-v1.png" for i in range(count)]
+            files = FileThumbnailStore(folder_files)
+            atlas = ThumbnailAtlas(os.path.join(folder_atlas, "thumbnails.atlas"))
+            for key in keys:
+                data = os.urandom(arguments.size)
+                files.store(key, data)
+                atlas.store(key, data)
+            atlas.close()
+
+            print("{:>10} {:>12.1f} {:>12.1f}".format(
+                count, measure("files", folder_files, keys), measure("atlas", folder_atlas, keys)
+            ))
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
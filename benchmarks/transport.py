@@ -0,0 +1,65 @@
+"""
+This file is a benchmark that compares per-call latency of algosdk clients with and without misc.Transport.
+
+The local stand-in kmd (benchmarks.node) answers every request so that only the cost of the transport is measured.
+Run it from the project folder with:
+    python -m benchmarks.transport [--calls N]
+"""
+
+
+# Algorand
+from algosdk import kmd
+
+# Local project
+import misc.Transport as Transport
+from benchmarks.node import StandInNode
+
+# Python standard libraries
+import argparse
+import statistics
+import urllib.request
+from time import perf_counter
+
+
+def measure(client: kmd.KMDClient, calls: int) -> list:
+    """
+    This function returns the latency in milliseconds of every call.
+    """
+    timings = list()
+    for _ in range(calls):
+        start = perf_counter()
+        client.versions()
+        timings.append((perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list):
+    timings = sorted(timings)
+    print("{:<20} mean {:7.3f} ms   p50 {:7.3f} ms   p95 {:7.3f} ms".format(
+        label, statistics.mean(timings), timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-call latency with and without connection reuse.")
+    parser.add_argument("--calls", type=int, default=2000)
+    arguments = parser.parse_args()
+
+    node = StandInNode(wallets=0)
+    node.start()
+
+    client = kmd.KMDClient(node.token, node.address("kmd"))
+
+    try:
+        kmd.urlopen = urllib.request.urlopen
+        report("urllib (no reuse)", measure(client, arguments.calls))
+
+        Transport.install()
+        report("pooled (keep-alive)", measure(client, arguments.calls))
+    finally:
+        Transport.pool_manager.clear()
+        node.stop()
+
+
+if __name__ == '__main__':
+    main()
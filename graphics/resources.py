@@ -1,9359 +1,35 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 5.15.0
-# WARNING! All changes made in this file will be lost!
+"""
+This file registers the graphics of this application (icons, masks and animations) with Qt so that they can be read
+through paths like ":/icons/search.png".
 
+They are compiled from resources.qrc into the binary bundle resources.rcc by ui_rcc_compile.py. Qt memory-maps the
+bundle so nothing is read from it until an image is actually used. (Graphics used to be embedded in this file as
+Python bytes which had to be parsed and copied at every start)
+
+Importing this module registers the bundle.
+"""
+
+
+# PySide2
 from PySide2 import QtCore
 
-qt_resource_data = b"\
-\x00\x01\xafH\
-R\
-IFF@\xaf\x01\x00WEBPVP8X\x0a\
-\x00\x00\x00\x12\x00\x00\x00\xc7\x00\x00\xc7\x00\x00ANI\
-M\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00ANMFL\
-\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\x9f\x00\x00\x1e\
-\x00\x00\x02ALPH\xa0\x01\x00\x00\x01\x0f0\xff\x11\
-\x11\x02nm\xdb\xb8\xb5c\x08n\xa8\x04\xa5(\x8d\xd2\
-n)J\x10\x0a\x0c+\xc0q\xde\xf7\x9bF\xf4\x7f\x02\
-\xe4\xd8pr\xfdb1,\x0a\x16\xcddZ\x14,\xaa\
-I7\x99\x16\x05\x8b\xd7\xa4\x99t\x93i\x82E1\xa9\
-&\xcd\xa4\x9b\x8c\x9d\xe8\xe7\x92\xe4\x92\xd5]\x94%\xc9\
-\xe5\xbb<7u\x91\xdb\x06\xa4\xab\x0e\x84\xab\x01<W\
-\x13p\x16Y\xae\x81tU\x80x\xf5\x02\x8f\x89\xbf\xaa\
-\x80\xbbj\x80X\xe4\xbb\x0e\xe9n@4\x09w\x13\x1e\
-\x13\x7f\x07\xb8/Q\x00\xb1\xc8w/\xa4/\x13\xef\xaa\
-U\xb8k\xf0|\x19\x7f\xd7\xad\xdc\xf7\x19 \xdfg\x92\
-\xbfU\xfaF\x18\xc5\xffT\x03\x83\xfewK7\x03\xa6\
-E\xfeJ\xf9f~\xa5a\x91\x06\xdc`\xd5\xc1\xe9\x8a\
-U4\xf3\xba\x17b\xb3\x08\x0d\x1e]5\xab\x10t\x0d\
-\x1e\x9b\x17\xa2\xae\xef\x92n\x80\xb7)\x90u\x13\x5c\x01\
-t\x80\x13\x0bY\x9c\xa6l&x\xcd\x0by\xf3h\xea\
-f@\xd04H\x22\xfd\xa2\x9f\xa2f@\x14i\x904\
-\x13\xc2&k\xd8T\xc0\x9d\x0a\xf0\x88\xbc\x80?\xbd\x9a\
-\xe7T\x01/R\x80pj\x80\x13\x11 \x9d\x06 \x22\
-2!\x9f\xa6\x86C\x01\xf22\x00\xbf{\x81\xb4t \
-\xec\x1a\x10\x97\x06\xa4\xdd\x00\xc2R\x01v\x00\xcf\xf2.\
-~\xa9\x8b_\xca\x12\x97\xa1\x90\x05'RX\xddf.\
-Q\xa4/Y\xb6c!O\xd6\xb4\xeb\x9bc\xdc5]\
-\xd8U\xdd\xb3+:\xbf\x13\x9d\x1c\xa7&\x9f\xba&\x9d\
-\x9a&\x9c^\x8d?\x89\xc6)\xe6)\x8b\xb2\x9f\xa2\xa6\
-\x9e\x1eM99\x8d\x8c]\x16u\xdd\x05]\xd99\x9d\
-\xf4%\xc9eY\xfc\x8d4\x08r\x04VP8 \x8c\
-\x06\x00\x000$\x00\x9d\x01*\xa0\x00\xa0\x00>\x91@\
-\x9bH%\xa4\x22\xa1.v\x09\x98\xb0\x12\x09gn\xe0\
-\xc0\x00e\x9f8\xeb\xfb\xa7\xf2_\xd5\xaf\x00\xff\xber\
-\xb2{\x0d\xca\xdd\x9a\xf8\xb0\xfc-\xe3\x1d\xcb\xbd\x8d\x99\
-w\xbdKP\xef\x01\xf2\x9ex\x22\xfd'\xfdo\xb0'\
-\xf0\xbfD\xdf\xe3\xff\xe5yA\xfc\xa3\xfc'\xfe\x1fp\
-o\xe5\x9f\xd8}\x17=w\xfe\xc0{\x07~\x98 ?\
-\x1b\xc9x\xbd\xb49\x0c\xec\xd0\xf8z\xf9\x80c\xfbF\
-\xc3!\x904\x19\xd2\xe7\x5c\xca\xff\x14\xf3\xdf\xb5\x9f\x13\
-hh\xc9\x99\x8bJ\xed\xc9\x1eL\x9aP\x04.7u\
-\x9b\xe0\x924\xf9<\xb6\x9d\x8fF\xe7\x15\xb4\x02\x84q\
-\xcb\x09:3B#\xa1\xe9\x8a\x1fA\xdb\xf0\x9f\xfa\x19\
-\x05\xedJ\xc4\x1a\x0ap\x89\x815\x0f\xe0\x9e\x92\x88\x8e\
-\x85\xf0\x19\xd4\xd0\x0ft1\x8a~\xe5\xe6Z\x97oJ\
-[Ns\x96-\xab\xa5\x09o\xc4\xfb\x8ak\x96\xeaQ\
-\x963\xdc\xda\x17mw\x935~\x149\x1b\xa7P\x9b\
-!\xb3J\xb4Y\xb5L$\x05\xfbL\xfd\x5c\x0ff\xf9\
-\xdb4l#\x0b\xeeI)\xe6[\xc6\x99:>\x98\xb9\
-\xf3\xfd1\xbaB\xb6\x8a\x1a\xa5WYM`\x00\xfe\xc3\
-N\xb6Z\xa6\xdaPb\xc1\xe4\x1c\xb8\xe7\xfb\x16=.\
-\x12d\xf8\xbe\xed\x5c\xeb\x08n'S\x8eq;\xb8\xfb\
-Q\x0d4\xecU\xbbl\xea\xe5\xa6\x18d\xf70\x10\x84\
-\xae\xfbi\x1d\xda\xcb\xac\xf3\xb5a\x92\xf7\x93)<\xd6\
-\xe6 )\x1c\xa7\x5cm\xc1\xfcS\xf8b\xdf\xcb\x96\x90\
-\xe9\xc8\xdfJ\xf4`m\xd5\x92j2\xcc>\xfd\xc6t\
-U\x02\x9c\xd6\xd4\xb2\xf0\x8df\xca=\x96\x83`\x1e\x80\
-\xa8\xd1\xff\xfc\x0d\x00:\x94\xff0\xcaOg\x89\x99q\
-\xef\xde#\xcdd\xab$[\xda%U\x1f|b+\xdf\
-\xcd\xb1)\xea\x87\xc5\xe7\xc0\xb3\x02(\xf9\x83\xb1\x1c\x9c\
-T\xb0aF$\xfe1\x04n\x85\xda&\x93N\x81\xc5\
-\x89\x1e[\xa5\xbb\x10[j\x80e%\xb5D\xda>&\
-\x7f\xa0?\xab!\x22\x00@\x9e\xef%\xfd\xd1\xd9<%\
-\x8c\x85\xd3\xa3\xd3\x01\xa2I8\xa9\x8e\xca\xeez\xee\xf8\
-\xb7\x04\xca\xactx\x9d\xdb\x8b\xee\xed\x84\xc8\xd8\x07\xd1\
-\xe98\xe6\xae\xb1\xf7\xa7\xd9a\xa3\xc1\x95\xab\x86\x1d\xc6\
-\xdf\xfcm\x9a\xc4\xff\xc5\xde\xe0\xc8']\x91\x14\xe8\x9e\
-\xb1ro\xb9d\xe4sD4w\xc2?\xa2\xd3\x95\x17\
-\x88\x1d\x9d@|\xa7f\xf0\xfcU\x91\x8b,\xd7\x07\xa2\
-?\xa1G\x03\xdeiy\xbc\x1b;;\xfae9\x814\
-!\xc3D\x22\x9f\xfc=e\xab\xa9\xccGw_8\x0a\
-L\xa6e\xd9q\xb2\x98\x00\x0a\x09\xb9\xc8\xa5|\xf3\xbb\
-N\x99]\xf2B\x8a\xd3\x1d6|\x0c\x11\x11\xf0F\xcf\
-\x1e\xa7\xbf\x85\xa2\xd30\x80\xb5\x22\xc1\x7fZg\xd9\x7f\
-49\xe0\xc2]=dR\x0f/\xb2\x05Z\x96\x10\x8c\
-T{\xaa\xa1\xe9\x1f\xd3\xd8>\xb1W@\xd6,\x87\xd9\
-\xf5R\x01\xeb\xb39@a\xf4\xe4\x10)\xcc\xeb26\
-\xf7V\x1a\xdfP\x00-;\xd2s\xdd\xbe\x82#7\x0e\
-Jk*#-\x97\xb4\xa4\x10I\xb7\xc5\x5c\xe9\xde\xf5\
-m\xa6Be.\x0d\xac6\xcaEu6\xd2\x19\x93\xa4\
-)L\x9f\x94\x81\xb1\xdb7YQx\xee\x01\x81\xd1\x9c\
-\xd4X\xce\xb5/~\x1cu\xddWBn\x1fo\xea\xf6\
-R\x1f\x1a\xe6z\xcc\x89O\xa4\x0b\xfb\x97+d\xaaE\
-f\xd2\xe0\x08\x10\x02+\xd5\xfb\xaeF8\xa4\x91\xa2\xd2\
-\xf9\xbb\xc8?\xd2\xfex\x10\x07\xf6Ws\xf2\x8f\xf5f\
-\xe7\xf9\xf9\xf6\x1f{\xb4\xde\xddo\x80\x07\xe3q,\x92\
-q4sv\x93\xab1*d\xd4\xed\xb9\x96\x9d\xa8\xbf\
-\x13$\xd3\xe6s\xdb?$\xd1\xb5NnG\x17f%\
-w\xa7v\x99ji\x8fyKJz\xc5\xb7J\xfc+\
-,\x5c\xa8\x1f\xa7QL\xe1$\xcd\x1c\x1c1{\xf5\x90\
-\x7f\x8e(*\xf0B\xe9b\xbc\xdaoB\x22@\x1f\xcc\
-\x0b\xdd\x9e\xf7GB\xfb\xc4\xe9\xbc\xa9\x0a\xef6M\x0e\
-\x98\x80t{\xf9\x912x\xd5\xabb\x00z\x86\x81\xc3\
-!\xa9\xb3\xaa\x0fQ\xc8\xf7Xb\xd2\xc7%\xb4\x82\xa7\
-\xe2\x84\x04\x05,m\xe6*\xe37{\x04\xae\x00\xee?\
-\xb2\x80\xe3i\xf26}P8\x8d\x97\x947\x0bz\xcf\
-N\xec\xf7XV\x990B\xe6R\x1dn\xff2\xf3>\
-#\xf0\xe9\x89\xb1\xec;\xf4\x8b\xda\xd4\xc7\x931\xca\xf3\
-\xd3\x9a\xfd\xcd\xe53\x00p\x98\x93,\x1a\xaa\xfa\x87\xd6\
-\xff\x8a7\x05\xa0o\x02\xeahuzN*cG\x18\
-\x04\xa1\x0fL*\xa0\x85\xcf\xb7>\x95\xba>\xa5\x95\x9f\
-u!\xda\xb3(GQ\xae\xc0>1d\xc3s \xc8\
-\xab\xf1w\xc9\xce\xec\x83\xe1\x1e\x16\xfc7\x0f`\xdf\x98\
-\x8f{\xd5\x8dK3\xde\x92:\x8f\xb1\xedA\xa5\xe7\x18\
-\x15.Nv\x93f\xeeU\xa0\x0b\x7f\x8e\xca\xbd\x94$\
-~\xca\xf2\xda\x99ND\xfb\x22\x01\xaf\xa3E\x8e-Z\
--\xfa\x1c\xeec\xc7\x06\xfe\x06\x9bh\xe7\xd7\x83\xd6\x0d\
-\xc01K\x22\xec\x02\x0a\x1e\xc0\xcf\x9f\xbc\xceb>\x1d\
-9\x99A\xbf$\x0c\x07r^E\xddo\x09\x179\xb8\
-\xc1g\x8aa\xc6=\xbb\xe3\x1a%?\xcawoZ\x1c\
-\xdf\x8e\x9f\xff\x94\xd7\xa7\xe9\xc4+\xb0d\x1b\x0aJ\xab\
-q\xc5\x8b\x141\x07:\xb2\x81\xd24;\xd65LK\
-L\x02\x1b\x9b\xbc\xe5\x0b\xfbE\x81e\x13OE\xeca\
-\xbd\xae\xf2\x84kG\x82\x05\x11\x16K\xc2+\xa8\x8f'\
-\x8ae\xbe\xea\x86{\xf3Mi|k\xaf\xe7\xddh\xd4\
-\x1cid<B\x10\x7fM\xd2\xbb\x1b\x8e\x04KCf\
-\xdcHIR\x12\xc9\x95\xf4\xca$k\x13\x06\x0a=2\
-\xb6Q\x00\xfb\x07M}\xf6\x17\xd2\x09\xd2\xcf\x81\xc5j\
-6b\xd1\x9c1\xb7\xa8\xb5\x5c\x84\x7f\x06\xfc\xee\x7f\x22\
-\xbaH\x0f\x92\xf0\x9b\xf5\xcf\x1bl\x958\x88\xe0#`\
-\x1a\xaah\xf7\x00\xd7&\x9ap\xc2\xa7\xc5\xbff\xaa\xd4\
-\x8b\xaet\xda3\xe51\xfbM\xe7w\x97\x87\xe9\xd8z\
-\xcbL>\x99\xd4\x83\x97Ma\xb0o\x00\xfb=R%\
-\x7f\xe8\xe6\xcd\xaa\x08W6\xae(<\xce\xbc\xc25T\
-k\x9c\xe6\xd6\x0ec\xb6Hs\x16(}\x0b\xe9\xbe\x9a\
-\xa2_\xd7?%\xa9\xd1\x80\xa65wZ-(\xad\xca\
-\x8ed\x8ej\xa9\xdd\xe7\x0ca\x19rCs\x97\x97\xee\
-?\xad\xe1\xf5\x18\xe5\xc3\xc0\x06?\x8a\x0bK\x14\x883\
-\x98x\x9b\x9c\xd6\xec\xcf\xa4mP\x9bIF\xfd\xdc\xea\
-\xd9\xcd\x86\xa3\x97\xbe\xfcZ\xe3\xed\xa5;\xd9\xee\xfa\xef\
-\x85\xa0\x03\x179\xc8\x5c30\x96\x9e`\xe5Zd\xff\
-?9\x5c@\xef>O\xab\x7f0P\xd9\xb9\xb0d \
-\xe98\x22\xb4\xe4\x19\xa4\x0d1\xae|\x8bvt\xe7\xc9\
-eBk\xf3\xd5)Mf\x0b'\xa2p\xc3`\x92X\
-v\x1f\xdce{\x81\x8b\xa6C/Z\x87[\xdc\x02\x8f\
-p/\x9b\xaa\x07\xf4\x04!K\xd9\xed\xae\x00\x00\x00A\
-NMFT\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\
-\x9f\x00\x00\x1e\x00\x00\x03ALPH\xa9\x01\x00\x00\x01\
-\x0f0\xff\x11\x11\x02n$Iu\xa8\xa3d`*\x04\
-\xd2x\x1e\xa1\x89\xd0\x08E!`bP\x8c\x01\xdc]\
-\xbd\xbf\x19\xd1\xff\x09\x90c\x83(\xd6\x8a\xc7\x00.K\
-\xc1\xa3\xb9L\x8f\x82\xc7\xeb\xd2]\xa6Ga\x1bt\xd5\
-\xa5\xb9t\x97\xe9\x82Guy]\xdaA\xd4\xdde\xb8\
-\xcc%\x89\x915\x18\xca\x92\xc5X\x97hy\x97`i\
-@\x16k\x07n\xd3\x00\xa2i\x02\xc1\xe3\x113\x90M\
-\x05\xb8M\x15\x88.\x97\xe9\x05\x82\xa9\x01\xe2\xf1\xd8:\
-d\xdb\x80\xe4r\xdb&D\x97\xcb\x06\x04\x171\x17\xaf\
-\xc7V!\x7f\x9ad{\xe1\xfe\x1c\x0d\xe2\xa7\xb9l\xdd\
-+|\x9d\x01\xf2\x95\x1e\x87\xf9\x89\xf2\x17\xe2\x13\xa5\xff\
-\xb0\x0f\x97\x9e]\xc8.@\xb6\x0c\x98\x1e\xcfgz,\
-\xd3k|\x96<\xc0\xc2g)\x90;\x04Sr\xbbt\
-\x15R\xf3\xb8\x1bD\xdd\xeb\xf6\xc2\xadk\x10}*$\
-]w\x19pU\xc8\xb6\x02\x8fnB(\x80\x0e\x08\xe2\
-!K\xd0\x94\xcd\x84KS\xe1\xd9D\xcd\xbb\x19pk\
-\x1ad\x91n\xe8\xa7\xa4\x19\x90D\x1ad\xcd\x84{\xf3\
-h\xd8\xbc\x80\xa2\x00Q\xa4\x02\xd7\xa9j\xe2\xe9\x05.\
-\x91\x02\xdc\xa7\x06\x04\x11\x01\xd2i\x00\x22\x22\x13\x9e\xd3\
-\xd4p(\xc0\xb3\x0c\xe0\xdaU /\x1d\xb8w\x0dH\
-K\x03\xf2n\x00\xf7\xf2\x02\xec\x00\xe2R\x97ky\x97\
-k)KZ\xc6\x12\x16Y\x08\x22\x85U\xb6sI\x22\
-]5\x162\xdb\xbc\xeb\x9bc\xda5\xdd\xbd{uq\
-Wt\xd7Ntr\x9c\x9a\xe7\xd45\xe9\xd44\xf7\xa9\
-j\xe2I4A1O\x8f(\xfb)i\xdeS\xd4\x94\
-S\xd0\xc8\xd8=\xa2~w\xb7\xae\xec\x82N\xfa\x92\xc5\
-X\x96\xcb\x22\x0d\x92\x1c\x01\x00VP8 \x8a\x06\x00\
-\x00\xb0'\x00\x9d\x01*\xa0\x00\xa0\x00>\x91>\x96G\
-\xa5\xa3\xa2!1\x99\x08\x88\xb0\x12\x09gn\xe0\xc0\x03\
-\xf8\x00\xd16\xe0\xf2\x91\xff\x94\xfeu\xfa\x81\xdfg\xf7\
-\xce\x8co\x1dJB\x96\xbcH\xef\x07k\xae\xfd\xfd\x88\
- \x03\xeb\x1f\x12\xbce\x7f\x5c\xf0E\xfb\x0f\xfa\xff`\
-\x0f\xe3^\x8b_\xc9\xff\xc8\xfdt\xf4w\xf9?\xf8\x9f\
-\xfc\xde\xe1\x1f\xca\x7f\xb1z<\xfa\xf1\xfdn\xf6\x0e\xfd\
-Z\xff\xd4r\xa1E\xbdP\xeb\xf5,7\xae\x22\xb0\xba\
-\x13e4\xc8\xfa\xff\x17XtkL\xa5F\xdc@x\
-\xcf^\xda}C7\xb89\xdc\x80\x0e\x9bR\xf5\xf2\xd9\
-a\xe7\x8d\x82F`\xf1o\xe0WrD\x10\xa2\x92r\
-\x90\xa1}\xd9\x11\xa1\xc5%\x14\x93\xd6\xc6\x17iJ\xe4\
-\xb9\x03}\xb3(\x8chq#P\x85\xc5\xfaw\xe96\
-\xd2E\xff\x82u\xae@\xfbb\xd2\xd0\xdf\xb5\x19\xad\x99\
-=v\x04\xd9\x8f\xd43\x07\xf4[\x96pc\xad\x86U\
-u\x05\xe7\xe3'\xc7\x85;\xc8\xc98\xf7\xdaV`\xd2\
-\xcb \xb5\xf4\xbdb\xfe{\x8e\xe4\x87\xae\xb5\x9b\xb4\x8b\
-\x97v\xeb\x1a\xfak\xda\x9c\xc9F\xd3?\x0d\x1d\x9c;\
-\x9d\xd8\xec5\x19\x9f\xfer\xf1\x9b\x09\x19\x91\xf4\xdc3\
-\xe1\x12\x01\x1a2\xbcxO\x8dkY\xa2\xfd\x1b~\x80\
-w\xdf?f\x85\xd0\x00\x00\xfc\xbf\xea\xa1R\xee\x145\
-R\xcc\x99\xdd\xb3\xees\x10#4\xb0\xeb/\xa3\xff\xa7\
-\x14Y\x01\x8e\xffn\xf8\x12s\xdf\xf8lb\xff(\xd3\
-Z<\xd3\xc5\xc1\x1c+ld\xcf+d=EE/\
-\x96;\xeaIM\x15\xc1\xb3\xc2\xdc\xa0|f\xf6yz\
-@8\xe2[\x95\xad\x1b\xe0\x0a\xbb\x94hc\x0d\xc1\x0b\
-6\x04\xe4\x94U\x068\x07y\x98\xbe\xd0\xda<\x0dP\
-U\x87o\xc8\xaf\x8d-\xd4\xfd\xaf\xfb|r\x1d\x13r\
-\xef\x8f/\x83ue\xb3V\x86\xd1\xf9\xe6\xfd(\xff\xfb\
-\xbeye\xf3\x08!\xcb\xa0\x0a\x99a\x10\xbbG#{\
-b3\xe1Q\xe7s\xfb\xdd3\xeeu&\xe5\xeb\xac\x8a\
-\xda\x5c\xd9\xee\xfc\x8a\xf2\x10/\xe9\x13\x10Hh\xa1\xf4\
-F\x0d\x12_\xa84}\x14\xd2c\x0d6\xa2\xaes\xd4\
-q*\x9e\xfb9\x0a.\x87A\xc9\x9b\x9a!\xde\xb48\
-J8\xdc\xdd\x00\x9e?y\xf5\x0eA\xf7 _\x9b\xfe\
-\x19\xbd/\x91\x9e\xeeq(b\x013\xd2.\xf9\xb8e\
-f\xf1#p\x07O\x9aS`J\xc8\xfe\x1b\xa5\x0c \
-\xecZ\xc4\xe3\xbe\xff@\x98\xb5i\xe7\xcc\xa0\x06C\xc3\
-\xd8\x80\xe2\x1d1\xc4F\xc0/\x80\x10\xde\x1d\xf9\xaf\x88\
-*\xac\x96\xcc!\xec]<x\xa4>\xf1\x09Z\xe5u\
-\x11\xd5)\x03E;E\xc3\xfc\x17\x93\xdb\xbc\xf6A\x82\
-#\xdc\x0c\x1c\x8d!&\xfe\xd7\xe0r\x0b\xb2\xc5\x01\x19\
-\xb1\xe9\xef}'e\x80F$\x1d\xd8\x0e\xbe\xf7\x8a\xc4\
-k\xdd\x8a\xc0\x12\x8a\x22\xe9\xcb\x80e\xd4?2[\xf3\
-W\xba\xb3\xaa&\xd2\xcaL\xbc\xb9\x09\xd6\xb8GJ\xe3\
-\x06_\x1aD\x0b\xfb\x9d\xdf\xaa\x14\xd4\xbd\x93\x82\x02v\
-\xa1\xc3\x1c\x9b\xd1\x0e\x06\x13\xbckX0\xfb\xd7\x8c\x89\
-\xfb\xa4N}\xa6#=\x83\xc0\x01f\x84\x88\xd9W\x87\
-\xe0\xc7S8\x93\x89\x0b\x143\xc5\xea\xe6\xd0\xffb\x92\
-\xe2\x1cJ\x8bG\xa4^uV\x88\x11ij\xe1e2\
-\xba\xa4\x87\x03\x81t\xa6\xe5\x1e\x18]\xde\x0a\xec\x81\xab\
-\xe3\xaa\x07\xea\x8e\xae\x1e\x88\x1b\x8a\xc3s\x00\xb6\xb8l\
-\xa4/F@f;\xaf\x12\x87\xb7\x03{`x\x14P\
-\xff,2(t\xbf\xb5\xe7\xb8\xcf8\x11\xd4\x86<\xe9\
-\xfaE\x1fU\xd7\x0a/\x10\xcd\xa0Oe\xe2\xf4\x84\x8c\
-\xb9\xcc\x9d\xd3[\xc5\x08\xd2\x16\xaeQB\x22\xd0y\xaf\
-\xe7\x98\xa0\xe9S\xfbe\xb7d8\x80\xd1L\x8aS\x9a\
-\x84_S\xcc\x03?\xb9\x94f\xf5\xe3\x9e\xc6\xa5\xd0]\
-l\x13\xae\x01\x16z\x15\x98\xa2\xdfx\xa4\xe2g]\xcb\
-\xb1\xf5\x8c\xb6\xd7\xe7 \x9f\xd8,/\xca\x16\xbd\xf6\xbc\
-R\xe8\xd8\xc6\x8a\x93\xe6\x1e\x1bE\x0f{\xad\xc9n\xf9\
-\x9a\x83<\x00\x82\xb2U\x0f\x0d\xb3~x\x1f\x91\x15\x82\
-\xe0\xdc/\xea\xc2\xd9&zx \x93\xddZ$\x08\xec\
-/K\xb2\xf0\xcfi\x00\x1c}\xea\x12\x82\xbd\xad\xe4\x8b\
-s\x1d\x82\x81se\x16\x97&\x922\x16\x97\xd6\xa0\x8c\
-\xe6\xa9\x9c=\xbd\xb4\xb8- \x85\xda\xc3th\x0dO\
-\x0as\x97=\x81\x96fo\xfc*g\xf6\xb0\xaaTQ\
-^\xfc%\x5c<\x8a\x12\xf2\xd8'\x03\xdc\x18\x8b\x1f\xbb\
-\xc7\x97\xc4;\x88}\x9f#_q\xf0!\xaa\xed:\x15\
-\xcfs\xe1\x89\xc6+\xa7\xd4\xf6\x0e\xef<\x01p\xc5\x22\
-\xdf\xdc\xea\xc8\x1bt\xa1L\x9aD\xa6Zcdxe\
-`]S+z\x00\x1b\xb1\xe5\xcbk\x0f\xd4\xa7\xfb\x1b\
-\x9a\xee\xf8\xd0\xe6\x1f\x02\x16\xf1T=\xa9\xf3<\x5cO\
-K\x84\xf5\x1a\x97\xc2w`\x99:4\x04\xf1g,\x9a\
-t\xb2n8\x0e\xd6j\xf1\xaf\xdf\xf7ObUx*\
-PX`x3Qr\x1e\xfd\xc9\xa8r7\xb8!\xb0\
-\xfc\x804\x15\x7f\x8f\x8d\xee\xe5\xaeK,+*\xf5\x88\
-\xc8\xce\xf6\xb5\xf3\xa3\xde\x95\x1e\xeb\xad\xf8\x09m\xd8>\
-Y\xa3\xe6\xf2G\xcb\x11\xd0\xea\xb6\x01r\xf5r\xa5\xfc\
-\xbd\xd6=/\xfe\xd7\xba\xa9 v\x87z\x8d\xb9r\xd6\
-<\xb8$\x9a'^\xc3\xac\x9f%uM\xc9&\xc3\xed\
-\xc7F\x08UA\x01\x22\x05\xa8)1\xe4\xa6\xdb\x22\x0b\
-\xd0p\x05\xb8n\xd5j\xfcH\xbe9^\xb7\x09\x1f\xe4\
-\x1c|\xe6._\x88\xa0\xa2\xb1{5\x0e\xe48T\xad\
-\xfe\xba\xe9\xd6P#\x1b\xf5\xc9Z1N\xb0=\xff\xc9\
-zsJ\x1f\xa4\x10\xcfY\x7f\xc3\x0bj\x96\x1b7\x10\
-\x0fy\x9d\x09\xdb-\xee\xf6jj\x07\x1aNt\xdc'\
-\x8dK\xcc\x1b\xdaL=\x19\xe5\xe1\x1cy\xf0\xef\x07\xf5\
-\xa9\x10\xe3\xf9\xd1\xa8\xa8\x8a\xb3\x07\x89\x83\x1e\xe9]\xda\
-\x15\xee\xe4}\xda\xd7\x86L\xe2\x01:r\xdfo!C\
-\x16<.\xc07*\x170\x93E\xd3\x082\x81\x14\xdc\
-\xc0\xdbW:\x18\xf5\xf9\x02^\xad\x8e\x00\xdc\xf9x\x0f\
-\x06\xd6G\xf7\xb9j\xea\xcc\x08\xbd\xac\x0f\xdbI\xd5\xc3\
-xA9\x82\xb0\xe3Y\xc6L\x9f\xdf<\x1a\xc7)\xbd\
-p\xee\x16\x8cM\x14\xa1\x17\x97XX\xff\xaf\x90\x9eP\
-\xd9\xbe\xb9\xa2\xe5\xa1\x86\xbc\xfb\x81h\xc2\x07\xfe\xab\xa3\
-\xfe\xfd\x90\x18\x94\x89\xea^\x07\xcfG\x860k[\xae\
-X1\x22\xcb\xc3\xe9\x1c\xed\x98\xc0a\xc2\xa3\x13\xd6\xa9\
-\xf5\xdd\x83\xd0lh|\x92\xe1$\xdc\xdc\x1d\xf2\x22\x84\
-t\xac\xd6?G\x8d*\xcb\xd6l\x99\xdbL[\xcdB\
-\x92\xb9N\x96\x9c\xa7\x823\xef\xb5N\xd8U\xbbO\xd5\
-z\xa1\xc4\x12\x1e\xeaywZ\x0b{>\xa8\xa4\x8d\x99\
-\x15\xb2t\xfe\xe1\xa1sp\xff\xbe\xdb*\xedn\xa3\xa4\
-\xf8y\x82\x8ej\x1b\xd9\x84l\x9cBa\xf2\x8c&\xb2\
-r\xb7\xe9Qn\xde\x1a\x14P\x00\x00ANMF\x82\
-\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\x9d\x00\x00\x9f\x00\x00\x1e\
-\x00\x00\x01ALPH\xa3\x01\x00\x00\x01\x0f0\xff\x11\
-\x11Bn$I\x81-\x0d\x81\x80\x88\x09xr\x98\xb6\
-\x98\xb6\xa6\xac\x09\x88\x08\x04%\x003\x13\xefK\xa7E\
-\xf4\x7f\x02\xe4: \x8b\xf5\x05\x08\x96\xb9eC\xc3\xa3\
-\xbbL\x8f\x86\xc7wJ\xba\xe1\xb2<\x1a\x1e\xef%\xaa\
-\xba\xcbpY.\x5c\x83\xa6\xb9|.\xdde\xdcD;\
-]\xd6VE\x86\x8a=\x88\xbemU\x8c\xef\x96,\xdf\
-\x16,\x1d\xa8b\x1d@6M \x99\x16\x10L\xc0#\
-\x1e\xd5\xd4\x80lz\x81\xe4\x12M\x1f\x10L\x1d\x10\x8f\
-\xc76\xa0\xda&\x14\x97l[\x90\x5c\xa2\x0d\x08.b\
-n^\x8f\xed\x85\xfa3\xc5\xf6ye[\x87\xf43\xd1\
-6~)\xd8\xa6\x97\xfc\xa5\xc7a\xfdP\xfdC\xfcP\
-\xf9/R\x1d\xd6\x1f{,\xff\x5cV\x90\xe9P< \
-L\xb0\x15\x97: \xe8\x9aWq\x8b\xba\x17J\xf7\xc8\
-\x1d\x92\xees\xfb \xeb:$\x9f\x17\x8an\x9c\xaan\
-B\xf4i\xf0\xe8\x16\x84\x06\xe8\x80 \x1e\xb2\x05M;\
-,\x88\x9a\x17\x9eC\xd2|\x87i\xe8P\x0fY3\x0e\
-\x03\x8afB\x11\xe9P5\xeb\xf6h\x80,\xf2\x01\x8a\
-\x06$\x91\x17\x88\xb7\x17\x88\xa7t\xfbN\x0d\xc8\xb7\x0e\
-\x04\x11\x01\xcam\x02\x22\x22\x0b\x9e\xdb\xd2pi\xc0\xb3\
-M \x9e^\xa0n\x03\xc8\xa7\x0e\x94\xad\x03\xf54\x81\
-\xbc}\x00'\x80\xb4\xbd[\xdc>E\xdb\xca6\xb7\xb0\
-\xc9\x86\x884v9\xae\xad\x88\x8c\xed9\xcd\xed^O\
-CWN]\x97O\x9f.\x9d\x9a.\x9eD'\xd7\xa5\
-ynCSo]\x93o\xaf&\xdeD\x13\x14\xeb\xf6\
-\x88r\xdc\x8a\xe6\xbb%\x8d\xdc\x82j\x9e\x1eQ\xf7S\
-\xd6\xc9)\x18\xc6V\xc5\xd8\xb6h\x91\x0eE\xae\x00V\
-P8 \xbe\x06\x00\x00T%\x00\x9d\x01*\x9e\x00\xa0\
-\x00>\x91@\x9aG\x83\x05d\x92\x00\x01 \x96v\xee\
-\x0c\x00\x07\xc0\x06\x94\x96\x90\xbf\xc0~(x\x05\xfe\x03\
-\x94\xc7\xd9\xdeU\x0d\x22\xc4\xeb%'\x03''\x10\x1c\
-d\x7f^\xf0E\xfb\x17\xa0\xaf\xa2\xcf\xf2\xdf\xf2<\xa2\
-~S\xfe\x1f\xff\x17\xb8/\xf3\x0f\xeb^\x93>\xbe\xbf\
-`=\x84\x7fT\x91'\x18cZ\xda\xff\x82\xe4\xb1c\
-\xc2\x9b\x87\xb1\xb6\x17\x9f9\x9e\x86\x0d\xb2\xb3\x9f8 \
-\x04\xc8\x86C\x19\x9b\x19\x07m}\x92^\xa8jA\xf5\
-\xaa\xfcdc\xac\x94\xa1\x03\xf0\xd1\xcc1P\xe3\x5c\x12\
-t\xd6\x18\xc2\x9e\x0a\xf1\x19D+\x91\xea\xd4z\xf9V\
-\xc5\x04\x10XtCB\x07\xb7E\x1b*+\x94G\xc7\
-\x04\xc3\xc1\x8d\xf0\x0c\x80\xcfl!]a[\xc1q.\
-bt\xb3\xc6\xf3-3BNw\xa9vy%\x82\x1f\
-\xde\xc9$\x17xE\x02\x05b\x8d\xf5\x9aN\xba\xc8\xd1\
-\xa5`AmR\x87L\x82\x03\xff\xb3,\xb8J\xba\xd0\
-\xd4\xb4\xc5\xa1\xc7\x91\xd4\x8eN\xca\xbe \x7f\xa1\x94F\
-\x8ct\xee\xd9\x18\xad\x02\x89\xcaU\xcf\xfa\x1a\x00f\xa4\
-\xc7\xfd\xb9V\x02\xb9\xfdE\xb62\xd2\xec\xb3bk\xfd\
-<5A\x04<\xc6&\x01W\x80\x00\xfe\xc8b\xc6\x1a\
-\xa6\x98\x1c\x12H\xe4\xd0\xfe\x8f\x86\xf6z\xfdz\xe4\xcd\
-K\xe7S\x04mx\xe0\x81\x85\x13\xce\xfc\x97\xb2W\xf6\
-K\xd7W\xc2\xb6\xc3\x85\xe1i\xee\x8d\xadV\x9ec\x0a\
-_D\xa0\xb0l\x9d\xa2\xd4\xe0\x8d-\x97\xbe\xd7\xfa\xe7\
-j\x95S\x98\xd3c\xc2\xda\x05\x97\xba5\x22\x89\x07\x0b\
-h\xe3\xca \x00K\x1a\x1dg;\xc1\xae\x8f\xd2\x0b\xd4\
-9\x11\xf5\xe9\x8c\xce8p~E\x02_\xf9\x12{\xfc\
-@\xdb\x14\x9ew&h\xe0Jp\x87j^v\xa98\
-\xe9\x81>\x19X\xedt\xf2\xf0,\xb8\x0eWb\xff!\
-\xfc\xe3\xd1\xad\xe1Ag\xe6>\xd7\xe3\xdc\xa9\x83\x03`\
-&hq\xd3\x03\x07:\xb4\xbf\xf4\xa9*&\x13]p\
-z\x068M3\x1amm\xf9J+}\x16\xa7\x86Z\
-\x89\x86\xd5\x93=\xe5\xb5a\x8e\x17\xd5\x0d\xef\xf9\xed\x96\
-*!\xab\xd2\x1f\xf8\xb1\xf9f\xdf\xe4\xfbz$w\xbd\
-?\x13\x9d\xfem\xa9\xc06\xb6\xc8\xb2\xa5\xd1@\xc79\
-y\x111\xaa\x5c\xa3\x98s\x09\x18_\x85\x11,\xaa\x97\
-\xed\xdd\x03K\xb0\x85\xe0\xd6.q,CU\x11\x12_\
-\x04,|0.\xb7N>U\x9f.H\xf3]\x10I\
-)P\x90<\x93\xc6=\x03@\xeb\xb4{X_\xdb\xab\
-\xb4\xf2\x16\xcc\xdc\x89c+\x11F\x00K\xeb\x94\x84\xb3\
-\x9eR\x16P\x5c\xce\xaeP.\xce\xcc\xa5\xb3K\xe7a\
-\x9e}\xcf\xc1\x8b\xd9N\x06\x0a\x92\xd8\x22\xed;\x90\x04\
-B\x9a\x8aJ\x96\xba\xd4\xfd6_\x1a\x9f\xbc^\xff\x0a\
-\xfc\x9c*\xe4iS_\xa5hd\xf8\xa8\xde\xaa\x9a\xf5\
-g\xbc\x7f\xeb\xd0^\xce\xcf\xb5\x0f\xf4N\x91>e\x93\
-\x89\x07\xc4\xfb\xf9\xe9\xfdL\x03\x15O)\xf1\xca\xa0\x0a\
-\xf5y\xa1\x8c\xcb#\xaf\x22\x8e\xdd;\xc7b\xcf\xd6\x95\
-)0\xd9\xad\xdam\xdf\x1c}\xb8\xcb\x17g\x97\x1d\xdf\
-\x17I\xb9\xa7\xcb\xb6\xa5\xad\x9e\x17,\x15\x5cs3\xc2\
-\xca\x0d\x0f\xc2\xb8!\x09&\xf6k3\xeb2\xa9k\xfe\
-\x13\xa7\x0d\xab\xb0\x01Xv \x897j\xa3\x12%\xa0\
-\x80p\xa5\xd8]\xba\xb0\xdf\xe3\x87\x1c\xbc\x00tMX\
-O\xcc\xadh\x8f\x16\x7f\x87\x1f\xf3D\xbe\x8e_\xefl\
-\xe1K\xd6\x09VX\x05\xaem\xad\x95\xa8\xd5&\x96\xd5\
-\x87\xab\x8d\xdd\x0e\xc4\x80:\xc7i\xa5\xc9\xbbB\xb5A\
-\xa0\x22\x0e\xd4}\xdf\xf3G\xcd\xce\xf3\x0cG1\xe1N\
-5Fy\x85b\x00\xe2\xa5\xc9\x8b\x09\xdb\xceh\x7fb\
-r\xfc:A\x1d:\xad\xa8\x84\x89\xf8\xc9\x0c\x0a\x88\x1e\
-\x12\x81^d\x1d\x91(\xf7R\x8b\xa3\xb1\x9c\x8d\x0f\x8e\
-\xa4\x8f \xf0~s\xba\x0f\xebL9]\x0c\xb7\x229\
-6j\xd6\xff\xc4\xa9\xf0\x84\x00R\xda\xe4f\xc2\xe5\xc9\
-\xbc\xb1\xc8\xd7\x85K?\x11\xecC\x8b\xc3P\xc5\x04\xa6\
-\xe7Q(\x98\x17 q$5\xf3G\xdbihJ\xff\
-g\x8f\xa2\xb3\x85_\x06\x9f\xe1\x18\x17a>9\xf7x\
-\x1eZ\x095\xb8n\xe5]\x90\x0b\xa8@\x9a\x17\xc2\xb7\
-\xc8 ZQ\x1d\xc48Md\xd7\xf4V\xfe*_\xfe\
-\xa5\xbaM$l-\xe4\x97B\x1f\x09A\xd2-\xaf\xa0\
-\xab\xc4\x8c\xe1J\x9b\x8c\xce\xb3\xb7\xfd\xe8\xbe\x9e\x5c2\
-t\x1aqC\xd4=\xf6r\xec\x8f\x12\xb5\xf1\x1b\xdb\xd6\
-qG\xd1\xbc\xa5\xe2\xfa\xbb\x95\x96\xb3\xec\xd7|qd\
-\xfd\x8av\x10\xd4\xbc\xa5\xfe\x1f\xfa\x92?S\xa7\xda\x14\
-\xcf\x8e0\xc9x\xbc\x84\x9b\x9b\xb6G\x99\xd0cp\xea\
-xl\xfc\xde\xd3\x0f]\xfc\xe1\x18\xc4.\x83rcQ\
-\x06\xbb\x921\xc9\xa0\x0e\x10\xcd\x14\xa26\x06\x040\xe0\
-O\xc8\xf2\xd50\xcc\xb4\xcad\xe1 \x01\xe9]\xa8Z\
-\xb5\xd9\xf2\xd1T\x05\xd7\xdf\xb7\xf7V\xfeL\xfa\xf0s\
-y\xcd\xaaGo\xc9\x950\xb7\x93\x16\xcf\xec.<\xe8\
-\xb9\xff\x11;h{\xbf\xf3j\x8f\xc0\x043\x08i+\
-t\xa0\x93Q\x0e\xcb\xf9[w\x1b\x010L\x1e\xb5\x17\
-\xd5\xf3Y?<\xff?\xd3\x04\xd3\x88\xab\x97\x9f\x0ai\
-\x87;\xe2I\xf3\xa9\x90\xa3K\xc9aV\xc9\xb7\x99\xed\
-G2\x1d[Q\xc8jd9l\x1d\x86\x98\x08\x14@\
-ZG1\xef\x1d\xb5}+\x0a^e!\xe7\xe1\x85\xa5\
-\xca\x0c\xe8/\xbb\xa6\x0d\xc7\x19\xe0\xafe\x80\x04\x0bk\
-=O\xc8\xb3F:\x1d\x0fh\x18\xc0\xa6\xcd\xe9\x9e\x0c\
-\xbf\xa5\x16T*\xefn+E\xaf\x88#\xd8\x90q\x8f\
-\x0a_\xac\xfd0\x85\x15\xa2G\x12oHp\xbaSw\
-_m&\xe6\x88\xef\x0fg?fh\xa1?k\x8a\xec\
-Qc\x1f\xbf\xf6\xe4i[\x81\xd3)\xcc{\xcb\xfc\x98\
-\xd8\xf7\xa6\xb8\x15\xb9\x1d\x02\xcd\xbc\xf9\xc7\xd6[}\x02\
-P\x93ZQ\x1f\x94p\xd5\x9b\xc8\x5c\xa9\xf4\x15FL\
-\x8d\x0f\xe3\xa3\xd0\xa6d\x9e\x05M\xc3q\xe6\x8bB\xe8\
-\xcb&\xbf\x04\xa5\x00\x1f\xb2F9(e\xa4\xb6\x0e\xd4\
-\x1cy\xfe`\xb5]\x1d\xa4\x80\x96rC\x1f\x13\xdf\xe7\
-\xb9^8\xb2\x8a\x959|\x95\x1b\xe5\xe4\xe9\x9au\xe3\
-\xddQ\xa1\x1b\x9f\xf4\x0f\x81\x80\xb1g}U\x8a.\xee\
-\x0d\xb2\xcby\xa9\x9ea>)\xee\xa5x@\xd71\xb9\
-\xecgH\xb5\xf9'\x7f.RU\x9em\xe9\x9e'\xeb\
-g85\xcb\xdc#Zr\x98&\xfb\x8e\x8a\x83\x19M\
-\xcf\x22?F\xcb\xcf4v\xdf\x81\xd8\xdb42\xae%\
-6:\x18*\x87d1\x99\x06\xfcsj;\xe0%V\
-QH\x04\x05C\xff\xb5y&P\xc5m\x9da\xae\xae\
-\x07\x9b\x13\xb5\x96\x99\xad\xd5e'%\x01\xcc3\xb7+\
-+8\xdb\xd6r\xba3\xfa\xde\xb9\xa7\xfb\xf0\x85ZN\
-\x12\x10\xb3\xbf\xd4\xd3\xfb\xf7\xf7\x99\xe2\xb0\xa6\xc7ia\
-\xe3\xe5M)\x99\x18\xcd\xee\xa4m\x5c\xd9\xd0\xf4\x1c\xad\
-\x22\xee&S\x1b\xdf\x04\xa9\x9c\x13\xf7\x86r\xd5w\xd0\
-N\x8aKP\x099\xcc\xf6Z%\xc5\x12\x1c\x9fR\x17\
-\xc9<\x00\x00\x00ANMF\x8e\x08\x00\x00\x0a\x00\x00\
-\x0a\x00\x00\x9a\x00\x00\x9f\x00\x00\x1e\x00\x00\x01ALP\
-H\xae\x01\x00\x00\x01\x0f0\xff\x11\x11\x82nm\xdb\xa0\
-\xb6\xed\x18\x02\xa1\x12\x94\xe2/\xeb\xcf(\xed\x96\xa2\x04\
-\xa1\xc0\xb0\x02\x9c\xe3\x7f\xde\xe8\xcf\x22\xfa?\x01r\xed\
-\x10\xc5\xfa\x018\xcb\xdc\x92\xa1r4\xf4S\xd0\xcdS\
-VU^\xb4KR\x8d'\xebE\xe5\x1a5\xdf\x93~\
-\x0b\x9a\xf1d=\xe1\xee\x15\xf5IS8E\x7f2\x9e\
-L\x85(\xd7\x96E\x86\x8a\xdd\x89HQ\xd4-\x8b\x88\
-\xfc\xab\xf8\xb6\xb0\xfd\xa3h\x9bX;\x90M\x03\x88\xa6\
-\x09\x04\xd3\x02\x9c\x09(\xf2\x22\x9b*\x90L\x1f\x10\x9e\
-xS\x03\x9c\xa9\x03\xf2\xa2\xd8\x06d\xdb\x84\xf4$\xda\
-\x16\x84'\xde\x06\xb8'b\xae\xaf\x8a\xed\x83\xfc3\xc9\
-\xd6^E[\x87\xf03\xde6~\xc9\xd9\xe6+\xf9K\
-\xe5\xc1\xfa\xa1\xfc\x87x\x94\xfe\xb7\xc9\x0f\xd6\x1f+\x7f\
-h>\xe2G\x06\xb8\xff\xae\xfa'\xe9\xe0u_\x11\xe9\
-6\xfc\x16t\x8d\xf8\xa4H\x83\xa8\xeb\xe0\x9e\x84\x0f\x92\
-n\x9c\xb2n\x82\x7fS\xa1\xe8\x16\xb8\x0a\xe8\x00'/\
-ds\x9azX\xe05\x1f\x94C\xd0\xb4\xc34t\xc8\
-\x22\x03\xa2f\xdc\x92!\x89t\xc8\x9a\x05\xf1P4\x1c\
-\x1a\xe0n\x15\x08\x22\x1f\xe0o\x9f&\xdc\x1a\xe0E*\
-\x10o\x1dp\x22\x02\xe4\xdb\x04DD\x16\x94\xdb\xd2p\
-\xa9@\xd9&\xe0O\x1f\x90\xb7\x01\xc4S\x07\xd2\xd6\x81\
-|\x9a@\xdc\x1a\xc0\x09 l\xdf\xe6\xb7\xb6\xf9\xadn\
-i\x9b\x0a\xd9\x10\x91\xca\xee\x0ekK\x22c+r\x9c\
-\x1be\xb2\xe7\xd38\x5c\xd3\xa9\xeb\xe2\xa9\xe9\xc2\xa9\xea\
-\xfcItr]\x9ar\x1b\x9a|\xeb\x9ax\xfb4\xfe\
-&\x1a\xa7X\xb7\x22\xcaqK\x9av\x0b\x1a\xb99\xd5\
-<\x15Q\xb7S\xd4\xc9\xc9\x19\xc6\x96\xc5X7o\x91\
-\x0eI\xaeVP8 \xc0\x06\x00\x00t&\x00\x9d\x01\
-*\x9b\x00\xa0\x00>\x91>\x96G\x83\x1fi\x88\x80\x01\
- \x96v\xee\x0c\x00?\x806|\xff\xd2\x01\x7f\xf0\x9f\
-\x8a\xbe\x0f\x7f\x80\xe5.?\xcb\x16L\x93Z\xf7\xbeO\
-b\x08\x00\xfc\xd3\xfa\xc7\x11\xbci\xffR\xf0L\xfa\x97\
-\xfc\x0f`\x0f\xe3\x1e\x8a\x1f\xca\xff\xca\xf2}\xf9O\xf8\
-?\xfc?\xe9>\x01\xbf\x96\xff`\xf4f\xf5\xf7\xfb\x1b\
-\xec\x13\xfadm4\xef\xbe\xff~\xdd\xef\x1d\xa2g\x1e\
-\xb2\xd8Bi>\x9c\xd1%\xff\xcce\x0d\x16l>\xd0\
-#\xa4\x11v^\xf2\xf3\x06\x8c~\xb1\xbbe\xe3y\x92\
-*:8E\xb2\x8f\x89\xb1\x04\x14\xb55qo\xfa \
-z\xba.L\x1f{p\xa2\x8d\x0c|\xc4P\x90~\x8a\
-3\x119\xbf\x9b=\x8an\xb7#-ME#\xfd\x0f\
-1\x02\xe4\x1c\xe4\xb55\x13\xc5*\x96*\xd9\x97\x9e\xa1\
-\x03\xedq\xd8t\xce\x96\x0e\xd8\xf4\xa1P\xcb\xe0\x81\x0a\
-}\xc4\x96\xbe\xf2\xaal\x81^\xfd\xed\xd8\xaalu\xc8\
-p%|\xa2\xd5\xce\x9b\x87\x82\xd3\xf9\xc7\x05\xb4\x14\x82\
-\x9a;\x99\x16.]\x8d\xc0\xc7-\x1a\xaa\xac\xa7R3\
-B\xc1\xe5\xb3\xff\xf3\xb9\xb6\xa9\xab4}\x88\x02eu\
-\x22(-\x5c\xb8\xc5\xe2\x93\x07\xb95\x87\xaf\x95\x8bt\
-\x8f\xf4\xadlk\x90\x00\x00\xfc\xc0\x1b\xd9B\xfa8\xb8\
-\x22\xdf\x97\xda\xd2R#\xa4\xf8\x19\xeb\xf0\xd8\x8d\x8cG\
-\xdf\xa9[\x22\xa0#s\xf7\xb6\x17\x81W\xa1d\x92W\
-\x9br\xaf\x8e\x84aP\xa9i\xb9/\xee(\x92M\xa4\
-,\x01\xa3\x11\x0d\xd5?\x1e\xad\x05\xd1\xb6\x0f\xcfp\xec\
-\xd1\xec\xd4\x9fS\x1b\x8d\xc4\x84\xcdF\x1a\x1f\xd2\x01h\
-\x0c:\x0aj'Z\xbc\x1f\xdd\x15\x1b\xb9\x15}\x9ba\
-\x82\xef\xbe)\x02@c\x1d\x0cGYI7\x08\x8b\xd8\
-@bIX\x03y\x13p\x8b\x8d\xbcgY\xec\xdcA\
-]i\xef\xd8\xbb\x18X.(\xe3w\x0a\xf0\xecor\
-\xcc\x02W\x9b;\x1e\xd1\x8d\x84\x86\x0e*\xf9\x9a \x88\
-\x88{\x11@q\xbeK\x08\xa38)\xc0\x01(O\xc5\
-\x9a\x91\xbb\x8a\xe3z\x94\xf3\xec\x87$\x9f\xfb\x16#\x8a\
-T\xf2\x81M\xb9\xf1\xc0\x0cjh\xb2\xc2\x9a\xa8\xc7\x8e\
-=&\x064)\xdb)\x90c\xc5\x01\x8f\xd5XUc\
-;\xf9\xad\xbb\xb1 \xf6?%O\xf862\xeb\xb1?\
-\x8e\xa5\x14\x9b\xd1\xa3KK\xac\xd8jA\x17G\xfd\xfd\
-\x8a\x7f\x9e\x8f\xa7\x87\x15z\xa165\xb5N\xde\xd8\xda\
-p,g\x1f\x9e\x11\x91\xb1O\xc5\x07vyH\xea\x9f\
-\x8d\xe9w\xc1\xd8\xb6\xb5qK\xeeD\x22\x96\xaf\x22T\
-\x0f\x1e\xa1\xcc\x01/\x97\xa7*\x11 Nm/@\x8b\
-\xd7\x82|4\x05\xd4X\xb6\x13\x7f&(-\x8bd\xdf\
-L|\x1e\xda\xb1\xc9n\xfd\xe9\x9d<\xffJS\xff\x9f\
-S\x8ef\xb7\xf1n\xb3\x0f\x9e%F\x863O\xee\xcc\
-3\xa5\xf2\x9e\x92\x82\xe2\xc5\xf0\xde\x88\x9a\xb0\xffz\xd2\
-\xa2\xedLvP\x091\xeb\xb4Z\xc7]\xf27f\xdc\
-s\xa9\x0b\x14.Kh@\xccx\x00\xdcv\xbdr\xce\
-\x8a\xa13\x9e\xc1\xbb\xcb\xf4\xa1S\xdb\x0f\xf1]t\xa5\
-\x17\x11f\xd9W\xb3\xc2\xf1\xed\xed\x08\xb9\x88ef\xcd\
-z\xf4\xb1\xeb\xde\x95\xd3!\x95\x9e\x5ci7\xf1\x19g\
-\xfeG\x06\xd0\xffD\xa3\xc9\x0c)\xe4I\x8e\x88z\xc2\
-\xf6\xc2\x83\x1a\xd7>\x8bp\xb0pj\xb9\xca^.\x90\
-\xc8\xcdP\xfc\x11\x87\xe6\xce\xb8GF\xcey\x9b\xb0K\
-\xe1\x9co>\xbd\xffMT!k\x14m\xaf\xc1\x07r\
-\xdb/'\xe6\x0f\xe3K\x7f\x8f\xe1\xe4\x00z8\xdf\xb8\
-\xe8\x05\x83J\xf8\xc4\x84\xf6UO\x09\x7fFL9\x22\
-\x14\xff\x13\x82\xd4\xeb\x1c\xdd\xd1\xbb\xa2@X\xb4\x9b\x07\
-J\xb2qF}\x1d\xc8m\x97\xfc\x06\x07\x80\x9e`\x0b\
-\xb0:\xb0\x9c\x0a\xfcV\xf8#\xee\xb1\xdb\xa9s\xfe\xdb\
-\xe3I\x84\x9fy\xfb]Zb\xd05\xcc\x183*\xca\
-\x11\x7f\x00?\xa23d\xa2\xb7\xc0\x1d\xfde>!\xda\
-\x0a%$\xfa%\xf1\xf5\xc3\xfb7\x86v\xad\xf8\xa6\xda\
-x\xd8\x9a;\xbe\xe2YZ\x15\xdb\x01`\x18\x0b\x8a_\
-eO\xddY\x7f\x93<\xf7!\xf1\xa9\xeb\xe9Q\x5cW\
-\xe8%\x90i\xd80'\xf7\xef5]\xaa\x1f\xd4\xc4\xe0\
-6\xce\x80\xc1\xe29\xbc;>\x85\xb4\xb0\xf0\xe4;Y\
-\x19\xec9\xe4\xb6b#vR\xaeh?W\xe8\x97\x1e\
-\xe5\x84\x8c4\xf3-\x81\xcaHm\xbe+kC!\xe6\
-\xa9\x97\x0e\x1e\xf2\x04\xe95/v\xdc\xf3V\xec\x9e\xb1\
-\xea\xe8\xa6\x84@O\x9e\x00!3L#(\xb1AV\
-\xf4\xd7i\x0eR\xc8\xee\xfb\x82\xf2\xb0L\xc1\x86\xafM\
-\x02\x06\xd8A\xc6\xa4\xa5u\xcc[\x93w\x83\xa5.\xb7\
-\xf0\xeb\xc6e[\x0flW\xf2\xcaI\x07\xa3i\x81i\
-wWr\xbc\x8b.\xd59\x0e*\x0aWO2\xd0\xe6\
-9\xba\x9f\x22\x0a\xebwG\xb9\x94N%r\xaac\x8b\
-\xa5\xf9\xa2\xe5\xe7\x93\xb7\xf8\xb0\xaa\x91\xab7\xe3$\xce\
-\xd4\x82\x1aB\xa1:\x82oZ\xa6\xc2\x90{\x91d\x8d\
-\xd7E\xbd\x99\xaa-\x0a\xe3\x98;\x06`GJ{&\
-E\xa1#d\xd2\xf0H\x1a\xe4\xaf\x8b\x8cZ\x8d\x910\
-\x1c\xb9\xc1\xe3\x84\xfcU\xb1#n\xf0d\x86 \xab=\
-6*\x96x\x98\x02\xb3(\xe5c\x0d\x88\xb0k;g\
-\x1c|a\xd75*\xb18[N\xabR+\xb4\x17t\
-\x8b{\x99\xe3 \x10g\x03\x9f\xa9\xfc\xae\x98\xf9v\x92\
-\xd57\x88Xa\xf22sY(\xd5\xe3\xf9\x07Q\x91\
-\xd2\xdd\x96\xd4a\xa97\xdb.[\x0b\xaa\x87\x15P\xe7\
-\xbe\xb5\x849\xc4\xa8\xa1\xdd\xcf\xf5\x18\x0f\x8a\xed\xbd\x0d\
-\x85fp/Y\xb1\xad\x1c<\x91D\xe2\x17\xba\xf0\xd0\
-\x1d\x1b\xcbq\xce\x01\xb8\xba4\x92\x0az\xa9a\xb5\xce\
-\xb5\x13\xc7\x90\x5c#\x85YVh\x18\x8f*\xb4\x96<\
-5\x0b\x5c\xbd\xca\xa8:\xbc\xe8\xe4l\xe2\xa2_\xcb\xde\
-gO\x84.\xe8t\x03z\xf3\x9c\xbb\x0c\xfc\xb1\x11`\
-c\xfa.\xde\xa0\xde\xe4\x93\xdf\xc49\x0e\xa8\xc7F\x8a\
-\xe43\x85\xe7\xea.=\x0b\xe0\xac\xa6P\xe5E\xddr\
-\x1fP\xcae\xcc\xf4\xea\x03\xb1M\xe5\x5c\xce\xdf\xe8\xe3\
-\x82\xbeb\xa15:\xe0/\x86\xb1sM\xbc)\xed\x00\
-0\xf6\x12\xf1\xe1\xc1>\xfc\xdfe\x03\xa4\xd3\xed+@\
-\xb0\xc6\xf6\xf2\xb9[!\xf6\xffGZ\xf7\x97\x8b\x1b\x8c\
-\xff\xc6\x9b7\xa7Y\x0d\xce\xe5R\x0c1E\x9e5\x02\
-D\x058f\xe0>E\x9dw\xed7\xc7\x1c\xe0\xad\xe0\
-\xa4\x9c\x9a&U\x16O\x0d#k;~\x14\x8f\x8d'\
-\x86\xa4\x9a\x09f\xd2e\x13\xf0\xfc3$z\x1dB\xcd\
-\xcd\xa2\x9d\x15\x91%\xba\xf3\xaa\x1bfD\xd0-\xe0`\
-\x89\xc2;\xdf\xd8\x90:\xea\x8a\xb9\xc5\x09\xc3\xac\x87\x09\
-\x146\xbb\xcc\xcc\xcd\x09W\xa4J\xb1 \xe3yg\x12\
-;3'w\xd1\x01\xdcb\x02H\xd3\xba\x85\x87\x96'\
-\x06xI\xb7\xfd\x105M\x0b\xb7~FK\x1e\xff\xf9\
-\x99\xb6x\xd3v'\x0el\xcc\x85\x13Lv\xab\xcf\xa4\
-\x00O\xd1\x1c\xe2\x1c\x14\xd0\x5c\x85\xcd\xe3W\xd5\x93\xff\
-\x84\x8b\xb9\xbe\xe7\x7f\xf9\xce\x00\x00\x00ANMF\xac\
-\x08\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\xc7\x00\x00\x1e\
-\x00\x00\x02ALPH\xbb\x01\x00\x00\x01\x0f0\xff\x11\
-\x11Bnk[u\x05]D@\xe8\x12(\x85\xd2\xa0\
-4JA\x9a\x02\xc6!\x81\xe5\x1d\x18\xee\xbd\xef3\xdf\
-(\xa2\xff\x13 \xff\xfa\xa1:]@v\xe9<\x83\xc7\
-\x5cd\x0f\x96\xd5a\xac\x88\xb6\xb99l\xf7\xa6\x9a\x1a\
-\xfb`\x19\x8ad\x99~\x97\x22Zpk\x9a`\x18~\
-\xa7F\x8c\x97\xdf\xad\xa8\x16\xdc\x9a\xa6\x18\xfa\xea'\x90\
-\x0dc\x11\xa5\xd9\xceG\x16\x91\xc9a\x98\x8f(\x22\xcd\
-t\x01U\x9eW2\xdc@^\x9c\x16\x80\xb8\xe8Q\xd7\
-\x1e\xb26t\xa0n\x8c\x03\xc8~\xc9\xe7\x04\xa2\xcf\x04\
-\xc4\xf7\x82\xeaW\x9cn\xc8N\xc0\xe1\x97|\x1a\x10}\
-:\x10\xfc\xc4w@\xf5+N'\xe4w\x9bp\xf8%\
-\xa7\x0b\xe2\x07\x04\xa7\xfb%\xe2\x0c\xf5\x03\x8aS{I\
-\xfe\x1a\x1d\x8eo\x92\x9c\xc6g\xc4\xafq\xbe$\xfc'\
-\x11\x9d\xc6\x97I\xef\xd6?\xe3\xf8\x80\xec\xd4>\xa38\
-\xc9K\xea\xdb\xdd\xf0.iwAP\xb5C\x15U\xbd\
-\xf8\xb1\x9b\x90T\x83\xa89T'\xc7\xe6\xb4eMV\
-M\xeaf@Q]\x10\x14UuCZu@\x05\xc4\
-U34KPt \xac\x04\x88\x06\xd1$\xc5\xa9\xba\
-\xe1PL\xa8\xbb\x0b\x8a\xe2\xb2T\xc5\x0de7\x01\x05\
-\x90w'\x106\x1d8v\x03H\x9ba\xcb\x9b\x09\xa4\
-]\x07\xca\xe6\x02\xe2\xae\x01l\x00\xc2N\x1eq\xd1\x1f\
-\xa2\xbc\x81cq\x02Us\x01eq\x03E3\x01\x82\
-\x88t\x80\xac9\x1fYD\xa6i<\x08\xd2x\x1e\x9a\
-\xbe\xe0\x07\xcb\xa8i\xabm\xd0\x88A\xd4\xb7\xaa\xea\xa6\
-\xaa\xe8N\xd5\xa1\x1b\xaa\xa4k\xaa\xa8\x13\x95\x18/E\
-\xb1\x9c\x8al\x19\x8adi\x8a`\x91{S\xc5|n\
-\xb2\xado\x92M\xee\x958\xceE\xf6h\x8b\xe8!\x13\
-(\xe2\x0b\xc8\xbf~\x00VP8 \xd0\x06\x00\x00\xd0\
-.\x00\x9d\x01*\xc8\x00\xc8\x00>\x91F\x9eI\xa5\xa4\
-#!*\x16\x09P\xb0\x12\x09in\xe1m\xc0\xfa\xac\
-.\xfe\xb1\xf8\xf7\xdf\xdf\xfa\x0e\x84\x1fi\xca\xf8\xf4\xbf\
-\x91~+\xc5\xdb\x22\xfe\x0e&R\xe0.\xecq!\xc6\
-\x97\xf7\xbf\x02/\xb1\xff\x9c\xf6\x00\xfeU\xe8\x91\xfc\xff\
-\xfc\xdf\xf1\xdf\x98\x1e\xcf\xbf,\xff+\xff\x83\xfc\xe7\xc0\
-7\xf2\xbf\xeb^\x91^\xb7\xffk}\x81\x7fQ\xff\xf6\
-\x97\xfb\xff\x1d\xb7;[\x0dj\x83\xca\xa8\xdb-?\xef\
-\xf2\xdb\xa2\xae\xc8\x14K:\xfe\xaeX\xf4\xd0-\xea\x87\
-d\xd4\xb7\xf5\xd4\xdbq\xf1\xa0\x15\xfd\xfe?\xca\xb2\xd6\
-.\xed>!\x11g\xa5\x96\x19\xeb\x8a\x14\xaf\xed\xb2\xfc\
-\xda*\xd4\x18\x9a\x82\x04\x81\x03)\xc3\x99\xdb\x1a\xeb\xc4\
-\x00\xf2\xa0@\x0a\xcd\xa2\x87o\x9dXYr\xfcv\xb7\
-\xeb\x1cm\xb9\xda\xd7\xeaY]0\x9b\x8d\xc9\x8e\xf3\xb5\
-\xb0\xd6\xb1dP2!\x01\xee\xd4Zw\xecu6\xec\
-5v\xd6\xed\x1b\x84\x8a\xcd\xf4\xd4>\xec$\x01\xd4\xbe\
-w0P\x8b \x87\xda\x1b\x13\xaa\xdf\xecn\xb5\xb3t\
-I\xc3\xda\x80\xd7\xa82h\xc2\x83\x00\xc7\x84\x81\x91\xf3\
-R4VLM\xa0S7\xaeTJD\xa7j\xb3\x14\
-\x88\xf5\xe2B\xce'\x8cU\x17\xa2\x99\x8c\xfd\x89y\x89\
-6\x9e\x1d\x9bt\xc0\x82x\xdf\x14\x91*\x86\xc6b\x92\
-\xbf:\x08\x1d\xe6\xa6\xad\xfc\xd11e\x0f]M\xae\x02\
-\x88|&K\xa0,(\xc2;Q\xaf\x0f\xf8\xbf<\xa1\
-\x0d&\xfa\x86?\xb9\xda\xd8kX\xf1\xdbq`\x00\xfe\
-\xfe\x87 \x01\xe6h\xa7\x90\x99\xc9H\xb9\x82\x10Ja\
-\x1d\x9a\xb6\x1a\x5c1\xed\xe7\x07\x22#\xfe\x8fa\xb6N\
-T\x8bv`\xb7\xbe\xaawg!\x92\xff\x1aIa\xf8\
-P\xf9\x84[\xbdA\xc8\x04\x17\xe4\xc3\xe4\xe3z\x17\xe0\
-\xbf8\x1d\xdd(V\x03A\xe0\xf2\xe7\xb7\xba\xffIY\
-md\x04\xd8\xd6)\x17\x0f\x02\x10a\x84\xc6\xf6\xdb`\
-NY\x8c\xb4\x13\xda?\x11\xd6\xe4\x96$\x8c\xfe\x12\x0a\
-\xdb\x18<\x07\xe43\xaaW\x8b\x06Y\xb8?\x90\x844\
-|\x1e(j\xa2\xb9\xae0@\x04\x0f\xb7\xc1\xfa]\x92\
-\x90i\x88\x87>Kl?\xdeN\xfdU\xae\xca\x04\xb9\
-~\x87H\xc7D\xca\x14\xe3\xe3\x1dI\x0f\x81\xcd\xdc\xd7\
-\xde+\xda\xeb\xff \xf6\x14y\xf5\xc4mr\xeb\xf1\xb6\
-\xe0\xd4\x83\xfd\xc4\x05\xac\xdc\xba@\x10*yZ\xf4\xd1\
-\xccf.\x02\xc3\xa3\x1egY:\x95\x13+\xabe\xe6\
-\x90\xf8?\xe2\x90\xfb2\x8a\xd1k\xd3\xc8\xe3\xe3\xbat\
-\xbb\xa8\xa5\x8f~\xc4(\xc3\x8dQ\xe2q\xba\x02\xba\x1e\
-\xbd\xf2_\x00\xf2W\x89\xfb\xefr\xfdJ\xdcvu\xde\
-\x0f@bZ\x12\xd2\x1a\xe4\xb8\xc9z\xf0DY\x14\x11\
-\xf4\x06\x17W\x0f\x03&E\x8a\xeb\xa9\xcd5$\x04\x99\
-\xb3\x81\x05\xef\x85\x11\x89\x09H\xcd-l\xb3\xd0\xf0\xd2\
-\xf5\x90{\xd85\xd4\xca\x02 \x1a\xea2\xb4\x12]T\
-\xc2\xae\x15\xf3wZu1\xbe\xd5\xddgP\xa8\xbb\x1a\
-\xa6'\xbf\xa6\x05I\x15\xdc\xb5\x92S\x85\xee\xe4\xb8O\
-h\xc8V\x14\xa8\xd1_\x9d\xd7\x9c~\xaefg!\xa7\
-\xf1D\x8c-&69\xf9\xe6!\xee\xca\x0f\xcf5z\
-\x08\xfcB5W(\x09\xa6\xdb\x96\xa0\xe1\xb8\xe3\x1bF\
-\xceC\xfa\xb9\xdd\xa5\x16\xca\xc6g\xe5\xa1\xf0F2N\
-\x7f\xca\xb1\x0f\xdey\xa5\x04H\x01h\x8b\xb4]\x7f\x9f\
-Z\x03#\x1a\x11L\x11\xe1\x01\xc2\xe0\x1bW\xafn\x80\
-\x86}\xb1a\xcd\x03\xe6\xe0\x86\xd1N\x10\xb5\xfa\xadI\
-\x86\x89\xf9y\x03\x16\xf6\xba\xc7\xc6zhB4'\x8d\
-\xe6\x84\x04\x13!\xb9\xca\xa5\xd1mH4\x96\x91\x15\x03\
-EmR-9,9\xf6\xffS~Z\x5c]*\x92\
-\xdb\xc7\xab\xd9\x91\x98\xa5\x95\x09\xd9OB\xdf\x9d]=\
-\x82|\xa2\x84i$\x11b\x86W]\xecd\x04\x9a\x1e\
-\xd6\x5c\xcf\xa6my\xa6\xc15\xaf\x9f\x99\xe6tu\xf0\
-\x19A\xf9\x92W[ l^\xa8\x18\x5c=D\x1f\xc2\
-\xe7]\x85\x80'\xe8\xc6{l\xc59-\xad\xbcL\xcf\
-\x93\xb2\xf8\x0c\x09\x89\xb8\x03\x9c\xcchxy\xb4H\xe8\
-O*\x9b\xd7\x9a\xd6kF\xb2\x8e\xdc\xc570\xe0\xf3\
-\x9e\xfc\xd6\x09\xba\xe0\xa1\xef\x02\xe2\x85KL\x0cd\x17\
-\xa0\xb5\x17T\x02\xaf\xc0\xe8,\x22v7\x06\x1f\xe4\x8d\
-\xc4W\xd2I\xff\x5c\xea\xe0\xe8BZf\x9b\x15^\x7f\
-\xac\xdd;\xc6\x87,\x84w\xe3={D\x94rM\xc7\
-\xfd\xcc\x9dt\xfa\xef\x8d\xc5\x8e\x0e+\xa8\x5c<\xe3\xa4\
-*s\xd0\x09\xf1|rp\xd2\xbc\x1b*\x9f\x0b\x12\x0e\
-\xf9Sn\x9d?0\xadc\x0d\xbb\xa9(\xaf\x80\xf5\xae\
-\xb8\x10\x02A\xe3\xf5\xde|\xe1\xf9'`\x10S\x1fw\
-s@W\x22\xf0\x05\xb9\xb9\x86\xc7\xbc3Hfg\xb6\
-:\x7f\xcaoR\x1aW\xc0G\xdc\x0a\xc64\xfd\xc3\xa5\
-+\x9c\x96\xfe\x02vt*]\x11\x1d\xef\xcd<\xd5.\
-:\xbb\x0e\xc1p\xdd\x9a\x18\x9d\x96\x14\xe9ir\x042\
-\xc6\xde\xc0cE!~\xcf\x84n\x10\xaa\xf1\xa2\x028\
-e\xa1\x99\x09\xab\x10w\xbd\x9d\x0c\x9e\xb0{>\xe6K\
-\x12\xf30\x1fL\xc9\xef)\x0a\xf6\xbe\x0b\xa6A\x109\
-#\xbe\x04\x9c\xfd\x19X\xe9UH8j\x02a6\x01\
-N>\xe7\xc0j\x96\x9dO\x02\x93\x149-$\xdb\xa4\
-\xae\x11\xfbwIk\x8a\xda\x19z\x98\xbf\xe5\xb1}@\
-\xde\x94\xe5\xdd\xa5\xa6\xedl|\xfa<\x09tm\x031\
-EM\xcb\xce&\xffnF\xfc;H\xf0v,\xba\x92\
-\x17Jx+\xec,\xc7U\xd9\xfdU\x06V\x98t\xae\
-\xfd\xfd\x1c\x89\xce\x82\xe1Z&\xb7\x88\x92\xfcd\xd8$\
-\xeeF\xb9D[\xe4\x0d|\x93lK\xd7\xd3\xac\xc7\x0a\
-\x19\xb7\x02?\xa2P\x16\xc2\x95\xb9\xe5\x05:\x09w\xdb\
-\x7f\xd2\xf7\xa3\x06\xc6\x03\x8e^\x0f\xbe\xca\x06\xf2@\x00\
-\x8f\xaczE\xfc\x17G\xe8G\xadE\x1dgm\xb5\x12\
-2\x1d\xeb\x81\xb5\xee\xc8\xb8\xb4)>\xac\xe7|\xe1H\
-\xcbG\xf5>\xf4\x01\xdc\xddBG\xd1\x89\xe1/[~\
-\x91\x0fS\xb6\xeal[\xce\xbf+`G\xa6\xb9X|\
-h\x9f5\xf4\xc6\x8f\x96M\xef;\xb0&Sn\x13\xda\
-dA\xd6O\x11\xbf\x9e\x10n\xdf\xaf3\x17\xa6bC\
-|\x91\x1f\xd2K\xc2\x9d\xa6\x92\x02\x18p\x05 \x13t\
-\xd0D\x06C9l\xed\xd1\x19\xbd\x87\xf3\x07\xd1\xbe\xae\
-\xd8\xe8J5]\xc5+\x08\xd3\xe1\xb9DY{\xb0y\
-@V'\xc7\xf9\x1f\xaa\x14\x12\x12\xd8)\x85\x9b\xb9U\
-\x18\x917\xefV \xfeR'\xddiE\xf8\xdb\xefN\
-\x8a6\xfc\xe3\xb9/j\xcb\x22\x12A\xab?\x1b\xe6\xeb\
-\xb2\xa0:\xc4\xeb\xb7y\x1b}\xd0\xd4\x0f\x82\xac\xd6\x90\
-\x9awd`&\xd6\xd3\xcb\xf5\x91\x01\x90:\x052*\
-\xa5\xf5\x17\xa1J\xab\xfb\xa5`8V5\xe0Vl\x82\
-\xc9\x9d\xfc\xacB\x9c\xb9\x13\x99\x0a\xb6\x9a\xaeM\xd4\xe0\
-\xecm}\x0e\xd2\xde\xe4\xed\xe3\x22,c\x84#7\xce\
-\xe3V\xffP\xc9\x84\x19q\xe6\xde\x83\x04c\x7f\xe1\x22\
-\xeeC\xaa\x91\xcb3N\xbbE~\x1c\xd8\x0d\xc4S\xd5\
-\xda(\xbb\x8f\x0c!\xa5/\xe1\xe5z\xe0\x00\x00\x00A\
-NMF\x90\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\x96\x00\x00\
-\x9f\x00\x00\x1e\x00\x00\x03ALPH\xb8\x01\x00\x00\x01\
-\x0f0\xff\x11\x11Bnm[A\x05]\x96\x01\x93\xd1\
-\xc1P\x0a\xa5A'\xd3\x8a\xa5X\x02!\x81\xcb\x13\xf0\
-x\xb8\xfc\xd1d\x11\xfd\x9f\x00-\x07$m\x9e\x00a\
-\xe3\x9e\xb2\xafa\x06W\xb7\x92\xeb\xb6\x8a\xa7\xb1\x0c\x8e\
-k\x15\x1dc\x95\x1d\xcf\xaa\xae\x1a\xce\xd5\xe99\x16\xdd\
-\x93\x16\xc3\x93\x17\x8f\xa7.p[\xa7\xabZ\x97\xabX\
-\xfd\x8d\xe1\xca\xd6\xedJ\xd63\x15i\x00\xd1b\x0eR\
-s\xb4\xa9H\xd2\x80\xc38\xa78\x9d\x10\x8ck\x0a\x93\
-V\x1d(2od\x0e Y\xbdZ7\x10\xad\xb3X\
-\x0f\x10\xac\xe6\xa9Z\xfe\xb5\x80\xb2\xfac4 \xad\xec\
-\x13\x88o\x1c;\x17\x10v:\xa0\x17\xea\xd6\x80\xb2u\
-C~#m=\x10\xdf8\xb6\x80\xf0\x86v\xdbKu\
-\xeb\x84\xf2\x91\xbcuA\xfaB\x87\xf8\x91ck\xbc\x14\
-~\xe4\x06\xfdL\xdd{>S~\x85\xcf\xe4\xff\x0de\
-\xef\xf9\xa5\xfa\x89\xfb3|%l\x8d\xef\x1c[\xfd\xa5\
-\xf8\x85\x0b\xd2\x17N\xc8\x1f)[\x0d\xea\x1bli\xeb\
-\xb0\x82\xa7EI\x0f\x1c\x9e3Y\xd1s\x15I\xf7F\
-\xafV\xf2\x0c$\x0d\xc8\x9e\x9bC\xeaP<\x0f\xd1\xa8\
-\x1e\xc8\xd2\x058\x1a\x14\xe9\x04\x8e\xd5\x09\xd5\x8a\xab\x0b\
-\x08j@ZuC@^\xdd\x80\xa4\x07\xea\xeaq\x10\
-\xac\x06TI7pX'P$\x0d Y\x1d\xc8\x92\
-:P\xac\x1bH\x92.\x00\x0b J:\xa7c\xba\xa6\
-CR\x9b\xf2tOA\x92&\x82\xd4\x985?S\x96\
-\xc6T\x8d{\xe2\x1ff1\x86\xb1\xccF\xf7%\xe3\xf2\
-E\xa3\xf9\x0eC>\xd9\x8f\xa7.\x86\xa7,\xba'-\
-NO\x5c\xc8\x13V\xcf\xaaj=V\xd9q\xad\xa2\xa3\
-\xad\x82C\xb7U\xe5\xbd\xac\xe4jVpiLE\xfe\
-6\x1d\x1b\xea\x90e\x03VP8 \xb8\x06\x00\x00\xd0\
-'\x00\x9d\x01*\x97\x00\xa0\x00>\x91<\x96G\xa5\xa3\
-\xa2!27H\xc0\xb0\x12\x09in\xe0\xc0\x03\xf8\x03\
-g\xcf\xf4 )\xffA\xd9\xbf\xf8\x9eV\xafc\xb9O\
-4O\x18,\x81xW\x92\xce\xfc\x1d\x9c\xd5\xf3\xd0\x0b\
-\xbb\xbd\xeb\xda\x90IM\xfa\x87\x81O\x96\xfa\x96z*\
-\xff)\xff7\xf5\xaf\xd1\xf7\xe5\xbf\xe2?\xf4\xfb\x82\x7f\
-'\xfe\xb7\xe8\xef\xeb\xbb\xf5\xe3\xd8S\xf5'\xfe\xe1\xc1\
-\xf4\x94]+\xe8V\x89\x1fh\xf7nV\x894Z/\
-l\xaf\xe2\x80\x11uh2\xb4!\x9fMFR\xa3n\
-\x8f\x1e\xec\x04X\xb0\xe7CZ\xb0\xd3\xb6w\xc5j\x01\
-\x83\xab\xd9\xea\x03\x93\xf8\xfa\xfd\xbc\xf8E\xc7\xf2N\x99\
-8@tn\xb8\x88\xce\xe4\x10}\xdd%(\x89\x80\xdb\
-\xe2\x02z\xcd[{\xda\x92\x0fA\x1d\xbb\xd9c\xae\x9f\
-F\x22\x86.D\xb6\xf1?\xddx\xd4y\xb9\x03\xd0\xfc\
-\xaf'\xbdy\xb4_\xba\x09\xf3;\xc5G\xaaB\x22~\
-\xf9\x81s\xc1\xd8\xbb\xe7\x11\xbbZ\xce\x04\xb6+7\xe8\
-.\xd0\x8d\xf6\xfd\x0e\xd7\x8eDh\xa7C\xde\xce\xe90\
-\xf6\x820\xd9\xc2\xc4'P\xd8\xe6_\x8a\xc4K\xe4\xb0\
-&\x5c#u\x7fA\x08\x05t\xf2\xce>^/\x9c\xb8\
-jX\xc9\xe7\xb4\xa0\xfa\x99\x12\x97\x1dC\xa0#bg\
-\xf7\xf7f\xec \x00\x00\xfc\xe6\xbd\x0bR\x87\x8d\x9f/\
-\xf5{\xaalyE\xd4\xb08\xe5B\xb7Xw\x00S\
-\x17V\x05\xd1\x89i>\xc5\xbf\xd4\xfd\x04\xe3\x9b\xba\xab\
-\x9e\xbbj\xd2\xfd\x11\x8fZ\xdc\xb5\x12\xe5Q_\xf5\x1c\
-L\x01!\x97\xccl\xc9R\xadk`\xb7\xe6t\xce\xae\
-\xe1\xae\xabJ)z\xc1\x16\x1f\x8e\x12\xe1\x81\x85\xe3\xcc\
-\x85\xe3}G\x12\xce\xa7\x97\xee\xbez1\x04\xdc\xe1\xb1\
-N\x80\xfc\x16fc\xfcr\x8fc\x87\x0f\xf6\x9a\xf1&\
-\xbd\x0a )6\xabB\xd6\xc6hq\xdd\x1a\x0c\x8d\xbf\
-\xf5\x1b\xfb9\xb8I\x85cl\xcf>\xc1\x00\xbbD%\
-\xc5b\x85\xe9\xdbw[\x9c\xa6\xb9M},(3\x99\
-D2\xbae\x97\xe0\xcd$\x8aY\x9b\xa86Qa\x90\
-\x14\xe9V\xb8V\x96I~\x0a\xa1h\x84,\xe0Q5\
-\x9e\xd9&\xa9\xee\xc4\xb2{\x13\xefQ\x1dl}\x95\xe4\
-\xd3\x15&\xd7\x9e\xf4Ag\xe4\xd4\xf92\xe07\x90\xfd\
-h\xa8\xf4\xd3_\x81\x83\xff\xe1\x05\x12\xbe\x0bO\x86\xf0\
-h/;\xd9\xe4\xdf\xf6\x9a\xdc\xecIw!\x19\xd9i\
-\xa2\xd6{A\x97\x01\x12\xe6:?\xe70W\xaf\x8cN\
-\x1c\xad\xfd\xa7\xa3\xbei\x84\xdfNr'\xdd\xb3\x9c\xc0\
-(\x97|\x13\xabP\x9e\xf0\xacj\xb7\x04\xedn&1\
-\x90\xc0Jt\xd1\x16y\x94\x98md\xed\xa2\x08\x94\xb5\
-\xe7\x5c\xe2\x1cN\x19\xf9\x16^+\xe7\xab\x22\xa4bI\
-\xd5\x84\xea,=\x1d\xf5\xef\xb4\x0b\x8a\x8a\xf7\x8c\xc1\x11\
-\xec\xcf<\x88X\xfay\x22\x16\xe4\x0e[#w&m\
-\xcc\x1a\xa4\xb2\x94\xee\xa7\x1d\xd9\xbe\xc4\x8f\xeab\xca6\
-m\xaa\xdd\x13g\xe9Z\x8bx<\xe2\x17\xd8\xe9\x87=\
-\xc7yr2\xbb\xd0\xb3\x19\x0d\xe5p`\x1b\x151\xec\
-\xc9\xc2\xdfywg\xddF\xbf\xa3R\xafg&\x0fE\
-R\xbe\xbc\x14,\xbb\xb4\x97\xbf\xe2RNpX\x03\x81\
-\x96}\xe9M\x7f\x90\x00\x91\xe9\xcb\xcc\xac\x91\x0bC\xf1\
-\x1aN5\x0cX\xbep\x03(\xef!Q&\xe5\x1a\x84\
-\xa87\xae\xa7X;]\x8f\xe4#2\x0dE\xd0\x1b\xb9\
-C \xdc\x91\x7f\x02\xe8\xf2\xeev\x90\xe1\xf9l\xf0o\
-z\xaa,\xb5\xb4\x00W/Ie\xe6\xbf\x0b\xb1\xd0\xa8\
-\x00V\xcd\xb9\xf8\xdd|\x98\x0eu\xf8\xd7~)d\xa7\
-\x1bxm\xbdB\xde\xf7^\x0d{\xf6J\xb9\xd4\x07\x22\
-^\x03-\xd3/W\xfa\xee\x0a\xa7\x8c\x03l\xf2\x22\xa9\
-$\xf1N\xa1W\xc0\xb0]i\xd4\x16\xc5\x06\xe1\xe2\xd2\
-\xcb\x0cm^#\xc4O\x95r\xf0\x00Z\xd91\xc7\x1c\
-\x13\x9d-\xdc\xce\x8b\x7f\xd0\x9c\x08\xd0\xbe\xfa\x10\x14Z\
-\x8d-\x04\xee\xcd\xc9\x5c\xc7\xbf\xdeBL\x02\xeaU\x0f\
-sgV%\x08\xb0\xa1~\xdf\x14R\x91SS\x9d\x00\
-\xfdr5\x8e\x1a\xd4\x9bKyy\xceYA\x84\xbc\x0b\
-\x9f\x1b\xa7\x94'\xd0:\xfd\xc2\xa57\x97\xb6:l\xfe\
- j\x1c\xec\xc5O^\x97\xb2t\x96mC\x81\xd6\xcc\
-\xafTGyd~\x1eLuO\xff\x07[!\xe6G\
-\xa2\xed\x10\xeb$\xe1\x1aZ\xf6@\xa1\xa0\x0b*Gt\
-(CG\x06\xed\x85\x0c\xfd\xbbE\xe0h\xd8\xd6\x10\xc2\
-@\xa9-\x8c\x98\xcc\x1c\xe7F\xd9\xb6G2\xa4c\x9e\
-\xd7C\xab9\xd4b\x82\x02\xa4\xfb\xec\x8a\x95\xf3]\x07\
-\x1a\xbbi\x84l\xab\xd7\x1b\xe7w\x9e^\x0c\x0c\xbb\x1a\
-z\x9c\xf1\xd4\xdd\x8c\xcf\x0e'\x14\xca\x97\xc9bdL\
-'\xad\x0d\xa6\x9be\xe4\xbci9kx8\x01\x1e\x12\
-\xe4m\x82\x80F\x97W\xeb\xbb,\xa2\x86\xba\x91\x04\xa4\
-\x00\x0a\xe6\x1f8\xd7N%W\xd7\x04\xc44\xe6\xbb\xbe\
-1J`\xeaVogE\x9b7Q\xd3Q\xb1\xc4\x82\
-\x1a\xaa\xd9\xd59\x22~\xa6q\xec\x92B\x9av\xd4\x00\
-mJ\x12\xed`Q\xe5S\x1a\xb9T\xf1\xbeIr\x18\
-\xaa\xa3\xd7\x93\x07e\xcb\xf2\xd9\xa6\xb8o\x1e>&\x87\
-\xb1\x13y\xdby\x7f$\xf0\x8a\xef\xd1\x9f\xb4\xb1\xc7\xef\
-=k\xca\xa8S\xf2#W\x0d\x16,\x8e\xfd\xc2\xd9\x87\
-\xcf\xba\xc2\xd5\x83\x85\xe5\xafP\x84\xe5\xaa\xc8\xd4\xd6\x96\
-f*\xe1~\x1d\x19\xfbi\x90i\xe0D\xb3\xb7\xc5\x89\
-\xd1:\xdc\xe5\xf5\xd25\x9b\x03E[\xdd\x8a\xbe\xfd\xed\
-\xfa>\xccKqq\x16 \xe3K\x87\x93 \xbd\x86\x86\
-\x8c\xd2\xdb\x04\x1d{\x82\xb3=\x87\x17i\xb8(\xd6,\
-qg\x01\xc0\xccL\x02\x12\x8f\xbc1\x93\xaf\x85\xb8e\
-\xaa\xe5v\xf4\xfe3\xd6 \xc3\xc0\x18\x80\xfc\x9c\xdf\xf1\
-DFj\xb3\x97k\x14hg\xcf\x7f\xbf\xbcmF\xa9\
-F\xf0\x7fC,Iz<+\xe9\xc2\x9f\x11\xf4MM\
-\x9c\x06C\xe6\xe6\x1eq\xcf\xb5\xaf\xa72\xa2\xf4\x98\xfd\
-\x89\xd2\xd0\x87)\x97^\x1ev\xee\xccmy\x85b\xf2\
-\x07^f\xce\xa3,\x16w\xd1\xfe\x90wcu\x86\xd9\
-\xca\xa0\x9b\x0e\xf9\xad]\xf6w=Rc\x0a\x1f\x8d\xe8\
-\xcc\x86:}Z\x8b\xaf'g\xff\xd7\x1fg\x87\xd3\x8c\
-'\x03\xb5V[\x1d\x05\xaa\xbd*$[J\x94\xfaS\
-N\xd4Y\xedZ\xaf\xca\x13E\xa2\xa1\x90\xeb\x156[\
-\x87a!\xf0\xfdQ\xefv\xfc\x99\x9c@\xb4\x05\xf9M\
-\x8e\xf0\xc6\xd2\x7f?++*@\x08\x1d<.\x89}\
-\x86\x8c\x8f\xcc\xf6\x82\x11\xc9j\x01\x05\xf0x\xb7\xebn\
-\xf9\xa4D\x88\xce\xf9\xa6\x89\xf2\xc3\x1b\xa2\x95\xe4\xcf\xda\
->\x1c\xa0\x99v\x87\xa0)\x17\xbc\xde\xb5\xcd\xcf\xcc\xb2\
-\x06\x86\xa6\xbc\xf0#\x22\xb7\xd8\x9dvDP\x08L\xb8\
-dP\xe7\x88\xa2\xa0,4,x\xb0_\xfa9y'\
-\xee\x12\x89\xa52\xb8\xc3\xc8`\xfa0+q\xfe\xb8\x8e\
-\xd0C\x14\x1az\x95(s \xb0\xbc\xb0'h\xa1\xc8\
-\xa7J\xa08g\xe3`\x8a>}~\xa6\x9b\xf5\xbco\
-R\xee\xe0\xa7\x00\x00\x00ANMF\x94\x08\x00\x00\x0a\
-\x00\x00\x0a\x00\x00\x8a\x00\x00\x9f\x00\x00\x1e\x00\x00\x00A\
-LPH\xb9\x01\x00\x00\x01\x0f0\xff\x11\x11\x82nm\
-\xdbu#\xe9\xa2i\xd0D\x02\xbd\x162i\x84\x06\x86\
-\xc6P\x18\x02L\x1a\x5c<\xc6\xfb\x90%\xf5|\xcc\x88\
-\xfeO\x80\xc2\x09U\xf9\x1d\xa0\xe4.\xd3R\x1bn\xc9\
-L\xaff.\xaf'6\xc2\xc4\x11\xad\xd1\x19\xb5\xe8\x8e\
-F\xb0\x91\x0c\xf6\xcc\xe2\xcdL\xf5\xceL\xf3\xee\xcc\xf0\
-H;[\xae\x98#\xb7\x9a\x99\xab\xe6\xcc5s\xe5\xba\
-\xb9M\x97N3\x0c\xb6H\x8a6\xd3%\xe9\x04\xba\xa4\
-\xdd\xacf\x07\x9a\xa4\xc3\xc8\x05\xaa\xa4\x09t\xef\x82U\
-\xd2\x09To\xc2\x22\xe9\x02Vo\xf7n\xa0x\x82\x22\
-\x09\x18\x0ao\xe4\xf5\xe8\x1a\x926\xa0E\xb3K\xda\x81\
-5:Z\xb0D{\x95t\x00%\xdaVI\x13P\xf2\
-\x9772\xf6\x84\xfe\xe4\x82\xf6B}r\xc3\xfa\xc2\xf2\
-\x04(/\xe8\xe1\xf6\xcex\xb2C\xff\x88\xf6\xe4x\xa7\
->\x99\xb0~\xc4\xf2\xe4\xfc\x94\xf2\xe4zG\xdf1\x1e\
-\xdd\x1f\xd2\xbf\x82\x0fi\xff\x9b\xf5\x0f\xb8\xbff|\xc5\
-\xf5\x0a\x1fpB\xf9\x92\xe5\xc9|g\xfd\xb9\x03\xea\xcf\
-\xed\xd0^\xe8?\xb7\xc1\xf89\x01o\x94'7,/\
-\xacO\xaew\xea\x93\x13Z\xe6\xb7\xa4\x09=\xf3\xc7\x1b\
-\x99!\xe9\x00J\xb4!i\x07\x96h\xa7xkt\xb0\
-H\x1bP\xa3\xc9*\x09\xe8\xd1E\x95t\xc3\x88n\x9a\
-G\xb0A\x97t\x01\x8b\xb7\xc3\x90t\x02\xd5\x9b\x80\xa4\
-\x09t\xef\x02\x8at\x00x\x00\xab\xb4\x9b\xc5\x1c\xc1f\
-\x9a9M\x91d\x90\xb4a%\xe96M\xba\xcc0\x97\
-\x81\x0b\xdb\xcd\xe9\xf9\xcd\xcc\x5c5Gn5[n1\
-\xca\xc9\xbd3\xc3;3\xdd\x9b\x99\xea\xed\x99\xc5S\xa6\
-\x04w4\x14\x9eQ\x8b\x8eh\x8d\x14\x95\xc4\xe5\x0d%\
-\xa7W3\x9bW2:MWz3KN\x13\x9a\x5c\
-\x00VP8 \xba\x06\x00\x004$\x00\x9d\x01*\x8b\
-\x00\xa0\x00>\x8d:\x95G\x83?r\x87\x80\x01\x18\x96\
-p\x87\x00\xfe\x00\xd9\xf3\xf9\xa9\xd2\xfcU\xfe3\xb4\x7f\
-\xee\x5c\xb0R\x8d$_\x0f;\xd5\xda\x97\xc0\x07dp\
-\x00\xfa\xc3\xc4/\x1a\xdf\xd8<\x0afC\xe8\xad\xfc\xb7\
-\xfc\xff'\xdf\x93\xff\x89\xff\xc5\xee\x0d\xfc\xab\xfa\x97\xfd\
-\xcfX\x0f_\xdf\xae^\xc1\x1f\xa7\xdf\xf5\xcfv;\x92\
-\xf0[\xe7\x95\xa6\xe6c}\xa7\xb5\xab%\xbf\xfan\x17\
-k\x86\xebx$;<@!$#\xc2&r\x92\x86\
-\x8f\xb4\x99\x1b\x109\x87\x0bY\x17\x87\xc7\x95\xf5\x0b\xa8\
-.\xfa\xfe=U\xed\xbcR\xf2*:\x8b\x90\xc7*2\
-\x7f\x0a\xf4\xa6r\xfd\x9cD\x80+\xba\xe5\xeaa?\xcf\
-\xc0\x88\xbeJB;w\xbd\x92X\xcc\x82\x80\x8f\x95\x98\
-\xa8\xfb_\x13x=\xb5\xa5)$-\xac\x0a\xedf\x13\
-\xb3T\x15\x9c=\x09A\xe3\xb7[E\xc5\xb9B\x06&\
-w\x7f[\x07\x89\xe5^th\xbb]w\xde\xd4+\xaa\
-\xa1\xffr\xf2\xd0\x99\x90\x0e\xb3\xbeT\xe4\xe7W\x5c\x81\
-[89j\xbe&\xf3\x13PS\xcaC\x151\x029\
->\xcd@_],\xff\xab\xba\xf9iW\x9f,?\xaa\
-Z\x9e\xc0\x00\xfd\x10\xbe\x85\xbdtj\xd6\x92;L\xdf\
-\x1dX\xc3\x1d\x80\xad\x13\xd0\x10a\xd1\x09\xc6R\xf3\x97\
-\x18\x05\xb2\xe99w\xe5/\xe0-\xe5\x15\xd1je\x09\
-$P\xe1\xf0\xcfv\xc6\xf1\xf9\xccm\xc3\xa0\x9e4\x82\
-\xf3\xc1j\xa1z9\x98\xb1%\xcc\x0b\xa3\x9duA\xbf\
-\x0e\xb9q\xff\xaf\x05\xd4`\x0a\x92\x99b$\xc6\xc6\xe5\
-\xebo\xf8\x8d\xfc\xe8\x045\x8ey\x99 \xf6,D\x80\
-\xe8N\xfd\xf6\xd7\xc9v\xd2\xd4\x159\xe2\xf9\x94\xa4X\
-\x04{\xb0\x1a\xf0\xcc*7kV:\xda\x83,\x1d\x0b\
-\x98\x8b\xbf'\xd0,\xcf\xf3\x0a\xa9\x1d\x99[\x96\x0bA\
-\xbd0\x14\x8b\x84\xc0=\xcbvs\xc5\x9bt\xc9\xa6<\
-\x0c\xb6_Z\x84_\x86\x9c\xe54\xa8\xe1\x87l.C\
-0\x0d\x80\xa1\x0d\xe7\x9d\xa5M\xce\x13\xdf2\xb4\xdd\xcd\
-\xda\x10\x8a\xf4\xe6\xaa\xc4\x85\x14'\x9b\xf3t\xddx\xc1\
-|\x7f\xff5\x9e%\xc7\xda\x83\xa8\x9c\x02\xf9\x9bT\xcf\
-\x03J\x06\x80\x9a\xa9-\x9a&\xb4k\xfd\xec\xbah\xc5\
-\xce\xf2\xfc\xdcM\x17\xa7_\xf5S\xd6 p\xaf\xcb/\
-g\xf7\xe9\x94\xe2e\x95\x88\xb4B\xc2\xd4\x8fJ_\x9f\
-\x88d8)\xbfWs,\x8b\x80L\x1d1cZ!\
-\x0f7XUb\xf8\x11\xa6\xbf%\xd9\x1b[Um\xcb\
-\xaa\xf5\xd3\xd7a\x9b);\x1aF\x1f\x02\xb0E\xb7-\
-\xd9Iz\xfa\xb0z!EG\x1f\xcf\xcc\xd3[\xeeX\
-y\x9e\xf2\xcc\x7f\x96\x00O\x1a\xf2W\xc6c\xa4\x8f\xe4\
-\x97\xca\xa34!\x88\x0a#6sGD\x1dm\xc9\x13\
-\xdb\xb1\xea\x02\x0d\x01Y\xb2\xe2dd\xecY\x02~W\
-[\x84\xfc5dv\xb9\xbf\xd6\xb9Yb\xc0}\xc3\x0b\
-\xce\xb3\xa2e\xde\xcf\x1f\xd6\x9c\x87C\x09vP\xbaz\
-?\xbb\x19\xae|\x95\x97+2\xf3PYD\x11\xf3\xb2\
-\xd3\xd1\x86-R\x85y;\xe6\xc7\x7f\xb6\xf9\x04\x04f\
-\xb2(\xc5\xcc\x9e\xe2T\xf2]\xc3\x9d\x1e\xc5vy\xeb\
-\x86\xe4\x84\xc1\xbc\xb8\xd2\xe1\x9f\xeb\x86\xc5\xb1\xd8\x8fY\
-\xa2\x9d\xdb-\x1a'\xe1\xd1wcq\xcd\x5c\xb6\xd6\xc7\
-i\xdc!]\x89}M\xcdC\x11\xd4\x09\xb3\x19\x87|\
-?\x85\xa6!\x84\xa6c\xf3\x91\x9aE@\xf8\xf9\x0a\xbc\
-(\x95y\xe8\xf6\x0e\x0b\xe2\xdb\x0a\x064\xa7\xc9\x08\xf7\
-[\xa8\xba8n\x9c5\x91:F\xce\x86\x98Y\x14\xc8\
-0\x95_\xd0\x10\xf0hw:m\xb6X\xa8\xe4nk\
-\x85\xd5rB\x1b8\x98\xec\x15b\xca\xb3Z\xe7K\xf9\
-'\x1d\x9c\xb8\xe9\xf1\xb1w@\x9f5Y\x92\xba?\xb9\
-.\x83\x14\x05\xc5\xe3\x8c\x1a4/\x1ewm\x09m\x02\
-\xfe\xf9E\xa3ng{\xb8\xb9-\xceP~K\x93\x8a\
-\xa3\xf9\x1c.Re\xcb\x0b\xb4^\xd4%\x9fq\x00\x05\
-4b\x9f\x7f\x8f\xbbe\xf4\xcfP}\xc6\xca\xbf\xda\xa8\
-}\xd4R\x13\xa3\x0aOB]\xeb\xcb\xce=9`4\
-\xe6Se\x9auG[ `\x1c\xec\x95\x8b[\xad\x84\
-\x0a\x0c\x80\x13J)\xa1\x1e\x09\xa3V\xc8?_\x9b=\
-\x0c\x98m9\xfcK9\x5c!\x03\x13\xd8\xf4\xd1\xe0\xcf\
-\xba\xce\x05l\xb8\xff\xf9\x80\xb0~\xa5&\xfc\xb8\x97\x1e\
-\x9a\x07\x1a@\x11?\xbc\xfa\xbfY\x91\x7f\x06\xa2\x89\xdd\
-v\xa5j\xd2\xd5\x03\xf2\x90\xe7\xe5\xee\x1bE_\x058\
-\x12\x86\xf8[\xddM\x19)^\x95;k\x80\xe4hi\
-\x12\x1b\xc9_\xd5th\x1a\xe9\x1b\xaf\xec\x08D4n\
-\xees\xa96\xf2\xf9ZIo\x10\xf3\xbd\xef\x8f\x1b\x7f\
-\xae\xca7\x00\x0b\x94X\xbe0\x04\xc0\x1a\xe0\x86\xa8 \
-\xfc\xab\x985\xc5\xbb\x81[\xb5G\xa3W'P\x16I\
-Nb`yB\xda;\xbc\x22V|\x9c\x1f\x9e\xbas\
-<f\xc0\x9b\xf62\xab\xfe\x1e\xc4\x08\x08^\x11\xa5H\
-\x8cO\x90a\xb7\x90\xec:\xeb`\xcc\x06Y\xafv,\
-\x07r;\x04N\x05\xcb\x83\x13\x89Ut\x01\xa7P>\
-\xc7bR\xb56\xf94\x9dF\xaevyQ@;4\
-\xb1+Z$_\xae\x98#\x8eDr\x01ei\x800\
-q,\x1f\x8dW>\xb9\xcav+\xce\xdb(\xcd\xb8u\
-\xbfJ]\x93`\x8bG%g=\xc2\xbbl\x85\xa5\xa0\
-\xcb\xefx\x8f\xb1b\xd7\x01\x22/\x0bRE\xcc1\x06\
-\xe3\x15o\xe9\xbcsj\x8fN/@ei\x8c\x12\xf5\
-\x11_\x9c\xe2\x87>\x18\xcdq9\xf6\x8a\xb3\xc1\x84\xea\
-\x22%\x1a\x172~Y\xf4\xc9\x93*\x0b\x0e\xf1\xa1\x9b\
-r\x9bx\x5cMM\xf4\xad{\xa8V\x15Q\xc8\xc5\x1b\
-\xaeJ\x81\x09\xbe\xbd\xd4\x8a\x19lm\x89l\xd6q\xce\
-Ol\x0fb\xc6 U\xc3l\xff\xa9u\x10\xac\x19\xba\
-\xb2\x07\xb7\xa5\xd3\xe1\xb2\x8c\x0fu\xafm3\xa1\xf7@\
-\x95\xc7\x150\xb3\x83\xe9%\xd5\xb2\xd6\xcc\x0a\x93\xf0\x97\
-\x1f\xe4\xc4\xfc\x0b\xe5\xfe!\x08\xc1\xe8\x5cz\xa5 \xe5\
-\x80\x5c4z\xa2/1\x0d\xd2\xd5\xdf\x07\x22\xe3\xd0\xaf\
-\xd6(\x1c\x85\xe5\x88\xd2U\xad\x93\x94\xb0\x81\x84\xfeK\
-\xe10\x95\x86\xb0\xd0\xe5\x8f {&H\xaa\xa37c\
-\xf7\x11\x83\xd4Pe\x9b\x83\xba\x81\x04\x00\x09\xe9M\x1a\
-S\x0d\x1d\xab:o\x90-\xe2\xd1\xb3\xae\x15\x86\xe8\xf7\
-A\xbd\xf9;\x12\x976u6\x9d\x1c\x9a0\xa4\xa86\
-\x9bc\x9e\xbf\xadXA\xb2\xc1{\xee\x04\x00\xfc%\x17\
-q\xb2\xb8\xbcn\x075\xb4\x93\x17c\xdf\x10~\x91x\
-\x86\xce\x8b\xf60\x94O\xca=\xf6\xd4\xcfr\xd7\xe7\xfb\
-\x80\x9b\xd8)\x19\x9b\x22\xc6\x9f\xbb\x8b\x9br\xe2\x02\x99\
-\xbe\x11\x97,\xa2\xb8r\xc6~6\xb6\x0a\xe6\xcfb\x09\
- \xc5x\x01\x1dc\xe2\x07UoDA\xcd\x8b\x91B\
-\xd5\x83#\x98\x08z\xf6\x9dV\x96Z+\xfc6;\x8a\
-I\xb3E\x90\xb0\xdc*j\x13\x1czR&\x8b\xdc\xf5\
-\x87\xfb:\xe6\xa6\x0a\x81\xc8\x01\x8c\xa0:\x04\xe9\xfc\xcd\
-\xea\xd5\x92\x1c\xb1\xfc\x04\x18\xbb\xf3:\xe5>\x98\xa00\
-\xdf\x80\x00ANMF\xaa\x08\x00\x00\x0a\x00\x00\x0a\x00\
-\x00\x8d\x00\x00\x9f\x00\x00\x1e\x00\x00\x02ALPH\xae\
-\x01\x00\x00\x01\x0f0\xff\x11\x11\x02jm[a\xac\xc7\
-B )\x81Rh\xe5w\x02\xa5\xa5\x94\x94\x80D\xb0\
-8\xe2=^23\xea\xbb\x88\xfeO\x80\x1c\x07$\xf1\
-_\x00\xc1\xb7Tqu\xcc\xe0\x19V\xf2l\xab::\
-G\xc7}J\xa7y*\xa7}j\x87\x8e\xf3py\xa2\
-5<\xd9\x9a\x9ebmO\xb3p\x1b\xdd\x17\xd4\xedK\
-j\xf8\xb2\x9a\xbe\xa2\x96\xb5\x8d\xaa\xb6\xaa\x22S5\x85\
-\x0e\x22]!\x22]U\x11\x91\xa9\x82\xc8\xa5\x92\xbaT\
-\x14\xb9UP\xa2\x92\xc8\x00\xaa\x98\x0b\xc8\x22\x13\xc8\xd6\
-\x00\x8a\xc8\x02\x92u\x01Ud\x03\xc1\x12\x0bhr\xdc\
-P\x8czZ\x90\xa5\x03\xe54 \xc9\x05\xa4\xd3\x0d\xd1\
-\x88\xa7\x0bDn \x9c:Md\x00\xe2\xdc\xd5h\x9e\
-UD&T\xcf\xcc\x22\x0b\x8agD#\xbb\x82\xc8\x86\
-\xe4\xb9\xc5\x88\x1e\x0d\x84\x8fu@\x9e\xb5'\x17\xd4\xcf\
-\xddP\xbe\x22?\x19\x90\xbe\x22>\x99\xef\x84_X \
-\xbf\xd1\x1e\xed/\xa9?\xc1+\xe5_\xa1>\xda?\xd3\
-\xbe`}\x09\xdf\x11\x9e\xcco\x89O\xc6;\xe9s7\
-\xe4\xaf(O.\xa8\x9f\xeb\xd0^\xe0\x89\xbc\x14\x9el\
-\x88/\xa4'\x0b\xf2\x93\xf9Ny2\xa0\xbe\xd0\x9e\xdc\
-@xp\x01\xf1\x85t\xfaS\x1d\xc8\xa7\xa1\x04\xa8\xa7\
-\x15\xd4\x86v\xda'\x0e\x9d\xa8\x16\x10\xad\x8b\xa4&\x90\
-\xadAV\x03\xa8\xd6\xa2\xa8\x1b\xc0\xc2\xbaTT7T\
-\xd5UQ\x0b\x9a\x12E\x10\xe9\x00\xc6VEd\xaa\xa0\
-\x96\xa2ntT\xd38\x1a\xc3\x97\xd4\xfdB\xf7E%\
->1\xb7\xa7Y\xd3S\xad\xe1\xc9\xd6\xe5\x89\x96x\xc2\
-a\x9f\x9a\x1c\xe7\xa9\x9c\xeeS:\xc9)8\x96\xd5\xc4\
-y[\xd9\xd3\xad\xe0\x91\xa9\xaa\xb8\xbb\x8a>\x19\x90\xc5\
-\x04VP8 \xdc\x06\x00\x00P(\x00\x9d\x01*\x8e\
-\x00\xa0\x00>\x8d>\x9aG\xa5#\xa2\xa1/\xb7J\x98\
-\xa0\x11\x89g\x08p\x0f\xe0\x03B\x86H\x1f\xd5{F\
-\xfe\xff\xf97\xd09\xeb\xcf\xac\x16T\xe7N\x8b\x0eL\
-\xadm\xde\xe3\xb3\x17D\xf3\x02\xf6'\xe9\xfcFq\xbb\
-\xfd\xb3\xc0\xa7\xea\xbf\xe8\xbdD=\x14\x7f\x8f\xff\xb9\xe4\
-\xd7\xf2/\xf2_\xf7\xbd\xc1\x7f\x94\xffU\xf4w\xf5\xdd\
-\xfb+\xec\x1b\xfag\xffi'\x9fw\xd0~M\xad\xc2\
-\xff\x94)\x89g\xdc\x7fbi.c\x91\x82\x11B|\
-B|\x9e6\xd9\xc0\x10\x92\x11\xce\x19\xdb\xbe\xdb\x90\xb1\
-\xff\xb7G\x95\xe0&8\x8cP$\xdal\x14\x9e\x10\x98\
-\x0a+\xff\xeb\xf6\xf3\xe1\x16\xfe6o\xca\x9d\x02\xe9G\
-\xe5\xc0\xbdc\xa1\x1b\x8e\xdbZ\xf6\x13\x96\xf4\xcb\xb9]\
-\xdc~\xfe\x195\xc4\x9aQ\x06\xcb\xa9\x9c\xb8j\x0e\x9e\
-FV\xac\xb0I\xaeu\x94\xfch\x01}\x08\x05\xbe\x9a\
-\xe3\x03\x11\xe2 \x9d]m\x83\x06e\xdbH5\xb2\x9f\
-Q\xac]\x07\xa4\x92\x0f\x99\xbe\x14\x9c6\xd3\xf8\xf5<\
-\x92\xae]L\x0c\xa9\xef\xa1\x8a1\x81:s\x9b\xf7w\
-Q\xa4\xbb\xf9\xad\xe7\x02\x9a,'%\xb6\xab\x0c\x86\x95\
-\xb3\xff\xd97P\xdc\xdb8y\x18A\x22\x83;\xa5\xcf\
-M\xcbK\xc0\x86)\x94F;L\x16H\x9eQ\x22g\
-\xfc\x9a\xf7\x00\x00\xfd\x5cp\x81b\xac&t\x8bF\x81\
-\xe9P'\xe0\x8e\x1ea\xd0\x10%F\xf0\xd46\xd3\x94\
-\xea\x04e8t\xaf\xb1\xa1\xf2\x18\x19\x0b\xf4No\x06\
-\xe2D\x9cIN\xd9k\x817\x8c\xe8M\xf1G\xd2\x9a\
-\xf4\x87\x0d\xe0\xb3\xd6%\xec\xb1\x0e\x9ds\x7f\xbd\xe5!\
-\xda\xcb}\xffS\xf5<c\x22\xf44K\xc2B\xff\xe0\
-t\x14\xcb\x95#E\xc5\xe8\xde\xa8T}\xac\xd0P\x8c\
-l\x0d\x89\x00\x1c\xbd\x94\xc6aa(\x8bQA\xfe\x11\
-\xc3h\xc2A\x98\x5c\xc17\xc3A\xc9\xe1\xbb-\xa3~\
-2G7\xd0\xc3h\x8f\x7f\xa8\xf72bw\xa0.\x8d\
-\xac\xc6\x0f`{.\xccd\xf3\xdeR\xed\xe6\xe2\xd7>\
-\xe4s&6\xdf\x9b\x96\x83:`\x93s\x13n\x0d\x1c\
-\xc0\x09\xe2\xc7\x0f\x92\x97\xfe\x11\x8c5\x16\xd3\xfd\xea\xa7\
-\xa4\x88\x94\xd0\x80\xe9\x92\x9e\x1c\x87\xb8L\x15\xd2h`\
-3\xc6\x15\x1d\x10qI\xa5\xa3\xde\x10\x0cl!\xcb\xa6\
-\x9c\x22\xd2}\x9e\xade8\xe0\x84\xbb\xbd]\xe6{#\
-wB5\xf1\xb5\x8d\xe7\xa0\xbeoyx\x09\x99\xe7\xf4\
-1\xcb\xe0\xb1\xf2\xa4\xd8-l\xdc\x83\x9de\xdf\xee\x14\
-a\x08j:\xd4J\x13\x15\xd3\xc2\xb9\x05D\xc2\xac\x10\
-\xa5\xbb{\xa9\x95\xca\xc8\xe9\xbe\xb2\x13J\xddkm)\
-\x8a\x13\x81\xca\xd2s@)\xd0\xa9\xba\xc3\xb0\x04\x1c\xd2\
-\x0c \xc5s\xb5\x9d\x0cE\x85\xe6\x02\xd5\xeb\xd3\xb2)\
-\xa8\xaaL\xc6\xde\x0e\xb4\xb5\xf7^y\xed\xf3\xa1?\x5c\
-(L\x94\xc5\xc2\x14l\xd5\xbb\x9d\xa6}\x1e\xff0\x85\
-\xff\xb4\x80\xbf\xe6\xa6<\xda\xeai\x80\xbe~g\xeb\xf9\
-\xcc\x88\xeeg\xd1J\x9b\xb9n\x82\xac%\x22y\x1c\xcf\
-\xbf\xb6\xe0\xe6\x95\xf8|\xc7\xa0&\x87a\x18\xb3\xed\xcd\
-\x18\xc2\xba\x0bd[\x9c\xea\xe4\xb1\x84\xa6\x85t\x5c\xf6\
-U\x9d\xa3\xec\x0c\xe8\x91\xd8\xdf\xc4mU;\xccJP\
-%\xe1\x1d\x9d'\xec\xff\xc0\x9e\x1a\xf0GN\xe4\xf1\xa3\
-d\x98=l\x01\xbc\xca\xbd\xb6P9\xedx\xca\x07\xe8\
-*\x18\x09s\x81%5\xd6\xbdwN\xfd$\x94E*\
-\x0e\xbc\xf8\x03J\x02|=\xec\x1f\xbai\xb0\x0cB\xba\
-\xcfQuO8\xec\xed\x808n\x90\xbdU\x09\xd4M\
-o\xb4\xf9\xe2\x80\x0e!\x02\x03\xd0\x02+\xbd\xfa\x19~\
-{\xb9W4\xfb4>\xc9\x9c\xf1\x16+\xa9\x03\xec\xa5\
-\x7f\xcc|\xed1\xf7\xf1\x11\x9b1\xd9\xadd\xafi\x82\
-\xe2\x0d,\xc0\x9f\xc8\x9a\xd4=\x05\xd1'F\xb3\x03\x83\
-%\x92\x8d\x1d\x22\xb5\xbd\xb7\x11\xa5v3[Y\xd5w\
-q\xe4){+^\xf5\xcf\xac<:\x04\xb7*V\xa4\
-\x8f\xf6\x93\x86\x12H=G\xa4\xc5!I\xa4\x92A\xfd\
-\xfd\x00\x8c\xb4\x10\xb4\xbaz\x87\x88&1+\xed\x82\xd1\
-\xc0\xa9\x07uP\xae\xbbO\x00\x9e:\x07\xf3\xdd\x12}\
-\xae\x16X\xb8\x0d\x03KUj\xa6?\xb3a\x04\xe5\xed\
-Y\x90\xcd$r\xf0\x00N0\xda\xff\xe4\xacwU\x03\
-\x5ck\xe6z\xda\xadr]D\x19\xaf\xb0\xfaQ\x05\x9e\
-\x84\x0d1\xd7-?\x86^9d\x22\xff\xa2'F\xa8\
-2U\xd1\xa5\x82\xfe\x1e\xbd{F\x07\x80\x9e`\x0a\xe0\
-94\xd4\xe7(X\x97!\x99\x00\xacU\x98\xa28\x9d\
-\x17\x83\x0a\x08\xb7\x99\x05MF\xe9\xf3_\xadO\xdb\x22\
-\xd1\xc04\xdc\xe8\x93;R\x9dO\x08V\xec\x04\x8bJ\
-\x17\x91\xe9\xfcZ\x8c\xe9\xadG\x9a\xb1\xa6\xc62$\x10\
-y\xd9>|\xe7\xbc\xb3\x92\xfa\xd8\xbb\xea\x8a\x90^\x94\
-u\xd8\xd9\xff\xf9\x15\xa9-\x19i\x95\xe5\x95/\xfd\xfa\
-Z\xf8\x93]\xd3`\xcc\xc5\xdb\xaf\xa2\xab\xfeVM\xbb\
-\xc9\xf7\x16\xaa\xd1\x82\xfd\x8b\x05j\xe1\xc8\x12\x0d\xc6 \
-\x95\xe8\xae\xcc\xce=.\x81jp\xd6\x0e=\x8d\xec\xcb\
-\x8e\xe6\xfae\xa8\xa9\x0b\x0f\x02\x85w\x84\xc6\x11\xb5\xa6\
-\x1d\x8a\xe3\x0d\x1a\xefsaL[\xab\x8f\x0b\x0f\xa6@\
-./\x09\x88|\xf7Q\xcf\xca\x86m\x12\xb2_S\x0a\
-J\xc5\xea\xf7\xddK\xcb\xf2C\xa6^\xc7\xbew\xbd\x92\
-\x83\x07\x5c\x1d\xd7-\xd2\x10\x84\x06)\xc1r\xe0\x9f!\
-\xc5\xe3\xfa\x9d\x8e\xd8\xa32\x9e\xcaF\xd0g\xad\x00P\
-|\x7f\x22;\xd3\xa6\xe9gL\x12\xcelO\x03\x1dr\
-\xbe\xa8\x0b\xaf\xe0\x9f\xa7\xe4\xb3\xe5\x1c\x1a\xacI}\x1d\
-\xaf\x19\xb1\x89\x8e \x8b\xd2\x0a,MxL\xf3\x9a\xbf\
-\x19\x04\xc3\x0e,,T\xb5$t\xe0\x7f'\x0b\x82.\
-\xef\xe6lB\xebU\x9a\xb5\x18\x8a\xa9G\xaa,T\xb2\
-g\x17;>\xbb\x9b\x16\x15\xc4\x0c\x88Q&\xf1\x1b1\
-\xdb\x99\x9b\xb7KK`=+\xcc\x9c\x99K\x18\x12\x8c\
-\xa6t\xa09*\x09nOK\xa1%Iq\x0c\xbb\xb1\
-f\xf8\xd3\x15\xf0\x0e\x00\xb2\xc6\xbf\x8c\x87\x0c\x9db\xaa\
-\xff\x14'\xfc-~j'\xf9\xfd!\xaf\x02\x06\xafq\
-g\xe4<\xa7!a\xfa=\xa2\xe7\xcb\x9e\x18\xb1+\xe8\
-$]\xd0\x9f\xa3\xb5Z\xde]\x09\x85\x9eCN\x93\xca\
-\x07*\xbb\xd5\xab\x01G\x996\xe5'S\xccKA\xe4\
-\xc5\xa0l\xa5;\xd44\xba\x9b\xc1i\xa9\xd7Ae\xf2\
-\xc8\xc0\x90\xc7\x92\x14\xd0 C\x06\x8a\x08e\xa7\xc3S\
-\x80\x0fb\x87\xffi;Z\x85\x164\x07\x1d\xff\xc9\xaf\
-v>\x8eB'\xc8\xf6&:d.\xcc\xf6\x98\xb0\x99\
-c\xb8\xf9\xfb\x12\xb6\x0e?x\xaf\x1c\xc2\xa5\xb1\x01\x1f\
-\xa8\xb4i\x92\x85\xa6\xc5\x22\x0c\xde\x22\x05\xe5v\x15?\
-\xdf\xf3\x11n\xf1\x9e\x90\xd7\xe6\xe1\xc9\x00W\xf4\x92\xfe\
-\xb66\x12\xce/\xf8\xa0!\xf4\x0a\x8dg\x0dX\xfb\x89\
-z\x9b\x01\xa0\x0c8\x9a<\xd3\xb0\xc0!\x87\xc3\xf9\x81\
-\x14\x0e\xb4\x0b\xe6J&:89\x8e\xdc\xb6f\xf6,\
-\xd56c\x22\xe8@p\xd88\xda\x1b\xe3\xf3\xd1\x05l\
-\xaf,,r\x8f\xae\x8fJ\xf2\xcdf\x89\x8dK\x0cb\
-\x95\xc8!\x9b\x87\xa7\xb7\xa9\x8e\xb2\x97\x08\xfe\xcf\xf6%\
-\xb9b\x80\x00\x00ANMF\x86\x08\x00\x00\x0a\x00\x00\
-\x0a\x00\x00\x93\x00\x00\x9f\x00\x00\x1e\x00\x00\x02ALP\
-H\xb4\x01\x00\x00\x01\x0f0\xff\x11\x11\x82n$[u\
-EkQ2\xb8\x7f\x85@&\x8f\xd0Dh\x0aE!\
-`b\xa84\x06{oT\xe7X\xcf\x8b\xe8\xff\x04\xc8\
-\xed\xb0k\xf1\x04H\x0b\xf7Tb\x0d3\x85\xba\x95C\
-\xb7U#\x0d7\x05./\x07\x86W\x02\x8fwx\x8d\
-\xa0wF6\xa7GvgD\x8a\xf3D\x0e\x87\xb0u\
-\xc6\x92q\xc5\xb2\xd1c\xbb1b\xc5\xb8c\xd5x\xa6\
-*\x8d\xe90\x98\x93\xd4&\xa66UI\x1aS\x92t\
-Ny:\xa7M\xd25\xa5IS\x96\xd4\x81*\xf3\x06\
-vI\x03\xd8\xad\x0e\x14I7\x90\xad\x13\xa8\x92\x1e \
-Y\x0d8\xacC\xeec\x01\xd5\x1b\x80\xd4\x80\xe2u \
-\xe9\x04\xb2w\x01\x9b\xb1y\xa7q\x01\xc9k@V\x07\
-\x14|`\x9f\x8e\xc8=\x0d\xa8\x91\x01Y7\x94H\x87\
-4\xed\x0b\xd2\x039rQ\x8d-r\xb2K@\x8a4\
-\xf2\x9aHj\x80b\x9a\x8e\xd8\x7f\xd2\x095\xf6\xe7\x0d\
-\x19e\xe9zi_\xea\x90?d[\x1a/\xa5/\xb9\
-A_\xf2p|O\xfd\x16>\xa6\xfc\xdfP\xd7\x9eo\
-:>\xe2\xfe\x18\xbee@\xfa\x90m\xa9\xbf\x94?\xe1\
-\x82\xfd\x13N(o\xd4Ohp\xbc\xc1\x92\xdeJK\
-\x0flo\xe4\xa5\x1b\xf6\xa5\xf1RY\xeaP\xdf8\x96\
-.`\xe9\x04\xb67\xf2J\x03\xf6\x15\x01e\xe9\x81\xe3\
-\x0d\x9c\x96\xac\x1b\xd8\xac\xd3\x19\xc0n\xf5\xcd\xea@\xb5\
-\xeel]\x00\x16\xce9m\xd3\xc5n\xb5\xa9L\xb7\xa7\
-\x89$5(\xce3\x15i@u\xee\x89\x02\x91a\x98\
-\x87\xd3#8\xd7\x1b-\x94,\x856\xe7ycD\xb2\
-\xd3\xdf8#\x9b\xa3H\xf2\x1e\xef\x90?\xbc\x12\xb8\xbc\
-\x1ch^\x0a\xe8\xb6\x0eE/k\x0f5+\x854\xa6\
-\xaax\x9b\xb6\x05u(\xb2\x01VP8 \xb2\x06\x00\
-\x00\x90'\x00\x9d\x01*\x94\x00\xa0\x00>\x91@\x9bG\
-\xa5\xa4\x22\xa1.\x17Jh\xb0\x12\x09in\xe0\xc0\x94\
-f\x118\xc3\xfbgh\x7f\xddyP\xe4\xe9J\xbe \
-w\xb7\xb5\x87\x7f>\xcd\x00\x01\xf9\x7f\xf5\xde%8\xd4\
-\xfe\xbf\xe0\x0d\xf6\x0f\xf3\xfe\xc0\x1f\xc6\xbd\x13\xff\x8f\xff\
-\x93\xe4\xe3\xf2\x8f\xf1\x7f\xf7}\xc1\xbf\x94\xffa\xf4U\
-\xf5\xeb\xfb)\xec'\xfa{\xff\xc1\x10\x03\xb3(\xad\x8e\
-\xfc\x09z\xaf]tyU!\x09h\xc2\xb3hw\xce\
-8\xb3\xae\x0b\x0f!\xf9$\xa5F\xdc\xeca\xcd\xac\xfa\
-\x07;6\x95\x14hm\x8f\x92p\xa4\xefd\x80\xa4\x09\
-\x8c\xa8\xb7o\xaf\xe3\xd5^\xdb\xc3gp\xa0\xd6\xae\x5c\
-\xe0\x8b\x14E\xb5\xe8\x97\x98\xeb\x06\xcd\xd5\x85\xb2\x0b_\
-\xff\xc5\xa7m]\xc2\xa1\xf8J\xabr\xf8\xb0\xa8bW\
-\x02\xb2\x8b\xa2\x93\xd3DnX\x1dt\xc2\xf6\x00~\xfe\
-\x8fN\xe7\xd2\x92wm\xb0k\xe1Y\x8b\xc3\x05|\xad\
-%c\xbab\xc2\x9e8\xdaQ\xbbS\xa0A~\x0d\xc9\
-\x1fuK\x93\xab\x99\x8d\x12J\xdf\xba\x00\xb4\xf6\x0a\x1c\
-\x8e\xe4]\xfefQ\x06\xe9AG\xe9\x01=\xaa\xe9\xc8\
-\xda\xe2\xe1\xae(\xff\x95j7't\x8a\xc2\x11'i\
-$u\x85_n\x1c\xfe\x95?\x93\xc7\x03P\x0a\xa7\xdc\
-\xcb\x86M\xca\xda\x10\x00\xfe\xcd\x0c#\xe9\x95R\xd9\x1e\
-\x9a\xab\x8fT\xd6\x84\x1c]\xf3Hl#\xa1c\x0e^\
-\xea\xa8\xf7\x18\xc6\xdb\x08\xd4\xb2Fb\x8azd\xb8\xbb\
-\xe8$\x14\x8b\x8f\xe7\x0f0QU\x87b?C\xa1\xff\
-t\xe2\xb6=\x8d\xcbd\x0f\xdb\x1a\xbe'\x89\xf9&\xe7\
-\xed\x83\xad\xfe\x1d\xe9XG9t\xe2T\x05\xc5\x91(\
-\x93Q\x8d\xfb Wi\x91\xee\x95\xc3\x95\xc2\xd3\x1fX\
-\xd6x\xe0j\x1a\xa0\xec\xf0`\x84\xbe\xa6\xe6WV\xc2\
-\xde\x90\x09\x22P\x16\xfa\xf4\xdf\xd1+\xbf@l\x86<\
-ci;\x8c\xac\xa9Ae\xaaV\x92\xd9\xebX\xd6\xed\
-G/b\x88\x97\xca\xa2\xda\x91j\xf0r\xcb9y\x01\
-(\xdaT\x94\x12\xa6\x08\xea/u\xc5\xe4\x91\xd0g\x0b\
-IT\xf7\xacY\x85#s\xb1\x8d\x91\x0b2]\x1e1\
-\xd0\xc3\x19\xb4}\x19\x92\xab/\x0b~\xedm\x18\xff\x18\
-r\x9c^\x88\xd0\xc0\xcfz\x14\x10s\xc6\x14\xe2\xe7R\
-\xc4r\xbb\x1e\xd71\x1b7b\xa0S\xf1\xda\xa4cS\
-\x80\x9b\xde\x08&\xe6X\xde-\x84\xee\x01\xa5;%\xf0\
-;p\x1c\x0b\x04\x9d\x83\xd4\xef\x0a\xa6\xf0\x95\xe2\x82\xac\
-\xb35\xff\xaa\x9c\x0d\x9a\x8f Q\xa7\xd7bs\x8d\xb3\
-\xeb\xb4\xd4\x01>\xe7\x01\xd4GZp\x5c\x1d\xfbj;\
-\xc4$\x88aS\xf2\x9e\xed\x13\xb1b\xa1\xa5\x92\xe8\x11\
-\x8e\xf8\x88\xf0\xf0X\xfah\xb5\x0b\xc9&\x80y\xcc3\
-\xdd\xc8\xbfj~\xec\xef\x9e\xae\x08\xdf\x0d\x8a\xe9\xfc\xbc\
-\xa7\xc8\x96|\xc2~\xbb\x89\x03\x8b\xc8u\x97\xa6\xfe\xaa\
-\xfe\x9c|8vkURe\x1d\xde\xb8/l\x1d\x14\
-H*Le\xee\xe5\xf2\xd5\x91\x926\xae,\xd1\xe4:\
-\x9e\xa4,x\x85\xe0\xa0\x1a\x90\xf9\xb8\xbd\xf8M\x16\xb7\
-\xdf\xd7\x0a=E\xf6\x82E\xf2\x9e`\xb1\xb9PP\x1d\
-\xae=\xaf\xea{k\xb8 \xed\x8c\xa2U\x17\xa3\x003\
-\xe1=b\xed\x1a\x86\x5c#\x99oR\xa9'\xa9\x0d\x8e\
-J6S\xe9LB\xa5\x9d\xa3\xc7\x80Yzw\xa6L\
-\x86\xbdk5\xc1\x80\x17\xbe\x99-\x11\xb9}'\xa9J\
-<A\x11\x96\xa4\xe7\x95\x00#\xac\xc1\x8bzJ\x85\x12\
-\x82!nRK.\xadw\xfaI4%d[\xc0\xf0\
-5\x8e\xc7\xa2\xd5Z\x12\x81\xd6\xc6\x06\xb1\xbd0\xab\xc0\
-\xf0\xafQ\xd7\xcd\xf7\x9b\x85\x5c\x80\x03\x9c\xad\xf6e\xed\
-r\x87\x7f\x0bUw/\xad\xfe\xd07V\xba\x96y\xc1\
-\xf6}\xd1\xec4\x08\x22Bh\xe9\xf7`\xfe\xc7\x90\xa6\
-\x8aR\x98\xe6B\xd0\x90\xa2\x9c,\xef\x88\xa3\xb07Z\
-\x03}\xd7\xea\xd7Ct\xe6\x07\xa0\xe8\xec\xf8T\x8a\xe5\
-\x81\x86\xe3\xearJp\xf7\x03cI{\xf3\x15\xba\xc0\
-?\x94]pz\x8b\x7f\x8e~\xa5u\xadn\xcbk\xe9\
-\xee\xf3\xd9\x86I\xdf\xb2z&\xb0\x15\xb8C8\xcf\xbf\
-\xff#\xdf\xa7M\x83]^\x00\xbcrm$\xbftv\
-\x0a:\xf8gW?\x9fU\xc8\x0e\xe1\xf8\xd1\xc0\x89\xac\
-U\x83\x12\x11\xe2\xf9\xc6\xb6\x80\x1dUrI\xd0W\xe0\
-f\xd6\xad\xdb\x0c\xd7\xa0f@\xd23\xeb/\xc2~q\
--\xcbO\x02\xe7\x08\x8f\x1e]\xd1s\x0b\xbb\xb8\x02X\
-\xc0\xf6\xfbwW\xc9b\xa5\x08\x8f\xc1\xe0 \x80\x07\xaf\
-\xc9\xdf\xa4\xa0Om\xef\xd4_\xe3R\xf7\xfd\xf6\xf0n\
-P\x87\xe5\xb1\xdb^\x9a\x1f7\x9c\x1d#O\xc2\xd6H\
-qY\x0d,\xad\xaf\xfdB\x18\x03\x12Wc<}}\
-)\xfeHayG\x90\x0e\xb1\xd8\x9f{\x88\xd4[\xf1\
-\xf12q\x90\x03\x84`\xd1j^\xa8\xc7L\xcc;t\
-W9>\xe9D\x16:\x0cj\x03YF\x91\xd6[\xf1\
-K\xe2\xd5\xb1\xb1\x1a\xee&\xf3\x10\xc5Y%\xe2yK\
-\xberV!\xe1\x01H\x96'\xd8\x17^\xb1\xc62\xa4\
-\xc6\xc3\xf3\xbbZ\xa5\x99\x1f\x02J\xf1(\xc8\x84A\xc3\
-,\xa8\x0b\xcc\xe9\x92\x8bzfg\xbd\x01Gf\xcb0\
-\xf9<\xce.\x0f\x5c>\xd5\xf8p\x840\xc3\xc3B\xa5\
-\xa3\xf5y\x92\xf4\xe1\xad\xf8\xf2%\xd2>\x923\x5cW\
-v>\xd3\xfd\xce\xa0R<\x8b\x00\x14\x80\xd3\x9cu\x17\
-\x94\x8e\x88\x15\xb3=\x8fe\xc0\xe4\xfd\x13@b-\x18\
-Q']y\x90>\xe8?\xb3\x8b(\x85\xc9]\xed\xf6\
-\x84\xba\x10kT\xbe\x1c\xc6^n\xa3\x1c\xb6\x8a\x05\x8b\
-\xf9y#\xcc\xab\xf3\xffI\x1fgT\xb9\xb6\xf4,x\
-\xe3\x19-\xcd\xa0\xb1\xf0\xdc\x84\x0b\x1be\xdci,\xdb\
-\x22\xee\xf6\x99b\x9a\x8b\x14\xebb\xf8c$\x90a\x97\
-yXP\x16\xb4::\xb2\xbf\xaa.B\xeb\x8d3\xbe\
-\xf7\xfe\xd2*\xd7\xc1e\xbf+\x09g\x05r\xcb]\xd2\
-\x5cCD\xf7\x97\xb6\x08\xd2\x0aD\x16\xa3JC\x0f\xca\
-\xb2\xef\x9aC?\xac\x82\xed'\xb2\xe1\xa0\x1f\x8a?\x96\
-\x0fw\xe6H\xd6\x05\x8f\xa8\x19O\xfeH!\x05)\x14\
-4\xbf\xc6\x84\x95`\x9d\xceT=\xbfd\xd1\xdf\xf2~\
-\x224\xc8e\x19\xeeT\xde\xf9\x9b\x8f\xf1\xa2B\xf2U\
-\xa1~hJ\x88J\xe5\xfc\x0b\xa9\x9c\x8cd\xfa\xe9\xd3\
-\xdc\xb4\xc9\x83\xd9\x5c\x8a\x92c\x07\xc9K((\xbd\xa9\
-\xa0\xfb\xd7\x13\x8cU\xf3\xb3j\x98\x91\x13\x22x\x91\xe1\
-\xb0\xba\xe0\x14\xadbz\xe3\x8d6\xe7\xafhG\xf5\x8c\
-\xbb\xbe\xb9)A\xae\xbe\xa3K\x8d\x04\xfe(\x16\xd1D\
-L\x95\x8d$\xae\xfa\x8f\xa4fB\xa9a\xa9|WL\
-%\x0ale\xf8\xbf\x09/0\xfa\xddS\xe5\xbb\xc6k\
-4\xd5\x18<\x90r}^\x01\x12}G}\xa5\xa9\xa7\
-j\xe3\x8a\xf2J~\xec\xf4[\xf4q{\xd1\x85\xd5\xda\
-Ev\xd4\x1f\x80:'\xf6\x92\xda\x17\xc2S`\x1c\xf9\
-b\xc5\xd9\xa2\x82\x81\xcafp6\x09s\xac\xe9\xebO\
-\x95\xf0\xd3\xdaX\x0d\x80s\xb3\xd4\xb6\xff\xb0Q\x05\x12\
-\x80\x00\x00ANMFZ\x08\x00\x00\x0a\x00\x00\x0a\x00\
-\x00\x98\x00\x00\x9f\x00\x00\x1e\x00\x00\x02ALPH\xa8\
-\x01\x00\x00\x01\x0f0\xff\x11\x11\xc2mm\xdb\x80\xf5,\
-\x81P\x09JQ\x9a)M)S\x82P`9\xc1\xe3\
-\xb1\xe6G?\x8b\xe8\xff\x04\xc8\xb6A\x94\xd3\x0a\xe0N\
-\x86J\x07\x0f\xcb\x83\xb6\x8a\xb6\xb1\xca\xa6\x87\xad\xe9\xdd\
-\x05K\xdf%\xcb\xdce\xc3\x83\xd1P-~\xd7,q\
-\xd7-i7-e\x87ySmn\xf5\xda\xc2\xaa\xd9\
-\xe2\xaa\xdb\xd2j\xd8\xf2j\xaa,\xd2UY\xa1\x9d\x88\
-(\x16\x8f\xca\x22\x22]9UUPUy\xf5*\xa7\
-D\x05\xd5\x80,\xcb\x01D\xd5\x81\xb8j@R\x03\x08\
-\xab\x0ad5\x01\xb7\x12\xa0l\x8al\xe7\x06\xc8\xbb\x0e\
-\x88\xc8\x03\xc4]\x03\x9cH\x05\xc2\xee\x05\xfc\xca\xef\xea\
-\xea\x05\xdcN\x80 \xd2\x001N\x88\x8bb\x19\x8b\x0e\
-\xd9\xd2!\x89\x0cH\x96\xb6\x8b\x07YdB\xb0\xbcP\
-\x16\xdeR\x17\x80\xb3<\xc0B\xcc\xea\xb9\xe1\x1e(\xb6\
-\x09\xaeB\xb6\x0d\x8a\xdcH*\xd9:A\xde\xa3\x86\xa8\
-x\x90E\x1a\x04\xdb\x1b\xaf\xf8\x85\xb7U\x11\xe9G\xfa\
-\x9a\xfb\xc6\x00\xf9\xa5ra~(\xff\x10\x1fJ\x7f\x91\
-|a\xfeX\xf9\xc8\xf8\x10\x1f\xe9\xe0~\xca\x9f\xb5[\
-\xe1\x1b/\xc4oTHW\xf27\x1e(W8\x93k\
-\xeel\x82\xbf\x12\xce\xc6\xadx\xd6!\x9d5\xc8W\xca\
-\xd9\x0b\x9cU\xc0_\x09G\x0f\x10\x8f\x04Hg\x13\xca\
-\x15\xce\x06\xe0\x8f:\x10\x8f\x1a\x90\x8f^\x80\x95\xdfU\
-\xe5\xd5\x1bv\x8fJj\x18D!\x22\x0f\xd10U\x12\
-\xe9\xa6\xa1(\x03\x92\xa1/\xb4\xa5]y\x0d\xd9\xf0\x5c\
-\x11C\xb1\xcc+}\x87\xa5]\xa9\x06g\x90;s\xe7\
--\xfd\xca{Ev\xce4VE\xccm\x15m\xb2r\
-\x07]e9|\x94?\x91\x06I\xb6VP8 \x92\
-\x06\x00\x00\xb0&\x00\x9d\x01*\x99\x00\xa0\x00>\x91<\
-\x96G\xa5\xa3\xa2!27\xd8`\xb0\x12\x09in\xe0\
-\xc0\x00e\xf4\xdc?\xa4\x1f\xe2{?\xff\x05\xcb\x1c\xfd\
-\xae\xdd\xf8\xa1\xe4\x0b\xc4h\xa0v \xd8\xcf@/d\
-\xbe\xc9\xc4'\x1a?\xcf\xbc\x18|\x97\xd8\x03\xf9?\xa2\
-\xaf\xf1\xbf\xf2?\xd0\xf9\xc7\xfc\x9b\xfcw\xb0'\xf2\xff\
-\xeb\x9e\x91\xbe\xc0?U}\x82\x7fY\xbf\xf8\x9c\x84w\
-%\xe0\xb7\xf3\xd2q\x87\x93\xeac\x14\xa5\x07a\x8ba\
-\x89\x8c\xad\x119\xb1\xba\xb0\xb0d\xef\x95\xfb\x9c\x00\xa6\
-\xabF\x9fq\xf7:\x9d)\x13\xa7\x1c\x0c\xce\x08\x09\x11\
-\xcfqe\xd2\xc7\x0b\xad\x94\x99q\xeb\x86\x01\xa1\x05\xfc\
-\x16tE\xe3\x86L\xa9\x96W\xcd\xec\xcd\xca\xc1o\xa7\
-\xee\x80\x130\xe40\x82\xa1@.\x8b\xd4\xf5S\x86v\
-\xd5\xdc\xf5\xc4\x0d\xff\xe6\xda`\x91G|\xa1\xfa\x5cu\
-\x04\xf6\x99\xdd\xab\xc4\x9c\x926T\x7f5eO\xc5\xd9\
-K\xd7\x98\xb2Qh\xd6\x0f\xe8\xbd\x8b>\xa4\x16U\x8d\
-\xb4\x01\xa0\x99Y`\xb1~v\x8eX\x91\x89\xcbl\x9d\
-\xe6jt\xcdBt\xa1\x92q\xa9\xf6\xe8\xa4|\xa0\xec\
-c\x99\xe9\x1a\x0e\xb2K\xbf\xd3=\xf16\xcc?\xb9?\
-\xde\xadacv5\xd8\xddT(\x99\xb6\x01\xe7?\xcb\
-`\x00\xfe\xb8\xfb\xdf\xbai#x\xd7\x93\xe9\xbf1i\
-R\xd2\x19\x93\xeb\xf5\xab\xfa\x03\xbdH.:\x83\x7f\x0a\
-\xe2ab8\xac\x15Jc\xaa\xdd\x01N\xbfZ\xef\xe6\
-\xcb\x88\xb7\xab\xafq\xad\x18\xed\xb03\xdd\xd1\xc1\xa9+\
-\xb5M,\xc4\x06cJ\x90c\xf5E\xe6$|\x0a\x1b\
-\xe7\x8b\xfdZ\x0b\x8f|Q\xbc\x92\x00\x04w\x15\xdb@\
-\x82\xe2\xea\xda\xe722\x13\x13\x9f\x89\xdf\xdf\xd3\x5c\xda\
-\xad\xdbJ\xeckk\xea:\xe8\x03g$\x06\xf7\xe40\
-2\x10ZL\x5c\x9f\xb5\xb6YZ\x92Y\xd7b\x8cS\
-63_\xd36\x80\x97\xb3r\xea\xefl\xda\x01t\xdd\
-\xc7[UB(\xca7\xc3\x15\x89\x1d\x98\x0c\xb8\x98\x05\
-\x138X\xf1C\xb2@W\xe2\xc6\xf0z$\xa9\x0c\xae\
-\xadt?\xbaH\x8b\x9c\xe93\xc7\x09\xfa\x06V\xb8\xa3\
-W\x9b\xf7-\x7f=\x17\x02y\xc3\xd3k\xbdY\xbft\
-p\xc1\xf6gh\x8f\xd4\xfd-fv\x16\x03\xc1\x83\xa3\
-\x82h\xd0\x82\x11=\xdddK\x1c\x05\xa2\xe7\x8d\x9b\xcb\
-\x8b\xc0\xf9![\x1dJAp\xea\xc4\x0a3bKA\
-\x14\xc6J\x0fe\x95!\x1f[\xae\xf1\xa8S\xf8\x8d\x18\
-\x18\x90\xe4\x8e\xf3\x84\xf5\x19A\x18\xb6[\x9eB\xc6\xe6\
-\x95\xf5\xb1\x01\xf8\xd8\x0d=N$\x8cc\xf0y\x11\xca\
-\x14\xfa\xe0Vk|D\xe9\xc9Y\x94(~\x1c\x12K\
-L\x08%-RI\x05+\x00`\xc3|\x22R\xe8\x84\
-\xbc\xbf\x8b\xe8Q\xc9E\x81\xae\xf90s\xe7\xdd\xa3q\
-'\x12\x0b\xee\xe8=\xf1\x84N\x8aJ\xb9\xf2\x01kZ\
-\x14\xbai\xbc!\x15\x17<\x15<\x94T\xbbN\x949\
-lE\x0fzZK\x8a?X\xbd\x97\xe5\x0f\x85\xe9C\
-y\xed\xfe\xcaA( \x0b\xbc\x09]oA\xa3\xe0\x97\
-\xc7V-;m\x1a\xbb\xff\xb0\x90\x84c\x09g\x83\x1d\
-\xd6Q\xf5e\x1c\xf2\xabM\xf4\xe2\xce\xffL>\xa1#\
-[\xa5\xa3\x91FA\x98t\x1c\x8e\xbb\xcc\x1c\x9c\x8cO\
-x'\x99\xe9[9\x091_\x12l\x1e&\xd9\xb8&\
-\xce\x05\xa7\xf5i\xb4>\x0c\x224\x81\xca\x06\xdf<\x82\
-n\x22\x95\xa9\x99\x0a\xbd2\x18\xe2q\x091n\xb8\xf1\
-y\xaeu\xab\x99d\xad5\x85\xd8\xb8T\xdf\xf3\x9a\xf6\
-v\x81\xa5)\xf1\x1bg\x0cg\xc2\xdcX\x0a\x95{\xea\
-\xcc\xb0\xbd\x0e\x19\x1c\xbc\xb2\x03\xef\xb9k\xa6\xa3\xa4\x18\
-\xe5mM\xe6\x80\xc5.z\x7f\xe2\xeb}\xb2|\xf5\x8e\
-T\xd08\x04\x98wG)\x13\x9f\x9a-\xde\x05\xed\xf5\
-&\xe2\xe8\x17\xa6\xed\xd3'\x85\xf6q\xcc\xa0F\xf9\xb4\
-\x89\xb7+\x1e~\xb6\xee2\xbf\xd7\x91\xcc~\xf7+\x82\
-\xba\xe2\x9b\x0b\xb5e\xbf\xec\x04\xea\xa4\xd9\x86\xb1\xa1\x1e\
-!\xc5y\xcdE\xfe\xc7(\xd5?\xaf\xa2=\x06\xf5\xd5\
-\x1e\xc5*\xbdS>\x9b\x8b\xf5U\xe8\x01\xd3\xf4-y\
-\xef\xbf\xf7\xad\x8e\xd8\xa1\xfe\xbe\xefR\xa5\x91J\x061\
-$1\xc0\xae\xbd\x9cS{[\xca\xae\x9biM\x97R\
-\x1e`\x9e,\xa6\x05>K\xfc*(\x80\x93\x05\x07\xbb\
-\x22\xc1\xc4\x8a/?\xf2q0(\x10lr\x87d\xd1\
-\x89]G\x02\xc4\x1c\x7f\xd0\x028\xf6Li\xde6B\
-uF\x94\xb6\xb7\x9f\x05aU\x8b\x87\xf0Z\xc0kx\
-k5\x97g)\xa8\xd0\x04\x92\xfe\x8f\x06'\xc4/k\
-\xe0G\xbecb\xed\xa4O\xc6o\x98\x13\xd3\xa5\x9c\xfc\
-g\xe2\x1c\xf0(V\x1e\xbcL\xdb7\x1d\xdf\xf9E\x1e\
-s\xd4\xced\x0e6wz\xdf\xe1i\x02\xe3\xafm\xe3\
-\xadRxG\x91-+GL\xdbKj\xbb\x0bzz\
-\xdf2\x9f\x05R\xd2\x11\xee\xe5\xcc\xf5sm;\x12\x9c\
-\xfb\xd0\xc3\x83\xd5\x03\xac\x9d\xf2\x9d\xa0irk\x8f\xc8\
-\x9b\x98\x18\xe4\x94\xd8K\xac\x98\x19*HA\xdc\xda\xd0\
-\x9a\x0d\x97\xbd\xadS\x80\xeb\x14\x06\x05d\xc2\xf8\xdd\x05\
-\xdb\xdf\xe0c\x9fk\x1a\xcc\xeaIL\xad\xcd\x02\x22R\
-U\x93\xb4I!\xbe\xcd\xd2\xfe\xd5\xed#g{\xfe\xab\
-yv+V\x84\x09\x868\x04d.\x0dz\x84\xd5\x1d\
-K\xa6\xe1\x8e\xe6\xc747\x09\x0a\x9e6\x19\xbd\x9bs\
-\x0a\x86j/'y\x83\x08\xfa(\xce\x03T\xa7dn\
-\x8e\xc0\x00U\xaev\xcc\x81\x0f\x1c\x9ak^\xdf\xc0\x1a\
-\xd6\xc5N\x05UL\x03\xd7\x99\xed\x1d\xb1W\xe54\xdf\
-\xb9\xd1\x0b\x16\xe2\xde\xbf\xa7j\x06g\xb2H\xac\xcdF\
-\xb1\x9c\xe7/\x02\x85f\xd0\x5c\x02@\xe3J\xcc\xa9V\
-z:\xfa\x8e\x0f\xa7\xb8\x5c\x5c\x7f\xee\x18\x05_'f\
-\xc9\x95x\x89\xe8,-\xb2\x0b^V\x97\xd7.\x8d\xa0\
-\xe224\x1d\x02\xf6\xaeOL\x89\xd0\xf4\x1c\xa6\xdd\xf3\
-A;\xd8\x04\xef\xa0\x03[\xca\x96v/\xa6y}\xa9\
-)N\xc0=/p\x0b\xf0\x97\xff3<\x01\xfc\x11X\
-\xd35@h\xf260\xe0\x7f\x03\xca\xb9uu\x96\xac\
-\xf0q!F-v\xf5\xca&\xfa\xec\xb9\x82\xb1\xceQ\
-\xc1\x5cy\xef\xb1 \x11\xe6s\xe4\xfd\x80\xbbprC\
-\xc3k6kd\x94\xe8e\xd3\x03\x10\xbcX\xab\xbf\x80\
-\x1ft\x9cQQg\xe5%\xe2fJq%6YO\
-\xc2\x0c\xcc[.\xd1\x87\xd6 pv\xe3\xa8Isj\
-\x0b\xb7\xc5\x10X\x14\x830n\xf5F\x0e\xaa\x16\xd3\xfc\
-\x0bJ\x0c\x14\x82+\xa0\x5c\xfa\xbd\xff\x8b\xc8a\x22\x95\
-\x9d\xbfR\x22 \xf4g\xec2eC\xe4\xff<es\
-C\xec\x22\x08-A\xb4\x9d\xc6\x16\xde?\xb1\xe7u4\
-\xbf)\xf3\x94\xccy\xedzWFiX\xaa@r<\
-_)=\xbc\x7f\xfb\xe3\x0ch\xd0LD\x0a\xdc\xf0\xf5\
-\x01\xfa\xdb\xd9\x15\x04\xf9&\xa5\x1d\xe0\xe3\xbe\x1dK\x09\
-u@\x00\x00\x00ANMF\x92\x08\x00\x00\x00\x00\x00\
-\x00\x00\x00\xc7\x00\x00\xc7\x00\x00\x1e\x00\x00\x02ALP\
-H\xbd\x01\x00\x00\x01\x0f0\xff\x11\x11\x82nl[\x95\
-\xc5\xe8R\x18\x98\x84\x802!\x15\x85!\x0fB\xa3J\
-\x89\x10\x02\x9e0\xbaz\x1b\x0d\x97\xfbZ\xdf\x19+\xa2\
-\xff\x13 \xff\xf5C1\xba\x80dRy:\x8b\xb9\x88\
-\x16,\x8bA[\xe1\xcf\xe6&\x9e\xdd\x9brT\xd9\xbb\
-\x93\xae\x08'S\x11O.E>A{PUN\xd7\
-UA7TQ7UIw\xab\x8a\x0e\xbd\xaa\x1e8\
-M[\xfdXyM_x\xa9\x8b\xa0\x19\x8f$\x22\xf3\
-\x115\xf3\xe1E\xa4>\x92\xe6\x02\x8a</ kn\
- .\x06P4\x00~\xd1\x00\x14\xf5!\xeb\x87\xdb5\
-\xa0l.\xc0\xef:\x906\x03\x08\xbb\x01\x84M?\xf3\
-\x9b\x06\xc4\xdd\x04\xdcF\x80\xb4\xbb\xa0\xc8\xfe\x86\xac\xca\
-\x8aKuCRL(; *:\xa0\x0a\x8a\xa6\xa9\
-\x80WT\xc0\xad\x1a\xe0\x14r\x22\xda\x1b\xfc\xaaC9\
-\x09\x8a\xac\xba\x14\x03\x92jBTD\xd5P\xcc\x93\x0e\
-I\x11\x8c.\xf0\xaa\x06\xf9\x0dNU\x15\xf7\x89@Q\
-\x88\x11\x94\x83\x1b^\x90\x0f\xaeM}\xd1\xa4\xec\xd2Q\
-\x5c4\x0b\xb7\x8b\x07#\x8b\x997\xfb*\x8ap\xb0\xef\
-?\x87\xffe\x8c\x8f\xb8\xffIx\xa3\xfe\x8b\x09\xbf\x8c\
-\xf6\x91\xf8\xb6\x0a\xe9W\x92\x8d\xe4#\xe5u7\xbc\xee\
-\x02g\xe7\xdf6!\xbcm@\xb4KF\x1d\xb2]1\
-j\x1f\xc1\xa8\x02\xceF\x00o\x17\x8cnHF\x17d\
-\xbbb4\x01\xa3\x01x\x9b\x0e\x04\xbbh\xd3\x80lS\
-\x01l\xe4\xe1mn \xda\x5c@\xb6\x99\x00\xced<\
-\xa2\x88|;\xea\x0f\x9c\xd4r\xd4\x16|\x87\xa3\xba\xc2\
-@>p\xef\xdc\xd1\xb4\x1bv}\xe7\x8f\xaa\x9d|\xe0\
-\xda\x84\xb3a\xd7\xed\xea&\x9e\xc9m7\xec\xda*\x19\
-\xc8m7\xed\xea\xc2[\xc8\x04\xb2\xd8\x02b\xfdE\xfe\
-+\x07\x00VP8 \xb4\x06\x00\x00P.\x00\x9d\x01\
-*\xc8\x00\xc8\x00>\x91D\x9eI%\xa4#!*v\
-\xf90\xb0\x12\x09in\xfc|\x997\xe7T\xc7\xfd\x16\
-\xfe\xcb\xda\x17\xf8\x8bO^\xd5\xdf/\xe2\x92g\xae5\
-\xbd#\xd1?\xed\x9e\x00\xdeG\xec\x01\xe4\xad\xfd\x0f\xfd\
-\x7f(?\x95\x7f\x93\xff\xb7\xee\x0b\xfc\x9f\xfb\x1f\xa5\x17\
-\xad\xef\xda/`\xcf\xd4o\xff\xe6\x0f\xb9\xd9\xd7\xb1\xb6\
-\xe7g:%<\xabdi\xa0\xb0P\xb3\x8f\xe9\xd1\xd9\
-c\x9c\xf7\x1cd\x88\xc3\xa1\xc0k,\xda\xef\xeds\xc4\
-\x12\xe5\x81i\xcb\x975\x80+\x83W\xe4\xfa\xccjw\
-~Lf\x81\xe1\x98\xbc\xc0V\xbb\xae\xcf\x13\xect\xe7\
-\xf6\xc6\xf3L.\xb0\x84\x00\xf8w[\xc0\xd4\xaf\xde\x10\
-Ie\x9b\xb4e\xcd{\xafD\xd0\xec\x7f\x93\xd5\x02\x9c\
-t\xaf\xd6\xe8RR8x\xdbli<1\xd9\x9b\xd0\
-\xc7\xbfY6jZ\x9d7\x93\x87\xec\xe3\x81\xe8\x16B\
-;\xa9\xc7s\xb2T\xd5\xb2j\x84\xea\x0cH\xb9\xaed\
-Q\x15\xcdut\x93\x96X\xed\xbb\x14_\xfa\xef\xf6t\
-\xdc\x9d\xb3\xc3\xf9\xd2+\x0e\xe7g^\xc6\xc4h\x8e\x01\
-Y\xda\xe3\xde>p\xd3]\xc4Ad\xcf\xa3\x09\x0e\x0f\
-\xbc\xcb\xbfyy\xc51a\x84E\xec\x81\xb1\xe2\xbcT\
-\xa3\x9d\x22zO\xb5\x9b\x9ed\xcdwx\xe8\xfa\xd9D\
-O\x8f\x0bWmi\xdf\xdd\xfa~\xf1\xc5\x9eX\xa8$\
-\x9eg\xd1\x84\x87c\x14kS\xf1\xa1\x7f}\x0e\xa5\xae\
-\xc7\x08\xf9K\xff\xf7\xe2\x822M\x0c\x91\xcdw\xfe;\
-nvu\xecP\x00\x00\xfe\xffZ\xf0\x0eF\xac'\xbc\
-\xa8wh#\xc7\x9f\xb3\xea\xe1\xf4\xf3\xf3\xcf\xfd\xd4\xc3\
-oJk\xc6\xfcad\xcb\xad\x12\x8eeuV\x0a \
-\xcc\x84\xee\x0d\xd2\x8a\xbe\x96\x03\x93sJ\xff\xa9Q\xb4\
-\xcb\xb7\x00\xfdEE<\x86\x97\xb6`~\xbe\xc5\xb69\
-:\xd5\xa1\x13\x0f\xfc\xefJ\xd5\xec\xc6I\x14W.\x8f\
-C\xcfA\x00\x01\xaat\xf5\x9c.\x8f\xcb\x89%,~\
-Qll\x18\xb4\x81\xb10?\x07\x04I\x8c\x84\x8c\xfd\
-)(.\xcbq\xb5\xe7S\x8c\x0e\xda\xa7\x03@.\x80\
-1\xe7\x00`\x15\x0f\xf4\x16\x15e\x11\xeb@s\xbc\xbb\
-\x93&\xd86\xd7A\xe5\xa3\xd2\xa6\x11\xfd\x83\x221\x16\
-\x84\x04v\xf2\xf1C\x17\x91\xdd\xcc\xde\x03f\x91\xfe\xaf\
-=\x95b\x80\xebe\x8b2\x11\xc4Z\xdf\x1eeo\xa4\
-,\xb4\xb0\x1a\x8e\xda\xa9[\x07\x89\x09\xe7>\x11\x1b\x95\
-\xcbr\x88\xb1[\xdc*(\xe2\x09\xd7\x92\xa3\x03\xb1\x1c\
-:\xae\x0fe\xba\xb6\x86\x97\xd6Q\xcb\xab<yf\x1b\
-!\xed\x94K\xc8\x1d\xf4IqCG\x89\xb4E\xc6<\
-\x17\xde\x84\xefM\xa6\xa0\xe5\x84\x80\xfd\x92\x1e\x80\xc6]\
-R\xba\xe48kl\x94\x84E\x86\xfat\xf0\xe4~\xcb\
-\xd2<\xc1\x93Q\x0e\xa5o\xa3\xb2\xac\x02@\xcc`\x01\
-\x80\xb5\x04\xf7\x99\xc0]\xe1/q0\xf0\xe4\x7f\xe6\xf6\
-\x97\xa8\x1d\x9b\xb8%J\x92\xce\x86*x\xab\xd5\xc0\xad\
-\xb6\xcd_\xba\x0f\xd4\xecm\xf7bPs\xd3\xc37\xa9\
-d\x00\x96,\x1deN\xcf\x0e\xca\x0c\xa2@\xbd\xfa\xaa\
-\xe1P=\xb8\xfc 3\xa1TP\x89-\xba\xfc3{\
-\xea\xb9Z\x03\xe1\xde\xf8\x22H\xd2\x95\x85x\xd5\xd1}\
-G\xcf\x9b\xfc&\x0a\x83\xe4B9\x02\xbb\xee\x0ff\xc1\
-\x12\x18\x98rHG\xdf*y\xacT\x998@\x1f\xc2\
-\xfc\x84\x03\x08-\xa8\xea\xfa\xe2\x1e\x86fIQ\x83\xd6\
-a0\xae'\xc8\x0c\xa0\x91K\xa3w\x98m\xb1\x1c\x16\
-J5\xfb([\xd7~\xd7\x94\xd9\x81\xcc\x16\xc8~\xa5\
-\xa6\x7f\xd6aH\x0a\xd8\xf5\xcdP\xa8y)N\x97C\
-\xc6\xdc7\xdeH\xea\xcav\xaa\x93>\x16\xc6\x9f\xbc\x22\
-\xf9\x96isJ\x0a\xa2F\xfc\xcb\xb8\xc0\xff\x09\x93\xf7\
-\x0e\xc4\xd9\x8bY`\xbe\x0fYe\xf4s&E\xec\xab\
-\xb6w\xe3\xcb\x05\xb4(\x9d\xb8\xa7\xfa\xaf\xa8\xe9#\xf5\
-N\xd0\x0d\x0a\x8f?\x03\xb4t\x9a\xc4\x9e\xfd\x17\xe8I\
-\xc0\x96\xd68\xd7\xf0'\x00\x10)\x99\x8e\xc7\xd9\xc8\xfb\
-\xe3Z\xbe\x8c\xf0W\xe31\xa3\x03\xb0\xc1~\xcd\xda\x09\
-\xa5\xbai\x8f\x1c\xeb\x0c\xc0O\x92\x86\x19GM\xab<\
-\xd0\xb1;\xc3\xcb\xd2\xc9\xb0\xd9w\x141\xcb+6\x93\
-\xfeL\xdb\x15#\xc3\xdf\xa3\x92o\xf5\x8a\x8b]O8\
-F\x95n\xab`\xb8A4}\x88\xe1\xfa\x81\xf5(\xe0\
-Y\x10\x0c\xe1o\x22\xd4\xbc\xcd\x06\xbe\x11@\xc5S9\
-\xa3Ir\xa6\xda\xff\xb4`\xaf\xa5\x81\xa8[\x8c5\xf0\
-.\x88l\x10{\xd2\xca5\x1eU\x83'\x8dO!\x81\
-\x85\xf4\x823\x00[\xd3\x9f\x9f\xcf=\xa2-B6\xff\
-_\xb2G*\x5c\x99g\xb8fzu.]=\xdfQ\
-d\xad1O\x8b\xcd\xf8\x8b\x05_'\x07\x91\xb5\x12C\
-\xbc+\xfcj/~v\x80&\x98\xd1\x8c\xff\x06\x8aI\
-\x90\x0fVdi\xf1\xe9T\x84\xa0<\x14\xbaz>\x1a\
-\xd2\x09O\x14`\x03\xf6\xe7\xf2\xfbC\x06\xd4\xea\x92\xd8\
-\x8b\x9d\x9b\xbb\xe4\x9a\xba\x1e\xb2\x1b\x02;\xce\x1ao\xc6\
-\xdc\xcd\x93Y\xf9@\xda\x1e\x5c\xe53\x92\xdb\xc9d7\
-i\x1e\xf4\xfe\xd5\x07\xb6\xc4\xee\x17\xfb\x04[\xedk\xfb\
-\x9b\xa6YIp\x84\xf3\x0a\xfe\xfdC\xfe\xfbZ\x12W\
-\xdf\x02\x12\x93@\xe5\xc2\xd0\x18K\xa0\x90Un\xa6\xd7\
-\x1b5n\x9d\x97\xad\xebA\x16\xb86\xb6\xd7\x1a\xe0i\
-\xd9\xac\xac\xb4\x82\xd6$\xa7\xaa\xe9\xe2nO\xb1\xd4~\
-\xf1K\x15\xd5G\xf5\xdfz\xd4\xb0\xc7\x05o\x92\xf2\x98\
-\xf3~-}\x17\x14\xf0\xea\xa53\xa9\x1d\x88 \x1d\xd9\
-\xbb)$\x906\xeb\xebj\x05\x1c\xda\x073\xb5\xea\xbb\
-\x1a\xa8\x91L\x192\xd9\xb9\xe0\x00_\x8d\x1b\xce\xb0\xca\
-\xb1<\xec\xfd\xf6\x0cV!{\xed\xc9/\x9aB\xac\x85\
-\xbe\x00\x7f\xe2_\xa9\x5cl\xc6\xab\xea\x99t\xbb\xd7F\
-\xb8\xd9\xc2\xc3\x950y\x09\xacVv\xb11\xe9\xc7o\
-\x87Z\x92\xd7\xbe@v\xd9fC\x1d\x5c%t\xf9O\
-iy\xd8Bi{_A\xfaP\x0d\xc8\x1dr\x5c\x1c\
-u\x0aK\x85\xe3\xf3\x0e\xc9\x90\xe2\xaena\x84\xc3\xc2\
-\x87P\xca\xab\xf3\xacL\xd3\x8eQwr\x93\x9a6\xa3\
-\xde~f\x00\x82S\x1e0\xec\xa7DsI\xc2\x08\x9b\
-\xc3\xd5\xbd=\x0d\x94-\xd7\xe1\xfc\xc9\xb7y\xd6?\xc9\
-\x9c\xa6^\x81#\xd2\x08\x1b8\x11S\x8d\xe8\xf2\x88\xa1\
-\xc7\xa5,\x1bE\x9d\xb1\xd0/r:\xa6\xcaE\xd1\x11\
-\xea\xb3\xd8D\xa9\xab6\x1a\xed\x8d\xb42\x8b\xe2\xf8\xc3\
-\xccpP\xd3\x1d]TkCF\xeb\xfbLo\xb4\xcc\
-\x02?\x06\xb6\x86\x11R\x84\x80\xec\xf5\x02\xb9\x01\xbcj\
-X\xc6\x99k\x9e\xf2\xb3\x8c\xbd\xda\xe7Z|\x01\xc0\xde\
-\x0c\xf5\xf4\x1br\x15\xe0b!\xb3\xe0\xc7\x19\x0fUr\
-\x9f\x94b\x0b \xb9\xdb)t\x16\xf4\x89k\xf10\xb2\
-\x11|CA\x02\x99\xe8k\x8b\x5c\xf3\x07\xd4\x8e\xda\xab\
- m\xbaU\xcc\x96\x97\xf7\x0d\xe0\x82(\x7f\xf1\x09\x80\
-\x8bD\x85{\x9f\x82%\x8e\xfd\x9e\xeb\xd1\xa3\x15\xf5\xb0\
-x\xa0\xfbIO\xa8M\xeaX\xc6\xa0\x00\x00\x00\x00A\
-NMF\x90\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\x9e\x00\x00\
-\xa0\x00\x00\x1e\x00\x00\x02ALPH\xa9\x01\x00\x00\x01\
-\x0f0\xff\x11\x11Bnl[a$}\xaa{\x06\x93\
-\x10\x08\x85\xd0 4\x85\xa2\x1001\xb4\x5c\x03\xf8\xff\
-\x97\xc6Z/\xa2\xff\x13 \xc7\x0eI\xac\x0d X\x9e\
-%\x1b\x1a\xdb\xa0\xeb\xbb\xa8\x9b\xbb\xa2j\x1c\x83\xe6>\
-E\xcd8e\xcd<UEC\xa9\xb84\x9fS\xd7\xa4\
-\xd3\xd0\xe4\xd3\xd4\xd4\x13\xea\xc3\xa5\x0b\xbb[\x17w]\
-\x97vC\x97w\xcf\xee\xdf\xa6\xec\xe6RD\xc6Rw\
-\xacA\xa4-l\xdaRDD\xc6\x12\x96k\x89\xcb\xb5\
-|\x96{\x09\x8b,q\xe9@\x91\xed\x03\xa4e\x00i\
-\xd7\x81\xbc<@\xdc]@Y&\x10v\x0d\xa8\x87*\
-\xc7y\x00\xca\xe9\x01D\xa4\x01\xf9\xd4\x81 r\x01\xf1\
-t\x03\x9f\xdd\xe7t\xedn \x9c\x1a\x10E: \xca\
-\x09iS5\xcff@\xd1\x0c\xc8\x22\x0fdM?%\
-C\x11\x99\x1057\xd4\xcdGsm\x80\xa0i\x80M\
-\x96\x06\x88%4\xa8\xba\x09\xe1\x82\xa2{\xe0\xe3\x96u\
-\x03>\xb7\xa9C\xbc!\xd9:D\xdd\x0d\xc9\xed\xa3\xbb\
- \x0d\x8f< \xe8\xda\x9b\xca\x03b|\xcf\xa4L\xea\
-;\xaaW\xb1<N\xd1\xa3\x08\x0e\xe2!K\xfe/R\
-\x1c\xe6\x1f\xab/y^\xc4K\x06\x84?\xf5\xb1u\xaf\
-\xf8\x8e\x1b\xd2;.\xc8.\xe5\x1d\x0d\xaa\x0b6q\x0b\
-\xb6\x09\x1f\x97h{ \xd9\x86W\xb6u(.\xd5v\
-\x03\xc1t\x01\x1f\x97hj@2\x09\x90m\x13\xaa\x0b\
-\xc1\xf4\x00\x1f\xd3\x00\x92\xa9\x03\xc5t\x03\x98\xae\xe5c\
-iK\xb6\xc8B\xb0\xcc%[\x9e\x852\x93jl@\
-\xd7]n\x97v\xc8*\xf1\x99.\xc3\xa5\xbb\x5c.\xb2\
-+\x86\xe92\x5cn\x97\xe6\x22\xcfR-\xb7Ks\x91\
-\xe1\xd2\x5c\xa4C\xb2\xe9\x01\x00VP8 \xc6\x06\x00\
-\x00\xd0(\x00\x9d\x01*\x9f\x00\xa1\x00>\x91B\x9bH\
-%\xa4\x22\xa1-vJ@\xb0\x12\x09in\xfc|{\
-\x00\x1f\x00\x1aY\xc5\x0f\xe2/\xec\xdd\xa6\x7fy\xe5O\
-\xcdc\x1cs\xb6C\xd7\xe3\xdf\x17v\xbe\xef\x93\xd8\xf0\
-\x00?/\xfe\xc5\xc4\xb7\xd7NQ\xbf\x02\x9f8\xf6\x00\
-\xfe\x17\xe8\x97\xfcg\xfd_(?\x92\x7f\x8f\xff\xd9\xee\
-\x0f\xfc\x9b\xfa\xff\xa2\x7f\xaf\xbf\xda\xef`\xdf\xd4O\xfc\
-\xe8%\xb4\xb2\x92B,)qD\x1b\xaa\x02\xa1](\
-\x10\xb1\xc7\xb3\x98\x08\x22\xac\x92\xf2\x15\x1a\xac\xc5\xa0i\
-\x914I\xd9J\xf3\xa1\x8d\x8c!}\xd3\x80\xb1\xf5\xe2\
-\x1a\xa1\x9a\x96\xe3l\x83\x11\xeeuw\x9a\xc0B\xed\x1b\
-\xa0\x1d\xc3W\x91\xbbk8\x5c%\xdf,\xf0bK\xd5\
-3p\xd8j_\x11\x22>ZQ\xc6\xd3\x9d\xbc\x1c@\
-\x7fP\xb5\xf9\xc3\xeb^\xc8\xa5}.\xd0\xeb\x1b5\xa8\
-\xc0\x9c\x98\xf9\xf7e\x0cIJ@\x0e\xd7\xf7\xac\xdeZ\
-]\x08\xd9\xba\x0a,\x15Nh~\xb3\xef\x0c\x12UK\
-\xff?\xdb\xa6\xa5\xed\xbd\xf6\x9d\x01\xb1F\xba\x83\xb6\x9a\
-\x5c\x83S\xf2l\x98K\x5cx\xb8j\xf0\x0b\x12\xcco\
-\x86\xcc?<\x13\xd22\x13=\xde\xcb\x8c[b\x89\x16\
-\xbf\x01\xfbj_\xb7J[\xd5=\xef\xaas\xd5\xb3E\
-\xed{1k\x91=\x8f\x94G\xae7T\xa8\xf7c\xc0\
-\x00\xfe\xc3P\x94\xe9L;\x81\xa0\xa5D\xca\xfc\xc6\xad\
-\xc24\x0b\xb6\x80\x8c^\x08\xe4Abm\xc6#\x89r\
-\x17a>\xf5vl\xd4\xc5\xc8\xf0\x10\x89\x02\xafNo\
-\xd9x\x7fp\x82o\x10z\xe6[\xa6\x8c\xd9\xd2\xbda\
-\xd2\x14 \xd0\x06\xbf\xb3\xe5|*\xbf\x00n\xa9fM\
-\xd2\xc3\xb4\xcc\xb8\x82\xdb\xa8/\x8c\xb2\x00\x04th\x0c\
-\xc4\xe4_z\xe7\x7f\xfc\x9e\x8a\xd1*\x22\xe6\x05\x99\xc4\
-\x91R\xab\x03\xb7/\x8b}\xaf\x80\xfe\xc7\xfc\xb0\x06\x10\
-\xf1\xadjf>\xece\x1f~\x077-+\xa4\x0a\xff\
-Jq\x1f,\x10\xc3 \xa6T\xbd[]\x8d`L\x18\
-S\xe6.\xfd\x0a\xe3\xcd \xb5\xcfO\xc5\xefP\xd1*\
-\x1b\xbam:Y<v\xa6D\xbe\xdb\x0a\xdcZ\xffT\
-x@\xc7$\xb7\xd4\x86q\x1f\x82\x845\xee\x15\xdd\xd8\
-l\xba\x11\x0e\x17\x806\x0fvon\x94\x1a0(\xa6\
-\xa0Tw\xbb*\xc15\x09a\xd6\x88E\xce\xf3\xd2\xc1\
-\xa3T\x1d\x166qX\xd8\xfe\xa1\xaaO+\x12\xdes\
-O\xddw\xcd\x19b\x98 \xc32\xdd;\x0c\xb9\xcd\xf8\
-\x87\xdf\x82J\x11\xf9r\xd6\x10\xf4\x9a\x06\xcc\xd49\xbc\
-\xda\xce#\x8ar\xb7,[\xd7\x12\x02*}7\x8e\xa6\
-*\xa8\xce\x17\xb4\xd2\xb5\x9f\x81q\x8b\xd2\xab]lQ\
-\xb9\x80152\xd4\xd8)\xca}p\x99\x90\xe3\xb3\xe4\
-\x8e\xdc\x81\xd2\xd2\xef\x19\xe4}W\xa9\x9a\x96)\xfd\xd9\
-tS\xa0'\xd6\xa6h\xbeM\xe2\x95\x06\xe1\x9b#`\
-\xf0r\x0a\x8f\x01\xb5\xbdt\xc8z\xeb\x0d:.A}\
-\xe2\x11\xbe\x9ahn\xac4O\xf6\xc6\xc2}\xd2\x00\xb3\
-\xc1t\xfd\xa3I\x0e_\xd8\xe5M\x13\xd8\x9f`QN\
-\xb6\xe0\x0e\x12\x8f\xca\xdd\xa1\xe9g>\xd7\x1cm0\xd5\
-\x9dpz/\x1c\xf8\xe0\xae;k\x98:\xd6H\xf6X\
-3?\x8e\xc5:\xb5ss\x9b\xbc|Yg\xf1\xce:\
-\xe6\xcc\xc2B\x94\x93\x84?\x1a\x9e\xa6\xa0\xc3}\x9fs\
-\xf8p\xf6\xc1\xb1\x18{J\xab\xd665\xd7\x10\x1e\x8c\
-M$&\xe3\xf9\x0f\xdb\xa6k\x0b\x90\xe8\x12|8o\
-\xf8bw\xbf\xaa\xd4\x09\xaf\x03\xe4\x94\xacDA}z\
-e\x18\x81\x97\x97\x1a\xed\x11\xb5\x0c4\xc5\xd0\xcbQG\
-Kxq\xcb/\xd1\xa3\x9a\xd5\xf5_\x08\xb1-h[\
-\xabD\xabc:\xc9\xf0n\xaa]\xb2\x00\x7f\x1b\xf4\x8f\
-\x14H\xc1+\x0e\x83\x1c\xff\xff\x86\x97\xee\xe2?\xbd\xff\
-\xd8\xb7\x05\xe3=\xff'\x01\xb1V\xea\xf1\xff\x10Z~\
-\xc1\x9a\x14w\xfb]\x04\x9d\x0cH\xd7#\x80\xcd\xd7\x9d\
-u\x8e\xff\xd6\xcbw\x5c\x9b(\x09\x8d$\x90w\x15\x97\
-+\xf75>\x1dN$.\x851\x15\xa7\xea\x1d\xd1\xa0\
-<\x8e\xcdo\xb8\x06=\x18\x0ad\xcd[\xf6j\x9d\x07\
-kI\xd9\xdf\xf0snj\xac\x15}\xceg\xf6\x05\xb3\
-\xaf\xde\xfa\xb6\x10\xb4\x91\xa5=\x8d\x17F\xb7\x12\x9f<\
-\x0d\xa9\x9f\xc9\x7fW\xb7\x13\x9f!\x9cfv\x1a\xd6v\
-\x05\xa5\x04L\xabwV\x1a\xc9\x11\x94\x88v\x98\x8f\xcf\
-\x8c\xd0O\xe8\xff\x0b=s;\x93\xdd'\xd2\xdc\x09\x89\
-x#g\xb0w\xae-\xc52\xa6\xc24\xc1-\xa5c\
-\xbd\x19?\x0a\xa2P\xd1G\x91\xacr\xb1\x0f\x15\x93\xcd\
-v\xd3h\xb2\xca\x12\x9cG{\xba\x1dU\xf9\xaa\xc8T\
-M\xdd\x05\xde\x0f\xc0;\x05\xa1m\x8b\x8c\x9a `\xa1\
-\x9dF\xc5\xb9H\x05P?T/b\xe8 %\xdd\x84\
-\xfe\x87\x9b\xd2`\x1c\x1e\xf7d\xe0\x1e\xee\xef\xd8\xd36\
-\x12\xe0\x17\x8bc\xbcyr3\xb4\x8fh\x00s\x82\xcb\
-\xf3>fD\xf0\xff/&*\x84q;\x1d\xe6OD\
-\x09\xbf\x8c;\x0e\xd1\xa4\x0b\xd0\xdb\x17\x93\x0f\xc7\xb1V\
-\xa6\xe2\xe4\x97{x\x1b}\xd6\xfc\xe0\x99]\xbc\x22N\
-\x84BU\xf6\xc6x\x0c\xcf\xd2\xd0\xbf \x0b\xf6\xaf\xf6\
-\xfb>\xb7\xc2j\xc2\xf3Y\xc6\xf0a(\xa7j\xf8x\
-\xf5\x0e\xe0+%O3QS\xa9\xac\x81\x0f\xd6)\xcf\
- \xd8\xe2\x15(,\xccs\x06W\xb7\xef\xb8W\xccE\
-=\xe4\xa0\x07\xc7\xa2\xe3\x9fs\x17K,\x9f\x0f\xda\xe8\
-\xe4\x01\xf4\x0267Og\xef\xf2_z\x15*2@\
-\x0e\x1d\xd6\xe99\xfd\xeb\x92b\xd8\x80\xb5W\xb5\x9e\x04\
-\xd0\xf9\x0f\xd6<o`U3\xb3\xd72\xd7B\x99\x03\
-\x0f_\xf4\xa6O[\x9c\xe1\x83\xde9\xb5\xee\xfbm\xd4\
-\x88\x88\xc3\xdf\xa4\xb8f\xddb\xe7:\x85-\x8f\xc94\
-_\xdd\xa8\xffL\xa5(\x00\xa8,\xc0}*~4e\
-\x9e\x88\xc1rn\xfbdGf\x13\x12q5\xbe\x1a`\
-:1\xd1\x97\xb9\xe8\x81I\xa7\x02\xc7r\xc9\xd1Xw\
-\x8fL\xd3le\xfe`p\x059|\x12z%iU\
-\xcd\xb7\xc46,+\xe6\x8a\xc5:\x93\x07\x87_\x1c\x84\
-\x8a\xb1\x8e\xd5u\x9b\x93!\xc8\xa1:\x01\xf5\x1eoA\
-4b\x87K$#\xb3\xb9U\xe0\xcb\xceY\xf9L8\
-B\xab\x0e\x0djN\xe1U\xc1\x04\xb9f\x90\xcd\x15\xbf\
-<:[A.<\x1eM[UHw~E\x88t\
-\xfc,s\xef\xe1\x9b\x85\xcd\xa3:\xc4\x9ed\x18\x5c/\
-KA\x9c\x09\x1e\xb5wB\xda4\xc6d\x91\x1a\x1b,\
-\xff(g\xef\xa8\x93\xea\xaa\x86\x04,\xc4 \xc0\xe6 \
-\x09\xb8\x9a\xeaf\x87\xc2w\xd4\xfe\x93\xdc&O\xc3\xdf\
-\xc0c\xb1\x16\x81\x05\x86 \xa1K\xb1\x88it\xa9\x9e\
-\xe0\xff]*<\xa7=\xff\xda\xd7y\xb5\xe6\x8b\x1c\xc3\
-r\xd8PF\x8d\x83\xa2\x16l\x80\x84\xab\xe9\xce}\x06\
-'\xbd<'\x9d\x18\xa7j\xde\xb1\xa4\xfd\xceG1\x04\
-\xc1\x12\x1a\xf1\xc2\x18\xdc\xe3\x9e\x17,\x91\x08=&\x9c\
-\xe6\xc8\xfc\xa9W\xfe\xd0P\xfd\xc5\x81\xedp\x1d6\x9a\
-V\xbfo\x86\x10p?\x88&\x0b\x19\xb9\xee\x9b\xaa\x9c\
-\xa2aL\x00\x00\x00\x00ANMFJ\x08\x00\x00\x0a\
-\x00\x00\x0a\x00\x00\x9f\x00\x00\x9f\x00\x00\x1e\x00\x00\x02A\
-LPH\xa1\x01\x00\x00\x01\x0f0\xff\x11\x11\x02n$\
-Iu\xa8\xa30d\x12\x02\xa1\x10\x9a\xc8\xe4\xa5\xa2P\
-\x14\x02&\x06\xc5\x18\xc0\xdd\xd5\xfb\x9b\x11\xfd\x9f\x009\
-6Hb\xad\x00\xc12\x96l\xa8l\x83\xae\xed\x92n\
-\xec\x8a\xaarT\xbd\xa7K\xd3OY3O\xb7\xa2\xa2\
-T<\x9axj\x9at\xea\x9a|\x9a\x9a\xfb\x84\xfa\xf0\
-\xe8\xc2\xee\xd5\xc5]\xd3\xa5]\xd7\xe5\xdd\xd0\x95\xdd\x5c\
-\x8aH_\xee\x1dk\x10\xa9\x0b\x9b\xba\x14\x11\x91\xbe\x84\
-\xe5Y\xae\xe5Y\xe2\xf2.a\x91\xe5Z\x1aPd;\
-\x80\xb4t \xed\x1a\x90\x97\x01\x5c\xbb\x07(\xcb\x04\xc2\
-\xae\x02\xf7\xe1\x96\xe3<\x00\xe5\xd4\x01\x11\xa9@:5\
- \x88<\xc0uz\x81\xb8\x8b\xa7g\xf7\x02\xe1$\xc0\
-%\xd2\x00QNH\x9b[36\x1d\x8a\xa6C\x16\x19\
-\x905\xed\x94\x0cEd\xc2\xa5y\xe1\xdeD\xcd\xb3\x01\
-\x82\xa6\x026Y* \x96P\xe1\xd6M\x08\x0f\x14\xdd\
-\x80\xe8\x96u\x1d\xe2\x0bI\xd7\xe0\xf2ip\xe9^H\
-nQ\xf7@\xea\x1e\xb9C\xd0\xd5\xcfT\x06\x88\xf1\xf3\
-\xcc\xe5v\x98\x1e\xb7W\xb1\x8c\xcf\x84\x07\x0e}\xc9\xbf\
-\x85&\xe2 \xff\x07\xc5a~\xb1\xfb\x93\x8cO\xc4\x17\
-\xea\x10>M\xb45\xaf\xebs\xbc\x90>\xc7\x03\xf9\xd3\
-\x14[\x85\xdb\x05\x9b\xb8\x05\xdb\x84\xe8r\xd9\x06$[\
-\xf7\xca\xb6\x06\xc5\xe5\xb6\xbd\x80\xed\x01\xa2\xcbe\xaa@\
-2\x09\x90m\x13n\x17l\x03\x88\xa6\x0e$S\x03\x8a\
-\xe9\x050=K\xb4\xd4%[d\xc14\x97l\x19\x0b\
-\x1f\x97\xaeoH\xba\xe6\xf2\xee\xb2\xae\xba\x88\xcft\xe9\
-.\xcd\xe5q\x11\x9f\xe9\xd2]^\x17\xf1\x19.\xcd\xa5\
-\xbaHw\xa9Pl\xd2T\x00VP8 \x88\x06\x00\
-\x00p'\x00\x9d\x01*\xa0\x00\xa0\x00>\x91<\x99G\
-\xa5\xa3\xa2\xa10\xf7\x89\x08\xb0\x12\x09in\xe0\xc0\x00\
-e\xd8\x5c\xbf\xa6\xff\xe0;=\xff\x07\xfdS\x99\xd9\x00\
-\xdc^r\x22\xed\xde\xc6\xd0\x01\xf9\x97\x09?[\xb9[\
-<\x0a~\xc5\xea\x01\xfc\x9f\xd1[\xf9_\xfa\xff\xe6?\
-\xbez>\xfc\x9f\xfc\xaf\xfeOp\x8f\xe5_\xd7\xbd\x0d\
-\xfd|~\xc7{\x09~\xa9\x7f\xe34\xf6<\x99\xee\x07\
-\xb2\xa6&\x9a\x22}\x09u\xab\xb7\x8cW\xdbK\xd0\x19\
-\xf3#\xcbS\x7fQ\xdb\x84\xe0\x08I\xc5\xfa\x05}0\
-\xf5\xa1']\x1e\x8f\x9f\xc7\xf8w7\x83\xb2\x05\x22\xab\
-\x10\x94\xb7V\xcc\xccZWo\x0a\x92\xed\xa8\xde\x07\x08\
-/\xcb\x97\x96)Y\x0a) \x05\x01\x01t~\x18z\
-,\xde)$\xaa\x09\xe0\xc1\xf0\x8d\x89U@\x18\xa9\xcd\
-\xf1q\xc9mJ\xe7\x04\xc4\x89\xe7\xd5\x16/\xc2\xfa\x80\
-\x1c\x99\xc1\x9a\x84\x95u\x89\xdc\xb7$\x15\xcf\x89\xd6\x14\
-\xe2\xb2\x90\xb0\x96\xc4+\xfe\xbe}pr\xd4\xd8\xa9\x98\
-(>i\x89\xf1\xf2\xe7\x99H\x0fD\xb4\xfc\xbd\xb3\xe3\
-\xd5}n\xde\xc0\xb3\xee\xaf\x87\x91\x84`\xa4\xb1\x85\xc7\
-\xa7N\xc5\x84\x13\xa7\xe7\x9f\x99\xa4\xafQ\xfaG\xc4\x22\
-c_\xa3\xf2\xf7I\xcab@*\xc2\xbah \xa7u\
-\x16\xfa1\x06\x00\x00\xfe\xb8\xfb\xc8m\xe8v\x93v]\
-\x83\xc3\xee\x84>\x0aXM\xc4\xceE\xfc\x5c\xc9\xe4\x15\
-\xb4\x85\x98NxY!R\x10\x9do\x09\xf0\xee\x98\x22\
-ud\xeb2\x1fg\xc2\xa1*\xacF\xb3\x9a\xea1\xc2\
-_\xb6\xccJ\xbd\x96\x88\xc5B\xcc\xf7F*\x7f\xeeD\
-\xc2\xb9&\xaf\xf6\xc6\xc0\x86\x0a\xa0\x17CXT\xdb#\
-'\x11w\xf4\x044\x96\xcb40\x1f\xca\x1c\xa2/\xfd\
-\x11\xd9M\xba}t~|\x1a\xa5=R\xfc\x82z\x86\
-}\x1a\xf0\x19\xe2e\xb6\xe4\xd2\x04.\x11\xe7(\xa1[\
-\xa8p\xb0*\xa4\x91E\xd9\xb1=\x0f\x04\xab\xbc8\x88\
-\xcc\xe4\x87\xa5I\xcf\x9c\xf0A\xdd\xda,\xa0\x93\xea\xe9\
-\x02\xdc\x03\xba\xba'\xf8v&\x9b\xd5\xa9D\xd1\x1f\x1b\
-\x0a\xe10KK\x09\x19F\xe4\x80\xfc\xde(\xd3\xf6\xc7\
-\xfbg\xf0\x00\x06\xf5Q\xce\xb9 \xb1\xdc\x03\xb5\xfc+\
-\x9f\xd6i\xfe\xa3\x09#\x9b\x8f\x7f\xbf$\xee\xcaw\x0b\
-\x81d\xf4\x02\xd1\x97\x9e\xe8\xcb\x96\x9d\x0b\xc86Y\xf8\
-\x13\xa1A\x07\xb2\xed\xa5\xdch\x98\x99\x8f\x0847\xb5\
-|Q;\x96\x19\xaaPUiPT\xa6\xbcj7\x22\
-c\xfb\xd8%\xd9\xe4\x0b\x85\x01\xb4\xbewK\xcd\x01\x98\
-\x1e\xbb\x0f\x10\x1c\x09H\xd9m\xa8\x8b\xb3\xed\xae\xcbZ\
-E\xe0EH\xde\x1c\x90`mVY\x12\xa43\xc6/\
-[\x8f\xa4\xc5\xfd\xa5i\xba;\x91\xd1,\xb97\x19\xab\
-\x22\xfd\xbb\x8f\xf4}\x1d\xde\x85j\xf7\xaf\x00{\xd5J\
-\xfa\x92\x19\xfb\xcf\xab\xc9\x16qj\x96\x0f\xe5\xce!\xae\
-\xe04p\x0f\xa6\x91\x97@DU\xfb\xa9R\xe1\x09\x1b\
-$mk4\x18\x80\xe0\x9b4\x5c\xd3\x97B\xb0\x10\xc2\
-1y\xe3<\x9d\x18g7\xa5\x9b\xac\x92\xcfC7\xcd\
-gy\x89\xbd\xf3y,\x8f\x94Sf\xea\xedz\xb9\x98\
-\xde\xc4\xec\xd7\x87+i\xb9M\x13\x8a\x97w\xf7\x1e\xaf\
-\x95'\xd26\xab\x83\xf9\xbd\xb2\x11\xbby\xf0\x8b\xb6\xe9\
-\xa6\x9c\xcb\x8e\x88\x87\xdfH\x05F\xf2W\xad\x15\xf3\xf4\
-z'\x95\xaf\xda\xd8\x8f<sw%+\xa3\xe9^\xd1\
-\x1b\x96cu\x0832\xa9Nj\x7f\xd8\xd9\xe6\xbf\xa4\
-\xbc\x0c,0P\x84v\x02s\xd7P\xe8\x14[\xb8~\
-\xbb\xe9&\x0c\x1f\x8fC\xb9\xd43\xed\x13O\x0f\xf4~\
--1a\x00\x908\x5c\xa7>Zj\xd5L\xabn\x8f\
-314\xe5%\x9d\x1c\x94\xdb\x9a~\xd9ak\xa7\x90\
-\x16\xa1\x8c\xe1I\xd4\xa2\x83\xbb/\x7f\x82\xde\xb6L1\
-\x1c-ZQ\xb8w\x06J]\x9fLJt\xd7\xa9\x83\
-4V\x5c\x14\x16X\xbf-\xdd\xf2\x0a\xe5\x89\xbcb\x07\
-:\xd8\x80\xbf\x1bO\xad\x1bJ4MU\xb8\x9d&\xa3\
-m\xc5\xae\x14n\x87\xd0)\x0f\xad[L-\xa2\xb6\xbc\
-\xc5\xa3\xeb\xa2Z`#\xd6\xb5}\x8b\xe5\xb7\xd7\x8c\x96\
-\xaf9\x05b3\xeb\xc0\xad\x9c\xa7\x82\xd0q\xb8\x07\x80\
-\x07\xd2H\xe8\xe1\x98\xbc\x1a*\xd5n)\x18x\x08\xdd\
-\xf8k\xa1r\x14\x1f\xf0\xa2\xa4{\x1ba\xa02K\xf9\
-}\xe71\xed\xe43\xfd\xd8?_\xdcKL:\xce\xba\
-\x7f\x17\xb8\x03\xb1\xa1\xe5t\xe4;i\xa6\xacv\xee~\
-\x90\xe3\x8a\x8es\xc5\xc74\x98\xa8\xeb\x09FpO\x9f\
-2\xd0\x8fG\xbb\x1d\xd7@\xc5\xb9\xffA#\x9eL\xa1\
-\xc7\xea\xa1\xcc\xbd-\xf1\xab\xdaV1\xad\xd2\xc2\xc8\x1b\
-6q\x94\x08\xc5\x88+\xa1\x09\xbf}\xec\x5c7z\x10\
-9\xc1Y\xb7\xab\xa4hW\x15\xd5\x02y\x93\xfd\xc8V\
-\x00\x95%|\x0b*\x00\x90\x94\x1d\xb4\xa4\xbf\xca%3\
-\xe3<\xd9\x15\x9bs\xa0\xa9\xc6\xbe\xff\xc3vc\x9f\x7f\
-3\xf8t\x92\xa0\x9c\xa2\xdf`\xf5y\x99r)\x1d\xef\
-\x03\x19\x1e0\x83\xfb\x0d\xe3-\xed\xf5\xc14Ks\xcb\
-\x9c\xe5\x9f\x19\xdeD\x0b$2\x0d\xfd\xcf\xfc\x12\xd3K\
-\xcda\x848\xf0\x93\xec\xafM\x83/<\x08\x00\x1f\xe2\
-\xde\xac 5/\x0b\xb4I\x96\xbbD\xba\xe2\x0a\xe8\xe1\
-Z\x83g,{\x052\x1c\x14Gz~^\x9f\x9e\xa6\
-o\xad\xf3\xb9\xc5\xf4\xfcNd\xf7\x85\xe9;-'\xee\
-\x8ah\xdb\x00\xc3\xdd\x02lP\xfbz\xacd4\xf6\xbf\
-\x80'F\xc7\xc9\xfc\x04%*\x82%\xf0\xb3\x09\xb2 \
-l\xab\xb2|T\xe9\xcdC\x95\xee\xe0\xc1(\xbe\xd0\xa0\
-\xe2\x03{y\xbb\x11\xfe\x17\xf7\x7f\x5c\xa6bx\x19\x15\
-\xd7\xc6k\x12\xc1\x8e\x89D\xf5]\xa4\x96\xaf1\xf2\x0a\
-}\xbci\x94\x07L\x18\x9b\x19\x952\x1e\xb82%#\
-\x08\xa6\x8b\x03x\x7f\xfc\xdcp\xaa\xd7\x9e\xdbG\xdb\x1f\
-\xa2\xf8\x8aW\x9eZ,\x03\x18.z\xbfd\xcf\x156\
-,\x0bIJ\x22\x87{\x9fh\xd4\x0a\xac\xfbF\xd7,\
-\xc8\xcf\x0a\xa2\x898U\xf5\xda\xae\xd8W{>\xd5\x11\
-\xa5U\x9e\xfb\xce\x9a\x0c\xa2>\x183#1a\x08{\
-\xe5\x97\x97\x7f\xe0\xc5\xf3\xb1IDi;-D\xab\x22\
-\xf3\x82!\xf4\xd6=0\x91\xa6\xce\xde\x01\xbd\x90P\xcb\
-\xb5\xa9\x81yrc\x99\xf4\x9c=\xb5\x12)w\xdf\x97\
-*\xbf?\xb9\xa5\xb5\xa6\x5cO\x09\xea\xa8-\xba\xbd\x00\
-\xe7\xf4S\xbfm\x18\xf2\xc3f\xe3.\xeb\xc5\xb0|\xce\
-\xa33t\xaf \x8f~\x953\xec\xfc\xa3zm3\xdb\
-!\xaa\xa5\xab\x1a\xa4\xd2\x99\xd7\xfc\xb7>v\xd3oP\
-\x81\xe6s\xa7\x1f\xf5C\x0f'A\xc3\x18K\x06LC\
-\xb5E\xc3\xf1\xf2\x9a\xc1ia3\x90\xa3=\x81\xb1\xcd\
-\xfaG\x17\x16\x18\xe3\x97\xeem]\x1fn\x12\x834\x8c\
-\xd6$o\x0d\x88a(?\xe1\x17JU\xf4\xef\xfeO\
-f\xe1\xd1\xed\xf9\xcd \x00\x00ANMFn\x08\x00\
-\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\x9f\x00\x00\x1e\x00\x00\
-\x03ALPH\xa3\x01\x00\x00\x01\x0f0\xff\x11\x11\x02\
-nkka\x9e\x0f\xfdI\x5c2\x02\xa30\x1a\x8c\xe6\
-Q<\x02%\x05\xe2\x16\xc0\xf7}r\xa2\xd4\x11\xfd\x9f\
-\x0096\x88b\xbd\x01\x82e,\xc9P\xd9\x1a\xda.\
-\xea\xc6.\xab*G\xd5s\xba4\xfd\x944\xf3T\x14\
-\x15\xa5\xe2\xd6|NM\x13O]\x93NSSN\xa8\
-\x0fU\x17v\x8f\xee\xda5]\xdcu]\xda\x0d]\xde\
-\xcd%\x8b\xf4\xa5\xecX\x83\x88,l\xea\x92ED\xfa\
-\x12\x96{\xb9\x96{\xf9,\xcf\x12\x16Y\xae\xa5\x01Y\
-\xb6\x03\x88K\x07\xe2\xae\x01i\x19\xc0\xb5\xbb\x81\xbcL\
- \xec\x04(\x0bP\xe485\xf94\x00\x11\xa9@:\
-5 \x88\xdc\xc0uz\x80\xcf\xees\xbaw\x0f\x10N\
-\x15\xb8D\x1a \xca\x09qS4c\xd3!k:$\
-\x91\x01I\xd3 o\xa2\xe6\xd9L\xb8\x0ce\xf3\xd1\xdc\
-\x1b h*\xb0\x11\xf5R=B\x85\xa2\x9b\x10n\xc8\
-\xba\x01\x1f\xb7\xa4\xeb\xf0yL\x0d\xae\x07\xa2\xad\xc1\xa5\
-{ \xba}t7\xc4\xee\x91lu\x17l\xc3K\x8c\
-\x90_2\x97b+\xf3E\xd92\xde\x84\x07\x0e}I\
-\xff\x99\xf6\xab\xfa\x9fS]D\xaa\x8b\xfcE\xd9a\xfe\
-\xb2\xf2\x92\xf1\x22^\xd2!\xfc\xaa\x8f\xady]\xefx\
- \xbe\xe3\x86\xe4\x92\xdfQ\xa1\xbcC\x00\x9f`\x9b\xf0\
-q\xb9l\xc3+\xda:$[\x83\xecRl\x0f`\xbb\
-\x81\x8f\xcbe\xaa@4\x09\x90m\x13\x8a\x0b\xb6\x01|\
-L\x1d\x88\xa6\x06d\xd3\x03`\xba\x97\x8f\xa5.\xc9\x22\
-\x0b\xa6\xb9$\xcbX\x88\x86\xbeI\x86\xe6\xf2\xb8T\x17\
-\xd9D\xcbt\xe9.\xcd\xe5v\x11\x9f\xe9\xd2]\x1e\x17\
-\xf1\x19.\xcd\xa5\xbaHw\xa9.\xd2T\x00VP8\
- \xaa\x06\x00\x00\x90'\x00\x9d\x01*\xa0\x00\xa0\x00>\
-\x91>\x99G\xa5\xa3\xa2\xa10\xf6\xa9\x08\xb0\x12\x09i\
-n\xe0\xc0\x03\xf8\x00\xd0\xa1\xd9?G\xbf\xc8\xf6\x87\xfe\
-\x13\xf2g\xa0\xeaOt\xab\xe1\xbf{77\xf6 r\
-\xfe\xe5\xbdK\xfb\xd1\xd0\x9f\xf7o\x03\x0a\x02\x7f\x1c\xff\
-%\xea\xab\xfc\xef\xfc\xff\xf2~r\xbf/\xff)\xff\x97\
-\xdc\x1f\xf9?\xf6\x0f\xd7\xbff\x0f^_\xb1^\xc1_\
-\xaa\x86w\x01\x93=\xc0\xee\xbe\x9a\xf3A\x12TA\xa6\
-VP\xf0\x0e7A\x1d\xedd\x130\x17\xf3\xd8\xa9\x91\
-4I\xf8RJ\xffz\x1b\xff\xeeM\x22\xb6\xc6\x07\x86\
-c\xef\x81\x1b\x819\xa2\x83\x17[\xdb?\xdc\xf4\xb0\xba\
-\xca\x13bU\xe3\xda\xae\x17b\xc6r\xf5\x0fId\xbb\
-ud\x90b\xafx\xe2O;\x9d\xeb\xfa#dm\xe7\
-\xe7{q\xea\xdb\xe9\xf4\xa5\x80t\xfeJ\xb5\xc0M'\
-\x85A\xa4\xcc\xf2\xf9\x9f\xd8,\xee\xb6\x82.\xf0\xa8\x89\
-G\xd4&\x12\xb9\xf0fzY\xfd<\xc6-\x87\xb3<\
-\x7f\xd5\xe1\xf9\x0e`\xf4\x99M\xaa^\xdf\xa8\x05\x05\xc9\
-\xaff\x00\xeb\xf6\x9e\xd9y\x92\xbcxS\x9a{g\xf5\
-\x00A\xfe\x80\xe2\x1bwd\xb5\xb7\xaa\xf8\x8d\x0e\xc9}\
-h\x7f\x15\xe7\x81]$!\xca\x9f\x0cFf\xe5?\x84\
-K\xebg\x83<\xe0-\xfav\x80\x00\xfc\xbf\xef\x16e\
-1\xbaY\x92`\xb7\xdf1^\xf0\x7f8\x03\xfeb\xf9\
-\x83r\xc2\xdd\xc9\xfc\x14;x\x9c\xd2u\xaa_A9\
-\xea\x80L\xbb\x98\x86\x8f\xf5\xe2\xb0If\xd8\xa5\xdf\xdd\
-}\x13\xd4\xb3\xc8\xfe\xc5\xbb\x1f\xcd\x9ea\xdb^\x8e\xa0\
-\x88\xe6\xff\xda\x0dg\xa9v\xaa\x9a\xc06\xe5\x052\x22\
-\xca\x0a@\x8b\x86\x06+\x9f}\xe4\x07U\x8cwU\x9c\
-\x8a\x12S}\xee\xb3\xed\xe5\x22\x13$\xc7\xf826\x8b\
-\x83\xf2k\xe0\x95\xdf;\xca\xcf\x1f\x9a\x00\xdd7\xe9Q\
-\xe5\xb4\x8a\xd0\xa5'\x94\xb8\x19m\x1d\xedk\xc4S\x8e\
-65\x5c\x83\xd8[\xd9,\x15g\x8b\xcf\x1du\xcb\x04\
-i)b\xdd\xc8\xd2\xc7j\xe8\x02K\xf8F[\xeb\xe3\
-\xca\xaf\x08\xbf\xa5\xe4\xcc\x15\x1a\x15B,\x17H@\x9f\
-\xa4&\xc6g6kc\xda=\xd5\x8a^\xfb$\xf5]\
-\x99[\xc75\xd0\x16\x0c>\x9d\xeafVd\x8c\xe1\xe0\
-\xce\x9e\xc0u\xcd\x19\x1e\x0aW\xd7\xe69.\xf5\xe6-\
-\xdf'8\xa8\xa1\x99?dqA\x92\xc7\xaa\xc6\xbc\x93\
-;{\xe4\x802$o\xa7\xc4\x96@\x8f\xed\xf2\xaa\x7f\
-\x01vd(\xcb\xad!\x86(\x16{{|\x95\xb3\x12\
-`\xa7\xeb+\xc2\x01\xb7\xcf\xae\xfc\xab4\x99\xfaj]\
-7N%\xa2<v\x0a\xa9s\xed\xb5\xb7\xd6\xa2\xdb\x94\
-v\xbf\xb1\xbc\x9f\x12\xdd\xc1\xb6\x0d_\xdc\xf0\xdd\x81;\
-)>5;e\x02\x1b\xf5\xad\xb7\x01E\xaf\x9bI\xff\
-\x80\x11\x09\xd0Lm\x09\xa4\x01\xf5\xa6\x0b\x16\xc3\xfb\xb6\
-\x84 '!9\xc4\xa6\xb4\xae\x8a\x99\xa3\x11\x8dw$\
-\x02`B-\x1c\x19\x1c\x12\xe7\xbeE\xd4\x89\x06_\x11\
-&a\xcc\xc2\xcc$\x5c\xd4\xf6\xf9\xaf\x87\x10\x06\xb3\xe4\
-V\xb5'\xfe\x1a\x0e\xcd\xbf&I\xfe\x9c\x0b\x05\xbaw\
-\xe7>\x7fr\xbaT\x03|F6\xd6O\x86\xea\xa2\xb9\
-\xc0'\xc6\x9fR\x16\x93\xa66\xe8$\xea'\xf3a\x12\
-\x10\x80\xf5\x9ea\x89q\xac\xfeF\x91\x95>O\xec7\
-\xb3\xcc\xa7}\x91\x193n\xc7\x1e\x19aY\x5cG\xc5\
-kt\xba\xcd\xba\xde\xea,\xb9\x14\xb1+r\xc10\x9a\
-\x0f\x02\x88\xed\xee\x82\xbb\xb4\xd81\x1d\xfa\x1f\x92s*\
-\xeb\x9e\xc0P\x89\xac\x06J\x8d\x80Z\x15\xd4\xd0\x7f\x82\
-\x09C\x09\xb4P\x8cz\xda\x9e\x1fKb(\x1c6y\
-<\x7f\xc4\x07\x02P\xe9\xcd\xccl\xf6:\x92f\xa7\xba\
-\xab\xed]r\x8b\x88YK[\x9f\x10\xcf\xaeu\xbc\x04\
-v\xa7\x9e\x92\x1b\xf9\xe0\xf7\xd4\xe3\xdc\xfb\xbc\x1e\x8e\xbd\
-\xf4! !'N\xa9\x06\xd9 \xfc\xb5\xf3\xfcT\xab\
-|o\x10u~\x9b\xcd\x03\xd4\xa1\x5c\xd9\xd2M\xc8y\
-\xc0r\xcf\xefhFC\x9c\xe7\xce\xfa\xcfb\x85\xbf\x12\
-\xe9\xf6\x9d\x07\xa0\xc1t\xfc;_\xc9\xbeh&\xe7c\
-c\x06iv\xad<\x14\xfd\x13\x89\xf1\xf9s1:R\
-\x04\xe2\x83I$\xc9Y\x1bX\xac\xd7\xe9u\x99\x0b}\
-\xc0\x0c\x84\xb8\x99\xd4N\xac\xe4\xbb\x0e\xf0\x96\x0d&\xc3\
-\x86\xb8a^\x0aM0&\xac{\xf4j\xe63\x05\x01\
-\x04\xb2\x15\xd2)\xb9_/\xe4v\xd7\xd3h\xa4\x0c\xf4\
-8#\xfc\xce\xa8l\x22\x86?c\xc1\xdb\xa6\x01\xd5\x03\
-\xbcZ\x9dX\xfe\xe6\x5c\xebf\x8c*\xd4F\x9a\xc2D\
-\x93C\x17\xe4$-\x95]\xb87\x9b(\xc7\xa3n8\
-\xc0\x94\xadm\xe5:`\xbc\xfc\xd2\x06\xc5\xd0Y\xb7\xed\
-\x15,9\xbd){U2bH\x9d\x80\xe2\x95\xed\xf6\
-\xbbx\x1a\x89\x5cvC\x85\xe8>H\xb1\x1c,f\x12\
-\xed\xf7\xd5i\xfe\x156%\x08\xdeV\xb3\xb6\x7fC}\
-\xe5]f;8\x12\xabk\xa1\xbc?pY\xfb\xae\x0a\
-w\xder\x06KT)\xcf\xc9\x8c\x9d\xb2%#\xf8\xa6\
-D\xc99\x13\xe1\xd0'\x08\xf3?d\xf2d\x01fK\
-\x0a\x5c\x08v\x8e\xdc\xbf+p\xe1)YR\xdb\xde\x86\
-\x17\x17J\xbf9\x91=\xa28Y;\xcb9n\x97\xff\
-\x00\xad\xb1\xb9A\xd4\x0d!\xf2\xdf\x0e\xee9|\xe7\xb4\
-\xb7\xa4\x8a.\xeb\xd5%}F\x9f\x0e\x5c\xff\x11\xb2\x96\
-&\xedX\xd8\xc2\xc0nK\xa6\x05\x856\x07!R(\
-\x0c\xec=\xd2f\xfeN\x0f5+3IA\x0c\xed{\
-\xaa\x03|X\x08\x22D}\xc8[\x8dg\x10\xbd\x8a\x1b\
-\xc8\x18\x22!\x8d_\xc4M\xcd\xbf\xd68\xbf\xb0\xe4\xec\
-\xf0\xb7\x93\xbf\xeb`\x18B\xa42\xae5L\xb0p#\
-\xc6\x8a\xc7\xda\x91\xfdy\xdc\xd6MO\xf4\xf0\x04;2\
-\xb9L\x95\xb1\x01T\xa7q\x0a\xe9\xc8\xea\xda\x84h\xf5\
-\xe8Tb\xec\xacB\xdb\x8b\xde\x04=\xf7\xf4\x1e\xf9\x0b\
-\xfe\xfeg\xf5G\xa5\x08FY\xaa\x1a\x85\x17\x9f\xb3\x08\
-\x00\x1b\xa1\xa9\xb7\x8c\xc5\xd4\x96\x87\x00\x03\xbc\x5c\xfd%\
-\xd1W\xe3CP\x01\xf9\x01o\x8b\x8f\xcd\x09\x08|\x02\
-\x84\xfd|<pD#~\xea7\x85\xc0\xc3\xe5\xb3\x01\
-\xb3\x84\xfd#\x13\x12\xa3}\xee\xd8\xe3\xc0\xeb9$6\
-&\xcez6\xd1\xa8\x1f\xb6+\xe3!/\x06\x9b\xa5\xc8\
-\xb2\xc9\xb3nn\x0b]\xd5\xc8\xc9\xb5\x7f\xd2\x8c\xb2T\
-\xa2\xf3n\xa7\x96N\x09\xecm]/\x8c5\xb2\xdfF\
-L\xcb\xa0\x01#\x00\x1b\xfbo\xf5I\xbb\xd9X#\xbc\
--5\xe0#2\xbd\xc2T\x8a\x860 SW\xc0|\
-k\x18\xc1NC\xf2KV\xa6\x0a\x22a\x15\xb8\xf6\xa0\
-\x22\xc0\xce\xe4\x1f\x92b\xf3j\xf0!\x81\xf9\xb4X\xce\
-\xa8\x82\x12\xe1\xcc\x0c\xb3\x13-T\x00+G\xb5.\x0a\
-\x80\x0d\x85e\x5c\xc9\xf8-\xf3\xcc\x009h\xfb\xe6}\
-CQ\xfc\xfa\x1d\xcf\xf4\xda\xe9\x8a\xb1\x22\xb6\x87u\x04\
-\x84\x95'p&\x82\xa5\xf4&\x99\xfa\x5c\x9e\x83\x7f\x11\
-\x9eEW\xf1xP\x17\xd4\x96\xc9\xf4\x00\x00\x00\x00A\
-NMF\x88\x08\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\
-\xc7\x00\x00\x1e\x00\x00\x02ALPH\xb1\x01\x00\x00\x01\
-\x0f0\xff\x11\x11Bnc[\x91\x05=\xc4H\x98\x84\
-@\x1a\xe3uh\x10\x1a\xa1\x10\x02&\x06\xe2\x18\xdd<\
-\xde_f\xb5\x22\xfa?\x01\xf2\xaf\x1f\xb2\xd1\x04\x92I\
-\xe5\xee,\xc6C\xb2\xe01\x1b\xd4'\xfc\xd9\xd8\xc4\xb3\
-\xb5\xc9G\x85\xbd;i\x8ap2\x14\xf1d*\xae\x13\
-\xb4\x07E\xe5tM\x15t]\x15uC\x95tK\x95\
-u\xe8U\xe5\xc0i\xea\x81\xd7\xb4\x07/\xe5!h\xfa\
--\x89\xc8\xb8E\xcd\xb8y\x11)\xb7\xa4\x99@\x96\xfb\
-\x04.\xcd\x02\xe2C\x07\xb2\x06\xc0?T\x00E\xb9\xc9\
-\xf3\xcd\xed*\x907\x13\xf0\xbb\x06\xa4M\x07\x82.l\
-\x9a\xae\x03~S\x81\xb8\x1b\x80\xdb\x08\x90v\x13\xb2\xec\
-\x17\x5c\xaaK1U\x0b\x92b@\xde\x01Q\xd1\x00U\
-PTM\x01\xbc\xa2\x00\xee\xa9\x02N!'r\xe0\x9f\
-\x1ad\xd5\x82\xa0\xb8TS\xd1!\xa9\x06D\xa3\xae\x18\
-\x10O\x92\x22\xa8\x9ab\x82WU\xb8\xde\xc1\xa9\x8ab\
-\x9d\x08d\x85\x18A>X\xf0\x06\xd7\xc1\xdc\x14\x13\xb7\
-I\x07\xe3\x83*\xc4\x83\x0e\xfe\xdd\x9a&\x9c\x85[\xfb\
-\x0c\x7fP\xbfL\xbcup\x07\xe5\xcfG~\x09\xe5O\
-\xc4\x1b\xb53\x19\x04+yA\xdb\x85#\xf9a\xf7\xf8\
-\x82\xfa\x92\xf8n\x05\xd27\xb9\x8c\xe4%\xf9\xed\x16\xbc\
-\xdd\x04g\xe7\xdfm@\xb0\x8bF\xfd%\xc9\xa8\xc1e\
-\x97\x8d*`T^\xe3l\x04\xf0v\xc1hA2\x9a\
-p\xd9e\xa3\x01\x18u\xc0\xd94 \xd8E\x9b\x0a\x5c\
-6\x05\xc0Fn\xdef\x01\xd1f\x02\x97\xcd\x00p&\
-\xfd\x96L\xda\x0dgQ\xed\x8a\x9d\xbc`\xd9\x8d\x9b\x98\
-v\xbbfW\xec\xe4\x05\x13\xb2Q\xb7kv\xc5N\x96\
-]\xe7\xb2\xaav\xb2\xec\x86]\xb1\x93\x9fv\xff\x05\x02\
-\x00VP8 \xb6\x06\x00\x0000\x00\x9d\x01*\xc8\
-\x00\xc8\x00>\x91D\x9bI%\xa4\x22\xa1-\x16\xb8@\
-\xb0\x12\x09in\xfc|\x99\x1a\xe7T\xc7\xfd'\xfe\xb5\
-\xf8\xbb\xe0\x7f\xf8\x0c\x85\xf2\x0a\xeco\x11;\xcb\xb9K\
-\xb1\x80\xcc\xbb\xf3\xd0\xcf\xf6/\x03\xef\x1f\xf6\x00\xfe;\
-\xfe'\xd5G\xf9\xef\xfb?\xe7\xbf0=\xa2~[\xfe\
-S\xff\x17\xb87\xf2\xef\xec\x9e\x90\x1e\xbe\x7fl\xfd\x81\
-\xbfL?\xff\x93\xf7\xdc\xec\xeb\xd8\xdfs\xb2qp!\
-g\x14\xfa\x19\x13\x95\x16y\xaf\x86\xd6\x81\xe7\x9d\xe1s\
-\xa13\x12\x97\x15\xbd\x99\xb5\x1b\x8d\xacTRqO\x91\
-s\xd9\xd95[\x05w\xab\x7fAS\xfe`?\xb6\xdd\
-P\x15L\xec\x11g\x97\xb3\xb7J\xb2\xd9\xdcE]\x00\
-\xacO\x88\xafW/\xd1C\xefZfP%\xf1G7\
-\xd0D\x17\xe7\x08kg<\xf7\xfd\xf5\x89s\xf0\xe9o\
-\xba\xcd\x11\xc4d\x80\xa1\xff\xda\x95\x0f\x1e\xff5\x95\x07\
-z\x5cz\xb2\xae\x1ehc\xeb%\xc2\xce\xc4\x9a\xfb?\
-\x80\x00\x9d>\xe2\xd6t\x0e\xc17\x02\xc4\xea\x88G\xf3\
-\x9d\xa0\xc9\xb8\xfb2c\xe9@\xdb\xde\xa1\xfb\x101\xe7\
-\x00Y\xd1\xcc\xd1ET+nbu\xf5A\xfe\xef\xa2\
-\xde\xa7f\x8a\x17\xa8$\xedut\xac\xf5\x01\x12\xed\xbd\
-\xd7 \x19%\xea\xa5\x0c\x8f\xfaXQ\x1f\xff\xc8\xed0\
-T\x0c\xb0\xa4\x96GD\xe6K\x0aU\xeb\x93`\xf3\xee\
-\x99\xfal\xde]\xa3}\xc8\xef\x19\x96\xc0\xfd\x89\xe1\xd1\
-\xd1\xf9M\x0d\xa8-\x05\xcaFmN\xd1\xc4`0\xd0\
-\xf1\x97\x98/\xcd\x97\x0eC\x0a\xed\x00u6\xa7\xbc@\
-\x9dz\x90\x00\xfe\xff\x09js\xca\xb3ly{\xd8m\
--c\x08\xdd&\xcd1\xdeSDQRc\xf0\x1f\x83\
-\xd4<\xce\xef\xd1\x15=\x06\x09\xe3\x97F}\xe9\x94L\
-\xb1\xf5\xa4P\xe38\xd7B\xad\x93\xa8R\x97<F\xc8\
-\x0eK\x08u\x97'\x14Y\x9a\xa7\x1f\x06,=\xf6\x85\
-\x8cl\x17\xc9y&\x16\xedy\xe5\xd7\xa5\xa1\xf4 \x00\
-5t\xdb\x88\xc5^B\xc7\xad\x02&\xab\xf0\xd8\xd5v\
-\xf2\x82{>6\x9c\xd81\x0e\x10\xb8\xe2\x5c\xd7\x83v\
-\xc0?\xf6\x19\xa3Ny\xc4|Q\xb1\xc7\xd7\xb7\xf2\xe9\
-\x5c\x02\xdc\xb8B\x8f\x81\xea6\xbaS3\xb9o\x83\xcd\
-m\x8a\x96B\xc2Z\x18\xc6\x07\xa6\xbd-E6\xc8]\
-\xd9)\xabe\xeduE\xc5\xe9\x98\xec\xee\xdb\x8b\x9b\x9e\
-\xcc\x85e\x95W\xfe\xfb\x86&&Q\xd1\x96\x5c?\xa2\
-\xecL\xa1<\x1b\xc8\xb7\xe2\x03\xd7C\xe2\x08\xf1\xff\x83\
-\x11\xdb]\x9c=NQH\xf3Y\xbf\xafw\x11\xbe[\
-\xb5\xe3\xae\xa6\xa3\xdb7\xe9\xbd\xdc\x5c;=\xd0\x80r\
-\xb6\xa6\x19\xff\x01\x19n\xc7\xffd\xc9Q\xd6d\xfb\xae\
-\x83\xd4k\xebD\xe2\xc7N)\x97P<\x9d\xbc\xfd\xb3\
-\xab\xbd\x0f\xb8\xe3Z\x9ay\xb5\xd0M\xc4\xfcuXw\
-\xff\xbc\xb7j\xc4\xaa\x05\x1a=\xd6\x80\x98\xaa\xc2\x11\x97\
-(\x03\xf2P\xa6Q\xc1\xca\xe5j\x97\xe5\xb4\xd9\x8f\x0b\
-\x96g\xef\xbf#m\xc2\xc9p\x0e8\xa4\xf6\x9c\x98\xd4\
-\x1f+\xfd\xd9L\x1d\xb0\xdc\x9f\x06C\x0a\xa8\xd0\x00\xd4\
-\xf5\xf5_\xae\xd5T\x18w|sO\xad5F\xab\xd2\
-_\xc3\xf8fP;Z4\x00\x8d\x96n_\xc0\xe5\xa8\
-\x8apE\x88\xcf\x18\xd6\x1f1\xb5\xa2\xc9v\xb2\xb9\x09\
-t!\xdc\xccf\xa5\x0c;\x19\xe1!\x00\xb7\xa2\xbd\xa2\
->\x1b\x15~\xda*\x91T\x85\xf0KNk(\x93\x0c\
-\x14\xf2\xc3\xc9c\xb9\xe9\x19\x99\x8b8\xd3\xfd\xcf\x8f\xf8\
-\x96\xc3z\x84\xcb\xa9-Z\x0f'u\x22\x00\x85\xa5\x7f\
-\x013\xd1\xe9W\x94\xf6_d\xa6\x13\x91\x11\xcf<\x93\
-J\xd5)\x5c\x0c\x8a|\xf7y\xcbr\x97!\xefP\xd5\
-\xe1\xfb\x04\x16\xe3V4\x06J\xa8\x98\xcd\x09\x13+r\
-\xa4\xf1V\x8eL6\x00\x9e\xe9\xfb\xbf\x81\xf2\x9f9s\
-\x00\x16q\xd3^\x1dY\x8c+\xa0\xf1\x8e\xc7\x22\xbb4\
-y\xa0\xa98SV\xff:A\x08b]j\x98\xedC\
-V\xa2}\xa0\x7f\x96\x88_\x1a\xda\xeb\xa9\xec\x80\xae\x11\
-\xeaF\xed\x8c\xe3\xa6|\x0fT\x14\xc3.?\x0e\xc9\xc3\
-\xfc\x95J\x85\xcc#U\x85\x0a\xd9\xb1>&\x90\x17N\
-\x9a\xaa*;\xc3\xe3\x06\x0b\x9c\xd5jg\xfb\x04.\xff\
-\x1c\x9b\xde\xba\x1f\x8f4K\x91\x9d\xf4\xef^}\x1a\xf1\
-=\x0d\x88<-z%\xfa\x9aq\xa0\x7fyg\x92\xc3\
-\xa3;\x1c\x8b\x14\xe6\xdd\x84\xff\x89V\x1fj\xd7]\x10\
-\xf0W!\xd4,6h\x92<\xb6\x85~\xd6\xf5\x0es\
-K;1\xa7\xa9c\xba\xc2u\x0f\xafF\x84\xe0y\xd9\
-;\x17}B\xab\xee.\x87\x01Q)\xacL\xdd\x80\xe3\
-o=\xcd\x04\x17\xcb\x15\xf5MFhe+\xc4\x8e1\
-O\x09\x0c'\xb0T~\xb1\x91z-\x91\xa1SF\xb4\
-\xe2\xb3\xfd\x04\x16]\x88\xc7\xa8K\x10\xb0\xb0\xe2\x88V\
-?\xfe\xa6\xb3\x1a\xee)\x9e\xd1\xf2\xc7p#,\xe6\x0f\
-/\xfe3tR\xf2P\xdd&\x96w\xd9\xe9:\xfe\x0d\
-A\x5c\xfd\xc8\xb9\xad\x08\xdb\x1d\xec\xa6Z\xe0\xec|\x9c\
-\xa9W\xe0\xf3E\xbeZ\xfa\x1f\x0f\xa3\xb3\x0a\x09\xe7\xc4\
-^\xca\xea\xfc\xeb|3'\xb5\x15\xa7\xe6 \xees\x83\
-\xd0\x84\xba\xeb\xcb\xfa\xd0\x1aj\xfe\xe3}%\xf7\x85\xd0\
-P\x15U\xe5\x83K+\xd4\xac'j\xf3j\xb96\x9e\
-\x9c\x1c2L\xc47\xbf\x8d&\xa5\x10\xef:\x83p\x17\
-3\x1b\xa3?\xec\x92M\x91]\xc4\xd0\x12!5\xb3\x99\
-t\xcd\xa9\xd0\xc7,\x0f\xd9\x91)\xe8\x81\xdf5\x10\x17\
-P)\xb2pX\x15!<%d{\xb1\xb4\x03lC\
-o\x14\xfd\x07\x92X\x18\xa5\xd7\xfb;\x8b\x17\x9bO\xcc\
-FD\x88\xc6R]S\xcc\xb91Qixk0\xa4\
-\x1b\xe8\x7f\x05\xfc\x93\xead\xa9f\xbd\xa6\xe9\x9c\xc4\xac\
-\xfdMr\x9ch7\xd1\xce\x02\x1e\x1bEJ\xbcV\x0f\
-\xf6\xfe\xe2\xa8!\xc7\x98A\x08\xa6\x97\x5c\x959\xc1\x97\
-\xbb\xae\xcb3\xe7\xf0\xa9\x03\xb2\x7f_*\xfb9\x09\xff\
-0\xc1\xe5\x82>\xac3N\x0e\xb3_\xdf\x92\xbc\x11\xf4\
-\xa7'\x5c\x14Ij\xe0qy\xf0\x13V\xce\xc7\x9dh\
-\x14\xad\xc4b\xf7\x81\x9d\xc4\x09L\xeeH\xfe\xd9uh\
-d\x88Z\x91\x86Kf\xe9\x19\xcf<\x80\xe1\xcb\x0a\xfe\
-ThGK\xa7\x0a.\x98,\xc7\x03\xcaZ\xea\x1e\xa2\
--m\x96g\x85xr\xbc/\x86\x0b\xaf\xbdM\xc6\xe1\
-\xf2;4\x8e`i+\xd7M\x1f\x13\xeb\xce\x8e\x9f)\
-CYB\x0de\xd4s\xb7{P\x9dU\xd5\x9f\x92\x02\
-\xd0\xf5z\xb3\x07\xba\xeb\x13\xf6\xf93A\x99\x9c*-\
-\xff:\x9f\x87\xf3b\xa3\xf9~\xb5\x83\xdc\xa2\x12\x06\x9c\
-q\x8d\xc1}\x82@?j.4\xddAr\x11c~\
-\xef6\xb7\xd5S\xd9\xcew\xaf\xfc\xeep\xe3+#\x5c\
--\x86\x1dB)\xf5\xb0\x11\xe3\xb2,\x86\xad\xa4\xb05\
-b_V\xa9;\xcd\x1a4\x1e\xc5\xa4t\x84r\x05w\
-\x91\x0a\xe9\x83\x80\xad\xc9\xde?\xc05\xbe&\x021E\
-\x11p\x22\xd5_\xf0\xc4\x13\x1fM\xac\xaa\xb0m\x01*\
-\xce\xd6A\xa6\xd46a\xeb\xc9Zp\x00\x00\x00\x00A\
-NMF\x92\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\xa0\x00\x00\
-\x9e\x00\x00\x1e\x00\x00\x03ALPH\xb3\x01\x00\x00\x01\
-\x0f0\xff\x11\x11\x02nm\xeb\xd4\xa0\xcf\x9a\x87\xf0\xef\
-`\x94\xa24JS\x8a\x12\x84\x02\xcb\x09\xf0\xf9\xe6\x9d\
-F\xf4\x7f\x02\xe4\xd8\xc0\xcbu\x01pWc\x097\x99\
-\xad\xbbh;\x7f1vQ\x979:U=yU?\
-\x05\xd5<%MF\xa9)\x9a\x17E\xd3<\x8a\xae\x09\
-\x8a\xa9I\x0a\xd4\xa7\xa2s\x87\xaa\xf3\x87\xa6{\x0e]\
-\x17\x0eC\x17\x0fs\x89\x22}I\x07V'\x92\x17v\
-y\x89\x22\x22}q\x9b\xb2\xf8\xa5./\x9b\xba\xb8E\
-\x16\xbfi@\x94\xed\x00\x9eM\x07\x9e]\x03\xc2f\x00\
-~W\x80\xb8\x99\x80\xdbe \x9d\x92\x1c\xe7\x09\x88\xa7\
-\x0e,\x19\x08\xa7\x068\x11)\x80?U\xe0\xe5\xf0r\
-*\x87\x0a\xb8\x93\x00^D\x1a \xca\x09\xcf.i\xc6\
-\xaeC\xd4t\x08\x222 h\x9a\xe2\xb9\x88\x222\xc1\
-k*\xa4\xdd\x8b\xa6\xec\x00\xa7\xc9\xc0N\xd4\x9bl\xe1\
-\x96\xa4\x9bK\x81\xa8\x1b\xf0\xf2\x09A\xd7\x97\x0a\x8f\xae\
-\x81\xb7j\xe0u\x15\x9eOx\xd1\x95\xa5[\x84\xc5\xe9\
-\xf2\xd7\x8a2@.\xbf\xda$\xddL\xabd\x17o\xc6\
-\x17\xc3\x02\x8b\xbe\x09\xff\x8af\xe6l\xc4\xa0\xff\xb1\xe2\
-\xcd\x00\x99\x16\xe9\x8b\xa5\x9bi7\xbeL\x94\x017\xc3\
-\xa6\xee\xdc\x85\x10\xa5\x1b\xf4`R6/7\xf2!\xcd\
-B\x16\xffU*<_\xa5@\xf8B\xd1 C\xb2\xc1\
-@\xec\x9c\xc1\x84\x17\x1bo0\xe01\xe8f\xc1\xa0A\
-\xb4I\x06\x150(\xc0\x8b\x8d\xbf\xcb\xc0s'@0\
-\x98\x90l0\x18\xc0\xcb]\x07\x9e\xbb\x06\xc4\xbb\x0ap\
-W\x96\x97\xab\xbc\x84+Y\xe2\xdd\xb4\x19@\xb8\xeb6\
-\xcd\xa6\x02\xcf]\xb6\x11\xa3\x09\xde\xa0\xdb4\x9b\x02/\
-\x06b4m:\xce\xa2\xdad\x1b\x19bZm\xb2\xcd\
-\xd7\x04\x00VP8 \xbe\x06\x00\x00\xd0(\x00\x9d\x01\
-*\xa1\x00\x9f\x00>\x91@\x9bG\xa5\xa4\x22\xa1-\xb7\
-*h\xb0\x12\x09in\xfc|{\x00\xfe\x004Ev\
-O\xd1\xdf\xee\xbd\x9f\x7f~\xfc\xa4\xe8a\x94\xd9$x\
-e\xde\xdd\xc9\xdd\x88 \x03u\x7f\xaf]\x0d\x7fY\xf0\
-\x22\xfb7\xf8\x7f`\x0f\xe3\x9e\x89\xff\xc9\xff\xcc\xf2\x83\
-\xf9G\xf8\xbf\xfc~\xe0\xdf\xca\xbf\xb1\xfa*\xfa\xeb\xfd\
-\xa4\xf6\x11\xfdK\xff\xda\x85\x99\xd9\x94W\xf3\xd67Q\
-\xdb\xac\xd0(\xcc~\x0d\xdc\xcbE\x88H\xf6\xf1j\x86\
-\xf3\xc84\x86q]\xb6\x9a\x11\x04-\xff\x15\xbd\x97\xe0\
-\xc8\xbd\x1a\x19:\xcc\xd3~c\xe4\xb2\xa9\xce\x0dG\xeb\
-\x04\xa8\xfc\xa9\xf6m\x92*:\xe5\xfe\xd15s\xbb\xa5\
-I\x90SY\x17\x1e}e\xc9#\xe7nI\xc9F0\
-\xabR\xb3\xbe\x84\x18\x01\xdd\x94\xd7I\xa8\x8a4B\x18\
-v\xd9\x87\x1e\xfc\xf5\xebY\xb2\xa4aw\x05\xd7TQ\
-\x94\xc1p\xa3\xbfD$\xf6\xa9\xbdd\xc4\x9f\x03lQ\
-Q\x94\xc1H\x974\x7fU\x8fy\xc2\xf5\xe8\x10wE\
-\x97\xcb!\xd64\x96\xba\x80bM\x8a=\x8d\xf0\xa6z\
-\xad\xe2\xe6\xd0\xa1\x85\x06O:\x9c\x9e\xfe?\x1e\xab\xe5\
-\xc1\xa5\x01t.\x18\xff\xe8s\xd4zE+\xcd5A\
-J\xce\x0c\xe6\xf4\xaf\xfd\xeb\x85M\x22\x17\xbd\xa2\xdc\xee\
-\x90x\x82Y\x8b1\x15\xc0R\x00\x00\xfd5d\xea\x0f\
-\xc9\x9d\xcb4\xa2\xfc\xbc\xc5\x9e\xe1\x86'a\xa1\xcd[\
-|\xffT\xf8\xbdpF{.\x18\x7fY\xa5eR\xb9\
-\x12\xfb\xe3MIx\x19*\x90\x92\xd1&\xf41%Y\
-\x90BJ\xdc^XU\x13h\x858\x9f0\xae8\xcf\
-\x07\x8a\x15U\xbe\xff\xda\xb5z\xb0\x82\xc3\xe3(\xd7W\
-\xf7P{n\x0d\x9f\x12\xc5\x15F\x12\x13^\xb9\xddU\
-gJ\x13V\xc6\xd1-\xfc\x82\xa8ay\x02\x19\xc0\xa4\
-\xed\xd7\xf2?\x8f\xab\xd6$\x915\xb8\x05|u\xd3f\
-\xdb\xcb^=\xd8\xcb%\x024\xafswZ,[\xdb\
-\xe5t0\xc6\xb7\xde\x17)\xaf2U\xd8=\x0b\xb2p\
-\x16\xa5\x81\x98\xb2\xdc\xbbA\x18W\xf2A\xed\xe7\x00}\
-y+\xb1\xed\xf3\x13\xff\x97{\x95C(\x8a\x97cR\
-\x0cz\xa1<\xed}TG\xcb}\xb8>\xe4g\x1c'\
-_E\x06\x15\xf22H\x08\xd3\xad\xf3\x1e\xd1\xe0E\xca\
-j\xc3\xc6\x0bX;\xd0a_\x1e\xed=\xec~Ff\
-\x10\x11\xf0\xad#8\x13\xe1\x5c\xaa\xcdU\x8c\x99\xc0Q\
-+\xb73\xc6\x12\x80PDT\x88<\xf5\xe73\x01\xed\
-R\xfe%b\xa0\x18\xc0>M\xef\x92\x9cE\xc6\xf0\xb9\
-\xee\x1a\xd0\xa9\xfb\x93\xday\xc7\xd7\xf9\xd0Z\xbbV\xc8\
-!\xa6\xaa\x1f\xc1J\xb5\x93&\xbb\xaf\x1d\xd4&u/\
-q\xdfO\xd0'E\x1d\xeb}\xd5\x96\xc7gi\xd7\xaf\
-\xbf\xd6\xd5\xfa$Jjb]\x17\xa9\x8d\xfe\xed\xff\x80\
-p\x19Q\xe30\xb8>\xde\xa9\xec\x0f\xe6u\xdd*\x81\
-{\x1ft\xb0{\x81\xb7\xc5\x0a\x9f\x03\xff\xa5h\xb6,\
-\xfc\x9a\xe4^\x99\xd9\x8b\x18\x1a\x0a8:&\xd4\xb5v\
-\x0c\xf6\xfc\xc0*\x1f\x13\xfe\x14\x9e\x96\xe3\x87^\x83\xd5\
-\xf0\xc7(\xfa\xf3\xaf\xf5\xd1\xe2\x80 \xfa\x02\x90\xce\x22\
-\xd5\xc3\x0f9{\xf4\xe6\xfe\x9f\x0eP\xb4\x96\xcf\xba\xbe\
-\x84\xee\xcdI\xec\xcc\xf4\x0dq\xf6\xfb;\x0f\x96{\xbd\
-\xd0|\xb9\x05\x80b\xe4F4\xf5\x88il\x85\xb3\x0b\
-a\x1c\xb8\x01\xdc\x8e>)M\x00\xdal]\x9e^\x1c\
-\x8d\xdf\x15\xad\xd3\xce\x9eU\x90b\x0e\x17\x11x\x1fw\
-\xeb\xc0\xd6\xcbd\x17\x0a\x0b1\xe4\xc3\x14\xd2\x9a(W\
-\xf7@\xf3\xd4\xd7\xd5/+\xe8\x9b\xdd2\x830+,\
-\xb4\xa3\x90`\x90b\x0bY\x91UO<l\xa0\xb4\x0b\
-\xdd\x00\x86-h\x05\xbe\xf2\xa0\xf9\x91\xc1H{\xf6\xf0\
-\xa2\xc05\xdf\xe1\x95\x19\xc2<i\xc7\x90\xf3f\xad\xaf\
-p~b\x88\xbd\xcd\x16\xe2\xef\x85\x9b)w\x8bZ\xea\
-\x8b\xea\x09y\x8a\x93\xea(\xd7'\x83\x1e\xae_\xe8\x11\
-\xe3'\xe5\xaf$c\xf0\xf3\xfc\xfb\xa9\xd0/l\x82`\
-9\xf5\x9b\xf8\xfbsv\xa3\x03\xff\xbc\xcb\x1c\xc6\xe3w\
-\xa6OHNh\xb4\x14\xd9\x0d\x80\x22\xba\xb93\x8d\xde\
-(m\xc1\x9a\xf8\x82%\xf3\xad\xa7\xb0\x1a\x92%X\xdd\
-\x07K-\xac&b%\xa4\x95d\x9fua\x1c\xd4\x00\
-`\xa8\x8e\x92.\x08\xbd\x83\xeb\xc2\x0d\xcb\x8e\x1c\xfaN\
-6\xa3\xef\xa7b\x81I<\x88AK\xceD\xd7\xe9e\
-\xbd\x17\x06\xd1\xa23\x0e\x90\xdf\xd5\x03\xd5\xeb\xf6\x82x\
-]\xa6\x06]\xb7{`\xdc\x9b\xe7\xd6\xd5Rp\x7f\xba\
-\xe7\x98\x8b\xa2\x11K=\xe5\xa5?\xd2\x93\xda\x1e\xad\x08\
-S^\xf8\x1d\xb76\x86\xdf\xae\xe3\x97\xd8;\xf6\xdfN\
-h\xa4\x9c\x9d:\xa1\x1cV1\x91+\xdfu\x0a\xa4o\
-R\xbd\xd9\xffxNpNYy\xf9G\xe6\xdc\xf4\x8e\
-\x83?\x0e8A\xc2{\xa5\xeb\xb2\x04/\x1c\x86\xf8\xc0\
-\xeb\x89\x08\x96\xe3\xa7\x8e-\x93z\xb9\x9d\xff\xc0\xc3,\
-NI\x15_t\xd2%\x17y\xce\xde\xde\xe3W\x1d\x1f\
-\xf3\x82\x02\xa2\xab1\xed#\x14\xd7Q\x22%2\xecN\
-z\xed\x97|\x0bA \x1b|JF\x9d\xddm|\xae\
-\xbf\x1e\x0f\xb0j\xac\x12P\x10\xa6\x9f\xf8\x04\xc6jS\
-c5Jc\x04g\xb9\xd7A\xce\x5c\x12$\x92m\xce\
-\xb1\xba\xc2\x17%\xba\xea \x12XX\x09W\xbe\xc6/\
-\xaaar<\xea\x0a{\x8e\xc9\xcfw\xff\xfe7\xc0O\
-\xd5\xe9D\x06\xa36$\xd8\xda\xd2\x18\xa1\xfb\xc2\xe8Q\
-\x95z\x90\xd9\x906]\x18\xad\xe7h\xac\xf1\xacAz\
-\xbbt/\x0aj\xf5\xb0\xd2\xbaO\x1b\xcb\x88\xcd(\xbc\
-\xcd&\xcd\x1a\xce*\xa8:\xf1\x1a!\xdd\x99q;\xca\
-\xaa\xfd\x86\xb6\xa6'\xfd\xd6\x03Y{\xac7;\x94\x98\
-q\x84g?\x9cV\xd2\xd1\xe1\x0b\x9b\xf7\xc1p\xf8\x03\
-\x0e\x1d\xd9\x7f\xe9\xa5yI\xbeB\x0d\xb4\x8e\x88\x88\x1d\
-\x8e\x06<\xf0\x04\xd0.|j\x7fr4\x9a\xe5\xa8G\
-Bj\xad\xdb\x17\x0e\xee@\xed:\xaf\xba\x15\xd5me\
-\x0f\x1f\xbf\xcf\xc0\xaf\xee\xf0\x90\xc1\x96\xa7\x09\x86\xaeB\
-\xf5\xfc$\xac\xae\xcf\xaa\xfa\xa7\xbc.+k\xcf\xd3\xc7\
-\xc6\xf0bAT\x92K\x08\xf5;\xb2\x1a\xc0h\x0e\xae\
-\xb2\x82\x8d\xb0;\x95\x1d\x1f\xec\xa4\xb9M\x92z\xb3\x03\
-\x02\x8eW\x02m\xbe\x81B3rE \xf3\x99\x1a^\
-\x0d\xa5\xf3\x8b\xeb-z\x15\xd9\xc8\x125-\x90<\xa9\
-\x81\x140H-\x82\xc2Dl\x1a\x9f\xf2T)U\x1b\
-:\x94u\x0e\x9c}.\xb0\x00\x99\xc4\xe5\xb3\xea\x0a\xe4\
-\xd2\xaah\xfc\x02\xb2R\xd8BW9\xe9\x22\xa8\xc1]\
-7\xfe\x17\xb6w\x80*\x17@\xe4\x80 mpsW\
-\x07\x89\x98\xbe\xd3\xde\xb3gN\xceC\x84\xc0\x10\x0c\xfe\
-b\xcc^\x14\x0e\xe1:\x97Q\x8d\x5c:~\x82td\
-\xd3\xbc\xe4\x04t\xcb\xa5z\xc1]\xc6\xaa\xc5\x17\x10\xe2\
-=zB\xa6\xa5\x95H\xccg\xe4R\xd5\xd9u\x83\xbf\
-B\x1e\xfb\xfd\xdeI\xc8\x17\xbap28\xb4'\xcb\x22\
-Z\xc2k\xff\xef\xf0\xda\x19\x05\x8c\xa6\xfe\x8d\x99\xda\xf5\
-9\xc3\xe9\x00\x0b\x00\x00\x00\x00ANMFl\x08\x00\
-\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\x98\x00\x00\x1e\x00\x00\
-\x01ALPH\xaf\x01\x00\x00\x01\x0f0\xff\x11\x11B\
-n$Y\x95 =b\x04DL\xe0<\xc1\xad\xfb\x0f\
-\xa6\x8d)c\x02\x22\x02A\x09\xc0{/v\xf7N\x8e\
-\xe8\xff\x04\xc8\xb1C\x12k\x05\x08\x96\xb1dCek\
-h\xbb\xa4\x1b\xbb\xa2\xaa\x1cU\xef)j\xfa)k\xe6\
-\xa9(*J\xc5\xa3\xb9NM\x93N]\x93OSs\
-\x9fP\x1f\xaa.\xec^]\xdc5]\xdau]\xde\x0d\
-]\xd9\xcd\xa5\x88\xf4\xe5\xde\xb1\x06\x91\xba\xb0\xa9K\x11\
-\x11\xe9KX\x9e%.\xcfr-\xef\x12\x16Y\xe2\xd2\
-\x80\x22\xdb\x01\xa4\xa5\x03i\xd7\x80\xbc\x0c \xee\x1e\xa0\
-,\x13\x08;\x01\xee\x05\xb8\xe585\xe54\x00\x11\xa9\
-@:5 \x88<@<\xbd\xc0\xb5\xbbN\xcf\xee\x05\
-\xc2I\x80(\xd2\x00QNH\x9b[36\x1d\x8a\xa6\
-C\x16\x19\x905\xed\x944/\x14\x91\x09\xd1po.\
-\xcd\xb3\x01\x82\xa6\x02\x1bQ/\xd5#T\xb8u\x13\xc2\
-\x03E7\xe0r\xcb\xba\x0e\xd7kj\x10_H\xb6\x06\
-Q\xf7Br\xbbt\x0f\xa4\xee\x91mu\x17>\xc6\x00\
-1B\xf9 s\xb9\x1d\xa6\xc7\xedU,\xe3\x03\xc1\xc7\
-\xe8K\xfe\x9fi\xff\xac\xfe\xffQ,\x03\xe6G\xb9\xbd\
-n\xcb\xf4\x1a\x1f\xa5\x0c\xb0\xe0\xd5!\xe8\xaaWv\xbb\
-t\x0f\xe4\xe6\x91\x1aD]u\x91Iz!\x19:\xd1\
-\xe1%>\x90\x0duS\x0c2/\x8f~U\xb8-O\
-\xf0\x90 \x80I\x96`\x9bp\xb9D\xdb\xf0J\xb6\x0e\
-\xd9\xd6\xa0\xb8\xdc\xb6\x17\xb0=\xc0\xe5\x12M\x15H&\
-\x01\xb2m\xc2\xed\x82m\x00\x97\xa9\x03\xc9\xd4\x80bz\
-\x81\xdb\xf4\x00\xc5T]\x04\xc8\xb6\xe92\x5c:$[\
-sy!\xda\xaa\x8b\xc0\xe50]:\xc1\xa1\xb9<\x88\
-\xa7\xcfo\x97\xef.\xdf,\x00VP8 \x9c\x06\x00\
-\x00\xd4&\x00\x9d\x01*\xa0\x00\x99\x00>\x91<\x96G\
-\x83#\x86\x86\x00\x01 \x96\x96\xee\x0c\x00\x06]\x85\xc5\
-\xfaa\xfe+\xb4\xbf\xee\xdfjyw\x9b\xbb\x8c\x16G\
-]\xab\xd8\xecc\xbd\xf4\xe8\x03\xfb\xb7\x81O\x99{\x00\
-\x7f\x1c\xf2\xd9\xff\x93\xc9\xc7\xe5\x1f\xe3\xff\xf4{\x82\xff\
-#\xfe\xcd\xe8\xf3\xeb\xdb\xf63\xd8?\xf5#\xff\x89\xd0\
-\xa6\xf2^\x0bz\xba\xef%\xe9\x90N:\x9cl]!\
-\xf7\x1e\x0e\xa1n\x0b\xe6cF\xa2O\xb3\xee5K\x8b\
-6\x1fd\x01\xb6s\x96L\xd7\xd4\xdb\x19\x93\x93%#\
-2r\x00o\xc3\x9c\x04\xe8m\x90b\xcb\x0f<l\x11\
-\x90\x14\xe0\xc2\x0d|E\xcc\x7fa{\x18\xc6\xe0\xb8\xbe\
-\xda5\x06X\xf3tD\xae\xaaB\x18\x82\xceSC\xef\
-!\x7f\x82s\xe8\xcc\xbc\x03\x5c\xe6haE\xc4\x17\xab\
-2:#\xb7z\xf8\xfc]\x94\xc5\xb2\xa6\x1c\xc3\xa7y\
-_\x135\x17@\x9b\x94\xdf\x1c\x8d\x87\x84\x95\xfes\x92\
-\xa3\xd2\xcf;\xa2v\x9e\xccw\xf9\x82\x83\xcb\xe1\x9a\x06\
-\x02c\xc2\xab\x9e\x0b\x87\x15\xa17\xd3\x0c\xd9\xcd\x14\x17\
-\xfc\x00\xb2\x0a?\xfc\xd8\xf4<\xe4I\xd4\xfd?s=\
-G\xa2\xac>\xd7qiv)f\x06\xd5|r65\
-B\x7f!]E\x86]\xeb]\x05\xe3\x93 \x9bx\x00\
-\x00\xfe\xb8\xfb\xa0\x10\xa0{\xff\x9c\xcc\xba\x87\xbc\xe7 \
-\xe8=\xa0\xfc$\xc6E\xf3\xa3\x1a\xc4\xa1\xdc\xbd\x87J\
-eN\x7f;\xdeC\x95\x03M\xe9\xacA1p4>\
-\xa0kR\xd8\xed%\xa01/D\xa0\xde\x9a\x14c\xce\
-\xcd\xfe\xddh\xbdT\x90k8<\xfe\xed\xd3\x83;\xce\
-\x98\x8e,w{\xc6|\x9c)\xe8M\x11\x8b\xde%\x1b\
-\xad\xe0%\xdf\xc8\x94\xd0U!^\x08\xff\xdd\xa3kX\
-\xecZ\xf2ug\x8co\x94CckI\x8dA\xe2\xaa\
-\x02u\x19\xcb%P&h\xe2^\x19w\x93\x95\x89(\
-J$t\xc99\x92r 71\x0b\xabE\x05L\xeb\
-2\x18\x91\x8b\xc4\x89&\xa1\x80\x15\xbf5\xbeJVe\
-\x1bo\x81hH_I\xaf,\xd2\x06\x98\xbf\xa7\x96\xb3\
-\xb3x\xb8-\xa7\xbd\x1f\xc3\x22g\x9c\x85O\xbe\xa2\x9b\
-\xcd[\x1a\x9e\xc6*~B\xe0c\xd0SA\xd5x\x99\
-\x8f(\xc3L\x0a5\x95a\x22\xe1\x12\x1aV\xc3\xac\xba\
-L\x8d\xd9\xb6\xc8\xe3r\x8d\xe4l\x8f\xdd\xee\x92Tp\
-D>\x86\xfa\xa3\xe8\xfe\xf4\xfb@\x7f\xde\x918\xd3\xc9\
-A\xc9\xd9#\xee\xa7\xe0\xc5\xfa\x1f\xc2}y\xbar\xc0\
-\x08\x12\xf3W\xb5;\xfb3\xde g!\x0e\xd5\x8b\xe3\
-V\x9a\x88\x8c\xc8\xc6\xd0\xad\xa8$\xc5\xa2q\xe5\x8dT\
-O\xb0\xd6\xed\x1f\xf3\xb0\xd0\xc3\x8a\xd2\xb9M\x11\xae\x1d\
-y\x02m\xa8\xe97\xb9\x0cO\xd2\x08 \x9b\x11\xe8\x0b\
-\xa7Q\x01\xf8\x02>m\x8f\xd6\xd9F7Y\x99\x19s\
-\xb2\x9e\xb4\x1b!cx5i\x82[N\x22\x06\xc9\x7f\
-]\xd9\xa3d{\x13\xc0\x84G\xdb\x14\xfc\xb7U<U\
-K\x1d\xe1\xbe\xa7E\xbe\x83q\x06\xa2\x9eK\xc8\xed\x99\
-Es\xb9\x8f\xe6\xda!\xe3\xd4tuP\xa0q\x99\xff\
-h2\xfc\x96\xdc\x8b\x95\x80\x0f\xb7\x1aW\x03\x81\xe1\x0f\
-\xfc\xd8,\xd0\xb6\x99\xa9\xa9 *,\xe70axZ\
-\x88\xbd\xd6\xf3VK\x95\xb3\xccB\xe1\x1d\xbaO=g\
-\xacqEq\xad\xa8\x0c*>\xd5\x03\xfa\xaagIb\
-\x14\xdb\xceCi\x1b\xe4\xea\xa6\xd9\xd5\xbd\x8c\xa9\xe6\xba\
-\x07r\x1d\xa6\xefc_\x80DT]\xf4q\xa0\x97\x87\
-\x0f\xca\xec\xde\xbf$\xcb\xe1%x\x9e0A-\xba\xeb\
-\x8dX'RX(\x0d`\xc6\x01\xd0q\xb6\xdc\xac\x10\
-\xd9\xde\x22\x0a\x95z6\x01]{\x1a\xbf\xde\xf5z\x05\
-K\x9e\xa58m\xaa\xd8\xd7\x1b\xaa\xbf\xe3\xe6\xcd\x09\xbe\
-?Lg\x85\xb6\x15\xbb8\x06u\x94J\xae\xb4\x86\x02\
-\xc9|\x8a!\x1f!\xfb\xdd\x1blj\xf3\xa8Z\x7f\xf2\
-\x9f\xa3\xcb\xd5$\x0ee\x85\xbc\xee\xe2\x84~O\xd5\x8f\
-\xe2Ri\x83\xdd\x8b\xb6?\x8eu\xad:u\xbd\x07\xbd\
-\x8c\xdb\xaf\xc1\x1cARO/\xf1\x8e\xa8\xdd\x0a\xd4;\
-\xc4N\xf1\x88\x07\xf4\xfb\xf4\xfcZ\x0e7\x1ch\x05!\
-\x09\xc8\xf0\x86\xc6bm\x8d\xbc\xbf\xbc\x99\xb5\xfa\x9a\xce\
-\x1fwW\xa6\x8d*\xed\x0dx\xbe\x81!\xa6\x94\x07\x82\
-\x9e<\xd9\xb6a\xc3OXJtG\x5c\xaa\x0cq\xf0\
-\xbc^3B\x00\xb3\xdf\xaeq|H\xad\xf5-\x9ev\
-O\x22\xa2\xd8\x92[\x10\x0b\xea\x85\xeeC`\xf6\x847\
-\xbdw\xe2\xb5{\x0a~W\xec9\x91\xed.\xdaz\xb3\
-\xf0\xae\x9aI2w\xb5\xda\xba\xd6\xc8\x81\x07\xa2`h\
-\xfe\xef\x93bn\x7f\xacT\xfa27`P\xcbG\xa4\
-\x06\x9a\xb7\xc9o\xc6\x95\x0b\x92X\xf7\xb2pH\xd6\x91\
-\x8b)N\xe0\xe5\xd4p\xa4\xbd\x9b\xd0\xd3\xef\xa8(c\
-\xa4\xc4\x22l\x00Xv\xac\xac\x5czA\xc8Uex\
-\xe6\xdbpu\x18\x11)-\xc1GI\x22\xf3A\x85\xaf\
-\xc6\x98\xa0\x14`\x8e\xc3\xb9$G\x81\x07\x13\xf4\x16\xb3\
-HS\x1d\x5cWw\xa1X\x89r\xe3\xf3\x90\xabK\x88\
-\x8de\xa6\x9e\xa6}O\xa2\xfcl\x98\x14\xb9\x98p\x02\
-\xd56\xcdx\x07`\x9e\x0bC!\xd8b>\x01\xa38\
-}\xd9B\x98\xcf\xee\xe9\xb2\xd5\x88\xf8\xb6c\x15o\x88\
-\x0f\xe0\x07\xd1D\x15\xbc\xb8\xd5p\x11:\xe8\xe5\x11_\
-\x03t(\x9b\xefs\xcd\xba\x97\xab\x01\xd8-\x07\xfe8\
-Xl\xa9\xb6`\xce\xc2\xb6\x10\x87h\xbc\xcc \xf6\x8c\
-\xec\x84\xbf;pj\x1c\x0e\x9e{\xba\xc2\xa8\x83\xa4\x10\
-\x96b\x16\x96\xaf\xba\xe7\xdcj7\x00\xbf\xe3\x99\xd1\x8a\
-\xda5\xdb\x15\x0c\xe3\xac\xeb\xc1\xef\xd5#9\xef$\x5c\
-P!\xad+\xe2\x87\xba\x047\xd4Z|;\xde\x89#\
-\xaf\xb9Q\x19i\xca5Pm\x0a\xa6\x89\xb5\x9f\xc5\xcf\
-\x85~\xdbr\xc6b#rU\x0c\xf7\x8eDU>\xa6\
-+\xfc\xf1av[e\xbc\x86\xf6\x16\xfd\xd4\xf1vw\
-\x81\xfc\x1b\xa72v\xcb\xc5\xa6\xaf\x11(j\x8e\x89H\
-\xb7>Tw\x06\x00\xf5/\xefP\x12\xdf\xaf\xa4\x97\x91\
-:\xf4\xf65\x838<g}\xae\xadZ\x96\x1ec\xfb\
-H\xd8{g.\xb8]\xfa\xa5\x8b\xa1\xa8\x0e\x93~j\
-4\xb1\x0d\xd9\x0a\xc0\xf0yj6\x00\x10\x9aJu\xb5\
-\xffK\x08\xda\xee\x1c\x1e7\xeav\xd8\xc8\x92^\x8a\xe8\
-\xbc~\x87\xc8\xf8\x91(\xf3\x80\x84\xea\x94\x1d\xc0K\xd9\
-\xfc\xaa.\xec\xe0\x18\x08\x8b\xa1\xb8\xd1\xb6\xe2\xb1\xfb\x1f\
-\xec\xf4\xc64\xe9\x9e/\xce\x04|P\x17Z]\xca\x8a\
-\xc3\x04\xd92t-\x1c7=\xd12\xd4\xb0\xf1{\xa1\
-hsFI<\xfbzXv\x9aY\xcc\xebi\xc89\
-\xff\x99\x8dHg\xcb\xd4,[%r\xff\x94\xd5\x80w\
-~\xa1\xbe\x9d\xdd\x00\xef\xfc\x10\xad\xf8`\xfbR\xab!\
-\xb0\xba{\x7f\x9c\xa1\x01\x16p\xf8:o\xb0\xe9|\xd0\
-oF)\xa5\xf9W\xcc\x8c\xff\x0f\xea\xe6\x82\x08\xf67\
-\x08\x09\x09L#\x87U`)M\x00\x00\x00ANM\
-F\x8e\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\x93\x00\
-\x00\x1e\x00\x00\x01ALPH\xb5\x01\x00\x00\x01\x0f0\
-\xff\x11\x11BNm[\xd1\xf0<\xd6?\x90\x19\x07\xc1\
-B\x1c`+U@\xda'\x05\x09\x94\x14,N\x01\xbc\
-\xc7\xcaTG\xf4\x7f\x02\xe4\xd8 \x88\xf5\x01p\x96\xbe\
-DCakh\xbb\xa0\x1b\xbb\xa4*\x1cU\xf5\xe45\
-\xfd\x145\xf3\x94\x14\x05\xa5\xe2\xd1\xbc\x9c\x9a&\x9c\xba\
-&\x9e\xa6&\x9dP\x1f\x8a\xce\xed\xaa\xce\xef\x9a.\xec\
-\xba.\xee\x86.\xed\xe6\x92D\xfa\x92w\xacND\x16\
-6eI\x22\x22}q\xcb\xb3\xf8\xe5Y^\x96\xba\xc8\
-v\xf1K\x03\xd2n\x00a\xe9@\xd85 .\x03\xf0\
-\xbb\x07H\xcb\x04\xdcN\x80\xbc\x00Y\x8eS\x93N\x03\
-\x10\x91\x02\xc4S\x03\x9c\xc8\x03\xf8S\x05^v/\xa7\
-gW\x01w*\x80\x17i\x80('\x84M\xd6\x8cM\
-\x87\xa4\xe9\x107Q\xd36\x03\x82!\x89L\xf0\x9a\x0a\
-y\xf3\xa2y6\x80\xd3\x14\xc0&K\x01\xc4\xe2\x0ad\
-\xdd\x04\xf7@\xd2\x0dx\xb9\x16u\x1d^\xaa\xa9\x81\xaf\
-\x10l\x0d\xbc\xaeB\xb8\xf6\xa2{ \xf4\x1b\xd1Vv\
-\xce6n\x89\x11\xd2o2\x97l\xcb\xf37J\x96\xf1\
-;q\x03\x88\x96\xfe_\xd6\xfe\xa8\xfe\x7f\x94~\x87\x01\
-\xf3w\xc9\xb7\xb2e\xfeN\xe3F\x1a`\xe1V\x07\xa7\
-+\xb7\xe2\xb5\x17\xdd\x03\xb1\xdd\x08\x0d\xbc\xae^\xab\x10\
-t\x0d\xfc\x9d\x07\xa2\xae\xef\x92n\xc0\xcb\x9d\x02Y\xd7\
-\xc0\xd9*8\x01t\x05dq*\x99\x88Lx\xd1\x8d\
-\xbc\xf1\xba\x96E\x86\xa9\xa6M\xd0\x95$\xd2!\xea\xe4\
-\xbbH\x83d\xf8\xb2\xc9\x06\x11\xa9\x803=\xc0\xcb\x15\
-o*@0\x09\x90l\x13\xf2\x15l\xe3J\xbf\xd2 \
-\xdb*$\xdbs\xa5@\xb4\x09\x84\x0b\xf3\xca\xc0_\xe8\
-\xbc\x5chW*\xeeB\xb9\x22\xc8\xcd_W~^\xf9\
-a\x02\x00VP8 \xb8\x06\x00\x00\x14(\x00\x9d\x01\
-*\xa0\x00\x94\x00>\x91@\x9bG\x82\xd7y\xaa\x00\x01\
- \x96\x96\xee\x0c\x0a\xc6_K\x8f?\xbbvw\xfe\x17\
-\x94\xa33GQ}\xd4\xc4\xf7%\x8e\xbc\xec?3\xbe\
-\xfar\xb6x\x14\xfdg\xfd\xa7\xb0'\xf1O\xf2^\xa9\
-\xff\xc8\x7f\xdb\xf2\x83\xf97\xf9?\xfb~\xe0\xdf\xcb\xbf\
-\xae\xff\xdb\xfe\xf9\xec\x89\xebS\xf6\xab\xd8\x17\xf4\xef\xff\
-\xa2\x18\xb9_}\xfe\xfd\xba\xdc\xda\xcb\x1e\x0c\xb2[\x8b\
-Bx2\xe0\x1a\xf2\x06\xc9|U\x8e+\xb3\xdcv\xe9\
-\xe4\xcael\xa9\xb05\x08\xcf\xf5\xe5R\x94\x84\xb8\x05\
-\xac\x03\x14\x8d\xfe\xed\xdb\xd4\x06\xca\x85\x8c\xc1\xac\xb0\xf3\
-\xc6\xc1E2T\xd9\x7f\xac\xa4\xce\x9c\x17\xe2\x17'P\
-\x87\xb9\xb1y \x8a\xa5\x12\x89\xae/\xa9\x99\xb24\x8b\
-\xd7*T{\x16\xa6\x90\xf2\x0e\xe2\xb4}\xbb\xd6\x9ab\
-O\xff\xba:\x86\x08\x06\xbf\x7f\x07Jx\xd6\x0f\x8a\xa7\
-\x97\xa1\xfd\xb5J\xfa\x89;R\xdc\xc5\xcd\xb0\xc4IB\
-l\xb8}#\xa2\xad\xc2\xd6\x8c\x02Tk~\xa9Gt\
-\xc5\x8b\xad\xbe\x18\xf9\xa2\xadf/\xc9\x14\xf3jT\xc8\
-\x17\x19!\x80\x9e\xfc\xfdop\x13\x99\xfd\x82\x16\x0d+\
-BM\xcb\x16\x1d\x11H\x1a\xf4\x93\xf4\x15\x98\x12M(\
-7\xb0\x03\x16\xe0.=j\xb3\x94\xa3\x1b,\xa4@\x9e\
-7\xd5\xae\x80\x00\xfe\xcd\x0b\xec\xb9.!\x8cN^\xb1\
-\xbc\xf6\xa3\xf7p\xb6\x0f\xba\xfbHZh\xb6\xad\xf6\x86\
-\x0e\xe6\xc8\x15\xe6 \x8f/\xc3&\xba\xe7\x11\xb1^\xdf\
-\x1f\x9e\x0c!%]R\x14_\xffi\xa3<T_\x1c\
-@\xdd\x0a$!\xbam\xf0\x8f\xe2\xc9\xeb$\xef\xad\xca\
-\x85W\xdcn\xa1b%\x80\x0a\xd50\x06\x088\xb8`\
-d\x83\x99\x8aB;Q\xfc*\x11\xde\xcf\xbd\x86}R\
-\x98\x10c\xa9\xd9\xc3\xb5\xd6U\xc3\xd3\x0e\xd1N\x86\xc9\
-\xa0\x1a^\xed\xfe\xf7\xadf\x16\xe2\x1aD\xa2\xc6\x9b\x92\
-\xd2\x04\x01\x99\xf6\x14v\x88G\x98\xfe\x00\xc2\x8a\xc7=\
-\xc9\xbf\x09\x9f\xd9v\xbfj\x81\x1b\xefg\xfb\x93\x18\xe0\
-\xcd&\x05M\xfa\xed+\xf9\xabvO\x03\xd8\x17\xad\x8d\
-\xf4A\x84\x89\xcb\x00\x0a\xe5\xcc\xd6&\xee\xea%\xef\x0e\
-\xf8Dz\xb4\xa0\xd7\x90\xfc\x93js\xbfV\x08\x1f\x84\
-\x8dK+\x22u\x94\xf6D\xe2\xcb'\x18n\xe03\x86\
-\x9c\xdesY\x0b\xd6'\x14\x13\xdd\xee\xb0\xe9l\x9c/\
-v\xd0H\x9f\x0a\xec\xe3s\xe9\xcf\xd8a\x5c\xd7\xe2\xb8\
-,\xcb\x7f\x95i- 3_AgA1zu\x0c\
-\x1c\xdc\xf6g\x9a6\x04)\xe1\xa4\xb0Qj\xb08\xde\
-\x95D\xe5\x05H4\x1b\xe4\xc9\x0e\x19J4a\xcb\x82\
-\x8a\xd8\x82Vk\xf1\xa8\x19>!\x0c\xb5\xfe\xd4\xb2p\
-\x8f\xfdM\x9b\x87\xca\xd8\x08\x01\x00\x9b\xfe\xe3m\x03\x80\
-\xc3\x16d\x97\x88[m\x04W\x86\xe8`\x8a1\x1d\xb3\
-\xcd\x0f\xafZ\x09H\xbc\x02K\xfb\xe6\xb2\xb8\x04\xdf\x08\
-\x18\x9c\x02\xbb\x91\xc1\x5cd\xe7\x7f\x7f\xa3\x1drFJ\
-C\xf9\xcfz\xcf \xea7R\x1db\x80\xbc\xfc$\x13\
-\x0a\x07\xc1H\x8e\xf1\xd1\xca\x82\x89f6?\x08\xd10\
-|\xbc\xb1\xa8-H\x16\xf6\x91\xe4$\x95m\xe4\xf0\x03\
-P\xd5\xb3\xaa\x00\x12z\x84\xbd\x0d\xc7\x97\xa1\x10V\xcb\
-\xf4\xff\x10\x8f\xc0ry8\x8e\xadY\x1b\xc4\xf0\x95\x08\
-AC\xbbF~\x1c\x1c$\xd4\xd7s\x84\xb8\xe6\x9aD\
-gYz\x14kHy\x8a<\x12\xfd8\x09\x8b\xccq\
-\xc1\xa1\x8fd\x10\x7f\xe0\xc0\xaf\x80\xc79]\xa3\x97\xa7\
-\x1dn\x8e\xf9:\xb3K\xe9\x90\xfa\x97\x07pf\xb2\x0e\
-\xbc#\xa1\xbf\x0f\x8e~f\x82CHQ\xa2\x11\xc2]\
-\xb5b\xbeV\xc0\x04\xe2\xb3\xd4 NTkf\x8al\
-,\x03R\x19:\x81\xd0\xdegV\xc6\x89\x90\xe1:_\
-\x94$\xdd\x81$\xb6[\x1e\xee\xc9\xdc\xa9\xfd\x22\xa8\x06\
-\xce{kJ%Ls.\x8c\xc2c\x8b\xf9g\xba\xd9\
-\x0a\x0f\xafIml!r\xa2i\x16=\xc1E/W\
-\xe9e\x00\x1f\xc3\xccA\xbc\xbf\xce\xe1\xe4\x1d#E.\
-\x9e\xac\xa4\x90t\xc5\xcd\xeb\x0a\x0f^G\xcc\x85\x7f\xca\
-\xe0u\x98\xd7\xbd+\xc4\xd4\xd4\xdf\xb7\x06Z\xa6\x11\x11\
-m\x85\xb7[p\xf6lC\x9d)\xed]X/0\xf1\
-\xdc@>\x8fGT%\xb1*%\xed\xf8m\xaa\xff\x90\
-\x5c\xa0\xab\xda\xc6q}_9\xa6\xe5\x1a\x0e\x12\x0d\xa5\
-\x04!\xbd2f\xff\xf128\x96\xf6|\xcc\x95\x22\xcb\
-8\x94m\xb4\xfd9\x9f\xe0\x98\xb3.N\xde\xc9[\xc5\
-6\xfd\x8d\x04\x13\xd1=\xada~\xa4\xa8\xa3\x90\xf0h\
-{\xd4`l2\xce!8\xc1\xfcZ\xd9\x96\x8d\xfap\
-\xc4\x8f\x0c\xfc\xa6yD\x9fO\xf6\xb18\x98\xd6\xb3/\
-\x8b\x18\x92\xa2\xc2\xd78\xa2\xf2G%a\x22\x8e\xeb\x01\
-Ax\xfb|\xdeB\xf7w^\xa2\x9f\x22L\x08\xb3\x22\
-\x190\x86=\x95J`5\x97?p\xcf\xe5#\xabW\
-\xd0U\xa6K\x8c\xb4\x8eb\xabeH\x9b\xf3{\xf4h\
-\xf4\xc3\xd0\x1f\xf8\xbe\x9d\xfd\x1e^\xb4g\x06_\xbaq\
-\x9b\xc7u\xca\x08\x17\xd2\x9bk1\xa7\x13te\xee\xef\
-\xfc\xbdx\x83\xfe\xa5\xb8z\xf8\xcbu\x04\xd4x\x0b\x84\
-X\x97\xe6\xcb\x15\x1d\xf6\xe6\xb1\x5c|\xb4d8\x17,\
-\xf8\x1f\xa3@\xab\x9a\xda\xde\xee\xfas\xb5\x19!\x0f\xfb\
-\xe8\xf0\xe6\xcb\x9d\xc7E\x98\xa8\xc4\x07\xef\x1e`\x8b\x13\
-N\x95X\xaf\x1br\x9d\xbe\x9bv^x\xc0P\x1b9\
-}\xcc\x8e\x09\xe8}\xed\xc67~\xa8P\xb3*\xc1N\
-\xf9\xdd/|\xc6\x81\xf2\xfa|\xf3\xfe)\x22\xf8j\x9e\
-\xe6\xb6\x98\xd0v'\x90\xd0\xc2P&\x84\xf3\xc3\x0d\x04\
-\x9eNF\x1a\xf2\x15\x0b@)\xa5x\xc2\xfa@\xf41\
--\xb1\xe8\xde\xfb>\x11(\xba\xe8t(`\xdb\xe3\x02\
-\xc8\xb5\xd3\x95\x0a\x04\xde,\xf0;\xe6\x04(\x82ax\
-W\x98\xe3]m\x12+y\x1bI\xf7\x96\x0e\xe8\x95\xdf\
-\x87\xa9~\xa9f\xc59\xe6p\xe6`\xcd,\xc9\x99\xf9\
-\x15k\xe7\x16\xa4H\x89\xcb\xe0,w\xf0pm\x09\xd0\
-\xa2,\xecnX\x90\x93|:\x04\xa0\xf9\xa7\xcf\xc7\xac\
-V\xfb\xab\xe5\xec\xf5\x19\x82\xd4#\x13\xc8M\xd17O\
-\xba`\xc5b\xa0\xfe\xeb\xb7\x1a\x8bI\xf0\x7f\xba\x1d!\
-\xe0\x14Y\xb7\x09\xbf)\xed\xd8\xa2\xca\xaa>5m#\
-\x1f\x19\x09\x06\xd6c!\x91[w\xcd\x93\xa7\x9ff\xcf\
-\x82f\x8f\x9a\xe6\x86\x07B\xf4\x12D\x07\x80n2\xe8\
-\xf7_\x9a\xd5\xec\x98\x94\x08\x1d\x84\xf1\xffJ\x9f\x86H\
-\xe5q\xd7\xadk\xb9@>\x7f3e\xf9\xfcA\xf0\x8e\
-'\x00a\x9f3\x5c'\x9do%\xa50\x06\x03\x9c\x0a\
-t\xe8m\xebj\xf7\x0f\x88H\x85\x8b\x11f\x1b\x04?\
-Q\x88g\x05\xa4A\xc5\xff\x9c\xe4:d\xd0\x13a\xb9\
-\xd3\x08\x01\xab\x0eS\xf7\x8d\xa5\x13r\xfa\xed\xd5@\xdf\
-K+\xf0\xbdz\xe7\xc2_\xceY\x94\xd2\x8830\x18\
-\xe54!F`\xff\x05@\xf4\xfar\xa8\xf0\x00R\xfe\
-\xc6\x8f\xd1#v\xcb\x92\x00T\xd7\x82\x1f$\xfd\xed\xc4\
-(\x0c\x9b\x81\xe3\xeb\xfc\xa7e\xea\xeb8v-\xb2\x80\
-\x00\x00\x00ANMF\xbe\x08\x00\x00\x0a\x00\x00\x0a\x00\
-\x00\x9f\x00\x00\x8d\x00\x00\x1e\x00\x00\x01ALPH\xb3\
-\x01\x00\x00\x01\x0f0\xff\x11\x11\x82n\xb6\xed\x18\xf0\xec\
-q\xbc?J#X!\x1bX)e:F3\x8a\x11\
-\x94\x0a\x87\xab\xc0\xe3I\xf2\xfd\xb4\x11\xfd\x9f\x00\xb9v\
-\xf0\xf2Z\x01\xdc\xcb\xdc\xe2C\xe1\xe8t\xfd\xe4u\xeb\
-\x94T\x85\xab\xaa\xdd\xbcf\xdc\xa2f\xdd\xb2\xa2\xa0T\
-T\xcd\xc7\xadk\xc2mh\xe2mi\xf2\x0d\xf5\xa5\xea\
-\xdc\xa9\xe9\xfc\xa9\xeb\xc2i\xe8\xe2i\xea\xd2imI\
-dl\xf9\xc4\xeeD\xca\xc6\xa1lIDdln\xab\
-\x9b\xdf\xea\xf6\xb1\xb5\xcdm\xb2\xf9\xad\x03I\x8e\x13\x08\
-\xdb\x00\xc2\xa9\x03q\x9b\x80?U m\x0bp\xa7\x02\
-\xe4K\x96\xeb\xba\x00\xe96\x01\x11)@\xbcu\xc0\x89\
-T\xc0\xdf\x1a\xf0q\xfa\xb8\xd5S\x03\xdc\xad\x00^\xa4\
-\x03\xa2\x5c\x10\x0eY3\x0f\x03\x92f@\x14\x99\x105\
-\xfd\x16\x1e\x92\xc8\x02\xafi\x90\x0f\x1f\x9az\x00\x9c\xa6\
-\x00o\xb2\x15@^\x5c\x81\xac[\xe0*$\xdd\x84\x0f\
-\x9b\x06Q7L:\xf8\x06\xe1\xad\x83\xd75\x08f\x1f\
-\xba\x0aaX\xc4\x01NW\xfe\xa44A\x1e\xff\x9c\xb5\
-e\x83e\x91\xad\xd2\xcb\xfc\x93\xb0\x00\xe2\xcb\xf8\xdf\xd0\
-\xff\xaa\xf1\xdf(\xbdLX\x16\xf9O\xca/\xcbj\xfe\
-)i\xc2\x0b\xbf\xc1\xe9\x0a\xa4a\x11\xcd>t\x15b\
-\xb7\x08\x1d\xbc\xae\x995\x08\xba\x0e\xde\xa6B\xd4\x8dS\
-\xd2M\xf8\xb0)\x90u\x0b\x5c\x01t\x80\x13\x0b\xd9\x9c\
-\xa6\x1c\x16|h*\xe4\x83\x7f\x9b\x104\x05\x92\xc8x\
-\x90[T-\xa2H\x87\xa4\x1a\x84CV\xf5\xad\x01N\
-\xd3\xf0\x22\x15\xf8\xd0T\x93\xc2\x87Hy\x91\xe5D\x04\
-p\xaa)\x22\xb2@\xd4\xe3\x94u?\xb7I\xd2\x1d\x07\
-\xd1\xa0\x9b4\x82A\xc5\x1b\x14>\x0c\x04g\xb1\xc4r\
-\x9a\xfc2\xf9\xf1\x06\x00VP8 \xea\x06\x00\x00\x94\
-&\x00\x9d\x01*\xa0\x00\x8e\x00>\x8d>\x9bG\x82\xf5\
-w\xab\x80\x01\x18\x96p\x87\x00\xfe\x00?@4\x874\
-\x89\xfd\x9b\xb3\xdf\xeb\xdc\xa6>\xcee,E\x93%.\
-\xe6\xec?2>\xf2\xf9\xa8\xf8\xb4\xf8\x03}s\xd4\x13\
-\xf8\xcf\xf9o\xd6\xafuO\xe3\xbf\xf0y>\xfc\x93\xfc\
-o\xfd\xefpo\xe4\xdf\xd6?_}\x88=t\xfe\xc9\
-\xfb\x04\xfe\xa5\xff\xdaI>\xfeL\xf7\xa4\xe9\x0a\xec\xd7\
-\xc3h\xb5\xf8Nf\x05\xd6U\x1e\x19\xd6\xef|\x8b\x19\
-\xa5v\xdahJ\x94\xda\xe9\xb8z\x1b\xe8}\xe5a\x86\
-q\xf7\xf0A\xcb\x07\xe8\xb5`\x9d w\xa7[)\xd1\
-\xad#\xed`J@\xdc\xd5\x1b\xf8\xb4\xa9\xd1\x18\xc4\xfd\
-u@\x13P\xc1l\x04\xfa\x1c\xe7z\xfb\xc9\xb5|h\
-@\xcb\xd6\x09uV*Kx\x06\xb9\xd6t\xf5\xa7\xe3\
-\xbe\xf2\xc8\x85\x08\xaf\xd9\x9ab\xc0\xa8\x9e\xd4\x91\xb1\xf7\
-\x1c\x17\xab\x91\x89\xabnj\x11\xd86>\xb6!F\x88\
-'\xbd\xde\x9c\x0d\xd1e\xea\xec\x8a\xb34\xc2X@\xc4\
-\x06^\x85y\xaa\xbf\x94\xcf\xe7\x8c\xcf\xbf\xde\x84@\xbd\
-\xd0\xc4\xc6N\x05\xfcT\x98\x84|Z\x1b\x84)'C\
-\x92\x00[eD|\xc2O\xd46\xdd\x90h\xfb\x0f\xce\
-\x84h\x95jF\xbd\x1ah\x8a6\x8b\xc0\x00\xfd5P\
-\xc1\xacg\xf9+}\xa1\x16=\x7f,j\xad,\xd7\xf2\
- \x82Eqy\xddU\xab\x13\xf6\xe2\x14\xa16Z\xea\
-U?\x9b\x92\x0c\xc3\x8e\x92i\x1d\xe2\xd4s\x8c\x0a0\
--_\x84\xe2\xb6O\x5c\xa7T\x86Li\xac<\x8c\xbf\
-\xbe\x87\xc8\xef\x09\xf9\xcd;0\x8c\xeeS\xdau|?\
-\xd4\xbe*\x0aqW\xe50\x0a6|NQ\xa9\xb4\xb1\
-\x8c\x10\xc7\x7fw!\xa3%\x08\x82\x94\x05\xdc\x00\xfc\xf3\
-\x0fnA\xff\xf51_\xce\xb9\xd86^\x1e/\xf3\x19\
-\x80\x1c\x96\x93{6\x17h\x80 \x8129\xec\xddw\
-\xb9q\x92:\x5cGM\xcd\x06S\x11oIk\x89o\
-5\xb3\xed\xfd hJ\xbc\x1c\xd4\xb3M$s\x0c\x17\
-\xb2\x16\xbc\xa6\xbc\xb3\xb3#\x86\xe6\xd6\x1b\x1e\xb8\xbcI\
-\xf3V\xd8\xdf5%\xc3u8\x17_\xe0\xab\xbaeY\
-\xd4\xcf\xed\xf5\xf8N\xdd\x1d\xae\xa8\xe8\x0eZd\xeb\xf4\
-\xc5%G\xc2\x00\xf1\xfd?\xc7\x87<7OoL\xab\
-\xe0\xfa/\x0e\xee\xb4\xadb{\x91c#\xee|k\xa5\
-\x02\x027\xd9\xa1i\x94\xe8\xfc\xfeN\x99\xd8d\xe9w\
-+\xdc\xba\xae\xb9v\x86`\x99\xc6)\x05\x1a\xcd~\x1b\
-Q\xed\x91\x19\xcfSvX2z\x87\xe7\xec?\xd1,\
-\x9e\xaeU\xa9\xdf.\x8a\x83?\x1b\x1f\x08\xcb\xd5F9\
-\xe5\x14\x9e\x19o\xb4\xe0\xb6\xf9\xdc\x17\xcf9Ju\x0c\
-\x5c\xcb\xfb\xa8\xdc1E\x8f\xaf*;\xb5eX\xe5\xe3\
-\xc4m\xefc\xfey\xb36+\xdf\xdc\xb8J\xb0#}\
-\xdfRx\x8f3]\xf1n\xd3'O\x87:M\xaeI\
-V\xe6\xfb\x07c\xd4\xb2\xfe\xe5c\x86\xaf\x17\xf7\xa1\xc4\
-\x88\xf6?+w(0\xf6*\x9b\x98\xcf\x13\x0d\x05{\
-x0\x03\xaa\xc1\xe5\x14\x9fcO\xff\x0b~\xb7KI\
-\xe2\x8b\xd2\xb8\xeb\x09\x1b\xdc\x05\x8c9s \x9b\x04Z\
-J,V\xc7\xee\xfa\x93\xbf2\x0f\xc0;>\xda\xc7\xd4\
-\xf8a\x13*U\xfc*\xd6\xb7\x9f\xc5(\x8dV\xfb\xb0\
-zN\xdb\x1e\xb4\xe4\xeb\xbco8\x93\xbc\xf2rN<\
-\xd6\x0b~\x04\xe8:\xac#\xa9RWt-2\x18j\
-\xb9$,\xe4\xf0\x8a\x0d\x81]\x0a\xfb-\xf4KW\xf6\
-\xed$n\xa1hu\x0c\x08\xabw\x9a\xdef\xaa\x08Q\
-Q!m\xb6+\xb7\xaf\x08\x89\xf9\xb5\xbf\x5c\x99\x00\x00\
-\x87\xc5tEUE<\x0d<\xc1-\xbf\xb8l\xa7\xf4\
-\x09\x18\xd9\xcbC*|\xa4\x09\xbd\xa1\x9a\x9c1\xb6D\
-Q\x06l\x1e\xa0\x19\xb2'\xff\xd9\xbe\x1f\xf0\xa9,\xff\
-\x82 d:\xde\x11^T\x01\xa6\xf1D\x85{\x890\
-\xc7\x12g\xdc\xc0L\x9f\xd1\xd7h\xca\xda\xd2\xce\xa7\xff\
-\x0b4MS\x88\xae\xc3\xeb\xd1\xdf\x88$\x9fu\xfe\xdc\
-\xee&\xe60R\x83i\xe7'}\x9aqUIw\xf7\
-\x9c\x05\xc0\xd6\xe0\x8b.E\xe1\xab \x92C\x9d\xad=\
-`\xaftwm\xaboLK\x92d\xee\xef\xf0H$\
-\x9a\x90\xf0~\xc65v\xe6\x8f\x00\xb5\xac\xe0\xd7\xdf\xde\
-\xb4\xad\xc5\xf8\x8b\xa0\x00].\xe5\xa6\x18\x84\xd1Gx\
-X\x8e\xeds\x16\x10\xbb:^|\xd2*\xe6\xe2\xd6\xc6\
-\xf9\xcczm\x11\x85\xf7<\xc52\x95\xe9\x1b\xb51d\
-\xca\x0bRX\x0b@\xfc\x8a\x94\x1c\xa5\xf3\x88\x8b#\xb5\
-\xb5\xc67\x05\x0fR\x99W\xe6\xee2x\x93\xf8h\xf2\
-\x0f\x0f\x16\xeb\xffD\x15\x06\xe7n\xde(N\x22l\x9a\
-M2\x1f/z\xee<\xb8\xfd\xf9\x95\xf8\x0dA\x9a\xb4\
-l\x12ag\xa8\xf4\x98h\xdf\xae\xc2\x0f\xffz\xfb\x5c\
-y|\xabL\x9a\xac\xf0#\xff<\x04\xf3\x02\x0b\xe2\xc1\
-O\x0e\xef]\x96\xfe\x8fa\x0cb\x94\x95\xd5\x80\xac\xf7\
-\xc2u\xb6da)\x0d%;\xec\x9c\xd8\xec\xe6\xe7\xaa\
-yA\xa2W\x86\xf6Q\xa8\xdd^\xb1\x1b\xe8\xcf\xe6\xed\
-\xd3K\xc7P\xf0;\x9d*d\xf2\x82\xc0\xeb\x9a\xe8\xdf\
-o\xc3\x9c\xd1\xbdx6fF\x900_%f\x0a\x0b\
-\xc3\xc9\xac\x93\xec\xae\xb1c,P\x01\x04)\xe0\xe5=\
-\xdeo?\xcb\xc4\xe4 \x0a\xbf!\xf8\xd2p\x8c)\x1f\
-do\xf5\x17\xc64\xdc\xc2k\x8d\xd4o\xca\xed\x8eK\
-\xa2\xb4F\x8d\xe1\x99H\xea\x1cP\xaa\x8b\xb4J\x19\x85\
-`\xd7\x8eY\x99{\x18\xd4\xf8_c\xc8XB\xdb\x1b\
-J4\xfd\xa4Z\xf3:\xaeV\xf2\xacm\xa9U\x85I\
-\xa5\xda\x92\xd1\xebTL\x96\x9cK\x99\xe4\xd1\xf7\xff\x9f\
-\xe7\xed\xd4\x89\xbc\xbd\xe2\xce\xdb\xd8\xdf\xa9u\x06[(\
-\xf8K3\x05\xc8\x1f6W\x94\x1d\x99G\xfd\xe7_\xb9\
-\x8e\x229\x18\x108\xe9\xc9`\xbd\xe5\xef\xe0\xe2n\xb9\
-g\x0dj\x80\xc1\x88\x83#/j\xac^\x8f\x94'\x97\
-\x92\xf9\x9f\xb24g$\xb6\xf1K\xf5\x94f\x94\xabK\
-\x95X\xf4\xdf\x9d\xd5\x82\x0f{\xe616\xe9Z \xcd\
-\xcf\x97\xd8Y\xdd\xbe\xdf\xe4wg\xcc\xb4\x16);p\
-+W\x8cq<#!\xf3=y\xaf\x988\xc2\x16\x99\
-\x16K0e@\x8aB\xc2\xee}}\xce\xb2\xb6\xe3\xfa\
-\x12\xcc\xacY\xcfu\x1f\xeb\xfb\x85\xfd\xc1g\xf2w\x84\
-\xddH\xbf7\xe2w\x8cb\xb3\xe0\xc7cz@\x02k\
-u\xcb\xe0B\xefGR\xa6c\xc1\x0e\xb4\xe5\x1c\xe0\x01\
-\xeaH'\xfd\x0d\xa8\x96)c\xdcP\x8bb!\xb5#\
-&\x8evHU\x0d\x86\xb1\xc6\x14\xb7\xc3_\x11\xfc2\
-\xd7\x88k\xf8^\xe3\xbb\xf2i\x1b\xcc\x0b03i\xb4\
-\xad\xcf\x9d\xfb\x97\x8a\x05\xc4D\x90`\x84\xf6\xdcb\x98\
-\x86\xa6\x07]\xf2\xe4R\xc2\x05\xfe\x9ft\x8a\xbf\xc9\x17\
-\xcc\xbb\xdc [5f\x89\xbb\xd4\x8d\xe7\x0c,1\x16\
-\xd9\xbf\xdb\x02\xe0\xa5\xd3\x18>\x12\xa4\xf6\xb1\xc7\xc7\xa4\
-E\xe8\x17\xf9<\x8e\x8d\xc4\x8b\x0btO\x83;\xae\xe3\
-\xb4\x02\xfa\x9d}$U\x12\xa5\x1c\xf8&\x80\x8a\xbb%\
-\xbaM\xac\x1f\x8f\xbeO8\xae\x06\xea7c\x1e\x9c\xca\
-A\x87\xd8\x8f)\x93yr\x10\xa9\x0f\xfdh}\x073\
-\xd2\xc6\x88\xdc\x07\x1b\xaaj\x09\x7fh\xfd\xe1M\x91\xea\
-\x1117\xc2\xc8W@\x00\x00ANMF\xa8\x08\x00\
-\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\xc7\x00\x00\x1e\x00\x00\
-\x02ALPH\xb1\x01\x00\x00\x01\x0f0\xff\x11\x11B\
-rk[q-\x81\x90>\xd5\x13\x02\xa1\x10\x1a\x84F\
-(\x84\xe0!\x03\xe4=\xb09\xf0\x9a\xea'\x11\xfd\x9f\
-\x00\xf3\xb7\x1f\xd8\xd4\x81\xb8\xa5r\xb5;\xfaM\xdc\xc1\
-m\xdeP\xefpk}\x12\xd7\xceI^*\xcc\xedJ\
-\x13\xfcJ\x17\xc2\xca\x10\xd2\x0a\xeaB\x91\xac\xd6$\xaf\
-\x1dR\xd0\x86\x14\xb5SJ\x1a\xbaT\x16\xacR\x17\x9c\
-\xd2n\x9c)7^9.\xd1\x18\xd3/A\xe9\x17g\
-\x8c)\x97\xa8\x0c \x9b\xeb\x00\x92r\x02\xf1\xe6\x00\xb2\
-\x02\xe0n*\x80P.\xe6\xfebg\x15\xc8\x93\x01\xb8\
-Y\x03\xe2\xa4\x03^\xf3\x93\xa6\x1d\x80\x9b\x14 \xcc:\
-`\xe6@\x9c\x0d\xc8\xc2\x09IJ\xc2\x90N\x88B\x87\
-<\x03\x82\xd0\x00\xc9\x0bU)\x80\x13\x0a`\xef*`\
-\x05\xb3b\x16\xdc]\x83,\x9d\xe0\x85$\x0d\xe1\x80(\
-u\x08\x9b\x0e\xa1CX\x89\x82\x97\x9a0\xc0I\x15\xd2\
-3X\xa9\x08'\x18\x1d\xf2\xc3 /\x9c\xf0\x04ia\
-L\xca\x16;\x89\x0b\xfd5\xdc\xa5BX8^\xa0)\
-~S\xdb\xe2\x1f\xe7\x16\xeak\x84\xcb\xf1DE\xb1\x7f\
-\x0c\xcc;)\xbfpn\xa1N\xda\x16\xffB~\xa1=\
-\xae>\x97\x9b\x84\x85\xe3)\xe2B\x9f\x94-\xf6qi\
-aL\xcc\x163\xc9\x0b\xe7\x13\x9c\xb0\x00\xf9a\x03\xac\
-T\xf6UH\x82\xdb\xd4\xc1K\x0d\xa2\x10\xa4C86\
-\x04!J]h\x90\xa4\x01^\xc8\xd2)T@\x02\xdc\
-\x9e\xa2\x14\xc0\x0a\x15\xb0w\x060b\x03\x8c\x90w\x9d\
-\xa4\x85<\x1b\x04\xa5.x\xa5@\x9au\x9cb \xce\
-\x0e\xact\x12f\x0d#\x0f)k\x1d?\xabi\xc5\xcd\
-J\xd4\x0e\xec\xcc\x04\xada\xc4\x0f\xadfe\xb1\xa4m\
-&\xee\xfb\xb1\xef\xdb\xbe\xff\xed\x01\x00VP8 \xd6\
-\x06\x00\x00\x90.\x00\x9d\x01*\xc8\x00\xc8\x00>\x91D\
-\x9cI%\xa4#!+\xf5\xd8\xd0\xb0\x12\x09in\xfc\
-{\xef!{\xe0f\xef\x18\x7f,\xfc|\xf0\x0b\xfc\xb7\
-\xe4\xf7C\xcc\x03=\x17\xfa0\x8a\x1eK\xce\x06M\xee\
-#4\x8d~\xcf\xfe\x1b\xd8\x03\xf9g\xa2\xaf\xf2\xdf\xf2\
-?\xccy\xc4\xfc\xa7\xfc\x97\xfe/p_\xe5_\xd7=\
-\x19\xbdd~\xd4{\x02\xfe\xa0\xff\xf9#q\x8a\xf8\xc5\
-|b\xbe/SA\x9c\xf0\x8e(\x9ev\xa4\x99\xac\xd9\
--\xec\xb7Q\xddMz\xdb\xa2\x04\xc1\xf1O\xe6\xef\xc2\
-\xda\xcc\x0dg2\x88\x1a]m\xdb\xcak\x05\x22F\x98\
-\xe4\xd9U}@\xe2\x06\x8b2d@-\xbe\x16\xc4\xb3\
-\xafL\x84\x02\xfd\xf5\x05\xdce\xb8}\x98aK\x0e_\
-\xd3\x07\x9d\xd6\xc4\xbc/\xe0\xc26\xedq\x04\xbf!\xb7\
-lu\x83D\xcbE\xe1tB\xf1\x9e_}:\xb9?\
-\x05\x16\xc0C<<\xdd#\xea\x1a\xfc\xa8\xce\xb4\x1e\xe4\
-\x9eb\x04G\x06\xb2n\x84\xa3\x140\xef6w\x7f'\
-\xb5s\xbef\xe2\xc5\xb2\xa9h{\xc6\xdd\xde\xe0\x88C\
-4#\xa0\xaf\xac\xa7Sd`~[\xdd\xef\xbe\xbdU\
-\xdfuU%\xeaDJ\xeaH]8\xe0F\xd4kv\
-~%E@:\xe8\x08\xe5\x00\x1a S\xadI\x5c\x15\
-\x9f@\x0a\xe4\xbb\x86XT\xdd\x98B\x94F\x1d\x16{\
-\xea\xa8\x93\xf4I\x87a\x0b\xf1\xcb\xec\x1d\x87\xdd\xbc\x1c\
-$\xa4\x04[U\xfa\xb1\xed\xad\xde\x06\xf7\xc7o\x8f{\
-\xc5\xbe\xc0\xdf`o\xb07\xd8\x1b\xec\x0d\xf6\x06\xf7\x80\
-\x00\xfe\xf9|\xd8\x06\x18\x82R\x87\x1c\xf7\x90\x0e7\xe1\
-\x83\xae\xe6I\xdbwG\xb5O\xf79\xad.\x9c\xacx\
-\xa2\xa2X\xa1}\x01+-\x9f\xeb\xc9}('.w\
-\xc1\x96\x22HT\xbe \xc0\xd4tu\xe1\x81F\xa1\x93\
-\xc3\xf9\xd24E\xe2H\xbd\x9a\x85\xc4\xf6\xe8\x9d!\xad\
-6x\x9drZ\x83\xca\x13\x09|\x02\xe1\x8e\xcb\xdee\
-9\x9a!\x9d^<\x91[k\xa1-\x86'\xd7\x13\x87\
-\xe9\x08G7z\xe5J\xe2\x94\x1b\x9b\xe8\x9e#\x88C\
-\xf8\x93=Gb4\xf68\x14\x95N\xfb\x1d\x01}>\
-\xcd\xb0\x8b\x83\xcd\xeaZ0\x97\xb0\x9a\x16\xe6p\xb6H\
-\xe9\xef\x06]\x974~\x8a\xc4\x88\xa1Q\xc5\xac\x1aJ\
-\xb7=\xaf\x9a3j\xbc(\xdc\xb3h\x1d>B\x91\xb7\
-gD\xe0\xea\xf7\x88\x01\x0f\x0d\x99\xeb\xa2\xb3\x93\x19\xb2\
-\xf3\xbd\xc9\xa3\x9c\xbb\xed\xe7wH\xef\xe7\xed\x8c\xd0\xd1\
-\x17\x8d\xf8\x09`*\x03\xfd*W\x5c5\xc3}\xcc\x9f\
-DRjJ\xc0\xcc\x9fN!\xef\xf0\x19\xb0BC\xe7\
-\x88O\xb8I\xd0\xe5\xab\xa6?r\xc6\xd2U\xd9\x0b\xf2\
-6\xe6\x97.\x02\xcd\x171\x99\xb0\x8b\xa1\xcf\x99\x13\xb3\
-\xc36\x00?\x7f\xe1\x96T[\x84\xe3\xcd$\x88\x05\xc6\
-\x19\x08\xa1\xeb\xa7\xe6\xce\xa1\x08/$\x91\xf7\xfcRt\
-\x17q\xe5\x9e\x86--\xa4\xb6\xa8\x93`\x9f\x83\xee#\
-\xe1\x19\xb0\xcfN\x9br\xf0\xc3\xce\x08\xcf\xe9n\x8e\xf6\
-c\x08\x02Q\xea\xd5\xbe`\xb1<\xbe\x90\x7f\xfa\x8a4\
-CL\x8e\xaf\xddQ\xfc\xf0\x10#x\x22}|?\x81\
-\xc2{E-\x06WM\xf6\x17\xe7ug\xb0L\x8d\x08\
-\xd6\xcb$*\xb3\xde\xfe\x0c~\xca\x98\xef\xb6\xab\x87\xa1\
-\x95\x0f{\x97\x0e\xdd\xd8H7e\xd4Vc\x82;\xe6\
-\xfe\xcf\xaf\x0e\xdenu\xab\x8c\x02\xd3\xd8\x979)\xb0\
-}\xfcgO*\xccq\xc1\x5c]\x22\xb9m\x92\xfb\x89\
-@\x03sq\xe3CC\x86\xd0b=\x9e\xf6\xd9zs\
-\x95\x09\xd5\x91\x92=\x88\xd34\xde6\xe4a\xee\xeb\x8e\
-E]u7L\x90\xc55B\xe4\x037s\x80\x0c\xfe\
-*K\xcc'k\xc0H\xb3\xde\xed2v~\x9f\xe6s\
-\x80\xd3\xf1qGK~\x10\x03\x13\xcf\xcct\xa1\xdf.\
-\xda\xc8\xdf\xd6\xf34\x11^\x8d\x1bU\xf9H\xf9\x14\xe1\
-\xad\x05q\x82\xd6\x03\x99\x9e\x1824\x00>\x08l\xec\
-f\xde\x16\xb0i*\xba\xf4\x05\x0a\x1cS\x08'`\x82\
-\xd8\xfb1\x9eM\xaa/y\xe0\xc8\xb1\xbd\xa7`?\xf2\
->\xd0wUWv\x07\xc3\x22\x1c(l`\xca\xc29\
-q~\x19\xb3K\x8ad\xa4s`G\xc9\x84\x9bo.\
-\x97u2\x0b\x06X\xdf\x89\xf3\xc6\xa9\xa4\xcez\x8c\xda\
-U,\x082\xebU\x11\xa1\x94\x8fQF\x17\x16u\xb2\
-}\x8a\xf8\xbd\xf8\xae`z\xe3[-\xf2\xd5\x97\x91\xb7\
-\x15[\x9d\xc3\xdd}\xc0\x93q\xe5\xf7_\x02\x93l#\
-w\xcb8<.\x15`;\xf3RG\xf8\xef\x00\xdb\xff\
-\x13\xc3\x00\xbcj{m\xbf\xd6\x18N%\xec\x5cf[\
-\xfe\xca\xde\xaf\xbb\x1d\xaf.\xb0\x5c<\x1f\xcbAK\xde\
-\xd2\x8bA\xa2\xde\x85\x7f\x1e\xad\xa8\xf9\x98\xa7\xfbE\xec\
-\xb2:\xedt\x8b%\x90\xbf\x01\x8c\xdfR\xa2\x04\x09c\
-\x8c\xa1\x1a$\xf2\x965\xbep\xfc\xef5'\xca\xcd=\
-\xd1\xbd\xc0=\x18\xb4\x975*\x81\x14\x93\xbc\x1b\x9cO\
-\x81\x02\xaa\xe5\x5cSTn\xaf\xc6>%crV\x95\
-\xcdB$\xf5\x9djN\x9b\xe4$\x85x\xdb\x96\x05\xd1\
-u|(!$\xe45/\x94\xaa\x94\x94\xd3,\xfe8\
-\xf3\x9f\x1f\xa0+\x11X\xc7C\xc8\xeaU\x02\xd1&\x16\
-\xb2\xb0\xbf\xa3T;l:\xd7\x8c\xfeDp\xa4\xbe\x07\
-\xd0\xe4{W\xd8\x8d^oS\xa6\xef\xcf\x05\xac\xe9_\
-H;\x0eB\x8b\xed\xd1\x8d\x1c\xdb7fAwQ\x12\
-\xfc\x86\xd4C\x89=\x8a/Q\xa8`\xb4\xe7\xf6\xa7\xfc\
-\x12k^+\x1aV?=\x06\xea\x17\x81]\x95\xa9\xe6\
-\xc23\x8d\xf7G\xce\x84\x00\xb7\xbb\xea\x1eh\xff\xa89\
-D\xc4o\x12\x0a>Y\x01\xeb\x1f\x06\xae\xa6\x5c:f\
-G-\x19\xec\xa9&\x05\xfa\x8d\xf1\x1f\x7f\x1b4u\xae\
-\x9a\x1a)\x96|\xcbL\x916\x98\xab\xf7\xcc\xe5'\xeb\
-\xf7\xf7\xb2\xff$\x8fw\x81#f\xc49\xee\xae\xfd\xee\
-\xbe\xb7\xf6\x19\xddH\xac\x98\x9b@\xcf\x05\xb8\x87(\x02\
-\x183\xac@.:#p>`\xb7}\xeaaB\xd7\
-4\xd5n\xae\x1a\xfax&\xec\xe9\xa2\xa1\xad\xf0Tb\
-d\x1fFIS\x9bl\x84*\x85j\xdf\x07\xb3\xcc&\
-\x5c\x87c+\xeaW\xe1\x14\xa1\x95|\xb2H\xef\xc7\xbe\
-3J\x15\xf6\xaf\xf6\xb3\xf6\xbe\xb3\x0e\x04&\xc8\xa9\x11\
-%\x93\xf0\xd8B]\x07a\xdf\xb6\x0aN\x22Y1\x8e\
-W\xc2\x9dZL\xd9X\x99\xe7\x007\xadb\x11O\x0b\
-\x9c\xa24\x1a\xb1\xb9\xd8\xab\xc7Y\x1d\x0d\x16M\xde\x8b\
-\x94\x976\xd6@\x1aXvo\xdb\xa5Z\x9c&\x22\xe7\
-O\xa1\x83\x84X\x06\x9a\xd1|\x95\x80\x9aF\x07A~\
-\xbd\xd0\xb8r\x017}zv&\xab\x13^\xb2\xce\x22\
-\xd6\xc9\x98\x02V\xcaZ\xf0\x14\xab\xa0\x95\x9d\xb8^\xad\
-\xb2\xc0\xba\x83=Lb72>\x87oTyk\x0e\
- \xe1\xc3N9\xdaS(\xcf\x97\x14\x90\xbb*\x7f\x19\
-\xd6\xae\xd6AA\x0f/\x11\xca3>Z\x22\x87.N\
-ci\xf9B\xff\xba\xaa\x7fB\xc20w\x82\x09NM\
-jdL\x118\x04\xee\x96@\x05\xb1p\x5c\xdf:a\
-\x85fK\x83\x0bT2\xd8m\x11\xa8\xca\xc2\x07y^\
-\x054/Z\x7f\xd2\xcf.\x19\x87*m\xdfR\xe0W\
-'\xd0\x00\x00\x00\x00\x00\x00\x00ANMF\x98\x08\x00\
-\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\x90\x00\x00\x1e\x00\x00\
-\x02ALPH\xa8\x01\x00\x00\x01\x0f0\xff\x11\x11B\
-nm\xed\xa0m\xfd\xc6\x0e\x84JP\x8a\xd2(M)\
-J\x10\x0a\x0c+\xf0\xfb\x19\xf7\xde\xf7\xe2\x88\xfeO\x80\
-\x1c;\x04\xb9\xad\x00\xeefn\xf1\xa2\xa0^t-\xd8\
-\xa6\x96L\x85\xa3\xa9\x9d\xbce\x9c\xa2e\x9d\x92\xa1`\
-4T\xcbw\xea\x96p\x1a\x96xZ\x96|\xc2|(\
-6\xa75\x9b\xd7\xba-h\xc3\x16\xb5iK\xda\xda\x92\
-\xc8\xd8\xb2\xc6\xeeDdC)[\x12\x11\x19\x9b\xdb\xea\
-\xe6\xb7\xba}[\xdb\xdc&\x9b\xdf:\x90D\x9d@\xd8\
-\x06\x10\xb4\x0e\xc4m\x02^\xab@\xda\x16\xe041e\
-9.\xc8\x1b\x90N\x13\x10\x91\x02\xc4S\x07\x9cH\x05\
-\xfc\xa9\x01\x9f\xf6\x9d\xaa\xd6\x00w*\x80\x17\xe9\x80\x18\
-\x17\x04%[\xa62 Y\x06D\x91\x09\xd1\xd2!)\
-\xe1n\x81\xb74\xc8\xcag\xa9\x0a\xe0,\x05P\xc4\xbc\
-\x95\x17\xae@\xb6-p\x15\x92m\xc2\xf7,\xda\x06|\
-\xed\xaa\x83o\x10\xee:x[\x83\xf0\xec\xb3U\x08\xe3\
-E\xbc+\x9a\xbb\x9b\xaf\xe4\x12\xd2\x0fY[\xbe\xcb\xeb\
-\x07\xa5\x9b\xf9\x93x\xc1\x83\xb1\xc5\xff\xad\xfe\xab\xc6\xff\
-[\xba\x99\xb0~J~\x95o\xd6O\x9a/\xd2\x84\x1b\
-^\x0dp\xb6\xf2*>\xfbl\x15b\x7f\x11:x[\
-{\xd6 \xd8:\xf87\x15\xa2mh\xc96\xe1{S\
- \xdb\x16\xb8;\xc0\x09p%\x02\xd9T\x94E4U\
-\xc8[05e\xe2M\x1d\xd2\xe6LC\x19\x88yB\
-\x14\xe9\xc9\xb6\xb4h\x03\x82H\x0b\xa6\x02x\x91\xfa\x99\
-\xea\xc1\x99\x1a\xf0\xc9m\x07\xdc\xd5\x00\xe4Gt\xc8w\
-\x0d\xd2\x93xW!\xdc\x15\xf0O\xbe;\x01\xf7`!\
-\x0fg~\x92^\x8c\xf8\xa2\x87\x17\xcd?\xf9^T\x11\
-\x11VP8 \xd0\x06\x00\x00\x90'\x00\x9d\x01*\xa0\
-\x00\x91\x00>\x91<\x96G\xa5\xa3\xa2!27\x08\xc0\
-\xb0\x12\x09in\xe0\xc0\x03\xf8\x03g\xcf\xf4 8\xff\
-\x09\xd9\xe7\xf8^O\x5c\xd7\xb2\xaf9\x84@r(\xed\
-^\xc4\x10\x01\xba/\xd7/5\x8fE\x7f\xb8\xf87\xfd\
-S\xfd\x1f\xb0'\xf1\xbf\xf1~\xaa_\xcb\xff\xcf\xf2\x8f\
-\xf9G\xf8\xcf\xfc\x1e\xe0\xdf\xca?\xac~\xc0{6z\
-\xe1\xfd\x84\xf6\x0e\xfdM\xff\xbao\xb5%\xbdH~\xbe\
-\x01Y\xb3\x9f\x80\xddV\xa1,\xa6\x18\xbc\x11\xc9\xc0\xf9\
-\x0c\xacE}\x8eD\xf2\x00\xfd\xa8\xb4\xb0\xbdA6\xfc\
-}\xf0\xad\xd8\xe4\xde\x0fC\x0b\x22\xba\x96\x07\xf8\xea\x12\
-\x19mfE\xc3\x15\x01\xea\x81\xa3\x1c\xad\xc9\xa2=4\
-07\x00\xce\x92\x90\x92*\xe6\xb4\x97\x1a\xbfxQ\x09\
-\x83)\xcf\xca\xcb\x1b\xc6\xbb N^5P\xb3\xab\x9c\
-\x93\xe0\xde;\xed\xa0\xc9\xfd\xf5\xf7\xc2>\xb8\xed\x83\x8d\
-\xe7\xdf\xee\x0d\xf4\xf0c)m\xb8P,;%\x92$\
-\xcc/\xeb7\xf2\xeacql+\xe0s\xff\xea\xe5\x9d\
-\xaf\x81\xebp\x9c[\xb6V\x05gjQ\x1d\xa2\x85\x99\
-\xedm\xce6b\xe5}\xf6\x95\x01\x8b\xdbPR\xb4M\
-\xe2\x10\xe2X\xeb\xa3\x83\xe8\x1a\xce,\xca\x19\x84\xd2q\
-\x1f\xf9\x1d\x8c\xd0\xd4\x99*V\xe0\xaaJ~\x00\x00\xfc\
-\xe6\xc4S+\xd1\x11\xc3\xe2\x0d\x86=\xd0kU\xa9I\
-\xf5LD\x99\x98f\xbfPn9\x04\x02\x06I\x95^\
-\x9c=\xd5`\x05?;\x99\xa0\x02\xa2\x98\xd0\xe5\xb0\xcc\
-Y\xb6\xa8\x01k\xf4d\xbd\x02\xac\xbc\xbc:/\x15\xf3\
-2\xaf\xd6\xa1\x00K\xe4z*n\xc3\xa0\xb6BZ\xd3\
-,C\xfbC\x0c\x93Q\x8f\xb2T{\xd6a\x1d\xe8\xce\
-\x85P\xce\xee\xa9\x90.m\xf1|%\x87\xfb\xfe\x85A\
-\xc3\x96@`T\xa5\xca\xbe\xd8N\xe4Va\xe0\x0b\xbc\
-\xdc\xa64\x9ar\xc7\x19\x913\xeb\x8d\x8e8\x15\x19\xa8\
-\xde\xc50\x85\x1f!\xc7\x0a\xc6\x828\xb1\x1c\xc7\x94\x07\
-f/\x02\xbf\xa7\xe8\xc2O\xa7\xc6\xcdk9\xe6t\x14\
-\xb7\xcd\xefR\x1c\xfb>+\x8c]\xc7\x0dE\xa9?\xc4\
-\xb9\x1a\xd9\xd4\x16\xddZ(o\xa2\x1a\xb6F_\xfe\xc9\
-\xd7\xcc|I\x9c\xef\xf6\x97\xc2~O-c\xa0\x06C\
-\xb3Y\xbc\x1c\xb7[Ig;\xe3\xac\xde\x1f\x8c\x82s\
-\xcck\x92\x99$W\x90\xb4\xfd\xc5R\x0eo\xf0\xf1z\
-]\xc2\xb7\xa0\xab\x9e\xb5\x04#5\xfes\x17c\x87\xff\
-M\xe4\xc9\x82\x8e\x0f\x8a\xdf\xe6E>\xd3hk\xd1o\
-i\xe4\xad\xe7\xd6J\xbf\xa1G\xf4\x12\xb8\xd8c\xaeN\
-$\xf1\xb2\xee\x1b\xa8\xaeR^L\x0f\x1d\x8du\xa8\xf7\
-4\xdf\xeb\xa9g\xff\xdc\x96h\xa5\xbasGs7\xc3\
-\xcd\xeb\x8dVF\xe4\xf2\xe96\x97I\x07\xb0n\xd4\x04\
-A\x87\xad\xdc\x18\xbc\x99t\xb1!6/\xa8Ci\xfe\
-\xcd\xe9\x9a\x0e?\xeb\xbccl \x88r\xe7\xaa\xf6\x1b\
-\xf0\xd6\x04\xb1\xaa\xb9\x89\xcc\xe2\x89Hu7<\xa0\xb4\
-x2\x9eJ\xfe\xd0v\xdf8K9kY\x8f\x1dO\
-\x9c1\xe8\xd07\xd5\xf3p\xc8\xd0\x03\xae\x8a\xcf\xf1\xba\
-\xff\xc6\xf8^\xb0v\xb1\xb1\x0e\x0f~\xee\xc4\xb5\xa7\xf9\
-.~`\xa4U\xc9\x826f\x9fn\xdb\x8eb\xe5&\
-\xa8\xcb\x86\xc1\xcb\x10K\xeb\xec\xc7X\xe7eE\x7f\x04\
-\xf0\xe5\xb9()L\x1b\x04\xa3u\x9fF#\x85^\x96\
-\xb9Z\xb9\xdc\xdf\xbdiy\xdd\xcf\x92\xd4\x10\xbb\x10?\
-\xdc\xed'\xcc\x07\xd41\x9c?\xe5\xd9\xc3Y\xfb\x7f\xba\
-Q\x89\xe3\xeb\xbclu\xb4\x0e3\x1c=,\xae\x84\x01\
-\x8b\x04Z\xcd\xae'\xb5\x08\x00\x1alh1\xdfZ\x12\
-t\xd5\xd1\xb2\xe3_y\xa9XH\x02\xbf;[-\x98\
-}\xa4\x9dq\x80\x8ep\xf3,\xe9tr\xc9\xcc\xf9\x04\
-\xe52\x8c\x92/\xd0\x9c\x96lD\xb1\xd1\xaf7\x5c{\
-\xbf\x80HJ\xf4\xbdL\x08'\xe86\xfe\x00\x5c\xc0?\
-\xac\x08\xd6\xda\xa0\x05\xaf\xce\xc8\xea'0T\xcbe\x19\
-\xab,A\xd1\x98\xf6\xc1\xcb\xc2\x05n\x1c@\xaeu\x01\
-\xab\xf0 \xf5\x9c\xf2\x8b4Q\xb177*\x8eGC\
-\x99v\xc4\xc2j\x0f}\xed\xbc\x8a\xe0\x04\xefy\xce\x09\
-\xd0\x11\x1b\xb7\xc3\xd7P\xba\xb0\x93\x1a\x96\x08\x03\x9f\x80\
-\x92;4\xa6\xadeT\x08\x1e\xb1\x9a\x0aF\x0dEB\
-\x90\xd2>\xcax\x95\x85A\x92\xe4\xd7c\x14\x09+\xeb\
-r\x1ays\xe5\x90\xeb\xe3[z\xb1\x80\x16^};\
-1H\xd1\xfa\xbb\x840\xb5WT\xcb&Jl\xe2\xa2\
-\xa2\xce\xe6=\xf1'\xf4\x9b\xcd\xd0\xc2Y\xa0\xa8\xacc\
-\xfb-\xa3\xfb+\x8fv\xf1RN\xf8~\x7f/\xcbm\
-\x17\xe9\x18\xb6\x14~\xbfs\xc2n\xb62\xc22/k\
-\x80\xc18\xf4'\xbeL\xc7\x10\xb7\x11\x11\x5c\x02\x84b\
-\xbc!\x0dy\xd51^=\xb1\x9d\xdd\x82e\xb1H\xfa\
-\xb2'\xaf\x91\x00\xb6|\xee,aW\x085f\xb9\x8e\
-\xc2\x09d4\xd2J\x83L\xce\xae\x90W\xafP\x06\xca\
-|\xb4\xe7V}=*\x9e\x00?\x8f8\xb7\x89\x1c\xee\
-\xab\xe1\xbe\x19\x04P\x1e\x03\x5c\x94\x0e44}\xbe\xd4\
-7\xde\x1b\xa2\xfd\xcbL\x02\xc2\x9c\xbb\xc0\xd7\xc0~=\
-m0\x1d\xd2\x97\x09Yo\xa0\xccc\x91\xc5\x0e<\x9d\
->\xc8L\xac\xdap\xcc\x9c\x18\xad\xa8\xd2\x15\xca\xf5\x18\
-\xd3\xad\xb8qb\xa8\x07Ty\x99\xe3p\xfa\x0d\x15d\
-\xdc\xc2\x9d[{\x97{ \x1dp\xca\xaf~\x19\xd6h\
-\x9f\xf5w\xc8\xecVN\xc3\xaaq\x15\xdf\xb1\x8dO\xe7\
-\xd6\xc2%'?\xdd\x09\x1cz\xf9\x88<\xae^\x80L\
-\x90\xa3\xf2\xfd\xda\x01|\xcf\x5c2\xa2=\xb26\x81\xb8\
-.a\x9e\x1d\xe3\xf5\x1a\xbddS\xa0\x1b\xc0\xfd\xc2`\
-\x96\xda\xf3P\x8d\xa5\xf5\x1a-\x91\x08\x0e\xc5\xf7c\x81\
-\xb5\xeb\x0c\xa0\xcd5\x1ba\xc5\xf4\x08R\x0e\xafi\x05\
-\xb7\xf1\x9b\xaeq\xa5o\xdc\xec\xa9\xd5qIf\x9c-\
-\x1fH\xfb\xd8C\x18[\xd8\xd9]\xb1x\x8e\x9dQ\xb2\
-{=\xf1\xe3\xc1K\xcd\xc0\x22\x1e\x06e\xe1\x9e\x0b\x08\
-\x17\x96\x99-\xd5\xddsc\x01`\xf6;<Yf3\
-\x9e#!\x00\x05\x96\x9c^B,\xb3\x12i\xf1#\x88\
- \xfc\xd6\xa3JJZ\x82\xb3\x8a\x03\x00d\xd6\xdf+\
-`Q;\xfb\xd5\xd9\xa1\x85SR\xa6\x7f\x02\xcf\xe0\xa5\
-\x9b\x0bM%:\x8ds=+\x8a/\xb3\xf6\xb2;\xc4\
-~T\xbe/\xe7Y\xa6E\xda\xa3\xa6&\x9b@\xa2\x80\
-\xac\xf1\x05\xb4\xb3*\xbe\x8e\xe5\x9d\xfb\xd1\x8c\xbdK\xfe\
-\xbe%6\xb0\xe4\x86\xbc\x5c\x9e\xea\x98$\xab\xd2\x92J\
-|m\x973\x9f\xe9\x99\xb5\xa4\xad\xc0\xe5ZiD\xde\
-e\xf5\xc0\xfa\x0f\x15\xfa\xa6q[\x96W\x834\x94K\
-\xc2\xa2\x1d\x9fW\xb9\xe1\x9c\xbb\xcc\x86\x06j\xf0\x84*\
-\x01\xa4M&\xc5r\x96rm\x82\xd8\xbcA\xd4\xee8\
-\x12m6\x02{D\xcf\x93\x87W\xf7\xb7\x88\xb0l\x1d\
-\xcd\x19\xdd<\x9c\xdaR\x1e\xd7\xb9\xab\x82\xe5\x03\x84\x99\
-\xba9~\xb4\xb9}\xf7\xa4jU\xf3\xb1v$=\xc4\
-\xcf\x8b\xff\xa8\xbe\x9c\xeebR3M\xa2,\x15\x8c\x0d\
-\xe9V\xa1&\x0b\x12(\x9f6\x8e\xd8Z{QB\xc7\
-\x00\xb4\xffj\xe6\xd0\x00\x00\x00ANMF\xc8\x08\x00\
-\x00\x0a\x00\x00\x0a\x00\x00\xa0\x00\x00\x96\x00\x00\x1e\x00\x00\
-\x03ALPH\xb7\x01\x00\x00\x01\x0f0\xff\x11\x11B\
-nk[\xb5\xedl\x84dB:\xf0)\x05w\x06\xa5\
-Q\xca)\x81\x90\x001\x03`\xb3\xef\xfb8\x8e\xe8\xff\
-\x04\xc8\xb1A\x90\xeb\x0a\xe0\xae\xc6\xf2\xdc\x14\xb67m\
-\x17.\xe6.\xe9\x0aG\xdd{\x0a\xaa~zT\xf3\x94\
-5\x05\xa5\xa6j\xbc\xa2i\xa2\xa2k\x1e\xc5\xd4d\x05\
-\xeaS\xd1\xb9\xc3\xab\x0b\x87\xa6\x8b\x87\xae{\x0eC\x97\
-\x0esI\x22}\xc9\x07V'R\x16veI\x22\x22\
-}q\x9b\xba\x84\xa5.~\xf3.n\x91%l\x1a\x90\
-d;\x80\xb8\xe9@\xdc5\xe0\xd9\x0c \xec*\x906\
-\x13p;\x01\xf2\x06\xc8r\x9c\xaat\x1a\xc0R\x80\xe7\
-\xd4\x00'\x22\x15\x08\xa7\x17\xf0\x07\x7f\xaa\x87\x17p\xa7\
-\x02\x04\x11i\x80('\xc4]\xd6\x8c]\x87\xa4\xe9\xf0\
-\x88\xc8\x80G\xd3\x14\xf1\x22\x89\xc8\x84\xa0y!\xef\xbc\
-\xa6\xee\x00\xa7)\xc0N\xd4\x9bb\xe1\x96\xac\x9bK\x85\
-\xa4\x1b\xe0?\xf0\xe8\xfa\xf2^5\x08K4h\x10t\
-/\xc4\x0fx]]\xba\xc5cP\x0e\xee\xab\x0c\x90K\
-H_fn\xf2]\x96\xf9\xa5\xd2\xcd\xf8bX \xf0\
-\xdc\xf4\xff\xbbf\xe6l\xe4\xab\xf4\xff\xact3@\xa6\
-E\xfeb\xf9f~\xb1q\x07I\x06|\x99\x0eNW\
-\xcc\x9e\x0fx]]\x9aE\x5c\x82\xee\xfd\xc0\x0bQ\xd7\
- ,\xc1\xa0\x82\xd7\xf5\x83\xe8\x07x\xa9$\x8bB\xbc\
-\x98\xe0\xa4\xe0/X\x04\xb9\x13\x91|Qv\x7f/*\
-d\x11\xf9s\xf1\xeen\x1b$\x83n\xf6\x18L\x88\x06\
-\x98\x14 \xdcU\x9b\x17\xf0w\x0dpw\x03\x90\xfbi\
-R\x80|W\x81t\xd7\x80\xe7\xee\x05\xa2M\xb8\xabv\
-\xfe\xae\x00\xce$\x8b!$\x9b\xc7b\x12m\x82\xc5\xc0\
-[t\xc4$\x9b\xb4d\x13M^o\xe3L\xfe\xc9\x16\
-\x00VP8 \xf0\x06\x00\x00p)\x00\x9d\x01*\xa1\
-\x00\x97\x00>\x91>\x99G\xa5\xa3\xa2\xa1/\xb6\x89\xb8\
-\xb0\x12\x09in\xe0\xc0\x03\xf8\x00\xd0\x88\xf0\xb2\x8c\xff\
-}\xfc^\xf0;\xfb\xc7\x0b7(\xa7\xa1\xfb\xa9\x11\xab\
-_\xee\xca\x80\x0f\xab\xbcHq\x8f\xfd\xdb\xc0\xfb\xeb\xff\
-\xe7}\x80?\x8f\x7f\x84\xf5R\xfe7\xfe?\x93\xef\xc8\
-\xff\xc6\xff\xdf\xf7\x06\xfe[\xfd[\xf5\xf3\xd9W\xd7w\
-\xec\xb7\xb0/\xea\x7f\xfd\xc2\xf8\xb7\x88*l\xfb\xf6\x02\
-\xc29\xc2\x19\xa3\xdel\xab \x85\xe0\x9f&E\x8f3\
-\xc3\x22+\xf5\xfay2\x99[2\xb7}\xd4\x80i\xf9\
-\xe8\x8e\x08\x18\xeaZ(\xa9\x1e\x0f\xca\x15\xf9\xa7\x01=\
-q[\xaa\xe8x\x17\xb0\xfa\xd4vU\x87\xa0\xd0k\xa1\
-\x16#\x8az\xb9\x02S\xae\xf4\xd5\xc6\xb1\xc7\xde\x14B\
-\xc2\xcfm>\xad\xeb\xf8x>\x10\xdb\xa0\xdf\xc4xf\
-\xd3\xe6jFIM\xb05o\xf2\x10\x80\xda\x99\xb0\x9b\
-\x96\xb6\xdc\xc1l\x7f\xdd\xaf\x94(w@\x93)\x99\xb9\
-\xd7#Rpv\xa3\xff\x1d\x8b\x9bw9\x00#\x83u\
-\xd2\xc8\xfa(|\x85\xe9D\x9b\x19\xb9%'1\xf7|\
-\x94\x1c:\xc46\xb4\x22^#\x7f\xed\xb7\xf0I\xbf!\
-1\xe3\x19[\xc4\xaa\xa8kZf:/\x90\xf6\xf4\xec\
-T[\xec\x10\xc8\xa1^\xa8i)Y\xbd%H\xf22\
-\xeb\xbe{\x8d\x83\x03:\xca\x16_\xc0\xe8\x00\x00\xfc\xbf\
-\xe5h\xb9\xc4\xe3\xfajk\xa2\xf6\xc7+u\xde\x18\xc2\
-U\x1d\x07\x1b\xa0\xec\x86\xfb\xea;\x7f\x09\xda-ta\
-\xd5\xcc\xa9)\x00\x1e\xe4\x0aE\xc6tHg\xedP9\
-\xad\xe3\x09\xaa\xf1\xf6\xabo\xbcJ\xbb\x08\xd9\x0dN\x1f\
-W9\xd6\x95\xbd)?\xce6\xd94\xa3\xb7\xc3\x9e\xe4\
-\xd6A\xf8]\xdbk\xcf\x7f\xcbq\x1eMZ\xd9'\x9e\
-\xe6\xe3\x00\x84p*\x01^#\x83\xc5\xd6\x89\xf2\xac$\
-\x9ch\xd8\xb5\xa1\x89\x5c\xe7\x10\x06\x80\x8a\xb6f\x18|\
-\xf7\x91\xa8\x9aR\xed\x12x\x12\xbei\x93\x07l\x04\xaa\
-\x9e\x80t\xe6\x81\x154#z\xf1\xd1\xeaGJ+\xa2\
-\xdb\x10\x17\xbc\xf1\xd0\xc13D\xbd\xd5\xf5#\xf0\xcc\x8b\
-i\xcb\xc6U\xb6{)r5<a\x13\xef\x91\x22\xbc\
-\xf4]\xdb\xbf>\xee\x80\x94R\x16\x82\x5c\x91e\x14\x0c\
-\xac\x16\x03p,/~\xf6\x9a\xb6\xe8\xa6\xcd\xb6\x22?\
-\x06\xc9\x1e\x1coJ\x0e\xb9\x17\xdbfk\xbe.\x89u\
-\x0cX\x17U\xbe\xb5\xbb\x0b}\x11\xda~\xc5\xd9N\x17\
-\xe9\xf9\xa1\xa4H\xa2\xe7^Q<\x04\xab\xb9\xd4*z\
-\xd6)\xf2\xb6f\x96\xa7\x5c\xdbn\x1aZ\x85\x0aL\xbb\
-\xb5\x1b]\xe8*\x84J\xc5\xc8\x98X%\x8d\xa6'-\
-\x9f\x11\x92\x8b\x8a$z\xeaF\x001/\x7fn\x13\xd4\
-B\xba\xe9\xf3\xad\xde8S88\x0b$1oW\xd0\
-\xd2\xe0el\xbc6\xf2U\xf4\xee]1\xa6\xfa\xe0H\
-%\xbe[GuG\x04\x88#=\xd7\x1ft\xb8o\xd9\
-\xb5\xe2\xcaJ\x9al\xb3y\x81\x86\x9c\xf0\x18ht\xbc\
-\xab\xe2\x90\x8e}\x14\xfe\xd0\xa3\x13(a5*Z\xb7\
-\xd3=\x15\x87\x84\x83j\xb6GxZ*\x89{\x7f`\
-\x00\xac\xcd\x9e\xf8\xeet4\xfd)\x85W\x82\xed):\
-\x9a\x02\x14\xc4\x22\xcb\xbf%R\xc8\xe753\xd5\x9c\xd5\
-%p`\xdfO+\xb5\xbf\xe4n{'\x02\xe83\xc8\
-;\x16\xf7\xfd\xfeI\xf2e\xe5.y\x01\x82uz\xfc\
-\xd1\x8b\xd9e\x7f\x15\x13\xb1G\xb3-p\x0e\x98\x15\xce\
-\x86\xa6\xb4\xceb\xf7\x13\xbb\xd2I\xdc,\x02\x9f1x\
-\xc7\xb2\xf8\x838n\xff\x1f\x99\x14\xfa?\xc8D\xd5`\
-\x82\xc6>M\xbf\x02\x91\xc1\xe9b\xed\x10\x8d$\xeaK\
-\x8a\xc3\xedRD\x97\xe6ON\xa8\x8d0\xff\xfbT\xf6\
-\x85\xd7\x1d\xf7F\x035u\xbb\xea\xd5\xadi\x91^\x93\
-\xf0@\x13O\x98\xfc{&\xa5a\xb8\xa3R\xe2y\x1e\
-_!VZ\xdb\x02\xdc\x81D*\xa8\xc1kh\x02\xd8\
-^\xa9\xbe\xd2%_e\xa2\xd5z\xfc\xbd\xf8\xbao|\
-RL\xc1\xad\xf5 \xc7\x8aE\xab\xbdt\xa3k\xfb\xd2\
-\xf3\xd5\xfa\xe0\x19\xbb\xf1\xf8zwO\xbc\x14&\xc3|\
-S\x7f:\x85\x0c;\xd1\xd3FG\x1f\xe8\x00\xf1U\xdb\
-z\x9cC\xb3\x90\x81\xe6\x08cl\xcc\x8fw\xef\xf4\x1c\
-a\x1e9`\x80?u[_?g 8\x80D;\
-\x90&`\xe7*2A\xf5\xe2\xbf+\xbc\xb2\x0a%\xdf\
-\xff\xb0B\xd6\xb1\xe2Mb\x061\x92\xd7:,V\x8a\
-1\xeb\xdf\xebfn\x13!@o,\x9e\x80Wa\x09\
-\x0d\xd3\xfe\xfd\xfc\x84T\xa1\xefE\x91\x1b\xbc\xa2\x02W\
-w\xd8\x8c\xda\xf74\xe9\x02sL\xfcA\x8d\x01\xe3^\
-P\xae\xc7\xd9q'L\xca\xa9\x9e\xda3\x13\xc3#\xd6\
-]\xbe\xf7\x15\x1cW\xf1\xaaZ\x84\x87E\x0c\xde\xb9l\
-j\xc3)\x90>\xe8C-\x14\xdd\xca\x08\xb4\xda\x8f\xf6\
-\x12\xf6\xdfIr\xa7\xfd\x97\xf2\x035\xb3G\x86\x90~\
-hX\xcd\xd9\xd8\xdb_\xf3\xe9\xc1\xa6$\xba\x81>B\
-$\xce\xfc\x5c_x\xfd\xae:+\xb5K\x006~\xd3\
-\x13(\xae\x08\xc4\xd3\xce)5\xff\x8c\xc0V\xf0\xe6C\
-d\xb3{\xf0\x00\xb2\x11\xf4\x03\xf1\xa3&\xcd\xcb\xf1\x86\
-\xf8\xfc|\xc9\xc8\x8b\xc6\x80\x82\xce\x12\x07\x19\x95\x90!\
-\x93\xb6\xff\xb9\xd4\xc9\x82\x98\xce^\xf4\xc0\xab\x8e7\x01\
-\xfd>2$L\xfa\xf7\x00\xfd\xbf\x7f\x1f\xf1+\xd5\x1a\
-\xd8?\x93<\x02H\xd3\xe8\xacP\xc3y\xfb\xf1\xe9\x8c\
-:\x11\x8ak\xf9\x1dU\xb0n\xd0\x0a\x04\xa0\xd6Rv\
-\xae\xf916\xa4\x8e\xfe;\x86\xb9D`\xa9\xf9\xfak\
-\x81\xb8\xd5'\x86K\x9c\xa2\xf2{\xfb\xed\xa1\x05\x9fu\
-\x83[D 0cXv`Z\xfe\xdd\xads\xea\x15\
-\xc0Mq\x0e\xf5\x81\x1b\xc1\x02\x0dM*\xf9\xc1L\x93\
-\xe9A\x8a\x92J\xad\xb7g\x03\x96Aw\xc9C\xe2E\
-Q\x17\x9d\xf86\xd6\xbf\xec\x91\xeb\x1fr\x11AP\x06\
-\x17\xd7\xb2\xf2\x0a\xf1\x1d\x89\x15\x5c\x0f\xbe\xa7\x13\x09\x1b\
-\xd6w\x02W/].\xd2\x86T\x09\xfd\xb5\xc5;*\
-c\x91\xda\xd1=V\x02o\x04\xee\xd0\xeej\xc1!C\
-Y\x98\x99\x87(yg\x13\xff\x17\x16\xe9\xdb\x9f\x9a\x8b\
-w)r\xe52\xa6\x1f\x8f\xa0\xf6\xd3M\xb9R\xd2F\
-\xf05\xa8\xc5\x0e\x8f\x8b'\xf7o\xa7\xe0o\xf4\xbc\x17\
-Nf\xf4w\xfe|>\xe1k\xe0HB\xb2\x1b\xe0\xc5\
-Gl\x0f\xbb\x1b\x1c\xf7N\x07\xf9\xc4\xa4\xbc\xa3\x07\xe5\
-\xfa\x06yy\x1en\x0c\xe8\xeb\xa9\xcf\x9b\xe2(\x04\x13\
-\xb9\xa3\xfdo\xdb\xc6J`\x1f\x01\xa4\x93p\xd8^\x82\
-\xcf\x18\xd2\x9c\xefr\xca\x96\xbd\xdc\x1d\x04\x1a8\xfae\
-\x1e)\xd1\xb0\xdd\xc3,\x87\xa6\xeb\x9d\xb6\x031\x807\
-\xdd\xc4\x9f\xc9c\xa4,TE\xf36.Q\x8d\x0c\xf8\
-\x22\x9d\xeb\x09/\x11\x22\xefv\xc1\xed\xa1\x5c\xc0^4\
-/\xc8\xa8\xda\xa3)\xc7{\x00\x9f\x01\x85\xb5Z/?\
-Y\xb0a.\x83\xfd\x82\xabx\x86\xd1;\xebV>\xec\
-@SW\x99\xaf\x83\x1d\xd9\xbf\x99\xb8+\x890(\x86\
-ByHA\xea*\xaf\xe3\xed\xe0\x17v%\xa8^U\
-\x7fT\x08AA?\x92\x82\xf6\x22\x06\x06\xa5\x90\xf2\x13\
-\xfa@-~\x17\xdd\xf6st\x05\x02cR\x85\xd3\x97\
-\x1fI\xa9\x01\xb1\xbe\xa1E\x02\x0a\x06\x0f\xc1\x9d\x1ay\
-5`{\xfc\xd1\x19\x05\x00\x00ANMF\xa6\x08\x00\
-\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\x9a\x00\x00\x1e\x00\x00\
-\x00ALPH\xad\x01\x00\x00\x01\x0f0\xff\x11\x11B\
-Nm[u\x00=V\x0aJ$ \x05+\xe3\x04\xa4\
-EJ$PR\xb08\x05\xf0\xde\x9b\x7f\x1b\xd1\xff\x09\
-\x90k\x87(\xd6\x06\x10,s\xcb\x86\xc61\xe8\xfa)\
-\xea\xd6\xa9\xa8\x1aW\xd5w\x8b\x9aq\xcb\x9au\xab\x8a\
-\x86R\xf1j\x9e[\xd7\xa4\xdb\xd0\xe4\xdb\xd2\xd4\x1b\xea\
-\xcb\xab\x0b\xa7O\x17O]\x97NC\x97OSWN\
-k+\x22c\xab'\xf6 \xd26\x0em+\x22\x22c\
-\x0b\xdb\xbb\xc5\xed\xdb\x9e\xed\xdb\xc2&[\xdc:P\xe4\
-8\x81\xb4\x0d \x9d:\x90\xb7\x09\xc4\xd3\x0b\x94m\x01\
-\xe1\xd4\x80z\xa9r]\x17\xa0\xdc& \x22\x0d\xc8\xb7\
-\x0e\x04\x91\x17\x88\xb7\x0fxN\xcf\xed=}@\xb85\
- \x8at@\x94\x0b\xd2\xa1j\xe6a@\xd1\x0c\xc8\x22\
-\x13\xb2\xa6\xdf\x92\xa1\x88,\x88\x9a\x0f\xea\xe1\xd1\xbc\x07\
- h\x1a`\x93\xad\x01b\x09\x0d\xaanAx\xa1\xe8\
-\xa6\xd7\xf3B\xd6\x0dx>S\x87\xf8A\xb2u\x88\xba\
-\x0f\x92\xdb\xa3{!\x0d\x8f< \xe8\xda\xafT&\x88\
-\xf1\x97ZT\xcbr\xaa^\xc52\x7f%<p\x18[\
-\xfe\x1f\xe8\x7f\x9c\xf1\xefQ,\x13\x96G\xfd\x95\xaae\
-y\xcd_\xa5L\xb0\xf0\x13\x82\xaeA\x19\x1eyP\xc4\
-#\x19^\xc8\x9d`K\xbd\x8a\xf1\xdb\x92\xc7\xf7X:\
-\xc4\x1f\xe2!\xe6\xe12\xe1\xf95\x16\x04\x1b^bn\
-./T\xdb\xe7\xd2\xa1\xd8\x86W\xb6MH6<\x1a\
-\x10M\xaf\xcb\x07<\xa6\x0e\x04\xd3\x04\xc4\xbc<\x1aP\
-M/PL\x1d\xc8\xa6\x09$\x13@\xb4\xbc\xdb\xf3\xcb\
-\x04K\x03\xaax\x14\x97l\x12 \xb9D\xdb\x82\xc7E\
-<\xaa\xc3\xa4\xb8$\x87\xc1\xe3\x12<\xaa8\xf6\xec\x12\
-]\x82\xc7\x0f9\x02\x00VP8 \xd8\x06\x00\x00\xb4\
-&\x00\x9d\x01*\xa0\x00\x9b\x00>\x91@\x9bH\x02\xe7\
-f\xa0\x80\x01 \x96v\xee\x0c\x00\x06Y\xf3\x88\x7f\xc0\
-~-x\x01\xfe\x0f\x94\x97\xd6\xfe[\xec\xe3\xc4O#\
-\xa7\x14\xb8\x0a\x03\x8e\xfe\xf4\x1f\xfd\xbf\xc0\x1b\xeb>\xa0\
-\x1f\xc9=\x13\x7f\x93\xff\xab\xe4\xe3\xf1\xff\xf1\x7f\xf8\xbd\
-\xc1\xbf\x95\xff`\xf4I\xf5\xef\xfb;\xec\x19\xfa\x8d\xff\
-a\x0a\xea*\xfa#\xcd\xb9\xe4E\x1f\x17>A\x85C\
-\xacT\xb4\xa8\x10\xf8\x8fb\xbd\xba\x92\xe1\x90\xc9\xd5y\
-8\x8a\xe5}3\x8d\x04\x1e\xba\x01\x02\xa7\xb7Q\xd4\x94\
-+\xc2\xcd|@!*\x11N\x99[\xf5W\x16\xb1}\
-{\xdf@eM\xf6\x80\xf6fL&\x87\x7f?\xae\xce\
-\xc1\xd2'\x07p\x8a\xb2\x12`\x03\x01]\x055\xd1\x10\
-\x1b\xb7O\x22\xda\xbe/<\x9a\xf6\xb9\xaa\xb2\xb8\x0cV\
-4\x10s\xe0\xb1N\x0bw\xa77\xd2\x10\xc1\xd1\x15\xb9\
-\x86\xbf\xab\xc6\xccr\xd5#\xb3{\xeamW2\xa1^\
-\x16\x87`Z\xf9\x82\xf8!5\xe6E\xf2\xc9&\xbc\x9c\
-W~\xf6u\xdf\xaao\x09\x0a\xa8\xa0D\xd1|\xd2o\
-\x5c\xd4\x16\x9c\xf0\x13\x7f\xeeJ\xa9\x85rQ\x0c\xbe\xbd\
-\x9ctr\x19\xd8\xb4\x91\xd5\xcc\x81O\x1e\x22\xd4D\xe6\
-\xe9\x8a\xb7\xd5\x12\xa0\xdd\x96\xab\x7fi\x8b\x00\x00\xfe\xc3\
-N\xc8\xbc~,\xed\x0d\xb6\xc5\x82\x8a\xb7\x5cJ\xd3\xde\
-\x99>M\xa9h\xe0\xef\xa9i\x8cX7\x01\xf9\xc2\xf2\
-7n\xe76\xeaS\x22`b\xc6p\xbb\xf9\xf4\x8bv\
-C\xf5\x9d>\x9b\xfcX\xa6?7\x0a\xc3I=\xe5\x7f\
-.\xecq\xb9\x14\x80a\xf4\xa3\x22\xc6\x9e9\x049s\
-B\xe3\xbat\xa6X\x85\x01\x00\x91\x91\x11\xee\xefZ\xa0\
-\x1dW\xf0Li\xb5\x84\xe0\x0f\x1b\xa7\xc6\xb2\x14\x18[\
-\x92\xa1\xf7\xe8\x0b\x9e\x0b\xb7\xf9\x0c\xfe\x12\xf0\xf9W`\
-\xd7\x1b\xfc\xad\xca\xcf)\xa4\x07-zP\xf6\xae\xecC\
-g\xee\x96\x93\xb8\xd5\xe9-5\xfe8H\x16|9G\
-\xa9\x1f2'\x8d\x842>E\x01\x95v\xfcF\xe7\x11\
-)8\xbb\x08y\x90&\x11_GVo~\xbf=\x17\
-\xfa\xe5\x82L\xd4\xd6\xe8\xdcq\xad\x05\xc7\x90x\x1dt\
-r\x88\xdc\xa9&\x9f\x1d\x86o\xf2m\xed#\x80!\xe4\
-\x15\xf5\xbb)\x94D\xbf\xc1\x16\x06-\xf3\xcf\x5c\x22\xc0\
-[b\xb1\xec\xc7\xb0\xad\x0dX\xf9\x97\xca?\xbe/\xce\
-{\x0b\xe9M\x0dR\x8e!O\xa4?\xa3\xc3'\xd7\x8b\
-ej\xe6\xed\xdc\xdc\xc9\xab\xabZ\xbaz\x035\xf0\x18\
-\x8bm\x1d\xc1C\x86=\xd2\xec\x84\xfbbT'\x04\x9c\
--?\xd4O\x8b9/\x0e\xe4\xf1\x00\xd2\x8a$>\x11\
-\xf8-c+=u\xea\xd9p\x94AF\xedv~U\
-@\x9e\x92\xc5\xdfK\xe8K0y\xc6+\x82H\xa2\xb9\
-\xd8_\xae\x02<{\x0c\x89\xcf;\xc6$\xb46\x099\
-\xa3Zb&\xad\x9c\x16\xd0#\xd2AZ\x95\xe0\xdbj\
-\x98\x0a\xc0\x15\xea\xfc{\xedh\xf2g*\xed\xab\x97\xc7\
-\x9c\xc1V\xc1\x00\xef\x88JD\xeb\xd4d\xc4\xfe\xa8\xcd\
-\xeby\x82\xb6\xa4\x94-\x0c\x02\x14\x0b\x11{\x5c\x12\xea\
-\xca7\xd8Zq\xe4\xe1\xa7\x9b\xd1:\x7f\xb0\xcf\xdc\x09\
-\xa6\x13&-$2\x82\x9b\x02\xa3\x8a\x1e\xc3\xd9\xb8\x86\
-\x08\xe5\xe6+\x0e\xedY\xca\x1f\xed^\xd5\x1a=R\x1f\
-$\x9e\xae\xe1c>\x08\xcc>R\xc8\x1d\xcapm\xd0\
-\xe4\xbc.\xd5\xe9T\xd3G\xb6\xe7[(M\x0bi\xf6\
-\xb0\x138\x9fh\xa9\x0e\xdb8\xc0\x90\x14ju\x01\x87\
-h\xdac/\xf6\x17B\x14\xb5\x0c \x05\xc4dEf\
-\x83<\x85\xee#\x91\xa3\xcb\x8dL!*\xfa\xf4n\x0b\
-'2\xf1{t\xf8$\x98\x93\xc7\x90\xb0\x8e\xe6\xfd\xd6\
-\xa9gP\xa9\xb4m'\x9cM\xa1\x06\x90\x81\xca\x05Q\
-\x8d\xcd\xf5y2\xb2Y\x9e\xaa\xf5\xe6\xa0\x05H\xa9\xc9\
-\x8fbV\xb09J\x08\xfb\xb1\x9c\x99\x22M_\xe9\x83\
-\x18\xd87\xb1\xe3\x990\xca\xdb\xbb\xe8-\xe7\xb3\xcf\xca\
-oK\x84\xcd\xcf#\xff|\xdd\x98f\x96\xe7\xf5\x82\xab\
-\x9ck\xa9\xb9\x80\x15\x02QVc\xe5y\xaca\x0e]\
-h#mt\xa0\x8c\x9f1>\x8d\x091\xb8\xc1D\xe7\
-F>\xee\xbf\x97\xcb\x16\xd5\xca\xdcHGz\x9c\x00@\
-\x8b\x95\xbbg\xcd\xb2\xf8\xc5\xd8\x00\xce|\x81\xe3\xe8\x9f\
-\x0cj\xcb\xf8\x7fO8\xc3\xcd\x8d|\xbe\xe9\x22\xe6I\
-*\xc0a\xa5d5\xf0\x88\xac\x82+`\xb9\xcaj\xa9\
-\x98\xa5\x07D42\xd1j\x9bwn\xad&?\x9b\xd8\
-\x17\x12m\x8e\xd3h\x82RK\xe8\xc7;\xc4\xdf\x85\x0f\
-\x0b\xc3\x1bzbo\xb0\x94\xb6j\xe9\xb7\xf8\x1a\x06\xa9\
-\x94\x19\xc0\xf3]4\xc5\x98\x91\xfe?aS>\xf1\xbf\
-\x1b*\x07\xf5\xe0J\x00\xe8\x1e\x9f!U\x17\x92t\x12\
-\x0f\x8e*<\xf2\xbc\x02jz\x9f\xb2\xda\xb2\xe1\x9ac\
-\xe5\x88<\x12u(\xfb\x07\x8f)\xb5\x05\xed\xc5\xc9A\
-\x97a\xa3s\xef\xeaeM\xc1z`\xa7\xc1\x0f_\xc5\
-Z]\xc8\x92\xa2H\x0c\xd4\xa5iO\x05\x0a\xa4\xe3\xd7\
-\xf7\xb4\x0e1_\x9fI\xf7\x84^\xc7\xd6Xi\xa8\xf8\
-\xfew`+TU\x1bu\x9f\xc2\x90\xb9\x0b\x1d\x16\xbf\
-O\x8d\x8f]\xbf\x16\xd3T\xeeY1\x12/\xb6\xa0\x05\
-\xfb\xa2LK^^f\x9f\x1c. \xa5\x0e\xbb\xc5;\
--m\x12\x96\x861\xae\x9f\xa8\xf4\xda\xf6\xee\xcf\x0fw\
-qp\x187\x8d#3\x82~\xa7Z\xd9\xfd\xf9\x9d:\
-\xbf\x19s\xfc\xf3\x96\xe8\xfbC`\x16\xf9\x14\xaa\xba\xce\
-\xe8\x0e\x9c\xb5\x8fI\xf8\x14X\xc5^\x7f\xa1RY\xd9\
-#\x83\xd8\x94\xe1~B\xbd\xa3h>\x95n\xd4\xf5j\
-\xf7\x7f\xa2\xee?\x19\x00N\xacbu\xcf\x006\xa8Q\
-\x9dPz\x18\x86>\xab3\x82C\x97y\xa1\xa5\xca\xf6\
-\xfaF\x9d`m\xab_\xea\xebQ6\xf0fgP\x0e\
-,\xb0\x91$%\xda\xc0\xb6\x1a\x96*\x01\x9e\xec\xed`\
-;\xd9\xf3\xa2\xfd\x872\x9a\xbb\xe2.'kq6\x97\
-\x18\xc1V\x12F\xcb\xcf\xa6\xe1\xc6\x00G\xd7\x11|O\
-\x81'\x052\xfdh'\x90\xe7\x90\x05g\xdf\xf9\xba\xf3\
-)+k7X\x08\x9c\x05\xca\xbaF\x0d;\x5c\x99\xdf\
-\xe4\xf6ed\xb3\x93\x86\x1c\x1b\xa1W\x94%,\x16\xc3\
-\xba\x93\x12&\xc4\x0d\x0c\xbd\x83\xc3\x02\xee%\xfc\x19_\
-\xc6(\x1cA5[D\xf7\x88\xba\x5c]a\x1f\x97\xb7\
-W\xeb\x92\xcb\x17\xc9\xbd\x19\x1a\xc6\xa5\x14\xdd\xa5\xf0\xcd\
-\x7f7>M\xc4\xf5\xf4\xaf\x8bT\x9d\xd5\xdb\x926'\
-\xc5Ii\xcd\x136\x83N\xd0]\x8b\xb1f\x9eJ\xa1\
-\x88\xdc\x03\x88Q\x0d\x10K4\xa4\xc9;.vn\x96\
-\x84\xaa\x82\xa5\x9a\x5c\xb4\xd8~\xb6F\xbb\xdbv\xe16\
-\xc0H\xbb\xa74x\xd4w\xe8\x1c\xb48\x1c\x5c3\x8e\
-\xc1|m\x87\xa4%ky\xc1\xa5;j\xed\xb9E\xa1\
-\xda\xf1\x03)\x17G\xa8@\xd3\xa7\xc6\xd8dm}^\
-\x0e\x97\x0aKHK\x9d\x83}\x01d\x91|5fc\
-\x07\xd6M\xaau\xcfJQ{\x84\x9fZ\xcbZ\xf6\xe3\
-\xff\xd0OfU\xf0\x131\xed\x9e!\xdcr\x81h\xe3\
-\x81)\x1f\xbf\xf2\xc3\x00\xb5\xf02\xb2-\x0b\x1fj\xc3\
-X/2]f\xa5\xb7\x83\x8c\x15\x8b\x13\xbf\xb6\x91\x0c\
-\x93C\x044j\x00\x00ANMF\xa6\x08\x00\x00\x0a\
-\x00\x00\x0a\x00\x00\x9f\x00\x00\x9d\x00\x00\x1e\x00\x00\x02A\
-LPH\xad\x01\x00\x00\x01\x0f0\xff\x11\x11\x82n$\
-Y\x95mk\x11\x08\x88\x98\x80\x1b\xf7\xf7\x1e\xa6\x0d\xa6\
-\x8d)c\x02\xe2\x08\x04%\x00k\xad8?9\xa2\xff\
-\x13 \xc7\x0eY\xac\x0d X\xc6R\x0c\x8d\xad\xa1\xef\
-\xb2n\xec\xaa\xaaqT=\xa7\xa4yOE3OU\
-\xd1P*nM<uM>\xbd\x9ar\x9a\x9a\xeb\x84\
-\xfap\xeb\xc2\xee\xd1\xc5]\xd7\xe5\xdd\xab+\xbb\xa1\xab\
-\xbb\xb9T\x91w\xb9v\xacA\xa4-l\xdaRED\
-\xde%,\xf7\x92\x96{\x89\xcb\xb3\x84E\x96\xb4t\xa0\
-\xcav\x00yy\x81\xbc\xeb@Y\x06\x90v7P\x97\
-\x09\x84]\x03\xae\xc3%\xc7y\x00\xeai\x00\x22\xd2\x80\
-|\xea@\x10\xb9\x81tz\x80\xb8\x8b\xa7{\xf7\x00\xe1\
-$@\x12\xe9\x80('\xe4\xcd\xa5\x19\x9b\x17\xaa\xe6\x85\
-\x222\xa0h\xfa)\x1b\xaa\xc8\x84\xa4y\xe0\xdaD\xcd\
-\xbd\x01\x82\xa6\x01\x1bQ/\xcd#4\xb8t\x13\xc2\x0d\
-U7 \xba\x15\xdd\x0b\xf11uH\x0fd[\x87\xa4\
-{ \xbbE\xdd\x0d\xf9\xf5(\xb6\xb6\x0b\x1fc\x80\x18\
-\xa1~\xa4\xcb2\xa9\xd3\xe3\xf2\xaa\x96\xf1\x91\xf0\xc0\xe1\
-]\xcaO\xa6\x7f[\xef\xcf\xa3Z\x06\xcc\x8fr}\x90\
-\xb9D\x87Q\xc5#:\xd4\x7fb\x86*\x1f\xa2y\x95\
-\x8fq{e\xdb\xf3a:\xa4\x8f\xf1\xba\x0c\x88\x1fc\
-B\xb0\xe1%\xe6\xe6r\xc3e{\x5c:T\xdb\xeb2\
-\xa0\xd8&\xe4\x0f\xd1\x80d\xba\x81hz\x5c:\x10L\
-\x03\x10\xf3\xf4h\xc0e\xba\x81j\xea@1\x0d \x9b\
-\x00\x92\xe5Y\xa2e,\xc1\xd0X\xc5x\xbb\xb4\xa5\xba\
-\x14\x97\xec\x92,\xb2D\x17\xf1\xb8\x5c\xaamBvI\
-.\xc1\xe3\x12\xfb\xa0\xb8$\x97\xe0q\x89\xe3\x9b]\x82\
-\xc7/\xd9\x03\x00VP8 \xd8\x06\x00\x00p'\x00\
-\x9d\x01*\xa0\x00\x9e\x00>\x91>\x9aH%\xa3\xa2\xa1\
-0U\xf9 \xb0\x12\x09gn\xe0\xc0\x01\xaf\xe7\xfa\x10\
-\x18\x7f\x8b\xec\xef\xfc'\xeaG\xf8\xce\x86IK\xd27\
-\x86}\xea\xdc\x93\xd8\x15^;\xf0\xf1\x13\xf5\xdb\xa1\xef\
-\xed\xde\x09\x9e1\xec\x09\xfck\xd1{\xf9\x9f\xf9\xff\xe4\
-\xbc\xdd\xfeS\xfe\x07\xff\x1f\xb87\xf2_\xec~\x8a\xbe\
-\xb8\xbf`=\x84\xbfQ\xd1'\x16\x04\x86\x88\xf1]Z\
-\xb7\xe2\xa9\xdf\x85\xac$X\x07\x13\x08o\xb5\xc4\xbd\xe5\
-j\xad\xd5\xa2\x19\x0cd8\xdb^)~\x9b\xd9\xfcV\
-\xfa\xb0\xb4\xcc\xafa\x02\xdb\xfd\x84b\x12\xd9S'8\
-z\xfd\xbc\xf8E\x5c\x9a\xb9\x8f\x15\xf2\x06\xa88\xfbr\
-\x1c\xe1\xd7\xa4\xcb\x93\x10U\xb6|0\xf3\xc3J9\x1f\
-\xec\x89\xae\xbfy\x13\xe0B$\x81O\xea\x03\xe8[\xf1\
-C\xd5\x82A0\x89\xe2\xffvF\xd5\x5c\xa2b\xb7\xb4\
-\xd4ox\x0e\xf8A\xab9\x13\xafx\xd7\x00\xc3\xb9\xd2\
-\xb0\xc4\xdd\x81\xdcr\xf4\xa0\x18\x10s\x0f\xcd\xb6\xe2\x8e\
-\x08p\xcc\xb4\xb6]B\x8cg\xbce#\xa7\xf5\xc6m\
-\xdd\x11\xc7\x91\xbc\x1b\xfeN\xbb\xb0\xb8|\xfb9\x16\x11\
-\xb0@\xe1k\xab\xf96\xf8S\xa3t\xa5\xfe>\xe8\x0b\
-\xd2`=\xf3e\x98\xfc;\xda\xf1\xbb\x91\xcdC\xa2&\
-\x00\x00\xfe\xc8g\xe7\x92\xa5\xe0<\xb6\x9d\x9f/E\xe7\
-V\x7f%\x07j\x1b9\x12\x85\xaa\xb3\xdd9\x84\xc4\xa8\
-\x09\xaeP\x12\xd3\xfc\xbbr\x15\xba_\xe0E\x94\x8eC\
-e\xb8`\xb4Cc\xfa\xe1\x12\x1cX)8a\x8c\xf8\
-\x85\xd3\x8b\x17\x10\x80\x08sI\xe7C\x85\xbe\xde\x00\xa5\
-\xdcW>\x08\x9dt\xcb\x98\x03\x0f$\x93Q\x85\xe5\xf5\
-\xe9h\x1c\xc2H}%\xadf\x01\xb5\x13`\xaeE\x89\
-\xf7\x05\x8e\x12r\xb9\x1c \xbe\xde$\xfc/\x18\xe0S\
-I\xd8\x1b\x80\xb2\x99\xc9\xcbs\xa7\x9f\xa4I\x89\xdcA\
-\xc0%\xf5\xeaV\xa8D*\x8en#\xaf+f\x0e\x89\
-\xedP\x00\xa2^!\xf8\xdc;\xa2\xe2\x10&x\x1d0\
-\xa7\x7f\x8a\x96g\xbfX\xeeV\x08\x1d\x0a\xaf\xb0\x03\x11\
-\xa6\xb9Y\x9e\xc0TN\x9f\xe8\xdb\x81#\xff\x03\x92Z\
-\xfd\xb3(\xb3\x90\x90\xfb)\x17\xc6,U\x11\xde\xf0\x1e\
- \x06\xacx\xf1Y\xaa\x1d(\xf9\xc3\x84\xef\xeax\x10\
-\xc6\x1f\x87\xcd\xf8\xdf\xd7\x03\x16.l\x83'Y\xf1G\
-\xc0j\x0c\x0cr\x02\xfcV\xd7K\xb9\x22\xe1\xd7s]\
-3\xee\xd8\xdaY=\xdd\x8f\xfd'\xfa\xee\xf9S~\xc0\
-k\x9b!\xfc\x99\xd4ZB\xa4\xac\x8a\x8a\xddl\xca\x11\
-\x9d\xcd}\x14-EL\xafL\xd2]\xee\x91\xc6\x88\x9b\
-\xc6\xf7\xb4\xec\xee!\xdf\x16\x0c\x80\x8d`\xcf\xe9c\xde\
->v\xb4\xa7tUYf+\xec\x1e\x86 \xef\x15\x06\
-us\xbb<@i\x8d\x19=w\x09\x07h\xd6\xbe(\
-|\xb7\xab\xac\x91\xab\x1c\xb6dTMj\x9c2\xc8\x96\
-\xe1=\x07Y8\xf0\x9a\xecrE\xef\x83\x98^\xcc\xa0\
-\xb9\xeajt\xcbf\x8f\xf9?x\xeb\xdf>^\xc3\xc0\
-\x17\xfe\x8d@i\xd8\x86w\xdb\x99\x0f>\x8fG7\xfa\
-w\xc9\xf7\xcb;0G0\x03\x82\x8aF\x9e\x8e\xdf\x82\
-f\xf9\x12\x92\x0a\xf0\xc6J\xef\xbeG+z\xdd\xda\xd5\
-\xb0&\xaa z\x1b\xf3\x05\xd3%\xa31\x8b`\xb6\x9a\
-\xd9B4$\x12\xa5\xe5\x0a\xc1\x18\x8a)\x95\x02Z\xc6\
-\xf9D\xa8?\x96C\x17\xc4gI\xf4\xa7QF\x95\x12\
-\x7f\xdb*=}\xde\x18W\xe7\xaaaKw\xe7\x94J\
-3\xa8QUzX\x1c\xbd}\x0f1Pj}\xf1\xcd\
-\x00\xa7`t\xed\x00\xf0\xb2\xc3=sx(B\x09\xdd\
-\xd5\xed\xa3g\xca~\x8d\xb4\xd1\x9b\x00\xd4\xf92\x0ed\
-\xd2\xcf>\x9d\xa3\xe4\xbe\xa5\xecU\xe5\x16\xcf\x90\xa2\x0f\
-\x80dW+\x81\x98\xec\xd9'\xc3\x09\x17e\xf2\xb9k\
-eH\x9f\x8e\x03\xf5\xba;\x0b\x01\x0d\x02\x81\xb3\xb4Y\
-\xc1?\xdc\xd9d\x9b\xe8\xd8\x00\xc1\x0b*\xe3\x86\xd8\x00\
-\x8d\x89#\xe5\x90\xce0\xdc\x8e>K\xa7\xaa\xb8B#\
-\xf2\xa2\x00\x90\xda\x0a$\xec\xb6\xc9\xee{\x09\xf7\x7fr\
-QFpdyv1\xfb\xf5jy\xcfcqJ\xab\
-\x00\xb0\x06\xf2!\xc2\x8b\xdb\xc8wkh\x08>\xf6e\
-\xa0\x1dC\xa3|\x9c\xfec9e\xf7ob\x5c\x8cC\
-o7\x80\xf4/\xd9W\xc5kz,MMB\x9a=\
-\xb5g\x92\x17z_\xdam\xb4\xef\xaeC\xb9\x80\xe4\xbd\
-\xc9\xe8\xf5S\xb7Z.|\xa0\xe9\x17O\x9f\xfb'\xa2\
-\x18\xd1\xcch/g\x92\xden\x22\xcd>\x00\xe5H\xcc\
-\x11\x04\xa3c\xa6k)\x89\xd5\xca\xb7\xda\xc9\xcc\x0a\xc6\
-\x86#e\xd7\xf9o\xf1\xded\xddH(\x1b\xbe\x19\xf4\
-1\xfd`\xc9\x0b\xf5\x96k?J\xc8{\x94\x81a\x94\
-x\x08 \x0e4\x89'\xb2\x11\xf1]\xeb\x8f*\xd8u\
- \xc0\xc6i\xf8U\xe6\xa9\xce\xd7*AD\xdf\xcbX\
-\x16C\xc7\x99\xc3W\xf9\x1e\x92\xa0Q\xb2\xb4o\x8d\x06\
-\x9b\x93N\x1e\x00\xf5(&\x93\x9c\xfa\xfc\xfc\xbfD8\
-\x7f\xfe\x92\x83y\xdeG\xd8\x01\x9d\x81\xc7\xcdte_\
-8mM\x1amU\x81\xf2D\xea\xb8\x7fP;\xea\x85\
-\xcb\x170\xc4~Xk\xb2\xa0\xc4\xe7(-\x93c\x92\
-\xdc\xf4e\xa6o\xe3\xc4\x12$\x11t\x8b\xca%\xb2\x0a\
-C\x01N\xa7\x91I\x19\x9c\xe2\x0eg\xf6\x1c.\x88\xfa\
-\xfc&L-R\xf6^I)\x00\xa2\x11.\xfb\x82\xcf\
-|\x80m\xf8\x1c\xf3\x80\xc0\x1d0\xed&\xbdJ\xf5|\
-\xf0\xe9\x1f\xac\xb5v\x03 \x00\xa2\xd8\xf3(\x8cu2\
-\x1c\xe3\xb4\x1f\x22\x9e=\xdf\xd7\x03\xb6\xd2\x85\xc4J\x89\
-\xfbe>\x19\xefT\x89\xc53\xb0O\x91\x8e)\xc3\xa3\
-h\xd1W\xa6G\x0e\xcb\x81FO\xae\xd0\x98k\x91'\
-\xdf\xb6f\x19\x15\xc8r\xa6\xf0\xac\x96\x00\xfb\xef\xd9X\
-\xd3\xb6\x96\xbb'7\xe1\x0f:\x80\xf0\xe4\x9f\xed\xd40\
-\xfe\x09\xaf\x95t\xf5\xeae\x0f\xce>X\x1a\x1eR\x0f\
-\x0f\x1e\xe5\x02r@(\xf4\xea %s\xf6\x8c\x89\xd2\
-\xe8\x8d}\xf90\xcd\xd5d\xa5\x1e\x89\xc5LC+\x80\
-9\xb0.\xdcX\xd0{\xb6\xc2s\x5c\xf0i`\x18\xde\
-dS=q\xbdR\x80W\xcc\xed\x5c;\xb7\xf9\xb3%\
-\xe9\xdcA\xc9\xf4\x95\x5c\x97s6\xaa\x84<F\x0f\xfd\
-\x99\x14\xc8\xe1\x98\xa0\x9e\x17\x833\xb7\x96\xf8\x0d\x06L\
-\xd3\x08\x80N\x81\xce\xaa\xf1>O\x0e4\xf8\xf5\xa9\xbc\
-\x84q\x14\x85\xa7\xecp\x1a\xbc\xcc\xec\xb7^\xb1\x07\xf2\
-\xc0D\xe6)\xc1\x06p\xc3\x9dd\xcf\xae_\xee\x16\x8d\
-\x0b\xcc{\xb4\xc0B\x1c\x9c3\xb5%\x9e;\xbb\xadj\
-\x8a\xdc\xa1\xa4\xcc\xf3y\xe9'\xb5r'\x97\xce\xcf\x88\
-\x9cg\xb3\xec\xf9DF\xa5i6KSR\x96\xc6\x09\
-\x1d\x0d\xe9\xc2\x92\xd3\xd3m7Ut\xd7\xcc\x15\xbb!\
-;\xa4/\xeeD\xb1\xb3\x89\x1dD\x93\xe6l\xf1\xca'\
-&'\xf5\x11f\xa8\xc0\x19L\x0e\xe1?-\xcc\x8eM\
-V\xb4\x22\xd1\xda/\xc0'\xdaQj\x07\x1d\xd3\xeb\x81\
-\xb2%]\xe8\xdb\xf4\xaf3\x03\x89\x1b\xbc\xee_\x04<\
-\x19v\xbb\xca\x98\x84\xf4\xed\xb8r/h\xbd^\xc4\xd2\
-H\x0e1\xa0/\x8a\xf09\xabq\x5cH\xb52\xfe\x81\
-\xfd\x83\xbb\x00\x00ANMF\x80\x08\x00\x00\x0a\x00\x00\
-\x0a\x00\x00\x9f\x00\x00\x9f\x00\x00\x1e\x00\x00\x02ALP\
-H\xa5\x01\x00\x00\x01\x0f0\xff\x11\x11\x02n$I\x81\
-\xa4!V@\xc4\x83\xc7\x14L\x03\xd3\xd6\x945\x01\x11\
-\x81\xd8\x12\x80\x99\x89\xbb\xff\x97#\xfa?\x01r\xec\x10\
-\xc5z\x03\x04\xcbX\xb2\xa1\xb15\xf4]\xd4\xcd]Q\
-5\x8e\xaa\xe7\x145\xe3\x945\xef\xa9(\x1aJ\xc5\xad\
-\xb9N]\x93NC\x93O\xaf\xa6\x9cP\x1f\x9a.\xec\
-\x1e]\xdcu]\xda\x0d]\xdeM]\xd9\xbdK\x11\x19\
-K\xdd\xb1\x06\x91\xb6\xb0iK\x11\x11\x19KX\xee%\
-.\xf7r-\xcf\x12\x16Y\xe2\xd2\x81\x22\xdb\x09\xa4e\
-\x00i\xd7\x81\xbcL \xeen\xa0,/\x10v\x02\xd4\
-\x05\xa8r|5\xe54\x01\x11i@>u \x88\xdc\
-@<=\xc0\xb5\xbbN\xf7\xee\x01\xc2\xa9\x01Q\xa4\x03\
-\xa2|!m\xaafn\x06\x14\xcd\x80,2!k:\
-\x94M\xb2\xbd\x105\x0f\xd4\xcd\xa5\xb97@\xd04`\
-#\xea\xa5y\x84\x06U\xf7B\xb8\xa1\xe8&\x5cnY\
-7\xe0zL\x1d\xe2\x03\xc9\xd6!\xea\x1eHn\x97\xee\
-\x864<\xb2\xad\xed\x82mz\x89\x11\xca\x87\xbcK\xb5\
-\xd5\xf7\x83\x8ae~\x12\x1e@\xb6\x8c\x7fY\xff\xaa\xf1\
-\xb7\x05\x8f \x0eb\xf7\x99N\xf5\x8b\xde/+\x0e|\
-J\xf3\xca\x9fq{%\xdb\xf31\x1d\xe2g\x0c\x97\x09\
-\xd7g\xbc\x10lx\x89\xb9\xb9\xdcPm\x8fK\x87b\
-\x1b.\x13\xb2\xed\x85d\xc3\xa3\x01\xd1t\x03\x97\xe9q\
-\xe9@0M@\xcc\xafG\x03\xaa\xe9\x06\x8a\xa9\x03\xd9\
-4\x81d\x02\x88\x96\xc7e,\x97\xa1\xb1\x8aq,\xd5\
-\xd0X\x8bKvI.\xd1\xe52\xc8F<\xaaKq\
-I.\x97K\xf0\xa8\xe2\x91m/D\x97\xe0Q\xc5#\
-\xb9\x04\x8f\x22\x1e\x97\xc7\x8f\x1c\x01\x00VP8 \xba\
-\x06\x00\x00\xd0&\x00\x9d\x01*\xa0\x00\xa0\x00>\x91>\
-\x96G\xa5\xa3\xa2!1\x96\xf8\x88\xb0\x12\x09gn\xe0\
-\xc0\x03\xf8\x00\xfd\x00\xd1\xa6\xd1\xb7\xf8~\xcd\xbf\xc6r\
-\x95\xfb\x01\xca\xdd\x9a\x98\xaa\xe4t\xe2\x97\x01ww\x88\
-\x9e\xe5\x9f@?\xccx4y\x9f\xb0\x07\xf1\x8fE/\
-\xe6?\xe1yA\xfc\x93\xfc_\xfe\x7fpo\xe5_\xd8\
-?^}\x95}x\xfe\xc4\xfb\x04\xfe\xa4\x1b\x1aIo\
-R\x1f\xf4K1\x03\x05\xc0GA~\x0f \xf0|@\
-\x81\x93\xa6\xde\x0d7\x1f\x02/\x90\x07\xedi`\xd4_\
-\x0c\x14\xc4\xff<pI\xd8\x5c\xc9u9\x9bW\xb9\xda\
-\x8eh\xa0\xc5\xd6\xf7\x16W=,.\xb2\x90\x9d6\xc6\
-\xc1\x02\xbaj\x1e;\x91T\x80\xae\xcbb\xc4HYr\
- |\x03\xef\x0a!^\xb7('\x95W\x0cEU\xbf\
-s3\x1a\x05\xd4p\x19u\xea\xea=\x0b\xd9\x02\x01\x8c\
-\xc4#\x87\xeblA.\xe0~3\xdd\xd05\x89\x06\x10\
-\xd2\x1fh\x99\xfb\xc5\x92wf\x02xY\xea\x88)\xa9\
-\xa9\xf3E\xb1\x01X@\xc4\x11\xaa\xac\x9dLy\x95\xf5\
-\xb6\x04tp\xe7\xca\x8f\x82\xc1\xbf}R\x83<m\xa4\
-^J\x87\xec5\xc5\x19[\x07\x84\x5c2\x1f\xe7b\x9f\
-`\xfe\xb0\x1ab\x02\xb76\x8cjK\x14\xc1\x0a\xc3V\
-\x04\x00\x00\xfc\xbf\xe23\xc4\x03\xd4\xaf\x19\xee&w\x9d\
-\xc6\xf0\xeado^\x19\xe4\x9c\xe5\xed\x0f^\xe0/@\
-\x16M\xa8\xea\xbf\x9eJr\xfb\x13\xc1,\xcd\xec\xbeQ\
-\x03^\xfd<<\x18\x98X\xb5\xbb\xe5l5g#\xc1\
-L7H#\x13\xb38\xb3uK\x98\xd0\x9c\xc6\xc6\xa1\
-\xd9\xff`\xcc\x0df\xfc\x80\x0b\xba\x14\xc9\x111H\xf9\
-\xe2\xe1d~\xc6\x88\xa1&'\x0d\xb01\xaa\x05\xfb\xdc\
-\xd8wY[\xe0\x22\x82\xe6\xbf-\x1d\xe1\x16\x01\x0be\
-\x94\x02\xe0\xb7\xeb\xbc\x91\x13\xe8pj\xf7f\x1b<0\
-_yn\xa1\x0b\xd7/\xd4\x5c[\xc9\xd7+\x93\x80\xc1\
-\xa7\x9fjY\xb0+\xfep\xec\xc7\x9c\xbdQ\x8f4\xf5\
-\x97E\x05]\xafX\x17\xd3\x15u\xcb\x04)YCc\
-d\xb0\x80\xbd\xff0%\x86\xdd\xff\xed\x12\xf6\x8b\xed\x8a\
-x\xaf\xcd\xb0\x02G\xf2\xea*\x1d\xc3#\x89s\x5cO\
-Y1\xa1\x02\x85\x15\x87K\xf6\x8cPH\x1b0\x15\x9e\
-|\x1f~\x832\xcd\x150t\xeb\x0a\x9c?\xf1c\xf2\
-\xcd\xbf\xc9\xf6\xf4OM\xf99\x9f\x89\xcc\xc3\xb4\xf7\x82\
-\x01\xb1t*&\xc2\xf5%\x01\x08\xc8\x7fmNI\xcf\
-[K\x8fH\xe4L\x07\x02\x89\xfa\xb9w\xf6\x15\xb0\xfa\
-\x957\xb2\x0c\xb1\x9c\x05\xad8\x92\xf0\xbe\x89\xf3\xc7\xac\
-\x9b\xe6\x5c[\x0bGv\xa70v\x9b \x97\xcb-\xa1\
-\xa2U\x879\x14g`\xbe\xab\xce\xa3dF\xf5\xae\x96\
-A\xfc\xddo\xc4\xb3\xdf\xd0\xf1P\xe9\xfa\xb6\x11\x15\x81\
-\x80f>\x9c3\xac\x8a3\xba\xa0\x0a\x06\xe7\xf3\x5c3\
-b\x1fj\xc6\xe7\x9b\xec\xf6\xbf\x92\xcb\xd6\x07\xcb\x0d\xd1\
-\x88\x0dS\x12\xd7\x80\xf48([d\xb5\xfe\xf4\x17\x04\
-\xd1\x85\xd1\x95{g\x80n\xb1:\xea\xfed\xb2J\xcf\
-<\xfb\xb4lO\x1b\xa9\x8f_\x9b\xcb<Q\x8e\xae\xb7\
-\xf9\xa3\x9b\xec1[\x1a\xa4\x012\x9c\x8c\xf5\x1e\x16A\
-)\xc65G\xbfK\xb3\xcb\xf0w\xe7\xf1\x07zA\x06\
-\x89\xee\xf26d\xb7\xba\xc0b\xb2\x8c\xb9k\x1f\x0c\x11\
-\x98Q\x92^\x00}4\xbd$7\xbaI./|\x94\
-W\x5c\xc8\x05N\x82\x8b%p_\x19\x8edf\xc9\xba\
-\xda\xab\xfc\xfe\x99\x1c\x11\xed\xa2e\x81\xa1@]\x06\x17\
-\xa6\xbe\xbc\xc6\x12\x17\xc2\xca\x1bm\xe5\xb6\x08\xa8\xae3\
-\xf4\xf2\x13\xd3\x87\x09\xb4\xf7\xd6\xe5.\xda,\x80\xae?\
-\xb6\xf9\x9a\xfa&=%4k*u\xf0\xd7\xcf\xe7\xcc\
-\xb0bEh\x0c\x9fOq(\xd6\xb2>\xce\xfb\xd3?\
-\xb7\x7f\x90:\xaa\xe2XP\x80\x9d\xbe\xa9\x98\xba^K\
-0E\x8c{\x0f\x1dL\xe4ov\x0f\xdc\x1f\xea\xf7\x90\
-D\x94\x12\x85\x86\xdc\x9f\x00\xe5\x83-\xfe\x1c\xc3\xe9\xe3\
-\xdft\x8fN\xf5\xfaD\x00d\x09\x86*\xdb\x0c\x03c\
-\xf9<\xa5\x86\x91\xf2\xb3}\x98H\xaa\xf2\x0a\xd2f\xe6\
-\xc7<\xba\x12\xa2t\xfa\xf0l\x0b\x07x\x8f<\x9b\xc4\
- q~\xbf\xc9EZ\xda\x00f\x95\x7fO\x07\xc1\xe4\
-\xf7\xad\xd3#\xbf\xdc\xe7ux\xa2\x9a)p|D\x9c\
-\x1e\x11\xc7\xf2VE\x12\x97\xb1v\x0a\xad\x87$eL\
-\x92\x9cJ\xbaUL\xc0\xdb\x0ex\xdf{\xab\xa5\xb5u\
-\x9em\x1b\x9f)\x93\xb8\xd7kt\xd9A\x8bR\xb6T\
-a\xbf\xab3\xed*/S\xf5Ta\x93o\x85\xe9\x9e\
-\x94\xa2b\xc8\xba{\xae\xc3-\x03\xe6\xc9\x11-\x83S\
-2\x89\xf2\x95#\x98MW\x8e\xdf\x12z\x891U\xf7\
-\xea\xc4\xd6M\xd04\x08\xce\xff\xbb\xe9\xd8\x12{\xed\x91\
-%6\x0b\xdc\x1a\xb3\x88\x0b\x9c~U\xc1\xad\x07h\xdc\
-\x0f\xd5\xe6\xfa.o\x0c\x1f\x1a\x95\xf9);\xd8\xa3J\
-m1\xbeM\xaf\x9c5%\xe3`\xba\x09\x8b\xac/a\
-Ox,#z\x12\xf4a\x04\xb5Q\xe9\x12\xbc=\xd9\
-=\xce\xe8%-B\x0c\xbd\x0f\xe0\x90`C\x1c\xc5!\
-\xc6\xb2&\x19\xd6\x82\x13\xec[#\x1c.\xbdX\xc2\x05\
-2ew\x5c\xf6\xc4\x98U\x06:Ke\x86R\xa7o\
-\xba\xb1\xbfE\xac\xe7Y\x01U\xf5D\xba\xbep\x95\xfe\
-|l\xae\xa6X)\x1b+\x88\x01A\xbeA\xb2\x80F\
-\xa9D\xfb\xcf\x86\xf2\xc2\xb8\x04\xce\xca\x9d\x0d\xdb>\x13\
-\x86\x06\xc4\xf4\xa3\xe3c\x80e\xaa\xfc\xda\xcb\xa2\x228\
-\x0aUs\xe6\x8e\x1f\xfc\xec\xeb\x9ch\x1f+\x1a=\xe6\
-U\x14\xf1\x10(\xb4\xba\x03\xf0\xe1\x86\x01\xb6\xc2L\xde\
-\x8a\xbf\xc3]\xb1\x015\x15\xb8o\x90\xf2\xbb\x9c\xcd\xb3\
-<\xce\xd2u\x1f\xcf\x8b.>i\xf4\x91\x025{\xc5\
-\xe1\xc5b\xa7\x91\xad\x82\xdc=\xc5\x8aP~?U\x85\
-\xde\xe1+R\x19\x86\x12\x89\x86\xfe\xb0Q\x844u\xb1\
-\xb3\x93W\x9b\x8d8\x82\xc3\x934Cm*\xf2\x85\xa1\
-\x04\xf7M\x96\xca\xf1\xcfV#\x8d{v\xcd\xe1\x1f\xbb\
-\x85\x0f\x91\x8b\xdd\xf2\x0f\xb9\xfeO\xf2\xe9o\xa4\xbb\xc4\
-\xc9%\x1d\xb8\x18v\x95\x1fQ\x16\xe1M\xb4J\xe1\xa2\
-\x9b0#sK=\x1d@\xa5\x1cf\xb5\xe6\x9a\xf9s\
-\x82\xb0\xde\x86\xf5s\xe72\x5c(\xf0B\xea\x90\xc5\x8f\
-C@\xa3\x0a6V\x98^\xc9m\xa0\x8e)\x03\x94\xff\
-\xff\xcb\xed\x85\x95\xf3\x96\x9cd\xdf\xca\x10\xd4\xc7Nb\
-\x8e@~\x04\xbf\xd1\xee\xbd\x0c x\x1at\x166\xdc\
-*\xe4\x10!\xe3}bn\xc8[\xe7u\xa3\x17\xa6\xe7\
-\xa3\xef\xf9\xce\x03\xd9\xf4\xb2\xe7\xfc\x95\xbb\xe0\xd7N\xd5\
-\xe0\xcc\xda\xe5\xd9\xe7/\xf6\x1e?B,poO(\
-.\xdb\x04\xf5~\xd2(\x02]\xd4q\xd1\x9d\x983s\
-3\x85\xe6\xbd\xb9\xabk\xf1k\xb6\x1e\x7f\xf4\x01:\x94\
-\x8a\x83JhJ\xb7\xa5\xe8\xa6\xd4\xb2\x13\x07\xf2\xd4q\
-\x92\x99\xf4\xbc\xf6\xae\x95\xc5\x01\x958\xf2L\x0dS=\
-\xe2{<\xfdR\xe1k\xe1[\xe8\x16\x9c\xcb3`a\
-\x93\x03F\x8b\xd7\xf6\x99\xabu\x80\x00\x00\x00ANM\
-F\x82\x08\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\xc7\x00\
-\x00\x1e\x00\x00\x02ALPH\xa6\x01\x00\x00\x01\x0f0\
-\xff\x11\x11Bnl[qeAa`\xd2\x19\x10\x8a\
-B\x83\xd0\x08\x85\x10dbP\xda\x86\xc4\xe5\xbc\xa1\xff\
-\xe0E\xf4\x7f\x02\xdc\xff~(\xa2\x09dI\xe3\xee\x15\
-\xe3!+x,\x82\xfeD\xd8\x1b\x8b\xb4w-\xcaV\
-e\xedw\xba!\xee\x0cC\xda\x99\x86c\x07\xebF5\
-y[7E\xdbiJ\xb6a\xca\xb6\xcbTl\xd8M\
-u\xc3[\xdaF\xb0\xf4\x87\xe0\xeaC\xb4\x9c\xb7\xec\x9c\
-\x1b\xb7d\x19\xb7\xe0\x9c\xab\xb7l\x99@q\xf7\x09\x1c\
-\x96\x0b\xc8\x0f'P,\x00\xe1\xa1\x01\x18\xea\xcd=\xdf\
-\xfc\xaa\x01e1\x81\xb0\xea@^\x0c \xda\xe2\xa2\xdb\
-N ,\x1a\x90V\x03\xf0\x0b\x07\xe4\xd5\x84\xe2\xd6\x17\
-\x1c\xa6\xc30M\x17d\xc3\x80\xb2\x02\x92\xa1\x03\xa6h\
-h\x96\x0a\x04C\x05\xfcS\x03\xbc\xc1\xed\xb8\x8d\xf0\xd4\
-\xa1\x98.\x88\x86\xc34\x0d'd\xd3\x80$:\x0d\x03\
-\xd2N6DS7L\x08\xa6\x06\xc7;xS5\x5c\
-;\x0e\x8a\xc1\x89\xa0l\x5c\xf0\x06\xc7\xc6\x5cT\x89_\
-\xe4\x8d\xf1A\x0d\xd2\xc6\x09\xe1\xdd\xfa\xa2C\xdc\x8b\x1f\
-\x146\xda\x07\x9d\x92\xb4\xf0\x1b\xf5/\xce-\x94\x1fP\
-\xff~\xdaK\xe2\xd7\xe8_&\x88\xce\x0f\x18/\xf1\xef\
-6_\xe2\xc4\xd7\x07@y\xb7\xaakp\xbc[\x87,\
-:_\x92DC7!\x8a.\x1d\x104U\xd7\x00\xaf\
-s\xdaS7\xa0\x88\xa6\xee\x82C\x04dM\x03\x92\xa6\
-\xeb\x06\x105\x13\x08\x1a\x00/i7'=\x81\xa2\xb9\
-\x80C\xd2\x90\x8d[VT\xeeQ\xd0y\x0c\x82\xf1\xe4\
-uNVt\x87.\xe9\xa2.\xe8\x9c\xec\xd0e]\xd4\
-yYq\xb2\xac\x8b:'\xcb\xba ;\x9c\xcc\xab~\
-\xdc\xffrVP8 \xbc\x06\x00\x00\xb0-\x00\x9d\x01\
-*\xc8\x00\xc8\x00>\x91D\x9bI%\xa4\x22\xa1,8\
-\x08x\xb0\x12\x09in\xe1i\xa0\xfdW\xddvO\x1c\
-\xff\x5c\xfcf\xef\xeb\xfc-\xa8\x0fe\xf8Q\xde\x9c\xa0\
-x!\xf6\x03\xa1\x1f\xed\xfe\x08\xbeC\xec\x01\xfc\xaf\xd1\
-#\xf9\xaf\xfa\x9f\xe7<\xdf~[\xfeC\xff'\xf9\xdf\
-\x80o\xe5?\xda=(\xfdp\xfe\xc7{\x05~\x99\xff\
-\xf9&}\xeb\xf9l.2ao-A\x9e(\x9a\xb2\
-\x93\xbd\xde\x88\x5c!s\x81\x96;\xaf\x8d\x9d\xf0\x8bu\
-e9\xea8\xc8\xab\xe6\xae\xe5\x5c\xd5\x80\xee<3|\
-\x8bI\x05\xe9\x15~\xfb\xaa\x01\x03uO_\x89\xca\x94\
-'a5\x04\xe4+Y}\x17:P,4\xd0L\x14\
-\x9e\x00 \x93\x84\x92\x9eBi\x95\xd4:\xf2D8\x1a\
-\x17\xe5?\xeb\x97\xfcj\x04g0\x93\xd41\x0e\xdfx\
-\xbd\x0a\xa69a\xce\x12\x1b\xacYd\xef?\xfc^\xf2\
-\x8b\x82\x8f\x14</K\x8a3:\xa5\x1f\x127\x1f~\
-C\xa4\xb8K\x0e?+\x1b\xc6\xa8\xeb\xd6-\xd5\xed\x8b\
-B\x15\x0e\x5c\xcf\x00\x04P\xe8ZR\xe9\xee\x9b\x1b\x0d\
-\xfb\x19\x0e\xb0\xb3\xc5\xd0\xb4\x8b\xedi\x8d\x99\x1b\xa3\x87\
-\x190\xb7\x96\xa0\x98|ySp\xd01\x83J\xe7\x95\
-u\x9d\x0a\xf3\x9b\x93\x93\xb2\x89\x0d]\x9d\xbdKy\x08\
-?\xf5\x98w3\x15+&\x17\x16n=\xbb8\xc0$\
-f\x9f\x1d\xf8\xc4\xf1\xba\xc1\xd6L\x0e\xb0\xceD~\xe9\
-\xd2u\xc3\xf6l\x8a;\xac\x98\x1dd\xc0\xed@b\xc8\
-\x00\x00\xfe\xfd\x8a\xe2\x0d\xd3L-\x13\x97\xa0\x8c\x11\xb9\
-\xdf\xfd\xb1&\xed\xbeX\xc9\x98\x99\x82\xec\xc3w\xa1\x02\
-p\xe7O\xc3\xfd\xbe\xef\x8f^\x06WOS\xd5\xf4M\
-\x176\xfe\xc9\x16\x8c\xca\x83\xc6e\xdd\xa1&\x83\xa0\x1e\
-A\x8aO\x0fa\xab\xb6\x89\xf5\x01\xe0\xe7\xef\xe7\x14\x9f\
-\xfad\xe2\xab\xf3\xe4\xed\x8b\xc8n\xfe\xb6\xf7\x16`6\
-}=B\xe7\xe4\xef\xb6\xe52\xdb\xae\x0b\x8a\xf0q.\
-i\x89\xdc\xa7^\xd3\xf7F\x22\x98A\xbe\x89t\xbe{\
-\x89\x14\xfc[\x87\xdb\xa1b\xff\xabk\x8d\xbe5\x09^\
-\xb0&eI@\xae\xa1\xe7\x98adCD\xb1\x8d\x1e\
-\x1a\xaf\xf0=\x12x\xe1\xf1\x1f\xf74\xec\xa6lr#\
-\x98\xb7\x86\xef\xde\xde\x1ev\x89-\xd84_\xc58\xdd\
-_\xd5\x5c\x0fj\xec\xfb\xd9\x84\xdb\xea\xd8\xca\xaa\x0b\xba\
-\xcc\xd3\x1f\xf8\x03^Dv\xd7 \xa9\xc8d(x%\
-\x10\x18\xe9\x22\x84\xce\x01\xe9\xb0\xd9\x8f\xb1=9+\x80\
-\xe3\xe1\xcdVY\xed\x83\xe8\xc98\xd1\x8b\xa2\x8e\xce\xc0\
-\xc7I\x00\xcd\xf2\xd5S\xebl{\xaa\x98\x9bB\xab\x14\
-*\x85\x090\xb2T\xafI\x84\xae2\xf6v>H \
-\xe5\xe1\x02\x94\xb8\xdeU\xfd\xe3S\xa5\x18\xe8F|'\
-\x97\xfb\xb5\x03Yy\xac6hq.\x10\x9eq\xb0A\
-5g\x9a\x1b\x13Z\xda<X;\xf2a\xf0\xa82>\
-/\xf3\x8e\xd1\xbbZ\x08\x95'\x0a\xdf\xf4oC\xc4T\
-\x80\x9c\xdaW\xb9\x8e\xdft\xad\x84ix\x96h\x042\
-\xf0\x80\x0c\x193\x1a\xaa.r\x8du:2\xc7\xabE\
-+\x02\xfc?\x82\x87\xdb\x95\xff>W\xb3\x93\xaa\xfb\xca\
-r=\xec\xf9ve\x03\xa8\xcb\xaez\xfa\xeb\xda\x85\x03\
-\xa1\x93A2\x9e\xa7;\x99{[A1\x11\xc0P\xdb\
-\x08t\x86T\xa0+5\x01\xdb\x91r^\x9an\xd7\x1a\
-%nU\xc6\x1c[\x15\x8bN\xf7Xc\xb8\xc4G]\
-d\xa7\xe90+a\x12#\x18\xadz\xa8?W\x0d\x09\
-IR\xa5\xbf<$\x84\x01\x08\x1b\x80\x80D5\x92\x93\
-\x1d\x11\x13It\xc8\x99\x03\xb2_\xb1\xc8wl\x81\xfe\
-\x14\x1d\x80\xe9p\xfdt\x9a+?=ta|\x22\xef\
-\xeb\xf7\xa59\x99\xfd\x00\xd0$\xb5\xa0\xa2\x92\xb5JT\
-\x1enyj\x80\xd6jY%V,w\xe8\x80\x1f\x99\
-\xf0\x9d\x0f$\x19\xa1\xf8fH\xf7R\x1e\xbfU\x04\x15\
-C\x08u\xa8}`\xab\x97sVpti\xfeF\x08\
-\xae\x1c\xef#\xb4\x90\x91\xfb\xa3\x1b!\xee\x02\xd7\xcd\xfb\
-\x8a\x02iq\xa6\x00o\x90\xfa\x11\x16Oh\x8a\xcc/\
-\xf7Q[\xb5\xa7\xe1\xdbBI\xa4\x98VHf\xaee\
-d\xdb\xfbc\x12\x9b7}\xa3\xe8\xf5\xa8<\x0c\x85w\
-I\xb4\xe3\xb1\x0cvg\xd2M\x9f\x88\xe4\x80~\x1b\x9e\
-\xea:\xf3?\x11\x0c\x1f\xb0-\xdaF\xe4\x84~\x11\x9e\
-J\x0b\xc1\x22i@\xafp\xb8{Y\xc3\x87'\xd2C\
-+\xa3\xee\xfc\x03\x81\xc1`\x0f\x803pmlx\xc6\
-OCem*\xad\xca\xc0\xd4Ci\xf7\x0b\xb9r\x22\
-(\xa8b\xb3\x7f\x90\xca@\x92\x11\xce\xa2\xc3\xbf\xf1\xb8\
-H\xf6`\xb8x(o\xbe\xc2\x0eT\x0c\xd8\x05\x1b\xda\
-;\xac\xc7\x9dSl\x94\xff\xa0:\xb5\x0b\x1eu\xf8\xf7\
-\x03\xd5\xf9^z-\xb3\x8f\xd5\x84\xa6\x130\x5c\x12\x14\
-j\x22c\xb6\xdd\x8f\x7f;\x98\xae+U ^=l\
-9\x89%GLY_xZI\x80\xb9\x1f\x90\xe7\xeb\
- \xc9\xcd\xa5{\x0dOz*\xad<\x10D\xfb\x14F\
-X\xb3\x0f\x89u\x14C\xd2~Pc\xf3@1\xc4.\
-\xd2\x0d]\x9d\xd2\xb3\xc3\x22\x11\x11\x1e\xcc\xb6\xb0\xaf\x9c\
-\x99\x1a\x1d\x96\xb2\x80\xe9@\x9b\xf9)\xdb2\x8f\xbbt\
-\xc5\xa3\xd4ol\x85\xf7\xe2\xf3\x84\x97\x0cp\xfb\xcb\x94\
-Z/\x14`\xc4J_\xfe\xd9\x82\xe8\x17\xd0\x8f\x0a\x9a\
-_*\x06!\xff&\xbd\x88x\x0f\x04lK\x9f\x19u\
-\xfb\xe6r\x93\xd8\xc2D\x0a\x90 '|\x05\x8eB\x80\
-b\xb8\xd9\x18\x05l\x9c\xc1\xa1\xf6\x00\xf4\x8c\xf4g\xa4\
-$\xa9\x10N\x92;[>\xb6\x9b\xb6\xdb\xb5h\x8dd\
-\xd8\xb7+66\x9d\x0c\x5cI\x07!\x9aF\x0bl\xc4\
-EC\x82\xfa\xa6S\xda\x9e\x9b}%I\xe9!cq\
-\x9eL\xba\xd2\x15Z\xe8\xf9\xa24\xea\x15KX./\
-\xc6%\xca\xf8$\x80\xcf\xc5\xd0\xb6~\xadq\x14\x10\xba\
-\xd0\x9c\xd2\xe8\xef\xe6E\xfc<\xa8\x07\xae`\x9dc\xe5\
-~\x1b|\x8c_\x96\x83~\xd73\xa6\xba\xd2\xd8\x95y\
-\xcb\x22\xcdk\x0f+\x1c\xb9C\xb1\xf4j\xd9m4\x1a\
-\xbd\xe7|\xfa%\xd7\xf0\xad,\xdc;N\x03\x84\xb1\x0d\
-\xba|\xf3\xdd$\x11\x1eQ3k\xd9\xb1\x8aLF\x16\
-\xb0\x84\xd1R\x13UW\xe1^Q\xba@a\xf3\xc6\xbf\
-K\xd7.W\xf2Dy\x7f\xdcj\x85\x0aEZ\xde\xec\
-<Uok\x8e99jy\xd0\xe8\xce\xbb\xc1)\xc7\
-\xe4\xc1\xfc\x89\x10\xf62\x91C\x8d\x0fL\x91w\xe4\xa0\
-}\xe5\x7f2\xf8\xff\xe2qG@\xff\xd4\xfbB$\xbf\
-\x0b\x95hLh'8\xe0_\xafv\xe8\xb0\x9d\xca\x01\
-\xd6\xd0\xbf\xb5Iz\xe2$K\x8aLA\xa449\xc4\
-D\xb35A\xd9\xe9\x7f\x5c<\xd8\xaf\xc7\xfa/\xf6\x83\
-\x82/.\x88'\x9f\xaa\xf4\xee\xab\xfe-1\xa2-\xd3\
-\xe8R\xf4\x92\x98\xb6b\x1f\xfaU\xe1\x8c\x82\xac2I\
-\x04Py+/\xcf\x94\x9f\xa6\xdb%\x90\x95p]\xa3\
-\xc80\xa5\xdf\xd6\xef\xd4\xf07yS.\xb0W\x5c^\
-6\x09\x03F\xb0\x17\xf7\xaa\x06\x22\x1b\x8d\xe1\x0bR\x1f\
-\x90\xc9\x00\x00\x00\x00\x00ANMF\x86\x08\x00\x00\x0a\
-\x00\x00\x0a\x00\x00\x9f\x00\x00\xa0\x00\x00\x1e\x00\x00\x03A\
-LPH\xaa\x01\x00\x00\x01\x0f0\xff\x11\x11Bnm\
-\xed\xa0m\xfd\xc6\x0e\x84:xJQ\x1a\xa5)e\x97\
- \x14\x18V\x80\xdf\xff\xce\xb9\xf7\xc6\x11\xfd\x9f\x009\
-6\xf0r[\x00\xdc\xcdX\xe2Ea\xebtm\xe7u\
-s\x97T\x85\xa3\xd3\xbc'\xaf\xe9\xa7\xa8\x99\xa7\xac(\
-(\x15U\xf3\x9c\x9a&\x9c\xba&\x9e\xa6&\x9fP\x1f\
-\xaa\xce\xed^\xdd\xb3k\xba\xb0\xeb\xba\xb8\x1b\xba\xb4\x9b\
-K\x12\xe9K\xde\xb1:\x91\xb2\xb0)K\x12\x11\xe9\x8b\
-[\xea\xe2\x97\xba<\xcb\xbb\xb8E\x16\xbf4 \xc9v\
-\x00a\xe9@\xd85 .\x03\xf0\xbb\x0a\xa4e\x02n\
-W\x80|\xc8r\x9c\x07 \x9d: \x22\x05\x88\xa7\x06\
-8\x91\x0a\xf8\xd3\x0b<\xbb\xe7Tw/\xe0N\x05\xf0\
-\x22\x0d\x10\xe5\x84\xb0\xc9\x9a\xb1\xe9\x904\x1d\xa2\xc8\x80\
-\xa8i\xa7p\x91D&x\xcd\x0by\xf3h\xea\x06p\
-\x9a\x02lD\xbd\x14\x0bW \xeb&\xb8\x0aI7\xe0\
-1\x8b\xba\x0e\xcf\x0bA\xd7\xc0\xdb4\xf0\xba\x17\x82\xd9\
-\xa3\xab\x10\xbaE\xec\xe0t\xe5\x93\xd2\x00\xb9\xfc\xb0|\
-3I\xd3\x22[\xa5\x9b\xf1IX`\xd0a\x12\x0dd\
-\x9a\xc8?\x93\xeb\xbfE\xfb\x98\xfe'\x1bF\xf9\x8b\xe6\
-\x97%\x03>\xa5X\xc5\xcf\xa8V\xe1\xee\xfd\x98\x06\xfe\
-3\xba\xc9\x80\xe73&\xb8;\xac\xe4\xba\x98T\xc8w\
-\xafI\x83t\xd7M\x06\xc4\xbb\x09\xe1\x0e\x8b\x02\xf8\xab\
-j\xf2\x02\xcfU\x03\xdc\xd5\x00\xe4zZ\x14 _U\
- ]5 ^\x0d \x5c\x01\xf8\x9bwyn\xc6\xe2\
-.\x0a\xab\x5cv\x838Y\x93\x8e}4\x09&\xde\xe4\
-Q\x95\x83Xd\x93d\x12L\xbc\x89\xb3\xc8b\x11/\
-\xea\xc6\x9b8\x8b,\x16\xc1\xc4Y$\xb1x,\xa2\xfc\
-WVP8 \xbc\x06\x00\x00P'\x00\x9d\x01*\xa0\
-\x00\xa1\x00>\x91>\x98H%\xa3\xa2\xa10\x97\xd8\x98\
-\xb0\x12\x09in\xe0\xc0\x01\xaf\xe8\x02\x10\xd0\x89\x9f\xf8\
-\x7f\xe5?\xa7\x9d\xfc\x7f\x8d\xe8\x80\xf21\xfe\xb1\x1a\xb5\
-\x87}\xee\xc9\x90\x01\xf5\x8f\x88\xcf\xac\xbd\x0c\xff\x85\xf0\
-)\xf2/`\x0f\xe4\xfe\x8b?\xc7\xff\xd1\xf2\x89\xf9/\
-\xf8\x7f\xfb\xbe\xe0\xdf\xca\xbf\xafz9z\xf2\xfd\x80\xf6\
-\x0e\xfdL4h4\x99\xee\x07\xf6\xad\xcd\xec\x96i\xc9\
-.\xb0\x82\xc9\xd3\x80\xc2\xce[\x91Y8\x04\xb0\xc0\x7f\
-&D\xd1&\x00\xca\xae\xc7M/\xe6\xf5fnb\xb8\
-\x87\xef2?^\xbe\x95B\x04\xc4;\xd1gz\xfe=\
-U\xed\xbb\xf2\x91\xf6\x12E\x0d\xd4\xe3\x96\xb8\xde\x04\x97\
-2\xfarL\x0e%\x83\xb6\x05\xbcRK\xcf\x85\xf9\x9e\
-\xb8\x8c\xf5\x17\xdb\xd5\x04)\xe8JF\x05.\xa4\xb3?\
-\xf8\x9az\xa2\xeaN2\x0f.\xe6}\xe6\x06!\xfd\xdc\
-\xf7\x1ff\xb2\xa7#,ro\x18\xee\xf0Jd\xbaw\
-\xe2#\x0dT\x9bY\xbc,\xdaJd\xbad\x99\xffa\
-\xd3\x83O\x94\xc6\xde\xe9\xc8\xb4\x14j\xa2\xf57\xca\x1b\
-\xc3\x02\xd5\xa3\x846\xff]\xfa\xca\xed\xb9E|\xbcP\
-\x0b\xb9\x92\x08\x98\x00\x98M\xde\xc2Lr\xc1\x00\xa9>\
-\xf4\xcfX\x1b\xee7\xcb\xb9\xaa=\x02P\x00\xfe\xb3\xe6\
-\xf4/\xb1@\x05\x15nz=\xb6\xd3\xdc\x7f\xbc\xaa8\
-\xa3ZrC5\xbd:/\xf6?z.xi\xe01\
-s\xb3\xf3\xd0%\x82\xcew\xf3\xf9b\x05\x8a~\x17\xe4\
-l\x0a\xb2*\x9f)\xdcr\x02c\xc1\xcf\xb1%Oe\
-I\x00\xa2\xeaW\x5c:5\xf7\xd5,\x12\x16\xa6GN\
-\xa4\xe0\xc1\x1b\x81\xbc\xaa\xd1\xd7WFnj\xec\x83I\
-\x99j\xaf\xe1x\x0e\x0d\x98?\x84<\xcc\xb5f\x15\xd9\
-\x94\xbf\xa1\xff\xcc/\x0f\x8a\xe13\xac\x13\x0e\xcc\x06\xe7\
-\x12/\xd6=\xd3\xed{[\x09\xe3\xf3\xef\x90k\xa1\x18\
-\x0c\xcci\xc5o\x5czx\x99\x22MO\xb0\x8f\xbb\x05\
-\x17xJ{\x0b\x01\xc8q\xaf\x872BY\x12Nq\
-\x13\x10\xab\xa51\xab1\x19\x88\x00\x99m\xc5\xc1S)\
-\x1b\x5cP\x16\xbc\xa9\x22\xe1\x0f\x93s\x1b\xc9\xe7\xc6\xdd\
-\x90 0L\xc0\xffv\xae\x9e\xb4\xdaDt\xb4\xb1\xed\
-\xd6t\x80N\xb7\xc6\x1e\xb6\x81y(\xa4\x01**~\
-D\x12\xd3M\x95\xbfO\x99\x09\xab\xb08\x92\x92o\xdc\
-\xcd\xde\xec\x22\xf2\xb3\x0a|\xa0\x84\x83%v\xa0\xb4\xe7\
-h\xbd\xd4\xc5\xfay4\x91\x1f\xben\x9e?\x80\x07m\
-\xeb<\xd4\xddL\x0d}\xb2J\xd1\xf9_pTQ\x86\
-\x9a\x8a\xf6\x82$\x80\x02\xbah\xf6:`\x91\x94L\xa9\
-\x16\x01\x0f\xe7\x96W\x9e\x05\xfe,a\x0eo\xc0-\xd2\
-\x91#\x9b&\xa5\x98W\x99\xc7\xfb\xb2\xf9\xef[g\x94\
-%3M\xed\x96j\xd9\x14.U0\x0cX\xed\xf5|\
-\xfc\xd8>-\xc14\xa6\x0a L]\xb9\xf8\xd0\x8e\xe4\
-\xfd\x13\xe8\xd6\x1a\x1d+\xda\x84\xb5\x1a\xe7\xb2Z\xc02\
-W}_h\x82\x5c\xe0\xcd\xa9!~\x192\x19\x9e+\
-\xd5\xd5\xc0;M\x16\xdc\x86b\xfb\xf5\xb7\xb1\x1a\xa6\xaf\
-TKC\x87\xa4T\x98\xa7\xd4\xb0\x90\xa8\xe19\x9d\xe3\
-\xd3\xd5@\x13\xe6\xe2\x1a\x01\xa0x\xcf\x07\x16\xecm\x99\
-=\x12\x8f\xd0Q\x19/\x93\xc7D\xec\x1eU\xa6\xfdX\
-\x05\xb0\xd6\xa7(\x1b_SZ\x80|\x8c\xe7\xa9\xde\x5c\
-G\x95H9*\xe5VT!\xea\xb6\x09\x0bI\xc3)\
-\xc6;\x1a\x0b\xb0z\xec\x87\x9d\x0fm\x8b\xc4I\xbc$\
-\x16\xa3\xc4\x1e\xe3\xa8\x97-j\xd2\xbc\x19\xe96 \xa8\
-\xe1q9\xe0\x01,\x00A\xd9p\xedH`\x0e\x06t\
-\xa2\xf40c\x89\x16\x9b>\xb1\xa3\x19\x13\xc2z>\xd2\
-\xc4h\xec\x93\x0a)]@>\xab\x95&\xf3JE<\
-\xd9d\xcb}\xb2bv\xbfsyC^|\xf3\x08\xa1\
-\xdcD\xee\xcc\xa4\xbd\x02\x07\x17\xc9\x99\xd7s\x0f\xb3I\
-\xa7L\xac\xf1\xcb\x0d\xba\xa8\xe89\x11kG=\xc1\x99\
-\x05\xa4\xfe\x86Y\x19\xe7Ia\xe7\xa5s:\x04F\x06\
-Ke\xf7\xb6\x8ay\xd3P\x85\x00\xc8\x0c7\x96\xef\x9d\
-\xef\xa2\xa6\xe6\xc1\xe2L?\xa7\xb5I\xbd\x06\x15\xe4'\
-\xbcVdXS\x00\x85\xf1I\xc4o\x95\xfdg\xde#\
-\xf5\xa8=\x19\x15Z\x22\x9a\xec\x9b>\xeag73a\
-v\x840\x88\xe9\x02\xe2\x5c3\xda)\xcb\xa5n<(\
-\x8d*\xf2\xfbZ\x08\x98\x07\x13\x87\x95\x11\x84B-\xd9\
-F>\xd72\xb6n\x15\xf7kf\xba:\xb0\xc1i\xc7\
-\xd7Z\x11|M\xf3[D+\x95\x0bm\x22 \xaa\x82\
-\xcf\x16Yx{\x8f*\xaa\xe1\x0f\xdf\xb6\xa0\x88\xf9l\
-]\xf6?\xf0xD\x1a\x032\xb7\x14^k\x184\xc4\
-7\x90\xeb\xb7d\x7f\xadV\xca\xda\xbfL\xa9;\xf4\xa2\
-X\x83\xc9rP\xa8\x9c\xbaK8\xba\xf4Jtts\
-\xf8\xea;\x00\x83\xc7\x81F\x0e\xf9\x07\x12f\xb6>T\
-\xad\xa2\xc3+\xdd[\xff\x19;f\x94\xdan\x10\xbcS\
-W\x16\xb5\x0c\x03\xd3@\xee`\xa5\x1da\x9b\x1fQQ\
-;\x06/2\xb80O\xd1xHRnPe\xe0\x17\
-\x1b*nR\x1244\x85_\x0b\x00\xa7\x89\xe9\x84\x1e\
-\xee\x87h_,\x00\x05A\x16\x10\x0cj\xc3_H\xe2\
-I\xc7\xe0%W\x80\xc8\xd3c\xcf/\x0b\x14}\xa9\x93\
-\xb7\xaeu\x0d4\xb5\xe6\x93\xc4\xeeg\xc7<\xe6\xfdU\
-\x00\x0d\x91G\xfb\xa3b\xa2\xe7\xd9\xad\xcb\x82YP\x8d\
-i\xe3^\xafDVXD\x15I\x15\xbb#Bgi\
-$?\xc7Zp\xaf\x1a\xb7\xbf\xaba\x9cS]\x09\x8d\
-\x99\xd8\xf4\xdcO5,}\x16\x9d\x1c\xd3m\x1eT\x92\
-M\x83\xc8\x84\x9d\x03\x04\xd3\x91\xae\xcf\xd9\xaf1\xb6V\
-\x0d?+-\xdf;\xde\xe9\xa2\xc0R\xee7\xb5~'\
-\xd9\x95m\x82\xd8\x1aLC\xc2z\x87om \xd6\x8d\
-\xfa\xf4\x8d\xe6\xa0I\x7f%\x81q-s)\xe9\xd4\x80\
-\xd7\xa6\xbe\x9b\xc2IP\x02\xaa\x1b\xd5\xb8\xa3`;\xb5\
-\xd9\x04\x9a\xe5\x9b\x86\xd4\x9b\x19\xd8<&\xb8\xf5\xdd;\
-\xb8\x19To\x9a\x17\xd4yXL\xb3\xc4\x0f\xf7\x96\xb3\
-\xdd]\xcf\xc1;\xa1\xfcv0\x94\x8f\xdaS\xeb\xe2\xa2\
-\xc9\xc6\xa7\xf1\x14\xf7h\x91s\xea]=zAC\x87\
-k\xf5\xa1\xd2 \xf4\xf7\xef\x06)\x08!`HH\x07\
-\xadCh\xde\x0a\xca|\x82%\xcc\xbd\x1e@\x9c\xc3\xcc\
-{\x0a\xdc\x0cL\x06\xb26\xed\x9e!w\x17a\xeb\x09\
-\xe7\x22\xac\xa9w\xa4`\xc5\xa5A%\x91\x86\xc3\xf4\x82\
-\xa0\xbd\x88\x1cb\xdbV\xf0\xe7P\xde\xeaq\x99\xa5\xc2\
-\xc1x-\xc6<\xdf\xad\xc7H\xc4\xc6\xf9\xccj+ \
-\xc2\xd4E\xcf5)\x921\xf9\xae\x95Y\xdc\xa4\x97\xaa\
-\xb9\xfak\x10\x88v\xc7\x12\x02kRY[EZ\x18\
-I\xdb\x22\xa7x\xc3g\xf4\xd4\xb6\xce\xf8\xc7\xb5\xad\xa5\
-N\xc6\x80<\xc68\x0a\xc3\x22Os\xcb\xf5H\xd8\x13\
-\xbd\x99Y\x09\xfc\xa2\xba\x853M{\xf5\x021\x8a\x11\
-\xf3\x0f\xff\xe1\xe5\xc2\x961y\x81\xea\x15\xb0 \xef\xea\
-\x8d\xf7,\xe4\xf6SG\xd5\x8a\x7f\x87\xfa6\x19Z\x00\
-\x09\x86\x00\x00\x00ANMF\xca\x08\x00\x00\x0b\x00\x00\
-\x0a\x00\x00\x9d\x00\x00\x9f\x00\x00\x1e\x00\x00\x01ALP\
-H\xa9\x01\x00\x00\x01\x0f0\xff\x11\x11\x02nm\xed\xa0\
-\xac\xdf\x12\x08\x95\xa0\x14\xa5\xb9\xa5\xddR\x94 \x14X\
-N\x80\xdf\xbff\xe6\xbd8\xa2\xff\x13 \xc7\x09^n\
-\x1bP\xaeX\xc3E\xdd\xe4\x8b\xb1\xc1\xeb\xd8GU=\
-dU?\xe04\xf3\x14\x14\x0f\xe7\xa8\xa8\x8a\xach\x0a\
-\x14C\xe3OS\x13\x0e\x0f\xdatxU\xf9PU\xe5\
-\xd0U\xb8\xdd\xd0\xf9\xdd\xd4\x85\x1d\xfa\xb8y6Qd\
-.i\xf3.ED\xea\x927u\x89\x22\x22\x13(\x9b\
-\xb6\xb8\xa5\x01l:Pd}\x17\xb7\x0c nd\xf1\
-\xcb\x04\xfcn\x00a\x01p\xbb\x06D\x11y\x80\x22\xfb\
-\xf7\xf0\x02\xe9\xf0\x00\xe9\x10\x0f\x02d\x11\xa9\x80?\x0d\
-(\x22\xd2\x00w\xea\xc0A\xcem\xd7\xa1(*\xe0D\
-\x06d\xc5\x03\xf8MR\xc8nB\xd4L\x08\x22@\xd0\
-\x8c\x93\xbf\x88\xf2\x00N\xd3!mD\xdb\x96\x17\x8a\xaa\
-B^\xb2\xea]\xaaAY\x92\xeaY\x1aD\x95\x00v\
-A7A\xfa\xd5\x00\xd7\xc1\xdf\x0dp\xba\x0e\xdeL\xf4\
-\x0d\xfc\xb4\x08wuS>\x04\xf2\xc5\x0bq\x9a\xb4\xab\
-\x07\xa2\x90,\x9aA\x12\xb1\xb9\xfe\xa4\xfc!\xf3\xdf3\
-\xfe\xac\xf9\xef\xe1\x83\xd2g<_\xf5B\xfc\x9ej\x15\
->\xa3Y\xf9\xbb\xfe1\x03\xdcgL\x13@>\xe2\x81\
-r\xf7Z\xe5\xbbj\xd2 \xddu\x93\x01\xf13\x80p\
-\xf5\x98\xbc\x80\xbf\xaa\x80\xbbj\x80\x5cw\x93\x01\xe5\x0e\
-\xc8W\x8fI\x05\xd2U\x03\xe2\xd5\x00\xc2\x15\x80\xbfy\
-\x17w\xd3M\x00\x8a\x5c\xd6%k\xde 2\x97\xa4\x22\
-L\xd6\xa8;\x06\x13\xaf\xa9'g\x22\x16\xd9$\xa9\xda\
-!\x9ax\x13\xb1(\xba\xbeK&\xc1\xc4Y\x14\xd1\x8f\
-M2\xf1\x16E,\xe2M]\xe4z@8\x01\x00V\
-P8 \x00\x07\x00\x004(\x00\x9d\x01*\x9e\x00\xa0\
-\x00>\x91B\x9dH\x82\x9f)\xb0\x00\x01 \x96\x96\xee\
-\x0c\x00\x1a\xfe\x7f\xc5\x01\x8f\xf3n\xd0?\xca\xfd\xa2t\
-\xc7J\xea\x90|4\xefGx\xaf\x85\x1b\xcax\x7f\xf2\
->\x80]\xd7\xef\x1c\xd4\x0aI\xdf\xdc|\x01\xbe\xbb\xea\
-\x01\xfc\x83\xd1G\xf9\x0f\xfc\xdf\xe4\xfc\xd9~G\xfe+\
-\xf6\x93\xe0\x17\xf8\xef\xf5oH\x0f_\xbf\xb6>\xc1_\
-\xac\xbf\xfa\x8eu\x0c\xc3\xa8*\xb3\x1cq\xf0!\xe4\x96\
-$\xeb|\xdc\x8a3\xf7y\xa1\x0c\x0f{\x87\xe9Q\xaf\
-r\xd3q\xc4u\x1eK\xdeyQ\x19\xa5r4\xd3\x86\
->\x0d8\x09\xfa\xa5OrG\xb6\xc8;9\xe8XV\
-\x0d\xea\xae{w\xf1\xf3\xc2\x82\x06I].M\xd5\xe7\
-#\xb3y\xf2\xbb\xbe\xdbFpH\x83\x106\xec\x85:\
-\x91\x9b\xf7\x0aw\x1d< jwX\xed\x86\xefJ\x84\
-\xd1\x95\xa8\x19\x93U\xfbR\xcb\xce\xf9{\xf1^\x22\xd9\
-F\xa6\x93\x88T\xc6a\xd3$\xce\xea\xf3\xca\x5c2\x1f\
-\xe5\xa6\x06\xd1\xfeZ\xbb\xd9\x01\xc8x\x85\xdcyL\xe1\
-\xa6\x06\xd1\xfb\x16\x11\x12\xe4F\x9dd\x1c\xa1\xfd\xd9\xb1\
-M\xcf\xfc\xeblX\x11,M\x04m\xfe\xe2\xde\xc2\xda\
-\xff.\xb8\x0e\x18\x1c\xc5\x05\xfd\xf0\xc3\xa9\xe3\xf2\xb8\x17\
-=\x85\xf0P1^\xec\x82\x03\x0f\xde\xfa\x95^bt\
-\x00\x00\xfe\xbe\x80n\x91:<d\xd9]\x03\xe9|Y\
-Qo\x8a+S\xea{NI-\x16h\x7f\xe9\xfc\x04\
-\xf0LD_\xca}\xa8\xaf\x82b\xa1\x0c\x00\x8e\x99x\
-\xaf\xaa\xb3\x8a\xe6\xa8\xad\x0a+\xc6\xfa0\x05\x0e:\x12\
-j\xb0\xe6\xf0!\xfd\xcef\xf4\xd8\xd4\xb6\xb7q\xee\xe7\
-\xc1$U\xc8\xd1{v\xfb22E\x12-l^\xb9\
-\xc1\x04X\xe5\x0f\x22\x13\x95\xdd\x82\x0b\x07H\xce\x0b\x10\
-\x0c\x13\x96\xd4uM#\x7f\xd7\xbew\x12\x04\xd3D\x1e\
-\x90+\xce\xf5u)\xaeg\xa1\xba\xcc6d\xc0\xf5\xd9\
-\xb5\xfa\xf19\xd1F+\x9a\x13K\xd7&\xd7\xec\xd6H\
-\xd5]\x96\xaa$\xc6]\x83\xea\x06)<F\x12\xc9;\
-\xbf\x02\xe9P\x9f|\xe4\x1d\x16\x07\x17O\x82V\xfdv\
-\xa5\x16\xbc\xe8\xa4t;\xea\xb0\xcf\xab\xc9\x1b%\xfd\xfd\
-\x1f\xd0\x10\xcb'.@\x8dj\xe1\xf4\x7fJ\x01-\x84\
-\x94\xe1\x0d\x08\xfeT\x02\x0a!\xf79Z\xb6\xfc/;\
-w-N\x0f#6\xac\x9cL\xa5\xf0*.\x08\xc6\xb0\
-\xc4\xeb\x9c\xc6\xaeI\x94>i\xba\xbdp\x80\x83\xcc\xa1\
-\x98\xa8\xaa\xce\xae\x95\xa3\x8e\x96<\xca\x88\xf0\xafO\x99\
-\x9a\x1d\xd1\xf5;\xd5\x19G\xbcbW\xa4h\xa0\x1e\xfa\
-\xb7&\x94&\xca\xb2\x81\xd7d\xd2j>\xfd\xf6\x88\x1e\
-\x96_\xf9-\x0f\x94\xdf\x0a\xf5\x1c\xaa \xd2\xc5t\x8d\
-`S\xa7.7\xe8\x8a\xf4V\xd6%\xdc)\x9dxE\
-\x84\xa8\xcb\x9c\x01]w\x13\xff\x9bu\x82\xfb\xe2\x1e0\
-\x0c$\x15\xbe\x8d\x99\x0e4\xd3\xce\xad\xc6R@w\x7f\
-\xef\x80\xe4\xd5\x15\x80\xd7\x94\xf1Dq\xad\x17cl\xb1\
-a\x1c3~\x05\xcfa-[])*\x91\xa0f\x86\
-N[\xea\x88\x14\x81\xee\x16?\xe6\xba[\xb2\x01Xi\
-\xd6 <\xe6\xb8\x08\x91@c\xee\xdc\xb1\x9d\x845\x0a\
-^\x18\x141\xb1b\xa1;\x8c\xae\x94r\xc7\x17\x88\xd3\
-\x1eP8\x91c\xd0\xdb\xf8\x81t\x0a=\x03\xb5\xed\x0f\
-\xa9\xfb5\xd0MY\xb3\x02\x91\xf9^h\xac5\x15\xdc\
-\x162M\x103\xbd\xb4\x09\x03k\x12\xc4\xce!?\xa8\
-\xb1r\xc2P>\xfa\x18\x973vIo\xe0\x8c\xac\xa2\
-\xc8\xa0=$:\x5cd\xa1\x9b3l\x22\xea\xaau@\
-\x1e9T:fN\x12\xd3\xb3\xd64|\xefB\xdd\xbf\
-7\x15\x07Z\xa6t^\x08>:\xed\xaa\xfa\xe8\xe7\xa1\
-\x92@\x0c\xf0*o\x1c\x02S9$\xaa\x8f\xfcN\x9c\
-$\xaa\xa0\xf2\xfbT`\xfe\xd2{\x9f\xea%\xc6\xd9\xce\
-\xac:\x9c\x9f\xd1\xbe$/\x0c\xdd\xd5W\xe2'.\x05\
-\xc4\x9bJ\x0fRD\x9f\xde|\xdfU\xda\x99?\xedt\
-vX\x19:\x00n\x8e\xdd*\x07\xfd)\x05\xe5F\xf2\
-\x1d\xd0\x0aB\x0b\x06\x82\x7f\xf6\xcf5F\x80#.\xb7\
-\xa6\x82\x93\x11\x97\xac\x8d\xa95]\xe6\x9c\xe8~\xa5\xa1\
-\xe2\xa1\xb5\xc2&\xf3u\x03Dp4\x8c\xb1p{R\
-\xb6\xa4\xea\xff\xf0P|w$\xab\xf0\xf5\xe5 \xd6,\
-\xc2 gn5\xe5\x07Y\xb8\x83<yQ\xc0<N\
-\xf0>\x97\xe4\x19\x978T\xab\xa1\x88!\x05\xd8\x01\xe9\
-.\xf4\xab\xe3^\x15@{\xa1\xaa\xed+\xf0\xcd\xc0\x1b\
-\xa5L\xc7*\x07\xe8\x1f\x08\xc8\x89\xad\x0e\xc8\x97\xdf\xf7\
-\x0f\x886\x9f\x86\xd1\x92\x0a|\x08\x8e\x06\xf8XS\xaf\
-\xfd\x12\xa8;2~\x82N\xe1]}|?\x00\xef1\
- \xc6\x15\xc5\xc2\xe2\xb5\xff\xe08\x14t\x84\xc1f\x9b\
-\xf3\xfd\xe9#q\xd0\x08\x051;vf\xc6\xae\xdc\x22\
-\xed\x0c\x982\xa4\xf1\x18\xc4\xf9\xec_\xe4\x9f\xfb\x83\x82\
-\xa6hv\xb9\xed\xb3\xe9l+\x17\x97\x13^\x9e@\xac\
-:\xb8\xab\xa8\xe2tN\xb9y\xcf\xa3Dj\xa0\xc5@\
-\xa87\x00\x12\xac\x06\x95\x0b\xa1\xc8\xa0\xe6\x1bu\x805\
-$o\xb9\x01\x01I\x92\xcb\x8d\xab\xb1C\x85\x8d\xd3\xce\
-\x0d\xdd\xe4\x8ah\x93\xec\xb7.-\xfe\x9e\x1e\xb1\xc8\xed\
-\xad\xce\x99\xee\xbdwzH&\x0bYv'\xcb\xc8\x8b\
-\xd7\xbb\xac\xc53\x8al2\xcd{\x81\xb2\x1bj\xbav\
-\x22\xd8k\xcd\x11\xc2[\x1d6z\xe3\xa0\x1a\x09\x03\xed\
-\xfc\xa5[\x11\xd7\x0bc\x9f\xd1\x9a{R\xae\x80d\xdd\
-C\xe1\xa1\xcd\x16)<\x8f\xccc?\xb8Z\x19\x09\x92\
-F\xdf\x224(\xea=a\x04\x9e\xa1C\x80B!\xec\
-z\xa9\x1d\xd6\xf8\x80\x82\xf7\x04T{\xe4EP\xf4\x07\
-\x88\xad'9\x18=\xc6g\xac\xe9\xcay\x81\xe5A\xba\
-\x8d\x86\x1f\xfb\x0cw\xa4a~B\xec7q\x19\xcdp\
-\xa8\x04\xd8\xfe~k:\xb0\xd5\xe9Rkh,\xc0\xef\
-\xa3\xb3\xb9\x9b\x0a\xaa8\xe9\x0ek\x10\xd5\x05\x00\x80\x9f\
-/d:G\xf4\xec.\xdc\x10\x06\xb7kD\xb5h%\
-\x89t\xb5\x01\xc5_m\x02\xef\xb0\xa74\xb6\x0a\x97\x88\
-\xfb\xfdG\x01\xccJ\x83z\xfc\x95\xf8\xb7w0x\xdb\
-1A\xb3?\xa5\x05\xedB\xc9\xd6\xe0\xd9\xaa\xee\xben\
-W\x96\x98&\xaa\xab\xae\xa1r\xe4\xf1\x86\xe7\x90\xfb\xc4\
-\xe9[#;y)q\x08\x92\x98:\x17D\xc8\x0e%\
-\xab\x06>\xe7\xbe\xf2\x92\x02M\xef\xdb\x9a\x13\xa7\xb6\xa5\
-\xcb\xe2\xc6\x98\x0a\x08\x0a\xf5\x99\xd0\x1f\x12$\xbd\xbfQ\
-\x96&\x15\xf3\xcak\xef\x09~\xaeM\xc4L\x00_$\
-\x89\x9d\xc7\xf5~\xa9\xaeSN\x92lF\x9e\x16\x04\x19\
-\xb5P\xab*\xe5\xf6`\x11XM\x84\xecI\xc7\xe5\xe9\
-W\xd2\xca\x8b\x1fS\x9f\x86\x9e-\x19T_\xb7D2\
-$\xfb\x97w\xc8\x22\xe3\x1b14r\xee\x8fu\xb7f\
-|\x16+\x1aN$\xdat%\x7f\xb4\x1f\xd0\xe5[}\
-\xa7\xe3-\xab\xe8\xb6\xb8G\x01\x16\xb6{_h\x04\xbc\
-\x005h\x8ekQ\xb9\xd6\x80\xcc\xc0\xfa\x12\xe1\x17\xf8\
-T\xea'U\xa8\xf6\xc6ch\x13\x13[\xa1\xbfS\xc2\
-.%1\xf7(=\x98\xf4@\xcff\x08$\x82\xeb\xa9\
-\x8275Q\x1b|\x1c+\x9b\x03\xe6\x11\xa8\xb8\xc3\x81\
-\x17\x8eK\x0c\xf7\xa6\x92\xbc\xdc\x83\x15]\x12\xed\xa2\x9f\
-=\xf4\xba\x05\x5c\x0eg\xba\xb7\xc8K\xfb\xd4\xc0\x9b\xa9\
-B\xc7\xf6L\x00\x00\x00ANMF\x98\x08\x00\x00\x0c\
-\x00\x00\x0a\x00\x00\x9b\x00\x00\x9f\x00\x00\x1e\x00\x00\x01A\
-LPH\xb1\x01\x00\x00\x01\x0f0\xff\x11\x11Bnk\
-[u(\x1dD@H\x03#1\x9d\xb84(\xcd\xd2\
-4\xe2\x12\x1c\x12X\xde\x01p/\xef;iD\xff'\
-@K\xa8r?@\xf14\xc6\xe0\xe8\x93\xec`Zm\
-\xe7\x8ch\xea\x8blz\x17\xd5\xd2X\x07\xc3eH\x86\
-n\xc8\x86\xc7p\x18\xb0\xae\x9a),.SZ\xdc\xa6\
-\xbc\xe8\xa6\xb2xMu\x81}\xd6\x1car:\xe2\xe4\
-\x9aD\xb5I\x9a\xdcC\x91\xd4\x87<\xe9C\x94\xd4\x86\
-2y\x80\xaa\xf1\x01\x8e\xc9\x0b\xe4\xc9\x0d\xd4\x09@\x9c\
-\x9c\x00C\x1b4\x1f\x82\xa4\x13\xa8\x8b\x07\x88\x92.\xa0\
-,:\x90$\xdd@Z\x5c\xa6\xb88\x81,\xa9\x03a\
-!\xa0Hz\xa0j\xfd\xc21;\x0c\xcf\xec\x85b\xe8\
-P%\x01\xd9p\x01\xb3d8'\x0d\x88\x86\x06\x04\x9d\
-@0\xc8 G\xd4\x05\xd5\xf4B\x1a\x0e\xd33\xdcP\
-L\x1d\xb2\xef\x1e:dO\x19\x92\xe9\x1a\x1e\x88\xa6\x13\
-\x8e}\xc1\xd4\x86\xd7#\xa8\xea \xdfIu\xbc \xed\
-\xe9\x87\xe3\x19\xae\x0dA\xf2\xf4\xc9\x9f-\xde=7\xc4\
-\xcfq\xedJ_\xe7\xfcj\xd9\xd7~e\xfaR\xed\xbf\
-\xe1\xdc\x95\xbe\xce\xf5\xa5n\x88_\xa7\xef\x0a\x9f\xe3\xd9\
-%\xff\xfbi\xa0~\x8e\xb6\xe5\x84\xe3s\x5cP|\xf7\
-\xae\xec\xeb[\x1eH\xbew\x0b\x10]m[p]\x80\
-\xdc\xf7\x96\x0e\xd5\xf7ly\xe1\xf0\x01\xc5u\x02\xd9u\
-m\xe9@r=@t\x01\x04\xcf9\xc8{\x03\xd5\xf0\
-w\xf2\x02\x87\xe1\x0a\x92\x1a\x9e,\xa9\x0f\xc5p\x13\xd4\
-\x18\x93\x89\x7fL\xa3\xa1\xb3\x0e[\xb4\xa3Z\x9e\xd5\xb1\
-%[\xdeU\xda\x12\xb7\xc8\xca\xf2\xd8R,m\x95\xb6\
-\x84\x1dU\xd6sQ\xb6$\x93\xde\x99\xec}R\x1cm\
-\x12\x1d\xea\xc0!7\x10V\x00VP8 \xc6\x06\x00\
-\x00\xd4(\x00\x9d\x01*\x9c\x00\xa0\x00>\x91@\x9dH\
-\x02\xdd}\xa1\x80\x01 \x96\x90\x87\x00\x19g\xd7\x07\xe8\
-\x97\xf6\xdf\xc4\xee\xfe\x7f\xc1\xf2\xce\xcaB\xf2\xbe\xbfF\
-\x08\xf6[\xacz/\x98\x17x{\xa6\xf5&\x92_\xf7\
-O\x02\x9f!\xf6\x00\xfe;\xe8\x95\xfc\xb7\xfc\xdf)_\
-\x97\xff\x89\xff\xcb\xfes\xe0\x13\xf9G\xf6\x1fF\xefZ\
-\xff\xb3~\xc1_\xa9\xbf\xfcP8K\x816\xf35\x8d\
-O\x82\x9a\x01\xd0\xdbuda*\xc6i\xa8~\xf82\
-44\x9b\xcf#\xa6C\x97\x01\x22\x91\xe4\xc6\xb8\x15l\
-o\x1a\x8e\xe7\xe3\xf65\xfc\x22o\xc4\x02}\x88\x94\x90\
-A\x94\xfai\xed\x91+;%\xb3\x0a\x08\x06\xe15%\
-a:\xe5W\x9c\xf1='\xef\xbc\xd8\xeb\xb3c\x17\x8e\
-\xd21\x98\xa1(\x08\x13U`m.3\xe7\xfc?\xa4\
-\xb4\xe1\xba\x18S\xd2\xc1$g\xacwC\xb80\xf0\x0b\
-\xc5\x1c\xff\xfb\xd0T\xd3/\x01\xf1P\xbc\x19\xc4\x8bE\
-,\xfa\x95\xb4o\x01J}a\xab\xb8\xaf\x8c\xa6\xdf}\
-\xa4\x14\x92?\xae\x9f\x93\xf2\x07\xe2]\x92\x1cm.\xf0\
-\x05\xe1\xd2R}\xcf\xaf\xc3'\xc0|+\x18\xa8\xcf\xa1\
-\xb0T\xe0\xfc}\x9c\x89\xe1,\x1e\x17\xa7\xcdP\xbd\x91\
-b]\x95\x9dF\x9f\xa8\x91\xb77\x86el\xab\x81\xa3\
-\xd5\x7f}\xd7\xe8\x1f\x95\x06E3\xfe\x88\xf83\x80\x00\
-\x00\xfe\xbe\x7f\x056\xaf\xe8a\xa0\xa5\x9c\x85\x90]V\
-\xe8K\x88r\x93 \x85\x83l\x83\x88\x10\xfc\x83!R\
-a\x1ch/\xeb\xe5\xe8G\xe1\xd6\xcbR[\xdf\xec\x8d\
-8\x98bO@\xe1Qq\x1e>\xa6?\xad\x5c\x0e\x95\
-G\xe7\xdb\x11{\xc2K\xad:30\x81\x88^~v\
-\xd51#O\xf7\x0b\xe7\xfc\xaf\xc6V\x1b\xfd?\x9f\xcc\
-E\xf2\x8d|'I.\xf44v\x13~\xe7\x08\x0a\x00\
-7\xb9B,\x5c\x88X^'2m\x88o\x93\x1b+\
-\xd4\x92\xf2\xda+F\xd5\xe0\xfd\xd1l\x82:\xcf\x10D\
-h\xdd\xe0\xf7\x89\xd2?\xd5m\xbf\xd0\xa3\xb4\xae\xce\xe1\
-\x0f{5\x9d#\x08\x14\xa5!\xc7\x08\xb2;\x8c3\x08\
-\x00\xef\x04\xb7\xa49=\x9d[/\xf1\x8b\x0dj\x8cl\
-O'uq\xd0\x07\x8cr\xc8F\xa0[\xa0\x86\xc0\xbe\
-e3\xf1C\xdf\xd2y\x1fd\xe1ff\xf5\xb1\xb5l\
-}_\xe3\xb5\xdb1P\x0b\xa1\x5c\xb8Ih6\x88\xfb\
-P\xb9\xe9\x98^\xc9\x8dH\x8e\x1c\xb2\x80\x87\x87\xe1\xb3\
-\x8b\x0ej\xc7h*\xea+\x11\x84\xeb\xbf\xd8\x10\xf8^\
-\xbf6\x12\xe2\x11V\xa4\xcc\x02sQ\xd2\x16\x82\xae^\
-\xdb+\x91R\x86\xf1\x7f\x94i\xfb\xec\xd3\xbe\x07\xb1\x88\
-}N\x03\x8c\xe0`%\x84\xbd('\xd2\xcc\xc7\x08>\
-1XF6:\x92>B\xfe\xef\x97\xc5C\xda\xbeH\
-\xc8\xf8\x8f~\xab\xe5o\x03((G\xd9\xa7\x13]6\
-\x8d\x80\x01] 5&U\xaeX\x91#\x08\x82\x89\xdb\
-\xe5\x89\xc7*,U\xaf\xbb\xb5\xff\xd3\xe7p\xae\xac\xab\
-@\xb3}\xcc\x87P\x0e\x87\xe5\x93H\x12\xfat\xd9\xa9\
-_E\x0c\xf2\x9eEz\xa8\x86b\xdam\xc4v\x0b\x0d\
-\x08t>j\x9f\xbd\xad\xd8\xcb\xef2\xe7\x16&\x90\x1b\
-\x93\x8e\x97\xcd\xd9\xc6\xfd\x9b\xa7>$B\x929E\xf6\
-\xb2\xdf\x87\x17\xecI\x0d\xf6\x1f{+f\x1a\xc8\xa3\xa3\
-P\x88\xd9[\xc1\xc2C.P\xc8\x9d\x8fR\xd8\xc3\x05\
-\xabd!+r\xba\x85\x8b`\xd2\xc29n\xe7|+\
-\xffq[\xd9\xc5c\x9a,NAb\x9f\xbb\xb5\xc7\xcf\
-\xaf\xf6\xf1\x9d\x12w\xf8\xc0\xe60\xef%\xb0\xfd\xd2K\
-il.xh\x87\xa1\xe4\x0c\xc5\x1b}\x88#m\xe2\
-\x84Y\x8a\x12}\xd6\xfa\xff;P]\x1d\xd3\xda\x86C\
-WS\xa68\xdf\xca\x81\xd8\xca'S\x1f=C\xca\x12\
-\xb3?\xdb\x1ch\x08\x18\x10\xf3\xf4a\x8f\xc9P<p\
-8\xda\xafc\x80\xf5\x05\xbb\x15L\x82\xf9\x94\xa8\x1ac\
-\xd2%\xf2X4\x8a\x84\x88\xd2\xacR\xd4n\xebH\x1f\
-\x1fa2(z4\xab\xd1\xc66\x81\xd0\x1a\xbd\x8d\xa3\
-\x8c:9\x85\x1fJ0\x9b'F\xab\x9d\x01\xca6X\
-\x8e\xa5T\xed\xb9\x8e\x08\x01\xf5\x1d\xa18\xac\xb60\xcd\
-\x07B:\xe4\xe3\xfd\x14\xed\x8d\xf3=\x02gw\xf6\xb8\
-\xbf\xacM>\xb0)\xf8T\xaa\x8f:\x18\x01Q\xc9\x09\
-\x9d\x96\xaf\xbf\x89\xd0\xf6\xbfj\x81n\xb9\xb9\xc7f\xb5\
-\xb6\xa8\xf5,!ou\x03\x1fb\x8f\xe9N\xb3\x08\xe4\
-\xdf\xaf\x00\xcfR\x0eD\xc0Xj\xa5\x8b\x08=\xba}\
-\xb6\xb6UD\xe1e\x98\x00\xb1\xb7\xb4/A\xbe\xe3\xe8\
-\xe3U\xe4\xa7\xd7\xa0\xae\xab_@\xf9\x7f:\x1b\xc1\xb0\
-*'\x87\xbc\xa3x#\x0d2'\x10\x97\x5cffq\
-\x9d\x16@\x09=\x91\xa7b\x9a\x1a\xc0\x00j9L\xdc\
-Y\xc4\x120Q\xea\x97\xa3\x8f9\xd4\xf0OO]\x09\
-#4fe\x9f\xae!\xafOY\xf8\xe9Bi\x97\xc1\
-\xb2}\xbb\xc9\x81 \x80\x16Qy'\xf3[\xa5\x08\x00\
-\x15\xb3\xb8\xf0\x8eJMT\x1e\x8d\x8fX\x98D\x1c\xdb\
-\x820\xdb\xc4%W\xc8\x94\xe4\xa8\xd4\xff,*\xa5\xe2\
-\xef\xa4\xd0\xb8D\xcf_z\xe7\xac\xb7I\x16\xf1\xf6F\
-X3-\xf93\x87\x80\x94\xdf2tk[\xdc\xc5\xd5\
-\xb8O\xdf\xc2\x93\x10\xa2P\x846\xa40-,T^\
-\xd7\xd1\x95i\xcci=\xd6Sle\xbd\xee\xa55\xe6\
-\xd4E|\xd3\xe2\x8e\x89\x80&\xf3\x03kL\xe0\xf8g\
-\xbe5\xbe\xc8n\xc1sw3\x1b\x8b\xd7\xe2\x93\xe6I\
-\x12\x22\x84r\x0b`\xac\xe5\x0bT+\xc1U]\x1e_\
-1\x0a\xa8\xf3Rm\x08\x99\xe9\xb7\xdd\xc1\xf8\xd1\xfd7\
-8^\x1f1\xd0\xbd\xa2\xe2\x0f\x12(n\xe2*%%\
-\x8e\x9a\xc3w\x9d\xa7\x1a\xc6\x99\x030\xbb\xbeWN\xea\
-k\x88~\xbf\xf9\xbbd\x9fO_\xee]\xf4\xc2\xc3\x8b\
-c\x93\x5c\xc0?\x0d\xe0[H\x85\x97\xe0\xf7\x17\xce%\
-\x03\x0b\xbc\x91\xc5\xe3\xd0Y\x8a\xf3z\xfa\x13#\xa6\xfb\
-\xcbX\xae\xa1\x1e`\xefC\xecs\xb5\xfc\x1c$\xc2\x1f\
--S\xa4\xf9\x91n%\xb79\xee\xa7nl\x8di\x82\
-u\xbaxO\xc6`\xcd\x91\xd6=\x8b\xc4)]\x11\xae\
-\xb4\x9e|o&\xca\x9b^.RuR\xbf\xe0\xed\x94\
-\x9d\x00:V(\xea\xff)\xf6/\x0emI\xfc\xc2E\
-\xe3m2=\x00\xb7\xe6\xf1\xa5\x22\xe7\xedl\x89l\x9a\
--1\x8f\xa9\xd0\xbb\xaeu\xa4\xfc\x12\xd8\xf7\x19W\xbd\
-F\xdc&\xb6\x01\x09[&\xc4\xf1\xde\xd8\xd3c\xbb\xd3\
-\x18t\xe4?\x83 \xad\xe4\x8a\x9a\x09\xfdRA\x99\xc5\
-\xbf\xd2\x09\xb5o\x1eo\x06\xe6[\xcc\xe8(\x82\x8c$\
-\x0aS\xef&\x90%.\x9b8\x1b\xbf\xd8S\x9eo\x9f\
-\x91\xbd\xd2\xf7\xd7\xf8\xbd\x18\xf1zG\xca-P\x05\xc9\
-/\x8e-<-\x8d\x8d\x84\xd6\x88a/\xec\x93\xac\x04\
-@\xc8\xc8\x05%\xe7\xfb\x8d4+\xc6\x06\xbf!VX\
-\x81\xe2K\xe0\xccqM\xf7\xa9 \xf8\xc4\xf4`*u\
-y,\x9d\xa5\x08\x80\x0c%\x91\x13\xc4\xcb\x04\x8fA\xf0\
-\xc6r\x94\xd7\x87\x09g\x92-\xcb\xb7\xd5\xcb\x06\x82E\
-\x0c\xe60\xa7\xe6\xe8D\x9b\x1a\x96\xb4n\xe6J\xe3\xc9\
-\xf8g<\x9e\xf8\x00\x00ANMF\xd6\x08\x00\x00\x0f\
-\x00\x00\x0a\x00\x00\x96\x00\x00\xa0\x00\x00\x1e\x00\x00\x00A\
-LPH\xb7\x01\x00\x00\x01\x0f0\xff\x11\x11Bnl\
-[a$=J\x06&!h3!4\x94\xc1\xa6\xa4\
-P\x08A\xa6\x0c\x8ak\xf0\xf9P\xdd3cG\xf4\x7f\
-\x02d7\x08Z\xac@Ya\x8c\xbej\x14_3\x08\
-\x9e\x0b;y\xea${\xde\x09\x9e>\x8b\xb3\x8b\xf99\
-\xab\x8e<{\x1c\xcc\x9a\xe7\x98tO\xb4.\xbc\xa7u\
-\xbb\xb2\xf5\xb8\x8a\xf5\xba\xb0\x9a\xef0\xba/\x1a\xf8\xd3\
-p\x19I\xea\xc39\xdcC\x91T\x87<\xd4!IR\
-\x07\xca\xf0\x0cax\x00\x86\x17(\x1a\xef!Hj@\
-24\x1c\x92:pX\x0d\x88\x92\x00\x82\xf5\x00I\xba\
-\x80\x22\xbb\x02\xa7uN.\xeb\x06\xd2D@\x96*\x10\
-g\x0d\x8a\xf4\x00a\xf6\x02\x96\xe6\x8f\xf1BqT \
-\xa8Av\x5c\xc01\x9c\x0e\x19\x1d\x92\xa7C\x14\x10=\
-mr,\xa4!x^8\xd5A\xdegx)\xae\x0a\
-Yu\xe1\x1e.\xf2J\x918]\x97\xd1\x92K\xc6\xb3\
-\x84tG_\x1f\xb4\xd0 hu\xcb\x0b\xc7'<\x9b\
-\xe2R\xfd\x9c\xb4t\x7f\xcf\xb5\xe9\xfc\x04}U^\xeb\
-\x7f\xbc\xb6\xa7\xec\xc8k\xfd/\xc5\x9e\xf3K\xae\xafJ\
-K\xf7\x87\xd4M\xf1\x13\x9eM\xc7\xd2\xfb!\x0d\xc2'\
-\xf4\x1d\x80>\xe0\x82\xb2to\xcaKu\xc7\x03\xe7\xd2\
-\xbb\xa3AZ\xea;\x80\xb8\xe3X\xb9wT \xac<\
-;^@\xab\x0d\xca\x12\x90W\xae\x1d\x158W\x1e \
-M\x0e\xab\x01q\x92,\x80\xc3\xba\xb2q\x0fa\x82\xf1\
-\x0e\xb2o\xe2\x00P\x1cYR\xf5U\x88R\x1f\xf2\xe4\
-\x01\xfec&\xd74N^\xcf\xb1#L\x9aG\x1b\xf2\
-\xac;\xce\x1di\x86\xf3\x98\x5c\x9e\xb0\xa1h\xc39S\
-\x9fE\xc7;\x0b\x8e:)\xf2NN\xd7k\x1d\xaej\
-\x14\xf9\xfb\x90\x16\xea\xa0\xd5\x06qI\xff\xe4\x04\x00V\
-P8 \xfe\x06\x00\x00t)\x00\x9d\x01*\x97\x00\xa1\
-\x00>\x8d>\x97G\x83!o\x8d\x80\x01\x18\x96v\xee\
-\x0c\x00\x06d\xa5\xc7\xfa\x85\xfd\xcf\xb4\x7f\xf2\x15\xefx\
-M\xdeN\xd7\x1eQ\xef)\xe0\x95\x00~i\xfdc\xbb\
-\xe3P)'\x7f|\xf0E\xfa7\xa8\x07\xf2O\xdc\x0f\
-J\xfc\xd5>?\xfe+\xf6\x97\xe0\x0f\xf9\x07\xf5\xde\xae\
-\x1f\xb4\xbe\xc3?\xac\xdf\xfb\x8dr_:\xaf\xb6\x10\x0f\
-\xaf\xffOT\xf7\xff\x97d\xc9\xa6a'\xb5\xfc\x81{\
-\xc4\x1a\xce\x9e\x15\xde\x08\x05&k7\x1dQ\x08\xdd\xf0\
-l\xa7\xadK\xb2\xec\x19s\xe2\xf7\x0c\xcc\xe2Y\xc0\xa2\
-\x14\x08\xfe)\xfc\xa7;B\x98\xe8a}\xf4\xbe\xceA\
-\xf3\xdb\x99\x9b\x8dN~{\x0f\x97\xec\x92UB\x1f\xaa\
-\xa3\x9bm\xf59\x7f\x10WV\xa4\x81\x10D`\xfeR\
-R\xdd!\x90\x0a\xb9r\x89z\xab~\x7f\xf8\x94e\x93\
-\x96\xcb\x9a0\xd6\xbcaf\xb1\xcfP\x1b58\xa8\x1a\
-0T\x01o-i\x00\xe0f\x9d\x09]\xca\xd7 y\
-\x9d\x89\x93\xb5C\xb0s\xff\x0cP^r;\xf2\xf1\xb1\
-\xe4n^\x09\xc9f'g\xbc'\xca\xfe[\x9d#\xa9\
-\xfc\xf6\xa7C}\x0f\xbfj\xd7\x93Kdb(`I\
-\xc3\x91\xe9D\xc5*\x1b\x9a\xfe\xbf>\x91\x8c\xaes\xfa\
-\x1at\x5c\xdawF1\xfd4\xcf\x01\xb9B\xd4?\xb3\
-RT\x8f\xb64\xa8\x83\xbc>L`\x00\xfe\xb3\xe4/\
-U\xebvV\x07s\xbd\x1b\xa7\x0eOx^\xab0\x12\
-I\xa6\xb4y\xd1ry\x9d5\x1e$\xe4csM\xaa\
-c\xcb\xaf\xe8\x7f\xecq\xe5}\x9ek\xe1UZ\xbf\xc3\
-\xb43\x9b\xfc\xfd\x90y\xdb\x88U\xfa\x8e\x1b\x0c\x1f\xf5\
-9\xa1\x13\xd3\x16\x17<\xc4\xc2+N\xb6>\xab\xdc,\
-\xd9\x1c\x04YV?\xe5'\x9f)\x88\x02\xae\x98\xc3\xf4\
-x\xfc\x1f\x8c\x0a\xcf-\x93P`&<B\x0a\xb7\xe0\
-\xff^\x0b<\x18<\xd7\xb3_\xd7)l\xeel\xfbL\
-twYN\x13\xa1g\xa4\x12\x8e\xe7\xbe\x99\x84`~\
-\xae:\x1f5\x0c\x02\xdf\xb0$\x1e\x03\x9dVk\xe6\xa4\
-q\x04`\x9aF{\x10O\xb1Fw\xa9%G_\xcd\
-K\x8f\xfct\x11T\xcfw\xc5\xc1)\x09\xa0\xfe2&\
-\x99\xae\x94\x0dd\x94\xc1\x0f\xf3\xa2t\xfd\xf3\x5cN\xa0\
-\xa6\xf9\xc7\x07Q!\x9c\xcb\xbb\xf4\xd6\xdbN\xe8\xdb$\
-cb\xe9\x01O\xe9\xae\xf9\xc5q\xd8\x91\xfb\xc2\x8e\xf6\
-\x01}\xa0l<\x06z\xe6\xda\xd4q \xf6C?\xed\
-\xda[\x5c\xaa\xdcA\xf9\xf7A\xd4\xa9\xdfi\x12D\xd4\
-\x04.\xc9\x95`C\xbb@\xf3\xdfME0\xb4\x0e\x03\
-\x8b\x98q\x942\xbfl\x15\xfa\xa5\xb8\x0c\xd1!\xe1d\
-\xe6P\x94\x1cJ\xcd\xb5_\xfd8\xb3s\x85$lT\
-\x18\x8b!\xf9[5\xbeX\x85\xabk\x10\xa8QD\x9e\
-\xad\xb0\xc8\xd9o\xab\xb6S\x09r\xf1q6\xdc\xff\x0a\
-\x03\xc5xY\xea!\xaf,\xac \x17\x98f\x07\x1f\xcb\
-\xe4\x994\xdb\xbd\x09\xdc\xab\x92j5\xe0`\x97\xc3\xf8\
-\xa6\x0fU\x91\xd5i 1\xf6\xfb\xf3\x1a\x17*\xed\xea\
-\x1c\xeb\x1b\xe5\xa0\x04\xa6a\xb9\xa2,\xaf\x0dgJJ\
-\x01}\x81\xe4\xb9\x12\xa1\x1a\xd7'\xbcCUkB\xf5\
-\xac\xcb\xaa\x10v\xc12\xb9o+I\x99%\xcd\x86\xc6\
-`%\x9bW\xe5\x01\xd2\x9e\xc0wd\xc3|\x18~\x89\
-Y\xf0B\x083\x99\x0b\xcc\xd6Q\x08\xc5A\x8d\xfc\xa6\
-\x1e\x0b\xf8\xd0\xb6]\x12q\xafv\xe42\xc6~\x9aZ\
-\xb6\x1d\xaf\x16$\xd2\x19\x8bx{\x97\xe1\xeb\xe2\x9cN\
-\xa0x\x01\xbbMV>\xdb\xdf\xfd\xef\xc9`\xca\xcb\x8d\
-\xb2\xdd\xdb\x7f\xff\xe2p\xff\xf1 \xbf\xff\x88\x19\x8c\x0f\
-\xc4G\xf6s\x0f\x1co\xe0m\xae3\xd6\xa6\xc3\x8f\x84\
-\xea\xf2(a\xd5\x14\xb7\xa4\x0c\x91\xd87\xf8\x83\xf3l\
-\xa7n\x86\x85\x87\xcd\xadP\xa6\xcf\x98\xe0\x0c\xec\xc5\xa0\
-\xae\x5c\xea\x0a\x0c,\xab4\xd4\xebk!q\x85\xe3p\
-eA\x89\xc3\x98\x09\xb0\xeb\x8f\xa1\xe6%\xdb\x945\xf8\
-^V.\xff\xa5\xb7\xd2\xc1\xafo\x03\x8c!\xd7\x10k\
-\xe4\xbf\x0ev|u\xc9R\xcd[\xc2k\xd9\xf5\x8f%\
-\x02?\xcd3W=@\xffv\xa2\xc2\x90\x01J\xcf\xbf\
-D\xb4\x87\xd0Z\xf4\xb6\xaa2\x1d\xf17\x17\xa4\x16\xfb\
-\x08Ui\x94u\x06\xd9\xa8\xdf(\xc8\x9e|.\x9c\xbd\
-\x13\xc5\xfc\xfa\x06&\x9bd\x97\xb5\xb9\x1d\x15\xbd%v\
-\xcb\x04C\xd3=\xa0\x9b%\xb9\xc3\xde\xa6k\x099y\
-bb\x96\xed$[\x9e\xe5\x8a\x1c\x0e@A\xfd\x04\x96\
-_p\xe3\x9b\xad\xca\xa0}\xbc\xbc\x94lE8>\x9b\
-\xf3\x8f\xd8>\xe4\x94%\xeb\x84\xb4VA\xb5w\x9a\xcd\
-\x1c6\xec\x9f\xb6\xf7\xaf\xd9\xc3\x8c\x8d\xa2\xa6\xa1\xf5\xea\
-\x0fn\xaf\x08U\x0bO\xcbLX\xe8\xc4_\xa6\x03\x07\
-G\xa9\x9c\x1b\x82\xdb\xd1\x06''_\xd9\xd8\xf2\xffw\
-ll\xefzC\xaf\xfe|x\xa6a\xde\x85\x19\xa2\xc7\
-!N\xd6\x06\xd8Yf\x92\x97\xfb s4F\xe2\xd0\
-\x03\xfa\xe1\xf2Y\x97@\xce(\x15\x0e\x83c\x7fIN\
-;H7\x9f\xb5\xc7\x00\xd8\x08\x86B\x5c\xbc\xe0\x04[\
-\xc0\x7f\xb28\xca\x9e\x16p\xfe\xd7gD&M=\x94\
-\xdf\xbe\x9c<9|\xe4\x0cI\x86;\x0c\x8aQ\x07\x1b\
-\x18\x8e+\x8e\xa4\x02\x0cj\x0c[\xfa\xb8f\xf3e\xf3\
-\x0aJ\xc1\xb1\x01B\xa8\xaa\x0dr\x9a\xb4\x9bG\x94\x04\
-\x1e5\xdf\xe07\xb4\x1c\xfc\x92'\x0e\xc7D%\x10\xdf\
-\x0e\x18W\x0d52\x191\x07\xda2\x85}\xdd\xcd\x03\
-\xf5\xb5b\xbe\xe12\x13\x8b\xc0\xf6L\x0c\x92\x9d\x0fv\
-U\x8f.j;L\xe7\x7fFB*\xd7\xb4\xa5-\xd8\
-\x22|\xb2\x10lk7\xb0\x16#= \x99\xae\xf1\xe6\
-\x96<1v\xdd\xden\xd4\xd5}\x0d\xc6\x99\xff\xf0\x1d\
-\xc7k:\xd6\xe7\x88\xef\xc8\x00\x90{1\x09\xe1c\x92\
-_F\x06SE\xae\xd9\xa4\x15\xaaR\x22\xc2^\xe3G\
-(\xef\x1d\xe9\xd6\x84\xc84\xd6\xcc\xd9.\x85\x8d\xc7L\
-\x83%\x16u3\xf2\x06\xb7\x06gT\xb0\xac\xbf\xcf\xbb\
-8\xfd\xf5y8gO\x8f\x0d\x0bB\x9e\xbd\xa3Z\xc4\
-[\xbe~\x0c\x85L=zh:\xd8\xa3\x15\x94dC\
-C?\x9a\xcc\x8cz\xa0zjg\x00\xd8\x0fZ\xfc\x97\
-\xc5\xa2\x99\x05\xd1-5\xed?5wO\x0f\x9f\x0e\xae\
-\xa6\xdael\xb2w\x91}\x1d\x07\x04\xb1K\xca&V\
-\xf0H\xa7F!\xf8\x12\xd8<$\xde\xc9\xf1q\xfa\x1e\
-\xd0cly\x9cT\x02\x15djQx\x07N\xf3\xb8\
-\x09U\x16\x8d\xb74|\xee\xbf\x9f\xaa9\x9fR\xe9\xd4\
-M\x8a\xdc/\xa0\xa7\x82\x1a\xf9\xcco\xac\x9c\xb0\xc2\x1f\
-(\xf4-\x93\xa4|\xc1\xbe\x02\xc5\xec\xd8\xd0\xd5\x0eR\
-\xf6/>\x87\x11\x02\xf5W\xff\x98\xd0\x8c\xba\x86\xc6\x97\
-El\xc5(\x1a\xc6\x83j`\x9ck\xf3\xe7\xe2\x94\x8e\
-\xb1\xe5\xcf\xb4+n\xa6\x8ew\xc2K\x81\x8b\xfd\xa0\xf2\
-!\x05b\xef\xeegk\x124Oq\xefP\xb8\xeb\x86\
-U\xe5FA~\x03\xfc\x81\xa3\xc9\xb8\xbb\xad\xe0<\x8e\
-\xaf\xd8\xc1s\x95\x11\x81\x82\xf6\x8f+\xd3\x9d\x88\xac\xba\
-,Yr\xe7\xab\xf2x\x02MT\x9c)+ba\xbe\
-\x15\xd7\x5c\xca\x95\xd2\xcf\xb3.\x09\xb2?\xb3h\xfe\xba\
-\x8fh\x04\xe5\xda\x9e\x96\x9e\x17.\xb3\xcf\xa3\xf6\xcb*\
-\xc5\x0b\xc8\xbc-\xdf\x9c\x11\xd2<\x00eD\x05\xff\xfc\
-\x87\xe0\x00\x00\x00ANMF\xb6\x08\x00\x00\x00\x00\x00\
-\x00\x00\x00\xc7\x00\x00\xc7\x00\x00\x1e\x00\x00\x02ALP\
-H\xc1\x01\x00\x00\x01\x0f0\xff\x11\x11Bnm[q\
-\xc5<\x16\x01\xce\xd4\x81)E\xa5\x89\xd2(\x85\x12p\
-F\xa0\xa5\x13H\x5c\xde\x1f<e\x11\xfd\x9f\x00\xfb\xdf\
-\x0f8\x0d \xbbT\xee\xc1c<d\x0f\x1e\x0f\x87\xfa\
-D\x5c\x1b\x93m\xed\x9a\x1cK\x85yXiB\x5c\x19\
-\xc2\xb6r\x0a\xfb\x0a\xeaB\x91\x82\xd6\xa4\xa4ui\xd3\
-N)k\x97\xb4k\xe8RY\x08J]\x88J{\x88\
-V\x1e\x92\xd2o\xd9\xcc\xc6mS\xc6-\x9aY\xb9e\
-\xe5\x04\x0e\xbb\x9f\xc0\xae\x5c@~\xe8\xc0\xa1\x00\xc4\x87\
-\x0a \x94\x9b=\xdf\xc2\xac\x02\xc7\xe4\x04\xe2\xac\x01y\
-2\x80\xa4\xa5I\xd3:\x10'\x15\xd8f\x03\xb09\x90\
-g\x1d\x0e\xe1\x82}\xd6`\x17N\xa9B\x16:\x1c3\
-\x83Mh\x80p\x91\x84\xaa\x9dD\xa1\x00a\xd6\x09\x82\
-i\x0d[\x88\xb3zH\x17\xa4\x99\xed\xd2\xa9\xfd\x94\x06\
-l\xc2\x0f\xa9kz\x87\xec\xd4\xfc*\xec\xefV\xfc\x0c\
-\x8e\xb7\xbb\xe0\xed\xce\x97\x04\xa7\xf1M:\xc4\xaf\xd1^\
-\x92\xde\xad~\xc6\xf6n\xe5\x9f\x8a}@\xf9k\xa8/\
-I_\xa3}\x99\xe8\xd4?`\xbc$\xbc\xdb\xf9\x12s\
-\xbe>\x00\x8ew+~\x15\xf6wk\x90\x9d\xfaK6\
-\xa7\xe1wBr\xba\xfc\x80\xe8S\xfc*\x10|\x1a`\
-\xbe\xddo\xc0\xe1t\xc2\xeet\xf9\x01Y\x0b\x93\x0al\
-RI\x93\xb6T\xb7\xc9\x00\x92\xb6ON J\x8d\x09\
-@\x90:\xf1\xa1\xdeL\x1el\x0f\x1d8V\xf6\x87\x0b\
-\xd8\xb5\x13\x82\x99U\x80\xac]\xb0\x99\xd9\xb8m\x1a@\
-\xb0\xc2=\xad\xf1\x8b\xc7(\x95\x87i\x90\xaafn\x87\
-\xd6\xa4\xddo\xf3KZ\x91\xa2f\x92-\x9e\xc2\xb1\xd2\
-\x85\xbc\xd2\x84\xb4R\x84\xb0b\xd7\xe4\xb0\xe51\xc9k\
-u\x92\xd6lb\x8e\xe3!{\x94\x87\xe8a\x03\xd8\xcd\
-\x17\x08N\xff\xd1\x01\x00VP8 \xd4\x06\x00\x00p\
-/\x00\x9d\x01*\xc8\x00\xc8\x00>\x91D\x9bI%\xa4\
-\x22\xa1,6\x88\x88\xb0\x12\x09in\xe0\xc1\x03\xf8\x00\
-\xd2\x1e\xfe7\x0b\xf4\x83\xfa\x07\xe2\xff~\x9f\xe2-C\
-{c\xc0\xee\xf2~3\xa6R\xe0/f\xfe\xb7\xc4'\
-\x1a\xbf\xdc|\x01\xbco\xd8\x03\xc9_\xfa/\xf9\x9f\xe6\
-\xff\xb7\xfa>\xfc\xaf\xfco\xfe\x8f\xf3\x7f\x00\xbf\xc9\xff\
-\xae\xfa#z\xeb\xfd\xa8\xf6\x09\xfdL\xff\xe8I\xdc=\
-\x98\xcbbm\xbfd\xb5\xc0\x84\xa6\xef\xfb\xed\xa8\xd0\x07\
-<\xb5hy\xa4\xda2\xc1S\xaf\x976=\x85\xe2v\
-\xfd\x94\x95\xd7P\xb3\xd9\xb7\x0f\xa3\x117v\xee\xbd\xcf\
-\xf2\x8e\x1bd\x95W\xd4\xe5\xdeU\xe6b\xa4\xec\xe4\xc5\
-\x8b\xb74l)\xe8\xe4\xdf\xec\x99\x00\x08o?\x99\x10\
-\xc6\xa2\xc7Z\x86#\xb3\xd9\x80B\x11\xa2\x9f?B\xe2\
-\xaf\xd9x\x92W\xbf\xe8%5\x807&\xd6\xc2\xf3C\
-\xaaQ\x87\xd7\xb9f\xecyQ\xf5\x99\x13\xd9\xb5\xecL\
-w\xa9F\xf8\x0eTwd2\x7f\xc6m\xbf\x0f\xa2\x11\
-B2\x89sx`\x03~\x85=\x9b\x5cV\xe5\x94\x17\
-WY\x9b\xdfUH\xcc\xc1\x89\xb6\xfd\xa6\xdc\x08\x8f+\
-\x91\xb6I\xc3*n\xd8\xf3\x9d\x90\xcf:qa\xac\x85\
-e\xd9@\xfam\xf2\x8b\x84tF\x0c\xc1T\xd5\x1f\xb9\
-\xb0\x1e\xc6\xc7]\xbf\xf1r\x08\x1dT\xd8f$\x1f\x1d\
-<\x88\x9e\x04\x85\x98\x92\x95\xcf\x8e\xd1\x02\xa3L\xfc,\
-=\xf5\xb3h\x8c\xb7\x95\x98\xe3<F\xf4\xf2\x00\xee\x9e\
-_\xff\xf1\xa3B\x1e\xcf\x10\xb3\xc6\xc36\xdf\xb4\xff\x8c\
-\xdb}\xd0\x00\xfc\xf9\xd0\x813J\xa4|\x12\xba\xa6d\
-\xef/N\xcf_X\xbd\x88E6szV\xc9|\xc4\
-\xc0\xa3\x07\x1b&\x08\x15\xd6QQ\xa4xr\xeds\x03\
-\x82\x1c5p\xf7Z\xef8\x95'u\xa9\x80\x15\x84k\
-\xe9\xe6\xd5\x00\x1b\x1fj\xe1\xbb\x1b\xf0\xd55\xe5P\xc7\
-KON\xb4\x99\xeb>\x81qU\xa8\x5c1\xda\x05\x10\
-\x11M=\x09\x03{K\xb9N\x10~\xfbQym7\
-\xb4\x19\xf5N\xe5dU\x88\x80\xf3y\x9e\xb3\xe1~Y\
-\xec\xe7\xd0\xa5)\x90iVB\x02\xf9\xe0\x8fw\xcbi\
-f\xdd\x9c/\xc8\xd8\xed\x01\x9c\x8bj'\x00\x14\x10\x9f\
-\xb3n\xac!\x8f\xef\x0bRW\xe1\x96eR\x1a\xe8\x88\
-\xc1\xa6w\x1a\x99)\xb6]\x09LA:\x9b\xd4\xcb\x10\
-\xa1\x5c\xd5\x9b\xc2[R\x18\xfa\xdc\xdcU\xc4\x8a\x16\xf3\
-\xb2\x13D\x17\x08\xba\xe3\x93M\xea\x1f\x0ak.^`\
-5\x9e\xd1\x1fk\xb4+\xa8:\x04+T\xe7\xf9bx\
-/\x07fw`\x8f\xa0\xe6va0G\xaa\xc9\xa11\
-\xaa\xd5y\x8cv\xbb\x90\xc0\x1d\x03\x19\x17}\x87s\xa5\
-\xf74\xdd\xb5%\xd9\x18\x85r]@\xc2,\xc5\x9d\xbf\
-\xfbW\xda\xdd\x0a\x9c\x8aCP\xc5\xbd\xdf\xc6\xba\xb8\x0e\
-R\xc3HB\xa5\xf2$.g\x85\xaa\xea^\x9e<\xf5\
-4!\xf9\xc0\x11:\x09\xa8\xc8\xb7\x01\xd4\xbe\x8dE\xaa\
-\xdf_!R{\xa6DG\x93\xfa=\xa7\xe4\xc5\xc22\
-k+\xee\x92\xc3:\xb6\x07\xbe\x9e\xa6\xc1e\xd6\xbf\xdc\
-\xfc?\x82\xc2\xfa\x11;9\xa3\xe2\xc1\x01\xb0Z\x95m\
-,\x9f\xab\x97\xb8\xa9J\xe5\x02\xbe\xd7\xd47C\xeeJ\
-\x05l/\xe1i;\x9b\x07\xd4u1\x8b\x04\xedb]\
-N\xd9\x03f\xac\xd7\x9d}\xd1\x8e\xcc\xc5;\xef\xc9\xbf\
-\x18#\xfewv8\xe7?\x973\x17&\xfe^\xa9Z\
-z\x15_\x04\xdf\xb5\xf4\xd5\x22mO\xdf\xc5>-\xdc\
-\x22+\x19\xd0q`\xf6\x01p\xe9\x00\x81\xc6\xed#\xd4\
-^\xec\xda\xa6\xaa\xa8\x09\xae\xd5y1<\x8d\xcfU\xf9\
-\x97\x8e\xfe2\xee\xd2D lFX\x80\x00\xe3\xf7\x0f\
-~\x04\xe5\xdf\x08\x12\xdez\x85\xe0\xbc\xbf0\xc9[\x11\
-Y\x94\x19\xee;\x1c\xd7\x8a_\xb2\xce\xa0G\x80\xa3\x1a\
-\xb8z\xb6\xfd\xc1\x1d\x85\x872\xeb\x9b\x0eB\xc7\xff\xe2\
-p\xff\xf1 \xbf\xff\x87\xf8N\xbe\x94\x80\xf7\xf0s\x16\
-j\x89\x1f\x02\xa0\x95\xf0\xaar\xb5\x0e)^\xa4.\x17\
-\x99\x8c\x8c\xddT\x14[\xb0\xf55\xf6\x1b}X\xe1>\
-\xe7\x17\x06\xdbrw\xff\x84\x90\xc7\x17\x98_\x8d\x95\xe9\
-\xb4\x5c\xa7n\x11\x08N<\x94SF`](\x0f\xa0\
-(\xddo\x90\x08\xa62\x19\x10s<T) \x84\xaa\
-\xf92B,7\xe8\xfa8\x03\x18\xdf\xbcT\xcc\xd1\x86\
-\xbc\x80K\xcbH\x14\xcaA\xfa\x11a\x15.\x05K\xdb\
-\xfc\xb5+\xb1[\x90O\x06DR$0\x85~\xf0Z\
-\xd5G-\x868nX\x0f2\xbb\xc8\xf0x\x98 \x0e\
-\xeam\xaf\xa5W\xaaF\x8c\xac\xd0\x89a\xdc\x9dn\x0d\
-:\xc9dc\xea\x10\x08.\xc6\xad\xfe\xfa\x92\xbe\xefr\
-\xf7\xca\xab\x89<\xa7W\xaa&Fc\x19\x19\x9f\xed\x83\
-\xce\xfcI\x95z\x041\xea\xe3\xe8Tt{K\xf6a\
-\xfd9\xb5j>\x1c\xac\xba\x0dcjCH\xe8\x9c\xe9\
-RBO42i\xc6\xb0\xf3Xqq8|\x1a\x15\
-p'\xa9\xcb\xf0\x8a'\xacf\x97\x001\xf3*\x89X\
-\x0f\x10\xfb\xd3|0g\xfe@\x94*^\x93&0\x83\
-*\xdacJj\xe0\xa9\x18\xea\xdfLP\x16]\xf3\xba\
-_\x01D\x18X\xfb\x0ao\x14\xb1\xb5*\xed\xd4\xb4\xcd\
-,\xc2\xf2\x80\xc5\x99-|\x83\xfa\x08~n\xe2\xb5\x10\
-\x16\x80$V\xe6\xa2t\xb8#\xb0\x1cH\x99UU\xc4\
-\x10\xd7\x8f7?@v\xc4\x09{\xa2[\xb7\xb5*\xb6\
-\x9e\x83c9H\xd6,\x8e,\xf4\x9a.\xc6\x10\x84\xf8\
-\xdff\xe5\xd1X\x19\x04?\xa5m'\x87\xfa\x03^z\
-&\xb8\x0b\x83\x83\xec\x99$#A\xe8\x97|\xd9\xf2\xd2\
-\xb9\x09o\x95\x84\xc9\xd6\xb9d\x0fW\x14\x9d\x85Yx\
-\xc3\x88\x86/\xded\x000V7\x9a\xde\xf4\xc4\x05\xd6\
-u6\xa2\xdf\x0d\xf5@`\xc5H(\xfa{/\xf4\x9b\
-\xe9\x08\x9f[\xbb\x16\x8eU\xe6\xba\xf1I6-<B\
-<\x97GL7F\xa0\x1c~\x9eD\xaa`\xa6\xcf\xe4\
-\x99i\x17\xab\xbd\x88\xea\x8a\x0d<,\xb2\x0a\x8b\xe9\xde\
-\x99[$\x95R\xa5\x1c\xc58G$\xe3o\x1bgB\
-$6P~\xa5>\xb2IK\x15\xec\x0c\xde\xa9\xe2C\
-lL\x06\x0aF#[\xb4\x1f\x9d9b\xd4\xbd?}\
-\xad\xd2\x90\xfdz\xbaG\xf8@y\xba\x1f\x07'\x10.\
-c\xd5)&\x05\xd0\xfc\xf1px\xcb\xdc\x82\xad\x81\x85\
-\xfd\xa0\x06\x9a\x8b\x0b\xb6n%l\x22\x8f0v\xc8O\
-\x0bb\xea\x91r\xcec\xc3c\xd1\xd0I\xef`\xbe\x8a\
-\x18\xfd\xd6\x84\xb28\x04\xe3\x01\xc8\x89\x0d\xa9\xc5\xfeI\
-\xdb_\x97\x22\xec\xca\xb6y{\x98\xc2^\x22\xabts\
-\x8f\xdd\x0bT\x88Iz\xd8\xa3J\x0a\x8e\x94\xeb\xca\x06\
-\xeb\xc9;\xb9N\xf3\xadT{v\x99\x98\x02\xafE-\
-\x10\xd0\x8c\xd8\xc3\x17\xa9%~!\xbce\xfb\xe1\xc7)\
-\xf2d\xaeu'\x83\x94\xa1*\xea\x96\x00\xb1d6\xac\
-\x05\x93\xe7^~\x8a\x8e\xf7 W\xb3\x09c\xefW\x15\
-\xdc0KQH\xdcCH\xf9\xa4[\xd9qO\xc0\xc5\
-\x915!_9\xc6E\xee[\xa1.\xbbj\xa2x_\
-\xbbc\xc9\xc6\x13\x9c8\xb2\x14\xdd\x01>\xd6z\xee\xcd\
-\x00\xc8\x98\xde0\x984\x87D\x06\xa2\x03\xf0\x00\x00\x00\
-\x00\x00\x00ANMF\xf8\x08\x00\x00\x11\x00\x00\x0a\x00\
-\x00\x91\x00\x00\x9f\x00\x00\x1e\x00\x00\x02ALPH\xb7\
-\x01\x00\x00\x01\x0f0\xff\x11\x11\x82nm[ud\xeb\
-h`\xc8T\x08\x0a\x85\xd0Ph\x84B\x08\x5c\x0f\x83\
-\xc12\xce\x07\x0d\xd5\xbd\xef\xb9\x11\xfd\x9f\x001+d\
-\xd9\x0587\xba*\x1bK\x91B\x153\x87\xbaEh\
-9)\xf0\xe0\xde\x81\xe6\x95\xc0\xf0\x08\xac@\xf2\x08^\
-N\x8dd\xa7E\x8a3\x2283\x94\xac\x15:\x8d\x87\
-\xf0e\xd4X6Z\xac\x18=\x861\x0c\x91f\x1cj\
-\xaaSD\xa6Jj)\x11\x91\xa6N\x05p+Q\x97\
-\x88<*\x19\x13\xb8ED\x94\x98\x1d\xc8jA\xb6*\
-P\xd4\x84\xdb\x12\x005\xe0t&p\x88H\x83\xc3\x19\
-N\x05q;\x90D\xe4\xa1x\x158ED\xb8\xbd\x07\
-\xb8\xd4\xba<\xf1\xe6\x19Xp\xab\x91\x02\x03\xb2\xeaG\
-\xa0;M\x82\x0d\x8a\x0a\xbfR\x81\xad\x078v\xe4\x95\
-\x05ik\xbetn\x8d7:\x5c_hoT\xb8\xbf\
-\xf0@\xfe\x82\xbcT\xf6\xd6\xefL\xf8\xc4x\xe9\xf8\x91\
-\xfeSi\xab\xfd\x97\xaa\x1fi\xff?\xfaw\x8e/\x8c\
-\x9f\x92\xed\xf9\x91\xf5N\xf9\x04\xef\xe4\xad\xe7#\x15\xee\
-/\xb47:\x5c_\x18pn\xcd\x97\xd2\xd6z\x038\
-v\x9e7* \xbb\xed\x8d\x0eekxG`BV\
-O\x0a,\xb8U\xbd\x02\xc0\xa5\xda\xed=\x81\xecU\xe0\
-T\xbdx\x1dHjp8\xc3\x9b$g\x01\x87Z\x5c\
-\x0e\x80h\xc8V\x05\x8az\x00\xab\x03YU \x19\x13\
-\xb8U\x03.\xf5\xe0u\xa0\xa8\xa6N5\x00\x92\x88,\
-\x95\x02E\xa4\xa1\x0f\xd5\x15\xfc\xc1\x14\xdd,\xbb\x185\
-\x96\x8d'v\x1b\xb2B\x975C\xc9\x1a\xa1\xc3j!\
-\xb1k$;\x12\xb9\xbc\x198\xbd\x118\xbc\xe6\x15\xf1\
-\x1f\xef\x0e\xc8t\xceHw\x8eH\xb5\xb2\x84\x97q\xc6\
-\x9a!\x9b\x0b\xb8v*\x14\xf1\x01\x00VP8  \
-\x07\x00\x000+\x00\x9d\x01*\x92\x00\xa0\x00>\x91@\
-\x9bG\xa5\xa4\x22\xa1/\x14z\x18\xb0\x12\x09gn\xe0\
-\xc0\x00e\x93\x1f\x1b\x81\xfaW\xfdG\xf1\x03\xbf\xef\xf0\
-\xdc\xa92\xdd\xa5\xff\x0d\xbb\xc1\xf8\xa5\x93?*\x8f|\
-\xecx\xd1?\xc8z\x01w\x17\xbbSQ\xae\xf6\xf3\xf5\
-\xfd\xe3\xc0\xdf\xe7\xfe\xa0\x1f\xc6=\x13\x7f\x9d\xfdu\xf3\
-q\xf9\x1f\xf8\xaf\xfd\x7f\xe8\xbe\x01\xbf\x91\xffZ\xf4\x99\
-\xf5\xdb\xfbC\xec\x15\xfa\xdd\xff\xa5\x11\x87/\xb73\xa3\
-\xf1?\x5c\xf5\xe9]\xbe\x1c\xb6\xab\x0e0?\x05\x9a\x91\
-P\xe7r\xdb\x87[%\xe3\xd9\x97\x97\xc35,\xd9\x7f\
-\x90\xb9\xd4\xffnL\xaf\xe3\xce\xc9\xc2\xb1n-\xe4\x9e\
-\xd9\x15\xa8\xdb\xeb\xf3\xb6}\x02DZ\xb4H\xa6\x17\xcd\
-nQ\x8fd.\xe1\x09\xf7\x96\xe1m\xbe^X=]\
-\x1a\xa0\x80'\x1b\xd1\xac3\x8aR\xfe\xba0\xf7;\xbf\
-gz\xfa\xb6\xef-\xeb\x96r\x8c\x8d\xb7\x7f\xf4\x9b\xde\
-\xde\xae\xce/\x08\xb7NB\xa4\xc2\x0e\x03\xf93\x92*\
-L\xe7\xf0a\x19\xdaE\xbf\xf5!R\xeb\x89\xfd\xd3\xa5\
-\x80w\xde\xe7:\xdfT\xf2\xf9Z\x97\xb0#\xb8\xffk\
-\x82\x90&wC\x05A<\x18\x0b)\xb8\x17q\x93<\
-\xe4\xaa\xff+\x1d\x95\xfb\xf7\xc8a\xa3\xad{\xf0J\xea\
-E*\xfa\x02\x86\xa3\x18#c6\xb8\xbf\x8b\x1e\xac&\
-\xe4\x1b\xf6\xfb\xf8\x05X\x0b\xc9\x0e\xf6\x80~\x06O\x1e\
-@\x22\x08\xae\xd0\x00\xfe\xc3Y\xd6\xfd\xe6t_\x05\xe1\
-\xa5\xf2\x94o%\xdc\x86\xaf\xae\xb5\xb1g\xe9\xa8\xac:\
-\xb2G\xe8`\xf1Y\xb7\x95\x13\xe7\x7f\xe7\xbfx\x99\xed\
-\x85\xd4\xde\x9f\x1dd\xc2ww\xad\x8f\x9a\xab\x90\x12\xcd\
-h\x99L\xaf\xb4\x0c\xe5\x95\x9d\x009\xaa\x98N\xc3B\
-K\x19\xb3\x84\xcc*)\xceP\xbf\xde2\xf6\xb1\xd4\xb5\
-\x8b\x80\x8dpX\xb0\x06\xa7\xc1\x0d@1<\x7f\xcf\xf1\
-z\x08>\x95\x19!\xb7\xc0k\x09\x0c\x11P\xac\xeb\xa9\
-\xccM\xbav\xb5\xd3\xd4[\xad^g\xe5\x1e\xb3\xa1\xb6\
-\xf0D\xd9\x05\xa7`>\x83\xead\xb6\x99\x99\x98\xdfE\
-\xb2\x0a\x0f\xc8\x19[\xe3\x0f\x8bu\x06\x82O\x0c\x15\x22\
-\x03_\xadF\x91\xa1\x1c\x02\x8d\xb0\x07\x0a\xab\xbc\x9b9\
-\xec\xddd\xed\xff\xfd\xd0O\xfe\xd3\xbf\xff\xee\x85=\x8b\
-\xc67\x0b\xfb\xe7|\x91\x1b\xe5\xd7\x92g\x09\x9bNQ\
-\x14\x5c\x8a\xfcw\xf4\xae\xa3\x95\x10\xbd2\xa6R6n\
-\xe6*Z\x07\x85\xa9~w\xe0]a\x19\xb6,N\xeb\
-/h\xa6\xb6\xd9\xe9\x8a\xac\x08\x04(\x13\xa7\x93\x07\x81\
-\xbf\x08\xb2\x853\xea\x0e\x84\xc3l\x99\x8e\x9af\xbf\x1c\
-\x9ec\x96\xc6\x88!\x1cpu\x0b~\x08\x93\x11F\xea\
-e\x04\x91f6,j\xef\xe8\xab*0%2*6\
-G\xdf\x01\xdd\xc8bqG\x06\x1c\x9a\xf7dONQ\
-\xbb\x87\x04\xc2\xa3+\xbc5m\xc0\x84\x87\x0d\x9c\x0e\xc4\
-2B\xae\x0e\x89\xea\xdf\x98\x13\xc4@hu9\xbf\x1f\
-\x03\xf1t\x09\xb7\x9a\x1c\xad\xfai\xc1)\xac\x5c'=\
-\xd9*{\xbbo*Rtj\xa2\xa03\x93\x5c\xcf\x90\
-\xa3uJ\xf7\x04\x92@\xf6*\xaboK\xfd\xfd\xa1\x92\
-\x1e\x88\xd9\xa8\xd7i\x91?n\xf9\xaa\xd9}\x9e\xf7\xd3\
-M&\xaf\xb8\x84na\x08\x8fB{\x22\x9b\x9a\x84\xd2\
-\x1b\xc1,\xff\xd0B\xea:\xbbG\xe5.%\x86\xac\xaf\
-n\xd3\xe2N\xbe\xa0\x91N':\xdc\x7f\xdd\xcd\xc6d\
-\xbb\x0f\xd2\xa1U\xfe\x912\xc9)\xc0\x89\xe5\xac\xef\xfa\
-\x1c\xf7\xc5C(3\xf9|\xa1J\xcb\x90d\xfd\xa6~\
-\xa0,\x15p\xd7]\xda@\x13\x87\xc3\xd5X\xab\x0a\x97\
-6b\x1d_5\xe2s%\xd9\x05\xc4\x1e;ZG\xae\
-\x93\xeb\xf3\x90\xb5\x99y\xa9\xe6\xb8\xca\x9b\xce6\xb0\xf6\
-\x8c\xc5\xfd\x97\xb9R\xd8\xd1\x15\x0fG\x85\x98\x09\x8c\x1c\
-\xfew\x99\xa9\xae\x80}#Vb\xdd\xd3\xb8m\x1a\xc0\
-\xf1R\x188\xfd\x22!\xb0\x05U\xa3\xdb\x02\xce\xd4f\
-\xe39\x941ZwBUk\xc7\x91t\x81\xe1v\xf8\
->\xdeQ\xb3\xf7\xa9\xd4\xbe\xe8c>\xff\xbfKos\
-\x17\x04\xbb1\xa9\xe79\xac\x93\xcf\xd1\xc4\xdf\xcfxE\
-\xfd\xde\xca)\xd4\xbd\x90\x94x\x8c\xba\xf15\x7f\xe5i\
-P\x0a\xca\x00\x13\xce\xe1\xc9\xeb\xbe+\xdc\x02\xf3.\xf4\
-\x14\xb5\xd9\x83\xa6O\x04\x8e\xa6Te\xfc\xe3Lr\x13\
-\xb0\xe7\xd6\xc3B\x85\x9e\xc0b\xe4\xd4p\x0b*\x86\x9e\
-u\xc3|\xeb(d\xca\x8f\x9e\xcf\x96\xfb(\x89W\x14\
-\x99\x0118XS<\x14lh\x8a\xff\x9d\xff\xed\xf1\
-\x8a\xf7\x22\xadq\xa5\x03T\xc1\xf6\xb1{~W\xfcV\
-u{\xfa\xfc\xff\x9c1\xf7\x80-\x05\x8cc@\x89\x01\
-^\x1bR\x85V\xeeh%u\x15\xcd\xc4\xd3\xe9p\xa6\
-&\x96\xfcB\xfex\x1ck\x80@y\xc2\x15+\xcbG\
-^$n\xa5\x9b\x04f\xda\x05#\xed\xdc\xa0r\x90\x93\
-R\x08c\xc0\x03i\x09\x06\x9bY?\xdbY\x01\xfd\xe4\
-\xffa/_j\x22\x9eH'\xbdz\x98\xd0\x12\xf5\x8b\
-[\xee{\xce@\xf1\xfaD\xe6\x12,~\x93c\xd77\
-\xe1\xf3i\x07\x1e~\x1d\xff\xff\xb9\xa8\x80\xb8\xca\x0a\x99\
-\xc9\xc0}J\x8a\xe2\x9ef\x05\xd5\x93\xbe\x01\xa2\xa7\xef\
-9\xf2\xf2e\xb1\x1a\x01\xdf\xba\xf7\x1eXD\xb6A+\
-H\xa9\xf4\xde\xf9\x198k>\xf4d\x5c+\x91@\xc3\
-O\xeaD\x14@\xea\xdfL\xde\xf8G\xf9\x93sy\xc8\
-|\x10\xde\xa1\xf0YR\xf2\xbeY_>\xfc\x0c]\xc3\
-1\xa6\xad\xc1\xfd]@\x5cspD\x01q<\xe3Y\
-G- \xf33\xbel\xe5\xc6a\xaa\x8b\x1d\x1f\xd0\xc9\
-\xc9\x02%\xef\xf37j\xe1\xe3\x9c\x13B\xfefI1\
-\xb9\x0b4\xce\xaf\xf5u\x0dJ?\x1bBD\xd3\xa4\x95\
-\xed\x0b\xed\x0at\xb4S\xa4\x86B\xf5\xc3t\xa7\xb1P\
-\xc4w*\x9a\xb6t\xe9\xf8\x0f\xb0;*\xbb\xb3\xcb\xfb\
-$Z\xb0=[\x9aD\x87|\xe5\x89F\x8a\x03\x97`\
-\xc1M8z\xd7\x7f\xaf\x08\xd3\xbf\xcc\xa5\xb8\x9e\x81\x9f\
-\x19S\x89r1\x88|\xf8\x15\x8f\x94\xa5}2~>\
-\x19\x1dKR/\xe2\x1eq\xb7\xae\xe9a\x82O\x9f\x99\
-\xe7\x9d:\x99|\x89\xa3\x15\xaa\xc9lP\x81\x19\x83\xea\
-\x7f\xcf\xefu<z\xfd\x12\x9aK\xe1d\x19v\x22\x82\
-\xf7\xb3N\x0f\xa2{K}\x9bi\x8c\x5cB\x01\xd1\x94\
--\xbf\x0d\x86B\xcaP\xbc\x99 \x0e\x02\xdd\x03\x03\x87\
-\xd0\xc0\xd8\xa1\x05\x17\xc09\xaf\x0f\xa23\x5cm\xf0\x11\
-f[\x1b-\xff\xf3T$!\x0fzX j\x95\xa7\
-C4CS\x0a/%`\x89\x00f\x9c\xb5\xf8j\xa7\
-\x96\x1f\xdf\x023\xf8\xa1\x5c\xcd\x06\xf4\x7fR\x04W=\
-\x00\xe3\xd0\xdf\x22us\x0b\xa7\xcb\xc5\xfft\x1bl\xe2\
-\x8d\x16)\x95UB\xdb\xdfE\xa1\x19\x95:\xbc\x1d\xc6\
-$\xf5qxE\xc3r\xa4\xd8\xdf(c\xe2\x92\x8e6\
-_?7\x04\xaaJ\xce\x9b\x1c\x18\xde\x88[\xb6KW\
-\xb3Y5\xcb\xb8\x1f\x87\xdd\xd6\xa8\x16\x01\x1b\xcfk\x0c\
-\x98\xc1%\x96\x9a!\xa2j\xf6W\x00\xea\x97\xa2\x80\x87\
-i\xeb\xe7\xd1\xbc&+9?\xa5\x81\x8d3\xc0F\x17\
-\xfce0\xef\xec\x86\x8b\xff\x0b0\x03\x10)\xf4\xfd\xc7\
-\x10-\x03\xf6`\x0fo\x87\x13&@V;tQ\xda\
-\x8eK\x8f^\x08\x06\xe1\xb51\xa3\x9e\xa0z\xbd\x1a-\
-'\xffLM\xa3/\xc2\xde\x8e\x9dpL\xb3\xe5\xcbm\
-};\xcd\xf6S\xe7W\xc8\x92\xcb\x13\xc9\xe7qr\xb8\
-\xf5\xf8\x12c\x0a\x9em\x01\x97:\xc7\xcd\x22z\x02\xea\
-\xa7\x00\x00ANMF\xee\x08\x00\x00\x13\x00\x00\x0a\x00\
-\x00\x8d\x00\x00\xa0\x00\x00\x1e\x00\x00\x03ALPH\xb9\
-\x01\x00\x00\x01\x0f0\xff\x11\x11Bnm\xeda\xdb|\
-8,Pb\x04\x8e\xc2lFl\x90\x950\x0aF`\
-\xc9\x02\x07\xaf\xf8\x7f\xfc\xa4d'uD\xff'@\xee\
-\x80\xa4\xf8\x05\x9c\x0f\xb09\xd4\x9d#4\x1cR\xa0\xe2\
-\x97@_\x1c\x81{AZ\xcdU^T\xd6\xfb\xa2\x07\
-\x8e\xc5\x15`1\x22\x9b7#\xd9\xa9Dw\xa7\x85\x0e\
-\xa7\x87N\xe7\x0e\x91^\xd8^\xc8\xe6\x8a\x15\xd3M\x91\
-\xa6\xd9M\x03NI\xdd\x1c\xa6\x02E\x92&p\xae\x92\
-\xb9\x00\x8c\xe0\x94m&\x99Iqd63\xd8\xbc\x01\
-ds\x93\xbc\x0b(\xe6:\xe57`w\xf6E]\xf5\
-\xb2\x10p\x98\x96W\x03NS\xd3\xea\x06L\xf4z\xa1\
-\x03\xe9A\x05\xb6\x07zcB\xfe\xdc\x80\xf2\xe4\x86\xfd\
-\xc9\xf5B\x87\xe3I{\xe7|R_\x10\xf0\x05\xf3\x85\
-\x01\xe9s7l\x9f\xbb\xde\xc9O\xfa\xb7\x94'\xed+\
-\xea\xb7\xec\x9f\xd3\xcf9\x1e\xcd\xff\xb2\xf1\x15\xf3\xbf\x8c\
-W\xf6\x9fP\x7fH\x83\xf2\x13\xfa;\xf9s\xd7;\xdb\
-\x93\xfb+\x06\xa4\xcf\xcd\x17\x00}\xac\xc2\xf9\xa4\xbds\
-<\xe9/\x5c\xb0K-En\xa7o\x91\x01E\xbaB\
-\xd3\xb9\xf3\x83,\x8d\x12\xa8\xc0&\xb1\x07\x9aS9\x02\
-\x1dHj\x10\xb8\x9c\x0eiu\x03\xd2\x0d\xdbj\xc0)\
-\x0d\xc8+\xe0\x90&\xec\x8b\xea\x01\xc7\xa2\x03\xbb\xc3\xe2\
-\x02\x8a4\x81\xcd\x1b@\x96\x06P<\x80M\xba\x81\xc3\
-i&I\x17\x80s\x1bI\xddd\xc3\xa2\x99CR7\
-\x87\xa4j\xc8\xd24\xbb$9\xfc\xc5-f:\xcbl\
-Fl3w,\x99\x1e\x93m\xa1\xc3\xa9\xa1\xdd\xd1\x8c\
-\x14oD6\xef\x8a\xc8o\x81sQ\x03\xfbBs\x95\
-W\xf7*\xad\xda\xe2Tp\xb1Gno\x8bt\xe7T\
-x\x9a\x12\xebF\x0f\x07\xe4'\xfa\xa3 \x00VP8\
- \x14\x07\x00\x00P)\x00\x9d\x01*\x8e\x00\xa1\x00>\
-\x91@\x9bH%\xa4\x22\xa1-S\xeb\x08\xb0\x12\x09g\
-n\xe2\xc0\x05\x98\x00\xcc[\xb8\xbfL\x7f\xa6\xfe1w\
-\xfd\xfe\x07\x96RU\x1c\xa0dv\xf0\x7f\xe5\x1b\xa7z\
-7\xf7\x1f@/h~\xcd\xc4'\x19\xdf\xe4<\x01\xbe\
-\xb3\xea\x01\xfc{\xd1[\xf9\x8f\xfb\xdf\xe2\xfc\xdd\xfe?\
-\xfe'\xf6\x8f\xe0\x13\xf8\xff\xf5\xcfH\xcf]\xdf\xb5\xde\
-\xc2\x7f\xaa\xff\xfc\x10.\xacF\xd6\xdf\xa7\xef\xf6\xf6f\
-\xd0S\x8c(\xadM)\x96\xb2\x01\xa7B\x17\xdc\xa2\xa5\
-%6\xfb\xbf\xdbQ\x0e\xeeMx\xd5\xd2\xe7\x16\xe1\x81\
-\x0b\xb7\x0dU\xae\xed Mou[M\xdf\xe62\xbf\
-\x10\xfc\xf1w\x1b \xe0\xb4\xa1\xe4\x05U \xd9eE\
-=\xd5Qe<y\x1dU$\xb3\x8cN\x96\xbc\xff\xa5\
-BT\x93\xa1\x7f@\x9d\xbc\x09\xd4\xd9\x00\xd9L\xd6\xfd\
-\xfb\x8e\x9c\xe66\x9c\xe7\xber\x07\x978\xff\xf1\x1fx\
-\x04\xd2\x05\x183\x17\xbf\xbaTD\x86\x906\x19p_\
-\xc7\xfc\xda\xce?\xbat\xdf/\xa9k\x1a\xe0\x10\xd2\xe9\
-\x11\x89\x8bg\x06\x94\x8d\xd6G/\x8fi\x84\x12\x18'\
-\xc4Xz{\xe5\xb1\xdc\xbax\x96\xa5U\xc4\x0f\xdc\x10\
-E&\x8d\xf1\xb3YdK\xa6\xff\x87\x8aR8 \x8a\
-\x962\xc0j\xff\x06\xca\x85\x8f\xda\xbdu\xff+'\xc1\
-V\xdf\xe1\xbc!g|\x00\x00\xfen\xc3\x18\x95\xd0\xe5\
-\xa9fCR\x0e\x22\xd9\x19\xaa\x8a\xd6\xaeRW\xa7\x1a\
-\x0a\x94M\x14R\xc2\x86\x9d\xea\x96%\xee\x83\xe7\xa5k\
-\xdd\xcc\xe6\xc6\x08\xc6\xe9\xdc\x17\xc5\xcfb'\x905\xcd\
-\xa1\x95\xb9\x87n\xf2i\xd6\x8f\x5c\xedo\xe6\x04\xae\x9b\
-fh\x12\x94M\xbbmDF\x13\xbf\x80\x0d\xe3\xc0\x82\
-\x1eY\xc1\xea\xa5\x80M\x06\xe2\xf4\x04\xdd5\x0c\xf4v\
-4Bi\xcf\x8fxEP\x84\x0e\x14d\x88z\xab\x16\
-\x5c\xb47\x8dN\xab\x9d\xd8|\x91\xd5\xad\x02\xb8\xdf\xb5\
-\xba\xb2\xc0W\x16I\xd6o\x86Y~\xac\x12}S\xfe\
-\x91\xc8\x81G\x93a+.\xfe\xd2\x8dj\x0a|\xd1\xce\
-R\x0f\x5c\xa4\xe8\x1b\x86\xe7\x95\xb0\x1f\x8e\xeal\xbeq\
-\x9d\x9f9_i\xa4\xf8\xb1\xb5\xa4\xfc\x92\xed\xe0/\x8e\
-\xad\xf5\x0b\x18\xb9\xed\xcd\x97J,\xe9\x7f\xcd\xa5\xbb\xdd\
-\xec.Wg\x85\xd0\x06>j<u0aS\xf6W\
-\xd7\x14\xfd)\x14>Q\xd1\xd0\xa2\xcb\x82\x91\x82@\x06\
-\x5c\x86\x1c\xa1vo\xa9\xa0vh\xffV\xcbbQ\x09\
-T\xcd\x7fY\x05Z-|\x16\xb7_\xc0\xa2r2v\
-\xcd\x96E\xcd\x5c\xe2Bb\xe57b\x82\xdf\xfa\x83j\
-w\x18\xc0_2\x95[\xdaA\xcc\xa7\xe3\x0b\xe5\x1a|\
-\x0dd5\xea\xa2N\x7f[\xb1\xda\xeb\xbf\xc5\xffB\xb1\
-\xff!\x9e\xb1\x5c\x05j\xd0W1\x03\x15P|64\
-a\xc8\x05\xad\x89\xc9\xdd\xb2\xe7v\xadP>\xcdZ\x87\
-*5\xd7\xe5EL{\xc9\xd4\xf3\xab\xbd\x08}\xb7\x90\
-\xde\xe0\x13R\xd20\xe9W[\x0b~M\x16\xb1l8\
-\x83@sk\x9f\x22\xc8\x12\xfb\xb2d\x09!&\xf9[\
-q\xc2\xf4\x802g\x06\xaar\xb6\xfe\x97x4P!\
-qq\x97]\x89\x9c-e \xff\xee\x83\x04\xcd\xda\x87\
-\xa3\xa1\xb2\xea\xcfu\x1eQ\x13\x97\xc0+e)@U\
-\xd1\xd4Z\x94\xe6\xccQ!\xf3\xd4O\x9e\xf6\xb4\xb7?\
-\x0b\xfa1\x7f\xd9\xd2\x05\xb0\xa0\xd7\xd8\xb3\xee;\x157\
-\xe0\x8f8\xae\xa9\xd8\x90\xd2H\xedv+\xc2\x1b\x0dK\
-\xd3\xa7[q\x9f\xef\xd7\x22\x95\xba\x9f%q\xee\xaen\
-C\x8bV`\xf1\x7f\xee\x8b\xdc\x92\x04\x00ZT\xcat\
-\xea\xd3\x96\xe4\xee\xa9Y\xb9h\xc2W\xef%\x9e\xef\xaf\
-cI\xc0\x0a\xae\xd4\xf9\xac\x00\xf0=\x8b\xb9\x94\x03\xb3\
-\x5c\xc6\xce-\x1e\xf4C\x7f\xd2\xef\xdb\x8c\x12\xd5C\x0a\
-\x9d\xe9U\x03L\xfa\x1f$<\xbb\xdd\xc1\x9a\x82\xf3\x98\
-\xa0\x22P\xeddB\x97-\xad\x81i\xe9\xb9?0\x81\
-\x97\xc3\xa1\x9f\xdd\x05\xe1@$\xc6'\xb7\xa8a+\xdd\
-={\xc4\xa5\xdf\xb1f\x05\x815W\xaf\xdaKv\xb6\
-(XP\xdaa'\xc7E\x9e\x10\x9b\xf6\x7f\xf7\x07\xcd\
-\x01\x8aubd\x97\xeb\x13(\xa5.p\xa5K\x14Y\
-<w\x8a.e\xaa\xed\x22\x03\xf8\x806\x22a\xdf\xc9\
-?\xf5OBfd\xed2\xbc:\xec\xaby\xc505\
-\x1e\x842\xa7f\x06\x96m\x01\x99\xf80\xe9\xe1\xe8=\
-\x9c\xa1\x9d\x84\x08\xf3\xa3\xe3\xd8f\xab\x03c\x11)\xaa\
-p,vJgK\xa8\xb2\x99:n@-`\x9a\xf9\
-\x1e\x03\x02jQw\x1e\xe0\xe6\xd8.\xa2L\x131c\
-\xa8\x7f\x91\xaa\x12\x93D\xca/\x921\xd3\x96\x0c7'\
-&o\xcc\xbb\xe4\xc4\xd0>\xd6\xa5\xba\xcc\x93\xd7\xdc\xe7\
-\xd3\xcd\xa99F\xbf\x84Q\xec\xdd@\xabq\x0b\x00|\
-[J\xc1T>\xf7_\x06\xdd\x13\x18\x01x\xc7\x82?\
-\x830\xcf\xe2\x92yq\xf4\xb5\xdd\xf4\x95\xecF\xd4M\
-D#\x1b\xden\xd39\x8bA$\x9d\x03\x08\x18\xaa\xdf\
-x\xea?\xc0\x05\x0d\x10\xcd\x0d=\xe9\xa8\x16\xf6#\xaf\
-\x0c?\xba\xa4\x17\x92L\xd1\x94$/\x80bb\x5c\xbb\
-ds^A\xa8u\xe66S\x9b\x86H\x92ha\x11\
-\xf4\xd1\xda\xf3.g\x81\xe4\x8c\xc1\xc4I\xf7[)\x22\
-\x10\x8d\xd9\xb5%VV\xefr\x05\xb8g%A\xec\x8f\
-u\xfbMyw<V\x0c\xd7\xd0E\xf8\xa6\xb1R{\
-3\xc2X[\xa9;\xc9)\xb2\xc9\xf9U4\xe8\x816\
-\xc7=>\x01&\x8d\x8dG\x9aP\x06\xa6\xda\x01\x0d<\
-p\xbe\x9aZ:\x89\xc8f\xf9\x9e\xbb{_\xce\x0a\xe4\
-\xb0\xa6\xa0\x13\x8f\x11\x9c]\xa7\xe21\x96\x13-\x83\xfc\
-cf\xb0\xe35\xd2\xf2\x8b7\x95\xf8gO\xb50'\
-;\x88>\x96\x02\xe0\x8e\xe1\xcfR\x80\xcbJ\x9f\x9a\x12\
-#I\x92\x92s\x9aW\x07/\x98]\xe3\xefC\xbf\xfd\
-\xeauo\x9b\x0fF\x10z)\xb3uO\x0br\x0eI\
-r\xc9]\x5c\xee4B\xd9\xa2\xf8\xe2_\x1c&\xf5l\
-\xf7\x8602\x0aZ\x08F\xd3\xdd\xe4G\xba\x19\xca\x06\
-\xcc\x1b\xf6\x13\xf9\x1c\xd7\xec\xb3\x1c\xbd\xf1P1\xa4o\
-\xfb\x5c\xf4\x8f\xe0,\x17j\x8c\x8c\x01\xf1\xf4\xb9\x07\x0f\
-\x1b\x05\xf7\xdb\xfd\xb5w/\xfe\x0c\xb0\xf3I\xdf\xd8\xb1\
-\xde\xb3@[a+&\x92\xd5y\x15ry\x13\x98\xef\
-\xe3\xbcI1;\xf4l\x5c\x8fq\xa9\xdb\x82\xf1V\xbc\
-\x84\x96\x1a\xe1>X\x1f}\x146\x94\xebi\xce\x0f\xdf\
-\x99I\x01\xa8`i\xa7Y\xc9qN\x22o36B\
-\xf7]\x0c\x16\xc9\x93ZD\x09X\xbe\xfd\xff\xff\x9b\x7f\
-\xff\xcc\xb9\xff\xfeh\x81\x1f=\x99\xe9\x97\x04\xaaN\x14\
-k\x046\xea\x04<\xe4\xf0\x88]\x87\xac\xad\x1c\xf1\xdf\
-\x22e\xd6U\x0d;\x00\xa4\xd5<^?\x8e\x87\xa5\xc0\
-P(\x14\xad\x92\x0a:\xc0\xc0_'`9^\x9b\x89\
-\x8a\xb0w\x04\x81\xa7\x95\xd3\x90\xbdl\xef\xaf\x94\x80\x10\
-|\xd7\x9fj\x99\x8fFi\x80C\x02t\xf0\x8d\x09\x19\
-H\xa3b\xe23wY\x1c\x82\xe2.\x94v_\xf0\x91\
-\xdf\xb7/\xad\x8a\xc4\xa5\xe7%\xcdL\x121\xaa\x87\x1e\
-\xacc\xf1\xa6$\x98\x9c\xb3Tt\xd4\x81\x10f\xc1\x17\
-)\x1e\xfd\xd6gp\x7f\xd6+\x9b]\xf9\x09E*\xec\
-\xb9?+s\x00f\xfe\xaa\x8e3\xa9\x5c\xdb\x93E\xe8\
-\xd9\xd0zHg;J[%\xab\xb4\x8f\xafg\xe3\xf1\
-\xde\x0c\xfb_\xf8\xd9(\xd9\xfc\xc00]\xf7\xff\xfe:\
-\xd3_\x8d\x5c\x00\x00\x00\x00\x00ANMF\x82\x08\x00\
-\x00\x10\x00\x00\x0a\x00\x00\x93\x00\x00\x9f\x00\x00\x1e\x00\x00\
-\x00ALPH\xb3\x01\x00\x00\x01\x0f0\xff\x11\x11B\
-jm[uhmFDd\xecu\x94\x92\xb6\x9e\x0b\
-\xa5QJ^\x07\x91\x88\x0c\x96\xe0\x9c\x03\xe3~mD\
-\xff'@6\xa0\xd9\x06\xe4\x89\xca\x98b\xcd\xc81\xcc\
-+T-\xb6Hsr\xa4;W\xa0\xe0'\xef\x0e\xec\
-^\x0b\x1c\xde\x1b8\xbd\x1e`Ir\xde\xc8\xee\xb4\xc8\
-\xb1\x22;O\xe4Z\x81s\x87\x92UC[dS1\
-v\xab@\x96\xd4\x86\xc3\x12l\x92\xca\x90\xbdKc\x07\
-N\xa7g\xe3\x01.\xe7\xdd\x8c\x0a\xe0\xc9\x1e\x92\xf5\xcf\
-y\x81\xcd\xfap\x1a\xb0[\xfe\xbd\xa2\x02\xc7\x8c\x80<\
-\xd5\xe1\x9czW4\xb8\xa6n`\xaa\xae(@\x9a\xd1\
-\xaam\xaa\xc3>\xf5\xaehpL=\x8b\xf2\xd4\xbd\xa2\
-.:\xa7\xca\x0a\xc1\xf5):|\x8awQ\x9aj\x9f\
-g\x9bz\xbe\xce\xbdh\xff\x0c\xf5K\x1dS\xe5\xef\xa1\
-OR~Su\xd1\xfeE\xee/\xb5M=\x9f\xa4-\
-J\x9f\xe1]\xa4\xe9\xfeI\xe0\xfa\x0ceE\x85S*\
-\xdb\x82\xba\x87n\xc8\xd2s\x84\x1e\xa3M\x1dR\xcf\xa1\
-fp\x86^\xd8U\xb9B}x \x04lj\xb1b\
-tH\x81\x0a$\x01\xdb\x84\x86=\xf0\x18\x1d\x8e@\x83\
-Kz\xe1\x0c\xbc\xde\x15\xe8pJ\x0d\x08\x00Yz\x80\
-\xe4T\xe0\x90n`w\xee\xc8\xe14`\x97*p:\
-/\xb0I\x05\xc0\x01H\x92\x86\xcd\xa8\x83$u\xe00\
-\x1e\xe0\x1a^\xe04:p\x0e\x0d I\xaa\x00yx\
-\x86,\xa9\x05\xee\x81\xa4\xc2x\x0c\xd5\xe0?\xe66\x14\
-\xcbM\x83&d\xf6\xd0e\xb5\xd0i=\xa1\xc3\xbaC\
-\xbbUB\xc9RH\xee\x1b\xb8\xbc'\x90\xbd;\xb0{\
-%\x90<u\xe7R\xb099R\x9d=\xa2n)\xdc\
-\x8c\x1c+\xc6\x16\xd3\x0b\x9c\x9a\x05\x92\x07\x00VP8\
- \xae\x06\x00\x00T'\x00\x9d\x01*\x94\x00\xa0\x00>\
-\x91>\x99G\x83\x19o\x91\x00\x01 \x96v\xed\xd5\xf4\
-Z\x8b\xfaK\xfd\xbf\xb4?\xef\x13\xf3Y\x02\xf1\x02W\
-\xff\xc2v \x80\x0f\xa9\xdcE\xf1w\xfd\xdb\xc0\xa7\xec\
-\x1f\xea=F\xbd\x14\x7f\x96\xff\x95\xfec\xceW\xe5\x7f\
-\xe0\xff\xf4\xfb\x82\x7f,\xfe\xbf\xe8\x93\xebk\xf6\xab\xd8\
-C\xf5c\xff1\xa5\x90\x9b\x10\x1d\x87_$n\x1dD\
-eT\x87c\xec1|X\x82\xc0\xfe\x83\xe1\xee~\xb4\
-6z\x84\x84\x15\xa3zTO\xd9\x8f\xfe\xc2\x9050\
-AYy\xa7\xb3\x85\x08+uS\xbf\xf6X9\xafD\
-L\x94\xb3?\xd8\xf6\xf9+%\xaf\xa0\x18z\x0e\x9d\x8c\
-\x0d\xb4\xd1T\x88\xb5q9^\xe96\xd1k\x8f\xc2{\
-0\x12\xdb\xe9\xe3\x9f\x19=fN\xe8\x92+\xbb\x929\
-\xe8%\xc8\xae\x9fF\xf8\x09E\xdbI\x04\xe7\x15\xf6\xc8\
-\xbac\x95\xee_\x19\xef*6\xba\xaeFN\x0b\xf8P\
-E\xef\xcb\xb93\xb1\xa4^\x09\xbe\xf7\xfe\xfd\x8b\xc4$\
-Z\xa2\xec\xdb\xd4\xec\x90\xda\xc3\xc4\xeb\xe0\x9e\x0a\xc6\x94\
-\x1b\x8c\xa9\x0fb0\xfc\xdb\xc6\xd9*\x1d\xfe\xaf\xde^\
-\x91\xf2\x06l3\x85!\xc3UN:\xea\x1f7\xc8'\
-\x22\x0b\x9d\xd9\xad>\xccT\xce\xc8\xd3\xacv\x09\x7f+\
-\xde\x1a\x98d:\xd6\x02\x80\x00\xfe\xfaw\xc0\xb2\xe9\xef\
-_\x10\xf4V\xfc\xcdZ\xb3|5\xf6\xbaY\xac\xf3\xf6\
-x)A+m\xb6\xdf\xb9\xcb\xea\xa7}\x9e\xe3\x8d\xa9\
-\x95\x00Y\x91\xdb\x18\xdf\x01g\x1f\x93\x0e>\xfb{Z\
-\xe66\x08\xb1\xe2\xe3(\x18P\xc8\xa8(\xd3\x03\x88`\
-\xe7{\xacx\xcd\x91\x16>\x18-gp\xd7G\xcde\
-\x9dT`\xf7\x0b\xf0\xb4\x1a`\x93\x12y^Q\xc3C\
-$\x11\x1f\x03@\xc4X\x9e\x17\x15\xde\x8e\xfev\x06K\
-\x15\xb6!\x9a7\xb4\xb0I\xd5r\x1a\xc1{\x95$\x1f\
-D\xa9\x9aZ\xdd\x06+\xbd=\x1e\x1dj\xd7K1\xe2\
-\xa7\x8a\x99\xe0\xe7k\x04\x1f.DV\xbbC\xaa\xec\xea\
-\x07I!\xddn$d\x0b\xa5\xd4\xd1\xe1o\x17\xae\xb5\
-D`c\xdf\xabC\x1e\x0a\xc7\x10X\xf2F9^\xd7\
-\xa1 \xc1\xae\x9e\xdb9\x15/r\x10e\x14\xfd;\xb1\
-8R/]9;\x94\xc5b\xbc\xd1\x97F\x81\xd2\x83\
-\xe1\xdf\x95$\xc3\x8b\x1d\xb1r\x98\x9b\xa3\x80\xcb4\xf9\
-\xabP\x5c\xdf\xdb\xd4\xcc\x115\xde\xfb\xb0\xa3\xa8\xbaX\
-\x92Z\x01\x16\xfc\xe4_W\x9fQ^\x10\xbcy\xea_\
-\x0e\xf9\xd5\x16g\x0b\xff\xb7s\xbaL\x16\xa9\xd9\xdb5\
-\x93y\xa2R7\x9bY\x22t\x98\xc5\xec\x093\xb8)\
-\xb2\xdc\xf0\xf0\x9b\xa51\x9f2\x22\x9bw\xeb,%\x02\
-\xfa\xc4\xf7\x92\xeeR\xa8Y\xb2\xb7\x8f\xd1B\x83\xd2\xff\
-\x9b\xedF\xf6!\xea4\xa6\xe1\x07\x10\xa3\xffg\x84,\
-Dm\xc83\x041\x14\x08\xfe\x22\x07\xc4h\xde\xf4\xc9\
-\x96\x91\xf2\xf2\xc4\x1e,\x18Q\xaf\x0d2eE;\xb5\
-d<\xaat\xd3\xedx\x8aE\xbbq0\x16\x0e\x16\x7f\
-\xaeQ\xe7\x88\xc3(\xdb\x9e\x16\xca\xb7\xc8\xd7nfP\
-\x9f\xba\x88\x9c\xac?\x9c\xc1/\xf3N\x07\x19\xc2\xc7\xac\
-\xe5\xe9Q\xd3;\xb3\xfe\xe6\x1f\x22\x95\x80]\x1d\x8bF\
-\xcc\xa0\xea+![{l\xa83#\xcb\xd9\xef;&\
-X\xb1r*kQ\xfb\xe0X\xfdM\x91\xb5\xc05\x1b\
-^\xf81\x88r\xb3\x0b\xd6&\x9f\x19\xf5JI\x8aL\
-<\x16\xa1\xe3\xe4`\xd1i\xb8\x7fp\x15$\x93\xf4\xef\
-$S\x8c\x97\x5c\x94B\x16\xfd4?!J\x0dv\x0c\
-\x95O\x8c\xbc\xe7\x86\x90\xf9\xff\xd4\xa1<4\x8e\xffr\
-|\xfba\x7fM\xfd\xbf\x1cAi\xcc\xfa\xe0+\x18\x98\
-\x01\x83\x97\xe6?\xc9\xaf\xd7zNk\xd8j\xb6_;\
-\x09\xb4aS\x94\x8a\xd3\x853\xa9e\xb3\xa3 \xc0+\
-u\xc7w-\x0e\xb2*\x13S\x09\xb1\xf0\x05\xfd\xe0\x17\
-2\x9b\x01j\x9d\xf7`\x05I\x8e\x7f\xf9\x16\x8d0D\
-\xca\x8e^+\xa3\x0d\xaaK+dv\xa3S&J_\
-\xf9my\xee]\xfa\x19\x8c\x9b}\x10\xa8\x19\xe7\x03\xbe\
-\xb6\xa0\xcb\xa2\xc5\xf9-\xb6\x9a\xde\xdd*\xc6\xe3\x1d\xd8\
-!v\xaf^\x9ff\x22\xd5\x06D|E\x02\xea*\xf6\
-mj\xdd\xd8>\xcb\xd9\xda\xf6\xe7\x84@[`$-\
-[1\x95p\x18k\xde3\xa6\xf2\x91\xb5)\x89(\x88\
-\x90\x1f\xf4\x05(\xa1\x90\xed\xa5\x0a\xb4\xfdl\x93\x0bh\
-\xd3CF\xa3\xe04\xa57\x09\xc6}!\xfb\x8b\xb1\xd2\
-K\x8e8EN\x10\x15o\x1eTjj\xa0\xae[.\
-\xc4\xd77\xa4V\x93\xd0\x9fo\x86\xf2u\x00K)\xb5\
-_\xad\xfcc\xa7\x5c\xd4\xe4\xef\x17\xbc\xda\xf0\x0c\xd9\xe5\
-wT0tQ\xb1\x83\xcb\x83e \x1c\xfa\xbd\xd0\x00\
-%P*\x99\xec%\x9f[\x0fu\xcc\xa6B\xffT\xec\
-\x1b5\xdc\xd6\x1ez\x7fA\x80@B\x99\x82P/\x86\
-&f?~Ibzk\xdb\x8ex\x7ft\xf7\xc5\xfd\
-o\x91$\x17RB\xa9~\xf0\xbc?\x86lA\xb1\xd0\
-\x88'w\x9bn\x85P\xa4\xd0\x85\xa2\x84\xa6C\xd9\xb0\
-\x03\xfd>\xb5\xef\xdd\x0b\xcdpa\xd8\x1f\x1a\x0c\x84G\
-\x98]Xo\xe1\xae\xd1\x0c\x17\xd4\xaa\xe3\x90\x8d\xe5\xb7\
-\x0c\xbd\xbf\xcf^\x12\x1c\x09\x1e\x99T\x84\xf4\xc8h\x1b\
-\xdb\xe3WZ\xb3+\x1f\x1e\xc1\xb0\xc2:cA\xa6\xb3\
-\xd2\x96\xa7 \xe7B\xc3\xb1\x87\x09_\x9c~g\x17\xdd\
-\xe8\xd6\xb5y\xd1H4\x0d\xb3\xffU\xf6;c\xee\xaa\
-\xd0L\x9a^`\xc2\x9b\xb8\xa2\x0a\xffq_\xd4\xac\x08\
-F\x94\xd67:%\xfd\x1b\xd0ap^3by\xda\
-p\xfd\xa3\x0c\x8cCK\x7f'>M\x13\xd4+s\x14\
-\xc0\xe9O\xd9,7\xa5\x18i\x94\xe5\xa0\xfb\x90\xee\xc3\
-Z\x10:c\xea\xcaV\xac\xf1\xcfq\xdbJ\xa3\xd5\xca\
-\xb0b\x902\xc8\xa12\xf3|[\x19\x1bO\x06Yc\
-\xc4\xa3FM\xe7\x99\x88_H\x93\xac\xcf\xae\x08\xba\xf8\
-l\xc6\xbf~\x86\xd1\xdd\xab\xf4#r\xef&\xc8=K\
-d\x99%LY\xaaX\xd6o\x1en\xf4\xe7\x11:\xd7\
-\x9ax\xb3\xc0\x8e|\x0d\xf4\x9f\x16\xf30\xfd\xe0\xb8\x9a\
-e\xb8up\x93\xe0g\xb6\x89H\xd89\xa8\x8d\x15\x10\
-\xe3\xeb\xcd\x81\x93\xa6\xdf\x9d\xde\xd7\xfec<\xf2\xbb+\
-\x1d\x92\x93\x04\x9b\xe1\x8cUSw\xb1G\xd3X\xcdr\
-\x0d\x85\x86\x89b\x8e\xb07\xbd\x17\x83s\xf3\xc5dD\
-\xf6\xd3 \xa9\xf9OK?\x1a\x1f\xde\xb3\x88A~\x01\
-\x8b\xbc\x9a\xccN'\x9e\x9a\xed\x80\xc1,\xec\xf0\xc8;\
-\xb0\x86>Y\xab\x18\xfb\x88tC\x1d\x11\x99\xe9\xd0\xb3\
-,!5\xb3w\x8bH\xe50\xe4\xc5\xca\x1f\xd2\xf8\xd5\
-\x22\xb3\x0cm52\x18\xd6\x0d+\x9d\x9c\xf4\x90\xf6Z\
-q\xb5\xeb\xdd\xe2V}*\xbf\xe3\xdfA\xf5\xabu\xcb\
-\xa1}R=\x9c3B\xe2\x92\x96\xc4\x87= \x1b\xb8\
-i\xde\xd3 \x82'\x9d^>\x9b\xc1\xde\xb9{\xb8$\
-0D\x8fi9X\x9c_\x18U\x89i\xdf\xefJ\xd9\
-)LMM{b\x10mg6o\xeaX76\x10\
-\x00\x00\x00ANMF\xaa\x08\x00\x00\x00\x00\x00\x00\x00\
-\x00\xc7\x00\x00\xc7\x00\x00\x1e\x00\x00\x02ALPH\xc4\
-\x01\x00\x00\x01\x0f0\xff\x11\x11\x82n\xb3mu\xc6\xec\
-E\x14\x94,\x10\xc9+d\x03\x16\x8bbFC\xca\x22\
-\x8c@Ia\xf9.\x0c\xef\xfb~\x87\xfc\x87.\xa2\xff\
-\x13 \xff\xf7\x03N\x17p\xb84\x9e\xc1c.\xb2\x07\
-k\x87\xb6\x89\xb6\xb9\xc9\xb6ks\xfa\x11\xfc\xa2i\xee\
-\xb2_1\x8d\x1d/\x08\x96\xaeH~\xd9\xd2\x14\x87_\
-\xb1T\x05/\x08\x06\xd1D[\x94\xbaH\x96\xfb\x10\x91\
-\xf9\xc8\xa6(\x22\xf5qX~\xcb\xf3\x02\x8a\xe5\xc7b\
-\x00\xa7e\xdd\x00|\xe4\x11|. \xfaL \xf9t\
-\xbf\x06d\x1f\x01\x0e\xa7\x1b\x8a\xd3\xe57\xe0t\xea\x80\
-S\xf3\xab@\xf0\x91\xd7D\xa7\x1b\x92\xd3\xe57!;\
-\x8d\x97\x1cN\xdd\xafAy\xb7\xea'p\xbe\xdd\x0do\
-w\xbd$8\xcdo2 \xbe[\x7fI\xfa\x1a\xed\xcb\
-d\xa7\xfa\xefG>\xa0\xfe\x17\xd1>#\xbd[\xff&\
-\x03\xe2\xd7\x98/\x09\xefvi~\xdad\xfb\xcbpk\
-N\xb7\x86\x01\xce\xcd\xf4\xbb\x09\xaa\x0aeU14E\
-\x87\xe84!\xa9:\x1c\x8a\xac\x1a\x8a\xe1\x90\x15\x87j\
-*:\x14\xd5\x05Iq\xaanE\xb3\x00Q\x81\xa6j\
-*\x10\x14\x0d\x08+\x01\xa2\xa2\x03\xa2I\x8a\xa1\xba!\
-+&\x9c\xbb\x0b\x8a\xe2\x82\xa2:\x15\xb7j\x02\x0a\xe0\
-\xd8\x0d l\x1a\x90w\x1dH\x9bn\xcb\x9b\x09\xa4]\
-\x03\xca\xe6\x02\xe2\xae\x02l\x00\xc2N\x1eq\xd1\x1e\xa2\
-\xbc\x81\xbc\x18\xc0\xa9\xb9\x80\xb2\xb8\x81\xa2\x99\x00AD\
-\x1a\xc0\xa1\x19\x8f,\x22\xf3\x915\xfdA\x90\xca3i\
-\xda\x82?,\xa3\xa6\xae\xb6A#\x06Q\xdf\xaaS7\
-UE7TY\xd7UIWUA'*1^\x8a\
-\xd32\x14\x87\xa5+\x92\xa5*\x82E\xee\xcd)\xe6\xb1\
-9lm\x93l\xb2\x11\xc7\xb98<\xea\x22z\xc8\x04\
-\x8a\xf8\x02\xc1\xe9\x7ftVP8 \xc6\x06\x00\x00\xd0\
-.\x00\x9d\x01*\xc8\x00\xc8\x00>\x91D\x9eI\xa5\xa4\
-#!*\x15\xb9P\xb0\x12\x09in\xfc|\x98\x12\xc5\
-c4\x1a\xe5\xfd\x1b\xfe\x97\xdag\xf7l\x7f2\x0d\xae\
-\x0b!\xde)&\xc2\x96\xbcFq\x85\xfe;\xc0\x8b\xc5\
-\xfdH\xbd\x14?\x99\xff\xa1\xfeS\xce\x0f\xe6\x9f\xe3\xff\
-\xf5{\x82\x7f'\xfe\xbf\xe9\x01\xebg\xf6\x97\xd87\xf5\
-7\xff\xc9\x7f\xbf\xf1\xdbs\xb5\xb0\xd6\xb1H\xd6\xf1\x7f\
-\xfc\x11\xad^\xf9o\x22\x86\xcf\x88\xbc.`\xef\x98\xbc\
-\x1f+\x12\xecu6\xe6\x9f\xce\xd5\xe0J\x1eK\x8f=\
-O\xf1\xf9~y.\x0br\xc3@\x0a\x7f\xc3\xb3OY\
-\xd3oH\xd7;\xf9\xc0H\x03\xa7u\xdc\x16U\x1e\xc4\
-\xe5\xf2\xe7\xadJ\x00\xa8kA\xf4s\x9fG\xfcv\xdc\
-\xe9\x8e\xa7\x12:\x5cz\x81\xb2\xb6\xf2\xd0q\xbf\xae8\
-\x07\x05\xbb\x0dk\x15\xa4\x90\xa3\xd6\xd3\x83\x18\xd7 M\
-\xbb\x0dk\x16wso\x8eM|\x14\xca\xbe\x9e\xcf\xb0\
-\xa2Gs\xb4\x0b\x1eM\xae\xc6d:\xff\xfa\xad\xa9=\
-\xcc\x93\x10y\xb0\xd5\xd7\xec\x10{\xebSfms\xd0\
-&\x7fXqF\xb5UL\xc3\xbf\x16\xae~\x80\x22x\
-\x00\x9e-It\xd8\xcac\x1ff\x92\xf1h#\x8fB\
-\xf5y\x93!)\xcc\xe7b\x1f\x8cU\xc0j\xe2\x94\xf1\
-\xb2D.Q\xba\xe1\x01\xfa\x85\xb3\x0eH\xbc\x9cS\x97\
-\xa8\xf7lA\xff]\xc8\xb3\xc3 /1\xf6\xedl\x0f\
-\xc5>\xa6\xc6Z\x10\xc6\xd0k7\xa4\xdc\xff\xf8!\x1b\
-\xd5\x8e\x1b\xe9q\xb6\xe7k\x90\xd6\x88;\xaf@\x00\xfe\
-\xed\xc2\x80Gi\xb5\xaf\xcb\xec\x10s\xf7\xda\xaf\xcd\x10\
-[E\xca\x13\x00\xc5\xa5{\x0c\xebzS\xe9W\xfa\xbc\
-\xa5\xc4:%\xfd\x1b\xd1\x03~R\x22\x1e\xfdC\xac\xc2\
-E\x95\xdfMT\xf9\x0c3\x95'\xbe\x16J^rv\
-\xe1\xf3\x92\xeb\xa32\x87\xf9(\xb1\xf8\x9b\x10\x00\x1bl\
-0\x909$\xdb\x01\xf7ps`k\xc2\x10*\x05>\
-:au\xe7b\xc8\xbf5\xae\xef\xc48\x0d?'\xee\
-=Q\xb2c\xca@&\xfa\xce\xd0\x06\xa2{\xb7\xc2\x0c\
-MT\x1e}\xf7\x90\x15Z\x85S\x88\xf7:9H\xb4\
--\x92\xfa\x80+\xc1\xc3\x82\xe5\x03\xf8\x85\xde\x8a*\x17\
-(\xba(\xa1\xd1\x0e\x9a\xeb\xf27\xf2\xd5\xd75u\xdb\
-\xdf\x02\xa3-\x1fp\xf5\xd9\xb1b}\xcc\x8d\x9f*\x12\
-\x85\xe6\xae3\xdb\xb1\xbd\xfa\xe7\xc4m$!ZC\x96\
-\x1f\xb2S\xcb\x98\x04\xf0\x06;\xbe\x9d4\xfc\xb17L\
-w.<*P\x01\xaaC\x11U\x12xE\xb5\x12\x11\
-\xb0\xc82!\x03\xc04\xa40\xa1\x06\xbbN\xc0yl\
-\xd3}\xf8\x123\xa0t\xb6\xb3\x99\x04\x02\xb8q\x95\xcb\
-\x18\x14\xba\xcfm\xf5\x0a\x5c\xe8.\x05\xbe\x1aV\x9c\xac\
-0\xfdn\xe5\xe2\xb2E\xda\xb7*\x82\xbfe<\x93\xd0\
-\x0c\xfa\x99z\xc1-\x94\xcc|\x1e7%>\xca>J\
-\xa7.x\x00]W0\x8cx\xd5\x90\xfd\x1e\x82\xf4\x12\
-\xea\x08\xfb.\xc8\x1b\xbc\xdf9t\xa1\xfa\xb1\xcd\xa8 \
-o\xf0\x08\xd6\x93\x1f\x19\x06\x1c\x1f9W\xff\xc2\x09\x18\
-\xc4\x0c7\xf8\xc3\x16\xbf\x90wla\x95v\xf2\xcc\xac\
-=\x96\x92\xb6\xc8\xe3\xb7f\xc6\xd4\x04\x0cu\xa3_\x19\
-o\xf8;\xb4\x8f\xbc(\xf3 \xae\x19@\x1eH,\x0f\
-\xc8\x00*\xdd\xd9\x8e\xfb\xaa\xf3@\x9b\x95\xc5\xd4U\x0f\
-\x96\xca\xd4\x1f\xc2\xe4\xeeq\xb6\xad\xee>\xe7\x928|\
-\xb3u\x99\x9c2\x84\xd3CV<\xa5\xfe\xa0u\x0f3\
-\xee\xf0e\x03\xf5\x93!P\xfe\x13\x22\xeaV\xf2K\x07\
-:\x16k\xd4@-q\x82 F\xc6 \x9a\x0b\xe1\xcf\
-\xe6\x19n:\xba\x90)\x87\x04\x92\x86\xd4\x96VL5\
-\x9a-1\x02\xdd\xd8\xd1\x9c\xba\xd7\xb4\xc5\x8b\x82;0\
-\xb4\x14=@]\x03f\xfb\xcb\xa6\xe8kO\xd2j\xf5\
-\xe9\xebY.\xa0i\xa9\x1d=\x97L\xaf\xc3\xb4v\xac\
-\x0c\xe5\xe3\x08\xaf`\xbc\x15>1w\x94\xd4\xd8\xfb\xec\
-#\xdf=\xdc\xb8\x91\xc3\x88|4/%\x95\xe0\xa6z\
-\x06:\xb89f_\xaa\xf4\xf2\xf3\xfb\x89p\xcf\x07\xe6\
-\xec\x97\xdb\xf2$\xf6'\x80\xd8\xa6\xb3\x8c\xf9\xac\xf4\x96\
-\x8c`\xd9\x00\x05\x1a\xb0w\xc2\xad\x1e\xdb\xd7-\xa0V\
-*\xfd\x8e\xf2\xd7\xd1x\x02*cL\x83\x9a\xd5n\x82\
-yF.\x06F\x06\xcc\xec\x9b\xf5\x07\xb3>\x9da\xe2\
-\x7f\xb1\xa0\xc8\x19s\x9e.|m\x90\x97\x0f9\xbc\xa9\
-\x8fO\x92e72\xd3\xbf\xb4uA\xb8\xf0\xd4\x8b\x17\
-\xf9\xf0\xb9\xcd\x08\xcf\xeez\x88\xe2:\xaa[\x16\x80\xfb\
-\x17\xb5\x9a\xc30+\xd1\xa8\x19\xee\x8e\xf0\x05(ac\
-tA\x5c\xc7~!\xa9F\x95x\xec\x16\xff\xc6]8\
-!p/\x1d\x17#\xae[L\xeb)\xb3\xdd&\x97 \
-\x93\x19L\x8e\xd7\xa4\xf0Yz>]*V\xfd\xf2/\
-\xfc\x12S\xa8/\xe69Nm\xf4\x7fR\xc1\xf2\xac\x1f\
-\x8a\x84\xf2\x94^9\xd6B\xb7\x0c\xa1\x0cm\x0c\xa2T\
-\xba\xc06cW\x15\xb4V\xbc!R\xd2\x05M\xe3\x09\
-V#I!l\xaa\x16\xc7Y\xab4\xe7\x8a]P\xf0\
-N\xdat\xf6 \x09\xb6\xa0\xd9\x0b\xa4\x94\xb3\xf7\xbdc\
-\xee\x1b\xb02AA~;z\xae\xe1\x82\xdd\x18i\x84\
--iGM\xbfT\x91\xda\x14\x0e\x96\xc4\xff\xf2w\x1c\
-f'\x8c\x07\x0f\xea\xad\x89B\x0f\xc4\x80/\x86\xfa\xe7\
-0\xb1\xf3H\xdf;\x89\x15\x13\x8b\xffxw\x95\x8cB\
-\x87\xcb\xe4Kp+(\x88\x87aH\xce\xa2\x08\xbcN\
-1\xa68\xea7h\xbd\xc1\x8fL \xa1\xec\x9b<\xb6\
-\xe3L\x02B\xe2u\xdb\xd4~8\x81\x87m\xd9\xb4\x94\
-\x96\x13g:\xd3P\xc2\xbd\xc56\xbb\x12\xe5\xc8-\xe5\
-[\x1e{#\x89\x0b\xcd\xa8\xb1\x09\xf08\xc9R\xf7\xd8\
-\xd9|\x15\xff\xc4\xa5\xb6\xb7\xf31\x97\xb3\xc7\xf3\x1dX\
-\x87\xd7\xd1\x0d3p\x19W}J\xee%\xe6\xe9\x8b|\
-=\x8bj\x0f\x9b\x85]p\xdd\xc2\x91`R\x84\xe0X\
-t!\xd6\x9f|\x00\xccH\x1b$\xa6\xfb\xd1\xdf\x01\xcf\
-}\x9azg\xf1\xbfv\xf0\xf2\xd1\xf0S\xfbl9\xdc\
-D\xed.\x8d\xe3/%:'?\xde/\xda\x13~'\
-B\x9f\xe9bn\xecp!\x1f\xee\x87N&\xc4($\
-\x0e\x19[\xed\xe5\xcd\xac\xe8\x11%~\x82E\x1dM\xd0\
-\xbcd\x9aT\x08\x08\xe7\xf9\x9d\xb5N:\xf5\xca\x81\xc8\
-\x0d\x10\xde`\x91\x82\x98\x1b\x9b\xba\xad\xf1-=\xb9C\
-\xecO,\xdc\x08\xda\x89\x0f\xeey\xa0e\x0fq-e\
-;\xca\xfd\x88(\x0a \x7f)\x10\xe7\xd8%\xf6&k\
-\x16\x83X\xaa\x9cc\x05\xc1\xc8\xfb\xa4/\x8cb\xd6Q\
-\x1f\x1a]y\x86x\xec\xda\x83\xf3\x1b\xad\xa2\x8a\xb7\xa8\
-{(\x05Bs\x90>\x81\x90\xd2\xee\x89\x0e\xebtq\
-\x1d\xf2\x8f\xe6\xb0=w\xf4\xec\xcb\xba\xe5c\xf1\xb6\xb9\
-\xc6x\x1a\x97]4\xd28\x10\xeac\x9d\xe4b\x91N\
-\x14px\x95\xdeu\xdbQ\xd0bY&\xc6\xdc\xdaz\
-\xb8s7\xef\xac%\x88Y\xf8em3*\xdfm\x1f\
-\x8e(\x9aP\xb11O\xb3\xf2U\x13\xa4F(\x83J\
-2!mU\x88\x9d\xf3e.\x0e\xaf\xb3}\xb6\x1c$\
-\xf7\xc0\x00\x00\x00ANMF\x92\x08\x00\x00\x0c\x00\x00\
-\x0a\x00\x00\x9b\x00\x00\xa0\x00\x00\x1e\x00\x00\x02ALP\
-H\xb0\x01\x00\x00\x01\x0f0\xff\x11\x11Bnk[\x95\
-\xe8\x5c\x84\xe4\x09\xe9\xc0\xe3N(\x0dJCr#\x94\
-@H0\x9a\x1d\x00\xf7\xde\xf7\xb3\xd3\x88\xfeO\x80\x1c\
-\xa1\x88\xf9\x01nKe\x0d\x86\xb9I.\xc5\x85\xa8\x1b\
-\xbb\xe4R\x5c\x08\xaa~\x88.\xc9%\xab\xda\x01\x9f\xe0\
-\x125\xf5\x94\x5cn\x97\xa2\x91\x13>\xc1%j\xde(\
-usi~\x8b\xc8\x5c\x92f\xad\xcbm\x91\x07\xc8\xa6\
-\x01\x14S\x030\xc9\x12L\x0f\x10M\x03\xb8L\xdd\xa5\
-\x01\xc9$\xc0m{!\xdb\x1e\x97\x09\xc5\xd6\x01[s\
-\xa9@0\x89[\xb4\xbdp\xd9\x1e\x97\x09\xc96\xbcn\
-[wi\x90?Gu\x11(\x9f\xe4\x85O\xf2x\x05\
-\xdb\xfcR\x03\xe2\xe7\xe8^\xd7\xd7i_-\xd9\xea\x7f\
-\x83|\x9a\xfa\xdf\xd0\xbc\xae\xaf\xd3?\xd9/\xc3\x80(\
-=y<\x1e\x95\xdb0!\x0e\x8f\xf0\xba@6<^\
-\x02\xc5\xf0\xba\xbd`\x80\xe2\xf4@P\xd5CT5\xc8\
-N\x13.U\x87\xdb6\x96\x01\xc9\x92\x96[5\x97\x0e\
-Y\xf5\xc0\xb5\x14\xd5\xbb4\x0b\x10\x174uS\x81`\
-\x08\x22@Tt@6\x97b\xec^H\x8a\x09ED\
-\x1e\xc8\x8a\x07\xf2\xae(\xde\xdd\x04\x14\xc0-\x22\x03\x08\
-\x87\x06$\x11\xe9\xc0u\xe8\xaat\x98\xc0%\x22\x0d\xc8\
-\x87\x07\x88\x22R\x01\x0e\x00ADd\x89\x9b\xb6\xc8\xfa\
-\x02i3\x80\xb2y\x80\xbcy\x15\x13 \x88H\x03\xc8\
-\x9b\xb1$\x11\x99K\xda\xf4\x85 \x95\xf5\xda\xb4\x0d\x7f\
-\xd9\xc6M\xdd\x1d\xc3F\x0c\xb2\x7fU\xe50U\xf90\
-T\xe9\xd0U\xd7\xa1\xaa\xe2ATr~\x14Y1\x14\
-\xb7\xa2+.EU\x04\x85\xbc\x87\x22\xdaq\xb8U\xed\
-p\xa9\xe4\xdd\x89~nnC\xddD\x83L \x8b\x19\
-\x10\xc7?\xa2\x04VP8 \xc2\x06\x00\x00\x10)\x00\
-\x9d\x01*\x9c\x00\xa1\x00>\x91@\x9cH%\xa4#!\
--\xf6\x09\xa8\xb0\x12\x09in\xe0\xc0\x00e\xd8]_\
-\xa3\xbf\xd8;F\xfe\xff\xf9C\x93o\xbf\xd1\x1a\xf0\xad\
-4T\xdd\xe2O\xb9C\xd0/\xef\x9e\x0d\x1eE\xec\x01\
-\xfcw\xd1G\xf9\x0f\xf9>Q?-\xff\x15\xff\xaf\xdc\
-\x17\xf9_\xf6_H\xef^?\xb1\xfe\xc1\xff\xab\x7f\xfb\
-\xcf\xd4(\x7f>\x14Sz\x22G\xff\x17Sp\x8a\xd9\
-\xf7}\x89dz\xe2O\xe5\xad\x05\x8a\xb7\xab\x99\xe1\xc3\
-w[g\xb4y+@i\xff\x0cv(\x1e9\xb40\
-\xb2\xe2-\xf7\xdf\xff\x8fbL\xe1\x19\xe2\x9dL^;\
-H\xc6V\xef\xb3b\xd8\x09\xe0)\x92\xa7\x0e\xfb\xfe\xda\
-\x9c\xe4\xb7\xcdt\x11H)\xd52\xd8\xb1\xf9\xe9=\x15\
-`\xfb+\xd5\xac\xe4\x83\xf3\xd5.\xda\xa0\x10\x8f;\x15\
-\xea@]\x0f\xf1E\x9cn\x06!\xec\xe1\xeeh\xc9\xca\
-~\xbbf\xbc\xfd\x9es\xdb\xbdTc\xff!\xd1n\x01\
-)\xde\x87\x9a\xd6\x11+\xfb\xbdv\xbe\xde\xea\x9b\xb4\xdf\
-\xc7\xa3\x9a\xd6\x05~\x95p;\xdc\xbe\xe6\xadd\x1f\xec\
-\x00{\x0a\x0b:l\xc7\xfab_\xc0\xe0\x94%\xa0\x9c\
-\x88\x06\xa8|\xd1:\x11\x81:\xec\xad\xec-Dig\
-\xb1]~\xd2\xf5\xba\xe5\xad\x89\xd6P\xf6\x0a\x91\xf1\x0f\
-\xdc\xf7\xc4\x1d\x03Q\xf62^[*Wd\xc0\x00\xfe\
-\xc3N3!\xec\xf7\xe5\xccyvGR\x85\x94*\x99\
-g/\x89\x05\xd5\xc0I\x13\xb7P\xc6\x0b\xc7\x96\xb8\xe6\
-\xe2`\xa6\xae\xb5\x1e\xb2\xce\x0f\xf6#\xf3>\xec\xdba\
-\xe3\x091\xc4j(\xed6p\x8f\xd5\xec\x17}\x91\xbb\
-d\x87\x90\xe0D\x118\xf0=\x89\xb1xR\xf6\xe5F\
-MO\xb3+\x0aQ1Z\x99\x12\xc7\x13\x18\xd2\xc5\xb8\
-=\xe6\x0c\xd8\xb5[U\xc1\xaa~\x12=&\xa0}\xbe\
-+h'\x1cl\x01b\x1bY\x87MS>\x0a\xfc\xf0\
-\x1c\xaa\xa0\x9f\xddd\x96\x82\xdd\x0e\x16\x14\xe6\x8bF\xae\
-\xfd\xfbJy=\x06\x17\xe3\xba\x1f\x8c\xe1\x15g:\xba\
-\xdcN\xfe\x09\x18a!\xbc\xf3|1\xfa)\xf2\x97\x0f\
-\xf3\x08p\x04\x22\x83\xb9\xd8\xc1L\xc8\xf9ik\xe94\
-\x0f-\x8c\xd2\xb0\xd0\x06\x9dK\xe4y\xe5\xffJn\xa9\
-\xad\x02\xf8\x05\x86\x05\x8c\xfa\xf5\xda\xa2\xf6I\xb5<W\
-\x19)\xc0\xa3B\x9dK\xf8\xa6\x11\x0cY\x1d\xbb\x09\xa3\
-\xa6aiV@\xcf\xdc\x14\xaa=\xc8\x15\xb7\x82.\x13\
-p\xc3F\x97w\x05\xdb/\x0b\xff\xfaz\xcc\xbe>@\
-\x1a*#\x9f{\xcf\xa4\xf48\xe9\xaa\xdfI\xefA\x89\
-\xc7\xe4G\xe9=\x1e\x0d2\x12\xe2s\xe2\x1f[\x83\xa1\
-\xdec\x9d\xffU\xaf\xbf\xe9\xeePp|\x94d\xe9\xaa\
-5\xc4\x80*\x14\xc5\x81\xd1\x8e\x1f\x84\xce\xe7b\x9ae\
-\x97s\x16\xf0\x01\xc9-\xea\xd7\xcd\xb7\x228\xb3e8\
-\x076P\xe8@\x05\x89m\x8a8vP\xee\xebiJ\
-~\xea\xeb\xa4\xe6\x02z\x92\x1e\x7f\x95c7\xba\xeb\xca\
-\xc9\x8c\xb0\xae\x98\x19\xd8\x96\xb8\x8a\x88\x8d\x10y-\xe8\
-\x5c\x17/\xcah\xc0$\xe2l\x8d\xaf\xdb\xa0\xa6\xa1@\
-T\xd6\xc0\xef\xcb\xd5\xed1\x14\xfa\xdf\xd06\x7f\xcd\x17\
-\xc3\xe5TF\xbd\xaa\xbd\xdeJz\x83\xd7\x0e\x80\xe6M\
-\xd7~\x94\xbe\xec\x9b\xdd\xda\x06s\x89&\xd9\xf9R\xc6\
- \xe2.\x9c7\xd3\x16\xe7\xb6\xecKb9)\xc11\
-\x19\xc3O\xd1\x1f\xd1}7\xab\xd6\xb63\xa1f\xc7\x84\
-\xbe\xaf\x88Y\xd3\x08pF\x18d+=\x0c\xa3\xcd\x7f\
-@\x9d+\x7f5)w\xcfc\xfdj\xd400{\x8d\
-\xef\x96q\x00\x00E\x17<F\x05\xb9)\x09e4^\
-Cu[\xb0\xfen\x0c\xfe\xd3i\xdc\xea\x0c\xf3\xfd\x80\
-d\x02\xfe\x0a\x88@'\xe7\xf3^\x12p\xb3CF\xe8\
-\xe9h\x91e\xa4\xef\xc9[f\xc2\xdd\xd6`>\xbc\xeb\
-?\xfc\xbf\xa0\xf9\xa1\x90\xe6\xa9_a\xed\xe3GV\xa0\
-o\xccc\x82\xd4\xb4\xdee\x91\x95\xcc,\x8b\xc6F:\
-\xf1\xec\xb1\x1d\x5cS\x9ek\xc5\x19\xb6f\x9f\x805\x1e\
-\xd6\x0d\x8a\xeakG\xa1\xcc\xbe\x1eG\xb0\x9a\xa3YU\
-'\x9aNr\xa4\xee\x18o\x9e?+\xd7C3\xe4+\
-\xe1\xcb\xac\x8c\x1anv\xfe:\x8bN\xa3\xe8\xaf8w\
-\xb9\xd5\x22y\xe81\x84\x93\xdb~Q0:\x8a\xe4L\
-%\x93.'N\xec\xf1\xd1\xccm4\xa1\xb6\x89\x82\x0b\
-\x84,\x1e\xd9Q\xc5\xf1c\x82\xab\xf1np\xfd\xdeA\
-\x19i\x04) \xbf.\x5c\x99\xd5\xffV\x9b\xf8\xc2\x80\
-\xc9`7\x11\x0cq\xf4*\x1a\xc8\xe2Vd\xc2\xa7\xb6\
-\x87N\xb1\xe1\x8dM\x08A\xcf[\x9d[\x04\xee\xfb\xa8\
-\xce>\x22o\x0fy\x14\xa2p\xf1\x9b\xe1\xa0\xca\xb4\xd6\
-\x16\x10.\xe5^_\x9f\x04\x8d\xed\x0f5sq\xf6\xaf\
-\x18\xe3\x80\xfd\xf3\xc1;\xfbV\x09g\x9f\x80\x04\xd9\x0a\
-\xa0\x91\xc5\x0bZ\xae\x1d\xe2!N\xa9'\xa0\xe0\x80\xe1\
-\xfbCau\xf5\xa0\xb8K\x1d\xfay\xb7\xab\xaa\xbd(\
-\xb8\x9b\x0fD\x94%\x02z\x1e(\x19\x0b\xcdE\xfb=\
-\xed\xf1\x83\xd2\x026\x1d\xc4\xe9\x97\xbc+pA\x1e\xdb\
-\x96\xe2\xf0\xc7\xe6\xe5)':G\xee/\xf5\x1c\x01\xb0\
-:k78\x8fF\x06pE\x8b\xb3\xd4\xc7c\xe3\xfc\
-\xa9\x1b\x062\x84@J\xe5\xae\x19\x9d\xd1T\xae\xc7,\
-\x85\xb8\xe8rQ\x84`Y'\xcd\xde\xbd\xce!\xd3\xe5\
-zz\x0a\xf6o/`\xbd\x08\xff\xcf&!\x8ff\xb2\
-I\x7f\x01\x93*\x0e\x82\x99\x19\xc01U\xc1\xc1\xd7@\
-\xc6Gd\x834<\xa2\xe5 \xcc\x87i\xa6\xc6\x5cm\
-\xb1\x01\xb5\x84\xb4\x90\xdc5I\xd9\x99\xa4\x9a`\xab\x82\
-\xfeZYT\xb7\x1aR\xec\xfdk~\xbe\xbb\x1d\xed\xf1\
-i\x86d\x1b\x1f\x1b\x9a\x17\x85Nt\xf8\xc9Z\x0f\xf9\
-\xd8\xf6\xf2\x0cc\xeb\x98\xe4q1\xe8\xde\xbd\xe5(\x17\
-}\xa1\xa1\xaeV\xe5\x1d\x0fb\x83=\xb0X\xe7Gy\
-\xc3\xc5Q\xa6\xca\xed\xe6]\xf9-\x19K\x83\x1aP1\
-:\xb3\xc4W|y\xdc\xef\x9b\x0d\xb6\x8eF$\xbc\x8c\
-\x1a\xf0\xce\xd7|\xfa\xcf\xaf&\xf7\xa6da\x99\x06\xf6\
-\xeb\xd5\xda\x88\xc5\x9a\xf6\xac7vV\xba\xab\xae\x0fc\
-\xeb\xfb\xc8\xde\xf2\xb6\x9c\xc4n\xb9\xbf\xd6!\xf3\xe9F\
-\x84\x80\xd7\xf9\xc7\xf3\xc2AE\xd4G\x05\xefR\x9b\x9c\
-\x83\x97\xb9\xb0\xd8\x89$\x1b\xad\xd7\xfc\x91=Jv\xb6\
-U, x>q\xb3\xe2\xf6e(\xf5\xcay\x04\xae\
-\x8c\xd1,~f\x8bW\xa7\x0f\xef$Bv\x9c\x11!\
-X)h\xa4\x8f\x06,,\xdb\x95\xce\xbf\xa9\x87\x18b\
-\xc5}\xa0-\xe1`{\xa2\xea\xd3\xadD,\x88|*\
-\xd8\xbdo\xe7t\x8b\xfaz\xcf\xe3\x83#\x044*\x07\
-\x9e'3\xc3%\xa0\x8d\xd6LF\xbb\x1eo1\xef\xec\
-nM\xb6a\x16F\xa3\xacn1\xfd\xc0pv8\xaa\
-\xf3\xb6I6\xd6i\xd4\x9c\x91\xa9\xa7\x0b\xb1lF\xda\
-\x80\x19\xcc\x992\x10\xb1\xaajU\x1c\x9c\xbe\xb8P\xfe\
-l\x9d\x02\x0a\xa1O.\xe7\xbeMzg\xb4\x82`L\
-T^\x16>\xaa&I\x16/?\x22\x1e[\xfd\x0e\x5c\
-\x1f\x83%\xd5\x0f\xff\xe3\xac\xca\xff\x8b\x8c\x00\x00\x00A\
-NMF\x86\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\
-\xa0\x00\x00\x1e\x00\x00\x03ALPH\xac\x01\x00\x00\x01\
-\x0f0\xff\x11\x11Bnm\xdb\xb8p\x1dC T\x82\
-W\xc9S\x1a\xa5\xddRn\x09B\x81a\x058\xce\xf7\
-\x9fF\xf4\x7f\x02\xe4\xd8 \xc8\xf5\x04\x9cI2\xc1\x99\
-\x04\x93l\xc2\xcd\xd8\x04\x93dRL\xb0\xf1\xba\xbe\x8b\
-&\xc9\xa4\x98`\xe3T\xed\x10L\xa2I2\xc9\xaa\x7f\
-\x22})*\x11\xa9\x0b7\xd2\x17w\xf3,\xfeF\x96\
-p5\x80x\xd5\x80t\xf5\x00\xf9\xaa\x02\xe5J\xa6\xc9\
-\x00\xee\x1a\xe0\xae^\xc0_=&\x15\x08W2!\xde\
-\x0d\x93\x0e\xe9\xaeY\xe5\xbb\x17\xca\xddcR\x81;1\
-sw\xd3d\x80\xff\x1c\xdd\xa4A\xf8\x1c/\xc4\xcf\xf1\
-X\xa5\xbb\xfa\xa5\x04\xf2\x17\x9aF\xe5\x93\x8c/\x86A\
-\xff\xd3\xb4O\xd3\x7fG\xffo\x06H\xcfw\xe5\xc1b\
-\x1a\x95\x9bi5>K\x1ep\xc3\x078]\x85\xdc-\
-\x92\x99\xd7=\x90\x9aEl\x10t\xaf\xd9\x0bQ\xd7 \
-\x98%]\x87\xf0@\xd6\x0d\xf06\x15\x8an\x82\xab\x80\
-\x0epb!\x8b\xd3\xd4\xcd\x04\xafy\xa0l\x82\xe6\xdd\
-\x8c\x8b\x06y\x135}\xd3!i\x06$\x91\x06\xf9\x22\
-n\x8a\x86\xcd\x0b(*\x10D\x1e\xc0\x9f\x1eM8\xbd\
-\x80\x17\xa9@<5\xc0\x89\x08\x90N\x03\x10\x11\x99P\
-NS\xc3\xa1\x02e\x19\x80\xdf=@^:\x10w\x0d\
-HK\x03\xf2n\x00qy\x01v\x00ay\x16\xbf\xbc\
-\x8b_\xea\x92\x96\xa1\x90\x05\x11\xa9\xacn3\x97$\xd2\
-\x97\x22\xdb\xb1\x90'k\xde\xf5\xcd1\xed\x9a.\xee^\
-]\xd8U\x9d\xdf\x89N\x8eSSN]\x93OM\x13\
-O\x8f\xc6\x9fD\xe3\x14\xf3TD\xd9OI\xf3\x9e\x82\
-\xa6\x9e\x9cF\xc6\xae\x88\xfa\xddE]\xdd9\x9d\xf4%\
-\xcbe]\xfc\x8d4\x88r_E\x09VP8 \xba\
-\x06\x00\x00\xd0'\x00\x9d\x01*\xa0\x00\xa1\x00>\x91>\
-\x98G\xa5\xa3\xa2\xa117\xd8x\xb0\x12\x09in\xe0\
-\xc0\x00|\x00i\xa2\x13\x9f\x88\xbf\xcav\xa1\xfe\x07\x95\
-{\xd8~U\xad\x19\xc6/#N\xdd\xecm\x00\x1fX\
-\xf8\x91\xfa\xed\xca\xd9\xe0\x8b\xf4\x1f\xf6\x9e\xc0\x1f\xc5\xbd\
-\x17\xbf\x82\xff\xb1\xe4\xfb\xf2\x8f\xf2\xbf\xf8=\xc1?\x97\
-\x7f_\xf4p\xf5\xfd\xfb\x09\xec\x15\xfau\xffh\xd9\xc8\
-\x22\xa5\xa0\xfeR\xf3\xa6\xdaK]0$\x95X\xfe\xf5\
-3\x0d\x09ql\x03lH\xfamXl$\x9c6\xca\
-\xaa*{9\xc0N\x86\xd8(\x93W\xa4N/\xa3J\
-lrkz\x14wF\xe2o\xb8\x0bjw\x0b\xe2\xf9\
-\x06\xe7\xc3e\xd6g}.\xfd^m\xc5\xe4$\xf4K\
-dr4I\xd8\xba5[\xef\x90\xd3_s\xe4\x16\xdf\
-\xb3Fr\xfc\x98\xb3\xc6;\xe5M\xbd\xc4\xfd\xbdU\xf1\
-\x1b+RN\x96\xa5\x89\x00ze\xe6\x00\xeb\x0f\x94\xec\
-8\xa3\xc8i\xad7\x97>\xb8\xe1{\xd9Gd\x8b\xe7\
-Cn\x97u.\xaa\x0c\xde[\xf3CXrE\xf2\xe0\
-.AE\xf6\x94\x99\xa4\x9c\xc4\xa7\xa2\x1ce\x18\xfb\xbe\
-\x98'\xcdYO\xa6\xc4\xc4\x1f\xf3Z\x92\xba\xf8\x05x\
-)6\x03\xde\x04\x7fgNg\x9b\xa7\xc5\xaa\xab\xa3\xaa\
-\xd5P\xcd\x97\xce\xca\xfa/.\x9c\x00\xfe\xb3\xddR\xdc\
-\x8d)(\xc5\xa4\xcd|AfT>z\x9a\x09'\xa9\
-t\xecXRG\x1b\x13\x83w\xcf\xd6\xce\xff\xe8\xb9e\
-\x86\x0d!kY\xe1S\xce\xd9 \xbf\x14\x1f3\x1a\x1c\
-\xfd\x14\xd3\xdc\x0c\xa31+\xc1\xa8\x14\xef\x01\xac.\x01\
-7\x04\x0f\xb1\x82\xe8\xcd[\xc3S\xc4\xa5\x1f\xfc\x1e6\
-\x9dw\xe0sa\x00R\xe1DkQG\xfdw\x0da\
-\xccz\xb6\x8dv\xf2\x9f\xc8\xee\xe4`F\xd8h\x99\x8f\
-\x08\xdb\xbc4<\x22p\x88\x1f\x10\x00\x1c\xde\x1dr\x1a\
-\xf9\xaaV\x9e\xb2>\x8dL>H\xbc\x0ak\x0e\xd1\x0b\
-\x17\xca\xcd\xa1\xb0\xccg\x9a\x03\x1d\xb7\xe9Jr&\xc7\
-\xb3|3\xd0\xdf\x8d!\x84\xb2e\xda\xeb\xb4\xa6\xa3\xd2\
-\xa8u\xaa\xa1`\x81Z\x11}\xdb:\xf5\xe6\xeb\xc3\xe9\
-\x09\xda@\xdb\xc2\x06UM=\xbb\x9a\x16\x95T\x04M\
-#\xd0\xce_.L\xe6\xd1\xd6x\xd4\xde7M\x0f\x84\
-\x08\xd8*\x8d\xb3r\xf8\x8e\x98\x8av\xcdB\x89T\xc7\
-\xbf\x90\xbd_.9\xa5+\xbf\xc6\xd0\xaa\xffi\xf1_\
-V\x98R-\x9e\xcc\xe3U\x81\xd4\x1d}\x0f\xf8B\x94\
-cY\xc3\xdc4\xde\xcbz\xbd\x07\xb8\x01\xf4eQ\x1b\
-\x89u\xd2\xfezp\x99\x14{v\xc5\x85\xefJ\x9d\x9d\
-yp1\xa8\xe4B\xca\xcc=\xc0T\x8cv\xe0\x99\x7f\
-I\xba\xbdJ\xe3<\xba\x0ck(\xa9d*\x84\x83s\
-w\x86\x09\xf5yY3B\xe6Q\xdcH4\xf3\x95I\
- \xb0\x87\x94\xf4\x80+T\x95\x9f\x8a-\xa4\x1d\xf4\x91\
-4\x1ds\xa3!nHs\x22\xa3\xfb\xdf\xe8\x1d\xa3\xf0\
-;?\xec\x0e\xe9\x8cc\x96\x0f\xab\xed\x96\xb4\x96\xc2\xac\
-\xd8,\x95\xbd\xd6ju5\xf2\x9eg\xb3A\xbc(\xd7\
-'\xf9x\x82o\x90\xbc\x86\xa4\xdd\x9fv\x14\x05\xd7\xf5\
-=\xb3l\x1b\x0c\x14\xee\xb6\x07\xb3\x8a\xee\xce\x0c\xe2\xdb\
-\x84\xf7\xd2J\xec\xf6\xdc\xf7\xf3\xf8?\xbf\xe5\xf5\x95b\
-\x22r\xa9\xb0\x11\x02\xdfnk\xec\x9d~\x8a\xc7\x9b\xc4\
-\xb7\x1e\xf1\xec6G\xd7o5\xefr\xear\xa7>s\
-M'\x11?\x13>)h\x0dF\x13<5y\x87\xef\
-\xd0/\x0f\xb5\x9dj\x19=\xda\xd8\x03\x99\xb7\x01\xfa\xf2\
-\xe1t\xb6\xcb\xfbco \x81\x1f\xfe\x1e\xa7\xd2\x8d:\
-\x5c\xc4$\xb5\x85%T \xb3:4\x96\xc5\xbaY{\
-\x83u\xfa\x8b\x02\x91\xa3\xccig\x19\xbc{?\x1c\xc3\
-\xe9\xf1\xb7;\xf4\x99\x8a\xd3\x95\xf1\x9f\xf8\x7f\xd2^\xff\
-=\x12\x97\xb2\x0fHJ\x1eez\xdeD\xd4\xf0B\xb8\
-\xe3\xc9%?\x06\x99,\xa8xd\xecd\xefv\x08\xdc\
-\x85\xd1\xccX\xbd\xceb\xf7\x90\xd4f\xf0\xd3<\xfb\xa5\
-p\x09. \xaa,\xe6\xdc\xf2\x98\x84z\x1ay\x83\x84\
-\xfa\xddD~b\xb5xA\xf6\x98\x89{\xd9*b\xb3\
-\x8f\xe2\xa7/\xc5\x1dP\x5c\xbe`d\x0f\xe1\x12\xc7-\
-\xcfIP\xfdza\x0fE\xa8\x19\xcd\xfc1K\xb0_\
-U\xa9\xf8[\x87\x08U\x0e\x04\x09\xb1H\xda4\x03\x85\
-\xd9 V\xa1\x8a\xc5e7\xf9\xe1\xbc\xcc\xaf\xe0\xb6\x13\
-z\xeeu\xbb\xe5U\xf0\x10Y\xf3\xee\xaf61j_\
-!\x93\x8bjX\xd8\xdc6R\xde\x12\xa6Y<\xf2\xb0\
-M8\xfc\xee$F\x8a\xbf\xa9\xc5\x1b\x132x\x1d~\
-#\xa0\x0aK\x18\x8d\xcb\xfd\xc2\xfe\xe0\xb3\xf9;\xc2n\
-\xa4_\x9b\xf1;\xcdo\xf0\xdc\xc9(\x99S\x99[\xb4\
-\x80\x13\xeaZ\x8f\xcf\x1fS\xc9\x0f\x8b\x8c\x9a\xe3uV\
-n\x84\x0b\x1d\x9f>C\xcc\x9f\x08\x02y=j[c\
-M\xd1\x83\x90\xb6\x00\xdd\x02w\xda\x22\xe1\x94\xf2\xd7\xbe\
-\xe4\x06o\x96\xf5\x19\xfd\xc4\xa4\x02F\xdf\x80\x92\x13\x13\
-\x19\x86\xee\xed\xdcI\xce\x89\x88WP\xfb\x8f\x9c\xd6\x06\
-\xb2yN\xf9\xdfV\xf4\xb5\x7fvb\x00\x94\xc802\
-\xed\xbe!\xbf\x98\x03\xa04\xb5\xf69\x07\x03%ux\
-,(\x97@@*KU\x95\x9e\xa5\x02\xcb\x0bZd\
-\xd9\x19it\x00 \xc1\x1f\xc8\xe6\x19\x0ed\xd4\xea\xc1\
-x\xd3.\x04\xa5GQ\x9d$\xf2F\xba\xfe&\xba\xb2\
-\xc0\x91?\x8a\xdcq\xe6\x99'\xac\xcb&;\xa3\xaf\xfd\
-\x18\x17%[E\x0coV\xe3z,\x8a\xb8\xcf\xcb\x8a\
-\xd1\x9d\xd9\xd6\xe4\xf0\x1az9\x8eX\x10>\x80\x9c\xbb\
- H\xc4)5C\xa9\xba\x5c%\xb7\xbe\xe1\xf6e\xdf\
->s\xe0\x08\xf9xL\x1f!U\xadj\xa5\xed\x09\xec\
-\x0dS\x02)c\x84iy\xe7\x8fQ\xbcZ\xf91\x09\
-&\xcc\xa7l\x97\xd1M\xec\xe72\xc1\xe2\xd7\xda\x86\xb9\
-:\xc5\xcbC\x11\xa0O~\xf1o\x9d$|Z\xd6\xf7\
-\x86\x01\xf0\x09\xd1\xb8\xfc\xc0\xb0\x1f\x1d\xb7\xd6\xbd\xb0\x00\
-\x14\x82\xe1P\x81\xddQm\xadG\xc4\x80\xcfq(\xc3\
-\x93Iu\xd21\x22\x15{U\x90\xb8\x8e\xda>\x1ce\
-o\x11\xa0)D\x93\x9as\xe6\x81kC5}\xd0C\
-%\xea\x10\xc17?\xee\xd6tD'!\xe0\xb4:\xd5\
-Hq\x80eg\x94?s<\x05Oc\x225\x069\
-l\xf9\xe9\x9b'\x9f0\xd4\x9bG\x07\x13\xfam\x16\xc5\
-\xd6bZ4\x0c=\x05=@\x06\x18\x077,\xee\xc3\
-|h\x19\x7f\xfe\x97\x82\xba\xd3^\xc0z\x97L\xacz\
-%\xd5!-O3W\xeb\xf5\xaf\x92q\xb5Q#\x82\
-\xb3\xb96\xb6\x00\x94w+d\xb8\x19\xd6kh\xe7\xb4\
-\xc5b\xe2\xe4\x0cc\xc6\x16f\xdeq\xb0\xbe\xf2\xe5\x0c\
-\xebD\xce\x80M\xfe/\xdc\xab\x9a\xeeQ_~\x93;\
-S\x18\x0cf\xbe08\xe0\xb6;\x93A\xc6G`K\
-9\x82l`\xb6x\xb5\x02L\xa1\x80M\x92T\xec#\
-x\xffX\xd7F9c\xa6\xa9\xffG\xb9\xc2\xb6\xdf\x8d\
-~\xee\x98\xbf\x87G\xba\xbf\xa8o\x11\xb4\x01\xa8\x08\x8a\
-Q\x9f\xff\xc8\xdc\x17\xe1\x90\x00\x00\x00\x00\x00ANM\
-FR\x08\x00\x00\x0a\x00\x00\x0a\x00\x00\x9f\x00\x00\x9f\x00\
-\x00\x1e\x00\x00\x00ALPH\xa7\x01\x00\x00\x01\x0f0\
-\xff\x11\x11\x02n$Iu\xa8\xa30d\x12\x02\xa1\x10\
-\x1ad\xf2RQ(\x0a\x01\x13\x83\xd2\x18\xc0\xdd\xd5\xfb\
-\x9b\x11\xfd\x9f\x009\x0f\x92\xd8\x07\x04\x97\xecBpI\
-.\xc5\x05\x9f\xcb%\xbb\x14\x17|\xa2Kr\xc9.\xd5\
-\xd07\xf8\x04\x97\xe8\x92\x5c\xb2K\xd1\x89\x8c\xa5Z\xda\
-\x82E\xc6\x12,\xf7\x12-\xb2\x5c\xa6\x09$S\x07\xb2\
-\xe9\x06\x8a\xa9\x01\xd5$\xaf\xcb\x00l\x1d\x08\xa6\x07\x88\
-\xa6\xdb\xa5\x01\x97I^H\xb6\xe92 \xdb\xbaW\xb1\
-=Pm\xb7K\x03l\xe2\x16l\xaf\xcb\x84\xf89\x86\
-K\x87\xebs<\x90>\xc7\xed\x95m\xed3\x15\x9b|\
-\xad\xd7\xa9~\x92\xf9\xc5p\x18\xff\x02\x1d\xa4%\xcb\x00\
-\xc8\xbf\x8ab\x99\xf0~\x96\xeaU-\xaf\xd7\xfc,e\
-\x82\x85\xcf\xd2\xa0\x0c\x08\xa6\xec\x16u7\xe4\xee\x91:\
-\x5c\xba\xc7\xed\x81\xa4\xebp\xf9\xdc\x90u\xc3eB\xbc\
-\xa1\xd8\x1aT\xdd\x0b\xa1\x01: \x88\x87,A\xd36\
-/D\xcd\x0dusi\x9e\xcd4t(\x9b\xa4\x19\x9b\
-\x01Y3!\x8bt(\x9a\x17\xd2\xa6j\xd8<\x80\xa2\
-\x01\x97\xc8\x0d\xc4\xd3\x0d\xc4\xdduzv\x0dH\xa7\x0e\
-\x04\x11\x01\xf2i\x02\x22\x22/\xd4\xd3\xab\xe1\xd0\x80\xba\
-L \xeen\xa0,\x03H\xbb\x0e\xe4\xa5\x03e7\x81\
-\xb4<\x00;\x80k\xb9\x97\xb8<K\x5c\xda\x92\x97\xb9\
-\x84E\x16D\xa4\xb1\xca\xf6]\xb2\xc8X\xean.|\
-\xb0-\xbb\xb19\xe6]\xd7\xa5\xdd\xa3\xbbvM\x17w\
-\xa2\x93\xe3\xab\xa9\xa7\xa1\xc9\xa7\xaeI\xa7[s\x9dD\
-\x13\x14\xef\xa9\x8ar\x9c\xb2\xe69]\x9av\x0a\x1a\x99\
-\xbb*\xea\xbeK\xba\xb6\x0b:\x19K\x11c[\xa2E\
-:d9\x02\x00VP8 \x8a\x06\x00\x00\xb4%\x00\
-\x9d\x01*\xa0\x00\xa0\x00>\x91>\x97G\x83\x19\x82\x83\
-\x00\x01 \x96\x96\xed\xd5\xed\xba\x8f\xfag\xd7\xf7\xf9_\
-\xc9l\xaf\xbd\xfe\x88\xeb\xb3{)+\xef}N#>\
-\xbat;\xfe+\xc0\xa7\xeb\x9e\x83^\x8a\xff\xcc\x7f\xdb\
-\xff;\xe7\x1f\xf2\x7f\xf2?\xf9=\xc1\xbf\x93\xffc\xf4\
-c\xf5\xdf\xfb\x11\xec\x15\xfa\xb5\xff\xa8\xe0\x88\x08\xd2\x7f\
-\xa1\xe0L:\xd6\x0d\x9f\xa6}\x89\xd3U\x0e\xed\xb3\xc0\
-\xf9\xed\x92\xe9\x93\xceov:\x04\x8dW\xa9\x81SE\
-\x06.\x90AuH\x91\x92\x0a~U\xd7%\x9e\x856\
-\x22\xacm\x7f\xba\x96\xfft\x02\xc02\x98_\xe6\xf1P\
-\x19\xb7J\xf5\x0f\x04Q\x7f\x9b\xe9]`\xa3\xc1+\x8a\
-Y\x0f7X^2\xa4\x98f$~O!\xad\xae\xa5\
-\x91\x16\xd4w\xfa\xf6'\x5c(~\x807ro\xc9\x17\
-\xee\xfe\xe4\x8f\x1e\x1ciE\x9b\x04\xdd\x1f\x8a\xc6yJ\
-U\x22\x82\x01\x0dVF*\x1ar\x22\xc9\xbf)L\x98\
-\xa2vO\xb8\xbf\x85\xab\xee7\xac\xb7\x8e\x00E.\x9b\
-\x02J\x8c\xb5(\xb1\xdf\x1f\xeb\xad\xa4\xb00z6u\
-_\xf604\xcf\x5cR\xc7\xe5bF\x9a|\xb2`\xb7\
-\x85F\x08x\x07\x1bj\xe4'\x16}\x99\xe9VO\xf2\
-T\xb6\x80\x00\xfe\xfawMq\xd2]\x9e*\x0b\xd3\xac\
-H\x1c{\xf7\xd7\xfa'\xdc\xfe\xf6\x04\xfflV\xb5z\
-\x7f\xb79H\x05\xb8\xf9\x90\x8d\x11\x8b\x05\xc2\xa2\xb8z\
-\x92\xe8\x8d\xe0\x98U\xa0E\xca\xd5\x1b(\x1et\xfe\x1b\
-'g\x01\xeb\xe6:YmU\x14\xe1V\xa6\x8e\x15\xba\
-\x0f\x12\xac\x96\xf5\x04\xc5\xd2\xb7\xcc\x9b7\xeeEI\xd8\
-\xfb\xd7\xad\xe6\xc4y\xb8U\x0b|Co\xb5n\xd1\xcf\
-XMG\xb4\x97\x8e\xd7\x1c\xa1\xa8\x91\xc2\xe0\x8f\xfb\xd9\
-\xf2\xff\x05\xc6\xf5\xaaj[z>\x80\x9c\xefVg\xb9\
-\xf0\x1f\xb4\xf2\x91\xe4\x80\x8f\x04\x87\xe4-\xdcE\x0d\x84\
-\x14\xb3U\xfa\x06>\xde\xec\xf6\xf8\xcdo\x81\xde5\x22\
-\xb3f\x1a\xe8X\x94\xae%\x9c\xa7\xbe\xc1\xe7\xde\xfe\x8a\
-\xf7?\x95]\x81\xb9M\x1d\x12\xa49\x19\xa4\x9c\xbc\x9c\
-\xb6\x07\xfe\x00\xa2]\x0c,\x22\xc7\xbc\x97W\x04\x922\
-\x87y\x22\xd9-O\x83\xc3\xaa\xc2\x85\xa4\x9c\x18\x7f\xe0\
-9\x05\x00\xf5\x0e\x19[\xe1\xe9gJ\xb9\xd9n\x91\x89\
-\xb7,Ny\x00\x03\xd5\xda\xb5%\x85\x08(G\x1a\xe2\
-B\x0e\xa5\x0fA\xa2~\x9f\xea~\xa1g\x88\xde\xe5\xfe\
-\xcfm\xe4\x81\x94W\x5c\xe1\xeb5\xce \xd2\x9a\xcbQ\
-\x1b\x85\x0cT\x0c\x9eaP`\xfdA\x91X\xf1:\xc6\
-\xe0~\x05\xf0\xcf/\xb3\x1e1m\x02\xa4i\x01\xea}\
-\xa9\x5c\x10t\x010\x97\xbbB$\x80m\x94\xf3v1\
-!\x07\xdc\xedg\xc5>\x22o\x01\x8b\xd9\x87\xa1\xcb\xff\
-\x9ev\xb9\xbf\xc9\xee\xe7\x922gM\x83\xc2G=T\
-h\x07v\x9d\x16\x98):'\xd2\xf7\xe8\xa77\xa2\xaa\
-N\x96\xe4\x99^\xe6\xe1Z\xba\x19\xd8\x1f-\xca\x91,\
-V\x14\x93\x08\x04*\xc2\xac\x1e/E28\xc1,\x04\
-u\xfaH\x19\xc1?\xd4\x08\xb1\xa65\x1bMh\x8a\xd8\
-\xdb\xe7\x96\xa3F\xb1\xe6\xeb\xfe\x05\xc0\xc8\x0c\x0a$=\
-\xea\xf6!Y\xd4H.\xfd\x99\xdd\xf8q%b\x165\
-\xefpV'\x07M\x9fXs\x0b?\xe5\x86\xc1AJ\
-\x22\xecG\xd2\xaa\xc8{Y\x18\x04\xebq\xb3\xa1we\
-\x15rF\x91\xe5\xe6\x0a\x97\x15\xde\xd9\xdd\x81yC\xb8\
-\x8e\xdc\x7fM\xeb\xa7\xb9\xf4\xa0M$\x08}Y`\x0a\
-1\x8d\x1d/\xcaSj\xe2\xedy\xfa\x08\xe0\xf0%8\
-\xc0\xacn\xacwt\xe67\x87\xea\x18\x88\x83XjB\
-s\xaa;\x11Wk\x98\xcd\x09A6c\x1c\xdc\xbd\x98\
-\xfc\x14_\x1e\xb4\x04\x09W\x94\xab\xd5\xa0\x07\xf1\x9a\xde\
-\x10|\xc0\xf4\xd4.\x81\xeaz&\x96\xd5\x80Muz\
-\x19rD\xba\x00\xcb\x9aq\xa4\x87.\x9c0\x07\x0b}\
-5\xa1:\xd1\xb7(\x88'0\x98\xa2\xe1\x9f\x0d~\xc6\
-r\x82\x16\xdf\x84k\xb8/\x93?\x06\xd6\x05Wel\
-\x00\xd7d!\x02\x12a\xfb\xaa\xd53\x14\x00\xd0\xa8c\
-p\x90\xc6Z\x0a\x10h\xac\xec\x84Y\x5cx\x16\xadZ\
-\xff'\x8a\x86\xf3Q\x1cF\x03\x05p\xb1\x0c\x0c\xa0e\
-H1\xc5\xf3\xad\xc6Y\xe7\x0e'\xa0\xdf\xe8\xf5_\xdc\
-\x1b\xc7\xdcu\xbb\x12\x92\xe4\xc9\x9b\xfc;\x06#z\x8a\
-g\xa7\x9d.@8TF\xb0!Q2{2\xf3\x97\
-\x22\xb2\xf9\x22\x87<\x99\xe14\x89\xe88X\xa1#\x8d\
-\xc5\x94H\xf7w\xe9\xfdZ)\x07\xf8\xc0\x7f\xda\x16&\
-\xa8\xc0\xa9\xf9A,z\x1c6\xb2B\x10BE\x04\xec\
-\x8e\xd9\x18\x8a\xce`h\x8c\x81=\xe8\x98F\xf9\x117\
-\x0b\x88\x00\xa6\xff\x02\xed\xae\xc0\x8f\xb0\xd5b\xd5\xd0\xbf\
-M\x88\xfa\x93!\xa3@;\xfeu\xdc\x1c4\x8b}k\
-\x0d\xb50\xde^D\x9ey\xaf\xf9\xdc$\xffs\xa4\x9b\
-_U\x87Y\x1ani\x94\xd6\xf9c\xf1\xb2\x90JL\
-\x82t^#U\xce\xc3K\x9ba5;v\x00\x19\xae\
-\xf7u@\x0f\x86\x8c\x0c/\xbf~\x5c\xc2\xc4\x89$\x1f\
-d\x03\x5c\x1b\xaa\x15X\x9e\x85\x14\xab{\x86\xfd\x1a\x88\
-=\xb4\xb2F&%\xbb\x85i\x04\x02\xb2N\xc5\x0c\xd0\
-\xe4\xc0BC\x97Xv\x1f\xd1\xa8\xb3\xeb\x0bpQ\x06\
-\xbfF\xda\x88\x95h\x94s\xcf\xc5\x9a\x0bu\x1fo\xcc\
-\xb7t\x16\xbe\x00O\xc8P\xe5\xa6S[\xb1\xe3\xb8\xc0\
-%$\xcb\x8a~\x101\xfd}\xa07\xbaF\x80Y]\
-\xbe\xa4\xabh\x0e\x07\xe4\xb6c\xcf\x0e\x18d0 \x5c\
-\x80\x98\xc0HTw\xf2# <u-\xaa\xdd/\x80\
-\xb9\x91\x0bS\xf9\xfb\x1e\xe5r\xd9\xab\xae\x9d\x9a\x13*\
-\xf0i\xad2\xc7\xd7\xea\xa4X\x81\xc5\xc76~\xff\x88\
-\x16\xf1E\x03\x11\xbb\xeba(9\xef\xc41T\xa66\
-oD=L3y&\xf5\x02\xa7t\x0a\xaf\xf1^\xd8\
-\xe6K\x95\xadZs+\xb9\xf3\xef\x88\xbd\x0f$u\x0b\
-\x0f\xf9\xb1Da9\x7f\x08<#\x14\xe7\x17\xdd\xcd\x13\
-)i\xe2\xdf\xe0>\x08M\x93Be:\x00\xaa\x84R\
-\xf1\xd7$;*\xb8\xb3\x22L\x88\x9c\xef}S\xc2d\
-\x11\xc8\xc7h\xcci\xf5\xf2\xd9\xfa\x85\xe4\xb0P\x1f\x89\
-m\xa1\x07\xf5\xfd1,\xbc\x1a\xe03\x9cg>!\x19\
-\x010\xe72'\xbc\x14\x96Ah\xcc)\xbf\x85\x0b\x06\
-\xf3-\x01\x03<'\x1f,\x07*R\xab\xf8\xe6\xb8v\
-\xab\x8d=A\x84\xe3\x8e\xd3z\x94I\x0e\x96'\x82\x99\
-\x91\x16\x06\xce\xe4\xeb0\x00@7\xa5\x12\xdd\xa4\x8b\x9f\
-\x11)\xd5G\x1d#\xb8\x7f;\xca\x1eMb\xbd\x9f;\
-\x8a\x97\x0d&\x09\x99\xc8\xd4\x17\xb1\xcef3J\xa7\x97\
-\xe9<\x88\xfe\x00g\x92N\xb2x?\xd3\xedD\xde\xfc\
-\xa2s\x97T\x98\x22\xa5\x87\xfb\x00roA\xf68\xbd\
-W\xf4\x0a\xa8\xf9\x8e\xd2\xbb\x16{\x91\xce\xaf\xe0>\x08\
-=\x93A@\x00\x00\x00ANMF6\x08\x00\x00\x0a\
-\x00\x00\x0a\x00\x00\x9f\x00\x00\x9f\x00\x00\x1e\x00\x00\x02A\
-LPH\xa4\x01\x00\x00\x01\x0f0\xff\x11\x11Bn$\
-I\x95`\x0d\x81\x80\x88\x09\x98\x82i`\xda\x9a\xb2&\
- \x22\x10[\x0203q\xf7>jD\xff'@\x94\
-o\x12\xc7\x97\xe0R\x1c\x06\xf8d\x97\xea\x82Or)\
-.\xd5\x05\x9f\xe8\x92]\x8aKs\xc1'\xb8$\x97l\
-\x98\x87b\x18\x87j\x90\xb95\x8bl\x98\xe6\x16,\xcf\
-\x16-\xb2%\xd3\x02\xb2i\x00\xc5\xf4\x00\xd5$>\x1f\
-4\xdb\x02l\x03\x08\xa6\x17\x88\xa6\xc7\xa5\x03\xc9$\x1f\
-d\xdbr\x99Pl\x03\xea\xcfx\xa1\xd9\x1e\x97\x0e\xd8\
-\xc4-\xd8>\x97\x05\xf1gL\x97\x01\xe9g\xbc\x90\x7f\
-\xc6\xe3Ul\xfdW\x09\xd4\x1f\xf29\xb5_\xb4~\x19\
-\x0e\xf3O\x94\x5c \xba\x94\xdf2\x5c\xe6\xffO\xb5,\
-\xf8<\xdaOj\x96\xef'-\x1b\xd4\x05?'\xe8:\
-\xd4\xe9Q\xdc\xa2\xee\x812<\xf2\x80\xa4{\xdd^\xc8\
-\xba\x01\xc9\xe7\x81\xa2\x9b\xa7\xaa[\x10}:4\xdd\x07\
-\xc1\x06\x04\x01L\xb2\x05M?|\x105\x0f\xb4C\xd2\
-\xbc\x87e\x18P\x0fY3\x0f\x13\x8afA\x11\x19P\
-5\x1f\xe4C\xd3px\x01E\x07\x92\xc8\x03\xc4\xdb\x03\
-\xc4S\xba\xbd\xa7\x0e\xe4\xdb\x00\x82\x88\x00\xe5\xb6\x00\x11\
-\x91\x0f\xda\xed\xd3p\xe9@\xdb\x16\x10O\x0fP\xb7\x09\
-\xe4\xd3\x00\xca6\x80zZ@\xde^\x80\x13@\xda\x9e\
--n\xef\x16\xb7\xbe\x95mma\x93\x0d\x11\xe9\xecr\
-\xfc\xb6\x222\xb7vZ\x1b,\xf6z\x9a\xa7s9\x0d\
-]>\xbd\xbat\xea\xbax\x12\x9d\x5c?M\xbbMM\
-\xbd\x0dM\xbe=\x9ax\x13MP|\xb7&\xcay+\
-\x9a\xf7\x964r\x0b\xaauj\xa2\x1e\xa7\xac\xeb\xa7\xa0\
-\x93\xb9U1\xf6-Zd@\x91+VP8 r\
-\x06\x00\x00\x10&\x00\x9d\x01*\xa0\x00\xa0\x00>\x91>\
-\x96G\xa5\xa3\xa2!1\x98\xb80\xb0\x12\x09in\xdd\
-_P\xe9\xb4(\xf8\x9f\xfc\x97i\xbf\xe41\xea\xb7\xbe\
-#\xae\xec\xecm\xb1\x9d\xf7\xf8\x8b\xfa\xe3\xe6\xa3\xe8W\
-\xf7\x7f\x03\x0f\xaaz\x80\x7f\x1c\xf4V\xfe[\xfeW\x94\
-\x7f\xca\xff\xc5\x7f\xe7\xf7\x07\xfea\xfdk\xd1\xbb\xd8\x8f\
-\xeb'\xb0W\xea!\xc7\x9b\xe6j\x1b}5%\x07d\
-\x19@\xb3\x01\xe9\xcd\xd8\xf8\xd9k0C\x5c\xd1\xc9\x83\
-*\xbbz<U\xaa\x22\x8a\xec\xa1E\x06.\x84&\xc9\
-p\xd5/\xac^*\xa1\xeek\xdd\xad\x9b\x95\xa8KW\
-\xde\x14B\xa5\x17\xf9\xbe\x7f\x93\x05\x9d\x5c\xe3d\xa2\xeb\
-\xbe\xdayt<*WC\xe4\x1c\x22\x10\xb7\xbd\xc0\xf4\
-\xfd\x83t\xebT\x90\x7fo\x98)\xed\x03!\xec,Z\
-\x9a\xd0\x83\xd0\xcc\xfbKah\xecy\xb4a\xad-\xf0\
-\x85\xad!\xaa\xa0\xd2j\xba\xbbL\x8c\xd3|\xa5\xb0\x1c\
-I\x0d\xf51\x13B\xf8\x85ov\xc7\x0e|\xa8\xd71\
-\x0e\x87\xff\xca\x92K\xde/\xc2\x87\x14\xd55\x9a\xffN\
-/\xcb\x90\xcd\xc4F\xbb\xfab\xef\xc2\x1b\xbf\xe5o\xb2\
-\x84\xd5\x96?ek\x93\xcd\xc2n\xad\xb0\x0c\xb4\xac\xef\
-\xed3\xb3\x196\x8ccz\xb4Ym\x00\x00\xfe\xfaw\
-K\xb9\x8eW\xfeB\x80u\x99z,\xc1\xfb\x8c\xa8\x10\
-\x0e\xdeJ\xbe\xb4\x1dLZM:\xb7\x1a\x92\xf9\xed\x9f\
-\xd21$\xa09<\xcdyp\xbbs\x10`\x0e\x22\xc0\
-A,\x80\xcc\xb4\xcceN\xdbJ\x0d&~v\x81a\
-\xb8\x87\x02\x08/X\x83\xbb\xf2%\xd3\xe7\x89\xd7\x8d(\
-\xe2\xfb\x973\x8a\x18\xbe\xd0U<q\xed\x031p\xb1\
-v3~XZ&\x11C\x05n\xa4\xb2\xe40\x13\xd8\
-;\x05\xd4-\x81\xf0b\xdf\x83C!5\xc0\xd8AY\
-\x9d\x92\x89\xee[X\x22\xf6\xbcC?)r0\xd8\xe2\
-\x9cm9a\xcf\xaf\x1aSu2YW\xca\x8a\x16\xc7\
->v4\xc9=\xd3\x83\x1c\xaaLT{~ry:\
-\x0d\x22\x17\x92\xf3Mv\x8c!V\x092\x8ebu\x13\
-\xc7\xdbd\xed\xf3;2Yig\xdc\x1b\xacj[\x17\
-\xb6\x19\xa9V\xe3\x12\xca\xd7\xc1\x9c#\xae\xb3\x80\xd2\x10\
-;VL\x15\xe31\xd02wg\x935g:\x99/\
-\xe8\xd8j\x07\x9e\xad\x8c\x06\xf1.\x1e\xcbz\xeb0\xdf\
-\x11\xe7\x5c75\xa9\x01Rg\xefK\xc6\xc3]VI\
-H\x07~V\x1f\xbd<\xa5uU\x87\xe1\xb5\xa3\xda\x97\
-p^\x94+\x85DA\xa6\xd1\xf4\xa7\xb8:H$\xd7\
-\xb2\x05\xf3\xf3\xaf\xa7`\x18_\xb5g\xb0\xf8\xaaM\x16\
-\xfeUp'\xfc\xbf\xb4\xfdZq\xae\x8fNsm\x0e\
-\xbc!\x83}r^\xeb\x9f\x9cZv\xc9\x82x\xfd5\
-v\xf2\xaa\x89>oc\xc3\xcc \x02\xcda\xa7^\xcd\
-\xb4\xf1Iw\xdekq\x90\xfaK\xfc~U\xf9\x0f\xd4\
-\xd5\xaa\x8f\xd9\xf7\xdc\x93\xae\xde\xc8\xb4\xb8Y\x9d\xc0\xdf\
-6!P$\xc0S2`\xbd\xfcl\xd5\xf5\xc8\xda\xd8\
-\x0c\x9c\xea[[{kt\x9f\x1f\x83\x8b~q0\x02\
-B\xd5\xda,!t\xd6{\xfbS\x17\x8a\xf7\x1b\x02\xc8\
-j:\x10kgB\x8f0\xb0\xce\xfd\x06\xbc5\xd7\x81\
-\xfe~\x85Q0^K\xfd\x96\x0f\x920uU\xa8B\
-6\xfc\xab5\x07\xeeZ\x9c9\xf5t\x0d\xfei^u\
-\x83\xe0\x80m\x16\x1b\xb1\xde_\x04\x1fZ!\xf5\xc1\xcf\
-%j\xd3wS.\x05\xcd\x05\xf8!\x1c1\xe4\xfc\x81\
-+2\x9fK\xb6\x10\xa7BO\xbd\xbd\xc6\xe3h\x1b3\
-\xe2\x1a\x80W\x83\xba5\xa3\xd2\x11\x08b\xed\xce\xd8\xe1\
-\xb2?\x19\x82\xdf\xe1\xc9\xe1\x1e\xae\xac\xde\xe3\x18\x5c\xc8\
-\xc8iq\xca\xc6\xa6\x16x6\xd7\xffG\x9e6\xe9\x16\
-\xc4\x22\x18\x84\xfb\xff\x90\xcb*\xb8`\xb3\xf2(\xdf\x99\
-V\xdb\xe6\xf4*\x09\xcc\x11\x02\xb2x\xfb\x8bv\xb4\xaa\
-9\xa4\xa7\xe8\x19r(\xa1\x08\xd0\xbc\x1a,Xmz\
-1\x0b\x9esk\xde\x87A\xcaFJ\xbe\xed\x8a\xc2o\
-\xe4\xbb\xd2W\x87\xcb\x91\x94\x87\x08uI\xdd\xc4\x05\xba\
-\xcdQ\xbf\xebP\xec\xb6\xb8\xbf\xb4,`\x98(\xc7\xff\
-\xa2\xda\x16\xfb\x05\x88\xc7\x10\x17\x8eS\xa7\x15C\x8b\xb4\
-\x1e1#\xf1\x95\x98\x0c\xa4\xe75ob\x190Sa\
-\x83!]\xa8\xdb{\x08\xdd\xa1K:g\xa0Th\x98\
-\x1c\x81\xb1\x0b\xa1\xb8\xbfk7&+\x01\x09G^p\
-\x8b\x05n-\xf6/\x08\xe5>\xf7\x06\x01\xd6\x06\xe1_\
-\x9ea@\xb0\xd8\xe7Z|\x8a\xe1\xe5!\xa8\xbc\x1e\x16\
-\x918\xc5H\x01=_\x00\x8e\xffn#\x8bb8\xe5\
-\xe8[\xf7V\xea\xbe6\xedY\xfd6\x91oQ\xc8E\
-\xa3s\xbc\xa9V\x957\xf4\xc3%\xf4\x06\xf8M\x0a\xe0\
-\xa3\xf6)\x0c!\x22rG\x81\x9c\xa4\x22\xe4y&S\
-`\x12\xf9v\xacp3\xd6^\xf2\xfa\xc1\xad\x87\x87]\
-2\x0d\xeb\x8b\xea\x94:\xe8}\xd1\xaf\xd7\x0b;\xccm\
-^\xdf\xf9\xafV\xa7\x1e\xde:'e\xfa\xf79r\xba\
-F#Ev\x9a\xbd\x153\xb5\xe0\xa0\x11E\x8e\x86/\
-\xa6\xc1%\xe0\xc3]\xeafc\x15\x92c\xa2.\x96\xce\
-\xc2\x7f\x88\xc3rl\xf5\xea\xeaPW\x02p\x10\xe9\x95\
-\x80\xf5\xe9\xb0\xc5C\x08\xc2\x02\xf8\xd9q\xfd\xe0\x9c\xd9\
-TUS\xc3\x90E\x19\x95\xd4r\xc4`\x8a;\xcf%\
-u\x152\xa2\x94\x88\xc8\xf4\xb6?\x19\x98\xa3H\x06\xbe\
-\xc6\xfbbf\xa8\xa38\xf5{\xd4+p\x8a\xcfZ\x85\
-L\xca8\x0b\xfa\xb2\x87\xea!\x9b\xdb\x5c\xe3m\xafJ\
-y\xf2\xeeb\xbf\x88\xb2\xbc\x0eK\xad\xc7\xf6\xb1+\xd1\
-o]~\xf0\x8b\xfc\x9bz\x0f\xa6\x92\x0e\xca\xe0\xc8o\
-7w)\xae\xa4\xe3\xce\xd3}\x03\x86\xec\x86?2\x8e\
-\x03\xd90B\x08\x99QF\x1e\x0f\x0aJ\x08\x1d\xae\xe4\
-\xe51\xff\xbf\x00q\xd7@\xb7\xb6\xd7VU\xbb/G\
-\xfa\x9e\x81\xbc\x93\xdd\xbe/\x9d{\x8bK\xf4\x07q~\
-\x14\x5c!7\xc9X\xe4O\xbf\xe8\x1fkl\xc9lB\
-tU\xf7\xce\x9a\xaf5\xe8\xdf\x04\xcd\xd5Zt2\xbc\
-\x9e\xc8\x80\xec\xafx\xe6\x8c\x18m\xf7\xc6\xb6\xd4\xe3w\
-\xdd5\xc32h\x92G\xda\x22\xb9B/\x1a\x8b\x9b\x22\
-\x94k\xe2-\xea@\x97\x15\xec\x09\xc7{\xf2b1\xff\
-\xef\xf1\x87-*\x9d /\xc9\xd0L4,<\xc7\xe4\
-+\x82\xed\x9a\xa4\xd2\xda\x1e\xac\xb51\x12Mg\xad\x9d\
-z/BGXk\xb2\xa1\xad\x5c\x16Rn\x8d_\x8c\
-Gw\xd8$\xcbu\x9a\xb9P\xb4\x0dc\xa4\xba\xa4\x19\
-5e\x00F\xa0\xcbud^;\x80\xa0\xa8\x8f\xbd\xb2\
->\xefL*\xcd0;9\xad\x0e\xbd\x91\xf6\xd1:s\
-\x19\xb6\x8ee4q8\xb8*K\xb5\xca\xbaV\xcd\xe4\
-{\x16#\xb7\x22a;\xbb<\xfc\xe4\x9a\xe8\xdf\xe0>\
-\xd6\xd9|\x00\x00ANMF\x88\x08\x00\x00\x0a\x00\x00\
-\x0a\x00\x00\x9f\x00\x00\xa0\x00\x00\x1e\x00\x00\x02ALP\
-H\xaa\x01\x00\x00\x01\x0f0\xff\x11\x11Bnm\xeb\x98\
-\xb0=^\xc1\x84JP\x8a\xd2(mJ\x99\x12\x84\x02\
-\xcb\x09\xf0<\xcf\xf7\x1bG\xf4\x7f\x02\xe4W\xb7\xe0\x92\
-=^\x82\xcb\xe3R\x5c\xf0yl\x1fd\x97\xea\x82O\
-tI\xa6\x0ed\x97\xea\x82Opy,cK.\xd9\
-\xa5\xb8TK\xdb\xb0\xc8\xd8\x82\xe5\xdd\xa2E\xb6\xc74\
-\x81d\xea@6\xbd@15\xa0\x9ad\xb9L\xc0\xd6\
-\x81`\xfa\x80hz]\x1a\xf0\x98dA\xb2M\x97\x01\
-\xd9\xd6\xbd\x8a\xed\x83j{]\x1a`\x13\xb7`[.\
-\x13\xe2\xef1\x5c:<\xbf\xc7\x07\xe9\xf7x\xbd\xb2\xad\
-\xfdQ\x02\xe57YN\xd5\xe7\xc7e\xd9&ue\x17\
-\xa2\x03d\x1b\x0e\xe3\xbf\xac\xfb%\x97l\x19\xffo\xc5\
-2ay\xd4\xdf\xa9Z\xd6\xef4mP&\xfc&\x03\
-\x82\xaeye\xb7\xa8{!w\x8f\xd4\xe1\xd1}n\x1f\
-$]\x87\xc7\xe7\x85\xac\x1b\xa7\xa2\x9b\x10}\x1aT\xdd\
-\x82\xd0\x00\x1d\x10\xc4C\xb6\xa0i\x87\x05Q\xf3B=\
-<\x9a\xef0!i:\x14\x91a\x18\xb7\xac\x99\x90E\
-:\x14\xcd\x82t\xa8\x1a\x0e\x1f\xa0h\xc0#\xf2\x02\xf1\
-\xf6j\x9e\xdb\x07D\x91\x06\xa4[\x07\x82\x88\x00\xf96\
-\x01\x11\x91\x05\xf5\xb64\x5c\x1aP\xb7\x09\xc4\xd3\x0b\x94\
-m\x00\xe9\xd4\x81\xbcu\xa0\x9c&\x90\xb6\x0f\xe0\x04\xf0\
-l\xef\x16\xb7o\x8b[\xdb\xf26\x15\xb2\x11D\x1a{\
-8\xac-\x8b\x8c\xad\xcaqn\xd4\xc9^N\xe3p\xcd\
-\xa7\xaeK\xa7O\xf7\x9c\x9a.\x9eD'\xd7\xa5\xa9\xb7\
-\xa1)\xb7\xaeI\xb7W\x13o\xa2\x09\x8au\xab\xa2\x1c\
-\xb7\xac\xf9n\x8fFnA5OU\xd4\xdf)\xe9\xda\
-)\xe8dlE\x8cm\x8b\x16\xe9\x90\xc5\xf1G\xeeV\
-P8 \xbe\x06\x00\x00\xf0(\x00\x9d\x01*\xa0\x00\xa1\
-\x00>\x91>\x98G\xa5\xa3\xa2\xa117\x98x\xb0\x12\
-\x09in\xfc|{\x00\x19\x88f\x16\xe2\xfe\x96v%\
-\xfd\xe3 \x7f\x87\x22F\xed\xde\xca@\x01\xf5w\xbeG\
-Rn\xfdt'\xfd7\xc0\xfb\xea\xbf\xef}\x80?\x88\
-\xff\x8e\xf5U\xfe'\xfe\x87\x94\x1f\xcb?\xc9\xff\xe8\xf7\
-\x04\xfea\xfd\x7f\xd1\x9b\xd7\xaf\xec\x87\xb0/\xe9\xdf\xfd\
-s`K\x8eC{\xf2^\x06\xfe\xc7:N\x06B[\
-/\x0fCi\x05t\xd3\xc6l\xe3\xdc\xfe\xcb\xcb\x80Z\
-\xab\xddS\xd9\xb9\xad7\x1c\x04\xf5\xc7\xd4\xaf\x90\x98\xce\
-\x89\xfcUC\x87yg\x18\xae\xfb\x88\xea\x00\xbe\xe0C\
-\xe4%sB\xefx\x87\xc0\x14\xd7\x8fP\xfe\xb1\xe5\x80\
-\x98H\x80Q\x864\x87\x90\x93\xcf\x00\xe5\xec\xb3\x18\x90\
-\xdd\xf1\xe8\x15\xda\x9a\x06\x82.\xa2\xe0*0\xf8!E\
-Ix\xf1\xf9B\x07N\xaa\xa4&\x9e1\x5cK\xa8\xce\
-\x96\xa6\x01%r\xff\xf8\x1d\x9a\xc8\xc7t\xc8$\xd1\x85\
-e\x18\xac%4\x82\x16\xdbC\xba\xb2\x8d\x10\xc9nS\
-s\xb6\x9e=\x92\xd5b2{\xa3\xa3|\xa1\xe1G\x82\
-\xbd|\x19\x97z\xb0\xab\xc4\xf8Y\xe9\xee#\x9e\x8d\x84\
-\x9f.\xfce \x9e\x8a\xc2X\xa6W\xef\x96\x1e\xd8\xfa\
-\xb0S\xb8\x97\xd3\xdb\x98\xaf\x90\xb8j\x18Fy\x99\xd1\
-\xeb40d\x16\xec\x00\x00\xfe\xb3\xdck\xf6\x16u\x83\
-\x8e$\x05\xaf\x81\xe77V\xc7\xf1:\x87m\xaa\xfc\xfe\
-\xc4\x9e\xda\x9f\xd8\x85\xfe\xb5\x07\xab\x0d\xdf\x80\x8aO\x10\
-\xc6\xb8B\xd7\xf9eU\xc3\x16\x90\xb6E\xa0\x16\xae5\
-\x8c\xe8G \x95\x87\xac<R\xd6\x98\xed\xe8g\xa1\xa0\
-S\xdbLq|\xa9\xfcH\xce\x82\x9a\xb6\xef7\xa0\x95\
-\xc1\xcblR\xf2\xa7s\x95\x1d\x0f\xbb\xd7&(\x97\xab\
-\xe3\xce[\x95\x19d<v+\xa2+\xef\xc8\x02\xc3\xe8\
-\x98g\xab\x04\x13=-c\xcbY\xa4*Z%\xecO\
-C\xe8\xff+T\xe5\x9f\xff\xf8\x81\x8f\x18Q\xd7r^\
-\x228\xda(\xcf\x16\x18\xc5dO6Y\xfd6\x1f\xe9\
-\xcf\xc1[\x04\xd4\xe9\x14\xb05Y6P:\x94{Z\
-\xeb\xf7z%S7<\xea\xdf\x819\xa1\x19?\xd4\xd7\
-\x5c\x19\x98\x13\xcfH\xa8\xa3\x1a\xa66\x15f\x04\x95Z\
-\xa7\xd5\x0c\x84\xf8\x9dq\x16F,\xf2\x92\xc2.A\xbb\
-\x81*H\xf6a\x10>\x1ar\xaa\xd6\xe3:\xc4$P\
-{pQ\xfd\xf7k\x97\x0b\x1a\xa5Bo\x1eP\x09\xea\
-%\x04\xbd\x09\xaf\xfc\x067ZsH\x1d\x10\xe88\x9e\
-\xc4^]s\x04\x85\x0e3\xb6\xe19\xde\x04\xba6\xfb\
-\x9bpl\x0c\xfd*\xd2\xab\xf2]f\x90x\x08[\x5c\
-\x15\xf2\x8e\xb6\xa0\xec\x16T\xeb\xde:f<'\x84\x0b\
-\x03\x0cI\xd6v{\xb7\x22\xaa\x81\x98\xdbK\xf2\x81\xf2\
-h\xab\xfd\xce[I\xce\xe1\xf9\x9a\xa4g\x0a'\x9c\xd2\
-\xb9o\xcaM/\xaf\xd1P\xa7%\x03\x19<\xedh[\
-q&H\xeb#\xe9\xf51\x98\xc2\xc6.\x98\xdf[\x1b\
-\xb7P\xb9\xa9\xeb\xa3\xc2\xfcpZ\x0f\xd2\x8e\xd7\x05\x09\
-\x7fR\xcf@\xc3\x91o\x1bKr?`\xf6\xa6\xb5.\
-CU\x06\x8b(\xae\x88\xc1H\xc9`\xd5\xd5\x7f\x93\xdc\
-y\x9e\x10\x8e\xd1\xfc\x08\xc6z\xd8\xb4B7\xfeHg\
-\xf0\xab\x84\xbaJ':\xe0\x1d\xf1\xd8\x0a\x8a:\x1d>\
-y%C\xb21\x0c\x5c\xff \x1f\xa4b\x03\xf3i\xfd\
-\xeb\x0d\x7f-*\x95+\xb6\xbb\xce6URu\xc3=\
-K{\xd1\x9c\xe3\x00h\xf2\xafi\x1c\xf6[w\xdfR\
-LJ%\x92\x82\x08\x8c\xae\xfeK2\xf12l\x9fa\
-kA\xcc\xa9~\xa9\xf6\xfds\x89\x8a\xc8\xa4\xf8}\x07\
-S\x05\xf84}\x10G\x8bZ\xb73\x01\x16p\x864\
-e\x16|7b\xa5\x17P\xf6O\x14{\x1f\x17G;\
-\x97\xaa\x8f\xb5#\xb6\xber\xd4\x08\x0c=0m?\x5c\
-$jzyDUq\xd4\x1c\xa9\xab\xb5\xe0\xd6}\xb0\
-u\xaaN\xd9\x8c\xdb\xbf\x05\xe4p\xb9\xa0\xc0w\xcf\xdc\
-PF\xf2?[<\x8a<>v\xf9[tv\x8cx\
-\xab\xbe\xc4\xb2\xa1c\xac\xa2\xc2*:/M\xde\x5c@\
-1?U*J\x9c+\x8c)\x9db)?\x12i\xe1\
-\xf6\x87\x95\x96\x97#D\x89D\x14-Y+u O\
-\xea<\xee\x94<\x92\xc4\x8a\xee[D]\xf8F@\xef\
-\x95\xc3\x926\x0c!s\xd0\x8e0\x80\x98\x88\xff\xcc\x93\
-\xf2v\x8a\xe0\x91\x0d\xa1\xa3*\xe5C9\x91\xb9\xa4\x1e\
-\x84\xc4\xa8\xf0\xbb\xceL\xed\x8aT\xe7\x80^8uz\
-h\x10:\xc6\xb4\x09/c)\x00\x07\xee]\xfeM\xb8\
-\xf6\x0ejP\x99\x10\xb6b\x10\x8c\xee\x99\xab\x22\x01\xe6\
-\xfa\xaf\xa3\xf5\xbb\xd9\xc9UU+\xf0\x97\xf7u\x22A\
-\xfad\x88\xc8zM\xd4\xce\x19\x16\xe8\xbe\xfe\xe97f\
-\xc7\xfb\xb6m\x0e\xa6\x1f\xc4S\xd5\xce\xa9\xf2\x1eaG\
-<-\x86\xfa)\x9d\x8eI\xc9\xf0/\xefg\xea\x18&\
-\x15\xdcG\x8eO{\xf3\xd5\xfe\xb53\xdf\xc2\xd4R\xf7\
-\xe9\xd7U\xc5\x94\x15\xf9\x1e~\x0e~yJ\xc6\xa0&\
-\x8f\xea\x0a\xb8y@)\x95\x22\xc7g\x85, \x9e\xb1\
-\x00\xca\xf9}73R\xf6\xbe\xd7\xb2\xd0\xb8\xda\xabZ\
-\xb7\xd6\x094\xb6\x9b\xf0'E\x07,\xac\xb4\xee\x12{\
-4\x167\xf0\xb7o\x9epFM(hO\x7f\xb8t\
-#\x0f\xfa+B\x11\xbb\x02\x1a\xe5f\x22d#7}\
-\x1c\xe8\x0f2{\xe0\x8a\xd2\x14 +EKIa\x0d\
-e\xefa\xc3\xecr\x95]\x1b,d\xb3\xa5\x1c\x8a+\
-,\x04\x05\xc1\xe4M\xfc\xfb\xf9#\xc9\x97\x9f\xd1\x1bq\
-R6Q~\xe5)&\xa9\xb4T\x04J\xe0\xb5U\xcb\
-\xc7\xaa\x8d\xbb\x9d\x7fh\xce\x08\x9b\x8e\xb5aF\xbe\xce\
-\xf8\xd7\xbb\x9a\xdfx|\xb3\xc8\x91\xd6*G\x1b\x09\xe3\
-\xee: \xc1\xf4\xc9\xe0\x93\xa5\xc5\x1c\xbf'\xf6\x89\xc9\
-x\x8a^J\xee\x870FJ\xecR\x05_\x92\xffg\
-\xbd \xea\x92?\xc5\xc9\xdc\xfa\x9e\xc7\xe1\xa7\xbb\xb8Z\
-E\xf1@1,\xc5\x82E\x92\x15`E\x1d\x86\xc9\xa3\
-\xf7\xa4\x10{SG\x14 \x87X\xae\x86\xb2\x9f\xc0\xb8\
-03\x17\x8c\xee\x9dE\xb6(\xbb9;\xf6\xa8I\xcb\
-\x0e\xb6\xc6\xc1\x0a\xe4\x9eeUr\xb5+\xc5Y\x13\x82\
-\xaa[\xfd\x0f\xb9\x9d\x1b\xbbO\x86\x0f\x1c.\xf5\xdey\
-\xfa\x0e\x12j\xfb\xd9\xd5`\xb2\x0c\xc1\xc4\x89f\x08\x1c\
-\x15j\xbe\x84\xd1`'\x08\xad\x05J\x86\xa3\x1c~\xf5\
-\x1f\x15\x97m2\xa1\xe5K|\x16\x11n\xbd\x83#\xc1\
-\x80\xa8A\xd9\xff\x00\xbe\xa5n\xd9\x09CX\x0e\x82i\
--s\xc7\x16\xe1\xc8\xf9\x16\xe5_\xc9Y=O\xe5\xd7\
-\xd9X\x01\xf2\x22(]\x18e\xab$\xed\xd9\xc9\x9ck\
-Q\xdf\xeb\x7f\xa4\x99\x98\x1d\x0c\xb7\xa8kO\xb5\xc1\x14\
-\x14\xa5R._\xf8\xbc\xec\xe8l\xed\xa8\xaf\x09\x0a\xad\
-\xf4\xbd\x85\xda\xa7\xfc*\x9a\xa6\x82\x80\xd1\xc7\xf4\x9f\xaa\
-\x88=\xf7\xf2[\xac\xc38|\x86\x87\xee\xc5\xc8\x93!\
-\x90\x88@\xfc}\xa5\x03\x10\xc5\xbd|\x05s\xe6\xa7!\
-Ar\xefB+\xc6\x90\xa9\x1c\x83\xe0\x0a\xe7\xdf\xff\xff\
-\x90\xfc\x00\x00\x00ANMF\x82\x08\x00\x00\x00\x00\x00\
-\x00\x00\x00\xc7\x00\x00\xc7\x00\x00\x1e\x00\x00\x02ALP\
-H\xbc\x01\x00\x00\x01\x0f0\xff\x11\x11Bnk[y\
-5]D\xc0d\x94@)\xb44\x1d@i\x94\x824\
-\x0d\x10\x12X\xec\xc0\xe6r\xfd\xbe\xf9\x8f\x22\xfa?\x01\
-\xf2\xbf\xecw\xbb\xe1\xcdf\xb2+v8\xab\x8b`\x17\
-\xed\xb2\xd5\x82\x17\x9c]0\x02\xa2]\xb2+6\x15\xe0\
-\x05g\xe7M\xda-\xd8E\x93zK&\xb2\x80l3\
-\x80b\xd3\x00l\xe4\xe6l.\xc0\xdbL \xd8t\xbb\
-\x0aD\x1b\x01\x92\xd1\x82lt\xd9M(F\x1d0j\
-v\x15p6\xf2\x8e7Z\x10\x8c.\xbb\x09\xd1h\xbc\
-\x92\x8c\xba]{%\x1bU;\x81\xf2q\x0b>\xee\xda\
-To\xe1\x1e\xd2\xd1\xdc\xf1B0\xf0\xb7F>\x19\x0a\
-\x9c]0\xeag\xfd\x95\xf0\x9e?h_h\x98\xc4\x8d\
-;\xa8\x7fTr\xaaq_\xae\xfe\x89\xf8\x83\xb6\xe9&\
-\xe1\x0b\x85\x83\xfe^\xfb,\xbf\x89\x07\xe3\x0b\xccM\x85\
-t\xe6\xde\xcb\x07\xd7FLdS\x0e\xd6\x07,8\x80\
-\xf2\xda\x05NU!\x1b5\x9d7\x9a\x10T\x1d\x92\x22\
-\xaa\x86b\x18DERME\x87\xac\xba (\x8aj\
-)\xda\x09\xe0\x9f*\xa0\xa9'N\xd1\x00\xf7$\x80W\
-t@4A1T\x0b\xa2bB\xd9]\x90\x15\xd7I\
-Q,\xc8\xbb\x09(\x80\xb4\x1b\x80\xdb4 \xee:\x10\
-6\xfd,n&\x10v\x0d\xc8\x9b\x0b\xf0\xbb\x0a\xb0\x01\
-p;\xb9\xf9\x87v\x13\xe5\x02\xe2\xc3\x00\x8a\xe6\x02\xf2\
-\xc3\x02\xb2f\x028\x11i\x00I3nID\xe6-\
-j\xfa\x0d'\x95\xa3\xf6\xc0\x0f\x1e\xbd\xa6>m\x9dF\
-\x0eD\xbdTE7UY7TQ\xd7UAWU\
-N'*9\xbc\x14\xf9d(\xd2IW\x84\x93\xaap\
-'\xb26E\x8e\xe7&\x9d\xb5M8\x93\xf5$\x86\xf3\
-!Y\xd4\x07o!\x13\xc8b\x0b8#\xf9&\xff\xca\
-\x01VP8 \xa6\x06\x00\x00\xb0.\x00\x9d\x01*\xc8\
-\x00\xc8\x00>\x91D\x9cI%\xa4#!,\xb68h\
-\xb0\x12\x09in\xfc|\x98L\xc0\x034\x1a\xe7\xfd$\
-\xfeu\xf8\xd7\xdf\x97\xf8\xcbN\xfe\xda\xdf&Q\x86W\
-\xe2K\xec\x07<\xff\xda\xfc\x08\xbd\x03\xd8\x03\xf8\xaf\xa2\
-_\xf4\xbf\xf3<\x9f~c\xfe?\xff7\xb8/\xf2\xaf\
-\xec\xde\x93>\xae\x7fs\xfd\x80?N\x7f\xff\x93\x1e\x10\
-\x04\xec5\xa9\x12\x1c \x09* S)\xa4\xd9a!\
-\xc2\x00\x91BX\x99\xe9\xa9\xf593>L\x9e\xd3U\
-\x89\x88\xd3\xfcT2\x1c \x09`\xe2\x92\xa2$\x9f)\
-\x8d\xd9\x90\xec\x7f\x98\xfd\xb16\xea]\xa3\x0f\x91)\xdf\
-\xef\xc9\xe0\xfb$g\x87\x9b\xa3\xda\xebG8\xf9\x1c\x8c\
-\xa6\xcb\x82\xa2\xc2\xc8\xdee\x97a\x84\xfe\x83y\x94\xff\
-\xea\x07\xdf;\xe7k,\xfaj\x08\xdeh\xe0O\x0c\xc1\
-M%A\x84$\x7f\xb4\xcf~\x88\xa0\xabPN\xadB\
-\xe4)\xd2\xda\xaa\x97\xe8\xb2\x0b\xd2\xf61j\x87\x89\xb2\
-\x91t\xae\xa6H\xc1\xcd\x05\xd1\xdf\x8a\xfcM\xca\x0c5\
-0\xdd\x08{\x1e\xaeea\xbf\x89\x95A\x16\xe8\xd1\x90\
-\xb8\xce\xf3O=\x002\x807Q\x068\xdc\xfa\xd8\x97\
-\x9b#\xfa\xad'\x80|\xca\x16X\x9e0\xcb,e\xb5\
-\xbe\xb2\xc8~\xbc\xa2\xd4c\x10\xa8\xe8\xae,\xf5o\xaf\
-\x120\x99\xff5_w\x08aI\x0e\xabZ<\xc1>\
-%\x126\xff\xe4\xdc\x0d\x9b\xcb\xf7\xb9Bi\xf4^\x84\
-\xff\xf2\x8a\xff\xff\xa1\x88\xa47\x9893\xbavA\x85\
-\x1b\xabgr\xff\xd3\x00\x00\xfe\xe7@Ln\xd1RO\
-\xba\xd8s\xf2\xdcj\xd9\xe1c\x9a\x87\xb8\x1d+\xd7\xd6\
-\xee\x92 \x15\xbb\xd4\x85a\xf5]\xcct\xca\xc8\xcbT\
-\x05\x85\x22\x1e\x80\xaf\x12<\x96\x81\xbfmIW\xe9\xc2\
-\xcb\x1a\xe9)\x94\x03\xca\x01\xb6w\xda\xd9?\xcc|+\
-L/\xaf\xd0\xe7\x83-\x13\xf1\xb0\x0c\xfd\xdd\x8c\x15K\
-\xf9\xcc\xbcX\xd0\xba\xf4X\xbf\xa31\x1e\xaf\x15t\x18\
-\x89\xe1S0\xe4q/\x86Q\xa4\xe3\xef%o\xc3g\
-}\xb6:\xa5\xacM\x81\x9d\xeaUS2T\xe8=\xc6\
- \xc3\xfaV\xb3\x93A\xb1\xf37\x88T1\xe01\x9b\
-\xc5\x06\x5c\x8dI\x7f\x0f\xe0\x11E\x9f0\xe19e\x19\
-\xe5\x1aK\x87\xaa\xc8$\xfd]\x05\x0f\x22\xf5\x10\x09/\
-\x1d\xdfiX\x0d\x01%bnB\xdd3\xfc\x22!L\
-\x15\x18*\x07\xf1P\xd5\xb8\x04E5+`y\x85!\
-\x09\xc4F\xbe\xb37\xa9\x108+?\x0c\x1b\xee\xbbl\
-\x85_\xe6\xe9\xc2\x1c\x0cU\x072GD\xaa\x9e\x8ea\
-z`\x1d<\x94\xa3\xd7\x0a\x84\x9d\x1e@\xaa\xc9#\x0b\
-\xd7\x89\x98\x13\x10\xecpY\x02o\xab0\x9d\x06\x88\xd1\
-\x1c\xf1@\x1e\xcc\x05\xb91\x12\xdf\x8a\xd5R\x1d\xc7Q\
--iQ\x22k\xcb\x04\x84\x16\x84m\xac1S\x82J\
-(\x86yb\x8cF\x8d\x83\xe4'\xd3U\xb8\x83\xac\xb2\
-\x93N2t;\xe1\x9bE\x89\xbd\x86sW\x10R\x0b\
-\xb7i\x0d\xaf\xb1\xc7\xc6:\x9c\xefGsX\xd8?J\
-\x9f\xc6\x1eO\x13\x0a\xd2\x12\x87\xbbX,\xf9\xa5\xe8\xa4\
-F\x0b\x83\xb2\xc7cl\x06\x07\xbcbP\xaa\x83\xb2\x90\
-49\xa71\x1d}/\x01\xa1\xd2\x87\xd0\x92l\x01\xe6\
-q\xe5I\x8bL\x81W\xa2\xb3\x0f\x14C\xebI(\x13\
-L\x0b03\xbc\xbb\xe7\xcf\xd3\xdd\xeb\x0e3\x0b5\x89\
-#\xd6\xb8\x01\xdc\x81D\xae-\x03\xccx\x9e\x0b=\x8a\
-\x11\x9bjzFdG\xf1\xd1ff{N\xf3\x17q\
-\x14\xfe-\x9cHH8a\xb4\xf0\xdd\xf22@<\xf4\
-\x04y\xbf\x9c\xa0bT\xf1\x94\xa1:]\xae\x14)\xcb\
-l\x0d\x97q\xf4\xd5\x96\x03\x16e\x18\xd0\xa6\x8b\x1dE\
-\x1a=\xba\x17\x11\xe5c\x0a\x1b.\xe6\x91B\x0dT\xec\
-Z\xcaA\xf1y\xe6j\x8aT\x93\xe3$\xc0\xc4ls\
-ck\x95\x18I\xc7'\x9c\x22-\xfc\xfa\x9d\xc6\x95j\
-\x9e(\x9a\x99?1\x1e\xbd\xf2\xfa\xde\x9a\x16g{\xa2\
-J\x16\x86\xc1\x17h\xd2\xa9@\x10E\xdb\xad3\xfcc\
-$`/\xa7#>\xd8\xe7\xa8\xde\x86\xec\xa8\xc1\x1c\xdf\
-\xbb\x91\xe8\x81\x0b\xaf>K\xaa\xe1\xe2\xb3wjG\xda\
-\xb4\xdd6\xc8\xe4\x06\xcd\xfc%{\x94\x17\xf2\x18\xbb\xbf\
-1L\xf3\xad\xcb\x0f3\xed\xd0\xd9\xecx\xe0{P\x89\
-\xf3Y_\xbb\xb8\x8co\x81\xb1#u|\x003x\xaf\
-^\x846+44\xab\xe4\x9aJf\xe4\xb8\x1c\xadC\
-0\x03\x94\xff*\x96/\x0ePJ\xfc\x99T\xf3J6\
-\xdbd{/\xd3\x177\xcd\x5cy\x16\x85\x8d8#\xc8\
-\x97\x5cg\xe7\xbbUg~\x943\xb6\xcc\x9a\xc9\x1c\xbe\
-M@\x00\x95\x0b\x09\xa0E7n\x9e\xed\x83:|\xd0\
-H\x17\xd0\x1et\x8fR#\x00\x12!D\x02H\xb4\xf7\
-S\xf2;I\xde\x0b\xc9vV\xdf\x0cZ\xee\xebG\xaf\
-C\xf8\xab\x83\xc7\xa49\x03\x89\xab\x9a}LU\x8f\x09\
-\x0c\xe7\x15\xda\x89\xc3\x87f\x1all\xa5\x99\x0f\xb7\xb8\
-\xccD\xb9\xfdl\x16\x81\xd5 \x0bC\x8d\xe9\x95F\xf8\
-:a\x03\xb3\xb5'\x0b*\xc4/\x8a\xc7c:\x1az\
-\xa0@\xa3\x1d\xbc\x09\x93\xc4G<\xf6ZE\x9a\x18\x17\
-\xaa\xe1\xf6\x08\xf6<\x92p\x81\x83\xd6\xabE\x90s\x9b\
-\xcd$\xcc\xd1\xd1\xcb\xef\x81z'\xd2\x88\xf9\xe3\x15O\
-\xabNM\x09t\xa9\x0a\xae\x80(\x9e6\xa1h%\x1a\
-+\x97\x8a\x81\x19\xbb\xf0\xdfF\xfb\xfe\xa5\xf9\xeb\xe3\xce\
-3\xa1\xed\xde-\xceZ\x18\xc5\x01|\x86\x0f\x9c:2\
-\xe7Fa\x83\x88Z\x07\x04\xad4\xe7%gC\xd4\xdc\
-\x9e\x06\x0e\xb8\x1cD1Pc\x9evH\xafp\xa4\x06\
-\x96\x9d\xcd|\xc5\xc6\x83J{t\xf91\xf7]\x9a\xba\
-|\xf9}[\xd7\xa9v \xbc\x81\x7f\xda\xf4\x07B<\
-\x0a\xe0\xe9L\xa8:\xfb3I\x05\x93QL\xd1e\x16\
-q^\xe2\xf7\xec\xfc\xaa\xea\x86E\xfb+\xf6\xc7\xa2\xbc\
-\xbc\x13\x11f;\x06\x10\xe7Y\xb6(fG\xd6\x00\xae\
-\x07\xc4\x94\x8aw\x90\xfc\x83\xff\x9d~\xb0\x0f\xd3\x00<\
-L\x92\xd9o\xa2r!b0\x19s\xed\xb0[t2\
-A\xd8\x02\x85\xac\xcd\xd4\xac\x87\x10\xe4\xe5\x95\x94\xdem\
-\xc9u\x88<\xd0S\xb8\x8d\xefU\xe7\xe7\xd2\x17=\xf5\
-\x84\x0d\xa9rGp\xfa\xb5\xb8c\x1e\xe9\x06{\xcbB\
-\x0ff\x00\xf1R\xbb\xbc\xaaL+\x01\xfe>OU\x05\
-\x0eq\x90\x1f\xbdjs\x84~\x94<\xce\x80\x07E\xfb\
-\xf6e\xf6\x0a\x1fpN\xdaM\x98\x0c#h\x1e\xa8\x96\
-E \xc6F\xee\x86:\x03\x06\xd2\xdf\xbf\xc9h\xd3\xd5\
- \xdbz\xb74\xd5\x96ZR\x94\xc3m|\x95\x00E\
-\x8e\x11\x1c\xbe\xa8\xc3B$\x1e\xe2\x81\x98\xe5\xcd\xf6;\
-\xb3\x913M\xc2\x22\xbdK\xae\xe0\x8f\x10\x8a\xc9v3\
-\xe4\x99\x90\x14\xcfC\xdd\x84\xb4\xd0\x10h\xc9\xe9\xa7w\
-\xa9\x8a&\xbe\xa4|;\xec\xe4\x0d\xda\x09\xbc\x07\x8a\xf5\
-\xf3\xb7\xf8\xcb\xc1\x90\xb9\xf7\x83QT\x12\xc2\xb3\xe8z\
-\xa9U*\xbfH\xeb\xa9s<`\x00\x00\x00\x00\x00A\
-NMFz\x08\x00\x00\x0a\x00\x00\x0c\x00\x00\x9f\x00\x00\
-\x9c\x00\x00\x1e\x00\x00\x03ALPH\xb0\x01\x00\x00\x01\
-\x0f0\xff\x11\x11Bnk[u(]\xc4H\x0e\xe9\
-`\xe8d(\x0dJ\xa3\x14\x97@H\x80\xbc\x03\xf0\xbd\
-\xf7}'\x8d\xe8\xff\x04\xc87\xfa\xc7\xe5\xaf\xcb?\x17\
-|\xa2C#\xb9d\x87Nu\xc1\xe1\x86\xe0r\xd9\x06\
-$\x97l\x9bP\x5c\xaam\x01>\xc1%\x9a\x1e\xe02\
-- \x99\x06\x90M\x1d(\xa6\x06T\x93<.\x0b\xb0\
-\x0d \x98n \x9a\xba\x8b\x00\x97\xed\x81d[.\x13\
-\xb2mx\x15\xdb\x0d\xd5\xd6]\x1a`\x93\xady\x84\x16\
--\x0f\x84\x9e,\x0bb/.X&\xc4\x9bh\x18p\
-\xddd\x87A5\xdc\x90\x06\x04\x97\xa8\xeb\x90\xa6G\xb6\
-\xb5S\xf8\x1c\x0b\xc4\x08\xe53U\xcbCy<\xaaW\
-\xb1\xacO\x04\x9fcn\xf9\x7fe|\xa9\xf9\xfb(\x96\
-\xe5T\x9fOT-\x8f\xd7\xfa,e\x81\x85\x0f\x08\xba\
-\x06ezd\xb7\xa8\xeb\x90\x87G\x1ap\xe9n\xb7\x1b\
-\x92n\xc0\xe5\xd3!\xeb&\xc4\x0eE\xb7\xdc\x1aT\xdd\
-\x03\xc1\x06\x04\x01L\xb2\x05M;<\x105\x1d\xea\xe1\
-\xd2\xdc\x87e\x18P\x0eI3\x0f\x13\xb2fA\x16\x19\
-P4\x0f\xa4C\xd5p\xb8\x01E\x03.\x91\x0e\xc4\xb7\
-\x0e\xc4\xd3\xf5v\x9f\x1a\x90\xde\x06\x10D\x04\xc8o\x0b\
-\x10\x11y\xa0\xbe=\x1a^\x1aP\xb7\x05\xc4S\x07\xca\
-6\x81t\x1a@\xde\x06PN\x0bH\xdb\x0dp\x02\xb8\
-\xb6\xbe\xc5\xed\xde\xe2\xd6\xb6\xbc\xad-l\xb2!\x22\x8d\
-]\x8e\xcf\x96E\xe6VOk#s,\xa7yx\xcd\
-\xa7\xa1K\xa7[w\x9d\x9a.\x9eD'\xaf\x8f\xa6\xbe\
-MMy\x1b\x9a\xf4\xd65\xf1M4A\xf1\xbcUQ\
-\xce\xb7\xac\xb9\xdf.\x8d\xbc\x05\xd5:UQ\x8fS\xd2\
-\xb5S\xd0\xc9\xdc\x8a\x18\xdb\x16-2 \xcb\x87\x02V\
-P8 \xaa\x06\x00\x00\xf0(\x00\x9d\x01*\xa0\x00\x9d\
-\x00>\x91@\x9cG\xa5\xa4#!/V\x09\x88\xb0\x12\
-\x09in\xe0\xc0\x00e\xd8]_\xa4_\xdb;:\xff\
-\x1f\xfd_#\xef\x7f\xa2:\xf0\x0e\xc6\xdb\x17\xa4Gr\
-7\xa2_\xd2\xfc\x11~\xb3\xff\x03\xd8\x03\xf9\x1f\xa2\xbf\
-\xf4_\xf8\x7f\xcc\xf9\xbb\xfc\xb7\xfcW\xfe/po\xe4\
-\xff\xd7}\x1d\xfd^~\xd0\xfb\x09\xfe\xa7\xff\xf1C\x0f\
-|\xfd[\x8c\xc3\xc4\xff\xe3B.s-\xad\x8c\xc0S\
-CV|\x87\xberm\xbfeY\xc7\xf3\x07\xf6fS\
-\x15\xfc\xbd\xb6\x07\xe1.\xb5\x8d\xbb=>\xb8\xe8\xb1\xb8\
-(n\x96\xd2\xfd\x85\xb4uD\xbd\xd4\x18\x9e'\xb2\xfd\
-Ln/\x08\xba\xe2\x81\xec\xda\xe4\x15p\x18\xca\x04Q\
-\xbf\xe5;\xcc\xea\xf7\xf6\xab}aw\xcd\x90U\xbe4\
-\x02\x10\x17o\x9d\xb5\x22\xc8m@~\xf1Q\xde\x9b\x9b\
-V\xf6\x95\xab\x83e\x01{*Y\xfb7\xae\x0a\x1c\xda\
-\x1a\xd5NS\x80A\x07\x15\xbb\xca\x06%a\x16\xa3\xaf\
-\x98p\xb8;:\x13\xe8\x8c\xea\xad7\xddi<\xe1g\
-\xc3\x91\x81l\xcbu\xeaW\xa7\xb2\xa6\x9a-\xef\x15r\
-\xed\x0fuz\x89\xee\xef8\x95\x86\x98`\x9dD}(\
-M\xa1\x14\xda\xcc\x03\x8b\xfc\x92D\x5cy\x96\x8c\xb7O\
-c\xe2Al\xa8\x05\xa3&\xd1HpX\x5c\xba\xc8\x9e\
-\xb5\xd4[\x1e\x16\xa9f\x00\xfe\xc3L\x12\x98\x1c\xe7\x17\
-\xd6\xd9\xba\xbc\xc1\xf0\x03H\xdb\xbf\xdf\x84\x93\x5c\x03\xd3\
-\xa1\xb3\xc7g\xfbQ\xd6f\xa3}\x9d\x94\xd3\xcf\xd7q\
-\xd7\x97\x07\xc1\xd54\x0d\x1c\x9c\x80(\xdf\xdb\xbe\x9eX\
-\x0a4\x83\xd3\x06-\xb1x\x9a\xda\xf8\xa9\xa8{\x1fA\
-t\x0c\xea\xda\x0f\xe7\xe1e\x88Q^VC\x17~\x88\
- \x94\xcdI\xe3\xa3\x16\x89\x99\x9d\xc9\x81a\xc8%\x8e\
-\xf1\xa0\xc3\x964\x80\x05\xb7k\x84\x9c\xa3\xa0\xc5\x82q\
-\xa1@9V\xa6s\xabnA\x1e\xcb h\xa8\x80\x03\
-\xc4yJ\x9c\x85\xe1\xf8\xd6\xb5\xb9\xd1\x0a\x8a\x12\x89\xe5\
-ON\x99\xfa\x0b\x88.\xfa:'\xee\xd8\xd0\xeff\xe9\
-1\xb5\x83\x0b\x1da\xe8\xdc!#3\x19~\xe3pg\
-\x89\x98\xa5\xbbE\x0e`\x9dkeQ\xa8\xedO\xb7\xbf\
-\xc7\x11,*\xeb\x96\xf6d\x8a~\x06\xbc\x1e-\x7f,\
-\x9b\xd9\x19\x12*L\x01\x1b\xb4\xc0A\x8a0=#`\
-m\x1b\xff\x02s\x1f\x84\x19\x0f\xfd\xb7\xe7\x0d\xda\xee\x90\
-\xf6\xb4O\xb6\x94Z\x0c\xb2\xae\x10\xfb\xf8\xf3`\x84\xb9\
-VF\xa6\xa4\xd99\x84\xcf\xad\xe3\x9b\x9f_\x90`c\
-\xb4\x8dH\xeb\x90\xcd\xa3\xbf\xba\x1d\xf1O\x8d\x80\xec\xe7\
-\x80_\x9b\x81\x0dGX\xe0@\xaf,\xf5=\xe7p\x09\
--\xa6\xe6\xbf\xc6m-\xb2\xf80B\xba\x18\xd7\xd8w\
-\xc4XKu?\xc9\x83\x0a\xc9\xae\xd5+\x14\xc2F\x81\
-\x08\xea\xb7(]\xdd\x02\x06Y\xc7\xaf\x13\xaf\xcbT\xba\
-DC\xb8\xff\x86\x1d\xe22\xbb\xf7Q~\xb6!.\x91\
-&\xc4\xca\xea\xc9\xf6.\xd7;}\x16\xc7\x8fw\x18)\
-0w\x1e\x05\x1a\xca\x82\xf8\xb3\xe1\x07\x95%\xc5\xd8\xd7\
-\xc1H*\xe4~\xc9\x98\xaa\x82\xf0O)3\xc6\xd6\xf9\
-\x80\xccn~\xb5+\xd7\x1d\xfb,\xc4\xe7\xab\x98T\xbe\
-\xa5\xb8\x1f)\xc4\x82(&\xeb]\xe5\x5c\xbb\x97ti\
-\xb4\x1f\xebI\xd0\xb2-\x96\xa3\xa3\x95\x88]\xb6o\xb9\
-`\xf8x\x5c\xd4\xd2H\x9f\xf9<B\x9a\x5c}+n\
-\xa6\xb3\x8e*\xd3\x02\xca\xef\xd0F\x7f\xbe\xf29\x9d\xd5\
-\xd8\x06\xc1Q\xc9\x9a\xa1\xcd\xcf\xcf\x86Md\xef\xb1o\
-\xaeh\xc1\xeb2\xcc\xbct\xd7\xb5\xf6\xc64\xf9T\xb0\
-\xf5b\x15\x98o\xb4\x94\xaa!\xfe(\xeb#p\xef\x1b\
-DVwf\x05bp\x7f<\x92\xb4\xb2\x0e\xcf\x83\xe8\
-a\xf6J\xe5\x07\xc4<_\x9d\xcbQ\x97\xbd\x8c\xe0\x5c\
-\xfe\xc3\x10\xf3\x90\x92\xc3tZ%o/nEv\x07\
-?\xae%\xd0xpi\xc1\x8a\x88\x9c\x93\x15\x86\xbc\xaf\
-\xf7]\xefd\xbdg\xd5\xc2q\xf4\xc3\x9d\xb5\xd2\xd8X\
-\xc5\xcb\xf4\xaa\xd0s\xf1\x9a2\xcaJ9\x92H|\xca\
-\x16.\xa5\xe5<\xf6\xf5-\xc5\xc8\xe9\x09\xf3t\xbci\
-p\x04)\xc9&q\xc3\xcc\xe6\x06\xd1D3A!\x1b\
-\xe4\xf3\xcd+{\x93\x85MR\xee\x8fD\xcf\xe0pu\
-\xcdV\x87W\xe7\x847\x9aWw7\x05C\xe8s\x83\
-\x9a3x\xdd\xa0L\x8d\xc85o\xe4j\xd4\xb1\x22j\
-\xed\xf5q\x15'\xb6\xd9\x00\xd7\xdeH\xf6\x95\xd7/\xbf\
-\xf1[hF;o}\xcc\x1e^m\xfd\xd9\xa3\xd9\xaa\
-\xa25\xe1\x1eX\x98\xb61\x9d\x90F\x8f0\x0e\xe0\xa8\
->RXx\xfc\xeb&\xa2\x5c\xef\x9d\xafa\x89\x8a\xb1\
-5K\xf9\xbf\x8fy\xa5\xab\x84\x04~\x9b\x9b\xff\x1c\xec\
-;\x14\xc1\x7f\xa8\xce\xd8J\xf5\x90Y\xb4\xf3\x15\x08\xbc\
-r\xd7\x02\x8e\xdf\x91\xf2\x09\xbc\x1e\x0a7\xddEq\xd0\
-\x8e\x8d\xb4\x95a\xc9n\xa3\x83\x1cg\x81?\xe1\x0b\x88\
-\xb2\x94\xb1}8\xbcf\x17\x12h;\xe7\xd8G\x08\x87\
-\xc8\xdao\xbf\xe2\xc60~v/3\xe2\xa4\xe2]\xef\
-\x09/1\xf2\xa7\x9e5\x9a\xe5\xb5WWe\xd5\x1b\x9c\
-\x00wGI\xfdP\xde`\xc0\xfa\x8d\x80\xe1=-\xed\
-\xb0\xf2*\x0fUZ(\x967\xe4sw\xb7\xb0\x0d\xce\
-\x84 #\x04\xe4\x5c(\x1e\xd2\xc8v\xcd{-o\x1b\
-\xa4\x04[\x18\xeb\xef\x99\xb9\x1bq\xaa\x1e\xd1\xd8\xa3\xd3\
-t\xff\xe7\x12\xd5\x01\xf0:\xcf\xe8W!\x96p\xdc\x86\
-\xb5\xf1%\xcb\x1f\x1dHT\xbe^x\xca%\x86yy\
-\xae\x86\xe9Q\x90\xf8lF'\xe3\xf3\xa5Vss\x9d\
-\x7fr1\xc2\xf4\xe9o{\x92*F\x9f\xb7\x1b\xb1\xb1\
-K[M\x9b\xdd_\x95'\x824q\x0c\x12\x1f4\xe5\
-!\x10\x06\xeb6I\x9dg\xd7\xfc\xeb\x0f\xf9\x95\x06\xd4\
-\x0aP\x01cj\xef\x0b\xae\x98\x86\xad\x8c\xc5\x8c\xef\x1e\
-\xa4\x18q\x16\xc7+A\xca\xe6\xe8a$\x7f\xc0y\xd6\
-\x14r;\xcb\x16\x19\x95\xb9\xc5C,\xe0\x13_\x9a\x81\
-\x15/\xa3r\xbf\x01B\xe8\x0b-t\xc8\xedA\xe8`\
-\xc1\xd1\x9dE\x1c\x03\x86Q\xa9E+\xda\x95\x11\xf2\x91\
-\xdd3_\x8dcbe\x0dFTCl\x84\xfeF\xef\
-\xa9%7\x9b\x80\x17\xf4\x85_W\x0a\xbco\x11\xb7\xdd\
-\x09\x8b_\xe8\x87\xf9\xbd\x8f$\x81\xc7\xf8\x03W\x1f^\
-\xca\xfeK1\xbc\x1a\xa4&Y\x08-\x87\xdb\xd7\xd3\xad\
-\xfc\x05\xa4\xc1\xc5\xcf\x0f\xaeE\xcay0\xb0\xac\x1a\x10\
-\xd98+\xab\xcb\xfa\xb3\x0bcp\xea\xadp\xc9E\x09\
-\xe3\xd3\xcd\xc46\x90%\x17\xa8\xf1\xd0\x9f\x13\xd0m~\
-\xa4\x8fB\xef\xa7\xfc\x07dD\x82\x95\xd9\x8f\xd8\xb3\xe6\
-\xf4\xc7\xfa\x8e+\x1e&z\xd3h\xe0\xd1\xd9TR\xff\
-\x92\xbb\x99M\xb8\x86J\xbc\x01\xe1)\xa5\xd4kI\x9d\
-P\x14\xccrS\xf40:\x18\xde\xa6\xab;\xbb\x95\xf3\
-\xd5\xfb\xe2u\xb8\x0e\xa5HO\x9c\x97\x1e??\xa0\xab\
-\x8e\xa5\xe8\x01\xb2h:\x84R\xaci\x85\x14\x9c\x1c\xac\
-&\xec\xd1\xech\x8e\xb0WTR\xaa\xb4_\x00\x00\x00\
-\x00ANMF\x92\x08\x00\x00\x0a\x00\x00\x10\x00\x00\x9f\
-\x00\x00\x93\x00\x00\x1e\x00\x00\x01ALPH\xae\x01\x00\
-\x00\x01\x0f0\xff\x11\x11Bnk[\x95\xe8\x5cD\x80\
-\xff4`\x89\x16\x5c\x81)\x0dJ\x9bR\xa6\x04B\x02\
-\xc4\x0e\x80{\xd1\xf3'\x8e\xe8\xff\x04\x88\xf5\x9b\xdc\xfc\
-y\xe5\xf7\x15\xee\xb8\x0b\x95p\xe1!^I\x17^\xf2\
-\x95r\xa1\xc1\x85\x0e\xee\x8a\xb7\x0d\x08\xb6\x09\xf1J\xb2\
-\x01\xf9J\xb1\xcd+\x03\xb05\xc0\x99^\xc0\x9b\x9e+\
-\x15\x08&\x99\x10E~\x19\xc6\xa6\x1b:$\x91\xe1t\
-m\x17LYdF\xdd\x0bEdf\xdd\xb3\x01]\x05\
-\x16\xa7\x92\xa5B0\xb9\x0aQ7\xc1=\x90u\x03\xfc\
-\xb5\xa4\xeb\xe0_S\x83\xf0B\xb45\x08\xba\x17\xe25\
-\xaf{ \xf6\x1b\xc9Vw\xce6n\x89\x11\xf2\x07\x99\
-K\xb1\x95\xf9\x81\xb2e|$n\x00\xc9\xd2\xff\xcb\xda\
-\x1f\xd5\xff\xdf\xb2e\xc0\xbcQ>R\xb1\xcc\x8f4l\
-\x90\x07|\x90\x0eNWo\xa5k^\xf7@j7b\
-\x83\xa0{\xaf\xbd\x10u\x0d\xc2\x9d\x07\x92\xae\xef\xb2n\
-\x80\xbfS\xa1\xe8&8\x1b\xe0\x040\xc9\xe24u3\
-\xc1k\x1e(\x9b\xa0y7\xc3\xd0 o\xa2\xa6o:\
-$C\x12i\x905\x13\xe2\xa6h\xd8\xbc\x80;U \
-\x88<\x80?=\x80\xdf\x85\xd3\xbb\xab@<5\xc0\x89\
-\x08\x90O\x03\x10\x11\x99PNS\xc3\xa1\x02e\x19\x80\
-\xdf=@^:\x10w\x0dHK\x03\xf2n\x00qy\
-\x01v\x00ay\x16\xbf\xbc\x8b_\xea\x92\x96\xa1\x90\x05\
-\x11\xa9\xac\xb2\x9dK\x12\x19K\xd9\x8d\x852X\xf3\xae\
-o\x8ei\xd7tq\xf7\xea\xc2\xae\xea\xfcNtr\x9c\
-\x9ar\xea\x9a|j\x9axz4\xfe$\x1a\xa7\x98\xa7\
-\x22\xca~J\x9a\xf7\x144rr\xaa\xb1+\xa2n\xbb\
-\xa8\xab;\xa7\x93\xbed1\xd6\xc5[\xa4A\x92#V\
-P8 \xc4\x06\x00\x00\xb4'\x00\x9d\x01*\xa0\x00\x94\
-\x00>\x91>\x98G\x83\x1fR\x8e\x80\x01 \x96v\xed\
-\xd5\xefb\x8f\xfa\x97\xfd\xd7\xb4_\xf1\x7ff\xb9~\x5c\
-!\x127o\xf6\x1a\x197\x80\xfa\x0d\xfe\xbb\xe0\xb5\xf5\
-\xff\xf5\x1e\xc0\x1f\xc7\x7f\xc8z\xac\xffM\xffS\xfcg\
-\x9c\x7f\xcb\xff\xbf\x7f\xde\xff;\xf0\x0d\xfc\xbb\xfa\xdf\xeb\
-\xef\xb3'\xad\x9f\xd9\xef`_\xd2o\xfdF\x89\xacz\
-\xdd\x0b\xa2@\x1fj\x83K\xe3\x02\x0a\xc2\x8d\x128P\
-\xf0\x1cb\xd6\xaa\xd0\xcc@\x8eR8p\x8c\x0c\x98\xa7\
-T\x1c\x92\x03\x1e\xdf\x16e\xbf\xc6\x1c\x02/\xecz\xaa\
-|\xda^\xbb\x9c`\xcf\xe2\xd0\x97i\x19\xadV\xe6\xce\
-Q\xd6\x88\xca\xac\xd2\x1e7\xac\x5cs\x8ac\xd0i\xdc\
-\xd2A\xaf\xe58^Egzb\xc1Ek\xbf\xed\xd9\
-\xccX\xa5\xf5t\x9f\xc58\x1c\xc4\xb0R\xfc\x97\xbbe\
-\xe8\xb5^>\xe6Ik\x97!\xfa1\x08\xb8\x85=\xe8\
-M\xddo#s\x9b\x9cJ>\x7fWz\xd5D\xcf\x13\
-\x1aX\xdb\xf5]y\xf2^\x7f\x80\x9a\x8f\xac.S_\
-^:\x9e\xbe\x1a\x0a\xe9\xf7\x9a\xed\x01\xfe\xdc\xb0\xa8\xa0\
-\x13\x91\xdf,;WX\xcd\xf9\x0b\x8d\x1d\x91\x1c\xf0t\
-\xaa\xc4\xc4+\xe5\xba&\xa1\x0e\x0f\xc0\xe3\xe8\xf27m\
-V\xad4\x95\x9f[\xf9\xb5k@5S\x00\x00\xfe\xfa\
-wA._\x15k\xbd\x90bl\x8c\xa8\xf4I\xba\x04\
-Ut\xbdA\x19\xd9\xf4\xc6{uX*\xd4\x14J\x97\
-\xbd\x82HLZW\xeb\x98\xe0\x16}U\xfe\xe3\xbb\x17\
-\xca\xbc*\xfb\xc7\xab\xca\x147M\xbd\x94\x125FF\
-\x1eA\x870\x82\x95\xdb[\x9b\xcd\x8dV \xb0\xdb\xf9\
-Z\x88%\xe2-\xfd\xd7\xd1\x1c\xa2\xf8\xba\x80]\xbd\xb5\
-m\xb5\xf6\xd2\xb8\xde\xd8^\xc3\xd3pPM\xb7+\xb6\
-\xbe\xf0X\xccj?\x7f\x9d\xa4\xfc\x95\x0ca'\xa0I\
-\xef4D\x10\xb2\x8b\x1bK\xb6p\xa1X\x8b\x7f\x8b\xdb\
-\xb9\xf8\xcc\xf2:\xe8\xe9x.\xc5/\x01\xb2(\xc7\xdb\
-\xcd|\xa1\x09\x91\x81g\xed\xf5\x1bG\x87KG\xe8\x8a\
-\x95Zs+\xbfK\xff\xae\x12\x94V.0\x0a\xae?\
-\x02\xa8I7}\x84\x17\xde\x97r\x13\x8d~\x8b'\x04\
-\xd4\x86nn\xb6\x86f\xf2\x1b\x84\xe1\x8b\xa8^\x8ca\
-\xab\x0e\x9dc\xcd.\xb2m\x84\x9aSi\xd7\x86\x12\x92\
-P'\x03\xa7$\x18\xe1O\xaf\x96K\x15\xbc\x90^m\
-i%\xca\x1c\xfeN\xe0A\xbf\xb7\x8de\xda\x15?\x0d\
-\x84\xe2K\x13\xd1h\xdc\xc5\xc5h\xcd\xd9\xc5\xfa\xd9\xe1\
-Z\x01\x1f\x95\xb62o\xf3@\x93Fv\xbf}\x98)\
-\xcc~\x95\xd6\xfb!\x83\x01\x1eG\xfd]\xb9ZP\xe6\
-\x13p\x04\xb7\x0a1\xffY\xe0\x84\x8b\xd8\xe6V@\x84\
-\x85K\xbd\x125\x87<$2v\xe7\x80\xf7\x8b8g\
-i\xb3\xc6\xa3\xea\x11t\x94\xc6,\xc35\x8c\xf3\xd0E\
-t\x10\x17e\x91\xa0\xac-\xa4#\xff\xbd:\x87u0\
-|\x14|N\x03`\x07\xfe-Y\xc7\x10\xca\x11\xae\x0a\
-\x8e\xdal\xc72\xf4\xfe\x7f\xef\xd5\x86\xf7\xfb\xeaQ\x9f\
-\xe9\x0c\xd2d\xc0;\xf3\xe7Vf$~\x17\xb5\xa8\x10\
-M\xff\x91\xf42\xe8\xaf\xf8\x0f\xf9\x12.Q\xd9\xda\xc1\
-,~\xcf\xcd\xf3:\xbc\x8f\xdcp\x11\x16\xb99\xfb\x89\
-\xff\x08\xadSp\xe6\xfd[\xad\xc9\x12M:\x94\xbf\x1a\
-k\xe7\xfaq\xc9j\x00\xe9\xb8m\xd6n?v\x92\xcc\
-\x802Is=\xd7\xe7\xa4X\xdaoT\xd2/\x13v\
-\xab\xa6\xa5^u\xae\x81\x1e\x22i\x1c\x89s>\xa6\x5c\
-f{KKB\xa7\xd1u\xe5\x88\xb5\x1f\x92@\x94\x83\
-9\x1a\xee\xea\xd6z\x8az\xcd\xb2B\x81\xc1\x5c\x81\xd8\
-\xe8\x1e\xe0R\xce\xcf\xf5\xea*e{\xca\xb4\x05\xb2\xc8\
-\xe2K\xc1^\x1d\xeds\xec;\xbc\xd6\x86B^\xb8\xe9\
-\xe1}\xfd\xb8\xa0\x1c\x17\x10\x81\xd3\x05AY%\xfeU\
-\xe9\xee\xc0\x91\xcd\xce\x0f\x0a\xf0A\x9dOC\xef\x8bd\
-\xe4\xb0~\xcc\xc6\x1d\x0f.I%\xe44#?b\x8e\
-[\xe3eK\x118\x80e0!oc^\x9a3\xa1\
-\x8d5\xd4v\xde\xd7\xb3\xbc_=\xc01{\x82\xe2\x9e\
-Pud? IWz\x8c\xf9\xfc\x03\xc0\xf2*\xdb\
-\x98\xb4m\xf8}(Z\x9e\xacq\x8cM\x01*\xb1\xd4\
-\x08\xb0\x88\xeb\xf4\x88p\xc3\xbf\xf3,\xed\xd4R\x1d=\
-\xe0:\x7f\xb5\x02Gs\x117\xdaEVN\x0f\x9a\xa5\
-\xcf\xe6\x12\x0f@\xe0\x92\x94\x8b\xb3\x99Z\x05\xe0\xc5W\
-.\x84\x92\x8c\x06\x9d&\x99\xf6\x0b\x07n\xacyl\xac\
-\x16\xf2\xe9\x07\xb5\xe9%\x1e\x9a\xcc+\x01\x88\x8d\xf9b\
-\x02Q\xcet\xbc\xcd\xb6,\xffW\x97\xd6\xb2n\x89\x16\
-\xd9\xab\xb3TQ\x90N\xcd>\x1b\xf0O\x92QFX\
-\xb2\xbc\x17K&\xce\x99\xbb\xf48\xc4\x89\xfb\xc1\x99(\
-\xf5\x94\xb5\xe3\x09^\x8e\xfe\xdc\xea\xfe\xc9 \xb7\xf2\xb5\
-QZ1Nl\xa7t\xeays\x90\x87\xfcFv\xe4\
-{<\xbd\x17\x16\xd6\x98 A\xe1\x9b\xd4\x17\xfd\x1f\xef\
-0\x02(R>h\xc3\xb7\xeb\xd0\xa6\xa9&\xc2\xc7r\
-\xe8\x06\xf9\x00?\x06\x18kH\x9c!2\x18\x12\x95\xd2\
-\x14\x03\xcf\x1b\x84\xfa\xbf\xa2\xec\xbc\x8d\x81i\xb9\xe3\xcb\
-\xc3\x8e\xa4\xfc\x15\x9dTy\x9d;\xee%d_?\xaa\
-\xd2\xc0\xcc\xeb\x0e\xbfU\xd1\x89`\xd88\xb2\x05F\xe4\
-\x03\x07Q\x12\xbfi\xa9\xa9K\x9a\xcbP\xf2$\x1f\xed\
-e\xf7\x9a\x0c\xcf\xf5!\xfb\xfd\x01Gp\x9e\xbe\xd3\x92\
-\xe0\x93j\xde4\xeeyD\x00@x(L1\xef\xb7\
-\xb6GKZ\xc3I]\x8fE\xc4\x19\xa3\xe1K}c\
-\x1f\xe0\xfb\xb7\x97\xc0)2\x8c\x8c@M\xef\x9eKF\
-\xa9\xccRP\xaf\x8fN\x87/ty\x90h\xd7\xf7\x03\
-\xe5\xd6`\x12\xd8\xa1m\xb6\xa7\xfdp\x9f[BZ\x0d\
-;\x04qK$\xed\xe9\x8a|-\xe3\xf1\xdb\xca\xa2\xc9\
-\xfc\xa2-.\xb6\xab)U\xcc\xc9\xa6\x17\xbb.\xc4V\
-i\x8b\xad\x80\x10\x9c\x11\xb1k\x16P\x94?\x0b\x5c\x11\
-q\xbb\xda\x09\x8e\xcb\xd5\xc3\x13\xb1\x186\x17P\x9a\x1e\
-\xf0\xf6 P\xd8]\x1b\x1a\xa7.j\xa9\xa7\x5c\xacV\
-\xcf\xf3\x1b\xd4\x13\xbd\xd8\xbd\xe6@\x94\xb0\xef\x93\x009\
-\xe9\x9c\xab\x98o\x9a\x0e\xc7\xbf\xdaG\x9axN\x97\x22\
-Dw5\x221\x02v\xf9\x1d:k\xe8c\xe7C\xf7\
-\xe0\x18s+\x83A\xf8\x82\xcd\xbf\xd4\xdf]\xa9\xd0A\
-:\xbe\xf5\x14#\x84G\x82\x1fLX\xc3\xfbk\xad<\
-\x93\x9f\x8a\xc3\x12\xe2\xafVOD1\xfa\x1c\x08\xf4\xbb\
-\x9f\xfadzr@\x1d\xab\xe9\xd9-\x0em\xd1\x22t\
-\xd0K\x82\xb7\x8d\xaf1\xab\x9b\xe9\x06\x18\x0cp\x1dJ\
-\xfd\xf1\xfey\xbc\xde\xf5GVU\xa2:`\xc8\xfb\x09\
-o\xff\xd0\xf8\xf6?'y}\xf6\x7fS-\xc5_\x9a\
-\xb2\x83>\xff\xd1z\xb2\xff\xc9\xc1\x10]\x8eP\x04\xa1\
-\xe3\xb0|\x9f+\xa2\xae\xea\x9c\xda/\x90\xf46J\xe9\
-\x1fE\xd9V\x9c\xcc\x05Zh\xf8\xd2\xecf\xe6\xf3\x86\
-U\xe8\x87c&\x18\xa6\x89[r\xb6\xa0\xc9\x94\xaeM\
-\x7fE\x12K\xd1Z\x8c\xf2\xba\xb1\xd2\xa8\xfa\xa0\x11\xef\
-EnO\xd2\xf7\xfe\xdfx\x00\x00\x00ANMF\xd4\
-\x08\x00\x00\x0a\x00\x00\x13\x00\x00\x9f\x00\x00\x8d\x00\x00\x1e\
-\x00\x00\x01ALPH\xb2\x01\x00\x00\x01\x0f0\xff\x11\
-\x11Bn\xb5\xed\xb4m\xfd\x86`\xdf\x8f\x0e\x8eN\x8e\
-\xd2(m\x96\xa2\x04\xa1\xc0\xf0\x06\xf8\xfd\xe7\x9eF\xf4\
-\x7f\x02\xe4\xfaS,\xbf\x9b\xfc0\xc9\x16\x05\x8b\x07g\
-P\xf1&/\x06\x8d`\xd0\x89\x06\x83\xb4|\xd3M\xf2\
-\xf2]\xc7.\xdd \x22\x05U\x01\x9c\xc8\x83\xd3<\x80\
-_\xbcA\xe5ES\x80\x17\x91F\xd0\xc8\x84\xb0$\xd5\
-\xd8t\xb2\xaaC\x14\x19\xa0j'w\x91D&xM\
-\x85|\xf7l\x00\xa7)\xc0\x9d,\x05\x90\x1bW \xeb\
-&\xb8\x07\x92n\x80\xb7\xa9\x10u\xdd\xa4\xc1K\x85p\
-\xd7\xe0EW!\x98y\xdd\x03\xa1[\xc4\x0eNW\xcc\
-\x86E\x1a \x97\xbfX\xbe\x99\xa4i\x91\xad\xd2\xcd\xf8\
-\x95\xb0\x00\xe2M\xffoh\xbfU\xff7J7\x03\xa6\
-E\xfe\x95\xf2\xcd\xb4\x1a\xbfJ\x1ap\xc3Op\xba\x02\
-\xa9[D3\xaf{ 6\x8b\xd0\xe0EW\xcd*\x04\
-]\x83\x17\x9b\x07\xa2\xae\x9b\x0c\xf0\x0f\xa4\xbb\x02Y7\
-\xc1\x15@\x078\xb1\x90\xc5i\xcaf\x82\xd7<\x907\
-/\x9a\xba\x19\x104\x0d\x92H\xbf\xe8\xa7\xa8\x19\x10E\
-\x1a\xa4\x8b\xb0\xc9\x1a6\x15p\xa7\x02\xbc\x88<\x80?\
-=\x9a\x97S\x05\xbcH\x01\xc2\xa9\x01ND\x80t\x1a\
-\x80\x88\xc8\x84|\x9a\x1a\x0e\x05\xc8\xcb\x00\xfc\xee\x01\xd2\
-\xd2\x81\xb0k@\x5c\x1a\x90v\x03\x08K\x05\xd8\x01\xbc\
-,\xcf\xe2\x97\xba\xf8\xa5,q\x19\x8b[dAD\x0a\
-\x9a\xb9D\x91\xbed\xd9\x8e\x854Y\xd3\xaeo\x8eq\
-\xd7taWu/\xbb\xa2\xf3;\xd1\xc9qj\xf2\xa9\
-k\xd2\xa9i\xc2\xe9\xd1\xf8\x93h\x9cb\x9e\xb2(\xfb\
-)j\xea\xe9E#'\xa7\x1a\xbb,\xea\xba\x0b\xba\xb2\
-s:\xe9K\x92\xcb\xb2\xf8\x1bi\x10\xe4\x08VP8\
- \x02\x07\x00\x00\xb4(\x00\x9d\x01*\xa0\x00\x8e\x00>\
-\x91@\x9bG\x82\xefC\xa8\x00\x01 \x96p\x0d\x5c\x0a\
-d\xf1?\xf6/\xc6.\xff\x7f\xbfc\xd5\xe9\x0f\x14\x1f\
-\x93\x22\x1dk\xfe\xff}\x8cV3\xbe\xe7|\xd6\xa1\xde\
-\x08\xe7g\xfdG\x82\xd7\xd3\xbf\xd3\xfb\x00\x7f \xfe\xe1\
-\xfe\x83\xed\xdf\xe9?\xf9\x9f\xda\x0f7\x1f\x90\xff\x87\xfd\
-\xa2\xf8\x04\xfeG\xfdw\xd2\x03\xd7\x17\xecW\xb0\xcf\xec\
-\x17\xfe\x848\xb0\xe4\x99\xe2\xcf\x19\xd0`W \xaer\
-\xfbs9\xe9\x86`%\xfd\xb5\x10\x1a\x08\xa3\x7fj\xcb\
-\xdczv\xb0\xc4k\x99\xe8p@\xceg\xd0\xd5\xf8\x1e\
-\xba\xa4/\x1a\xfc\x81S\x883\x22<g\xf05\x02\x8e\
-\x0b\x0d\x9eW??\xfd\xb9\x92\xb3\xac\xbeF\xde\xf6\x00\
-\xcd\xba%c,\xc7\x9a\xe8 \x85\xd5\x84\x1e\xc9\xc8\xd4\
-u\x86\xaf\x16\x10\xb3\xc7\xba\xf5'L\x8d\x06# F\
-c:\xcd7\x8c\xacdpPF[\x87\x01\x9eF#\
-!\xd3\x19\x06\x03\x9e\xa6\xa1`\x03\xf73\x98\xc0\x09\x89\
-\xc6;KT\x9atE\x0e\x15\x0c\xbb\xd4\xda\xa9\xc2/\
-`\x11\x89'\xafF\xd7r\x8d\xc1.\xd0V\xec\x81\xab\
-\xbc\x07\x86K\xf4\xad\xbfc\x8a\x84_XI\x82\xfac\
-\x81\xc2\xda\x92\xe9\x96\x9f\x8dLo\x13d\xd7/\x9d1\
-\xe4w\x93\xd7\x1cW0\xb0\xfb}R\xc6W\xdd\x16\xfe\
-\xc8\xb7\x00\x00\xfen\xc2\x199\x9e\xe5(vML\xc0\
-\x12o\x1cy;\xe3mb\x0cC\xfb\xce\xb2\xacc\x97\
-y\xe3\xccx40\xad\xa0\xe8\xc8\xca\x0f\xc0\x162\x12\
-\x8d\xdb+\xf7\xa8\xe8W8\xc3\x8e\x81l\x98q\xed\x9f\
-+\xf6\xe6\xb6H\xf5\x5cc\xfe\xefP\xa05\x9d;/\
-\xcf\x0d\x1f\x8a\xb1-\x83\x17\xae\xf6S\xbac\xf7\xfa\xb3\
-\xab\xbf\x0b\x00s0\x8d\x9e\x22\xc1\xe9\x02\xce\xc3}\x8c\
-s\xea\xd2\xd7\x8c\xba+a`\xd2\x83\x06j{\x9e\x8c\
-\xe4\x7f\x92\xd2\xc4B\x0d\xab\xf6\xbf\x84\x11\xcb\x05D\xe1\
-\xa2\x04:\x06e\xd7\xad\x09\x1f\x05\x12^\x8a\xc1\xf2\xa2\
-1\x13F\xd3\x1f\xbd{\x8a\xe2\xc7\xa5\x84%\x00t2\
-\xf3\xc6!\x1d\xa7\xf7\x9d\x9c\xf3\xe6\x1d\x8f7\xd9\xde\xf7\
-?W\xaa\xaa\xa9\x91-*F?H\xbf\xa7x.\xc8\
-v\xa2JRY\xa0|m*\x09)(s\x99\xbcS\
--\xd1}\xf0\x8e>\x15\xc9\x7f3\x07\x0d\xea\xbf\x04\xfa\
-T=\xdf\x1am\x10:h0\xf5\xef\xb3\x9f\xad\x06\xdf\
-\xc9\x09\xa1S6\xb5J\xf5\x08\xaeK\xae\x1do\xc9S\
-\xca]`\xf7#\x9e\xbb\x17v\xed9x\x18\xeb\xc2\xab\
-\xd5A\x1b\x02\xa8\xe3\xcc\x92\xbf\x87\xb9w\x17l\x98\x90\
-\xf7E\x83\x08\xacd\xb7\x18\xb4\x0cB\xa3BO\xcf\xdb\
-\x8b\xb2k_S\xa5v\x90\x13&_BJ\x7f\xa6\x1d\
-\xa7\xde+\xd4P&\xd3\x1e\x98\xdaE\x96\x8e\x82\x88\xd8\
-\x19\xcbJ\x1b\x18\xc2\xdb%\xdd\x22x\x8d\x8ey\x8f\xdf\
-\xd0/de\xd3\xb79\xe2h\x0a\x7f\xd9?\x08\xf4\x01\
-\x08tO\x85V\xaf)1&W\xfe\xcabm\xedv\
-\x05\x05mN\xde\xe5\xd0Q!\x1f\xfc\x7f\xb03*\xa1\
-\xafs\xe3c7\x83x\x1a\xfe\xd9q]\xeaj\x07=\
-\x087\xde0\xfd\xd8\x10\xdep\xa0\x16\xa4\x86\xaa\xeb%\
-\x10\xbd\xd5q@n\xea\xdf5\xc4\xdb\xb1O\x82=]\
-\xce\x8eo\x03u\xfb>;)cZ\xc8R5\x22i\
-^\xec\x9d\xe3`fV\xb3~r\xd0}\xb2D\xffo\
-\xe5\xa9\x8daR\xe2\xddr=DS\x09#\xe6m\x8b\
-\xe17;\xaf\x83\x17\xe2\xb5A\xa1\xc4\x02z\xc2\xb5\xd5\
-\x88\xc1|\xa4\x80^\xddp\xf2\xda\x22\x00#O\x09\xd6\
-\x0b\xad\xcb\x0c\xa4\xb7\x07\xad\xe5\xd6\x03\x8fJx\xf8T\
-\xe1\xa8\xa1R\x86\xe8\xb8\xfe\xc8S\xa6\xf9\xd4o\x86\xa8\
-wn\x92t\xf0\xf5\xfd\x19\xbeA\xb8\xabI\x9c\xb8\xe8\
-rD\x02h\xf7\xacF\x08D\x16\xe1\xda\xa8\xb5\xfe>\
-\xe4!8!\x95\xcc\x5c-sM\xeb\xe4O\xa3\xea\xb0\
-\xd5\xea\x0a\x9a4\xf3#=\xa0\x85\xbb0\x1b,\xe8?\
-\xa7\x8e}2\xa6_\x9e\xb3\xb9\xf9n{\xd2]\xa3\xa7\
-O\x95\xe4\xcd\x17\xc0\x80\xbc6\x94}\xf9\xefc\x82{\
-\xa4Jwz\x97\x91ke(<\x04\xd2\x86j\x17\xd8\
-\xc9\x81lQ\xea<n\xa9?\xce\x87\xca\x7fk\x90h\
-}\xc8\xe1)\x84D\xb8\x13\xa8\xd5<N\xa5\x1be)\
-c\xe6\xee\x02\xb1b\xecI\xb5\x00\xd2\x8b'\x10G\x11\
-h\x0e\x86\x10\xfb\xb6\xc3\x06]a\x08L\xe7\x89\xd1C\
-\x8f\xebPHm\xf3\x1c\xe7\x08\x92\x09\xfd1\x8c\x83R\
-\x9e<\xf4\xf4\xac\x03\xa5t\xc7\xc5 \x89\x11\x8e\x05\xe0\
-\x5cgc\xbb\xe5h\x11\xcb\xd4\x87ei\x1e\xa7\x88G\
-*=\x13\x7f\x80\x02\xd4\xd1\xcf\xadP\xab\xe0\xdcFO\
-,\xcc\x0e\x10\xcb\xfd1D\xed\xc8\x99\x09\xbfh\x0f\xe2\
-\xf0E\xfb|%5\x13\xc3\xc2\xc63r\x85\x8e\x04\xfc\
-\xd2\x9e\x84F\x14-D\xca\xfd\xd7z\xef,\x9d\x19z\
-\x06\xe2\xf6\x85\xfe`y\x11\x8a\xc2\xf1\x97C\x02:\xb0\
-\x1e\x0e\x07\x93\x99\xc4\x97\x81;\x16\xfb8\x1d\x7f(c\
-3TH!b;\x0d\xe84\x06\x86\xe6<\x22\xa9_\
-\xbe[3\xac]\xae\xda\x99\xf67\x0b\xaf\x1e\xa3\xc3(\
-\xdd7\xb4\xfb\xfe&\xb35v\x9c\xecR\x8f\x98\x04W\
-w\xe5i~\xa7\x18?D\x97]\xf5\xa5\xaf\x9f\x12*\
-\xa2\xb1\xdff\x96\x90\x0ds\xdbmP\xba\x8cZ\xd5N\
-\xf7y\xd0\xe6\xb8}\xdf\xb9\x84\xc8\x06p\xb7\x8c*b\
-b\x86`\x9b\xd4\xb2\xd2r\xf2\xd4\x93\xd1\xc5\xa5\xf6\xa8\
-\xb8Ws\x9be\x13\xb9W?\x93\x99\xa4`\xd2\xa5\xc5\
-\x1f\xff\xeaJ7\x11\x8a\x0e\xdd\xe8\x9c\x80\xaeQ\xa4\xa0\
-b\x01\xc1wy\x8d\xda4\x1f+z\xd7\xac'\xde\xb5\
-\x80mL\x8dp\x93M|\x12\xf3h\xf7b]\xb5\x88\
-\x02\x0e?Wc%t\xae \xc3\x0c\xaeH\xa1\xda\xf8\
-\xc6z\xebl\x96\x8eWA/\x00\x1d\x1b\xc1\xeeEP\
-\xab\xe1\xbbj\x04-i \x82a\xbd\xa7\xd3\xf9LO\
-:\x18\x0aC\xcc\xb0\x03i\xc0\xe6\xaf\xe8\x8fjS\xad\
-\xa77\x1e\xa56q*\x8f\xa3\xab\xff\xb6\xb2~\xfc\x90\
-\xe0\x1bV\xcc\x87\xde\x0d\x8f6\xd6\xc4\xa2\x997|h\
-\xb2\xc8\x85#\xc0\x8d3\x81\x8d\x8bk\xc8\xe1\x07\x83\xfb\
-\xe0\x98\xf9\x228\xe8\xf3\xbc\xc4\xe2\xb5y\x81~\xae\x9f\
-k}o\xe2\x0b\x87\xd1zS\xab\xf1\xba9\x0c;\xb2\
-\xb0\xf5\xbf*)\x0d\xbd\xea\xba`\x19\xe1Vu\xfd\xb0\
-\xa5\xdd\xe5\xd6\x08\xe7\xe6s\xc2i\xbb5\x98\x08\xc6\xc2\
-\x8b\xf1n\xe2q\x11\x14\x9c\x93\xd0\xd3`G\xd1\xb0\xe5\
-\xe0\xf3\xc31\xdb\xd6\xbc.\xf2\x9d\x9f\xc0\x18\xd8\xc6w\
-R\xda-29=\xa2\xa4\xcf\xc4\xe3\xf1\x82\x05\xd7\x07\
-\xec\xe0\x161\xc5\x03F\xbc\xef\xd0G\x1aXv\x93\xdd\
-\xdd&\xf7\xf48\xd3D&\xf3\x0b\xc7\x13\x94\xb7N9\
-9\xb7\xbd\x9eQ+\xf8X\xed|v\xfa\x12\x0c\x0bo\
-q\x95\xaa\xac\x8a\xea\x1d\xd4#\xa1\x18\xc3\xf5\x10W\xe4\
-\x8c\x1e\x0a\xbf\x07\xfd\xfa\x0b\x9d\x80z\xe5\xd8\x88\x13\xa0\
-2\xb1\x81@>\x01\xce\xdd\xc8E\xd2\xf8\xc4\xfc\xc1\x80\
-\x7f]J\x176-\xa8\xa2\xf9\xbb\xb2\xa2\xc7\x8d\xa7\xaf\
-:\xd4\xef\xd3\x91y\x011*\x0e\x03T\xd1\xa4\x88\x8b\
-^p%\x10S\x19)xu~\x9ap\xde\x1f\x81\xed\
-{\xcf\x19\x8bb/xa\xcaas~\xc3M6o\
-+V\xc4Bo\x00\x00ANMF\x8a\x08\x00\x00\x0a\
-\x00\x00\x14\x00\x00\x9f\x00\x00\x8b\x00\x00\x1e\x00\x00\x00A\
-LPH\xab\x01\x00\x00\x01\x0f0\xff\x11\x11Bnl\
-\xeb\xd8\xb6]^\xdf\x8cP\x09JQ\x1a\x9d|\xad(\
-E\x09B\x81\xb1\x03\x5c\xcc\xfb\x9bF\xf4\x7f\x02\xe4\xf5\
-\xc7\x13\xf7\x22\xfb\x17%\xbc\xa8\xf1\xe2\xdf\xd2\xd2\x85_\
-:\xba\x1c\x96\x81Q\x95\xb8L\xac\xaa\xa6\x17m\x03N\
-\xd5\x11\x91\x0c^50\x22\x05\x82jb7Q\xc5R\
-!i28\x91vQ\xc0\xdf\xd5M\x87\xa8i\x10D\
-\x06\x84'\xfe\x22\x8aLp\x9a\x0aic5e\x03\x18\
-M\x066\xa2^\xf2\x0b\x93!\xe9&\x98\x02Q7\xc0\
->\x0b\xba\x0e\xb6\x82\xd75po\x1a8]\x05\xff\xcc\
-\xea\x0a\xf8\xfe\x22t0\xba\xfc\x99\xe2\x00\xb9\xfc<\x93\
-8I\x9f#\xbd\x8a7\xe3\x13\xc1\xe7\xe8K\xf8K\xb5\
-O\xd3\x7f\x1f\xf1f\xc0|\x91>S\xba\x99\xaf\xc6g\
-\x89\x03n\xf8,\x19b\x07s\x15\x9eY]\x81\xd0^\
-\xf8\x06NW\x9fU\xf0\xba\x06\xeeM\x81\xa0\xebO\x06\
-\xd8\x02\xf1.C\xd2M0\x19\xd0\x01F^\xc8b4\
-y3\xc1j\x0a\xa4\x8d\xd3\xd4\xcd\x00\xafi\x10\xef\xfa\
-\xa6C\xd0\x0c\x08\x22\x0d\xa2f\x82\xdf$\x0d\x9b\x0a(\
-2\xe0D\x0a`OE\xe3N\x15\xb0\x22\x19\xf0\xa7\x06\
-\x18\x11\x01\xc2i\x00\x22\x22\x13\xd2ij8d -\
-\x03\xb0\xbb\x02\xc4\xa5\x03~\xd7\x80\xb04 \xee\x06\xe0\
-\x97\x0a\xb0\x03pKY\xecR\x17\xbb\xe4%,c1\
-\x8b,\x18\x91\xcc*\xdb\xb9\x04\x91\xbe\xa4\xddX\xf8\xcf\
-6\xee\xfa\xe6\x18vM\xe7wU\xe7vYgw\xa2\
-\x93\xe3\xd4\xa4S\xd7\x84S\xd3\xf8S\xd1\xb8\x93h\x8c\
-b\x9e\x92(\xfb)h\xea\xc9i\xf2\xc9hd\xec\x92\
-\xa8\xeb\xce\xeb\xf2\xce\xe8\xa4/Q.\xf3bo\xa4A\
-\x90#\x00VP8 \xbe\x06\x00\x00\x94)\x00\x9d\x01\
-*\xa0\x00\x8c\x00>\x8d>\x9cG\x83\x01f\x9f\x00\x01\
-\x18\x96p\x87\x00\x19`\xb7\x17\xe9O\xf6\x8f\xc6\x9f\x05\
-\xff\xc8\xfeL\xf4P{\x1d\xc8\xc2<}y\xbe\x5c\xa0\
-\x9b/\xbf#\xa8\xd5\xe8~\x88\x7fb\xf0\xae\xf2_`\
-O\xe4\xbe\x8a\xdf\xcc\x7f\xcf\xffA\xf9\x8d\xed\x07\xf3\x1f\
-\xf1\x7f\xf8=\xc1\xbf\x97\x7f`\xfdz\xf6P\xf5\xb3\xfb\
-\x0f\xec\x13\xfaq\xff\xa1\x14\xadr\xf1\x90\xdd\x006F\
-\xe6E\xd7\xf6\xdd@.V\x09wyp)R\x06\xbf\
-|\xfc0#{\xd0\xce\xb6[r\x02\xe9\xb7:\x85\xd2\
-|\x14\x86\x13$(\x80\x0b\x04/5%;\xe7\xfd\xff\
-\x80\xd4,rR>|J\x81\x9c\x86sQ!\x16\xc1\
-/\x80\x94\xd6\xaaN\xbc\x09\xa9u\xa9\xe3F\x95#\x05\
-\xdf\xc8 \xbc&}\x0c\xe0S\xb9\xba\xff\xcaQ\x96\x9d\
-\xadI\x02:\xe8\xae\x88z\xff\xbd\xf1<\xa1\xaf{\xe4\
-j\xfd_\xa7\xe21Of\x02s\xd6\xc0\x08\xbe4\xe6\
-\xebt\xec\xe2\x85\xc3\x13\xa7\x8f\xc8-\xb0\x82z\x07\x92\
-\x13\x8e%*QS\xa7\xefa%Nw\xd4\xa6\x1f_\
-\xc9\xf7\xcd\x18c\x13\xa8\xf7\x00g\xea,0\xbd\xbf\x0f\
-\xc35\x7f4\xbc\x9a\xac\x1eS\xbe\xac\xabb\xe2M1\
-=\xab\x0c\x90\xe9\xf9\xab\x84\xf7>\x95Sn\xd0\xf5\x95\
-\x92\x04;q\x1e_m\xce\xa3C\x22\x05\x1b\xc1 \x80\
-\x00\xfe\x8b\xfd\x0c\xee\xa4\x1b\xa2|\x8d5\x91\xd0\x96)\
-\x0b\xddv\xb3;r \x9ao,\x16m\x9b\xa3`\x0b\
-\x85M\xd1\x8b\xa6\x12*\x19w\x80\x0e\x8dJ|Q(\
-\xd8\x12\x1e0\xb0\xaf#n\x85`5W\xe4\x97_\xed\
-\xc1\x04u_\x1c\xc8*\xb19Y\xe1\x11\xad\xf8aL\
-</E\x93\xbc\xb7\xb8&DMH\xa3\xeb\xf6\x9fK\
-\xdcN% z\xf7\x07\xbb'P\x9d\xef\xf8l\x96\xfc\
-f<\x84C\xee\xfb\xf42\x06.5\xfaQ\xfb'\x1e\
-*\x5cm\x5cX\xad_\xfd\xf1\xd1\xc8?\xaf\xeb\xbc\x10\
-P\xfc\x8c\x153\xbb\x0d/~\x96Tf\xcc\x18\x1a\x97\
-\xdf\x80\x8b2=\xee\xa2ek\xc0k\x11`\xd3\xce\xcb\
-q\x95\x12\xe6\x9a\x94\xb2\x11\x9cJ\x90\x01$F\xd6i\
-R\x12\x9b\x1eLk\x97\x8b<\x92\x9f\x11\xc8\x91\xb0\xec\
-\xd5~khUub\x9ec\xefg\xaav\xf9S\xeb\
-\x91\xf2n\xce<\xb76\xc7\xfah\x0c\x17\xcfx\x83\x06\
-\xbb\xf3d\xde\xe3A\x14-\x93\xc8\x99!z;\xebg\
-\xb4\xc5\xbd%I\xca<\xe9\xa8\xef\xf2\x8a\xfcf\x10Q\
-[LPs\x1b\xfc>\xff9\x17\xddJG\xad\xb3\xf8\
-::\xd9wH\xc09\xe7\xe4w\x87Nm\xf4hc\
-H\xd9\xf5\x9c\xc6\xf5\xe5S\xf3\x09\x1dm\x8d |\x9c\
-}\x99\xe4\xe9-\xce\xf7\x81\x9e\x90\x06\xb7_\x7f\xf2\x1d\
-G\x8fiZr'h\xf4\xa0#N\xc4X\xd7\xc3\x0c\
-\x1f\x0e\x86\x02&\xf0?\xc5\xe1\xfc\xbf\xba4\xdc.\x09\
-\xdb\x98\xa2\x9d\xdd\x92m\x12\xcc6\x00\x81\x0b\xa9k-\
-\xf5\x17\xdf\x10w\x1f\xd9m7Dq\x93\xa3\x22\xba\x17\
-\x0d?\xbc\x0a\x81\xff\x05\x01\x05w\x19\xedAs\xbeS\
-1Z\xdc/q\x8aR2\xe1u\xde\xa9\xfb\xba\xd6\xaf\
-\x93\xfe\x03~\x935\xa6\x05{\x9b34\x1e\x7f\xb8\xbf\
-\x8b\xf6\xac\xc3[\xd2\xca\xb2\xb3f\x90\x82\x0f\x87s\xfc\
-U\xed\xa2w\xe4?\x8c\x93\x17- \x0b\x02\x18\xf8n\
-x\x11\xf1\x14tP2\xad\xd7I\xee\x96\xcb,\xd5\xb6\
-\xe6\xbe\x18\x92\x04I\xbf\xff\x0df\x12\xee\xe2\x12\x7f{\
-\xca\xe5>\x83\xf9\x08\x85\xd9_\xad!j\xec\xe4oL\
-\x9ffX\xf2<l\xfb\xe05+\xe4\x1e1\x1ak[\
-]\xa6\x98C~\x8a\x0e\x19\x97Q?jg\x17b\xbb\
-\x0d\x8a\xb1l\xbe\x9dP\x18 \xea\x1e\xa1\xdd\xe6RA\
-\xc5@*\xe3\x1db\x9c0\xa6\xc0\x14\xf5\xbe\x0b\xaa>\
-\x9e\xfc\x9c!\x98\xac\x1da\x9913\xe9\xa5?\xd4t\
-\xd0\xe8\xd8\xc3\xa9]\xc9\xac\xde\x86}\x8a:<\xa1`\
-\xce\xb4;h\x93^\x90\x9dyl\xe2.\xbc)d%\
-9}\xc3\xa6\xd1\x8e\x19<8@\xf6n\x0b\x0c*\xb5\
-+y(}\xc8I\x85\x08\xc7\xbc1\x95\xbbC\xe7U\
-\x8c\xc6\x99=4\x0c\xac\xd9\x88\xdfM\xc2t\xc5~\xb2\
-A\x12\xae\xa7\xa6N#\x1cx\x8aAtW\xd3\xb0\xc3\
-\xf0\xb0A\xbcP\x12\xe1\x18\x1c\x1c\xbe\xe2\x22\xb9\x1d\x17\
-\xaa\xc0e)\xf9\xd85\x91\xe7\x93\x10\xe8\x98\xbd\xb7\xad\
-\xd7\xd8$A\x99\xbek\x0f\x87\xa4\xb5f\xaa\xa1\xae\x8a\
-\x96\xa6h0\x1b\x8c\x19\x99\x88Z\x00\xd2\xfd\xe2\xbf\x8b\
-\xd4\xd2\xfa{c\x91\x91\xfa\x91)\xfe\x10\xf5RWS\
-{\x97\xbc\xbd\xf3sd\xc5}\x84l\xd2\xc4Hy\xe4\
-\xfd\x9c@\xa5\xcd5\x00\x90\x18\xeb\xa5\x1c\x1e\x89\xe7n\
-_9\xf3\xae\xf1\xb8\xa8\x8b\xb8\x08Zf\xc4\xf4D}\
-)\x8a\xee\x04\x06QAm{\x0e\xb7;=KP\x88\
-\xa6\x10]b\x1f\xbbw\x1b\xbaD\xc5_/\xa0\xd9j\
-\xd9\xbfP:r\x89\xf62\xae\x8b8\x11dZ\x12%\
-\xfa\xfc\x19\xef\xde\xe5\x95\x1c{\xc1OA\x90\xd4.w\
-\xd9\xf8\xda~\xa6i\x8aG\xd7\xbf\xf6\xf7\xabr\xcc \
-\xf5Q|PD.\x13\xee\xc1\xe2XV\xc2e\x10\x07\
-\xb0\x86\xc5\x9f\xfdP?\xaa8\xd3\xa3\xe5\x93\x83p \
-\x02C\xfb\xc7\x93\x1a,(\xd9}\xbf\x9a\xe2\x1e\x88\xc3\
-\xe7]\xe6\x82\xd6\x12(\xa9_=\x0a\xb9\x8b\xae\x9b\x90\
-\xae\x89J\xfcu\xb1\x18]\x17\xf9\xd7\x9c<\xe9\x95\x08\
-\xff\xba\x07\xba\xf0s+\xc7P\xdc\xb5\xb6\xd7\xa1\x88\xc4\
-\x93\x1d0:24E\x83\x80e\xe1}y\xb0pT\
-\xc1;\xb2\x04\xaf~\xe5\xa1\x86\xed\xc8\xd0\xc8\xe4\xa8\xa2\
-.\xf9\x19P\x96E\x8a\x12\x0a\x8e\xab\x17\x90*63\
-\xc0W\xd8F8\xd5\xc1\xf0:\x0b\xd6\xbf\x8e\x18\xdc\xd6\
-\xaca\xcbJ\xc3\xa1\xa4n\x12\x10o\xca*\x12\xad\x83\
-<\xe5>\x13\xaeO?\x91\xd2Z\xba\xdf\xb5E\xa2\xcd\
-\xb3:!\xf6|N\xdb\xd4\xea\xbf\xc71\xac:#\xe3\
-i6Q|<zF\xf6g\x98MW\x99\xc8\x8a\xd4\
-\xb1\x9e`\xc0\xfa\x92W\x1cr\x99\xf8vG\x89\xca\x7f\
-\xb8\x892\xd7\xde\x98\xd5\xe1\x1e|\xca\x9fg\xab%\x92\
-\x05\x87\xa3\xe3\x08R]\x84E\x01\x88M>\x09\x96]\
-\xa6\x10\x9a-f\x13\x88\xca,\xea/\xf5\x7f\xa04\x18\
-a\xf0tb\x0e\xd5N\xb0oJ\x7f\x86#j\xa4\xad\
-^\x95\x18\x97\x17\xe2\xba:r\xb6\xe895\x1c#e\
-R\xbd\xd8\xf6\x10\xd2\xa4T\xfa\x95\x0f\xef\x9e\xfe\xdc\xa1\
-\x1dF[f\xc6\xd3*fj\xf09xw\x8e(\xbc\
-7\x80\xc5\xfe\x5c\xad\xcb\x9aV,\xbbX\x9c\xa4G\x92\
-$T\xc2Z\xd0\x98\xe1t\xbb\x19\x8eaK\x86\xc9p\
-=Q\xea5\xe9v\xc2\xd3\x01\xeb\xde\xa2\x0b\xb5\x9e[\
-\xc0\xa2\x95\x92\xd9}\x07\x85m\xe5GiR`\xc9\x19\
-H\x9c\x02\x9e=\xcd<\xb3\x99\xc8\xc8;\x11\xdd\xfe\xf0\
-b\xdc\xd9\x92\x1f\xa8]^\x82\xec)\xd2\xdb%b\x06\
-\x19\x00E\xc5a\xf4\xc5\x8aG\xf5#iE\xf2~\xf0\
-flG\xff\xbf`\x00\x00\x00ANMF\xae\x08\x00\
-\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\xc7\x00\x00\x1e\x00\x00\
-\x02ALPH\xba\x01\x00\x00\x01\x0f0\xff\x11\x11B\
-nm[u\xed\xc0  \xa4\x04\xb5\xf0B\xffi\xcb\
-\x91\xa14:p\x0b\x94@H\xa0\xa1\x15Hl\x90\xae\
-\xffN\x22\xfa?\x01\xe6\xff\xdb\xb7u_\xd7}[\xc7\
-\xb2\x8c]U\xd6U\xdc\xaa\x86_\xd5\x09\xab\xf6u\x07\
-\xdb*\x88\x8b\xf2\xba\x02iQ\x05\x165\xc0>\xac\x03\
-f\xed\x0eI{'E\xed\xd3\xe8\x80MK# H\
-\x19\xc9Ku\x94\x01'5\xecU\x01\xac\xd4q\x8a\x91\
-\x8fQ\x85\xa4\x81\x17\xa2\x94\x85\x06\x9bT!\x08Aj\
-B_\xb0\x09^\xaa\xc2\x0eN*\x10\x9f`\xa5,\x1c\
-`tH\xb7A\x9a8\xe0\x01qb\x1f\xe4%v\xb0\
-M\xf4\xfb\xca-a\xa2\x81{ZU\xfc\x9c?\xd5\xd7\
-p\x13\xe5\x85\xda\x92\xb0(+\xf67\xc5\xbc@\xfe3\
-\xe0&\xca\xa0>\xcb\xdf\xe7'\xea\x0b\x95\xb9\x06n\x10\
-\x9e\x96a\x9b\xe8\xb7\xd8\xfb\xe2\xc4>0K\xcc M\
-\x1c\x0f8`\x02\xd2m;X)kN*\x10o\xeb\
-\xe0\xa5\x0a\xdb\xa2&4\x083A\xd8\xa4.T\x88\xd2\
-\x0e^H\xd2!\x94\x19\xc0\x09(Y\xc9\x80\x15\x0a`\
-\xaf\x0c\xe0\x84\x0a\x18\xc5\x0bM: \x08\x1d\xd2h\x87\
-(\xec\x10\xa5$\x1cR\x07\x04`\x1b5\xc0\x0e\x0a\x10\
-F\x15\xf0\x83:\x17\x06\x1d\xf0\xa3\x02\xc4\xc1\x0e\xb8Q\
-\x06\x18\x00\xd8\x919\xb9\x8br2\xe2\x01\x84\x8b\x06$\
-e\x07\xe2\xc5\x01D\xa5\x03XcL\x06\xd8\x94v\x0a\
-\xc6\x98~\x0aJ=aM\xe6\xec\x95r\xc1w.\x9d\
-\x92\xaf\x86V1\x13F>\xa4\xa4u)jM\x0aZ\
-\x95\xbc\x96%\xab\x19\xc9L\xeeB\x9ci\xc26S\x05\
-?\x93\x05;c\x8eA2\xd3m\xb0\xcd\x95\x81\x9f3\
-\x03\xb3\xb0]l+\xf2\x85[a:\x10\xcdZ\xc0.\
-\xfa\x8b\x0eVP8 \xd4\x06\x00\x00P.\x00\x9d\x01\
-*\xc8\x00\xc8\x00>\x91D\x9bI%\xa4\x22\xa1,7\
-H\x88\xb0\x12\x09in\xdd_\x95\x04\x9f\xfa\x17\xe3W\
-\x80\xff\xe2\xf9ge\x98{\xdfM\x91a\xc8\x13\xbd;\
-\x0d\x0c\xa6E\x8f\xdb<\x08\xbc\xef\xd8\x03\xf9W\xa2?\
-\xf3\xff\xf4\xfc\xa0\xfec\xfe?\xffO\xf9\xcf\x80_\xe5\
-\x1f\xd7\xfd!\xfdv\xfe\xe8{\x04\xfe\x8d\xff\xff%\xc1\
-\xe6\xd3\xfe3m\xfbO\xf8\xcd\xb7\xed?\xe2\xe5\xd7]\
-B\xcfg\xda:^5T\x163m\xfbM\xc7@\xb1\
-&Zk\x02\xa7L\xa4\x9e\xdf\xb1\xa8\x00q\xf2\x0cz\
-\xf5\xb3<\xe9\xad\xc2\xf4M\x18\x1f<F~GU\x91\
-\xfa\xb4~\xdd\xd9\xb3/\xaa.;-\x7fk\xbd`\xeb\
-\x8d\xa3\xd8wVd<v\x22^\xf6k\x9d\xa6\xe8<\
-\xba\xc7\x80%?k\x9c\xdd\xfe^5\x13\x97m\x19\x0d\
-\xc6e\xb0\xe6\x1b\xed\xe0b\xc8\xa5\xad\xd5\x04\xc8p*\
-\x17_\x9f\x84\x07\xfe\x16\xa4\xdbl\xbf\x83\xc5\xcb\xfa\xe7\
-\xbbq\x13'G\x86\xab\x8c`c\x17\xf3\xf0BC\xed\
-\xa4\xd7d\xae\xf0X\xb7\xb8\xfd\xbc\x9a\x01\xb5\x069\x17\
-HhPG\x0f\x8bW>>\xe9\x02\x03\xa2#\x85)\
-d\x10X\x5c\x8f\xaf\xe7]\xa2\xca\xcb%\xd9;5R\
-Z\x92s\xdf\xf8\xb9\x04\x0e\xaal.\xa05\xb0\x94E\
-3\xdf|\xd1\xc1\x19\xaf\x06)\xe4R\x82\x8d\xb9\xd9\x19\
-%\xd7$\x9f\xdb\xc6m\x5c\xc0\xb1sTI\x19\x84\xab\
-A\xbe\xad\xee\xff\xfdF\xe3@F\xa3=\x85e\xb16\
-\xdf\xb4\xff\x8c\xda \x00\xfe\xf9|\xcd\x04v\x00c5\
-\xdc\xa2\xa5\xa2m\xdem\xe4\xc1-]\x06\x9a\x9a\xe0\x1c\
-\x8d\x05_1\xacbZnD9um\x1b\xe9\xdf\xea\
-\xb8\xc1\xd0C[\xb7|g%l\xa0(\xfc\xdc(\xe5\
-\x07\xfct~\xfc\xffY\x0b\xf5A$v't\x0c\xef\
-+\x98k\x1b\x00\x10\xed\x8bod\x94\xd4\x98\xa2\xcf\xa6\
-\xc5x\x07\x8a\x0c\xb2a>1\xf0\x90\x11\x0eU\x13\xcb\
-4\x05f\xee!\xd5\x01_\x85\x80\xd0\xff\xe7\xf4\x99\x80\
-\x8c_\x15\xb3\x19\xe1?\xb9\xdbL\xef2j\x82\xc1(\
-\xdb\x95\xbb7\xa4%\xc3\xd6\xe5\xc0\xed\x14\xde:3K\
-\xc3Q\x89\xea\xff\xff\x89\xc3\xff\xc4\x82\xff\xfe D\x1a\
-\x9bR\xb4&\xc8\x1d\x1a\x8e\xa6\xc5\xd0A8\x1d\x96\xd1\
-\xa5\xb0#\xe8<!c!\x85\x1e\xba\x87\xdd\xf0\xdb\x00\
-+\x85\xac\xf8;e]\x1e\x04\x8b\xd9S\x09\xd6y\xa6\
-\xe1l\xe5\x07\x8d\x1ci\x97+\xf49\xf6y\x92\xf7i\
-\x9e\xf7\xa8O\x89]\x94\xe9\xe6m\xf4\x81@p\x12\x19\
-H\xc7\x95Jh\xf7\x19cL\xb7\xcbg&\x0e\x812\
-\xc4\x1f\x08\xb4\xb7F#!q\xcaX\x9c\x06\xbar\x09\
-\xc8n\x8f\xef l\x9e\x83\x07\x8a{\xbe\xb4yRq\
-\x0d\xc8\x9a\xbb\xf3\xcd\xad\xa23\xa1\xe4\x0cP\x88J\x14\
-\x99q\x8b\xc1X\x1a\x92\xdf \xb4O\xc4\xfa\xda)\xae\
-P\xbbumW\x0f\x91\xfbEL\x9e\x12H\xd9\xfe\x04\
-\x96\x0d\x1b`\xd1n\xb8\x03u\x82\xacp\x08\x16\xb9U\
-l[D\xc0\xcbY\xf7W2\xa0O\x93\xbeF\xad\x8b\
-\xf2\x01\x80\xae\x06\x95^f\xf0y\x7f\x09\xb1S\xec\xb6\
-\xc2h\xfd\xac\xd9\x06\x81\x87\xe3x\x93\xad\xa78I0\
-\xc1\xb8\xa2\xdem\xfb}\xb8\xea\xb2\xc7\xc4eA\xfde\
-ab\xe7\x94H\xae\x11\x8a%\xd3\xd3\xb9\xd3o\xb9\xd9\
-'\xe1A2\x04\xc1Y\xfc\x00\x95xCgi<\x04\
-\xacF\xaaj\x90l\xc3r\xd8\x84;\xe1\xdc<9\xa1\
-8\x16:W#\xf7Y\x91s\x86\xbc\xb8qW\x9bN\
-\xd5g\x863\x9e\x91\x0b\xe5\xfb\x94}\x22\x13;\xa0\xbc\
-MQ\xe8+\xcal\xc0K\xa5u{\x8eNd*3\
-\xf1\x0a\xc2\xf6Q\x87\x07G\xc3\xa3\x8e\x13\xd9\xfc\x0cl\
-oZ\xa1}\xb2v\x15\xfc\x84\x82kH\x04$\xea\xf4\
-\x9ew\xcb\xe6\xc02\x15\x97\xce\xc2,G\xc7\xb5\xb7\xc4\
-\x07G\xb6\x8e\x95j%\x09\xc3\xb6\xce\xe6\xcc\xaf\x19r\
-o\xa2Uz,\x06N$\x94[\x84\x92\x00\xd5\x00\x0c\
-\xb2\x01\xa4\xccyq\x0fA:\xd1\x08K\xff\x04:\x15\
-\xdf0%\xa0\x98\xd4\x1b\xc4\xa3\xea\x05\x9eS\xc29\xd9\
-\xe5\xfa0\xad\xe0\xce\x1e\xdb\xe6\xd2\x96\x0e\x89\x90\xa2\xe2\
-\xae\x04gr;L\xdc9\x02\xb8\xa1\xc7}\x1d\xf3N\
-\x81\xcd\xb6o\x0e\x04\xc1s\xcf\xab\xff.P\x95\x9c\x11\
-r]\xc2u\xeez\x14\xb4\xf2\x0as]\xa3\xd5\xa37\
-)\xfegqD\x01\xdd\x0b\xab\xf8^Q\xcf\xbb\xf5\x0c\
-#\xb8j{'\x16\xf5\xf9*\x8dA\x90_r\x84\xf8\
-U\xb9L_\x97n\x15\xb1\xfe\x12)UA~7\x09\
-z\xff\x1e\xe8\xa5\x19\x15\x04\x9c\xb5\xe7G'\xd0\xe0w\
-\xfc4AN\xb4\x9a\x19e\xde?4]\x11\xf4\xf0J\
-\xd6\x5c\x91\xf1\x12\xcb\xedV\xd1\xd7\xddQ\xd6y:\x17\
-\x9d\xed\xa14\xec\x0bXU\xe2\xf2b\xe5\xe4\x00\x041\
-i\xd8\x1c-\xc9\xf7\xd5\x08-\xdeC3\x00\x0c\x90\xa1\
-\x13}\x06\x8du\xd0\xcb\x81\xa0\x94{\xfb\x98\xa2f-\
-mc\x89eG\xbc\xc6&\xaa\xefC\xf9[\xdc6i\
-9\xed\xb9\x12\xa2\xbb\x0d\xb1\x04\x12\x8e\xb5@g\x896\
-z\xf1\xd0\xdc<>\xfb\x1d\x8be1\x84\xd9\xaaW\x0c\
-\xeb\xe3>:\x5c\xfc\xcf\x180Bb\x8c\x88\x0c\xe1L\
-0\xc1\x0dGA8\xe0s\xcc?\x0e\x04\xfaVJz\
- \x96\xb3h\x15\xdc\x94\xe6\xea\x07\xf8\xa2\x0ce\xe6p\
-\xd00\xf5Pa\xcc\xaa\xd4B\x10\x02\x06b\x91%\x83\
-\x94\xf7\x0bw\x87\xb2\xc5\x9c%\x0cTp\xa9\x85A\x91\
-\xaae[\x8c\x1c\xdf94\xb8-G\xca\xb6\x05\xac\x22\
-\x02\x84\xb4\x90\x87\xc6\x84{Y|\xf9\xa8\xe4%`0\
-\x0a\x13\x00\x9ebG\xb7\xbesPH&J\xfb\x87g\
-\xac\x1f\xef<\x9e\xf6\xea\xb2`\x95\x89S\x9f\x89\x83\x8d\
--\xa8\xaf\x0d\xda\x89TnAb\xb0\xdd\xd6d\xfe\x95\
-\xd0\xd8J\xf5\x17\xd3AUE\xd7\xac@\xcbI\xe8\xe9\
-N\xee \x95\xe7/\x02\xadI\xd3\x00p9\x92\x97\xf6\
-\x1a\xb7\x22=\xbf\x9a\xb9\xa4\x11\x13Y7\x91\xb8!\x84\
-\xd0\xbf\x17\xc1\xba K\xf4c/\x84\xd7\xf1\xdeE \
-\x93\x05\xe3\x15\x13\xd3\x0b\xd9\xb1\xd2s\xdc\xe1a\xb6\x19\
-N?m\xe0\xd8\xb6\xe5\xfe\x1f\xc2\xfcSQ\x01\xbdy\
-_\xa1\x98\x9b7\x22\x91\xfe\x929\xf0\xfbz\x04\xc1\x8c\
-d.\xa4\xab\xb0\xe5\x1f\xdb\xf5\xc4\xc5~\x93Q\xe8\x5c\
-,\xf3\xe2\xc37\xd1\xff\x1d\xa9n{\xb6\x81\xdf\x13{\
-t\x08E\xda345\x00(=\xdc-h\xff\x8c\x04\
-\xfb\xd5\x88E\x1d\x91\xe0\x19\xfd_\x02\xa6\xe0X\x0cO\
-\x96hWL\x95]u\xeaa\x91tV\x1b\xcfJ\xff\
-\x5c\xc8{j\x89\xc6/\xdb\xdc h^\xe5\xe0W\xf7\
-]\xc0Us\x08\x09^\x05O\xa2\x9f\xf4I,#d\
-\x22.\xdfa{\xde\x98\x08\x04O\xb7\xdf,\x0a`\x98\
-G\xccvZQ\x08T\x94\xf85}&\xd7\xe9\x1bQ\
-6\xca\xa8\xcb!D\xc1\xda\x18\xb1\xefp|\xb8\xb7\xb8\
-\x8bN\x8bN\x17@\xea\x8f\xa4B[\xb6\xf1\x93\xf6A\
-\x87\xadf\xe8\xcaJ\x0ft\xea\xe2\xe3\xcej/d]\
-e\x05\xde\x02\x08\x88\x94\xbeF<\x00\x00\x00\x00\x00A\
-NMF\x00\x09\x00\x00\x0a\x00\x00\x0f\x00\x00\xa0\x00\x00\
-\x95\x00\x00\x1e\x00\x00\x03ALPH\xb6\x01\x00\x00\x01\
-\x0f0\xff\x11\x11Bnm\xdb\xb8p\x1dCpC%\
-(E+\xaf\x8c\x97Q\xda-E\x09B\x81a\x058\
-\xce\xf7\x9fF\xf4\x7f\x02DD\x8a\x17\xcb\xf71i\xc1\
-\xa4\xdb\xcch\x82I!YT\x9bF\xb6\xe86\x03,\
-\xa6\x0d\xe0\xee\x0a\xe0\xef^\x9b\x0a<w\xcd\xa6\xdb\x0c\
-\x9b\x09\xb8; \x8bI\xba+@\xbc{\x81\xc7\xc6\xdf\
-U\xc0\xdd5@L\xb2A\x87d0 \xda\x04\x83\x09\
-\xcf\xc5\xbf\x9d\xbf\xf8/\x22\x80\xbb\x98;\xd1\x17D\xca\
-\xdd\x8b[\xf2E\xc3\xc9\x0b\xe9b\xe0-\xc0K\x85\xa8\
-{m*<K\xd0\xb5\xa5\xc1\xa3\xab\x10>\xc0\xeb\xde\
-\xa5[D\x83rp\x06\xc3L.!}\x9a\xb9\xc9w\
-Y\xe6\xa7J7\xe3\x93a\x81@\xbc\xe9\x7f\x90\x06\x0e\
-\x82\x81@\xfc\x14\xfd\x97\x95n\x06\xc8\xb4\xc8\x9f,\xdf\
-\xccO6\xee \xc9\x80O\xd3\xc1\xe9\x8aY\xfc\x00\xaf\
-{\x97f\x11\x96GW?\xa0B\xd05x\xac^\x88\
-\xba~H\xba\x01\xde\xaa@\xd6Mp\x06,\x02\x5c\xc9\
-\xc6i\xcan\x82\xd7\xbc\x90w\x8f\xa6\xee\xc6E\x83$\
-\x22\x1d\x82\xa6+\xe2E\x14\x91\x06I3!\xec\xb2\x86\
-]\x05\x14\x05xD\xe4\x05\xfc\xe9\x05\xfc\xe19\xd5C\
-\x01\xc2\xa9\x01ND\x04H\xa7\x01\xc8:!\x9f\xa6\x8a\
-C\x01\xf2f\x00~\xf7\x02i\xd3\x81\xb0k@\xdc4\
- \xed\x06\x106\x15`\x07\xf0l\xde\xc5/US\x96\
-\xb8\x8c\xc5odAD\x0a\xab\xec\xe7\x12E\xfa\x92\x0f\
-c!M\xd6t\xe8\x9bc<4]8T\xdds(\
-:\x7f\x10\x9d\x9c\xa7&+\xba&)\x9a&(^\x8d\
-W\x88\xc6i\xe6)\x8b\xb6\x9f\xa2\xaa\x9e\x1e\x95\x9c\x9c\
-n\xec\xb2\xe8\xeb.\x5c\x94\x9d\xbb\x90\xbe$\xb9-\x8b\
-\xbf\x92\x06A\xceVP8 *\x07\x00\x00\xf0*\x00\
-\x9d\x01*\xa1\x00\x96\x00>\x8d<\x96G\xa5#\xa2!\
-2W\xd8\xb0\xa0\x11\x89gn\xe3\xb0\x01Ybd\xc4\
-4\xf1/\xf8\x0f\xc4~\xff\xff\xc0\xf0\xadn\xcd`f\
-\xfaw1v\x05YM\xf9\x1dC\xbb\xfb\xcf\xd7\xf9_\
-\x06\xff\xa3\x7f\xba\xf6\x00\xfeQ\xfd\x8f\xfd\x97\xb2\xb7\xf1\
-_\xfb\xbf\xc2y\xb8\xfc\x97\xfc\xaf\xed\x17\xc0\x1f\xf1\xff\
-\xeb\xfd[?g\xfd\x85\xbfX\x7f\xf6\x9b\x9f\xc5!\xc2\
-\xf9R\xc9\xaa\x80N(\xe3{\xa4\x98Rb\x22\xb9\xe9\
-o$\xb0\xc4hl\xd0\x9a|\xe2\x11\x15Y'\xd4\xc8\
-T\x037s4h.\xd5\xb8)Y\xa8\x0a\xed\xa6\x92\
-\xf7\x91\xb5[\x91\x9b\x10W}\xd6\xad\xf4O9\xb1\xdf\
-0Nc\xb3[\xd5D\x8b\xd7U^\xb5GD\xc7r\
-R\x08}\xea\x9eJ;\x02,N{\x16\xa1\xcek;\
-\x90\xa3\x8b\x80\x97\xda\x18\xdc\xe83\xf0\x10nz\x14\xf1\
-\xaa\xce$\x96\x9cw$\x8f\xccL\xb3\xe7\xe5\xea\x22\x0d\
-\xebPo)k>e\xa0\xf3\x0b\xf0\x94\xccC\xf05\
-k\xd1]\x8aq?S\xc1\xc7\x1bUi&Wc\x80\
-#\xda\xc3\x16.\xcf4\xf3H\x00'\x89P4JO\
-o\xc3\xd6\x1fY\xb6wz\x0c4\x0d\x1f\x22N\x88\xb5\
-y\x91Y^om|\xc4{\xafv\x89S|\xc1>\
-\xff>\xaa#\x82*\xc2>\xb3abWj@/2\
-\x15A\x99\xaab\xc9\xcem\xe4t6\xcc \x00\xfe\xfa\
-\xd9\x09\xa3\xd0\xee\x88\x03c\x83M\xf6\x19\x83\xca\x81\xac\
-\xea]B\x0d\xbdM\x05\xc5\xff\x7f\xa3\x7fYX\xc0{\
-\x05\xa3\xd5~\xf8|\x86\x0f.Ph\xd1\xd4\xbf\x22\x08\
-\xc5k\xbfa\xf2kx^\x8a\xb9\x0aW\xdd\xcc\x22%\
-\xa6W\x0a\xc8)\xda)\x0b\x95p\xd8j@\x22\xe5\x0d\
-\xfb$9\xa3\xf1\xe6\xff\xff\xd3\x1b\xff\xb3\xb8\xff\xfd\x99\
-({\xbcx\x9c\xff\x95\xe7\x17\xbd\xff\x99\xd28\x00D\
-b~\x8a&\xa9\x19ic\x0c\x1a\x14\x98\xb6\xa4#\x86\
-\xfb\xecX\x86\xe7\xdc\x9a\xd1\xfaw\xca\x03N\x0f\xf5z\
-\xd3\x8e\xa5\xbd\x16M\x06\xb3\xe5S\x0a%\xbag\xb8\x95\
-\xe6\x8f4\xdb\xf3\xeb\xa7F]\x22=\x92\xe3E}\x0f\
-\x0b\x14|\xa4\xb9\xbe\x16\xb5M\x11\xe1\xfbaZ\xc0\x87\
-\x14\xcc\xed\x8fs\x96\xe6*\xbeW\x1d\xddS\x89\xc8\xb4\
-\x01}\xb0a\x8c\xaat&C\xf7\xcbY\x1d\xe1\x90\x15\
-\xddL\xe8\x00\x01k\x1d\xdelJ7\xc4I\xb0\xa2\xb6\
-\xadf\xb2\xd4o#\x899\xee\xb4\xdd\x07\x03\xf3\xdb\xbd\
-\x0a\x83\xd5\x10\xc17\x88\xcd\xb8\xb8Z\x9d\x11\x04\xca\x97\
-Oa\x98E\xb6\xd0\xdb\xa2\xf6\x13\xf0\xfd\xe6\x12\x01\xc9\
-\xd7x\xa7+\xecco\xd3o\x91Z\xf9\x96\x9a\xdb\xe3\
-$\x9d\x8a\x1e\xa2\x92\xcbU\x13\xd3\xb3P<\xdd\xc0l\
-\xdc\xd0\x1d4\xfd\x872f\x7fJ\x18{\xa1es\x9a\
-:\xf8\xd7\x96+\x19\x81\xb2@\x9d\x8d\xb2\xcf\xc3,f\
-W\xe8\xcdI{pN_\x9d\x0d\xd8\xbbw\xaf\xc5\xce\
-\x05\x03Cz\x8f\xb5<\xa1\x1b2}\x80\xbb\xbc\xd4+\
-I\xd5\x87J\x18fA\x12\xf9m\xb5\x5c\xef\xed\xfc)\
-\x8b\x22\xba\xf8\x99\xe9\x7f\xe2k\x7f^Q\xf8\xfb\xef\xb9\
-\x19\xcd\x07\x12\x03\xfc\xaa\x89\xd7T%\xd2$\xcco\xe2\
-\x023\xaf\x9c\x88iq-z\x9b\xfb<\xf8g\x1f$\
-\xf0\xbd\xde(\xcc\xfa\xcf\xd2>uH\xec+\x87\xedK\
-Vi\xb8\x01\x17\x9f%\xc2p\xbc\x16\x87\xc7Fv%\
-\xa6\xacf\xe0\xb6t\x98\x0aV\x16\x89v\xc6\x8bfa\
-\x9c\x01\xbdg\xf2\xe5)\x98cW`n\x80\x82\x8a\x94\
-\xac\x7f\xce\xe58XvI\x0c\x18>9\xf9\xae\xcfB\
-\xa9s\xb2^\xa1\xf9\xab3\xf4?|U\xf6t3\x1a\
-\x86,L\xecAm\x18\x1b\xafB:\x1e)\xd4{\xbc\
-\x11\x91\xec\xdc\x0b\xcc\xb5@\x92\xa3)'\xe1l\xaf\x90\
-\x86v\x08\xf8J\xb0\xd8(%\xb7\xda\xe0\xe0\xd7\xdcc\
-\xb8Fr\xa3sOE\xf9\x97\x09E?A\xf39\xfc\
-`[\xaf\xbd\xd0\xab\xff\xff0)\xaaI\xe6\x02O\x81\
-\xf7]\x15\xed\x97/\x18\x1a\x11A\x1cu\x07a\xe9\x17\
-{\xcc\x06\x99\x05\x0a\xd1\x9b\x83\x0dc\xc5y\xaf\xf7H\
-\xc8\xad\xe5\xe3]\xf1\xd3\x15\xa2!\xaa\xfe|\x92\xceE\
-!\xad\xd5\x08\xd1\x9al\xeb\xcehU<\xdb\x918\xf1\
-:6\xed$:\x222;cr\xfb\x86\x17\x064\x8a\
-\x12\x11\xd6\xd51\x7f\xdf\xd3\xdb\xdc\xf8\xf5\xc7\x9b\xfe\xa5\
-\xd9\x9d\xff\x86\xad\xb7p\x06\x87\xef\xc9\xc2r\xcf\xb7\x1f\
-\xf7\x15h\xfb9\xca\x97V\x1e\xebb\xe8\xbc\xd8h\xcf\
-\x07W\xd0\x0b\xe8y\xf4\xfd6Z\xa0F\xfc\x05(o\
-Ykx\x05!\x96\xe8\x81\x95\xb6nB\xf2\xfc=\x0f\
-J\xe2\x98\xa6\xc6\xed?U\xbc^\xc4\xceGp\xba\xfc\
-\x80\xd7\x9av\xd7\xa7\xfd\x93+\x08\x10\x8e\xb4\xdf\x1d\xd6\
-\x1c\x97\x0c\x11\x81X\xb2]qHYH\xfdQ\xae\xa8\
-q\xa6\xeb\x9a\xf6\xadx\xd2q\xb0\xfc\x8b\x11\xe1\x9d_\
-m\x17X\xec=f\xfe$L#\xcd6\xd6\xf2\xd0\x81\
-o\xe7!\xfd\x0fd\xd0\xda\xf5zr9\x19\xe3\xb1\x01\
-\xed\xdb\x94\x9a\xa8\x1d]\x97jo=\xdc\xd3Yk{\
-\xd3t\xf6\xdfI\xd0]\x8f\xb0\x22\xbe\xd6\x89\x82m=\
-\xcd#U\x1f\xa8T\xb2\xab\xc1\xa4\xe8\xda\x8f\xf3+F\
-\xed/\xe8\xa1\xc4\xb7\xbf\xd0\x11\x1f4\x1d\xc4\x9dC\xb0\
--i[\x19\xfb\x22\x08\xc0\xdb\x00\x9a\xed8\xb8\x1e,\
-\x9f\x9b\x0c\xfa\x80\x9eE\xff\x07V\xd6\xdd$ @B\
-\x85\x17\xcd\x81\x0d\x91:\x1e\xbe\x22\xe9b\xce2o\xba\
-x\xcf\x94,\xfbl\xbc\xcdT\x932d2\xbc\xc3\xa1\
-\xecx\xdc\x11\xb8n_c\x83,\xeeC\xca\xa5PF\
-\x08z\xfb\xd3\x91\x8f\x92\xcf\xa6+\xd5\x90\x13}]X\
-\xc94j\xcfb3f\xbf\x9f\x8a\xf6\xd1\xe3\x1c\xcb\x18\
-Z*\xe47I\x13-\xd5\x11i\xa8\xaf\xef\x0bH\x05\
-o\x08\xbb\xa6\xf1\xb9\x0e\x9a\xd5T\xae\xee\x14o\x1a \
-q\xa2\xc2\x9eZ-m\xa2\x08\xcc\xc7z\x00\x86*\xf7\
-zC9\x1c\xdf\xd9\xa2\xab\x0e\x0d\x9a\xadB\x0b\xf8t\
-@\xfc,\x5c\xba\xdc\x80\xe4\x07\x22\x863\x01\xbd\xbf\x81\
-\xbe\xfc\x86\x9a\xf3\x06FD\x8f\xb2\xb9yz\xba\x9aR\
-\xda\xfa\xb2\xb6gc%\xf1\xe5S\xe2\x07\xf3\x0d\x18\x08\
-(\xa6h\x8e*\xf5\xf7\xbf&\xcd\xe6\x05`{\xfc\x0b\
-j\xe4\x9f\xe3\x18\x0cG\xa0i\xa6\xd5\xa1t\x80\xb1\xcc\
-\xbfOY\xba\xa8\x06\x14\x873\x86\xf5\xed|\x16+R\
-\x08}\xb0G\x05-\xfd\x8d`5\xf6\xbf\xcfN\xe2f\
-\x95O\xb68me\x83\x8e\x00;\xa3\x99\x0ey\xee\x11\
-}\x90\x8a\x95A\xf9\x84\xb4\xaf\x89\xa7\x03|\xf6\xdb\x1f\
-)\x1fu\xf1\xd0\x0fq|\xc34\xddey\x93\x10\xa8\
-\xf4\xbf3\x00b\x00\x1e/\xf0\xabtp-\xdc\xcaQ\
-d\x03D\xd7er\xc1\xf26?\x11.\xd7\x92eV\
-\xbeW\x9cu\x02H\x0b\xd8\x10\xa1,J7\xc4HI\
-\x80\xf3\xbb\x8am1\xa6\xbb\xa62\x0c\xefz\x0dY\x9a\
-c\x91\x18V\x08\x18\x03B*\xc5\xb0\x01\x05&\x8b!\
-\x10jql&\x0c\x88\xfa\x9fv\xdc\xdd\x05\xa8\xdc\x9a\
-\xae\xda\xedV\x09\xc5\x16\xd4\x0e\xc5\xcf\xfd\xea\x92Y\xd5\
-\xf5u\xb5\xf6o\xf8v\xf4\xdbg\xc8\xc0C\x93\xcc\x1a\
-\x09\xabL\xa0\xd4\xeb\x05?2\x84dM\xed{\xe5\xb7\
-\xcb~j\xb9\xc2\xdd]Ur\xfa\xec\x85\xd6\x99\xf2H\
-\xa5-\x92\xab\xf3\xd9\xca\xf4\xff\xf8H\x1fM\x044\xa2\
-r\x83<\x12\xd6\x09S\x80\x82\x19\xca\xba\x95\xcf\xcb\xc5\
--\xae\x08\x80\x00\x00\x00ANMF\xa2\x08\x00\x00\x0a\
-\x00\x00\x0c\x00\x00\x9f\x00\x00\x9b\x00\x00\x1e\x00\x00\x00A\
-LPH\xac\x01\x00\x00\x01\x0f0\xff\x11\x11Bnc\
-[u\x00=di\x1dR\x02\xa5P\x1a\x94\xe6R(\
-\x81\x90\x00q\x02\xe0\xbd\xb7\xff4\xa2\xff\x13 ?\xf1\
-\x87G\x8d\x1e\xcde\xb8\xac\xe4P\xf1\xf8\xc8\x0e\xdde\
-\xb8,\x8a\x03\x1e\x1f`k.\xdde\x00\xc14]\x16\
-\xf0\x98\xf0\xa8.\x9fK\xdb\x82\xa5\x03Y\xac\x03\x88\xa6\
-\x09\xbc\xa6\x05\x04\x8f\x22f \x9b*\x90L\x1f\xf0\xba\
-<\xa6\x06\x04S\x07\xc4\xa3\xd8\x06d\xdb\x84\xe4\x12m\
-\x0b^\x97\xc7\x06\x04\x171W\xafb\xfb \xff2\xc9\
-\xd6<~4\x88\x96\xfavx-=z\xcc\xed1T\
-\xe2\xb05\xd2\x80`\x98.xT\xc8\x13\xc4\xf8K-\
-\x8ae9\x15\xafl\x99\xbf\x12\x1e8\x8c-\xfd\x0f\xf4\
-\xdfj\xfc\x1be\xcb\x84\xe5Q~\xa5bY^\xf3W\
-\xc9\x13,\xfc\x84\xa0\xab\x90\x87Gr{t\x1f\xa4\xee\
-\x11;\xbc\xba\xe6\xd6 \xea:\xbc>\x1f$\xdd8e\
-\xdd\x84\xc7\xa7B\xd1-\x08\x15\xd0\x01A<d\x0b\x9a\
-zX\xf0h>(\x87W\xd3\x0e\x13\xa2\xa6C\x16\x19\
-\x86qK\x9a\x09I\xa4C6\xc4C\xd1ph\x80\xa2\
-\x02\xaf\xc8\x07<\xb7O\xf3\xde\x1a\xf0\x88T \xde:\
-\x10D\x04H\xb7\x09\x88\x88,(\xb7\xa5!\x9c*P\
-\xb6\x09<\xa7\x0f\xc8\xdb\x00\xe2\xa9\x03i\xeb@>M\
- n\x0d\xe0\x04\xf0n\xdf\xf6lm{\xb6\xba\xa5m\
-na\x93\x8d R\xd1\xac-\x89\x8c\xad\xc8qn$\
-\x8e\xf94\x0e\xd7t\xea\xbaxj\xba\xf7Tu\xcfI\
-tr]\x9ar\x1b\x9a|\xeb\x9ax\xfb4\xcfM4\
-A\xb1nE\x94\xe3\x964\xed\xf6j\xea-hd\x9e\
-\x8a\xa8\xdb)\xea\xea)\xe8dlY\x8cu{,\xd2\
-!\xc9\x15VP8 \xd6\x06\x00\x00\x14)\x00\x9d\x01\
-*\xa0\x00\x9c\x00>\x91@\x9cG\x82\xdd}\xa4\x00\x01\
- \x96\x96\xee\x0c\x00\x06[\xbd\xbf\xfaO\xfdW\xf1\x8f\
-\xbf\xef\xf3?\x92\x9ds\x9e\x91\xf6s\x94\xa4y\xbbg\
-}\x99F:\xa7\xf8\xdd\x22\xfe\xbe\xf4'\xfd\x9b\xc1\xf7\
-\xeb\x9f\xec\xbd\x80?\x8bz,\x7f#\xff?\xc9\xf7\xe5\
-?\xe1\xff\xf4{\x82\xff-\xfe\xbd\xe9;\xebC\xf6g\
-\xd8O\xf5k\xfe\xd2\x0e\xa2\xf8\xce\x0a\x17\x1e\xf1\xff\x94\
-p\xe1\x8d?\xb5\x82f\x94W\xb2\x7fu\x06k\x96=\
-=\x22\xb8\xc3f\x83\xa9\x19\xbb\xc0!J\x14\x92\x00\xfd\
-\xa0S\x13x\x95hB^\x9c5\xd7y\x99\x13\x1eC\
-\x16vf=-m\xff\x94\x08A\xec\xac\x1d?\xed\x88\
-g\xec%b\x128\xe0e]\xd2\x1d\xf7\xc5\xb6\xe8l\
-a]^\x88N\xc0\xd0\xd2H\x96\xde\x0e\x8cTX\xe9\
-e\x08\xa6\xfb\xd5~\x1b\x9b?P\xbcP\xe6\xa1\xb2\xe6\
-\x9eB\xe1\xf9\xfb\xab\x86\x16V\x1b\xd3\xe2\xb0\xd9x\xad\
-}\x8d`\x97\xb95^\x00u\xfbN\xdb\x88*D\xa5\
-\x86\xd8\x01\xbcw)\x02\x01\x07A\xb9{\x9c\x06\x9e\x9d\
-G.d\x82\xd6\x86J!\xe7\x16\x1e\xc0*\x06\xcc\x1e\
-\xc8U\x1f\xc9\xe5:\x06\xb3)\xf4\xf7\x9c\x17\x18\xd5A\
-\x19\xb5\xf9'\xb5\xff\xe6}m\xf3^\x18\x7f\x1e\xcb\xd1\
-\xd9\x97\x090SV\xd7^[\xb7g\x90\x00\xfe\xc3P\
-\xadR\x8d \x97\xaac\x10\x05?\x82\x07\xef>\x18\xcf\
-X\xac\xecE\x85\x14\x81_\x8f\x88\x14\xb6T\xf8yO\
-\xc71\xf9\xe4;CZe\x5c\x01\xa1x\xb6HL0\
-=\xf6\xf4\xd5\x93\xa0^P\x126e\x0a;\xe6\xfd/\
-\x134\xde\x0e\x91\xfd\xbe\xc4\xe7xJ\x09\x93\x7f\xee\xfa\
-\xaf+\x22\xe4exG\xceD~=2\x06\x0eNi\
-\xf7|\xec\xc1\xff\x87\xae\x09\xcb\xfc\xa1\xe9\x96l\xd1\xbc\
-\xa8\xcd\x8bN\x9e\xc4\xb6\xa6N\x0d\xd7hZ\x03\x1dy\
-\xf0\xd4\xe8\xb5j/}\xb7\xee\xde\x80\x0ay1M*\
-\xd5\xaca\x99\xe7/\x9f\xa9\xaf_\x80l7@g\xd3\
-\x80\xb4\x95\xcf\xdd\x1a#\xd7R\xd2\x0a\x96\xceP}\xa7\
-\xfb\x0c\xd6l/Ad\xc4\x8e\xc1+\xc5\xc5e\xbc\xa5\
-\x16\x86\x8bK\x14x\x06G\x96x\xd7\x18\xfd,\xef\x8c\
-A\xbak\xb1z\xaas\xc8\x0b\xf0a\x8femu'\
-\x1cvQ\x0c`\xe2\xc0\xeb\x1d\xeb\xb1HOk,`\
-\x02\xfd'\x96\x0f0\xfc\xe8\x13\x95\xd3-\xd3f\xdc\xc2\
--\x8b\xe1+\xc8k8g\xb2L\x0c\x18DG\x89X\
-\x07j\x0e\xbfF^\x8a\x1eM\xcdD\xddrx1\x8c\
-@PV\xfak\xdb\xb1\x8f~\xe5-q\x0c\xfbK@\
-\x19X\x0f\xfc\xb5>\xdc\xc7hf\xe4w\xcd\x03\xaa\x18\
-=\xa2\x8c\xc5\x0f\xfeMT\xe5\xe4\x9e&\xd0)\x15\xfc\
-\xb3\xa1\x92E\x9bg\x7f~!!\xfa\xd0E\x0b\x80\x1e\
-\xbch\x95J\xcc]U\x14\xe6\xb8\x80]\xe7\xe6]\x15\
-\x17Hgx\x9bn=\xce\xc5`\x17\x96~\xf1>\xfc\
-\xd3\x10\xa2\x1fZ\xc8A< \x12\xdd\x16\xac)pM\
-\xc38\xedL\xf7\xc4{\xe0-\xae:\xb1I\xdc\xa3\x7f\
-@\xf6\xfdT\xe4\x0a\xf9\xef\xc0v\x00q\x07KMM\
-9`ruOw\xe2\xf9\xda-\x84~\x9c\xb5\xca\xdf\
-\xfe\xb2\xe7\x91\xcd\x91.\x9cm,\x86\xca\xfb\x93\x80b\
-\xc7\xee`^<7Js\x16K\x86\xc6]\xeb_7\
-]\x9e\x19k\xa7\xb3Z\x94l\xb6l\x12\xda\x0axM\
-\x89{iJ\xd62QU\xb5\xca\xd3ey/?]\
-K8T\xf5\xe2vfpE\x04G\x84\x8d\xe3\xa0\xd8\
-\xd6j\x9f?\xc4\xce\x12T\xfa\xceS@\xa7\xbd\xcb\xda\
-\x95g\xbdCl\xd2A\x0f\x88E]j;\xb2u\xeb\
-\xc0\x16\xae\xcb\xc7B\xe0\x9dJ\x1fn\xd5\xf3\x0bX\xf6\
-w\x93\xf1\x0f\xebp\x83w#\xc1MM\xac\xf6\x096\
-\xd68\x17\x9b\x0d\xc5\xc3\xfc\xf4\xf4\xe9\xf3FFfg\
-KYY\xcfoP\xac>\xea\xb1\xca\x9c\x80\xa8\xab\xc9\
-~\x94\xd8\xddc\xe9c\xb7+\xf0\xfd*l\x5c\xce\xde\
-6;\x9f\xdeT\xaa\xaa\x90~\x00\x9b\x06x\x93\x96\x1f\
-\x0c\xb0\xba\x0d\xc0\xfc\xd2\xca\xd0\xb8iS\xdf\xf9r\xe7\
-\xe9\xaci2\x15h{N\xe6\xf6\x99w\x08I\x13\xb2\
-L|9\x87\xb2\xf8\xa2803nq\xeb\x1ff\x8b\
-\xbe\xdaFa\x86\xd0\x0b\x92\x14GW\xd6\xc3ZJo\
-\x03\xccV~B99\xea~\x0e\x93\xce\xbf\x0a\xa7\xe8\
-\x86\xa5Z\x07U?\xaa7B\x06\x15d7\x09\xd1\xfe\
-7\xa2IKBe\xfc\x016\x82\xec?\xca\xbd\xa6\x07\
-\xb0\xf6=\x09\xe1\x97\xbeK\x8dUa\xf9JC\xa65\
-\x80Ce\xdc\x11\xe5\x93\xd3M[?\xdf\x8az\x9d!\
-\xbc\xc3]\xab(q\x0f\xd5\x8a\x91\xed\xa0K0\xde\x83\
-\xed\x5c0-\xad\xe8<$\x1d;\x119\x85/\xc1^\
-\x05\xb1/\x81\xa2\x85U^\x16\xe1\xd4|\xaf\xd5\x7f\x1f\
-\xc0\x8c\xa2a\xd7i9\xb2\xff\xbc\xe5\x9c(q2\xa8\
-g\xaaSv\xbc\xa04\x08E\x9b\xe8%r\x18\xf5\xf1\
-1\xc8h\x02W\xe3JN\x8a\xfb9E\x0cg\xacN\
-a\x847\x12\xe61\xd7\xd2=\x045\x15v\xf9\xads\
-,r7\xff\xb7\xc3\xd4\xc3c\xb3\xecrn\xea\xd8\x8d\
-b\xb3\xfca\x1f\x90\x97BX~?A\xda\x84\xbd\xff\
-\xdc\xa9\xbcx\xb0\x5c\x0e\x92\xe0>\x10\xe6\xb6\xcc.\x22\
->\x94\xe7\x03J\xecD\xf8\xbe\xbb\xf66#\x1d\xd0m\
-\xa5K\x92\x0d\x9b\x8a+z\xbf4tc2\xf4\x06Y\
-OS\xa82`A\xca\xef\xf8p\x1a\xd4!D\xf5\xe8\
-\xcc\x17[\x19\xe4uk\xd2\xdd\xff>!xkij\
-f\xaf\x17\xb9\x14\x8b\x19\x97\xe4\xe5\xca\xf7V\xa35.\
-\x11\x88\xae\x06\xcc\xc7N^\x02wT\x0a\xa3\xb4\xc7}\
-\xc3I\x0f\x01pT\x18\xdc\x11\x95\x22t\xfbF=\xba\
-\x19\x04\xd5\x0a\x1d\x0f)\x08\xd3C\x1a\xa1{\x8a\x0e\x14\
-\x10\x91\xb9\xb7\xb8\x8f\xe3\x04\xe0_\x92\x176\xd9\xfc\xe4\
-\xfc\xe2B\xd9\xa2\xf0\xfe\xfdKI1zR\x8cS>\
-\xa9\x1d*\xea\xf7\x1a\x10kC4\xf5\x1a\x0e\xee\x06/\
-@\xa3\xb2~Tu\xadY\xb7\x99:@\x91\x91)v\
-\x19\x0d<8l\xc9\x01\xbb\x87\xc8\x19\x95x\x81II\
-\x12\x80\x04g-k\xe0l\x5c\xa5YF\xee9\xa5\xb6\
-hc\x95/<\xad|\xef\x5c\x9d\x90# I\x84\xc0\
-\xdc\x19f\x9e\x96=\xcfk\x8e\x8a\xd6\xca\x026\x99\xc1\
-\xd3;\x9fc\xa4\x08hk7\xf6\xd71\xb3\xdb\xb5\xdc\
-C\xec\xbc-\xeb]\xf6px\x09\xf7\xea\x8b\xeb\x05K\
-\xf5\x91\xb4h\x01\xa6\xa2i\xb0\xa2\xdb\x87\x97,\xd4\x88\
-\xc1fV\xea\x03\xad\xb1\xb29K\xda\x8c\xf3\xc4\xc0\x95\
-\xb8xlp\x7f\xdf]L\x92\x1a\x8f&&r:\xef\
-\x08\x129\x91V\x96l\x22D%\x09\xb9\xbc:\xdf(\
-\x01_A\xc6\x1c\x09\x10G\xb9S1L\xb5\xb1:\xbd\
-\xc7\x02\xc1\x95E\x13\xe2\x0br<\xd26\xeft07\
-\x14\x0e\x9b\xd3Q%\x9d\x02\xb5\x11\xcd:\xa9\x98\xa2\xc7\
-\x17\x86\xdd\x03\xe9\xebIC\xaeh\x8a[\x814C~\
-.\xe1\x00\x9bo\x10\xdf\xdf\xb6\x04\xcb\x0c\xf3\xdf\x80\xed\
-B2\xf3\xdd\x89\x02\xdc\xca2\x1c=w\xc70\x00\x00\
-\x00ANMF\xe2\x08\x00\x00\x0a\x00\x00\x0b\x00\x00\x9f\
-\x00\x00\x9d\x00\x00\x1e\x00\x00\x02ALPH\xaf\x01\x00\
-\x00\x01\x0f0\xff\x11\x11Bn$Yu\x00=J\x86\
-L%pU\xa4q\x1e\xa1Ah\x0aE!`bp\
-\x8c\xf1\xe0\xbdW\xf7\xb3#\xfa?\x01\xb2\xff!\x81-\
-G\xf4\x90Y\x02\x1a\x11_\xc8\x08YT_#\xe2\x0d\
-\xe9!\x03\xf0\xad\x10\x22\xde\x90O%O\x0f\x19!3\
-d\xa9\xcb\x83N\x8e\xa6\x8a8_u{>\x95<\x1d\
-(\xe2\x1d\xc0\xe3\x9a\xc0\xedZ@\x8a\xa8\xe2\x06\x8a\xab\
-\x01\x8f\xeb\x05\xee\x90\xcb\xf5\x01\xc9\xd5\x01\x89\xa8\xbe\x01\
-\xc57!\x87<\xbe\x05w\xc8\xe5\x03R\x88\xb8[T\
-\xf5\xbdP~\x9b\xec\xfb\xa2\x1e_\x87\xfb\xb7\xb9|#\
-*\xfd\x1e3J~\x8b\x9f\x11\xadL\xaak\x94\xe5k\
-\xd4\x80\xa1\x8ag\xfeND\x00\xd93\xfe{\xfa?a\
-\xfc\x1f\x15\xcf\x84\xf5\xbb\xd4\xa8\xeaYQ\xf3w)\x13\
-<D\x0dH\xb6\x16\x95\xc3.\xdb\x0b\xb9G<\x1dn\
-\xdb\x17\xf6\xc1c\xebp\xc7\xbc\x90m\x03.\xdf\xdc\x15\
-_\x83j[\x90\x1a`\x03\x92D\x88J\x96\xb6Yp\
-Y^\xa8\x9b\xdb\xf2m\xa6\xa3C\xd9<\x96\xb1\x19\x90\
--\x13\xb2H\x87bY\xf0l\xaa\x85\xcd\x07\x18\x1ap\
-\x8b\xbc\xc0uz\x81kw\x9f\xbe]\x03\x9eS\x07\x92\
-\x88\x00\xf94\x01\x11\x91\x05\xf5\xb4,\x1c\x1aP\xd5\x04\
-\xae\xdd\x0b\x145\x80g\xd7\x81\xac:Pv\x13x\xd4\
-\x07\xb0\x03\xb8\xd5\xab.\xf5\xa9K5\x95\xd5TI\x89\
-BD\x1aZ\xb6Ke\x91\xa9\xean*\xf8\x85.\xbb\
-\xb1\xdb\xe7]\xb7=\xbb\xcfv\xef\x9a\xed\xda\x89M\x8e\
-\xcbRO\xc3\x92O\xdd\xf2\x9c^\xcb}\x12K2\xac\
-S\x15\xe38e\xcbw\xba-rJ\xa6\xb9\xabb\xee\
-\xbb\xc7\xd6v\xc9&C\x15q6uy\xa4C\x96#\
-\x00VP8 \x12\x07\x00\x00\x10(\x00\x9d\x01*\xa0\
-\x00\x9e\x00>\x91@\x9cH\xa5\xa4#!,4\xaa\x90\
-\xb0\x12\x09in\xe0\xc0\x00e\x9f8\x8b\xfbO\xe3\x7f\
-\x7f?\xe2x^2\xc3\x22\xe7\x91\xa8\x15\xff\x0f\xd8\x15\
-`\xfb\xed\xf7\xcaj\x1d\xdf\xbew\x7f\xcc\xf8\x11}\x83\
-\xfd\x07\xb0\x07\xf2/\xed\xbf\xef=\x92\xff\x91\xff\xc1\xfe\
-W\xcd\x97\xe4\xff\xe5?f~\x00\xff\x93\x7fe\xea\xc3\
-\xfb#\xec/\xfa\xe5\xff\xc4\xf9\x0e\xa7\xee\xd7wX\xce\
-\xa1\xd7\xae\x81\xf4\x8bbW\xa7\xbd\xc2\x02DGK\x83\
-\xb7\x8a>E\xd3\x10\x17\xff\xd2\xdb\xde\x9b\x08/\xe2=\
-a\xd4\x9d.\x86 j\x84\x83l\xfd\xe5\x03\xb3+\x92\
-\xb5\xb3>E\x22>\xe88l\x0bZ\xeb8\xcc\xb1\xaf\
-\xe9\x1e\x02\xcd\x9dg&u\xecc\xa1\xe3s`\xcd\xa4\
-\x19D\xc8\xb4\xb3\xc7\x93\xf1\xaa\xdd\x0b ^HP\x9d\
-yuuu0\x1a\x8d\xd9\x95z\x92\x8c\x9c>\x090\
-~,yS\x04\x95\x1bmM\xfa\xae\xeb4\xed}@\
-\x18b$\xae\x8d\xbb\xdb}\x1b\xd9g\xbb\xe5\xc1Z\xc5\
-<\x88z\xc0m\x91\x88T\xb4\x8e`D\x82\xc3<\x18\
-\x8b\xeb\x04\x16t{\x0drQln\xed\x85\xdbt\x0d\
-\x98L\xdc\xc7\xeeG\x8d\x7f\xed\xbd\xf9\x01\xbd\xb6\x8cC\
-q\xe1\xc6<\x19hr\x93\x15\xda+\x84\xc7\xff\xe8~\
-,\x00\x00\xfe\xc3M\xaa\xaf3\xcc&\x938HE\xa4\
-\xaeZ\x9d\xcb\xe2\x16\xc7T\x12k\xde\x0cR\xce\x99O\
-4\xab2>\xbc\xa5\x8b\xce\x1em\xcd}q\xb1\xff\xd9\
-l\xde(T\x1e\x8f\xdf\x8c#\xa1\xc4l\xa4z\xa0 \
-\xf1\xa6NO\xa7\xd1s\xc5H\xe6=\x94\xb85\xef\x16\
-\xea\xc6\xb7\xa0\xa6\x84,M\xf4\xaf\x9erYR'\x1f\
-X\xbe&_Xn\x1a\x93\xe8\xaf'G\xccR-d\
-s\xff\xf7G?\xfd\xd4K\xff\xfb\xa3\xa0\x03E\x89\xe3\
-\xa8\x0b6_\x00\x9d\xf3\x18}\xf4lx\xbf\xc1[*\
-\xcd\xa6\x19A\x093\xd4d\xbaX*UaT\xe4\x85\
-\xd5\xbba\xfb\xa3\xc8r:\x95\xe6\xe6\xf1\x84\x04\xef\xed\
-\x94Z\x9e\xad\x01Fh\xcdh7\xa5\xedp\xb4\x22I\
-\x98{\x9d\xf7\x9b\x1fN\xfe\xf5\x14\xe1\x99_\xb4\x9a\x16\
-v=\x96-\x94\xa0\x01eKsd^dq\xa3R\
-\xb0\xe7\x1b\x9d{^L\xcbdw\x7fxz\xa5\x9a\xf4\
-\xb7\xa1\xcfH\xf3Cg\xda\xd8\xa7\xfe\xbd\x83\xe3r\x1c\
-\xd5y\xbc\x00\xbc\xcf\x87\xbf\x95\x95\xe8\xban\xc7\xb9\xe6\
-\x9bP\xef\x96_)\xa5n\x85\xb1\xa58\x1a\x86\xe8V\
-\xdf0\x90\x1c-?\xc0\xb5\xdfOT\xde~\xc3\x99k\
-\xb0\x92w\xa5\xd0\xb8wZ7C\x8f\x0e\xe4z\x7f\xac\
-W~\xa3\xdeV[\x04\x7fU\x10\x0a\x99\x9b\xc3-\x94\
-\x1d\xb2\xcb\x1e\x1e\xd9\xa0\xfb{%\x13{t\xaf\x89K\
-\x90.\xede\xc7)iU\xe0\x08x\xbc=F\xd3\x12\
-\xc5-\x8d\x0c;J>S\xe1O\xd5[\x9d\xfa/9\
-\xf2,\x18\x8e\xca3C\x8e\x04\x12\x92\x0b\x1e\xea\x1dA\
-&\x11H\x02\x1f\xd9\x83\x9d\xfb\x22F&\xb8\xf5\x83@\
-\x89\x97\xc2:Y\x93?\xe9`\x86uYp\xc3&2\
-l`7\x18\xd2\xe7X\x10\x00\x1e\x8bK\xe6\xd7v\xde\
-\xc1\x03\xc3\xc6\xfb\xc8\x11\xdf\xca\xdb\x03\xd1\x8br\x8bS\
-\xf5@\xb3\xcb\xa3#\xfb\x01\x965l\xe5h\x9e\x06\xa4\
-\x8bO\xc3t\xe77\x1a]\xf9;\xa6\xcfYL\xf3\x83\
-\x8d\x12,\x03\xa1\xe1LV\xff)\xf9\xe9=\xd8\x0a\xf4\
-'\xc1H04\xa4\x90\xe2\xe4(\xa9\x5c\xc5\xd8\xce\xa9\
-\xd1'H\xf5\xe3\x04\xe5:\xe5\x05\x0c\x93x*\x9f\xbe\
-\xa6{\xea\xf7~\xe1W\xaaN\x9f\xd1)\xfd\x06`\xef\
-\x81\x9c\xdd\x8f\xb8\x1d\x11x\xbd\x12Jz\xf1HZ\xac\
-\x89`p\x9e\xde1\xe8\x8eo)\xae/\x93e\xf3\x9f\
-\x03\xe44,\x8d\x1c;F\xaa\xed\xf5=x\xfat~\
-\x90\x1dE\x81iC\x9b\xf4\x82\xb4\xf4\xbc\xa0\xc2\xaa\x0d\
-\x0c\xf0\xab\xafG\x81\xde\x16Pl+C|F\xb6\x1f\
-q<\xd23\x8a\xc1\xa8\xb5\x5c\xbf\xb9\xe6\xb7\x9dZ\x8c\
-A\xc7\x15\x87:#\xa6\x00\xd4\x8b\xd6\x13\x1e\x99L$\
-\x8e\xac\x22\xa2d:\xaf\x8b\x07\xdf\xf3t\xa4\xac\xae\x11\
-\xab\x90\x0a/\x9du\xb8\xb4\xf9)\x88o\x0a\xbe\x09\xdb\
- \x7f\xe4\xf5\xb4S\x9fsDt\xbcE\x96e\x10m\
-\x22B\xe0\x83\x82\xe0\x0eN\xbf\xa0\xf0\x96-15d\
-|\x03\x09w\x14\xcd\x91\xd5\xf2\x91\xc9\xc3\x11\x9e\xff!\
-R?i\xf7M\x97L\xda\x1f\x84\x9f\xc0D/\x9d\xfd\
-\x17\xcd\x01\xfe\x95\x02\xab7<\x06y\x92T\xd99\x90\
-\x10\x0fR\x93\x9f\x87Fg\xafW\xaeB\x8bx\xf0x\
-+\x01\xf9rQ\xb6_^\xef\xcam\xd6\xd1\x80\x09^\
-S\xaf}~0\xd6>\x22\xa4\x04\xd3\xc9U\xf12\xa2\
-\xf4\x91\xf3*\xf2\x7fsi2ya\xe2ie\xd4\xc0\
-\xc9\x1fg}u\xca)\x9b@\xd4\x90\x11\xb43\xb5O\
-\x84\x16\xf0h\xc0\xb4\xe9\x17\x89q\xe9r\xd8\x04\xfa\x80\
-l\xb8\x09d\xe0\xec\x87ED\xb7\xa5\x12\x0e\x90\x22O\
-\xcfb:<d\x95\xb3C\x0f\x19\x99\xba\x09a\xb6\xe8\
-j\x90\xe7\x96)`\xfa\x9fn\xe5\x19\xd9\x90P8b\
-\xef\xc6D\xb4(\xf7\xadt9e\x116)\xfdk)\
-FM\xec\xa1V\xeeN\xe4\xc6\x00D^\xff\xadtL\
-\xfa\xfe\x8a>\x9e!&\xdeOU\x9d\xd2\xb3\xcd\xea\xf8\
-Kv<\x84\xd9\xb9\xed\xba\x0cmD\xe0\x88\x00w\x12\
-Y\x86TL\x88\x80/TlMg\xe3bP\x14{\
-\x98\xa2o\x07\xfaJt\x98\x9f?K\x19e1\xd94\
-\x08\xdc\x1fBK\xac\xe0!\xb8Y\x82q\xe5\xfe\x80\xb9\
-m\xb7u\xb5\xe7t\xef\xe9*\x04E\xf9\xe6\x0cM\x92\
-\xb2\xf1zvA\x89\x9fM\x98L\xde\x8a\xddP1\xcf\
-o~w<\xf2\x9ds&+\xeb\x02.\xbe\xa0\xaf\xf1\
-H\xa6\xb3\xed\xd1P\xb0\x5cg,\xfe|eV\x13\xfc\
-#\x0f\x1c\xd3\x19#\xc7\x89\x03\xdc\xe9X\x14#\xeb\xe9\
-@\xad\xe7lD\x8d?D<c\xc3~\xb7\x1c\xdf'\
-+O\x97\x08\x93\xdfA\xf9\x99\xfb\x90\x01\xe4\xae\x1a\x03\
-\x95_(tFW{\xe6V\xda:\xd7I\xfd\xe8=\
-\xdehCSy\x0b\xc9\xe7N\xbe\xe4\xc4\x0a\x80\x15\xa9\
-\xc0\xb5\xed\xb3^\xd5\xe2\x168+6\xd5\xcd\x08\x0b\xf1\
-\xcdv\xfa\x12\x06\xf6\xa9u\xca\x92\xa3\xb9Q\x1f\xaef\
-b!\x13\x02i\xb6}\xadI\x04C;\x22\x9fE.\
-f!xB,\x16O\x09\x9a\xcc\x80?P\x98\x1f\x7f\
-\xf6\xc8\x14:\xd4\xe0\x97\x8d\xd1`\xe0\xdb\xe0v]\x8c\
-\xd1a6\xe0\x99;\x02l\x08\xff\x03\xc3L\x09\xa3\x1b\
-*\x0d\xaev\xd6\xa5\xdd\xad\x11{@\xd1f\x19\xdb\xa8\
-\xe4\xbf\xfd\x13&n\x0d2\x8e\xdd\x17\xf2\x8a\x8c\xc5y\
-<\x12<KB:\xb5op\x98\x01.\x8c\x83\xddd\
-\xa0\x1by}\xc2\x1d\x8f\x8f\xe6\x97\xd9\xf8\xf3\xf9\xf8\xa2\
-\xb7\x0a\xfc\x87\x7f7\x99\xbdABJ\xcd \x8d\xdf\xed\
-\xda;\x7f\x85\xec\xf5\xd6\xbb\x12I m\x89\x82\x18\xac\
-\x00\x0f\xa4\x8f\xb8\x98\xa2\xb8\xe4\x01\xef\xb5\xa1W\xbf%\
-\x96\xa2\xa9\x0f\xebp\x0fK\xe3s\xb8$\x1f\x90'\xbe\
-\x93\xa0q\xf0\x9eXNo\xa3\xd9vdP\x84_\x1a\
-\xbc\xfc\xf7J\x0eL\x10v\xa8\x8a\x9d>\x0e\xa6a\x89\
-\xef\xde\xd9\xf7\xcf%\xc1\xf2\xb3\x07\xfdLs\x01\xbbv\
-\xd0F\xad\xea\xddg\xd2\xac8\xfd]\xe4\x13\x01\xd5\x04\
-)9\x08R -m\x00\x00\x00\x00ANMF\xb4\
-\x08\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\xc7\x00\x00\x1e\
-\x00\x00\x02ALPH\xaf\x01\x00\x00\x01\x0f0\xff\x11\
-\x11Bjm[u\xae\x9d\x0c\x04\x92\x12(%\xa5\x85\
-\xd2(\x05w-\x12\x91\x91%\x12\x0e\xfb{\xdc\xff\xe1\
-\x22\xfa?\x01\xf6\xbf?\xcaNYE6t\xc8\xaan\
-@\x12]\xb2\x82\xac\xe9\x86\xee\xd4!+\xbav\xcb\x92\
-\xae\x1b\xbaK\x87\xac\xe8\xaa\xae=\x04E\xbfeS\x8e\
-[\x90\x9c\xc0a\xd2\x0bH\x1a\x80 )7\x93V`\
-\xd74 k:\x10uA3\x00\xd3\x9ep\xe8v\xd1\
-\x05Y\x04$]\xd4\x14 h*\xb0\xe9L\xdb\xe0\xd0\
-\xed\xa2\x0eY\x97D\xe3%QtB\xf8\x80Mt\xbd\
-\xc4\xc4p|\xc0.*\x9f\x91E\xf5%\xe9\x9bDQ\
-\xfb\x8c\xf05\xfaK\xb6\xf7iI\xd5P\x15\xfeL\xec\
-\x9b\x94\xbf\x91\xf0.u\xd2$\xf1\x83\xe2B\xfb\xa0\xba\
-\xd6!L\xd2\xbb\x15\xc8\x0b\xe3%\xdb\xeb\xf6\x85sb\
-\x12\x9b\x1c\x0b\xd7\x1b\x5c\xb0\x00\xc7\xcbN\xd8\x5c\xc5\x17\
-\x5c\x15\xf6\x97\x0d\x88\xae\x06Y\xd4\x1d\x1d\xd2Jrd\
-\xd7p4\xd8]'D\xc7\xe1\xba\x1cu\x05\x08\x0e<\
-\xc5S\x80\xcdQ\x81\xed\xc9\x80\xe0h\x80y\xa2\xa3\xbb\
-.\xc8\x8e\x01\xc7\xec\x84\xddq\xc2\xee:\x1c\x97k\x00\
-\x0e \xcf:\x10&\x15H\xb3\x06\xc4I[K\x93\x01\
-\xc4Y\x05\xf6\xc9\x09\x84Y\x01\x98\x00l3\xbb\x85\x87\
-z3\xe7\x05\xa4\x87\x0e\x1c\x9e\x13\xd8\x1f\xae\x95\x01\xb0\
-\x99Y\x01\xc8\x9e~Kf6n\xc9\xd3nlV\xb9\
-GO}\xe0\x87\xc7\xe0)O\xd3\xcdc\x0b\xe6\xbe\x5c\
-\x87o\xb8v_w%_sE_q\x05\x9f\xb9l\
-\xf1t\xec+\xdd\x91W\x9a#\xae\x14\xc7\xb6b\xd7\xe4\
-\xb0\xe5>\xc9ku\x12\xd7\xecz2\xe1x\xc8\x8a\xf2\
-\x10\x146\x80\xdd\xb4\x80\xfd\xef\x07\x00VP8 \xe4\
-\x06\x00\x00\x10-\x00\x9d\x01*\xc8\x00\xc8\x00>\x91B\
-\x9bI%\xa4\x22\xa1,\x97\x88\x88\xb0\x12\x09in\xfc\
-|\x97\xdb\xe4\x97\xf9\xb0E\xfc\xcb\xb4o\xf3\xbc\xb4\x0a\
-\x88v\xde\xf9r\x81\xe0\x7f\xd6\xfe\x81?\xcd\xf8\x22\xd0\
-\x03\xf9\x7f\xf9?T\xbf\xe3\x7f\xed\xf9J\xfc\xe3\xfc\x9f\
-\xfeo\xf3\xdf\x00\xbf\xcc?\xa8\xfaKz\xe9\xfd\xb3\xf6\
-\x05\xfd1\xff\xf4N\x87n\x90f\xdeso6H\xbb\
-\xe9,V\xf3w2\xda\x06\xe0|\x05;J0\xa2\xd5\
-\x04SH\xfaW\xc4\x16r#\xec\xf1\xc8\xdd\xd9Y\xf2\
-\xd2\x87\xb18\xcb\xe0i\xa3\xc0\x90ry\xf8\x06\xba>\
-\x03J/\x82\xce\xa3\xa9R\xd7\xb0fP\xd53\xe0\x17\
-m(\xc2\xba+\xe2@\xcaI\xf0\xec\xe9A\x1e\x1dP\
-R_\xd5\xb6o!\xee]K.\x1c\x89\xc4?19\
-\xd4\xf6\x9a=Y\xc6j\x1e\x16\x07U%\xbd$\xd6-\
-\xe3o\xfb\xf4e\xe3\x84\xd4\xec\xa5\xbd-!l\x0e\xd1\
-+\x97*\xb6\xed\x9a\xf2Ox\xcd\xdc\xae\xef\xc7\x0a\x04\
-Ab\x8e\xa0\x9a\xdc''sv\xc8\xb3\xd8\xb3\x88\xb3\
-t0\xeb\xa8Q,\x92r1\x01,9y\x16\xcf\x22\
-7\x1c\xf0&\xc0Z\x9e\xf5\x9dC(\x0a\xfd|\x8d\x88\
-\xae\xaf\xc5\xe1\x96>d:\xe1\x8c\xd7W\xe9t\x0ao\
-\x8e\xcb\xb9\xbb\xdd\x97\xe5\xdd\x9f\xcax\xde\x12\x1ft\x1e\
-m\xb47H3)y\xd4\x19r\x5c\x18\x92\xb2\xb3\x86\
-\x0d\xff\xfd}b\x1a\xfcs_\x0d|\x06\x94a]\x16\
-\xee\x8bn\x80\x00\xfe\xfd\xd2\xe8\x00\x99\x08\x99\xd8\x1f\x16\
-\x1cfW\xad\x1a3\x978\xfdwT-\xdb\x08\x97Y\
-\x7fy\xf3\xba\xe0\x82t\x15\x19\xa5oZ\x96\xd1Mo\
-\xb0^\xb74K$a\x0e%?\x96\xbe\xb9\x84\x84\x02\
-\xa5\xc4\xa8\x1b\xc1u\x80\xa7w\xbf\xdd5\xbeA\x1d\x07\
-%\xd8\xcc\x19[\xdc<\x93\xbf^\x0c\xda\xe0B\xd9\xd3\
-\x5c\x22\x0e\xafI\xbak\xb7b\xb2\xedm\x9c\xc93\xdf\
-\x0bX\xf3I\xee\xa6xR\xb1\x9b+\xafho\xcf\xcc\
-|\x8dB~\x1cU\x03\x8e\x5c\x0aK\xd3\xd5sG\xef\
-\xbb$0\x86\xe7\xc0YU{\xc2\xc3G\xd6\x12\x0d\x14\
-\xc4\x93mm)\x12\xa9C{e/\xe8\xd3\x88\x9fP\
-U.\xfa\xc3b7\xf1X.\x1dh\x99\x0aQ\xcd\x8e\
-+\x05\xe0\x9b\xd9G\xcc\xa3\xad\x86\xfb\xb93V]\x22\
-\x8d\xb6\x04\xe5\xbc\x0f\xec\xcb\x83\x9a\xdd\xc5\x00\xef\xe3~\
-4nJ\xc1\xb07Q\xaa\x04*\x0b>\xa8NU\xad\
-tN\xa2\x0d\xa5\xa9wT\xb1eTT\x81\x0e\x04\xe1\
-s_7\x80\x22\xb1\xae\x12\x86\xceC\x00\xefHM-\
-\xc5x\x8eC\x90\xd6\x90\x00\xa5&,\xda\xb1\xba\xd3=\
-\x05t \x0f\x0b\x130\x86\x5c\xace\xe0\xab\x9c\xb5\x8f\
-\xce\xc3\x17~\x98\xe3\xdb\xd1$s\x7f\x91\xf1\x90i5\
-;\xab\xfb\x9b\xf6\xcb|xL\x87V\x08L\xc6\xe0\xf0\
-\xc6\xa5\xba4y\xe3i\xcd\xd3\xd5\xc6':\x93\x8c\x8d\
-\xd1\xb9\xb7'\xcb\x09nYQ\xe5\xac\xc7\xf5\x17\xa69\
-\xf6\xd2\xebG\xf3\x09?\x82\x81O\xaa\xf3S\xff\xb4&\
-}\xb4\xec\xe6\x1c\x8d\xf3\x0e \xcd\xc2\xc6*=\x9a\xb0\
-\xe6\xbc\xf7\xab\xb1p1u\xa7\xfcx\x9c\xc2\x8d\xb8\xd9\
-Z>(\xb06Z`\xa3\xb6\x9f\xaa\xfd\xc0\xach\xbe\
-\xaa\xc9'O1\xae\xf8\xbc\x9d\xfe\xdb\xe1\xae\x0a\xb8\xc7\
-\x8578\x00\xa9?\xa7\xf2\x0a\xaa\xb0\xf21;f\xc0\
-\x8b\x8b\x02-\xe6H?\x8au\x10k\xed\x18-\xd2\x1f\
-\xf1\x80\x87\x08\xd4\x00\x1c\xba\xd9\xe0\xc3\xaa\xe7v\xf4\x93\
-K\x15\x94\xb9\x1db7\xfe\xf9\xb0\x99\xde$\x19\xcf\x8f\
-\xe2\x0aZ\xa1?\x99\xf4\xf7\xf0\xbay-\xb4\xd7\xce\x1e\
-\x80\xc4K\xa0\xbf\x9b\xb1o,_5\x1c9len\
-\xae\xd1\x81\xff\xb1\xf6\xd9\x8c\x90\x03\xf4\x98\xba_\x11^\
-3Dk\xf0W\xfb\xdf\x8d\x17@&e\xa4\x09\xe4\x9e\
-b\x8d\x90A\x91\x06\xcd\xb3VY?\xd1\xe9\xc5\xe6\x10\
-p\xb1\x0f74HS\xd7\x8e\x91\x12My\xef\x96\xb5\
-%\xc6\x9a\xe7-\xd1\xf9\xfc\x17\xf4\xf2]\xbe\xcb\xe3\x12\
-\xcc\x11[\xd6\xca\x14\xdf\x5cO\x85\xd4\xc3[5\xf7/\
-\x07\xb4\x097\x0ek\xfb\xd9\xacy,1V\xd5\xf0\xfc\
-y.&$J\x9f\x0a\xad\xc3o_(\xd2\x0a}\xa7\
-\x077\xfd\xa7\x13\x1d\x03\x11|k\xb13\x9d\xef\xad\xf6\
-\xf93\xdcjFw\x08\x88\x17\x1cU\x87%\x8fN\xd2\
-^~Z\xb8\xe9\xeey>U\x08\xdeTq\xd0\x01\xad\
-\xa6\x1c\x1a\x17G\x00\xcc\x8fo\xf9\xb9\xc82\x07\x10W\
-\x0b\xa4\xcdU\xdb\xae+D\xd5\x0b\xba\xa0z\x8c\x86\xc2\
-\xde\x9f\xe8\xa690Z\x00\xfd]R\xc9\xe7\x9d\x9cH\
-\x81\xace\x81\xdeK\x22\xbe\xb0#\x04#7\x8b\xacv\
-\x9c\xa8\xe8\xe1\x00\xa2?\xb9\xf2IRm\xc8{X\x95\
-\x08\x08\xec\xa6C\x06\xef\xff0\xd7/r\x1cx\x10\x19\
-O\x82\xaf\xa5\x99Q\xd5\x17\xc2\xe1k\xf0\x87\xd4=B\
-\x91\xd2\xd0\x86@\xf7\x00\xcd\x05\x1b;\x8e\x02\xd8Ei\
-\x8a \xa3\x0c\x8b\xa5Kp\xc8\xefE\x13l\xde\xa4\x16\
-\xa9\x8f\xf7S\xfd\x93\x5c#9\x87#|]=\xe2g\
-\xf3f\xf8\xa1\xb3\xa1\xd4\xc8\x12S\x18\xcb\xe2\xc1!i\
-\x1c\x1a\x1f\x07\x16\x0a\xc1\x02\x17\xb1\xf9\x88!Y\xafV\
-h\xf8\x835A\xb3P~\x13\xbc\xc2\x12\xa1q\xc8]\
-\xb5(\xdcjIW\x07\x97\x1a\xf0H|*A\xc6\x1a\
-\xa4@\xde\x10,~\x06hZV(\x18(pL\x01\
-#\x08\xd5V\x80\x8e\xba\xd5k\xb1=W\x94\xa0\xb2\xf1\
-A\x1f\xf2\xee<\xee}\xa7D\xde\xcf\x04\x92\x11\x09\xa0\
-9\x0dn \xb7;L*,}Im\x9f\xbb\xaen\
-\xf1i\xbf\xbb\x80\xbd\xe0\xc1\xfa\xed`\x93A\xf5\x18}\
-\x89\x05\xd0x`(P\x08&NW\xadFhS\x80\
-\x0e\xb7\xd6k\xad|3\x9cy\xa0\x93c\x05\x16\xc0\xad\
-\x80%\x00L\xf2\x18\xc8\xf8\x8a\xaa\x80\xf6M@Y\xfe\
-A\x10c\x0f\xf6x?\x8b\xbd\xc5\xeeC\x89\x94G_\
-\x1eX\x8a\x14<\xec0-[Z\xbc\xa5\xd6\xb6Q\x94\
-\xb1\x15%*\xf4A$X\xd9\xday\x18P7\xf1\x03\
-\xa7MI\x22;02!}\xadq^\x11\x94\xe9\x8c\
-\xcd$^\xe3\x01Q\xd0\xec\x84/\xba\x8eB'\xb5\xa2\
-l\xdf_\xe2\xe6*x<0\xbc\xfck\xc9?=\xae\
-\xa6\x81\xb7\xec\xa6\x88$\xd7\xc1\x82\xa1\x9b\xd7\xd9\xd4\x03\
-\x8bJ\x88g\x9c\xcd\xc0\xa0^\xa7\xb6\xbd\x9a\xd0\xeb\xb9\
-\xa5\xbbe\xa0\x9b\xd3\xb1\x8ct\x9d\x88En@,J\
-\xcb\xfb\x00\xb2\xad\x5c\x8f\x8d\x97{\xd7\xec*\xe9wz\
-\x16\x80\x88\x10\x94\xb7\xa7&s\x99\xd7,\x86\xe4\x08\x22\
-\x8a\xca\x1d\xb8)\x83\xd4\xb8\x02\xac?\xe5.\xc8O\x12\
-\x12\xf8\xab\xc6\xf6\x95\x93\xee\x94\xee\xf9\x18\x8b5\x96\x8a\
-\xe5\x04\xd3ecG\xbb\xa0p\xe3\xce\xf8Y\xa1\x17\xc6\
-E\xd5Q:\xd8\xac\x9a\xa1\xfeZ \x19m\xdci>\
-\xa2\xcfVx\x91\xd9\xc0\xc8\xe7\x04F\xb5\x882\xaaX\
-=\xd5EW\x1fzD;\xb1\x15\x1b\xcfr\x09`3\
-\x81\xd2\x8fPY\xcb\x97\xd6i\xf3bu\x10\x006\xfa\
-\xf3\xdc\xce=\x1c$x\xcd#\xb7i\x8e\x90\xc9u\xb6\
-u9\xff\x9cL:%\x08\xc0\x17\x9b\x08P\x93p\xfc\
-\xcf#h\x02\x18\x00\x00\
-\x00\x00/\xa0\
-\x00\
-\x01\x96\xecx\x9c\xed\x9d\x07X\x14G\xfb\xc0\xcf\xd8\xe2\
-\x17\x8d-\x89%Ec\xff>\x93\xa8\xb1\xa6\x18\x8d%\
-\xdd\x18\xf3\x8f\xd1D\xa3\xc6\xaew\xa7\x01\x15T\xa4\xa8\
-A\x10\xaep\x94\xa3\x5c\xa3\x83(`A\x10\xa4*\x82\
-\x08\x88\x14\x05\xe9\x82X(\xd2\xa4I\x99\xff\xcc\xec\xed\
-q\x1c\x1cG?\x94}\x9f\xe7\xf7\xdc\xed\xee\xec\xce\xfb\
-\xce;\xbb;;;\xf3.\x8d\xd6\x8f6\x88\x86\xa4\x1f\
-m\x22Mo$\x8d\xb6\x13\xfe70 \x96g\xbc\xde\
-\x8f\xf6\x10\xae[\xbaT\xba\xbc\x8cF\x1b:\xbe\x1fm\
-\xf6lb\xd9}*\x8d6o#\xfc7Q\xba<\x82\
-FK?\xde\x8f6b\x04\xb1\xbc{\x00\x8d\xf6\xafy\
-?\xda\xe9_~\xfev\xd8\x7f\xc6\xff\x07\x1ez\xd8\xf7\
-\xdf\xad\xf8\x15mE\xbc\x8e\xb2\xde\xa8\xe9\x0e\xf3\x1c\xb9\
-\xf2\xfb\x15_\xffv8\xb5(C\xd7lm\x9enh\
-\xe9c\xff\xfdW\xb5\xb3\xd6\xaf\xdf2s\xd9\x88\xf3\xa3\
-\x1co$9\xce\xf0e\xcfqM|\xeasY\xeb=\
-z\xea\xbc~\xe7\x5c\xdf9\xef\xe8Z\xf4\xdc\xbb\xdem\
-\xae\xc8$a\xe8\x8am\xd3\xf2nl\xcf\x9f'Z\x90\
-h\xfd\xbd\xeb\xfc\xd3{V\x8df\x8d}\xcb\xf3\x9b\xf7\
-F\x8c\x5c\xff\x8e\xd6q\xdd\x10\x9d,qC\xfc\xed\xe7\
-ub\xf6\xe3\xc2\x07\x85\xcf\xeeG\x17\xd7\xd6\x14k\xc7\
-}\x16\xb7\xb8\xaa0#KW\x9cu\xe4\xf6g\x114\
-E1\xf8fkbf\xbf\xefV7\xc4\xaf\xf3z3\
-\xe2\x13A\xda\xc4\xad\x8f\xf7\x0d\x89\xb8g{\xf9\x9b\xe0\
-\xd9\x9b}w\x7f\x11\xe4W\xc2_\xad\xf9\xf5\xa9g\x8e\
-\xc6\xac\x91\x1a\x116\xc9AE\xc3\x07\x9c\x0c\x98?k\
-`n\xa4\x16S\xef\xc0\xa9\xe1\x1fn\xbd\xe9\x1c\xd4\x9f\
-\x96\xb0\xfc5\xda[\x93\xfb\xd1L\xd6\xf4\xb7\xf9{\xf1\
-\xbbU\x0b\x06\xe7r~\xaf\xfa\x22,eG\xe1;\x17\
-\x8e\xcf]\xe8\x1a\x1477\xea\xcf\x03)\xb5\x81\xab\x07\
-_w}\x91\x92|\xa2\x94\xef\xe6\xcbr\x0e\x8a\xb3\x9e\
-{\x94f\xb0u\x0am\xe9\x9cQ4\xfb\xb1\xf3\x0d\xf6\
-\xf8\x1e\x88\xd6\xd3\x10g\xde\x7f\xa17\xf2\xdd\xf2K\x7f\
-\xa7]]\xf6ux\x85\xcb\x8f\xdb\xd3\xa7\xae\xce\xbd:\
-\xf0\x8d\xed\xe9\x7fZ\x0e{\xb4]\xc7\xcb\xec\x8d\x0c\xfd\
-\x0d^\xb7\xc6\xfco\x87\xff\xb1c\x1b#\x1e\xe7\xf9\x1c\
-\x8f\x09=2N\x92oU`=\xcd\xf1\xcd\x07C.\
-\x04_\xae\x1a\x9c\xfb\xad\x16\xb3\xae\xca}\xd0\xecC\xcf\
-i\xb4\x1b\xdfI\xb3\xdaK\x1bR\x94\x12P||\x0b\
-\x83\xadsk\xc3\xd4w\x87n\xdc\xe5\xb6~}P\xc3\
-\xe4I^\x1fo\xc8g\x8a\xe6\x0f\xf3\xdcd=\xe1\xf1\
-\xc3=\xe3&\xf0\xad\x07m\x1f4\xa8\xee\x1d\xe1\xd0B\
-\x09\xb2z\x7f\xddY\x9f%[';\x0d\xa6\xcd\xf8F\
-f\xb3\xf1\xd3\xa8\x8fk\x9f\x0d\x89\xb8\x1d\xf0x\xfbG\
-\x16{\x8b^\x14\x84W\xde\x95\x5c\xfd}\x81\xcd\x1a\xf1\
-I\xd1\xd8\x1cA\xe1\x86\xfd\xa6\x8b\xb4K\xd6\x8e\xdc\xb0\
-_\xf7\xb1\xd0fzI\xca\x98\x85\xfaS\x8b\xb8I\xdf\
-Y\xea\xd7\xd22\x1a\xf5\x1a\xa9\xf5eI\xcc\xb5-\x8c\
-7\x0c\xfd\x82\xd6\x86o\xaf\xcb\x8f-\x08\xbf\x96\x9f\x7f\
-\xe7\x0c06[|tcxM1\xf8\xc5+\xfb\xdc\
-\x95\xcdK\xef\xde\xfb}p\xee\x92\x0c\xdd\xac='\x87\
-\xaf\x18N\xfb\x855\x80\xd0(z\xea\xfe\x9cO\x93-\
-\xb3\xa6m\x9d\x1eYW\xb1c\x9d\xc9\x0d\x8d\xc8:\xad\
-\xed\xbf\x85\xd7L0N\xcb\x17\xc4|\xf6\xd9\xc2`\xdf\
-\xef,\xa7\xfcTqO\x90\xf7\xec\xb2\xaf\xb3n\xb8\xeb\
-Z\xe6\xdd\xb5e\x87\x85_N\xcd),\x1d\xcd\x0c[\
-\xb4\xeb\xe2\x86\xa0i\x0d_\x16\xc5\xcd\xb6\x8e\xefO\x18\
-\xc9\x83\xc5\xe7\xdeo\xc5\xf9\xdb\x99o\xfb\x06\x1e-\xb2\
-[Q\xb4z|yU\xa5\xa1\x97\xa4h\xf1\xe4\xaa\xb8\
-\xb4\xe0\xba\xa8\xb4]\xf5cc]S\x8d\xbcy\x91\xb9\
-\xd5C\xf6\x0f\xab\x12d\xbe\x91D[v\xa7\xe9\x11\xae\
-~\xcep(\x7f\x968\xc1\xbah\x89dwm\xcc\xfd\
-\xe3+\xd2\x16\xda\xfd\xf7\xbdb\xab=\xc5\xdb&;4\
--\xd6\xdf\x87nx\xa2\x19\xf5\xe6\xdf\xba\x7f[\x1b\xd7\
-\x97\xd7\xf1\xd2f=3\xb9\xac\xe7$\xb8V\xfa\xc9\xcf\
-.\xef\xd7\xcdjZu,\xd7.<7\xe6B\xfd\x83\
-\x1f?\xad|68;\xb0\xb6\xdfo\x81E\xc7\x17=\
-\x91f\x8d\xca8\x89\xf6\xeb\xa3\xd4?W\x1e\xf3\xdf\x1c\
-\xc7\xf57\xfc\x00\xee5\xa4\xb1\xe0&\xcb%\x8c\xe9\xff\
-\x9d\xfb\x11p`O\xf15\x9f\xff\xe9V\xfe\xdf\x9e\xe2\
-\xd7v\x8e\x5c,\xcd\xa8\x85]l\x06\x8fx\x10\x9f!\
-`\xa4\xd6\xce\x16\x89S\x02\x92]\x82\x86\xdb|!\x9f\
-\xf1\x94\xa6\xfb.((\xa7\x1d=ztE\xc2\x9e\xe2\
-\x90\xfc\xe4\xbc\xf1\xcf\x123\xa75\x5c/\xf6z\x9eS\
-\xc8\xd0\x1f\x143\xf5A\xe2xx\x98]\xae\x8f\x17'\
-\x05V;\x8f\x013\xc6\xae\xa7\x87\x8cg\xf9\x15\xa7V\
-{o\xf5\xbfp\xe9\xf3\xd5'\xe5\x94_\x90[\x9e\xae\
-\xfd\xd5\x95];f{\xed*\xfaj\xbf\xd5\xe6\x1fj\
-'f\x03\xab\x05G\xab\x06\x08s\xd7\xbd9\xaf\x18\xa4\
-\xf9h\x7f\xf8a\xad$l\xc6\xff\x1d\x10\x9c(\xadt\
-[8A\x10\xa5\xed&W\xd6\xabt\x86e\x97z\xc6\
-y\xbd\x1e1\xee\xfft\xe27\xac\x14F\xc6i\xf9\x98\
-\x18\xbe\xbfp\xd3\xcc\x1c\xfe\xda\x1fW\x0a\x99\xd6\x05i\
-\xef%\xd2\xccg\xac}8\x11\x04\x1d\xd7L\xbd\xfa\xd6\
-\x8f\xbf\x0d\xcbnXur\x92\xd7ZW?\xf75\x9e\
-Q\xfa\x0e\x17\xe6\x8c\x0b\xd1\xfftV\xceB\xbd\x84)\
-9\xf1k\x8a\x17\xa6\x04$\x86\xcd\xb6\x88M\x87\xaa\x83\
-\x0a\xd7\xdcD\x7f w\x16^\x08\x9fo0\xddO?\
-h,\xab /~y\xce\xb0s\x7f\xbc\xcf2\x9d\xf9\
-\xf0\xb7\x06Cm\xbd\x9f\xc2m]\x97\xa5F\xae\xb0\xca\
-\x0c316\x8a(\xd8S\xfc\xebGk\xe6\x1b\x0c\xf6\
-\xbb9>4|K\xc0\xe8wo\xed\xa8\x99Uu\xcd\
-\xf4\xe3I_\xdd\x15T-<2s\xecPn\xca\xbb\
-'4\xe2\x82W\xb9L\xa9].w:\xfc\xa8\xb7\xc4\
- \xff\xa6S\xd8\x9d?gF\xd4\xd5x\xfd|\xe1\x85\
-cV\xc0\xaap_\xb3\x85s\xcfh\xea}\x17\xfe\xb8\
-\xe1A\xda\xa4gWvx\x1a\xa7y]\xfd\xdc'(\
-\x0c\x1c]\x15\xbe\xed\xdb\xcc\xd1\x1aUnzk\xc3m\
-w\xfe\x91\xe8n=mEzUz\xc8\xe9+;*\
-4G\xc6\xa5\xfd\xa3\xfb\xa4\x81\x15\xd8\xc0I\x0f\xe9\xbf\
-\xdf\xf8pi\x86dD\xe9\xeeK\xc2o\xe3wok\
-\xb8rq\xd3\xf7\xff]g\xa9q\xe8\x98V\x95\xdb/\
-f\xf3\x8d\xd3\x96,\x98\x96\xa3\xdf\xb0S`<\xd8\xe8\
-\x22\xfd\x84\xc6\x86\x0d\xf5\x7f{G\x85\xfctq\x89|\
-I\xa4\xcc7\xd8\xf5\xc1\xe1o\x86\xa6~+\xd4\x9d\xc1\
-\xa8\xaf\x99\xb0yz\x8e\xed\x07\xe5\xb5\xb7t\xeb'U\
-\xd2_s\xd9\xb65\xff\xd0\xf6a[\xeal\x02\xf36\
-\xd4\x14\x1e\xf1\xd6=\x92\xe9\xbf'\xca\xf1NU\x95_\
-\x957\xd3\xd8\xa3\x9fef\xd1\xdb\x1awu\xc0\xa5o\
-\xe3L\x0eo\x7fzqE\xe4\xa5\xf8\xb7S\x1f\x1e9\
-\x1c\xf2\xcd/\xe3,\xb6\x1d\x5cg\x15\x9d1o\xf5\xe4\
-\x9b\x8f\xb7\x9f\x5c\x981qu\xc1\x12\xb0\xb88u\xcc\
-\xb6\x09oF,^\xbc\xf8\x8b\xc0\x94\xb4\xdc\x7f\x14\xf4\
-y\xb0\xac\xfc\xfd\xb0\x14\xbb\x80\xb1\x0f\x1f\x8d9h\x5c\
-a\x9aYQ\xa7\xf1\xd7X+\xbf\xbf\x8a'\xf0\x96\x0b\
-\x8f\x86\xdb|\xa4\xb3\xe6\xf6\xa1\xaa\x99#\x96O=\xf2\
-\xc1\xb1\xec\x98\x15\xbbu\x0cM6f\xc5\xd9O\x1f\xf4\
-\xb0\xf6\xee\xdc\x8bA,\xbf\xf4\x90\xb2\xbf\xd3\xe9\xa0\xc8\
-\xb8>J\xa7V\x22J\xda\x14\x9b}\xb2f\xbe\x01\xe3\
-\xc3\xcc\xbc9z\xab\xec'\xad.\x10\xe4\xaf\x0ft\x0c\
-\xbb\xe8RV\x1b\x1f\xff\x09\x08^~\xdd\xf6\xd9\x96t\
-\xad}5\x91A\xd3\xc4\xdcr=y\x95\xaa\x93_\xbb\
-\x12\xf0\xde\x81\xc3\xcb]s\xe6Go\x9b\xb7\xe0\xfe\xbf\
-\xdaq\xbe\x97\xae_\xf8\x99\xfesf\x06G\xabf\xd9\
-7\x8f\x02_\xd4q\xc6z\x8e\xcb}\x14kQ\xba\xf2\
-\xc8\xa6\x90\xcc\xd4Q\x01\xf5\xcey\x9f\xfda\xf5\x8f\xa8\
-\xfc\xa7\xf7\xbc\xe6\xe6\x94\x1f\x0a\xaf=v\xe0\xaf\x9d\xff\
-\xcc8\xe8/*\x9d\xfe\xd7\xbf!\x9b\xbf\x16\xfb.\xf4\
-\x9a\xb4\xceXg\xf5\xb5\xbc\xe8\xed\xab\xb2+\x16\xe6-\
-\x1e8\xf7^\xfa3\xe6\xb2a\xb4\xd0$3\xa9\x0a\xa5\
-t\xda\xbd\x86\xc0c_s\xf6\xd8y\xad\xb7\xd9mt\
-\xea\x87D\x9d\xcc\x80\xcc\xbbSs\x12\x8a3?^w\
-3B\xc7ki\xde\xbd\x8a2CA\xde\xe57yE\
-\x97o\xbe\x91\xf0cU\xa6\xd5n}\x0f\xba\xb7E\xe9\
-e\xfa\xc3\xff\xccI\x13\x14hz\x07\x8d\x0c\x08\xbc3\
-\xcf\xef\x83\x9d6\x15\x95n\xbf\x9f\xf6\xab\xbff\xa87\
-\xec\xa7{4\xe1\x9c\x85?\x05]\x8e\x92\xbff\x5c\x80\
-Y^y\xfb\xef\xe87\xde\xf8bt\xd1\x9d\x94yK\
-\xae2\xcd\x9f~0z:s\xbfWQ\xdc{\x16\x8b\
-5~\x08\xb7\xd5\xcez\xe3/\xfdX;\x9b\x93\x85\xe3\
-\xf8Q\xb5\xa3G\xe7\xe8\x86\x8c\x89y\xc3\xfb\xf4\xca\xfa\
-%\xdf<\xdb\xfc\xbfo\x07\x86\x0a\x97JO\xf1\xbfn\
-\x1d\xe8\xf7\x8e\xe1\xc71o\x09F\x17\xfd\xe2\xf2\xb9\xdf\
-\xed\xdc\xadvG\xb8\x1f\xde\x1c:\xd4x\x91\xf6w_\
-i\x7f\x98\xa83\xcd\xc7\x9f\xff{\x8dn\xcd\x8d\xcd\xe2\
-\xbcw\xeb\xbf=?\xe4\xc7OW\x8d,\x1f/\x9cc\
-j\xe1\xb3Z\xee\x9c\xbaj9~\xe9\x1c\x86\x03\xf3\x07\
-\xad,\xf0\xe2`\xd6a]~\xde\xe6\xc5\x1f\xe5\x14\xf2\
-\x9c4\x0d5\x80\xc63v\xfd\x91]\x1b\x04\xda\xdc@\
-\x1d\xfd\xfd\xeb\xbdfG\xea%\x98gJ&n6\xae\
-\xd3\xf3\xf9\xc9E4\xfc\xd3\xc87\xc7\x18\xdc_A\xea\
-\xf5\xc3\xb0\xa5~\xe6\xef]_X\x1f\xed\xb7\x82\x11\xf9\
-\xe8\xde\x91'\xfe\xb7'L\xae}\x5c\xe1\xbda\xc3;\
-\xa5\xec\x82\x1f\xd7\xac\x9a4H\xeeJ\x9f\xe2\x92D\xab\
-\xfb\xdakQi\xf1\xb4\x87\x15)\xbe)o\xdd\x15\x9b\
-U\x0c2\xbc\xeb\xf3x\xe0\xe1\x03\xc9\x02\xf0TP6\
-\xd0{\xda\x16\xcf\xf4\xac\xb7g\xe6-\xce\xd0\x0b{\xf7\
-\xba\x96\xb6\xce~\x83\xe8\x1f\x12\xbc\xf7\xbb\xbc\xf7\x19o\
-\x0b\xe3\x7fE\xc7F(\x1c\xf1\xf6\x91\x0b\x87\xab72\
-\x7f\xe2h\xcc\x9dC\xa7\xd5\x08\xd7\xf5\x9f\xe1\xb6\xa1\xff\
-\xcd\x09_\xce\xd8l3\xef\x91\xb5\xa9~\xee'\x9fM\
-\xa9\xbdS\xb6=n\xc1\x8am\x07\x86L8\xb0\xc6\xee\
-u\xc0\xf6\x8d\x10\xaeJ\xf8J\xee\xce\xf0\x91\xd6\xb0\xd0\
-q\xb5\xfbf\xfbFx\xfe'\xc2\xea\xb8\xe9\xd6\xfac\
-\xeb\x02\x1fg\x8c\x09\xaau\xe7Zoc~U\xf4\xe9\
-\xb7\x5c\xa3OB\x1e]\xd7\xcc\xec\xbfMo\xc0\xdd\xd1\
-_=\xce\xb9\xb6\xa5z\xbf\x0f\x00c\xc7\xc8\x1d\xa7p\
-\x94x\xd8zp\xa1\xea\xd6\xfba\xee\xc7\xfe\xfcy\xf4\
-n\xff\x9dG\xceU~a\x97\xc7N\x8a\xe3N\xfb\x92\
-gg\xf6\xb1\xd1\x98\x0f\xf7\x05\xfcQU\xf1\xb4\x7f}\
-Yq\x05;d\xff\xe8\xd2U~7s/U:\x8d\
-v(\xd2\x05K\x1e~<=\xeb\xb3_G\x94\x06I\
->\x18\xa5qaFdJ\xee\xb6\xb2\x85E\xfe\xdeQ\
-\xf5\xa5\xf4\x05k\xe2F\x1e.2\x13F\x96\x95\xf5\xab\
-I7\xbd\xfa\x8cW5\xa50\xdf<Y+i\x94\xde\
-\xe2\x17\xb5N\x0d+3f~\x9f*\x7f\x87\xb8\xe1\xdd\
-/\xa9\xe8\x0d\xd8\xa0\x8b\x91\x0c\xc8\xbd0yz\xf8\x0b\
-\x91\x9f\xa7\xe9]=\x8b\x85\xc3\xb7h\x18\xa5\xdfh\xf8\
-\xfb\x888H\x5cV\xf4\xda\xa3C\xf9\xc1b\xfd-K\
-\x1bNY\xfePV\xac\xfd\xc8\xa7\xaev\xe5]\xda\xed\
-\xe7\xb7\xec\xae=1f\xec/q\xdc\xb8\xe9\xa3[\xc5\
-\xd7\xed\xb53\x8f1~\x8b\xd8\xf5s\xa4\xce\xfa\xcd\x9b\
-\xbd\xd3\xf5Ay\x85\xc4\xa2\xe8\xf2\xc2(\xbb\xb5\x1f?\
-\xf01\xcb-6Z\xb2k\xf2\xb6X\xed\xa6U\xcf\xf4\
-\xaf\xfe\xbb=\xf9!\xa3Y\xdf\xfeg\xa0\xc6b\xcd\xbc\
-kf\x877\xd5\xa4\xc4[l\xad\x85\xb7\xa9mAY\
-u|\xc6\xee\xc2r\xfak\xa3\xdf\xfe\xec\x9b\x90E\xd3\
-\x22w/\x9f\x9a\xb1\xed\xf0f\xe6\xb2\x0fBM\xb4\xed\
-\x02?Y\xed$(\xfb\xe5\xf0H\xd7\xfca5\x91\xb7\
-\x0d\xbd7\x9f\xfd\xf7\x93\x05\xa3\xc7\xe4Un\xfblL\
-\xc0\x97\x1e\xf5\xee\xf5gNY\x7f\xf4\xd3\x8e\xf5\xfb6\
-\xaf\xaa^o<zz\x9e\x8d\xfe\xe1\xc3\x09\xfb\x9f\xdb\
-n\x99\x9dr(G\xe7\xfbL\xae\xdc\x8d\xf7\x9d\xab\x83\
-J\xfcg\xe9\xff\xccr\xd4b\xa4\xd5\x1ana\x88j\
-L\xb7\x1c+5\xb4\xbeQ\x19\x1b\x1d\xb0R\xf8\xdf\x7f\
-%\x8fY3s3\x9c\xbc\xd7\xdf\xfc7\x22v\xd3\xaa\
-\xecB3\xaf\x82\x9a\xe8\xc9Q\x11\xe7\xcb\xbf\xc8+\xa5\
-\x97\x89we\x05\xb9\x8fr\xfb,1\xe8\xbb\x0f\xc0\x9a\
-\xfd\xfb\xf4ut\xaa/\x7f\xc8d^tM\xfc\xd5\xf2\
-B\x96\x9e\xe5\x8d\xcc\x17n\x81G\xfa\xbd1\xeav\xff\
-3\xbf=\x1cS\x997a\xcc\xf2d\xed\x88\xc2\xa1\xe8\
-\xc2}:\xf8\xbc\xfc%\xf2\xe6`\xee\xca\xa7\xf7\xaf\xac\
-\xdb81#\xf3Q]\xed\xc0sC\xbe\xb9q\x96o\
-\xec\xf2Fq\xe0*x#;R_\xc5(x\xdfr\
-\xb9G\x99u\xf0\xf8\x80\x86{E'\xcf<\xdb\xbfq\
-~q`e\xf8/\xb7\xc6\xfc\xdf\x8c\xb9k\xf8!\xfe\
-\xb3\x02gD\xd6\xb9\xe9L\xbf\x1b\x9e9t\xd0\x91/\
-4\x97\xcf\xd6\xdb\x9d\xbc|\xe4\xdc\xb7\xaf\xc97\x04G\
-%\xd3\x8e}1!Sg\xedl\xad\xb5\xb5\x8e\xc6\xec\
-\xd1c\xfa?\xfc\xfc\xcf\x1b\x95E\x05_M\xca\xc9\xf1\
-\xd81\x8d\xa1+0\xd5\xd6\xd5\xb6\x1cR\xfc\xd5\xb3]\
-\xe2\xf41\x01zNwiu\xfeek\x0e\x14\x8f\xf4\
-\xfa\xd3\x02,s\xca\xac\x1f\x9c\xb9dj\xe4sP\xcf\
-\x0f\x8c\xcc~b\x93\x9e\xf9\xf9\x81\xff\x8d\xddu\xc0\x7f\
-XX57\xa4d\xdc\x91\xeb\xec\x7f\xe5\xaf\x86\x89\x9b\
-\xfa\x97,\x0e\xae\xb8\xffv\xd8\x22\xfa^\x9d\x13\x17\xe6\
->\xf2\xf5\x19\xbe\xecJI\xf9C\xf6\xef\xfdS\x82\xe6\
-f^\x1a?\xe7\xbapdU\xca\xb9\xb4T\xdd\xb0\xea\
-\xf2\xab\xc5\xab\x9f\x17\x86\xcchrW\xab\xeao\x5cP\
-~u\xc9\xe4\x88\xd9\xb7\xaf\xa4\x9d,\xe50k\xf5?\
-\x1e\xbbKX\xab;y\xe1\xfaY[\xe9A\x82\xff\x04\
-\x8c\x03C\x97\xbe~\xa4\xd4xn\xce4\x9b\xdb\x01\xfd\
-\xc3R\x02XW\xae<\xe4\xcd\xdaW\xc7_\xbf\xaf\xf0\
-\xdc&\xe1\xd7r\x95QPz\x84\xc6~v\xdaSg\
-Y\xe4v\xeb\xb4/\x0d\xbe\xd5\xde\xff\xe8\x0b\x87\xd7[\
-k(~;\xfc\xc3\xbd\x99\xcb\x9d\xfe\xde\xb4|\xd1\xd1\
-\xe6\xedB2\xe9\x9c\xe1Km\xbf\xb9\xaa\xff\xf5[\xe2\
-\x03fC[mw\x1a\xac8e\xf4p\xffMm\xf1\
-,\x93+\xde\x0bg\xe6<\x9b\xb9wRp\xee\xba\x88\
-\x95\xe9\xf76\xad\xae\x9d|f\x99\x9c\xbaN\x83\x0cV\
-\xd4\xcd\x01Q\xa3\x1fl\xfe\xaf\xbe\x7fH\xbd(d\xb1\
-]\xe5\xb7\xbf6i\x07\x0f\x9b\x98ze\x8c\xe9\xd7\xf4\
-\xcb\x93\xc6<*\xdbS\xfc\xac0\xbf`U\xe5\xdb\xf9\
-_\x88\xd8\x97\x83\xf5\x03\xf5MJ\xff;\xef$X\xde\
-\xe4\xa0#\xc2\xfe\xac\xfay\xb6\xd6m\xafa\x11\xba\xba\
-e#6\xf9\xfb\xd8U~\x12\xe7\xf1l\xe6\xc3\xc7l\
-\xbb\xc1\xb3\xf7\xd4N\xbd\xbc\xbe\xa06\xb2\xd6m\x91y\
-\xe5\x9c=S\x9a>\x87\x8d\x14\xce\xcd*\xd94j\xbe\
-\xc1r\xef\xb7\xc2\x971\xe7\x1b\xac>\xf6\xabX\x0b<\
-\xf3\xcbKo\x98\xeb\x96\xb7\xaep\x17\xff\xb7\xe5~\x5c\
-\xcd'[\xfe\xef\x89fA\xcc\x12W\xdd\x9f\xc6\x0f\x91\
-/\x91\xf1K\xff\x9df\x9d\xf66k:\xe3\xd0\x86\xd9\
-_\xe9}\x142q\xec\x04\xbd\xb5\x9c5\xc9z\x07'\
-\x15qg;\xa5~\xf1pq\x9dk\xed\xd1\x86\xeb\xde\
-\xb7\xc6G\x97j\x07y\x9f\x9b_?\xe9v\xb2\xb6\x9b\
-\xc2\x91b\x5c\x83\xfa\xb3wF\xfa.\xd6\x1e\xbc\xad \
-&k\x5c\xcd\x89\xef<\x16zZ\xcf78\xb4I\xb8\
-F|\xa2 s\x1bm\x93\xde\x99\xfb\xa6;\x86\x85.\
-\xda`\xe1\x104}\xec\x12_\xfa\xe8r\xda\xd6_\x1a\
-*\xfa\x1fl|\xc0\x99\xf2<\xdc7\xa8\xcat\x8c\x10\
->Y\xae\x14^\xd9tg\xaa\xb7~\x15\xfd\xb5\x99\xeb\
-\xa2\xfc\xcb\xfc\x85?\xd6N\x9e\xf6\xab\xe7-\xef\x94\x0b\
-Ne_6\x84\xf5\xd7\x8c\xd1o\xa8s\xce\x9a\xa2\xb1\
-\xf4\x9c\x86\xfeX\xd6\x84\xfb\xbaYY\xce\xf5\xe3\xde\x1d\
-\xd7\xc4\xc6\xd0y:\xc7\xa2\xc5\x15a)\xe3/m\x0e\
-\xbfw\xee\xcd\xb4\xe03\x7f\x88\xc7\x82;\x9a\x7f\x8c~\
-\xf2\x8c\x1f=\xe6P\xb4\xdd2\xfa\xd9\x8d\x99IS\xe8\
-\xaf\x1f)\xf6\x09\xf0\xfe\x95_\x1a\xfeo\x9d\x09\x8bu\
-3\x8b\xd5p\xa9,\xb8AWW\xb3F'2\xef\xe4\
-\xa8[\xa3y\x9b\xfd%7s\xd7\x02\xc6l\xbd\xed\xc9\
-\x13\xeafx\xf4\xfb\xe9\xfd\xa6\xb9\x0d-xZ\x130\
-\xf6\x90_\x157s\x1cK\xa41|\xc06z\xcc\xfb\
-{\x8a\xcb\x87\xea\xac\xd4\xd3+\xcf\xdb\xf2\xe5\xa7[%\
-\xc3\x22\x16\xd7.\xb0J\xc8|\x10\xad\xa0\xea{\x97\xca\
-\xc3\x16\xcf<\xa9\xb1\x98\xbe`\xc0\xb6]\xe9\x1f\x87\xa5\
-\xfcYsnYn\xcc1\xef(\xf7\x14\xed\x0f\xe7\xf9\
-6h\xd6\xda\x1d\xd3\xd7\x9e8v\xe7\xdeG\x83\xc3\x0e\
-\xd7&\x0a\xb8\xb1%\x1f\xae\x18\xdaX1\x9a\x8b\xfd\xd7\
-u\xc3\x9f\xbc\xff\xf6\x8f\xfe)~\x99h\xf9\xfb\x95?\
-\xaf\xf0Z\xb6\xe5\xc4\x0c\xd4\x8bAt\xf1\xe0^\x19\x9a\
-\xb4\xbf\x87\x12J(\xa1\x84\x12J(\xa1\x84\x12J(\
-\xa1\xe4e\x17\xf1\x1e\xee$\x0c\x83\xbd\x11!b\xb0\xac\
-\x10b&\xfb:\x86\xc1N\x92\x92'\xa5R\x01r=\
-\x91N\xba\x9f\x84\xc9\xb6D\x90\xc7%\xf3Q\xb7\xbd\x94\
-4\x15\xca\xff}C<\x0c\x0c\x06!$\x0c\xf6Z\x84\
-\x98\xc1\xbaJ\xc0\x06=L\x0c\x01k'B\xb2\xc5\xe0\
-u\x84\xba\xcb\xe7U\x17\xca\xff}S\xc4t\xd3\x85\x04\
-\xac\x14\x8c\x82?\x84\x07-16\x16\x171|\x8f(\
-\x8cEX&\x86\x17\xf3\x14c\x96XBp\xbf\xa2)\
-\xd2\xf5d:\x8b\xd0\x0c\x0cy\x1c\xf2\xb8\xa2\x03\x16\x98\
-\x16\xeaC2B\xc8\xe4,@\xa8\xbb\xbc^5\xa1\xfc\
-\xdf7\x05\xb6\xbdv `\xd9\xd6J\xc1\xe5-\xd0\x97\
-`,}\x131\xa4\x1f\xb9\x195\xdd\x0a\x99\x0f\x99\xaf\
-PO\x82\x91\xab\x07XO\x11\x83\xb3\x0d\xa1\xee\xf2{\
-\xd9\x85\xf2\x7f\xdf\x141\x93\xf5\x1b\x86\xc1\xaeG\x88\x98\
-l\x80\xe0;_\xc7p\xd3\xaa\x08\xba\xd9\xdf*\x91\xea\
-a\xed|\x0dC\xea\x09u\xaeCH\x98\xac_\x11\xea\
-.\xcf\x97M(\xff\xf7Mq\xa0[\x8eF\x88\x18\xec\
-\x22\x04y]\xe5{Fc\xd4\xeeo\x15XA\x1d\x11\
-\xb2\xfb\x01\x93]\x80\x10jpF!\xd4]\xbe\xbd]\
-(\xff\xf7m\x81>7@\x90\xe5g\xcb\xf1\xc4\xa8\xcb\
-\x9f\xbc\xb8B\x8c\x9d\xa9\x07F\xaca\x8e!\x97yw\
-\x8a0\x8a\xfb\xd9\xb1=1\xb2z@\xe7\xe8!\xd4]\
-\xbe\xbd](\xff\xf7m\x1119\xf1\x08\xb2\xdc\xc8\xfe\
-\x1bu\xf9\xdf\xce\xe4\x0cFY?0Y\x0f\x14\xf7#\
-\xf5\x96K{\x07\xa1\xee\xf2\xed\xedB\xf9\xbfo\x8b\xb8\
-\xf1},.7nJ\x05\x81\x9a\xfcO^\xef\x95\xf9\
-_\xa4a\x81i\xb6\xafTo\xb9\xb4\xd8.u\x97o\
-o\x17\xca\xff}[\x14\xcbW]~\xef\xec\xf5_V\
-\x7f\x14\xd2\xab\xbb|{\xbbP\xfe\xef\xdb\xd2\xdb\xfc/\
-{\xfe\x93\xd6\x03\x11\xbc\x17 \xc8ee\xcf\x7f\x94\xff\
-;&\x94\xff\xfb\xb6\xf46\xffw\x16\xca\xff\xed\x13\xca\
-\xff}[(\xff\xf7m\xa1\xfc\xdf\xb7\xa5\xa7\xfc\xaf\xec\
-y\xae\xbbQw\xf9\xf6v\xa1\xfc\xdf\xb7\x85\xf2\x7f\xdf\
-\x16\xca\xff}[\xd4\xe5\x7fu\xdbM\x09!\x94\xff\xfb\
-\xb6P\xfe\xef\xdbB\xf9\xff\xe5\x10@\x03\xfd\x10\xf6L\
-\xd3\x1f\x11\x12\x06\xdb\x1dCgg!\xec\x19\xecZ\x04\
-\x5c\x07\xda\xc3\xab\xde\xfe\xeb\x00\xc4\xbc7X\xa6\x08\x11\
-\x83\xe5\x86\x80e\xfc\x03\x82\xf4\x03\xe5\x7f\xca\xff=!\
-\x8e\x0c\xd3\x0f\x11\x12\x06'\x84\xa0}\xfe\xa5\xfc\xdf\xc5\
-\xd0\xd9\xc1\x08\x01\xf4\x09\x82\xf2?\xe5\xff\xee\x10\xc9?\
-\xdc\x89\x08{\x06'\x17A\xfa\xcb\xe3(\x0f\x93\xe4%\
-\xc6\x94\xc6\xbba\xea\xb2\xceb@\xee\xb96\xd1\x90\xe9\
-\x82\xe9)\xffsb\xcb\x08n\x16\xf7j\xb87\x0a0\
-\xbc\x80l\x0c_r\x1d#\xd2\xb2\xc14\xd6\x03\xceC\
-\x84\xe3~\xde\x07\x08\xca\xff\x94\xff\xbb\xc4\xef\xd2\xb8F\
-0\x8f{\x08\xd2\xef\xfe,>\xa6&\xcd\x03\xd3V?\
-+\xa36\xc9\x02\xd3S\xfe\xe7\xde\xab\xc4\xa8\xdb\xbf\x1d\
-\xc5\xec\xda\x13\x8c\xad\xa1\x1bF\xae\xcc\xee\x22\xcc\x99\xe6\
-\x83\x11\x94\xff)\xffw\xca\xffL\xd6Q\x8c\xd4\xef^\
-\xfa\xe6\x98\x17\x19\x1e\x98\xce\xfa\xbd\xee\xbe\x00S\x1dm\
-\x88\xe91\xff\x93\xf7\x81\xf8r\x02e\xe5|%\x13#\
-\xd6\xb4\xc4X9D`\x14\xd3Y[\xf9cDZ\xd6\
-\x18n\xd8c\x8c\xec8\xa1\x8f0\xa2C\xd6\x182\xbd\
-\xe2q\xf8\x0e70\xe2\x03\x96\x18\xde\x95,\x8c\xd2\xfb\
-\xc3\xf5|\x8c\xf0\xa8\x10\xd3Xv,-\x04\xe5\x7f\xca\
-\xff\x1d\x11\xdb\x9d\xb6\x03\x11\xd0\xe7O\xa5`\xff\xe7\x86\
-:b\xda\xed\xeb\x1c\x0fL}\x86\x13\xe6E\xa2\x05\x86\
-\xf4\xbb\xba\xfc/\xab\x07\xe8^\x80\x88-%\x90\x96\xaf\
-\x85{,\x86\xb4\xdf\x8e\xe5\x8dQ\xf4\x83\xc0\xc0\x11C\
-\xa63\xf7I\xc5\x90\xdb\xc9er;\x99^\xf18\xe4\
-\xf1\xc9td\xfe\xaa\xee\x07\x16\xe7\xe21re\xf7\x18\
-a``0\x00A\xf9\x9f\xf2\x7f{D\xb2\x97\xf3\x1d\
-F\xaa\x87\xa7\xae9\xa6\xcd\xd7\xf3\x18#\x02\x05\xff\xaa\
-B]\xfeW\x06\x19\xe7M\xe6\x7f\x8bK\x18\xc5t\x02\
-C\x17\x8c\xcco\xe1\x0f0\xe4vrY\xe6\x7fiz\
-\xc5\xe3\x90\xc7'\xd3Y^N\xc0\xa8\xbaO\x91\x08\x8f\
-\xd8ade\xc8\xe4\xae@P\xfe\xa7\xfc\xdf\x1e\x81\xfb\
-\x9eF\x90zD;\x091\xaa\xfao\xda\xeboU\xfe\
-\xe7\xc5\xe6c\xd4\xe5\x7f\xf3\xa8G\x18\xf1A+\x8c\xb2\
-8T6\xe2 \x8c\xf8\xb0\x0d\xc6,\xa9\x04Cn\xe7\
-\xa1\xd8\xb2\x10\x91\xb65\xc6F\x12\x84Q<\x0e\xff\xdc\
--\x0c\x99\x1f\xef\xd6#\x8c\xec>\x15SF\xa0\xc4\xff\
-\xd6\xfc\x00\x8c\x5c\x19\x9eBP\xfe\xa7\xfc\xdf\x1e\xb1g\
-\xb0\xae\x22H\xffg\x079b\x94\xf6\xdf\xdc\xb3\xc6t\
-\xd6\xff\xce\x9a,\x0c\xa9\xbf\xad\x95\x0fF\xdd\xf7\x81\xde\
-\x02'\xa9\x82@Y;\xd0\xe36\x86,?\xe8;\x7f\
-\x04\xe5\xffW\x83\x9e\xf2?\xdc']\x0a\xf6\x7f\xc9\x1d\
-7\x8c2\xff\xbf\x88\xe7`:\xeb\xffp+\x13Lc\
-\xfb\x85\x83\xb1\x08N\xc3\xa8\xbb\xfc\xd5\xce\xfd*\x8c2\
-\xff\xf3\xfc\xb30\x8d\xd7\x7fN*\x82\xf2\xff+B\xcf\
-\xf9\xbfT\x0a\xf6\x7fu\xaa\x07F\x99\xffkbOc\
-:\xeb\xff\xea(\x02\xd7\x83l\x0ci\x87\x08\xd6\x01\x84\
--\xd7\x1b\xc3\x8b\xc8\xc1\xa8\xdd\x1f=Mz5Fi\
-\x7fp\xe8c\x8c\x5c\xfb\xaf\x04A\xf9\xff\x15\xa1\xe7\xfc\
-\xffB\x0a\xf6\x7f\xfd\x83\xb3\x18e\xfe\xaf\x8e9E\xd0\
-Y\xffK)\xb9N\xe0\xa6\xc5\xc2\xa8\x1c\x07\xa5.\xa4\
-\xf7'\x11|\xe6CX\xbb\x86c\xba\xbb\x1e(\xed\x03\
-\x8a(\xc4\xc8\xe9\xf8\x02A\xf9\x9f\xf2\xff\xcb\xe4\x7fE\
-n\x09L0n\x87\xd8\x18e\xe3E{\x0b\xc2#\xb6\
-\x18nR)\x01\xe5\x7f\xca\xff/\x97\xff\xdb\xd9\xfe3\
-\xc6t\x97\xff{\x1d\xd2vj\x9e\xaf\x11\xc6\xd7\xd0\x14\
-\xa3X\x0f\xc8\xfe^nZ\x0d\xc1\xcb\xd3\xfe\xa3\xfc\xdf\
-\xb7\xfd\xdf\xb4\xff'\xde\x1d\xa3\xbc\xff\x87\x8dQ\xbb_\
-\xd4L\x86\xa71F\xf1\xfed#\x0a\xc2t\xda\xff*\
-\xfa\x7f\xcc\xfc\xb31\x8d\xfe\xef\xa2\xfe?\xca\xff}\xca\
-\xff\xdd\xfd\xfe\xa7\xe2&Ag\xd3u\xd5q\xba\x9a`\
-\xb6)Fv\x1f8h\x89\xe9t\xbb\xef\x15y\xffG\
-\xf9\xbfw\xfb_Bg\x99`\xa4\xfe\x8fq\x16`:\
-;\xfe#\xef\x8a\x11\xc6a\x1f\x1b\x13+6\xc6(\xa6\
-\x0b33\xc18k\xb00\xc5a\x86\x18r;\xb9\xec\
-\xfc\x0f\x1b\x13\xc63\xc1(\x1e'Ft\x1aC\xe6\xf7\
-\xe8\xca)Lw\xfb??\xd0\x08\xa3\xd8O\xd4\xe9\xeb\
-\x7fl\x19\xa6\xad\xe3?$\x0c\x8e\x11\x82\xf2?\xe5\xff\
-\xf6\x88\x03\x83\xf5=B6\xfeS\xcf\x1c\xa3r\xfcg\
-\x8a\x00\xa3l\xfcg\x8a\x871\x86<n\x08\xdb\x04\xa3\
-\x98\xee\xe2qS\x0c\x99\x8e|\xce\x92\xd5#\xe92\xb9\
-\x9dL\xafx\x1c\xf2\xf8d:2\xff\x9e\xba\x0f(>\
-\x0fv\xf4y\x8f\x9bP\x8eQ=\xfeS\x80\x91\xf9\x9f\
-\xceZ\x89\xa0\xfcO\xf9\xbf=\x227\xff#_\x8at\
-\xfe\x87\x13FU=PFF\x80\x03\x86<^\x98\x95\
-\x0dF1\x9d\xcf)K\x0c\x99.?\xca\x05Cn'\
-\x97\xc9\xeddz\xc5\xe3\x90\xc7'\xd3\xa5y\xf30\xbd\
-\xc6\xff\xc9\x95\x18\xd9\xbc\x93\xa8\x12\x02\x15~n\xd6\xee\
-;\x97\x80\x91\xcb\xeb\x09\xa2\x0b\xe6\xffP\xfe\xef\x83\xfe\
-'\x05\xb6Y\x8e!\xc8\xf2\xf3\xd67\xc7\xbc\xc88\x8b\
-i\xaf\xff\xc9\xf8\x10\xe4\xfd$\xcd\xcf\x1e\xa3\x98\xee\x8e\
-\xbb\x08s\xe1\x84\x05Fq\x9ey5\xfc\x8f \xb7\xdf\
-9#\xc2(\x1e'\xd5\xd7\x1e\xe3\xa5\xc7\xc3\x94&\xb8\
-a\xeaR\x85\x18u\xf9\xbf\xad\xf39T\xc1\x0d\xcf\xc7\
-\x08\x8e\x0a1\xb2\xe7M\x06\xeb0\xa2\xa3~\xa7\xfcO\
-\xf9\x1f\x89\x87\x06g\x08\x02\xb6!R0\xd2z\x10\xc0\
-\xe6cj\xd2=0\x1d\xbd\x1f\xa8\x9b\x17I\x16\x98\x1e\
-\xf3?y\xbd\xef\xac\xdf\xaf=\xc5\xd8\x1a\xbac\xe4\xf2\
- \xe2tH\xe3vP\xfe\xa7\xfc\xdf\x15\xd2\x18\xf7\x8d\
-\xfdP\x8a4\xfe\x93\x19\xe6\xae\xb7\x18S\x9a\xe0\x8ei\
-o\xfc'u\xd1\x90\xe9\x8c\xe91\xff\xab\xe8\xbfi\xe6\
-gi\xfc'\xb3\xab\x0f0V\x92p\x8cP\xdb\x06#\
-\xbb\xde3\xd9y\x082NWW\xf9\x9d\xf2?\xe5\x7f\
-y\x11\xef\xe1NB@\xdf_\x93\xd2\xe6\xd8\x8e\xbd\x99\
-\xea\x18C\x82n\xf6\x7fW\x03u\x0fC\x90~\xe9.\
-\xbfS\xfe\xa7\xfc//\x06\x06\x06\xaf!\xec\x19\xec\x9f\
-\x11P\x07\x0f)\x0f\xa4\xd4IQ\xbbo\xdb\xe4\xff\x1e\
-\xba\xfew\x80:)\xd9R<\x10\x12&g\x15B]\
-\xf1\xbf)\xff\xf7m\xff\xbf\xec\xd2S\xfeW\xccG\xdd\
-vSB\x08\xe5\xff\xbe-\x94\xff\xfb\xb6P\xfe\xef\x9d\
-\xf2\xaa\xb5\xff(\xff\xb7O(\xff\xf7m\xa1\xfc\xdf\xb7\
-\x85\xf2\x7f\xdf\x96\x9e\xf2KOA\xf9\xbf}B\xf9\xbf\
-o\x0b\xe5\xff\xbe-\x94\xff\xfb\xb6\xb4\xd7\xffE!\xa7\
-0\xbe\xa7L1N\x1a,\x8c\x1f\xfc\x8fx\x16z\x0a\
-C\xf9\xff\xe5\x10\xca\xff}[\xda\xeb\x7f_C\x13\x8c\
-\xb2\xf7\xa7d\xbd\xa0\xfc\xffr\x08\xe5\xff\xbe-\xb0\x8c\
-*\xa5\xe0\xf2z\x1ey\x0a\xa3\xac|\xc9\xeb\xbd2\xff\
-;\xfdC\xd0\xd3~'\xf5\x96\xf3=\xb6K\xdd\xe5\xdb\
-\xdb\x85\xf2\x7f\xdf\x16XF\x09Rp\xb9\xe5\xfa\x18a\
-\x94\x95\xf3eCSLo\xbb\xfe\x93z\xcb\xf9?\x09\
-\xa1\xee\xf2\xed\xedB\xf9\xbfo\x8b\x98\xc9:\x8e \xcb\
--\xe0\xb4)FY9\x93\xcf\x7fd=p\x84\xd7z\
-\x04\xd9.T\xd7\xf3_\x10\xcb\x04C\xdaa\xcf`\x9f\
-\xb2\xef\xc0w\x98\xfa\x9aP\xfe\xef\xdbb\xbb\x93\xf5\x16\
-\x02\x96Y\x91\x14\x5c~\x89\xce\xa71=\xed\xc7\xf6\x92\
-\xe2n\x8c\x91\xf9\x9d\xce.G\x88\x18\xa7\xc7#\xd4]\
-\xbe\xbd](\xffS\x82\xc4\x9e\xce\xf9\x1d\x01\xcb\xb0\x1e\
-\xc3d\x01D\xb4\xf04\xa62\xca\x10\xa3n\x7fW\xdd\
-\x22\xb8\xe3`\x8c\xb1\x87:\x22H\xff\x8b\xe9\xac\xed\x08\
-u\x97\xe7\xcb&\x94\xff)Ab\xcf`\xedDH\x14\
-\xe6\x93y\x1fca\xee\x9f5\xc6\xf4T|W\xb2\xde\
-\xa5{\x1ac.\xea\x9bb\xe4\x9e\xf3\x1a\x10Pg-\
-\x84\xba\xcb\xefe\x17\xca\xff\x94 q\xa0s?CH\
-\x18\x9cT\x82\xa6\xefU\x5c4Y\x98\x10\x8e\x09\x86\xbc\
-\x1e\xe7\x5c2\xc2\x14\x04\x9f\xc2\x94^# \xeb\x0b\x09\
-\xb9\xbe \x88 \xc7\xc7\x08\x13\xefh\x8c\x09\xe1\x9a`\
-\x5c\x0f\xb20\x8a\xf9K\xa4\xf3^\xed\x99\x9co\x10\xea\
-.\xafWM(\xffS\x82\x84\x8ck$\xa6s6#\
-$L\xf6-Ls\x7ft/LN<\x86\xc1\xd9\x8d\
-\xb0\xdak5\x14\xa1\xee\xf2y\xd5\x85\xf2?%-\x89\
-p/g\x0a\xc2\x9e\xc9\xde\x84\x900X\xd6\x18:\xfb\
-\x06BL\xc6Ec\xb0\x1fI\xa9R\x00\xaf'\xd3\x89\
-\x19\xac\x08\x02\x8e\xad\x94\xbf1L\xd6\xff\x10\xea\xb6\x97\
-\x92\xa6B\xf9\x9f\x12J(\xa1\x84\x12J(\xa1\x84\x12\
-J(\xa1\xa4u\x01=\x22\xa14Z\xffV\x96\xf1\xd7\
-\x89\x87+_\x0eE\xcb\xfd\x95/+\x9a\xa2\xb0\x5cG\
-,/Q\xb6,\xfd8\xf2pj\xb9\xe3\xcb\xb2\xc2l\
-\xefr\x9d|m\x5c\xd2|\xb9\xc9\x97\xab\x877_\x0e\
-\x95_\xee\xdf|\x99\xd6D\xda\xbd\x5c\xd7ty\x09\xb5\
-\xfcr-w\xd6\xff*\xeb\x97\xaa\xfa\xa9\xaa~7\x9e\
-\x05r\x17\xbc\xf6-\xf7\x86\xf3\xffe^Vu\x7fP\
-u\x7fQy\x7fRu\x7fSu\x7f\xecF\x99\x015\
-Y\x0a1\x80\xf4\xa3M$,[J\xa3\x84\x12Jz\
-Xp\x0c\x7f\x06{\xa3\x88\xc1\xb2\x123\xd9\xd7\xe1\xff\
-$H\x1e\xa4RJ\x1e^\x07\xb7I\x98lK\x94\xb6\
-'c\xfew\x87x\x18\x18\x0c\x920\xd8k\xc5\x0c\xd6\
-\xd5N\xc4H\x8f\x11\xa31b]\xf8\xbd\xa3\x9e\x101\
-\xddt\xa1\x98\xceJ!\xed\x10\x1e\xb4\x046\x16\x17\x01\
-\xdf#\x0aX\x84e\x02^\xccS`\x96X\x02\xcc\xee\
-W\x10\xc0\xffh\x9dEh\x06N\x83\xd2\x8a\x0eX\xc8\
-\x97C\xb2\x90\xc9Y\xa0n\xbb\xda\x22\xb0\xfe\xee\x80\xfa\
-\xd6\x22\xbd\x05\xfa\x12`\xe9\x9b\x88ml\xef\xf7q\xd1\
->h_\xa1\x9e\x84,\x83Z\x11\x83\xb3M\xdd\xf6\xb5\
-&b&\xeb7\xa8g\xbd\x88\xc9\x06|\xe7\xeb\x80\x9b\
-V\xd5\xf9\xef\x82\xc3cX;_C\xdf\x01\xc2\xdf\x0c\
-\x900Y\xbf\xaa\xdb\xce\x96\xc4\x81n9Z\xc4`\x17\
-!_\xf1=\xa3;o\xb7\x02V\xf0\x98\xb8\x1e0\xd9\
-\x05B\x0d\xce(u\xdb\xab(\xd0v\x03\xa4\x9f-\xc7\
-\xb3Sv\xf2\xe2\x0a\x81\x9d\xa9\x07\x10k\x98\xe3_\xde\
-\x9d\x22\xd96;\xb6'Q\x06t\x8e\x9e\xba\xedU\x14\
-\x11\x93\x13\x8ftC\xd7\xb7\xce\xd8ogr\xa6\xc9=\
-\x00\x95\x01\xb9\x0d\x1d[\xba\xfe\x8e\xba\xedU\x14\xe9}\
-\x1cpS\xda\x7f\xad\x93\x07\xf9]\xde~\x91\x86E\xe3\
-vxl\xe9\xfa^\x17o\x80\xd4\xb7\xb3\xe7yk\xfe\
-\xc7\xe5#]\xafn{\x15\xa5\xab\xec\xc7\xe7?,\x03\
-\x11:\xff\xe1\xaf\xfc\xf9\xdf\x17\xecWy~P\xf6\xbf\
-2\xf6w\xe2\xb9\x80\xb2\xbf\x97Ig\xecW\xb7\xee]\
-!\xaf\xa2\xfd\xe8\xfbc\xf6L\xd3\x1f\xe1s\xbc\xbb\x84\
-\xce\xce\xb2\x87\xcf`\xca\xc6M\xf7t\xfdo\x85Z1\
-\xd4U\xc4`\xb9A\x9d\x7f\xe8\xe87\xd4\x88o\xe2r\
-B\xda:n\xbc\x17\xd9\xdf\x14:;X\x00mi\x8f\
-\xed\xe8;\xb3\xf6\x0cN.\xb2\xcb\xe3(\x0f$y\x89\
-Ai\xbc\x9b\xd2\xef\xfe6d\xbat\xc8~N;\xbe\
-\x97\xdb\x9e\xef\xea\xf2\x02\xb2\x01_r\x1d\x88\xb4l\xc8\
-\xe7\xa5\x87\x8e\xfby\x1f\xb4\xc9v4\x07\x81\x18O\x0c\
-\xfcY|P\x93\xa6\xfa\x1b\xe8\xb5I\x16\x1d\xb2\x9f{\
-\xaf\xf3\xdf\x0bo\x0d\xb3kO\x80\xad\xa1\x1b\xa9\xdb]\
-s\xa6\xf9`\x95\xf63YG\x91\xed^\xfa\xe6\xe0E\
-\x86j\xdb\xeb\xee\x0b\xf0\xfc\xc9\x8e\xb6\x7f8\xf1\xe5M\
-u\xbe\x02\x9f\xf14-\x81\x95C\x84l\x9d\xb5\x95?\
-\xf4\xa55\xe0\x86=&\xd2\x84>\x02\xa2C\xd6x=\
-\x99\x86\xefp\x03\x88\x0fX\x02\xde\x95\xac\xa6\xf5\xe1z\
->\x10\x1e\x15J\xf5k}\xde\xa6\xedN\xdb\x81\xd0\xf6\
-\xa7\xc8\xfe\xdcPG\xe5v\xe7x\x80\xfa\x0c'\xf0\x22\
-\xb1\xf1\xfb\xf2\x9di\xffqP=\x88-\xc5\xfaZ\xb8\
-\xc7\xe2\xeb\x89\x1d\xcb[f\x83\xc0\xc0\x11\xaf3\xf7I\
-\xc5\xcb\xe8\x17-\xa3\xf5d\x1a\x94\x1e\xadC\xfb+\xd6\
-\x03\x8bs\xf1\xa4~\x8f\x0d\x0c\x0c\x06(\xf5\xfd^\xce\
-w\xe8\x18\x9e\xba\xe6-\xfb9Fy\xbc\xae\xaej\xff\
-\xa2>?l\xbf\xc5%\xd9:\x81\xa1\x0ba[\xf8\x03\
-\xbc\x8c~\xb1\xfdp=\x99\x06\xa5G\xeb,/'4\
-\xabS\x08\xe1\x11;BG&w\x852\xfb\xe1\xf6\xd3\
-\xe8\x18\xd1N\xc2f\xd77U\xf3\x87I\xfby\xb1\xf9\
-\x9d\xb2\xdf<\xea\x11\x10\x1f\xb4j\xd2\x87f#\x0e\x02\
-\xe2\xc36\xc0,\xa9\x04/\xf3\x12K\x80H\xdb\x1a\xd8\
-H\x82di\xf8\xe7n\xe1\xfdx\xb7\x1e\x11u*\xa6\
-\xe9\xb5\xd5\x9a\x1f@\xea\xa84V\x91=\x83u\x15\xd9\
-\x9f\x1d\xd4\xb4\xee\xd7\xde\xb3Vi\xbf\xb3&\x11\xab\xd1\
-\xd6\xca\xa7\xd3u\xa0+\xe0$U4=\x07<nc\
-\xfd\xa0}\xfeJ\xeb?\x83\x9d\x8e\xec/\xb9\xe3\xd6\xc4\
-\xfe\x17\xf1\x1c\x95\xf6\x87[Ic\xd529\xc0\x228\
-M\xed\xf6s\xefW5\xb1\x9f\xe7\x9f%\xf5?'\xb5\
-\x15\xfbK\x91\xfd\xd5\xa9M\xaf\xfb5\xb1m\x88\xcf\x13\
-e\x08\x5c\x0fJ\xfb\xac`\x19\xd8r\xbd\x01/\x22G\
-}\xf6\xa7W7\xbd\x0f\x84>&\xeb\x7fI+\xf6\xbf\
-@\xf6\xd7?h\xda\xce\xa9\x8ei[\x9c\xb1\x92\xeb\x86\
-\xc0MKy\xcc\xd2\x0e\x01\xcbR\x04\xcf}k\xd7\xf0\
-\xf6\x9f\x03\xf2\xd7\xc0\x88B\xf2\x98/\xba\xcb~\x92[\
-\x02\x13\xe0v\xa8i\xbb\xb8+\x10\x1e\xb1\x05\xdc\xa4\xd2\
-\xee\xb4_I\xfd7\xee\xf6\xf8\x13\xca\xce\xa9<_#\
-\xe0+\x17\x07\x13]\xf7\xb9i\xddV\xff\x89\xeb_\xbc\
-\xbb\xc2\xf5O\xfd\xdf\xeb\xc8\xf04\x96\xd5'\x1bQ\x90\
-j\xfb\x15\xae\x7ff\xfe\xd9*\xaf\x7f\xed\xbd\xff\xb5\x14\
-\x97Dq][\xd2\xb4\x95`6Q\x0fD\x07-\xbb\
-\xe7\xfeGg\x99 \xfbc\x9c\x05*\xdb?yW\x8c\
-\x80\xc3>6\x88\x157\x9e\x1baf&\xc0Y\x83\x05\
-\x8a\xc3\x88e\xf4\xeb\xfc\x0f\x1b\x84\xf1LdibD\
-\xa7\xf1~\x8f\xae\xb4?vc~\xa0\x91\xec\x9a\xa8\xd2\
-\xff\xb1-\xb7\x7f\xe03\xbd\x912\xfb\x1d\x18\xac\xefq\
-\xfbW\xaf\x85\xf6oJ\xd3\xf6o\x8a\x07Q\x1fC\xd8\
-\x8d\xb6]<N\xc4\x8bA\xe7,.#_\x22N,\
-ZO\xa6A\xe9\xd1:\xb4\x7fG\xea\x80\xcav6<\
-\xef\xb9\x09-\xb5\x7f\x05\x84\xfdt\xd6Je\xf6K\x9f\
-\x7f\xf2\x89\xe7\x1f\xa7V\x9f\xfb2\x02\x1c\xb0\x1daV\
-6\xb2u>\xa7,\xf1\xba\xfc(\x17\xbc\x8c~\xd12\
-ZO\xa6A\xe9\xd1\xba4o^\xd7\xd8\x9f,}v\
-\x8a*Q\xfa\x1clq.\x81\xdc\xefIk\xcf?H\
-`\xdd:\x86\xf4\xf3\xc6\xcf\xbf-\xf7w P\x7f\x08\
-\xaa'i~\xf6\xb2uw\xdcE\xe0\xc2\x09\x0bY\x9f\
-A5\xfcE\xcbw\xce\x88diR}\xed\x81\x97\x1e\
-\x0f\x94&\xb8\x81\xbaTa\xa7\xeco\xe99\xa7Y\x7f\
-Hx>\x10H\x9f\x7fE\x0c\xd6\xe1\xd6lG\xe2\xa1\
-\xc1\x19\x02\xebH\x0a*\x83\x006\x1f\xd4\xa4\xab\xee\x03\
-\xe8\x0c/\x92,:f\x7f\xb2\xea\xbe\x13\xee\xb5\xa7\xc0\
-\xd6\xd0\x9d\xdc\xe7^[\xc7\x11\x11}\x7f\xec\x87D\xff\
-\x97\x19\xb8\xeb-\x86\xferW\xda\xff\xd5\x19\x1a2\x9d\
-;f\xbf\x92\xbe3\xd4\xffev\xf5\x01\xb0\x92\x84\x03\
-\xa1\xb6\x8d\xb4=\xce\xceC}zm\xb1]v\x1e\xec\
-\xe1N\x82\xf6_\xeb\x89\x98\x1b\xd51\xed\xb7\xbf\xad\xc0\
-\xe3\x87ut,\x1d\xbcV\xbcf\xcf`\xff\x0c\x8f\xe1\
-!!\xe2\x00\xd5u\x8b\xfd\x1d\xf0\x7f+\xd4A\xb2\xc5\
-Hg&gUG\xfb\xbf{B:b?\xb9\x8f\xba\
-u\xef\x0ay\x95\xec\xef\xa9\xfaO\xd9\xdf\xbb\xed\xefH\
-\x9b\x8e\xb2\xff\xd5\xb5\x9f\xfc\x86\x1f\xf9\xed\xbe\xce\xc6\xec\
-\x7f\xd9\xecW\xfc\x86Yg\xbfY\xd2\x8b\xed\xc7\xdfv\
-R\xfc\xa6\x93\xe27\x9c:\xf3\xcd&\xb9\xef.\xf5\xba\
-\xf1\x8f\x12\xe9\xb7m\x14\xbfi\xa3\xf8\x0d\x9b\xce\xf8_\
-\xee\xbb3\xbd\xee{3\xe4\xb7=\x14\xbf\xe9A~\xc3\
-\x83\xfcvGg\xce\x7f\xf2\xbb\x1b\xbd\xf1{\x1br\xdf\
-6\xe8\x96\xef\x19\x90\xdf\x1e \xbf9\xa0n{[\x12\
-Y\x5cwi<\xf7\xae\x88\xe3N\xc6`'c\xaf\xf7\
-\xf6\x98\xebr1\xadeq\xac;\xd2\xdfK\xc6\xa2\x96\
-\x8bA\xdd\xf0\xb2\xc4\x9dn\x8c\xe7K\xdc\xab\xc8\xf8\xbd\
-d\xdc^2^\xaf|\x8c^26/\x19\x93W!\
-\x16\xef\x83\x97-\xf6.\x19\xcb\xb4S1L\xa5qH\
-_\xf6\xf8\xa3d\xfcF2n\xa3\xb81^\xa3,F\
-\xa3X\x16\x9bQ\x1a\x93\x91\x8a\xc5H\x09%\xdd.\xad\
-\x84\x100\xe8\x87\x7f\xea\xa4\x11\x13\xaai\xb4\x09\xe8\xb7\
-D\x1a\xe2 \x9bF\x1b\x8c~C\xa51\x0d\xba\xeeW\
-\x1f4\xfe6\x10j\xea\x93\xb1\x1b\xaa\x89\xdf\x09d\xac\
-\x07\xf27\x9b\xf8\x1d\xdcS\xbf\x8a\xf9\x93z\x91z\x92\
-zc\x13\x88\x98\x0f\x0d]]N\xc4o\xb6\xd4\x0f\xa4\
-_H?\x91~#\xfd\xa8<N\xc4l\xc8\x16\x9a\x5c\
-\x9c\x88)4J^Q\x11\xef\xe1\x0e\x82\xed\x92Y\x22\
-\x06k\x87\x98\xc9\xb6\x82\xf7]\x17\xc8e).h\x1d\
-\x9e\xc3\x0d\xd3\xa0\xb4\xea\xd6\x17\x89\x98n\xda_\xc20\
-\x9d\x02\xdb\x09\xfb\xa0~\xf7E\x9a\x16@xT\x00\x04\
-'\x1c\xf1\x18P\x81\x91\x1b\x01\xfa\x0f\xd7\xa1m\x22M\
-<\x8f2\x07\xb6)\x0e\xc3g\x86\xa9B&\xa7\xbf\xda\
-\xf4g\xb0\x7f\x82\x5c\x13\x1d\xb0|a\xc3\xbf\x0c\xac\xbc\
-c\x898\x00w\x8a\x80\xd9\xbdr`\x96ZI\x00\xff\
-\xa3uh\x1bJ\x83\xd2\xa2}\xf0\xbe\x0c\xce\x8fj\xd1\
-\x9d\xc9\x9a\x05\xf3\x7f 8\xee\x00,\xfd\xef\x01\xb3\xbb\
-em\x1e\x7f\x85\xd2Z^\xb9\x07\xd0\xbe\xe8\x9d\x14|\
-.\xfc\xa4Gugp\xc7\x88\x18\xec0\xc1)\x17`\
-\x1e\xfd\xa4]z\x9b\xdf\xc8\x01\xe6\x91\x0f\xf1\xfc{\x1e\
-\xdc\x17\xd5-X\xf7BDL\xce\x98\x9e\xd2\x1f\xe6\x85\
-\xe2\x09<Ec\x9a\xdb3\xee\xcf\xda>\x04\x88\x0e\xf1\
-\x81\xe8\xb0-\xf4Y2^gu\x19\x8f\x81x\x0a\xf9\
-\xad\xa7\xf4\x87yi\xa1\xf1v\xed\xa93\x08\xd1A+\
-Y\x7f\x99-\xef\x82\xcc'\xe8X\xe8\x98=\xa8\xbfA\
-\xabcm\x94`\xcb;\x0fD\xff\xf0\x00\xbaN\xa1q\
-\xd9\xe4z\xa9M\x06\xbd]\x7f4\x86\x1d\xc5[\xb0:\
-\x7f\x1b\x98\xc9\xcdg\x7fY\xf4WFo\xd5\xdf\xce\xd8\
-\xbd-\xef\xf5{\xbb\xfeY\xd2\xf4\xaaX\xdaK\xf5\x0f\
-\xe9)\xbd\x9082L\x078\xec\xe5N\x930Xh\
-\xceI\x82=\xd1\x0f\xd2\xac\x0f\xa8\x1b\xeaOKTA\
-\x12\xc4h\xfe\xcb\x1e\xee4\x01\xd4\xad5\xdd%\xffp\
-\x07\xd838h\xac\xe4M4?0\x8co\x03b\x9c\
-\x85 \xce]\xd4\x88\x9b\x10\xf8\x9e\xb6h\x93\xfe\x96\x9e\
-\xb7\x01\xdf.\xb8\xc3X[_\x05\xb6,or\xbe\xdf\
-M1\xd4\xcdq?O\xa9\x0d\xb0=8\x0b\xea~\xc7\
-K\xcf\xbc\xfe\xe9M\x17<\xde\xbb\xe1\x81\xc2\xb8\xacl\
-7\x10\xeb`\xde&\xfd;=\x8f/\xb2\x08p\xc3\x9e\
-\x00\xf3K)h\xac^=\xcc\xf3\x0el\xef\xb5\xd8V\
-\xb2\xddi\xdb\x0f\xea~\x1e\x8d=,\x88vian\
-\xdaY\xac\xfb\x8bD\x1e\xee\x83o\xeb\xf5\x93\x93\xf0\x1c\
-pn\x11c(-\x9dn\x02\xbbSg\x80YP.\
-\x9eK)8\xe1\x0c,\xce\xde\x01\xdc\x1b\x85\xc0\xda&\
-\x10\xd8\x9e>G\x8c\xab\xbc\x98\x0c\x84\xc7\xc4\x80\xe7\x9f\
--\xb3\xc5\xfcr\x1a9\xd6\xd4\xd3\xc0\xc0\xa0\xd9\xd8#\
-\xc9^\xee\xfb\x0e\xfb8U1N\x02\xd9x\xba\x86\x07\
-\xee\xa0\xee\xbe\x10\xd4%\xdb\x80\xda\xbb|Ps\x87\x98\
-o\xd3\x1e\xfd\xb9\xe95xL 7\xf19\xe0\x8ba\
-\xfbGO\x02x\xd7r\x81yH6\x10i\xdb\x00\xbe\
-{\x140\x8b}\x06l-/\x03\xa1\xae\x18\xa7\xb3\xbc\
-\x90\x08\xc4\xb0\x9dd\xee\x9b\x22\xb3\x1d\x8d\x9f\xc3c\x85\
-\xf7q+\x85\xfb8\xef6\xab;\x0c\xf6\x06wm3\
-\xf0 \xd8IV\xdeu\xc9\xb6-\xce\x8d#\xf57k\
-\xc7\x9c\x05\x04\xba\xef\x0aX\xe7p,\x10\x14\x17Lx\
-\xca\x15\xb7\xe3\xd03\x82\x8dc(\xb0\xe3z\xe1t\x16\
-aY@\xa8\x0f\xed\xbc\xf5\x18p\xa0=\xe4\x18X\x8b\
-\xb3\xf1\xb8\xfd\x07\xf3^\xaf\xa8\xbf=\x83e~\xfe\xb8\
-\x05(K \xc6\xf87d\xb9\xc2\xf2n\xf9\x9dl\x82\
-\x931~og#\x0e\xecP\x0c\xafv\x81\xc6\xebG\
-\x13s \xd1\xf8E\x01\xacW\xb0\x9e\xf3\x9a\xd5\x1fX\
-\xaf\xd0x\xe2\x17\xd2q\xa9h\xfc\xa4\xb2\xf9\x19\xe8\x9d\
-\xc2\x05\x03\x16\x9e3\xc1w\x0d\x87\xed\xf8\xc7\xdd\xa7?\
-\x9ao!\x9d\xc3\x89\xc6\x9d\x0a\x0c\x9cP\xf9\x9fkA\
-\xff\x00\xdf\xd3\x96\xb296h\x1eik\xf3k\x1e\xfa\
-\x1a\x01'M\x14\x07\x88\x87\xe3\xa9\xa1k}\xbb0=\
-\x0b\xac\x9d\xc2\x00/\xb1X\xf55@\xaa?'\xa2\x08\
-\xd8\xc1s\x1e\xea\x1f\xd0Y\xfd\x11\xc5\xd7N\x81\x9b\xb6\
-&\xc0\xcf\xd0\x14\x5c\xfe\xb7\x1d\x9c4\x05\x9e:,\xe0\
-\xb0\x9f\x8d\x9e\x83\xf13Y\x17\xe8/\xad?gU\xd6\
-\x9fNs\xcb\x10<\x0d0\x02\xb7\xecN\xe3\xf7Y\x82\
-\x7f\x9d\x95\xcf\x0fU\xa8?vJ\xea\x0f>\x7fO\xc0\
-\xf37Q\xf9\xf9\xab\xf8\xdeU~Y\xfe?\xf9\x8dk\
-UvTD\x1a\x82\x1b\x96&\xb8\x0eZy\xc5t\xee\
-\xfc\xa5\xb36\xb8\x1f6\x039!\x8e-^?\x8bB\
-\xe19\xab\xcf\x02w]\x09\x9f\xc4\xc0k(\xaa\x07e\
-7\x88\xf9$g\xb4Y \xed\x1c\xb1\x0d\xbdS\xbc\xc6\
-3\x01\xe57T\xdbPr\xfd\x14\xbe\x16[\xbb\x5co\
-\xb1\xec\xb9-\x5c?%\x0c\xce\x1f\xcd\xcb\x9f-\xbd\x7f\
-\x09\x1b\xef_\xd9\xe4\xfd\xcb\x16\x14\xdc\xb0\x06^z\x5c\
-\x10\xe7d\x81\x97o\xd8\x98\x83\x0b\xc7\xb9\xa0,\xda\x1a\
-\x14\xc1m\xce\x9a\x1c\x90\xeci\x89\xb7]16\x03\x81\
-,6\xd4M\xf9\xbcjy\x9a\xe8\x0f\xcb\x9b\x9bT\x81\
-\xf5\xe6\xa2y\x00\xd1\xcd\xef_\x22\x86i\xb3\xfb\x97\xb4\
-\xfdp\xc1\x0b\xb7\x1f\x5c\x9b\xb5\x1f*\x93\xcf\x80\x00\x0e\
-\x1fd\x05\x12\xfeI>/\x01!\x16\xd68\x16@\x15\
-l'\xf9\x18Z\x82\x87\xd7\x88{_\x94\x83\x00D;\
-\xd8\x82\xaaD\xdbv\xe9\x8f\xe7\xbb#}\xa3\x9a\xb7\x85\
-x\x8d\xed\x07\xef\x96\xda\x0f\xd2s`6\xb4!\xdeK\
-_y\xfb\xad;\xe6!`\xfd\xed\xc3d\xf5\xbcy\xfb\
-\xed>\xd9~\x8bGm\xcc\x96tG\x82\xda\xfeP\xff\
-\x1f Qh~A\x8b\xed\xe7vr\xdf\xdb\xb2M\xfa\
-\xdb\xfd\xeb\x0a\xf8\x82\xe6\xedg\x1b\xf6yr\xbe@\x94\
-\x88\x09u\x83m|e\xfa#\x11\xef\xe1\x0e\x80ig\
-@\x1bXh<\x12\xa4\xba3c`\xd1\xf5\xbe-\xfa\
-+\xa1ZL\xc4\xd45\xb5\xdf\xcb\x9d\x8etkM\xf7\
-\xae\x16\xa8\x7fH[\xf4\x97\xdaj\xd0\x83z-E\xf9\
-\xb5\x81\xac^\xaa\xbfAW\xd6\x1fu\xe9\xdfU\xed\x89\
-\xde\xa0\x7fa\xf0)\xfc\x5c\x80\xee\xcf\xcf#_>\xfd\
-\x03MM\xf03\x8d\x93\x06\x1b\xc4;\xb6o\x9c\x9e\x1a\
-\xf4\xd7\x86\xd4\x96\x857\xb6\xaf]\x0e6\x8e\xa7\x0d4\
-m\xfbXRt\x0c\x09\x11\xbfK\xbb\x07\xf5_\x0b\xc9\
-\xbf/7\xd75\xd2\xe64p9\xc0\x06\xeeZ,<\
-\xbe\xad\xad\xfa\xa7\x9e\xc5\xe3\x1f\x0b \xebzJ\x7f!\
-\x9d5\x16\xe6\x17v\xe9\x84)\x9e{L\x96c\x9e\x9f\
-\x11\x9e\xbf\xdc\xd6\xf1\x8d\xe8\x9cAmX{:;B\
-\xc2`5k\x93u\xa7\xd8\xd39\xa8\xad\xf4\xe0\xbc\x9e\
-)n7\x97\xddh\xfb\xf8\xdbr\x986\xc3\xcb\x08\x5c\
-4\xc0c\x10\xf3`\x9bfQO\xea.\xb3\x81\xc1^\
-\x05\xf3\x0fw\xd1d\xbf\x0853\x01I.\xc6x\xac\
- \x1aK\x5c\x1eA\xf8\x01\x81\xf4}\x16F\x8c#D\
-\xd7'\xf4l\xe0z\x80\x85\xea|\x14<\xc6Zu\xe8\
-\x8e\xc4\x81\xce\x1d \xa1\xb3\xa7B\x0eJ\x98\xec\x07\xce\
-\xf0\xda\xe3q\x98\x05\x90O.\x1d7\x05>'\x09\xd0\
-\xff\xf3\xfa\xa6x\x1bJ#A\xf36\x19\x1c\x1d1\x83\
-\xf3_{&\xa7G\xdb4\xcaD\xb8\x973\x18\x96\xe7\
-\x1cX\x8fwA{\xac\xe1\x7f7\x88\xaf\x1471\x83\
-e\x03\xf5\xdd\x0d\xafO\xf3\xc4L\xd6K\x15\xb7\x9f\x12\
-\xe5B\x8c\x16\x92\xff\x0d\xc5\x1f\xe1B\x03\xb4\xf4\xe5\x7f\
-\xeb\x88\x8f3\x11\xc3\x90:\xf5\xab\x8f\x8eO|R\x87\
-F\xcbF\xbf\x83\x1b\x7fC\xd1o\xff\xee\xfbU\xcc\x8f\
-\xd4\x03\x0d\xe3\xea\xa4]\xc4/YN\x8a\xe5G\x96\xab\
-By\xa3qZ\x13i\xc4'|d\xe3\xb4Ft\x85\
-g\xd5+\xf0Ym\x88\x88\xc1\xfa\x12^/vB\xb4\
-\xa5\xec\x84\xd7\xbe/\xd1\xb6n\xcb\x97n\xfa&\xbcV\
-\xb1E\xfb\xb8\xcf\xd0\xd8\x0e\x1b\xdb+\xc0\xda!\x14\x83\
-\xfe\xe3\xf1\x1e\xfb\xb8eP\x17\x9e\x90\xc9y\xb3K\xf3\
-f\xb2\xde\x86\xc7M\xb6\x11\x04\x00^\x82\xf2~Y\xb4\
-\xcd\xc6\xce\x9f\x88]\x00\xf7\xe9\xb2\xfc\x19l{dg\
-k}\xa9\xa8\xaf\x95\xef\x15\x83\xdf9\xa0\xb4p\x1fI\
-\x17\xe6_jv\xb7\xf5w\x22\xa2C\xc4\x18\x10\xd4\xdf\
-\x88\xd2\xa2}\xba0\x7f\x95}\xe1\xb6\x96\x97\xb0\x0ed\
-\x9f3\xda\xa7'\xf3W\xa4'\xf2G}s\xad\xbd'\
-\xee\xa1\xfc\x0d\xba*\x1f{\x06g\x11l\x93\x04J\xa4\
-s\x13U\xbdSWe\xbf\x02\xe8{\x0f\x81b:\xbb\
-\xc561\x1a\xe7\xe0z\xd0\xac:3\xc0\x01\xd4f6\
-\xc6\x0dA\xef\x1b\x94\xfa?\xb9\xaa\xcd\xef\x8cQ\x5c\x17\
-K\xf7X \xd2\xb4\xac\x86\xed\xad%\xf2yK\xfbx\
-S\x14c\xf8\xd4\xa3w\x1dq\xa6\xad\xbeS%\xdf#\
-\xda\x98]\x02\x16\xdew\x81\xe5\x99\xdb\xc0\x9a\xef\x0f\xcc\
-\xc2\x9e\x00\xa1\x9e=\x11\x8f\xf4\xa4\x0b0\x0b\xcc\x95\x8f\
-\xad\x93,\xdfW\x0b\xcbd\x9e\x17\x19C)\xc7\x03\xe7\
-\xa9\xd8\x8f\xa7\xea}\xa2\xad\x8d\x1f\xb0\x0cI\x07\x96~\
-w\x81\x8d$\x18\xf0\x92J\x81\xf0\x84#\xde&0v\
-\x07\xbc\xe8\xa7\xb2\xfez\x22\xbe+g.\x99?\xb4}\
-g\xb8\xad-as\x9a\xa4\xd9s\xcd\x19\xd8\xbe\xe6\xbb\
-Et\xfa\x9d\x1f'\x8e\x88\xbfc\xc3\xbd\x88\xf2\xdf!\
-\x97\xbfN\xac\x8bP\x1a7\xca\xaeY\xfeh\x0e\x94\xfd\
-~6\xf1n\x0e\xd6\xb9\xd6\xe0\xbbG\xe0\xf7\xc0-\xea\
-\x80\xde\xd9\xc3\xfc\xf96WQ\x99\xea\xb45\x7f\x04\x9a\
-\x97y[|\x1a\xbf\xa3V\x8a\xe04\x11{n\xbf\x19\
-~\xd7\xdc\x8e\xfcw\x86\xdb5/\x7f\xf9wM\xe4\x7f\
-\xc5\xdf\x96\x88\x85\xba\xa01\xbdm-\x7f{:k>\
-\x8a_\xacX\xff\xd0\xbc\xb2\xac\xf3F\x00\xf5GDX\
-\x9d\x06\xa5\xd7O\x01\xafc,\xbc\x0d={\xa1\xe7\xf4\
-\x96\xf2\xaf\x88<\xd5\xfc\x9cI\xadjR\xff\xa0\xcd\xb2\
-\xfa'=\xff\xee+\x9e\x7f\x91\x22;\xf0\xf8\x863x\
-\x10\xe4\x08\x90\x7fP|\xa8\xcbFDl,\x14k\xa9\
-\xe4\x16_i\x19\xe0\xfcS\x1b\xdf\x11\xcab[y\xe2\
-\xf3/E\xf1]\x09,\x83\xaf]\x0fr\x9b]\x7fT\
-\xbe\x07I0S\x9e\xbf\x5c\xcc!nx\x01\xbe\xfe\x08\
-\x0fX\xd6(\x1b\xd3\x05\xcb\xe0sH\xb0D\xc9\xd8\xa6\
-\x96@\xef\xfb\x94\xe5\xdf\xc2\x98\xa5 \x09\x9d\xf3\x99\x8a\
-\xdb@\x9b\x05\xf5\xed)\xcb_\xd2\x85\xf7\xbf\x8e\xd8\xdf\
-\xd5\xf9\xb7\xa7\xdf\xb3;\xf3\x0f\xe6\x10s=Q\x9fZ\
-\x0f\xe6_F\xf6\xa9\x92\xfd\xa9\x09N\xca\xfb\x82\xa5}\
-\xa7e]\x98\xbf}\x94-\x117\x10\xd9\x8d\xfa\xd3+\
-[\x99#\x8c\xae\xc3p\x1f\x97\xae\xca\xdf\x9e\xcey\x07\
-\xb5\x0f\xc2-L@\xc95\xe5\xfd\x81\xe8\xfa\x18\xc1\xc7\
-yg\x88\xe9\xacq]\x95?\x12\x07:\xf7Mx\x5c\
-3\x87}\xec2\xd4\xbfz\xdd\xdc\x04D\xd9\x9e\xc6\xa0\
-\xff>p\x1d\xdc\xf6\x1c\xa6\xb1\xb2gv\xdf\xf7\xde\x84\
-{9C$\x0c\xd6bX\x07vI\xfb\xdb\xd1\xf3\xe7\
-.\xd4\xa6\x82\xcfiotW\xbe\xdd%\xb8\xbb\xa0d\
-8\xd1\x8d\x80f~\xb5\x88>\x9e5\x16J\xa3\xf57\
-\xa0\xd1\xfa\xb5\x06J\x83\xd2\x82\x06e\xc7\xeaG\xe4U\
-2\x5c6\x9f\x0cuKL\xa4\xc9\xf5S\xb4\xa3\xe7R\
-\xc4`\x8f\x84\xe5\xbf\x10\x01}1\xb2\xad\xfbA_\x0d\
-\x14\xe8K\x84|\x8f\x9b\xb5\x16Ai\xc0\x22(\x15\xf0\
-\xcf\xdc\xac\x83\xebD\xf0\xd9y\xa0\xca\xfd\x19\xec\xedh\
-\xac]\x936\xa8\x95\x0f\xb0\x08\xc9@\xd7\x07\x951\x07\
-\xd0s\x8bb\xfb\xc4\xeaB\x1c0K.o\xd33\x8d\
-\xfc\xfe\xd2\xef\xdcIT\x8d\x99v\xd6\xe0n\x8c\xb2\xb7\
-+D\xef\xff\xd1X[Y\xbfAlA\xcb\xe3d-\
-\xfd\x0aE\xff\x98o\xc4\xf9\xd19\xc3`\x1b\xa4\xa2>\
-\xd3\x09\xd4\xde\xe3\xc3\xf6\x9e\x091\x0e\x86\xd4\xff^\x05\
-\xe0\xbbDJ\x89\x00V\xe7b\x017\x02\x1e\xd7&\xb0\
-B\xc4d\x0f\x83\xbeY\xf40\xcc\x09\xb6\x17\x888\x9e\
-\xa8]ec\x1f\x8cu\x97\xa7I\x99&W\x02\x0b\xaf\
-Dd\xdb\x22\xc5\xfd\x11\xf9A\xa7\xc0\x03\xd86F\xe4\
-H\x89\xb06\x01\xc8\x9f\x8a\xfb\xc3\xf6\xcd\x9bP\xffJ\
-\xa4\x7f\x96\x9f\x15\xc8\x86d\xf9Z\x81{\xe7,A\x82\
-\x0b\xb7I;\x13\x7f\x8b\x13\xc5\xc3\x85m'\xa4?\xdc\
-\x7f\x18.?M\xce_\xb0\xfc\x8aZ\x1aOQ\x14\xd6\
-x?\xc0c&\x14\xcaOQ\x14\xde\xb5K\x90\xeer\
-\xf7.\x95\xfeGiPZ\xf4\xde\xa2<\xa2\xd9\xbd\xaf\
--\xfboG\xe3\x1d\xd1\xfdT>\xc6\x0aZ\x87\xda\xe3\
-\xaa\xf6\x87\xf7\x84\x81\xb0-,\x8a\xb3?]\x87|\x89\
-\xb8\x03\xff{\xeb\x9a:\xc0k\x7f\x9b\xe7\x01\xc2\xbcF\
-I\xa4\xfe\x85\xd7P\xa5\xd7\xed:\xf8\xc4Z2\xbc)\
--\x8d\xf6A\xeb\x14\xd3\xa1}\xff\x1f\xb6\x9e\x03>\
-\x00\x00\x07\x22\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x01\xd8\x00\x00\x01\xd8\
-\x01\xfa\x5c\xa6r\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x06\x9fID\
-ATx\x9c\xed[[l\x14U\x18\xfe\xfe3\xb33\
-\xdb\x9dm\x0bmY* \xa2\xe0\x83\x1aE#xE\
-i1\x11\x89\x1ay F\x12\xaf1D#\x145<\
-\xa8\xc1\x07\xa3\xe2\x83FM\x08\xde\x12\x1f\xd4x\x03\x1f\
-(1*\xc4\xa4\x06*\x90\x88\x1a\xb9)\x17M\xa9\xd4\
-J\x05T\xdanww.\xe7\xf7\xa1\x16K\xbb\xbb3\
-\xd3=\xbbS\xa3\xdf\xd3\xee\xcc\x7f9\xdf\xb7\xe7?\xb7\
-\x99%(D\xea\xe1\xad\xab\xc8\xf5V\xb2t\xa7\x920\
-\x84\xb0\xea\xfe \xf0n\x86\xd8\xa09}ow\xbd|\
-MFe>\x15 \x15A\x1a\x1e\xd9v\x96f;\xbb\
-\xd8\xb3\xa7\x9e\x0e\x1c\xab\x82H\xd4\x0dOu\x98X\xde\
-\xd1\xfd\xc2\xecoU\xe4T\x85\x92\x05\x98\xf6\xe8\xe6:\
-;\xa7\xfd\x0c\xcf\xb5\xce\x08<J\x00\x00@\x1f17\
-\x8d'\x11D\xa9\x01\x1c\xc7h\x1bI\xbe\x08\xaaA\xb4\
-a\xc6S\x1d\xf1R\xf3\xaaBI\x02Li\xd9q\x19\
-;\xb9\xd9a|\x18\x98\x99\xcd\xf4\xdeWJ^\x95\x08\
-U\x02\x93[\xdaWB:-\x04\xc4\x01@J9\x01\
-\xd2I\xe6\x0d\x9c\xbf\x04\x86\xd0E\x84\x9d\x00 \x99<\
-\xc1\xd8\xd1}\xe4\x87W\xf1\xd1\xed^\x98\xf6\xa8@`\
-\x01\xa6\xac\xdcq\x8dk\x9f\xda\x0e\x0e\x18\xb8\xb8\x00\xf9\
-\x1a\xd2\xd2\xfd\xfc%\xeb\x02;(B\xe0\x12p\xd9]\
-\x1c\x94\xfcX A\xd7\x96/za\x9c\xd1\x03f\xad\
-=Y\xe3dz\xdf`v\x17\xb2\xe7\xd6Bz\xa7\x05\
-\xf2\xb26\xdc\x13=\xc1\x03\x87\xec\x01\x9ae!6)\
-5<B\x1a\xe0\x9f\x08\xf4\x99p\xc5\xba\x1fW&\xba\
-\x02\x07\x0b\x81\xd3\x04g<\xff\xf3R\xbb\xff\xf8\x09i\
-\xa7\xef`'7q8\xf9h\xc0\x16\x80K\x18\xfc\x98\
-\xa7{\x87\xce}\xb5oy9\xb2\x08`\x90\xbc\xe7\xf4\
-\xbf\xc7\x9e\x1b+G\x12\x05\xa8\x02\xb0\xee\xbc\xd7z\x1f\
-W\x1dX\xccZ{\xb2F\xba\x03oCJ%\xab\xc2\
-r\x82\x99\xd6\x9c\xf3z\xef\xd5*c\x0a'\xd3\xfbz\
-\x90_\x9e(\xe2\x8a\x18\x84\x10L\xcf(\x0d\xc8\xec\xde\
-\x14\xcc\xb2\xcc\x1dD\xd3\x83\xd91\x9af\xad\xed\x9b\xa4\
-*\xad\x80\xeb\xd5\x061$]\x07\x91\xa6*\xef(h\
-\x89D`SW\xc7\x85\xaa\xf2\x0af7P\xdf&b\
-h\xf5\x0d\xaa\xf2\x9e\xd9\x08+\x09\x11\x0f\xbe=\x10\x04\
-e\x0d\x09U\xd8Z\xdc\x80\xde0YYO \x22\xe8\
-5\xb50\x1a\xc2\xf1a.}\x137\x84\x80\x85\xf7\x0f\
-\xb4\xb8\x011e*\xd8\xf3\xc0\xae[\xd0N\x18\xf1\xa2\
-\x0b!\x12\x04a\xc4\x01-\xda\xc15\xb4\x00\xc0`9\
-\x90.\x00\xdd(lc\xc4\xa1YAw\xc9\xd1a\x5c\
-\xccmQ\xe2\x7f\x01\xa2n@\xd4\xf8_\x80\xa8\x1b\x10\
-5|g\x81\x85\xe7'\xd2\xab\xaf\xd2\xaa8\xe4\xf6\xd8\
-\xb2,\xa4RyO\xcb\x8a!\xfde\x97\xf7\xf5\xdd\x1f\
-g\xe6\x87u\x1c+|I\xad\xbeZ\x8f\x87%_\x02\
-\xacy\xd3\xb4\xf9\xd7N\xd3\xf7U(\xdf\xf8,\x01\xa9\
-\xe8\x81M\x10\xf8\x0a\xb0f\xa7\x9b%M\xaf\xc8i-\
-3\xd2\xedG\xdd\xad;\xbb\xdc\x8b*\x91\x0f\x080\x06\
-l9<`m9\x1c>0\x19\x80V\xdd\x1f\xd6\xcd\
-\x02P\xb1\xfa\x07\xc6i\x09T\x12\xffy\x01\xc6\xb4\x19\
-\xfa7\xe0\xf8'\xe6\x83N\x16O\xba\xcc\x934\xc1}\
-\xa6A/5\xdcb?7\xd2.\x90\x00WL\x8bg\
-gL\x10N\x98\x06\xb0\x1e\xef\xaf\x9dh\x1c\x09\xe3\xf3\
-g\xc6\x8b}\xde\xc9\x17\xa4mY\xd26\xb2\xa7\xd5\xdc\
-\xd2\xd7\xc77\x0e}wA\xf59\x1bkz6\x99\x8b\
-&\xdf\x96\xbbn\xb8\xad\xaf\x00k\x17\xd5\xfc9\xbb\xce\
-\x9d\x80\xbf\x9f\x07\x06\x85ei\xd5\xa9\x94qV\x18\x1f\
-\x00\xc8y\xf8i\xce[\x03\x8dED8\xc4L\xed\x85\
-\xfc{Z\xcdm\xe9,_\x97\xef^:\xc3\xf3\x8e\xb5\
-\x1a\xbb\x1a\x17\xdbs\x87\xae\xf9\x8e\x01\x975\xc8@g\
-\x86\xaa`j\x98\xd9<];P\xe0\xf6A\xd7\x13\xcd\
-G\x96'\x8f\xe5\xbb\xd9\xb3\xd1l/D~\x08\xb6\x83\
-9v\x9b\xf9\xca\xd0w_\x01\x06<-\xebg\xa3\x18\
-\xd9\xdd=n\xbe\x9esPj\xa2\xf9h\x8b\xd5\x9d\xcf\
-\xa9g\x93\xd9\x9e\xce\xf1\xbcb\x81u\x0dh\xac'\xc4\
-4<\xc4[\xe3\xcf\x02\x00\x9d\xfd\xcc\xbe\xa2\x8f<\xeb\
-\x13\xba|\xaa)\xd1\xdb\x98\x08w\x10\xe8 \x96>{\
-J\xaa#\x8cO\xda\x96\xdeK_\xd9\xd5m\x9d\xde\x99\
-\xef\x1c0\x0eH],\xe8|\xc0\xfa5\x9f_\xcf&\
-\xb3=\x9d\x09L\xfe\x1f\x08\xdc\xea+\xc0XAF\x02\
-Z\xb5\x92\xe3\xfb\x83\xae'\x16\x14\xfd\xe5\xc7B~\x10\
-\xdb\xc6\xfb:\xa0\x9c\xe4\x01\xe0\xf2\xf1,@\xb9\xc9\x03\
-\xa0\xdcx]\x08\x0d\x0ex\x0f)\xae\xf9Q\xe0\xad\xbe\
-\x02\xd4't\xf9t\x93\xd5\x9bJ`\x0c\x83\xa0\x15j\
-\x10\x1cp\xe1\xbd\xb83s\xaa\xedW\xbe\xbfs\x99\x95\
-\xf7m\x0cu\xe4\x91\x83\x94O\xfb\x0a\xf0\xfeb+\x17\
-'g\x82\x9f\xddHX\x96Q\x9d\xaa\xa1\xc6\x90n\xdf\
-\xbfysb\x09\x11\x95\x9b\xbc\x07\xf0=\xd4\xec|\xe7\
-;\x06$4\xafR\xef\xf4}\x0f`AA\xf2\xad\xe6\
-6e\xe4\x89\xee\xa5\xf9\xf6z \xc0B\xe8\x9b\xe3\xd4\
-\xebg\xa3\x00\xfe\xe4}Vx\xa1\xc8_\x9f}\xf7\xb4\
-\x9f_\xcb\x1e\xd9\xdcW;\xb6\xcd\x90\xd7_;\xd1>\
-\xe2gWc\xe2\x97es\x8c\x15\xc9\x08\xc8\x03\x01V\
-\x82cE\xc0\x85\xd0A\xa9\x89\xe6\x82+\xbc2\x93\x07\
-\xa2=\x10\x89\x9c<\x10\xdd\x81\xc8\x0f\x88Qs\xc1\xa9\
-\xaeB\xe4\x01@@\x08\x19\xa8\xc9\xeap\x02R_\xd4\
-\xb1,\x199y\x00\x10\x10\xb1S\xbeMV\x0a~\xa2\
-cEUg\xbe;\x95&\x0f\x00Bh\xb1O\xfd\x8c\
-\x14\xe2x\xa2\xa1\xfa\x9d|7\xa2 \x0f\x00\x22i%\
-\x1e$M\x0f5\xc5\x95\x80\xb6\xfd\xb7\x93=\xf2\xe2o\
-\xad\xe6\x17\xea\xc8\xf3\x9dA\xc9\x03\x80\xd8\xbf<\xd5\xcf\
-f\xe2.\x08Q\xc6w\xc1\x07\xc1\xcc\xa3\xfe*\xf3\xc7\
-F\xeb\xd2\xfe,7\x15\xf3\x0bG\xde\xfe0L\x9b\x04\
-\x00\x1c]5}=\xe2\xc9\xa5\xe5\xef\x09b\xcf\xc8+\
-\x9e\xe6,)\xe6\x11\xae\xdb\x87#\x0f\x0c[\x07\x1c]\
-5}}um]\x9d0\x93\xef!f\xfc\x0e\xd2\x94\
-\xcf\x0e\x9e\xa4\xd1\x02H\xba\xb2\x90}9j~$\x22\
-\x7fA\xba{\xa3\xd9\x99\xcd\xf1\xf4\x91\xd7+A\x1e\x18\
-\x07\x8f\xc6\x5c\x8f'\x8f\xbcV)\xf2@\xc4\x02\x9c\xfc\
-\x145\x9e\x07s\xf8\xb5J\x92\x07\xa2\xee\x01\xd2X\xc8\
-\xc3\xe6\x9eJ\x93\x07\x22\x16@\xbat\xc3\xd0\xe7(\xc8\
-\x03\x11?\x1d\x96\xe0\x8b\x81\xb0\xf3|.\xf4TW\x0c\
-\x91\x0a@D\xa7t\x8d\x8b\x91\xef\x07x?@\xbbA\
-\xe2\x1d\xba>\xb3]y\x1bT\x07\x0c\x83\x13\x1fcj\
-\xb2\xca\xfc\xc0\x8ca.\x80\x0e\x80\xf6\x02r\x0f\x08\xfb\
-@b/\xe6e;\x88\xca\xf9oE\xe0/Y\xd1\xc4\
-\xbbP\xe9A\xc4\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x09\xa2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x01\xd8\x00\x00\x01\xd8\
-\x01\xfa\x5c\xa6r\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x09\x1fID\
-ATx\x9c\xcd\x9b[p\x1b\xd5\x19\xc7\x7f\xdfJZ\
-\xc9r|\x97\xed418!7'NH\x9c\xa4P\
-\x0aI\xafig`(\x85&\x19\xa0\x17h(\xf4\xa5\
-\x10\xa6\x03Sxc\xfa\xd2)\x14\x86\xcbC\x87I\xcb\
-\xa5C\xd3i\x81\x02\x9d\xd2v\x0a\xd3\xd2\xa4\x99\xa6\x83\
-\xc1v\xb1\x82\x1dr)4\xa4\x09$N\x1c\xdf\xa4]\
-i\xbf>$v\x14K\x96\xb4\x17%\xfd=I\xbb\xe7\
-\xfb\x9fs\xfe\xda={\xf6;GB\x85i\xed\xd3\x16\
-'\xcbz\x15:\x11:pX\x8c\xd0\x00\xd4\xa3\xd4&\
-\xf6\xdb\x0e0\x0a\x9cD9\x810\x88\xca\x00\x86\x93\xb4\
-\x0ds\xe7\xfe\x1b\xe4\xa3J\xb6O*!\xda\xd4\xa3\x9f\
-\x14\xb8I`\x83Bg\xb1z\x12\xfb\xecbR\x8a\x92\
-\xc4\xe0\xcf\x0a\xbf\x1a\xdchv\x07\xdd\xd6\xc0\x0ch\xdc\
-\xad\xb5F\x94;\x80-\xc0\xd2r\xe3J\x180\x9d=\
- O\xab\x19~r\xf0:\x19q\xdb\xc6B\xf86\xa0\
-6\xa9\x8d\xa6\xcdV\x94;\x81\x06\xb7\xf1.\x0d\x98\xe4\
-\x04\xe8\xe3\x11\xcb|\xec\x9d\xaf\xcb\x09/\x02\x93x7\
-@U\x9az\xf8\xa6\x08?\x01\x9a\xbd\xcax4`\x92\
-!U~8\xb8'\xf2\x04\x0f\x88\xe3E\xc0\x93\x01\xcd\
-o\xe9B\xc7\xe0Y\x81O{\x89\xcf\xc5\xa7\x01\xa7Q\
-ve\x1c\xe7\x96}7\xc6\xf6\xbb\x0d5\xdc\x064\xf5\
-\xea\xf5j\xf0f\x10\x9d\x0f\x0c\xe1\xcap\xc8\xe8Y\xfa\
-|\xfaF\xf7\xa1\xe5\xa2j$zy\x18\xb8\xdbm%\
-\xb9\x18Y\xa8\x7f\xdf&~\xd2!z\xdcb\xe2\xe4A\
-\xb4\xba\x0a\xad\x89\x93iI@\xc8\xf5or.\xc2#\
-\x03\xfd\x91{\xcb\xbd%\xca3 \xa9f\xc2\xe2\x19\xe0\
-&\xaf\xedJ\xec\xb3\x99\xf7\x8f\x09Z\xf6X\x84\xd3z\
-V:\xfb\xea\xd4g5#d\xda\xe7`-_D\xa6\
-\xad\xd5kU l\xaf>\x1e\xb9\xf5\xad\xefJ\xc9\xfb\
-\xab\xb4\x01\xa7;\xff\x12p\xb5\x97\xb6\xd4\x1c\xcd\xd2\xf9\
-\xca(-\x03Va\xf9\x1c\x03r\xb1\xdb\xe7\x90^\xb7\
-\x86lC\xad\x97j\x01}\xb5z\xc8\xbc\xbe\x94\x09\xc5\
-\xaf7Ui\xb6\xd8\x86\xc7\xce\xb7\xbck\xb1\xee\xd1\x13\
-3v\xbe\x18\x91\xf7\x0fS\xfd\xeb?\x11>p\xc8K\
-\xd5\x80\x5c3\xd6h?\xcb\x03Z\xb4\x8fEO&z\
-yD\xe1[^\xaao\xdf\x9d\xe2\xf2\x9f\x0d\x9fs\xb9\
-\xbbEl\x9b\xea?\xec\xc0L\xee\xf3*qSG\xa7\
-\xf5\xe3b\x05f4\xa0\xb9G7\xe1q\xc0k<`\
-\xb3\xe2\xc5\x11\xc4{\xdf\xcf\xa2J\xd5\x1bo\x12>t\
-\xc4\xa3\x80\xdc\xd3\xf1Bz\xc6\xb1\xab\xa0\x01-\xdd\xba\
-@a\x9b\x97\xea\xccq\xe5\xb2\xa7Oad\xbdD\xcf\
-\x80\xe3\x10\xff\xe3.$\xed\xfeV\x02@\xe5\xa7\x8b_\
-L]R\xe8T\xbe\x01\xaa\x92\x0d\xf1\x0b\xa0\xceK]\
-\x8b^\x1f\xc3\x1c\xf34)+\x8a\xa4RD\xbb\x93^\
-\xc3\xeb\xc41\x9eA5o\xd0\xcf3 \xd1\xcbm^\
-'9\xd1\x11\x87\xf9\x7fOy\x09-\x0b\xb3o\x10\x99\
-\x98\xf0\x14+\xb0\xae\xe3E;o<;\xc7\x80\xda\xa4\
-6\x02?\xf2\xd6<\xf8\xc4;\x16F&\x88\x1b\xbf0\
-\x92\xcd\x129\xf0\xa1w\x01\xe5\xc1U/i}\xee\xa1\
-s\x0c0m\xee\x06\x12^\xf5g\xf7\xa7\xbd\x86\x96M\
-\xc4\xf3c\x11\x80\x96\x94\x9d\xb9+\xf7\xc0\x94\x01\x8d\xbb\
-\xb5\x16\xe5{~\xd4\xeb\x0fe\xfc\x84\x97E\xe8\xe8\x90\
-?\x01\xd1\xadK^\xd1\x9a\xc9\xafS\x06\x9cIf\xb8\
-~\x9f\x9f\x8a\xcfB\xa4\x02\x83\xdft$\x95\x02\xc7W\
-=\x8d\x92\xce\xdc>\xf9e\xca\x00\x81[\xfc\xa8\x9ac\
-N0\xcf\xfdR\xa8\x22\x13>o5\xd1\xdb&?\x1a\
-p:\x87\xa7\xb0\xdc\x8f\xa6UU\x91\xf4ba\xa2\xa6\
-_\x85e\xcb^\xb0\xba\xe0\x8c\x01\xe2\xe3-o\x12'\
-\x22\xd8\xe7\xc1\x04\x8dE\xd1p\xc8\xb7\x8e\xa3z3\x9c\
-\xbd\x05\xbe\xe4[\x11\x18i\x09\x07!S\x14\xa7\xbe\xa6\
-t\xa12P\xe4\x8b\x00Fk\x9f\xb6\x00\xcb\x82\x10=\
-\xda\xe9\xfb\xd2,\x89}I[ :\x02+\x17o\xd7\
-\x84\xe1dYO@\xe9\xf1#+\xa2\x15Zi8\x83\
-@\xe6\x92\x8b\x02S3\x22\xd6zC\xc5\xdf\xe0\x97\xcb\
-Hk\x88\xc3+\xa2A\xc9\xe5a/\xb8\xc8G\x82$\
-\x1f\xc1\xe84\x10\x96\x04\xa6\x08\x0c\x5c]\x8d\xe33\xad\
-W\x10\xc3 \xf5\xa9U\x81J*\xba\xc4\x00\x16\x05)\
-:\xda\x12b\xcf\xb5\xb3\x82\x94\x04`\xe2\xca.\x9c\x00\
-\x7f}\x00\x94\xc5\x06\xea}\xee?\x13\x07>S\xc5\x07\
-\x97\xc7\x02\xd3\xb3\x96-\xc0Z\xd5\x11\x98\xde\x14B\xc2\
-\x00\x82y\xaeL\xa3os\x0d\xef}!\xee[\xc7\xea\
-\x5c\xc8\xc4\xe7.\x0b\xa0E\x05\xa9\x09\x03\xc1_\xaf\x80\
-\x0a\xbc{M5#\xad!\x96\xffn\x0cs\xd4\xdd\xfc\
-\xdd\x89\xc7H_\xb5\x06k\xc9\xbcJ4o\x92\x9a\x8a\
-\xcf\x5c\x0e\xad\x8dqdy\x94\x85o\x8cs\xf1\xee\x14\
-\xb1S\xc5\x8d\xd0\xea*\xace\x0bI\xaf^\x8a\x9a\x91\
-J7\x0fI\xf4\xe8q\xa0\xb1\xe25\x01\xa2P\xff\x81\
-Mb\xafM\xd5p\x96\xf8\xd14\x87\xed\x1e\xb4:\x8e\
-\xd6\xc4\xb1\xdbf\x93mm\x029o\xef\x15\xc7$\xd1\
-\xa3\xff\x06\xda\xcfW\x8d\xd3\x09dq\xd4;\x07\x0d\x84\
-c\x17\xb2\x05\x17\x14\xe5\x98\x81\xb2\xf7B\xb7\xe3B!\
-\xc2`\x18\x18\xf4+d\x8e+u\x1f\xda\xc4\x86\x1d\xa2\
-#\x0e\xe5nU\x90\xb4\xcd\xd8\xc8\xc1\xf2+\x12\xc1\x89\
-W\xa1\xb3\xaa\xc867\xa2>\xf3\x02\x0e2\x186\x94\
-~\xc7\xc3\x98c80\xb7;E[o\x9a\xa6\xf7,\
-\xcf\x0b!\xc9l\xaf\xb7@\xc3\xc0n\x9b\x8d\xbd\xb8\x1d\
-{\xc9<0\xdc\xcf\xbf\x0du\x92\xd2\xda\xa7-Y\x87\
-#\xb8x\x8fK\xec\xb3Y\xf1\xf2(5\x87\xfd'A\
-gZ\x1dv\x83\xd3PKj\xfd\x1a\xec\x8b\xe7\xb8\x0a\
-s\xecH\xab\x004\xf7\xe8;\xe5\xa4\xc4\x0c\x07:_\
-\x19e\xfeNo\x8b\x13\x85\x08\xc2\x80IRk\x97\x93\
-\xbebe\xb9\xc5{\x066\x99\xab\x0d\x00\x85\xd7J\x95\
-\x16\x85\xae_\x9e\x0a\xb4\xf3A\x13\xeb\xee\xa7\xea/\xff\
-D\xb4tvVD_\x87\xc9\x94\x98\xb2\xbdT\xc0\xf2\
-\xdf\x8e2\xb7\xa7\xf2\x0b\x1f~1\x93\xfb\x88\xfd\xad\xf4\
-~J\xc3\x91\xedp\xc6\x80c\xab\xa5[\xa0\xbfX@\
-d\xa2\xf29\xff\xc0\xb0J\xae\x22\xefIn6{!\
-g]@\xe1\xd9\xa2\x11_\x99u^\xb2\xbe\xbe\x89\x9a\
-\xa4\xaf\x5c]\xbc\x8c\xca\xcf'?\x9e}vT\xf1$\
-0\xe3\xae\xcbT\xadA\xffu\x15yq\x0c\x94\x89u\
-kp\xaa\xab\x8a\x15\x19\xd2hxj\xef\xc3\x94\x01\xc7\
-:d\x04\xe1\x89b\x91\xff\xb9,\xc6G\x1d\x95\xcf\xfc\
-z%3o.\xd6\xd2\x82\xfb \xa6\x10\xe4\xd1\xdc}\
-\xc6\xe7\xcc\x1el\x83G\x81\x8f\x8b\x09\xbc\xfd\x8dZF\
-[\xfc/L\x04M\xb6\xa1\x96\xf1\x0dW\x94*v4\
-\xad\xe1\xc7s\x0f\x9cc\xc0\xf0\xa5rB\x84\xfb\x8a)\
-Xqa\xf7\xedu\xa4k*\x91\xf9\xf4\x86\xc6b\x8c\
-_\xfbY4V<#-\xca\xbd\x076\xcbp\xee\xb1\
-\xbc^|\xbc\x92\xa7\x81]\xc5\x84\xc6\x9bB\xff7&\
-h\xbc\x8a\xd1\xeb?\x8fSW\x22\xb3\xa7\xecxwS\
-\xe4\xb9\xe9\x87\xf3{ \xa2F\x96[\x80\xe1\xbcs9\
-\x0c\xb7\x85\xd9\xb1\xb5\x9e\x91\xd6\x0bw;8u5\x8c\
-n\xdc\x80\x93(\xbe\xaa\xafp\xd2\x099\xdfF\xf2\xd7\
-\xaf\x0b\xfe\x84\x1f\xad\x95\xfd\xa2|\xa7T\x03&\x1aC\
-\xec\xba\xb3\x81#\xe7aIl:\xf6\xfc\xb9\x8cn\xfe\
-r\xe9_\x1e\x10\xf4\xb6\xbd_\x8b\x1d(|\xae\x08\x89\
-\xb7\xf5a\x84\xef\x97\xd3\xa09}i.}~\x04s\
-\xdc\xdd&\x01\xb7\xef\x02j\x9a\xa4\xae\xea\xc2\xea\x5cX\
-^y\xf4\xc1\xc1M\xd1\x1f\xcct\xbehR\xf4X\x17\
-\xf74\xf5\xd2(pk\xa9\x8a\x0e\xaf\x8c24?\xc2\
-\xa2\xd7\xc7i\xdf\x9d\x0a|\xb3\x94\x86BX\x9d\x0bI\
-\xaf\xedD\x8b?\xe7\xcf\x22l\x1f\xec7\xef/^\xa4\
-\x14\xdd\x1aI\x84x\x19\x17\xfb\x85c\xa7\x1c\x16\xbc1\
-N\xdb[i\xa2#\xc5\xa7\xd0\xa5\xae\x00\x8dWa-\
-\x99\x87\xd5\xb5\xb4\xd4\x04gz\xe4\xef\xab\x87\xcc\x1bJ\
-m\x96.on\xfbW\x0d7\xd5\xf1\xa4\x08[\x5c\xb4\
-\x00QH\xbcg1\xa7/M\xe3\xfb\x19f\xfd7\x93\
-\xb7\x8d&\xcf\x00\xc3 \xdbPKvv\x02kQ;\
-N[+\xea2K,\xf0\x5c|(\xb2%\x98\xed\xf2\
-\x93\xa8J\xa2\x97\x07\x81{\x5c\xb5&\x87\x90\xad\xd4\x1d\
-\xce\x10=\xe9`N(\xd1\xa14c#\x07O\xef\xfa\
-\x88\x9a8\xb3\xe2d\x9b\xea!\xe2y\xb9B\x15}h\
-p\xa3y_\xa1\x11\xbf\x10\xae\xdfn\x9az\xf4\xab\x02\
-O\xe1cGY.\x01\xa6\xc5O\xa9\xe8\xed\x83\x1b\xa3\
-\xbfq\x13\xe4z&s\xbcK^\x0e\x85X\x8b\xb2\xd3\
-ml\xc5Pv\xa8fW\xb9\xed<\x04\xf3\xb7\xb9\x87\
-\x80\x16\xaf2~\xff6\x87r\xff\xc0\xa6\xc8\xb6r/\
-\xf9\xe9\xf8~\xc1\xaf\xef\xd1\xfa\xb0r\x17\xc2V<,\
-\xb1y4\xe0\xb8 \x8f\xa55\xfc\xf8\xf4\xb9\xbd[\x02\
-\xcbp4'u\x96\xda\xdc\x81\xb2\x85\xd3\xff\x17.\x0b\
-W\x06(\xfdb\xf0\x94\xe1D\xb6%7\xcb\xa8\x87f\
-\xe6Q\x91\x14Os\xafv\xa9r3\xb0\x01XA\x91\
-\xb1\xa6\x84\x01\x8e\xc2\xbf\x0c\xd1\xd7\x0cG\xb6O\xa6\xb1\
-\x82\xa4\xe29\xae9\xdd\x9aH\x87Yo\xc02U\x96\
-\x02\x8b9}\xab\xe4\xff}\x1e\x86\x80AE\x06\x0cu\
-\x92\xd9\x8c\xb9s\xef\xcdR\xd1\xb5\xcb\xff\x01\xca-:\
-C\x9d\x1ez=\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x08\xd8\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x01\xd8\x00\x00\x01\xd8\
-\x01\xfa\x5c\xa6r\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x08UID\
-ATx\x9c\xe5\x9a{lS\xf7\x15\xc7?\xe7\xfa\xc6\
-N\x1c\xc7\xe4AB P\x08\xaf\x11B\xa7m\xdd\xca\
-\xa6U\x83t\x83\xf2\x10\xecAa[+M\xd3^\x95\
-6RD\x0b\x15\xa2\x9d\xc4?\x1b]\xe9\x06\xc9&m\
-\xad\xba\x7fV\xd6Ji(\x9a\xc6V\xd8\xa4\x86u\xa2\
-h\xab\xb6\x02\x9da@\xc8\x8b\x8e\x84G\x1ev\xec\xc4\
-v\xec\xfb\xdb\x1f\xc1\xa9\x93\xd8\xd7I\xeckJ\xfa\x95\
-\xfc\xc7\xfd\x9ds\xee9\xe7{\xce\xfd\xdd\xfb\xfb\xfd,\
-|\x08\xd1\xe0i_\xae)U\x83\xf0YA-U\xb0\
-\x00p\x01N\x81^\x05^\x90fP\x1ee\xc8[J\
-\xb3\x9d\xdcV=\xafg*\xbe$\xa3\x91\xa7\x81\xdf\x9f\
-k/\xb2k\xc6\x0fD\xf8\x16\xb0|\x92\xe6a\xe0\x84\
-2\x8c\x17\x1f^\xb1\xf0O\x22\xa2&jx\xc7\x09\xf8\
-\xdd\xd9\xae\xfc|}`\xafBj\x81\x82\x0c\xdc\xd2\xa3\
-\x0cc\xcf\xd6{\x17\x1d\x9b\x88\xf2\x1d%\xe05O\xdb\
-z\x81\x17A\xcd\xcd\xf8\xcdE\x8e\xe5D\x8d\xef}\xf9\
-\xde\x85\xd7M\xd52\xeex\x02hP\xca\xa6\x9do\xdf\
-\x0fj\x97\xc51t\x89\x92G\xb6\xacX\xd0\x94L!\
-\xeb\x044x<v\x0d\xe7\xcb\xc0\xb6,\xb9\x0c\xa3\xf8\
-\xf6\xc3+*_M$\xd4\xb2\x14\x04\x00MMM\xba\
-&\xf9G\xc8^\xf2\x00\xf6\x80\xdfw\xe0Wo4}\
-#\x910\xab\x1d\xd0\xe8iy\x09\xe4\xbb\x93\xb1q;\
-\xec\xb8\x1d98t\x1b\xba&\x84\x22Q\x82\x91(\xbd\
-\x83aB\xd1hJ\xfb~\xaf\x17\xbf\xb7\x0f l\x08\
-\xebv\xac[=\xeaq\xc8\x1a\x01\x8d\x9e\xb6\xef\x80\xfa\
-\xedDt\x9d9:KK\xdc\xcc.p\xe2\xcc\xd1\x13\
-\xea(\xa0g D\x87\xd7O[\x9f\x1fC\x8d\x7f\xf3\
-\xf9\xbd}\xf4{\xbd\xf1C7\x22\xa2}b\xe7\xba/\
-t\xc6\x06\x12\xdf=\xc38z\xa1uA\xd4P\xf5\xa9\
-\xf4tM\xa3\xba\xac\x90\x85E\x05hb^\x1b\x01J\
-\x9c\x0eJ\x9c\x0e\x96\xce\x9c\xc1\x7f\xae\xf7\xf2\xbe/0\
-\x22\x1f\xae\xbcw\xacYY\x8e2^\x006\xc7\x06\xb2\
-2\x07D\x0c~\x01\xe4\x9b\xe9\xe4\xdbuj*\xcbY\
-\x5c\xecN\x99\xfc8\xdb\x1c\x9d\x95sK\xf9\xd4\xec\x12\
-4\x11\xfc\xde\xbeX\xdb\x8f\x83\x82M\xf5\xc7\xdf\xdc\x18\
-\xbb\xb6\x9c\x80FO\xebJ\x81\xaf\x9a\xe9\xb8\x1dv\x1e\
-\xac\x9c\x83\xdbaO\xcbWeQ\x01\xf3\x8bg\xe0\xf7\
-\xf9L\xf5\xc4\xd0\x9eUJ\x09d\xa3\x03\x84\xa7\xcc\xc4\
-v\x9b\xc6\xe7\xe6\x95b\xb7\xa5\x1fJG\x18\x06\xf3\x0b\
-\xa9\xa8\x5c\x94*\xa6\x15\xbf<\xd1\xb4\x01,&\xe0\xf5\
-\xb3\xcde(\xb5\xd9L\xe7\xfe\x8aR\x5c\xf6\x9c\xb4}\
-]\x0d\x0f\xff\x00J\xe7TP8\xb3\xd4\xdc@\xd9\xbe\
-\x0f\x16\x13\xa0t\xed\xeb I'\xdaY\xae<f\xb9\
-\xf2\xd2\xf6\xd3\x11\x1e\xfe\xc5cN\xe5B4-\xf9\x5c\
-\x22\xa8u\x07\x8f6\x15ZJ\x80\x01\x0f\x99\xc9\x97\x97\
-\x16\xa6\xed#\xbe\xf2\xf1p8r).+73u\
-\xe4\xe4\xa9U\x96\x11\xa0\x94\x12A>\x9fL\x9eo\xd7\
-)\xces\xa4\xe5#Q\xe5\xe3QT6\xcb\xd4^)\
-\xcd:\x02^?\xd7\x5c\x01$-\xf1\x9c\x02gZ\xf7\
-\xefHR\xf9x\xb8\x0a\xdc\xe8\xba\xe9\xfcRm\x19\x01\
-Q\xbbn:\x15\x97\xa4Q\xfddm?\x0e\x22\xe4\x15\
-\x98n1,\xb6\x8c\x00\x89H\x89\x99<W\x9f\xdaG\
-h\xaa\xb6\x1f\x0b\xbb\xdd\xe4\xdbB(\xb6\x8e\x00\xcd0\
-\xedq\x87>y\xd7\x13\xae|\x1c\xf4\x1c\x13\x02\x14.\
-\xeb\x08\x10\x192\x93\x0f\x19\x13\xde\xb6\x03&_\xf9\x18\
-\xa2\xd1\x88\x998d\x1d\x01\x8aq+\x91Q\x9e#\xa9\
-\x97\xb21Ld\xc2K\x86\xa1\xb0\xa9\xa1\xcf2\x02\x22\
-h\x1df\xf2\xfe\x90i\x83\x8c`*m\x1f\x8f\xd0\xe0\
-\x80\x99\xb8\xcd2\x02\x5c\xf6\xf0\x15PI\xfb\xaf\xd3o\
-\x1a\x180\xf5\xb6\x8f!\x1c\x0a\x12\x1c0\xf3\xa3.Y\
-F\xc0\x86%KB \xef&\x93w\x0f\x84\x08G\x8d\
-\xa4\xf6\xe9V\x1e\xc0{\xeb\x96\xa9\x5c\xd0\xde\xb6v-\
-\xa0H\xba\x1bk(\xc5\xa5\xee\xc4\xd3D\xba\x95\x07P\
-\x86\xc1\xf5k\xef\x9b\xeaDm4YJ\x80\x86\xd1h\
-&o\xee\xf1\x11\x1c3\x19f\xa2\xf2\x007;\xaf1\
-\x14\x0a%W\x10\xce\xecX\xbb\xea\xb2\xa5\x04lY\xb1\
-\xe8\x1d\xe0|2y\xd4P\xbc\xf3\xbf\x9b\xa8\xdb\xfby\
-\x99\xa8<@0\x10\xa0\xb3\xbd\xcdTG!\x87!+\
-[b\xf2s3\xe9\x8d@\x90s\xd7{i\x1b\x8cd\
-\xa4\xf2\x91H\x84\x96\x0b\x1e\x0c\xc3\xf45\xebs\xd8\xc2\
-/A\x16\x080\x08\x1c\x06\xae\x98\xe9\xbc\xdbz\x95\xd3\
-\x17[F:a\xaa\x08\x05\x07i>w\x86Pp0\
-\x85\xa6:\xf8\xd8\x9a5^\xc8\x02\x01\xdb\xaa\xab\xc3\x82\
-z\x22\x99<\xb6\x81\xd9\xdd\xd5I\xb3\xe7=\xf3\xe7\xd6\
-\x04\xbe\xden.\x9d\xf97\x83\x03\x81T\xaaW\x83Z\
-\xf8@\xec\x22{\xe7\x02\xe7[_A\xf1\xcd\xf8\xb1\xb8\
-C\x8b\x11h6\x8d\xd2\xf2\x0af\xcd\x9d\x87-'\xf5\
-VY\xa0\xdfGg{+\xfd}\x89w\x81\xc7\xc0P\
-J\xd6?\xbea\xd5_b\x03Y#\xe0\xf0\xe5\xcbn\
-GH\x7fO\x84{ q\xf2\xf1\x10\x11\xf2\xdd3p\
-\x17\x17\x93\x9b\xe7$'\xc7\x8eM\xd7\x19\x1a\x0a3\x14\
-\x0a3\xd0\xef\xa5\xaf\xa7\x9bp08\x990\xf6\xd7\xae\
-_\xbd7~\xc0\x92\x83\x91\x07\xf6\xfb\x9fTB\xc5\xa9\
-=\xae\x91\xd6\xefn\xb9\xbaD\x17\xfb\xcc\xd2\xf2r\x06\
-\xfc\xfd\x89\x0e-FA)e\xba\xbf?Y(h\xe8\
-\xf9\xc7\xaag\xc6\x8eg\xbc\x03\x86\x93\x97\xe7o\xbb=\
-tj\x8fkg\xdd\x897\xef\x13CN\x0a\xe2\x8a\x0c\
-\x0d\xa1\xd9lhZ\xf6\xcee\x05\xfeh\xa8\x81\xad\x8f\
-o\xd80n\x82\xc9(\x01\xa3\x93\x1f\x86\xcb\x1eze\
-c\xd5\xd9\xcd\x82\xb8\x82\x81\x01\x82\x83\x01l\x9a\xad\xbf\
-\xa0\xa8\xa8\x0f\x91y\x99\xf4\x9f\x08\x82z\xe1V.\xdb\
-\xf7\xd5\xd4$\x5c\x97d\x8c\x80D\xc9\xc7\xf0\xb1\x99]\
-T\x15^$8\x18\x00\xf0\x8a\xa6\xd6\xba\x8b\xee\xf9\xaf\
-H\xf070zb\xcc \xfc\x22\xfcp\xfb\xba\xd5/\
-\x9b)e\x84\x00\xb3\xe4\x01\x9cC\xdd\x94\xd9:X6\
-\xb7\xd3+6\xb5\xf6\x99G\xb7\xfd3&\xab?\xde\xf4\
-%A\xeaQTe\x22\x16\x00\x14\xc7\x22\xa2jw\xae\
-\xafiK\xa5\x9a6\x01\xa9\x92\xc7\xefE\xf5\x0f\x9f\xd5\
-\xe5;\xc2\xaf\xfe\xf5\xb9\x8f?2Ve_\x83\xc7^\
-\xe2\xbe\xf9(\x8a'\x81\xea)\x86\x12\x01\x8e\x1a\x9a\xf1\
-\xb3\x1d\x0f=\xf8\xaf\x89\x1a\xa5E@\xaa\xe4U\xbf\x17\
-\xfc\xa3\x0f*\x05\x0e\x9d\xaa[\xb63\x99M\xfd\x9f\xff\
-\xf6I\x11\xb5\x15\xa8\x01>\x8d\xf9\x9b\xaa\x1b\xe1\xefJ\
-\xc9qG\xc48\xf2\xd8\xa6\x1a\xf3\xf5o\x02L\x99\x80\
-\xa9$?\x22C\x1d<]W\x95\xf4\xeb0\x86}\x0d\
-\x1e{a\xc1\xf5JM\xd9\xe6\x8b\xa8\x19J\x89]\x13\
-5`\x08\xb7D\xd3\xaf\xd4\xae}\xe0\xdaT\xe3\x8fa\
-J\xdf\x01\xe9$\x0f\xa0\xc1\x84*\xb5o[u\x18\xb8\
-x\xfbg\x09&\xdd\x01\xe9&/\xa8\xa7O\xd5U\xfd\
-t\xb2~\xad\xc2\xa4\x08H?y\x9e:U\xb7\xec@\
-R\x85;\x80\x09\x7f\x8ee\xa6\xf2\x1f\xae\xe4a\x82\x1d\
-0\xdd\xda>\x1e)\x09\x98\xce\xc9C\x0a\x02\xa6{\xf2\
-`B\xc0G!yHB\xc0G%yH\xf0\x16\xf8\
-\xca\xaf\xbd?N+yQ{\xef\x96\xe4\x01l\xf1\x17\
-\x8d\x9e\xb6'\x16\x95\x87\x9em\xbd\xe9P\x83\xa1\xf1\x7f\
-\xb1\x9aP\xf2\x87\xaa\xf6[\x10\xa7e\x18!\xe05O\
-\xcb.\x81\xe7\xed\xbab\xc9\xec\x90\xb4\xdep0\x18\xfe\
-\xa0A\xa6c\xf2p\x9b\x80#\x9e\x96Z\x90\x83\xb1\xc1\
-\xdb$\x10#A\x02\x1f,i\x13\xe1nM\x1e\xc0\xd6\
-p\xa1\xfd>Q42f>\xb0\xeb\x8a\xc5\xe5!\xba\
-:\x83\xf8\xba\xfcIo\xa0\x94\xda\xfdv]\xd5sV\
-\x07j\x154[\xd4\xd8\xc5\x98\xb9 \x06\x15\xea\xe5\xfe\
-\xf9\xad\xb8]\x89\x8f\xf9E\xd4\xde\xd3\xf5U\xc97C\
-\xee\x02h\x86P\x93H\x10\xdb\xb7\xcfu\x18|\xf13\
-=\xe3H\xb8\x9b\xdb>\x1e\x9a@\xd1\xd8\xc1\xb1\x87\x16\
-1\x12\xf2\xf3\x22\x01\x98>\xc9\xc3\xf0s?\xea_\x04\
-\xc9Nlr\x1d\x06kV\xf6:g\xb8\xa2\xbb\xa7K\
-\xf2\x00\x1a\xc2\x1fb\x17\xa9\x8e\xab\x9c\xb9\xd1\xa7\xdf\xf8\
-I\xf5]\xfd\xcc\x8f\x85&\xc8\x01\xa0\xdb\xef\xf3\xf5\x98\
-\x9e\xd5\xc1\xde\xed\xebWO\x9b\xca\xc7\xa0mY\xbe\xa0\
-\xd3\xdf\xd7\xfb5__o\xb2\x7f,E\x94\xa8\xda\xe9\
-\x98<\xc4-\x86\x0e\x1e\x7fk\xb6\xae\x8c\xdd\xc0&`\
-\x1e\xd0\x8d\xe2\xa4\xa6\xd4\x81\x1fm\xac9s\xc7\x22\xb4\
-\x18\xff\x07@\xf9\xc4\xeb\x04:\xb2j\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x06\x9b\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x01b\x00\x00\x01b\
-\x01_'\xd0S\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x06\x18ID\
-ATx\x9c\xe5[\xbdo\x1cE\x14\xff\xbd\xd9\x8f\xcb\
-\xdd\xd9\xf1G,\x12\x07\x14\x12\x1c%\xb1\x88\x80\xc4\x05\
-\x85A:\x14\xfe\x00@\x0a\xa4G\x22\x1d\xa2\x82\x0aQ\
-\x90\x82\x8e\x96\x8e\x86\x06AEE\x0a\x94&\x12P\x00\
-\xc2\xe1\xcb\x10 q\xe28\x1f\xe7\xb3\xef\xce\x1f\xb9\xbb\
-\xddy\x14\xce\xc5\xe7\xf3\xce\xec\xcefg\xf3\xc1\xafZ\
-\xdf\xbcy;\xf3\xfc\xfb\xcd\xbey\xb3K\xcc\x0c\x9b\x98\
-\xf9m\xeem\xbf\xe0\x7f\xe8\xba\xceN\x22\xda\xd6>7\
-\xb7\x10\xd5\xed61~b\xf0\xfb/\xbd\xf8\xcc76\
-\xc7G6\x03\xf0\xe3\x85\xb9\xd3CC\xa5Ot6\x8a\
-\x00t\xc1\x92\xc4\x89\x13\xd3O\x9f\xcbvd\x9b\x10\xb6\
-\x1c\x03@\xb1\xe8\x9d\xb9G\x17$X~\x90\xc9`\x14\
-p\xad:w\x9d\xd1\xee\xb5\x94\x8c \x0c\x96#\xcc~\
-\x8e\xf8\xed8\x80\xc1;\xd7\xc7l\x8c\xad\x0b\xab\x01\xa0\
-\x1e\xd1K\x19\xaeON\x8c\x8f\xf4\xdbLN\x8co\xeb\
-w\xee\xfc\x85\xef\x00<\x7f\xe7\xcf\x82\xb5\x01\xc2\xb2\x04\
-\x1e\x06\xfc\xef\x03\x10\xfb\x14X\xb8\xd5|\xc1\xf5\xdc\x8f\
-\x88h\x8f\xa9s)\xe5\x04aC\x05\x0c\x06\x01\x9d~\
-\x9b\xc5\xa5\xe6B\x10\x04[~\x97\xa1|\x02]\xea\x13\
-\xc2ri\xc7g\xa6\xf7\x06Q\x95Y|zp\xdf\xe8\
-\xafZ3]\x00fn\xdc(?^\x1c^\xf4=\xd7\
-\x9a\x0e\x97\x96\x9b\xe8t\x02[\xee\xafq[L\x1e<\
-8\xdaP\x19h%0B\x85\xd36'\x9f\x03\xf6R\
-!|Mg\xa0\x0d@\xc1\xf3\xdf\xccv<\xf7\x03\xf4\
-\xba\xaeU\x19\x80\xd9\xd9\xea\xa0\xe7\xba\x93\xd9\x0f(g\
-0^\xbez\xb51\xaajV\x06\xa04\xe4\xbe\xe5\xba\
-\xce\xf6\xe4\xfd\xe1\x83\xd7\x0e[\xaf\xa8\x1a\x95\x01\xf0}\
-\xef\x11\xa0\xff\x06\x98\x84R\x06\x91\x01\xb8x\xb1\xb6\xd3\
-\xf7\xbc#\xf6\x86\x947\xf8\xc4\x1f\xf3\xcd]Q-\x91\
-\x01(\x0c8\x8f\x0a\xfd\xbbp\xdd\xa0\xf5jTCd\
-\x00\x5cAO\xd9\x1dO\xfe `\xfb\xa6\x03\x8a\x00\x04\
-,\xbff\xdb\x95\x92|\xd1a!\xbe\x8fjPf\x82\
-\x97\x17\x16'\x8b\x85\xe2\x19\x22\x94\x01 \x08\xc2g\x91\
-\x22\x1d\x8e\xc3\xcd\x9b5\x04A\x98\xa9O\xdfw\xbf*\
-\x97J\xdf\x02\x003\x07\x0e\x07_\xee\xdf\xbf\xe7R\x94\
-m\xe2\x8a\xd0\xcc\xefs\x1f\x97\xcb\xa5w\xb2\x1b\xe6\x06\
-b*B\xa9@D\xa7*\xd3G?Ob\x9bx7\
-\x18\x86|5\x89]\x10\x84\x08C\x99\xc8\xe7\xea\xea:\
-\xda\xedm\xfb#\x85\xdf\x00\xedv;\x91\xad\x0c\xe5\xad\
-D\x860(\x88\x08\xe0\xdf8\x9b\x95\x955\xd4ju\
-\x00\xc0\xd8\xd80J\xa5\xa2\xd2v~\xfe:\x82@b\
-v\xf6o\xec\xdd\xbb\x1b\xbbvm\xab\x95\xdcE\xbd\xde\
-\xc4\x95+\xd7\xc0\xcc\x18\x1f\xdf\x8d\xb11\xb5-\x000\
-\x89j\xdcX\xbbH\xce\x80\xb6\xbc\x18g\xd3l\xae\xdd\
-\xbdn4V\xb5\xb6\xeb\xebmt\x0bF\x8b\x8bKZ\
-\xdbj\xb5\x86\xaeTk5\xbd-\x00\xf8p\x123 \
-q\x00\x1a\x0d\xfa3\xce\x86y\x93\xfaa\xa8_\xd8z\
-+\xe4q\x92\x09\x82\xcd\xed\xb2\x94\xf1\xf2*\x95\xd6\xb2\
-g@\xa5\xb2\xff\xb6\x94R\xbbb\x0a\xb1\xe9.\xc6\xd4\
-\x08\xbd\x93\xee\xbdG$\x08\xf5\xa9\xa9\xa9d\x0b\x0b\x0c\
-KbR\xb2\xb6r\xd1{\xf0\x91e\x1a\xd1\xcb\x10\xc7\
-\x89\x19\xb2Db\xfa\x03\xc6\x01\x90\xb7\xb5\xce\xfa\xfe;\
-I\xe8\x1a\x07f\xde\x12L!\x1c}\x07Bb\xfa\x03\
-\xe6\x0c\xd0\xaelBl\xdd>d!\x83\xfe \xc6I\
-\x80@\xf6\x18\xc0\xccu\xed\xcd\xfb\xce\xfe\xb2\x90A\xff\
-\x02\x19'\x01\x06[\x0d@M\xeb\xcc\x82\x04L\x19\x00\
-X\x94@\x5ct\xfb%`\x83\x01q\x01`\xb2)\x01\
-\x09m\xe2\xde/\x01\x1bk@\x9c\x04\x84d{\x0c\x00\
-K\xed~\xc0\x8e\x04\xb6&T\xb1\x0c\xb0\xb9\x08\x86L\
-\x97\xb4\xcer\x90@\xfc\x22\x18\xda\x0b\x00\x1cG\xbb\x1f\
- \xeag@\xfe\x8fA\x93\x8d\x10`\x18\x80\x86\xb3\xaa\
-\x0d\xc0\xf6<\xc0\xc6S@\x9f\x08\xed \xdf\x1e\x03*\
-\x87\x0eUu\xb4~\x00\xf2\x80\xd6\xf4\xf4\xe1\xa6\x89\x7f\
-\xe3\xe3q\x19\xaa\xf7\x03\x0f@\x1e`D\x7f M\x00\
- [Jg\x16Ra\xb3<\xc0,\x0b\x04R\x04\x80\
-C^S\xb5\xd9\x90\x80Y\x1e@90\x80\xa5Vc\
-[k\x02\xb9\xe7\x0190\x80\xa1\xadI\xf5\xca \xeb\
-E0A1$\x17\x06ho\xd2+\x83\xac\xf3\x80\xd8\
-bH\x1e\x0c\x00\xf3u\xad\xc3\xcc%\x90\x9c\x01\xa6i\
-0\x90.\x00\xda\xfd@\xd6\x0b\xa1I9LH=;\
-#\xfb\x98v\x08B\xba\xa2u\x98\xe1\xa3\xd0\xb4\x1c\x96\
-\x0b\x03\x04\x85\xffh\xdb3L\x86Lk\x01\x1090\
-\x80;\xd0\x9e\x0fd)\x01\xd3Z@\xc7\xb0\x18\x02\xa4\
-\x08\xc0\xb1c\x07.\xeb&\x95%\x03\x0c\xd3`\xae\xcf\
-\xcf.\x9a\xde#\xd5\xab\xb2R\xb2rVY\xae\x01\x86\
-\x1b\xa1\xa5\x93'O\x1a\x9f\xb3\xa7\x0a\x00\xb3T\x1e\xd3\
-f+\x01\xbbY \x90\x9e\x01\xebJ\x87\xf7M\x02f\
-\xb5\xc0\xbb>\xd3tbf\xe5~ \xcb\xb2\x98\x89\x04\
-\xd2<\x02\x81\xf4\x0c\x88\xfa\xf2\x03@\xb6\x95a\x13\x06\
-P\x9e\x12\xd0\x1d\x90\xd8\x95\x80&\x11\xe2|%pC\
-\xe9\xf0>I\x00\xf9J@^S:\x14b\x8b\x0c\xa2\
-\xbe\x15\x04\xb6\x06\xc6u\xa3\xff\xb3\xfd\x13v]\xf5\x1b\
-=L\xe6\xc5\x10 \xf5'34\xa7l!\xc2\xe0`\
-y\xc3\xb9\x10\x18\x18(E\xda\x95\xcbE03\x88\x08\
-cc\xd1/s\x0f\x0f\x0f\xc1\xf36&=2\xb2y\
-\x1d\x05\x81\xe4/F\xf5\x22\xddWc\xcc\x7f\xe9\x9a\x87\
-\x87\x0710P\x82\xe3\x08%\x03\xc6\xc7\x1fC\xab\xd5\
-A\x18J%\x03|\xdf\xc3\xe1\xc3\x13\xe8t\x02\xf8\xbe\
-\xa7\x1d\x92\x90jYj\xfb\xa5\xe9\xb4|\xf4\xc9\xb3\xba\
-l\x10\xd8\xa0\xb5j\xf2]\x14\x0a\x9er\xf2]\x10Q\
-\xec\xe4A\xa8K\xb9tAo\x14\x8dT\x01\xa8\x00A\
-\xbb\xdd\x8e}m.70\xceV*\x95T\x1f\x1e\xa5\
-\xfel\xae%\xc37\xe2X\x90\x13\x96)\x08\xdfK\xdb\
-9u\x00\x8e\x1f\xd9\xf7\xc3\xca\xca\xda\xbb2\x8b\xbaW\
-jP\x15,OU*\xcf]J\xed\xe1^KV3\
-3\x97\x0f\x88\x82\xfb\x85\xeb8G\x5c\xcf)\xc7\xe9\xbe\
-\x1f)\xde\x15n\x01\xf8\x85A\xe7E\xd0:S\xa9L\
-\xa5z\xfcu\xf1\x1f'D\xd5r\xb3\xd8C\xed\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x03\x98\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x01\xb3\x00\x00\x01\xb3\
-\x01\x1ef\xeb\x87\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x03\x15ID\
-ATx\x9c\xed\x99\xcdk\x13A\x18\x87\x9fwR?\
-\xfae\x0f\xa2 *\xb6\x85\x82g\xc1\x9bPZA\x0f\
-\xa2\xe0\x7f X\xb0%\xd5C=\x08\x82\x1e\x8a_\xe0\
-E\xc1\xa4\x7f\x81x\xf7$\x08\x8a\xc7\xa2x\xaaP-\
-\xfd\x10Z+\x8a\xa2Mm\xb1\xb1y=\xb4\x81\xd4\xb6\
-\xc9nvvw\x12\xf79nf&\xef\xf3\xdbYv\
-v\x06\x12\x12\x12\x12\x12\x12\xfe[$\xee\x02\xc2\xa2=\
-\x9b\xeb\x16\xb4\x0f\xe5(F\x96\x14^\xe4W\xf5\xd1\xdc\
-\xe0\x9eo\xa5\xed\xea/\x00U\xe9\x1c\xf9uW\xd1k\
-[\xfc:/\xc6\x9c\x9b\xeao~S\xbcP_\x01\xa8\
-JGv\xf1\x01\xc2\x952\xad~j\xa1pzf\xb0\
-m\x14\xea)\x00U\xe9\x18Y|\x08\x5c\xf6\xd0\xfa\x87\
-\xa895\x95n~]\x1f\x01\xf8\x93/\xf25\xf5'\
-u,\x15VM\x91Q\x9d<@3F\x9bj;\x80\
-\xea\xe5\x01\x108P\xbb\x8f@@\xf9u~\x1b[\xf5\
-D\x8a\x1dyP\xa6k/\x80\xe2\xab.\xa8<\x80\xf0\
-\xb8\xb6\x1e\x01o\xefyO\x88\xf0ve\xb9\xe5D\x83\
-\x8d\xba\x22\xc1\xa2<\xcaxA\xe5\xcc\xec\x90,\xd7\xc6\
-\x0c\xb0,\xafH\xcfL\xba\xe53\xd4\xc2J0Dy\
-p=\x80\x90\xe5\xc1\xe5\x00\x22\x90\x07W\x03\x88H\x1e\
-\x5c\x0c Byp-\x80\x88\xe5a\xbb\x00T\xa53\
-\x93\xeb*\x88i\xda\xb5{y\xf2\xfd\xc5}\xb9\xc0\x05\
-U\xc2\xa6<\x8c\x19\xe1\xe4\xe4@\xeb\x97J\x0d7\x05\
-\xd0\x9eY\xb8 \x22\xc3\xc0\xe1\xf5K+\xa0O\xf2;\
-uh\xb6\xaf\xed\xbb\x85\xe26\x13\x93<\xfc\x13@g\
-v\xf1\xde6{i\x00\x1f\xf2\x92\xea\x9d\x1dh\x9a\x0b\
-\x5cb)1\xcaCI\x00\x1d\xd9\xdcm\xe0z\x85\xf6\
-\x13yI\xf5X\x0b!\x86g\xfe_\x0cx\x96\x07\xe8\
-\xda\xa1\xab/\x0f\x8d,\x1d\xac\xa6\xc6\x0d\xd8\xbe\xf3\x86\
-n\xbf\xf2\x00\xd2\x91Y8\x8b\xc8S\x9f\xfd\x82\xcd\x84\
-\x98\xa7})\x06\x91\xabU\xf4\xab~&8$\x0fk\
-\x8f\xc0\xf1*\xfb\xfa\x0f\xc11y\x00\x03\xa2\x01\xfa{\
-\x0f\xc1Ay\x00\xa3\xe8h\xc01*\x87\xe0\xa8<\x80\
-A\xe5>\x10d\x16@\xb9\x10\x1c\x96\x0703\xe9\x96\
-g\xa2\x0c[\x18ks\x08\x8e\xcbC\xe9B(\x93\x1b\
-F\xb8aa\xcc\xb5Wd\x7f\xe3\xa7\xb8\x179^\xd8\
-\xb0\x14\xf6\xb1 \xaa\xc4\x04\xf0\x0a\xe8\xb30V(w\
-\xbe\xc8\xa6\x8f!\x8b3!8!\xde\xf9\x22[~\x0e\
-;\x11B\x04\xf2PfC$\xd6\x10\x22\x92\x87\x0a;\
-B\xb1\x84\x10\xa1<x\xd8\x12\x8b4\x84\x88\xe5\xc1\xe3\
-\x9e`$!\xc4 \x0f>6EC\x0d!&y\xf0\
-\xb9+\x1cJ\x08\xcax\xa1\xc1\xf4~\xbc\xd4<ou\
-\x5c\x8f\xf8\xde\x16\xb7\x1aB\xcc\xf2P\xe5\xb9\x80\x95\x10\
-\x1c\x90\x87\x00\x07#\x81BpD\x1e\x02\x9e\x0cU\x15\
-\x82C\xf2`\xe1h\xccW\x08\x8e\xc9\x83\xa5\xb3AO\
-!8(\x0f\x16\x0fG\xcb\x86\xe0\xa8<\xac\x1f\x8c\xd8\
-`:\xddz\x13\xb8\xb3\xc5Oc\xc6\xd0\xed\xa2<\x84\
-p<~dd\xe1\xbc)\xc8\x80\x18\xf6\xa2\xf2\xbcQ\
-\x97n\xbdK\xef_\xb4\xfd?\x09\x09\x09\x09\x09\x09\x09\
-\x81\xf9\x0b\xef\x0d\xff[\xfa\xcc.\xfa\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x05>\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x01\xf1\x00\x00\x01\xf1\
-\x01\x9e\xb9mg\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x04\xbbID\
-ATx\x9c\xcd\x9bMh\x1ce\x18\xc7\x7f\xcf\xbb\x89\
-H6\xd9\xaa=\xa4\x88\x22z\xb0\x15\xc1\x83\xf9\x12\xe3\
-a\x93X\xb5\xd6b\x15D\xb1(\x88\x1e,\xd6\x83\x05\
-=x\x11O\x1e\x8a=\xf8\x897\xf1\x8b^\x8c\xb5\x17\
-\x95f\x93\x14Lm\xb2\x09x\x94B=\xa8\x88\xadR\
-\xdbd'b\x93\x9d\xc7\x83;m\x9al\x92\x9d\x99g\
->\xfe\xb7\xcc\xce\xfb\xbc\xef\xef\xb73\xec\xfb\xce;\x11\
-\x9ad~\xa8w{A\xdcK*:\x08R\x04\xf9\x19\
-\xd1#\xc5\xe5\x8e/drr\xb9Y\x9b\xbcD\xcb\xe5\
-6\xaf\xb0\xb8\x0f\xe4I\xd0\xdb@=Q\x99\xaa\x0b\xef\
-\x95*3\xa7W\x9f/\xab\x0fx\xc3\xfd/\xaa\xf0\x0e\
-\xd0\xbe\xa68\x9c\x12doge\xfalB\xe3\x8f\x95\
-\xda\xc8@7\xa2_\xa3\x0c4\xf9xI\xe0\xe5be\
-\xe6\xa3\x95\x07\xaf\x12P\xbb\xbf\xff\x15\x94\xc3\x9b\xf4s\
-Z\x5c\xfbP\xf1\xf8\xd4\xefq\x07l\x99\xda\xc8@7\
-h\x05\xb8s\xe33\xe5\xf5\xce\xca\xf4[\x97\xff\xbaR\
-\xa0\xff \xf0v\x8b\xfd\xe5JB\xeb\xf0A\xaeH\x10\
-\x80\x85\xe1\xfe\x03\x22\xbc\x1b\xaaW\x95\x9f\xf0\xfd\xa1\xce\
-\xc9\xea\x1f\xe1\x86k\x9bZ\xb9o\x1b\xceM \xba#\
-L;E\x0etU\xa6\xdf\x17o\xf8\x9e\xbbU\xfc\x19\
-\xa0\x10\xba\xf7\x8c%D\x85odY\xd4\x0d8\x15}\
-\x8d(\xf0\x00\xa2;pn\xa2V\xee\xdb\x16\xa9}\x8c\
-\xc4\x84\x07hS\xa9\xbf\xea@\x87b\x8d$\x03\x09\x06\
-\xf0\x8dH\xd9\x01\xd7\xc5\x1eQ\x8a\x12\xec\xe0\x01\xb8\xde\
-\x09\xfcjP(\x15\x09\xc6\xf0\x00\xbf8E\x8e\x1a\x15\
-KTB\x02\xf0\x80\x1cs\xc0!\xe0\x9c]M{\x09\
-\xc9\xc0s\x0e8\xe4:+\xd3g\x1d\xec\x05\x16\xccJ\
-\x1bJH\x02^\xa0\xe6\xab>\xd6`\x87\x8e\xca\xcc\x0f\
-\xbe\xeaCXK(\xc8\x09o\xe7\xe0\x8dQK\xd4F\
-\x06\xba)\xc8\x98\xf17\xef\xf9\xe2\xf6\x94\xc6\xab'a\
-\xd5Z`~\xb8\xef^'\xf2-\xd0e\xd8a\xa4i\
-s\xf8\xe9mK\xf1T\xdc#]c\xa7&\x83\x03k\
-V\x83y\x90\x90\x16<4\x11\x00\xd9JH\x13\x1e\xd6\
-\x11\x00\xd9HH\x1b\x1e6\x10\x00\xe9J\xc8\x02\x1e6\
-\x11\x00\xe9H\xc8\x0a\x1eZ\x10\x00\xc9JP\x7f\xb9\x9e\
-\x15<\xb4(\x00\x92\x91 pFa\x19\xd8nU\x93\
-\x10\xf0\x8d1\xb4\x9e\x84\xae\x04\xcb\x84\x82\x87\x90\x02 \
-\xd7\x12B\xc3C\x04\x01\x90K\x09\x91\xe0!\xa2\x00\xc8\
-\x95\x84\xc8\xf0\x10C\x00\xe4BB,x\x88)\x002\
-\x95\x10\x1b\x1e\x0c\x04@&\x12L\xe0\xc1H\x00\xa4*\
-\xc1\x0c\x1e\x0c\x05@*\x12L\xe1\xc1X\x00\xfc/\xa1\
- \xf2\x9dB\xa7q\xe9E\x15\xb7\xdb\x12\x1e\xc0Y\x16\
-\x03p\xe2\xce\xa8\xf0\xa7u]\xe0\xbc\x93\xc2\x9a\xfd\xfd\
-\xb81\x15pyU\xa7\xdcjY\xb7\x91\x9b\xd4_\x9a\
-\x88\xf3\x8c\xb1Y\xccn\x81\x84\x96\xb4\xcdb\xba5o\
-\x22 E\xf8 f\x12b\x0b\xc8\x00>\x88\x89\x84X\
-\x022\x84\x0f\x12[Bd\x019\x80\x0f\x12KB$\
-\x019\x82\x0f\x12YBh\x019\x84\x0f\x12IB(\
-\x019\x86\x0f\x12ZB\xcb\x13\xa1d\xe0\xe5\x1f\x11\x16\
-\xed\xeaq{\xd8\xc9RK\x02\x92{n/\x0f\xd7}\
-\xdd\x89\xe5\xaetH\x09\x9b\xde\x02ilZd\xb9\x17\
-\xb9\xa1\x804wl\xb2\x92\xb0\xae\x80,\xb6\xab\xb2\x90\
-\xd0T@\x96{uiKX# K\xf8 iJ\
-\xb8\xfau\xf9\x1c\xc0\x07IK\xc2\x8a\xd7\xe5\x13\x82w\
-\xba\xbb\xebx\xf5D\x94\xc6iH\x10H\xec=\xbc\x05\
-\xdf\xf7w\x95&f\xa7\xe2\x14\x99\x1f\xea\x1dt\xce}\
-\x83\xa5\x84\x15o\xb9\x8b\x96\xcb\xd7zm\x8b\xdf\xa3\xf4\
-\x98u`\x04\x1f$\x11\x090[\xbc\xe6\xfc}\xcek\
-[\xdc\x9fgx\x80\xd2\xc4\xec\x94\xef\xfb\xbb\xb0\x9d1\
-\xf6z\xffn\xdd\xefP\x9e1,j\x0e\x1f$\x11\x09\
-\xa2\xfb\x1c`u\xdf'\x06\x1f$\x01\x09w8\xe0\x92\
-A\xa1\xc4\xe1\x83\x98J\x10.9\x94\xd9\x98e<u\
-\xba'\x0d\xf8 \xa5\x89\xd9)\xa3w\x9b\xabN\x9d~\
-\x10\xa3\xc0\x82\xef\xfb\x0fF\xfd\x9d\x8f\x93\xd2x\xf5d\
-\xdc+A\x94\x0f]\xd7Xu\x14\xe1\xd3\x08\xedS\xbb\
-\xec\xd7K\xcc\xdb\xe1\x93be\xe6\xa8\x03(\xfe]\x7f\
-^\xe1\xab\x10\x8dS\xbf\xec\xd7K\x94\xdbATF\x8b\
-\x17\xea/@\xe3\x89\x90\xcc\xcd-u\xdep\xcb\x13\xa0\
-GZh\x1fkz\x9bDJ\xe3\xd5\x93\xadJ\x10\x95\
-\xd1\x8e\x8b\xcbO\xc9\xdc\xdc\x12\xacZ\x0ciOO\xbb\
-\xb7\xa5\xf01\xc2\xd3\xeb\xb4\xff\xcbW}4\xf8g\x83\
-\xbc\xa5\xb1v8\x06l]\xe7\x94\xcf\x8b\x17\xea\xcf\x05\
-\xf0\xd0d9\xac \xdeH\xff\xb3\xc0A\xe0\xae\xc6\xe1\
-\x8b\xc0\x97\xae.otLN\xfff=p\xcb,>\
-\xd0w\xb3\xef\xf3&*\x8f\x03[\x1a\x87\x7fD\xe5p\
-q|\xfa3\x01]y\xfe\x7f\xc0\xef\x1a\xc4\xd1E\xed\
-O\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x009\x80\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x04\x00\x00\x00\x04\x00\x08\x02\x00\x00\x00\xf0\x7f\xbc\xd4\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x009\x15IDATx^\xed\xdd\xd9\x95\
-\x1bG\xb6(\xd0[\xfd\xfe\xaf\x05\x09?\x94\xf0\x03\xf0\
-\x03h;\x04\xf8\x01\xf8\x01\xc8\x0f\xa4\x05\xd7\x81z\xc1\
-\xcaP\x91\x04k\xc0\x90C\x0c{\xaf\xd5\xa5\x0c\x8aR\
-\xb7Zd\xe1\x9c<C\xbc\xbc\xbe\xbe\xfe\x0f\x00y\xea\
-\xba.|\xbd\x5c.\xef\xc7\xfeG\x82\xfe\x07\xfbc\xff\
-\xf5\xd7\x9f\xd6?\x04M\xd3\x84\xaf\x8b\xc5\xe2\xfd\xf9\xfd\
-\xe1\x96\x1f\x04 ;\x12\x00\x80\xd9\xfc\x19\x97\xbf\x87\xe6\
-7\x86\xef)\xb8=[\xf8\xf0\x07\x01\x98\x98\x04\x00`\
-\x5c!^\x0f\xb1\xfb?\xff\xfc\xf3\xfe5\xb5\x08~v\
-\xab\xd5*|m\xdb6d\x05Ax\xe8\x7f\x1c\x801\
-H\x00\x00\x86\xd1\x07\xfa\xe1A\xac?\x88>\x1f\x90\x15\
-\x00\x0cN\x02\x00p7/\xf5\xe7\xf2k> +\x00\
-x\x8c\x04\x00\xe0+b\xfd\xf4]\xe5\x03}C\x11\x00\
-\x9f\x91\x00\x00Db\xfd\x92\x5c\xe5\x03}\x86\xf0\xf6g\
-\x00j'\x01\x00j$\xd6\xaf\xd3{V\xf0^1\x90\
-\x15\x00\x15\x92\x00\x00\xe5\xeb\xc3\xfd\xe3\xf1(\xd6\xe7C\
-\xab\xd5\xaa\xcf\x07\xb4\x0f\x015\x90\x00\x00e\x0aQ~\
-\x88\xf8\xcfoD\xfc\xdc%\xa4\x01}& \x1f\x00\x8a\
-$\x01\x00\x0a\x11\xa2\xfc>\xdc\x0fq\xbf\x88\x9f\xa1\xf4\
-mB!\x13\xd0/\x04\x14C\x02\x00\xe4*D\xf9\x1a\
-{\x98X\xc8\x044\x0b\x01\xb9\x93\x00\x009\x09Q\xbe\
-\xc6\x1e\xd2\x11\xd2\x80>\x13\x90\x0f\x00\x19\x91\x00\x00I\
-\x0bQ~\x1f\xeek\xec!q\x9a\x85\x80\x5cH\x00\x80\
-\xb4\x84(_c\x0f\x05\x08\x99\x80f! M\x12\x00\
-`~!\xca\xd7\xd8C\xd9B\x1a\xd0g\x02\xf2\x01`\
-v\x12\x00`\x06!\xca\xef\xc3}\x8d=TH\xb3\x10\
-0/\x09\x000\x91\xfe5\x7f\xa0\xb1\x07~\xf5V\x1b\
-\xf8!\x9e\x01F&\x01\x00\xc6\x15b\xfd\xddn\xe7M\
-?\xdc\x22\xa6\x02\x92\x01`L\x12\x00`\x14\xe7\xf3y\
-\xbf\xdf\x87\xaf\xe2~x@\xcc\x03d\x02\xc0\x08$\x00\
-\xc0`B\xac\xdf\xb7\xf5\x07\xf1\x87\x80\xe7\xc4<@&\
-\x00\x0cG\x02\x00<+\xc4\xfd}\xd0\x1f\xa2\xff\xf8C\
-\xc0\xd0b\x1e \x13\x00\x9e&\x01\x00\x1e\xa4\xb9\x1ff\
-\xf1\xbeDH2\x00<F\x02\x00\xdcGs?\xa4\xa3\
-O\x03\x82x\x06\xb8\x81\x04\x00\xf8\x9e\xe6~H\x5c\xcc\
-\x03d\x02\xc0\x0d$\x00\xc0\xa7\xfa\xb8\xbf\x7f\xdf\x1f\x7f\
-\x08H[\xcc\x03d\x02\xc0\xe7$\x00\xc0\xb5\x10\xf7\x1f\
-\x8f\xc7\xddn\xa7\xc9\x07\xf2\xf5\x9e\x06H\x06\x80+\x12\
-\x00 zo\xf2\x11\xf7Ca\xfad \x88g\xa0n\
-\x12\x00\xa8]\x1f\xf4\x1b\xea\x85\x1a\xc4<@&\x00u\
-\x93\x00@\x8d4\xf7C\xe5b\x1e \x13\x80*I\x00\
-\xa0\x22\x9a\xfb\x81+1\x0f\x90\x09@M$\x00P\x85\
-\xfe}\x7f\x88\xfe\xe3\x19\xe0w1\x0f\x90\x09@\x05$\
-\x00P\xb8\x10\xf4o\xb7[\xaf\xfc\x81[\xb4m\xbb\xd9\
-l\xa4\x01P6\x09\x00\x94)D\xfc!\xee\xf7\xca\x1f\
-xL\xc8\x01v\xbb]\xd34\xf1\x0c\x14D\x02\x00\xa5\
-\x09A\x7f/\x9e\x01\x1e\xf5\xd6\x13\xf4C<\x03E\x90\
-\x00@9B\xd0\xaf\xdb\x07\x18\x5c\xd34\xbb\xddN\x1a\
-\x00\xc5\x90\x00@\xf6t\xfb\x00\xd3\x089\xc0f\xb3i\
-\xdb6\x9e\x81<I\x00 c!\xe8\xb7\xcb\x1f\x98\xd8\
-[O\xd0\x0f\xf1\x0c\xe4F\x02\x00\xf9\xe9\xde\xae\xf1\xd2\
-\xed\x03\xcc\xebp8H\x03 G\x12\x00\xc8\x89n\x1f\
- 5}5 \x88g y\x12\x00\xc8\x83\x01_ \
-e1\x09\x90\x06@\x0e$\x00\x90\xb4\x10\xf1\x87\xd0\x7f\
-\xb7\xdb\x09\xfd\x81,\x84\xefW\x9b\xcd&\x1e\x80$I\
-\x00 Q\xba}\x80|\xc5r\x80\x82\x00$I\x02\x00\
-\xc9\xd1\xed\x03\x94!&\x01\xd2\x00H\x8c\x04\x00R\x11\
-\x22\xfe\xddn\x17\xa2\x7f\xa1?P\x98\xcdf\x13\xbe\xbf\
-\xc5\x0307\x09\x00\xccO\xb7\x0fP\x83X\x0eP\x10\
-\x80\xb9I\x00`N\xba}\x80\xda\xc4$@\x1a\x00\xf3\
-\x91\x00\xc0\x0c\xfaW\xfe\xe7\xf3Y\xe8\x0fT+\xe4\x00\
-\x87\xc3!\x1e\x80\x09I\x00`R\xba}\x00~\x15\xd2\
-\x80\xddn\xd74M<\x03\xe3\x93\x00\xc0D\x84\xfe\x00\
-\x9f\x91\x06\xc0\x94$\x000:\xa1?\xc0-4\x05\xc1\
-4$\x000\x22\xa1?\xc0\xbd\xa4\x010\xb6\xff\xc4?\
-\x02\x83\x0a\xa1\xffz\xbd^,\x16\xa2\x7f\x80\xbb\x84o\
-\x9b///\xdb\xed6\x9e\x81\xa1\xa9\x00\xc0\xc0\xbc\xf5\
-\x07\x18\x8a\x1b\xc4`\x0c\x12\x00\x18R\x88\xfb\xd7\xebu\
-<\x000\x84\x90\x03\x84L \x1e\x80\xa7i\x01\x82a\
-\x84\xd0\x7f\xb1X\x88\xfe\x01\x06\xb7\xddn_^^\xf6\
-\xfb}<\x03\xcfQ\x01\x80g\x85\xd0?|8u\xae\
-\xf4\x02\x18\xdf\xe1pX\xb9E\x18\x9e#\x01\x80\xc7\x09\
-\xfd\x01f!\x0d\x80gh\x01\x82G\xbc7\xfc\x88\xfe\
-\x01\xa6g\xcd\x1a<C\x05\x00\xee\xe3\xad?@:\x9a\
-\xa6\xd9\xedv\xaa\x01p\x17\x09\x00\xdcJ\xe8\x0f\x90&\
-i\x00\xdcE\x02\x00\xdf\x13\xfa\x03\xa4\xafm\xdb\xcdf\
-#\x0d\x80oI\x00\xe0+B\x7f\x80\xbcH\x03\xe0[\
-\x12\x00\xf8\x98\xd0\x1f _!\x01\xe8\xc53\xf0\x0b\x09\
-\x00\x5c\x0bA\xffz\xbd>\x9f\xcf\xf1\x0c@\x9eb\x12\
- \x0d\x80\xdfI\x00\xe0\xa7\x10\xfao\xb7\xdb\xa3\xbdr\
-\x00\x05\x89I\x804\x00\xfe%\x01\x80\x1f\x84\xfe\x00e\
-\x0b\x09\xc0f\xb3i\xdb6\x9e\xa1b\x12\x00j'\xf4\
-\x07\xa8\x874\x00\x02\x09\x00\xf5\x12\xfa\x03\xd4)\xa4\x01\
-\xbb\xdd\xaei\x9ax\x86\xca\xfc'\xfe\x11*\xb3\xdf\xef\
-]#\x0fP\xa7\xf0\xcd?|\x04\x84\x0f\x82x\x86\xca\
-\xa8\x00P\x9d\xf3\xf9\xbc^\xaf;\xfb=\x01\xaa\xd7\xb6\
-\xed\xdf\x7f\xff\xad#\x88\xdaH\x00\xa8K\x08\xfd\xbd\xf5\
-\x07\xe0W\xab\xd5\xeap8\xc4\x03T@\x0b\x10\xb5\xe8\
-\x0b\xbe\xa2\x7f\x00\xae\x84\x8f\x86\x97\x97\x17\x1f\x10\xd4C\
-\x02@\xf9\xba\xb7\x8b\xbd\xb4\xfd\x00\xf0\x05\x9f\x14\xd4C\
-\x02@\xe1\x0c\xfb\x02p\xa3\xbeVl8\x98\xe2\x99\x01\
-\xa0X\x86}\x01xL\xd34\xbb\xdd\xce\xe5\xc1\x94J\
-\x02@\x81B\xd0o\xc1?\x00O2\x1cL\xa9\xb4\x00\
-Q\x9a\x10\xf7\xb7m+\xfa\x07\xe0I\xe1\xa3\xc4p0\
-ER\x01\xa0\x1c\xfd\xb0\xef\xf9|\x8eg\x00\x18\x82\x9b\
-\x83)\x8c\x0a\x00\x85\xd8n\xb7\x8b\xc5B\xf4\x0f\xc0\xe0\
-\x8eo\xc3\xc1\xe1\x83&\x9e!s\x12\x00\xb2\xd7\x7f_\
-\xb6\xb4\x01\x80QY+G1\xb4\x00\x911\xc3\xbe\x00\
-L\xcfp0\xb9\x93\x00\x90\xab\x10\xf7\xaf\xd7\xebx\x00\
-\x80i\x85\x1c\xc0\x9eP2\xa5\x05\x88\xfct]\xb7\x5c\
-.E\xff\x00\xcc(|\x0c\x85\x0f#\xb3g\xe4H\x02\
-@f\x0c\xfb\x02\x90\x88\xf0a\x14r\x00\xc3\xc1dG\
-\x02@6\x0c\xfb\x02\x90 \xc3\xc1d\xc7\x0c\x00\x190\
-\xec\x0b@\xfa\x5c\x17@.$\x00\xa4\xce\xb0/\x00\x19\
-\x099\xc0f\xb3\x89\x07H\x92\x04\x80tu]\xd7\xb6\
-m\xf8\x1a\xcf\x00\x90\x83\xf0\xe1\xf5\xf7\xdf\x7f\x87\xaf\xf1\
-\x0c\x891\x03@\xa2\xd6\xeb\xf5b\xb1\x10\xfd\x03\x90\x1d\
-\xc3\xc1$N\x02@r\xfaa_\x1d\xff\x00d\xcdp\
-0\xc9\xd2\x02DB\x0c\xfb\x02P\x1e\xc3\xc1\xa4F\x02\
-@*\x0c\xfb\x02P07\x07\x93\x0e-@$a\xbb\
-\xdd\x8a\xfe\x01(X\xf8\x983\x15@\x22T\x00\x98Y\
-\xd7u\xe1{\xa2\x9b}\x01\xa8A\xdb\xb6\xa7\xd3)\x1e\
-`&*\x00\xcc)\xc4\xfd\xe1[\xa1\xe8\x1f\x80J\x84\
-\x8f\xbc\xc5b\xe1\x83\x8fyI\x00\x98\xcd~\xbf_.\
-\x97\x16}\x02P\x95\xf0\xc1\x17>\xfe\xc2\x87`<\xc3\
-\xe4\xb4\x001\x8f\xedv\xeb{\x1f\x005\xdbl6\xbb\
-\xdd.\x1e`B\x12\x00\xa6\xa6\xe9\x1f\x00zm\xdb\x1e\
-\x0e\x07\x1bB\x99\x98\x16 &\xa5\xe9\x1f\x00\xde\xf9X\
-d\x16\x12\x00\xa6\xa3\xe9\x1f\x00\xae\x18\x09`zZ\x80\
-\x98\xc8z\xbdv\xc5/\x00|\xc6H\x00\x93\x91\x000\
-:M\xff\x00p\x0b#\x01LC\x02\xc0\xb8B\xdc\x1f\
-\xa2\x7fm?\x00p\xa3\xd3\xe9\x142\x81x\x80\x11\x98\
-\x01`D\x9a\xfe\x01\xe0^F\x02\x18\x9b\x0a\x00c\xd1\
-\xf4\x0f\x00\x0f[\xadV\x87\xc3!\x1e`P\x12\x00\x86\
-\xd7u]\xdb\xb6^\xfc\x03\xc03\x8c\x040\x12-@\
-\x0c\xec|>/\x16\x0b\xd1?\x00<\xa9\xffHUN\
-gp\x12\x00\x86\xd47\xfd\xc7\x03\x00\xf0\xb4\xf5zm\
-$\x80ai\x01b0\x9a\xfe\x01`$F\x02\x18\x90\
-\x04\x80\x01h\xfa\x07\x80\xb15Ms>\x9f\x8d\x04\xf0\
-<-@<\xebx<j\xfa\x07\x80\xb1\x85\x8fZ#\
-\x01\x0cB\x02\xc0S\xb6\xdb\xedz\xbd\x8e\x07\x00`d\
-\xe1c7|\xf8\xc6\x03<D\x0b\x10\x8f\xd3\xf4\x0f\x00\
-\xb30\x12\xc03$\x00<B\xd3?\x00\xcc\xcbH\x00\
-\x0f\xd3\x02\xc4\xdd4\xfd\x03\xc0\xec\x8c\x04\xf00\x09\x00\
-\xf7\xd1\xf4\x0f\x00\xe90\x12\xc0\x03\xb4\x00q\xab\xae\xeb\
-\xc2w\x99\xf3\xf9\x1c\xcf\x00@\x1a\x8c\x04p\x17\x09\x00\
-7\xd1\xf4\x0f\x00)k\x9a&\xe4\x00\xe1\xc3:\x9e\xe1\
-sZ\x80\xf8\x9e\xa6\x7f\x00H\x5c\xf8\x98^.\x97F\
-\x02\xb8\x85\x04\x80o\xec\xf7{M\xff\x00\x90\x85\xf0\x91\
-\x1d>\xb8\xe3\x01>\xa1\x05\x88\xafl\xb7[\xdfG\x00\
- /\x9b\xcdf\xb7\xdb\xc5\x03\xfcA\x02\xc0\xa7\x96\xcb\
-\xa5\x91_\x00\xc8Q\xdb\xb6\xa7\xd3)\x1e\xe0wZ\x80\
-\xf8@\xdfG(\xfa\x07\x80L\x85\x0f\xf1\xf0Qn~\
-\x8f\x0f\xa9\x00p-|\xb3\xb0\xf0\x07\x00\x0a\xe0\xb6`\
->\xa4\x02\xc0o\xc2\xb7\x09\x0b\x7f\x00\xa0\x0c\xe1\x03=\
-|\xac+\xe9sE\x02\xc0O\xc7\xe3q\xb9\x5c\xc6\x03\
-\x00P\x84\xf0\xe1n\xa5\x07\xbf\x92\x00\x10Y\xf7\x09\x00\
-\xa5\xb2\xd6\x8f_\x99\x01\xe0\x07\xdf\x17\x00\xa0x\xd6\x83\
-\xd2\x93\x00\xf0\xe3\xd2\x10\x17\x07\x02@\x0dV\xab\xd5\xe1\
-p\x88\x07j%\x01\xa8Z\xd7u!\xfa7\x1b\x04\x00\
-\xf5pE\x00\x12\x80zY\xf7\x09\x00u\xb2\x1e\xb4r\
-\x86\x80+\x15~\xdb\x8b\xfe\x01\xa0N\xd6\x83VN\x02\
-P\xa3~\xdd\xa7\xe8\x1f\x00j\x16\x82\x01C\x80u\x92\
-\x00T\xc7\xbaO\x00\xa0\x17B\x02k\x00+d\x06\xa0\
-.\xd6}\x02\x00W\xac\x07\xad\x8d\x04\xa0\x22\xd6}\x02\
-\x00\x1f\xb2\x1e\xb4*\x12\x80Z,\x97K\xb3>\x00\xc0\
-g\xac\x07\xad\x87\x04\xa0|\xd6}\x02\x00\xb7\xb0\x1e\xb4\
-\x12\x86\x80\x0bg\xdd'\x00p\xa3\xfe\xa5\xa1\x96\x81\xe2\
-\xa9\x00\x94,\xfc\x06^.\x97\xf1\x00\x00p\x9b\xc3\xe1\
-\xb0Z\xad\xe2\x81\xe2\xa8\x00\x14k\xbf\xdf\x8b\xfe\x01\x80\
-\x07X\x0fZ6\x15\x802Y\xf7\x09\x00<\xc9z\xd0\
-R\xa9\x00\x14H\xf4\x0f\x00</\x84\x13!\xa8\x88\x07\
-\x0a\xa2\x02P\x1a\xeb>\x01\x80\x01Y\x0fZ\x1e\x15\x80\
-rt]\xb7X,D\xff\x00\xc0\x80\xfa\x9d\x226\x0a\
-\x96D\x02P\x88~o\x97\xdf\x9c\x00\xc0\xe0B\x0e`\
-=hI\xb4\x00\x95\xa0O\xcd\xe3\x01\x00`\x1c\xa7\xd3\
-)d\x02\xf1@\xb6T\x00\xb2g\xdd'\x000\x8d\x10\
-rX4R\x00\x09@\xde\x8c\xe7\x03\x00S\xb2l\xb0\
-\x00\x12\x80\x8c\x89\xfe\x01\x80\xe9\xc9\x01rg\x06 W\
-\xfa\xfe\x01\x80\x19\x99\x07\xc8\x97\x04 K\xa2\x7f\x00`\
-v\x97\xcb\xa5i\x9ax \x1fZ\x80\xf2\xd3u\xddz\
-\xbd\x8e\x07\x00\x80\x99XA\x9e)\x15\x80\xfc,\xdd\xf5\
-\x0b\x00\xa4\xa1i\x9a\xcb\xe5\x12\x0fdB\x05 3\xa2\
-\x7f\x00 \x1d]\xd7iK\xce\x8e\x04 '\xdb\xedV\
-\xf4\x0f\x00$%\x04'\xd6\x12\xe6E\x02\x90\x0d+\xb7\
-\x00\x804YM\x9e\x17\x09@\x1e\xc2\xef+\xd1?\x00\
-\x90,\xb1JF\x0c\x01g\xe0x<Z\xfb\x03\x00\xa4\
-\xcf\xe5\x00Y\x90\x00\xa4\xce\xca\x7f\x00 #r\x80\xf4\
-I\x00\x92\xd6u\x9d\x0d\xbb\x00@F\x9a\xa69\x9f\xcf\
-.\x08K\x99\x04 i\x8b\xc5B\xf4\x0f\x00\xe4\xc5\xe5\
-\x00\x893\x04\x9c\xae\xe5r)\xfa\x07\x00\xb2\xe3r\x80\
-\xc4I\x00\x12\xb5^\xaf\xad\xfc\x07\x002\x15\xc2\x18+\
-L\x92%\x01H\xd1v\xbb=\x1e\x8f\xf1\x00\x00\x90\xa1\
-\x10\xcc\xb8\x1c M\x12\x80\xe4X\xa3\x0b\x00\x94AT\
-\x93&C\xc0i\xb1\xf2\x1f\x00(\xcc\xe1pX\xadV\
-\xf1@\x02$\x00\x09\xb1\xf2\x1f\x00(\x92\xcb\x01\x92\x22\
-\x01HE\xd7u\x8b\xc5\x22\x1e\x00\x00\x0a\xe2r\x80\xa4\
-\x98\x01H\x85\xb4\x18\x00(U\xe7n\xd3\x94H\x00\x92\
-`\xe5?\x00P\xb6\x10\xea\x18tL\x84\x04`~V\
-\xfe\x03\x005p9@\x22$\x003\xb3\xf2\x1f\x00\xa8\
-\x87\xcb\x01R \x01\x98\x93\xe5\xb8\x00@m\xc4?\xb3\
-\xb3\x05h6\xe1\x97\xbe\x0c\x18\x00\xa8\x93\xcb\x01f$\
-\x01\x98\x87\x95\xff\x00@\xe5\x5c\x0e0\x17\x09\xc0\x0c\xac\
-\xfc\x07\x00\x08.\x97\x8b\xcb\x01\xa6g\x06`j\xfd\x1e\
-\xdcx\x00\x00\xa8\x98\xcb\x01f!\x01\x98\xdaz\xbd\xf6\
-\x0b\x1d\x00 p9\xc0,$\x00\x93Z.\x97V\xfe\
-\x03\x00\xbc3\x189=\x09\xc0t\xb6\xdb\xad\xe8\x1f\x00\
-\xe0J\x08\x90\xacF\x9c\x92\x04`\x22V\xde\x02\x00|\
-F\xa44%[\x80\xa6p<\x1e\xf5\xb7\x01\x00|\xcd\
-\xe5\x00\xd3\x90\x00\x8cNg\x1b\x00\xc0\x8d,\x06\x9d\x80\
-\x04`t\x8b\xc5\xc2\xda\x1f\x00\x80[\x84\xe8\xff|>\
-\xcb\x01Fe\x06`\x5c\x96~\x02\x00\xdc\xceb\xd0\x09\
-H\x00F\xb4\xddn\x8f\xc7c<\x00\x00p\x03K\x81\
-\xc6\xa6\x05h,\x06\x7f\x01\x00\x1ef x<\x12\x80\
-Qt]\xb7X,\xe2\x01\x00\x80\xfb\x19\x08\x1e\x89\x16\
-\xa0Q\xb4m\x1b\x9f\x00\x00x\x88\x80j$\x12\x80\xe1\
-\x19\xfc\x05\x00x\x9e\x81\xe0\x91H\x00\x06f\xf0\x17\x00\
-`(!\xac2\x10<83\x00C2\xf8\x0b\x000\
-8\x03\xc1\xc3\x92\x00\x0c\xc6\xe0/\x00\xc0H\x0c\x04\x0f\
-H\x0b\xd0`\xcc\xa9\x00\x00\x8cD\xa05 \x09\xc00\
-\x0c\xfe\x02\x00\x8c\xc7@\xf0\x80$\x00\x03\xd8\xef\xf7\x06\
-\x7f\x01\x00F\x15\xc2\xad\x10t\xc5\x03O0\x03\xf0,\
-\x83\xbf\x00\x00\x939\x9dN\xda\x81\x9e$\x01x\x8a\xc1\
-_\x00\x80\x89\x19\x08~\x92\x16\xa0\xa7x\xf7\x0f\x000\
-1\x15\x80'I\x00\x1e\x17\xa2\xff\xf3\xf9\x1c\x0f\x00\x00\
-L\xc2@\xf0\x93$\x00\x0f2\xf8\x0b\x000\x17\x03\xc1\
-\xcf0\x03\xf0\x88\xf3\xf9\xbc\x5c.\xe3\x01\x00\x809\x18\
-\x08~\x8c\x04\xe0n\x06\x7f\x01\x00R\xd04\xcd\xf9|\
-6\x10|/-@w\xd3s\x06\x00\x90\x02\xc3\x00\x8f\
-\x91\x00\xdcg\xbb\xdd\x1a\xfc\x05\x00HD\x08\xcc\xe4\x00\
-\xf7\x92\x00\xdca\xff&\x1e\x00\x00H\x80\x81\xe0{\x99\
-\x01\xb8\x95\xc1_\x00\x80d\x19\x08\xbe\x9d\x04\xe0&]\
-\xd7\x85_R\xe1k<\x03\x00\x90\x12\x03\xc1\xb7\xd3\x02\
-t\x93\xf5z-\xfa\x07\x00H\x96\x81\xe0\xdbI\x00\xbe\
-g\xf0\x17\x00 }!`\x0ba[<\xf0\x85W\xbe\
-\xb4\xdb\xed\xe2\xffS\x00\x00$/\x04o1\x8c\xe3\x13\
-f\x00\xbeb\xf0\x17\x00 ;\x06\x82\xbf&\x01\xf8\xca\
-b\xb1\xd0\xfa\x0f\x00\x90\x17\x03\xc1_3\x03\xf0\xa9\xe5\
-r)\xfa\x07\x00\xc8\x8e\x81\xe0\xafI\x00>f\xf0\x17\
-\x00 _\x06\x82\xbf\xa0\x05\xe8\x03\xc7\xe3Q\xd6\x08\x00\
-\x90\xbb\xc3\xe1\xb0Z\xad\xe2\x81\x7fI\x00\xaeu]\xb7\
-X,\xe2\x01\x00\x80\x9c].\x17\xc3\x00W\xb4\x00]\
-S-\x02\x00(\x86\xd0\xeeO\x12\x80\xdf\x1c\xdf\xc4\x03\
-\x00\x00\x99\x13\xdd\xfdI\x0b\xd0o\xec\xfd\x04\x00(L\
-\xd34\x97\xcb%\x1eP\x01\xf8\xd5v\xbb\x15\xfd\x03\x00\
-\x14\xc6V\xd0+*\x00\x91K\x7f\x01\x00\x0af\x1a\xf8\
-\x9d\x0a@\xf4\xdf\xff\xfe7>\x01\x00P\x9c\xb6m\xe3\
-S\xf5$\x00?\xec\xf7{\xd7~\x01\x00\x14\xac\xeb:\
-\xd3\xc0=-@\x16\xff\x03\x00\xd4B#P\xa0\x02`\
-;,\x00@-\x04~A\xed\x09\x80\xd5\xb0\x00\x00\xf5\
-\x10\xfb\x05\xb5\xb7\x00Y\xfc\x0f\x00P\x15\xd7\x02T]\
-\x01\xb0\xf8\x1f\x00\xa06!\xfc\xab\xbc\x11\xa8\xde\x0a\x80\
-\xc5\xff\x00\x00\xd5\xaay\x1a\xb8\xde\x0a\x80\xc5\xff\x00\x00\
-\xd5\xaa\xf9n\xe0J\x13\x80\xe3\xf1h\xf1?\x00@\xb5\
-B(X\xed4p\xa5-@///\xf1\x09\x00\x80\
-Z\xd5\xd9\x08Tc\x05\xa0\xe6\x8a\x0f\x00\x00\xef*\x9d\
-\x06~\xad\xcc\xe1p\x88\xff\xe4\x00\x00T/\x04\x871\
-L\xacFu-@\x16\xff\x03\x00\xf0\xae\xc2k\x01\xea\
-j\x01\xb2\xf8\x1f\x00\x80_Ux-@E\x15\x80\xf0\
-ow\xb1X\xc4\x03\x00\x00\xfc\xab\xaai\xe0\x8a*\x00\
-\x95_\xf9\x06\x00\xc0g\xaaZ\x12SK\x02p|\x13\
-\x0f\x00\x00\xf0\x8b\xaa\xae\x05\xa8\xa5\x05\xc8\xe2\x7f\x00\x00\
-\xbe\xd04MH\x03jh\x04\xaa\xa2\x02`\xf1?\x00\
-\x00_\xabg\x1a\xb8\xfc\x0a\xc0\xf1x\x94\x00\x00\x00p\
-\x8b\xd3\xe9\xd4\xb6m<\x14\xaa\xfc\x04\xc0\xe2\x7f\x00\x00\
-nT\xc3\xb5\x00\x85\xb7\x00\xed\xf7{\xd1?\x00\x007\
-\x0a\xa1c\x08 \xe3\xa1P%W\x00,\xfe\x07\x00\xe0\
-\x01e_\x0bPr\x05\xc0\xe2\x7f\x00\x00\x1ePx\x18\
-\xf9Z\xa8\xc3\xe1\x10\xff\x09\x01\x00\xe0N!\x98\x8ca\
-eq\x8am\x01\xb2\xf8\x1f\x00\x80\x87\x15<\x0d\x5cf\
-\x0b\x90\xbd\x9f\x00\x00<\xa3\xeb\xbaRC\xca\x02+\x00\
-\xe7\xf3y\xb9\x5c\xc6\x03\x00\x00<\xaa\xc8k\x01\x0aL\
-\x00B\xf4\x1fr\x80x\x00\x00\x80G\x15\xd9\x08TZ\
-\x0b\xd0~\xbf\x17\xfd\x03\x000\x88\x22\xaf\x05(\xaa\x02\
-`\xf1?\x00\x00\x83+\xecZ\x80\xa2*\x00\x16\xff\x03\
-\x000\xb8\xc2\x82\xccr*\x00f\x7f\x01\x00\x18II\
-E\x80r*\x00\xe5\xb5g\x01\x00\x90\x88\x92\x8a\x00\x85\
-T\x00\xbc\xfe\x07\x00`T\xc5\x14\x01\x0a\xa9\x00x\xfd\
-\x0f\x00\xc0\xa8\x8a)\x02\x94P\x018\x1e\x8f\xae\xfe\x05\
-\x00`le\x14\x01J\xa8\x00\x84\x04 >\x01\x00\xc0\
-h\xca(\x02d_\x01\xf0\xfa\x1f\x00\x80\xc9\x14P\x04\
-\xc8\xbe\x02\xe0\xf5?\x00\x00\x93)\xe1\xd5\xf3k\xce\x0e\
-\x87C\xfc\xc7\x00\x00\x80I\x84\x104\x06\xa3y\xca\xbb\
-\x02\xe0\xf5?\x00\x00\x13\xcb}\x12 \xe3\x04 D\xff\
-\x12\x00\x00\x00&\xd6u]\xd6Qh\xc6C\xc0\xcb\xe5\
-\xf2|>\xc7\x03\x00\x00L\xa5i\x9a\xcb\xe5\x12\x0f\xb9\
-\xc9\xb5\x02\x10\xb2.\xd1?\x00\x00\xb3\xc8\xba\x08\x90k\
-\x05\xc0\xeb\x7f\x00\x00f\x94o\x11 \xcb\x0a\x80\xd7\xff\
-\x00\x00\xcc+\xdf\x22@\x96\x15\x80\xc5b\x11\xfe\x1f\x8f\
-\x07\x00\x00\x98C\xa6E\x80\xfc*\x00!\xd3\x12\xfd\x03\
-\x000\xbbL\x8b\x00\xf9U\x00\xbc\xfe\x07\x00 \x119\
-\x16\x012\xab\x00x\xfd\x0f\x00@:r,\x02dV\
-\x01\xf0\xfa\x1f\x00\x80\xa4dW\x04\xc8\xa9\x02\xe0\xf5?\
-\x00\x00\xa9\xc9\xae\x08\x90S\x05\xe0\xe5\xe5%>\x01\x00\
-@2\xf2*\x02dS\x01\xc8q\xc2\x1a\x00\x80\x1a\xe4\
-U\x04\xc8\xa6\x02\xe0\xf5?\x00\x00\xc9\xca\xa8\x08\x90G\
-\x05`\xbf\xdf\xc7'\x00\x00HOFE\x80<*\x00\
-^\xff\x03\x00\x90\xb8\x5c\x8a\x00\x19T\x00\xbc\xfe\x07\x00\
- }\xb9\x14\x012\xa8\x00x\xfd\x0f\x00@..\x97\
-K\xd34\xf1\x90\xa4\xd4+\x00\xdb\xed6>\x01\x00@\
-\xf2\xd2\x0f_S\xaf\x00x\xfd\x0f\x00@^\x12/\x02\
-$]\x01\xf0\xfa\x1f\x00\x80\xec$\x1e\xc4&]\x01\xf0\
-\xfa\x1f\x00\x80\x1c\xa5\x5c\x04H\xb7\x02\xb0^\xaf\xe3\x13\
-\x00\x00d%\xe5\x22@\xba\x15\x00\xaf\xff\x01\x00\xc8W\
-\xb2E\x80D+\x00^\xff\x03\x00\x90\xb5d\x8b\x00)\
-V\x00\xba\xae[,\x16\xf1\x00\x00\x00yJ\xb3\x08\x90\
-b\x05\xc0\xf2\x1f\x00\x00\x0a\x90fX\x9b\x5c\x05\xc0\xeb\
-\x7f\x00\x00\x8a\x91`\x11 \xb9\x0a\x80\xd7\xff\x00\x00\x14\
-#\xc1\xe06\xb9\x0a\x80\xe5?\x00\x00\x94$\xb5\x22@\
-Z\x15\x00\xcb\x7f\x00\x00(LjE\x80\xb4*\x00^\
-\xff\x03\x00P\x98\xa6i.\x97K<$ \xa1\x0a\xc0\
-\xf1x\x8cO\x00\x00P\x8a\xae\xeb\x92\x0at%\x00\x00\
-\x000\xae\xb4\xba\x80^\xd3p8\x1c\xe2\xff \x00\x00\
-(\xce\xe5r\x89\x81\xef\xdcR\xa9\x00x\xfd\x0f\x00@\
-\xc1\xd2)\x02\xa42\x04l\xfc\x17\x00\x80\xb2%\xb2\x0f\
-4\x89\x0a\x80\xcb\xbf\x00\x00(\xden\xb7\x8bO\xb3J\
-\xa2\x02\xe0\xf5?\x00\x00\xc5Kd\x1f\xe8\xfc\x15\x00\xdd\
-\xff\x00\x00\xd4 \x95}\xa0o\xa3\xc0sZ\xadV\xf1\
-\x7f\x0a\x00\x00\x14\xadi\x9a\x18\x04\xcfg\xe6\x04\xc0\xf6\
-O\x00\x00\xaa2\xfb>\xd0\x99[\x80\xf4\xff\x00\x00P\
-\x95\xd9\xf7\xdf\xcc<\x04l\xfc\x17\x00\x80\xda\xcc\xbb\x0f\
-t\xce\x0a\xc0~\xbf\x8fO\x00\x00P\x8dy\xbb`\xe6\
-\xac\x00x\xfd\x0f\x00@\x85\xe6\xdd\x07:[\x05@\xf7\
-?\x00\x00u\x9ay\x1f\xe8\xdb(\xf0\x0cl\xff\x04\x00\
-\xa0Z3\xee\x03\x9d'\x01\xb0\xfd\x13\x00\x80\xca\xcd\xb5\
-\x0ft\x9e\x16 \xfd?\x00\x00Tn\xae}\xa0\xf3\x0c\
-\x01\x1b\xff\x05\x00\x80Y\xf6\x81\xceP\x01\xf0\xfa\x1f\x00\
-\x00\x82\xf3\xf9\x1c\x9f&4C\x05\xc0\xeb\x7f\x00\x00\x08\
-f\xd9\x07:u\x05\xc0\xeb\x7f\x00\x00\xe8\xcd\xb2\x0fT\
-\x02\x00\x00\x00\xb3\xd9\xef\xf7\xf1i2o\xbb\x80&r\
-:\x9d\xe2\x7f+\x00\x00\xf0f\xe2}\xa0\x93V\x00f\
-\xc8o\x00\x00 m\x13\xef\x03\x9dt\x08\xd8\xf8/\x00\
-\x00\xfci\xca\x98|\xba\x0a\x80\xee\x7f\x00\x00\xf8\xd0\x94\
-\xa1\xf2t\x15\x80\xc5b\xd1u]<\x00\x00\x00\xff\x9a\
-r\x1f\xe8D\x15\x80\x90\xd3\x88\xfe\x01\x00\xe0CS\xee\
-\x03\x9d.\x01\x88O\x00\x00\xc0\x1f&\x0b\x98\xa7h\x01\
-\x0a\x09\xcdb\xb1\x88\x07\x00\x00\xe0#\x97\xcb\xa5i\x9a\
-x\x18\xcd\x14\x15\x80\x89\x17\x1b\x01\x00@\x8e\xa6\x09\x9b\
-\xa7\xa8\x00\xd8\xfe\x09\x00\x00\xb7\x98 8\x1f\xbd\x02\xa0\
-\xfb\x1f\x00\x00n4E\xf0\x1c\x92\x8cQ\xb5m\x1b\xff\
-\x9b\x00\x00\x80/5M\x13\xc3\xe8\xd1\x8c\x9b\x00\x1c\x0e\
-\x87\xf8\x8f\x02\x00\x00\xdc\xe0t:\xc5`z\x1c\xe3\xb6\
-\x00\xe9\xff\x01\x00\x80\xbb\xec\xf7\xfb\xf84\x8eq\x87\x80\
-\x8d\xff\x02\x00\xc0\xbdF\xdd\x07:b\x05\xc0\xeb\x7f\x00\
-\x00x\xc0\xb8\x81t\xdf\x094\x86\xd5j\x15\xff;\x00\
-\x00\x80\x9b\x8d:\x0a<b\x0b\x90\xfe\x1f\x00\x00x\xcc\
-x]@c\xb5\x00\xe9\xff\x01\x00\x80\x87\x9d\xcf\xe7\xf8\
-44\x09\x00\x00\x00$g\xbc]@c\xb5\x00\xe9\xff\
-\x01\x00\x80g\x8c\x14\xa8\x8fR\x01\xf0\xfa\x1f\x00\x00\x9e\
-4RP-\x01\x00\x00\x80\x14\x8d\x14T\x8f\xd2\x02\xa4\
-\xff\x07\x00\x00\x9e\xd44\xcd\xe5r\x89\x87\xe1\x0c_\x01\
-\xf0\xfa\x1f\x00\x00\x9e\xd7u\xdd\x18\xbb\x80$\x00\x00\x00\
-\x90\xa81B\xeb\xe1[\x80\xf4\xff\x00\x00\xc0 \xc6\xe8\
-\x02\x1a\xb8\x02\xe0\xf5?\x00\x00\x0c\xa5{\x13\x0f\x03\x19\
-e\x0b\x10\x00\x000\x88\xe1\xdf\xb0\xbf\x0ej\xb5Z\xc5\
-\xbf/\x00\x00\xf0\xb4\xa6ib\xa8=\x90\x81g\x00\x0c\
-\x00\x00\x00\xc0\xb0.\x97KH\x03\xe2\xe1iC\xb6\x00\
-\x19\x00\x00\x00\x80\xc1\x0d\xbc\x0c\xb4/\x04\x0cB\xff\x0f\
-\x00\x00\x0c\xaem\xdb\x18p\x0fa\xc8\x16 \xfd?\x00\
-\x000\x86\x01\xbb\x80\x06k\x01\xd2\xff\x03\x00\x00#\x19\
-\xb0\x0bH\x02\x00\x00\x00\xa9\x1b0\xd8\x1e\xac\x05H\xff\
-\x0f\x00\x00\x8cg\xa8\xb8}\x98\x0a\x80\xd7\xff\x00\x000\
-\xaa\xa1\xba\x80$\x00\x00\x00\x90\x81\xfd~\x1f\x9f\x9e3\
-L\x0b\x90\xfe\x1f\x00\x00\x18U\xd34\x97\xcb%\x1e\x9e\
-0@\x05\xc0\xeb\x7f\x00\x00\x18[\xf7&\x1e\x9e \x01\
-\x00\x00\x80<\xecv\xbb\xf8\xf4\x84\x01\x12\x80A\x12\x11\
-\x00\x00\xe0k\x83\xbcy\x1f`\x06\xc0\x00\x00\x00\x00L\
-\xe3\xf9+\x81\x9f\xad\x00\xe8\xff\x01\x00\x80\xc9<\x1f~\
-K\x00\x00\x00 \x1b\xcf\x87\xdf\xcf\xb6\x00\xe9\xff\x01\x00\
-\x80)=\xd9\x05\xf4T\x05\xc0\xeb\x7f\x00\x00\x98\xd8\x93\
-W\x02K\x00\x00\x00 'O\x06\xe1O\xb5\x00\xe9\xff\
-\x01\x00\x80\xe9=\x13\xc3?^\x01\xf0\xfa\x1f\x00\x00f\
-\xf1L\x17\x90\x04\x00\x00\x002\xb3\xdf\xef\xe3\xd3\xfd\x1e\
-o\x01\xd2\xff\x03\x00\x00\xb3h\x9a\xe6r\xb9\xc4\xc3\x9d\
-\x1e\xac\x00x\xfd\x0f\x00\x00s\xe9\xde\xc4\xc3\x9d$\x00\
-\x00\x00\x90\x9f\xddn\x17\x9f\xee\xf4`\x0b\x90\xfe\x1f\x00\
-\x00\x98\xd1\xc3]@O\xdd\x03\x00\x00\x00\xcc\xe2\xe1.\
-\xa0G\x12\x00\xfd?\x00\x000\xbb\xc7\xc2r\x09\x00\x00\
-\x00d\xe9\xb1\xb0\xfc\x91\x19\x00\x03\x00\x00\x000\xbb\xc7\
-\xc6\x00\xee\xae\x00<\xbco\x08\x00\x00\x18\xd0cc\x00\
-w'\x00\xcf\x5c;\x0c\x00\x00\x0c\xe8\x81\xe0\xfc\xee\x04\
-\xc0\x00\x00\x00\x00$b\x8a\x04@\x0b\x10\x00\x00$\xe2\
-\x81\xb7\xf3w\x0f\x01\x9b\x00\x06\x00\x80t\xdc\x1b\xcf\xdf\
-W\x01\xd0\xff\x03\x00\x00I\xb9\xb7C\xe7\xee\x16 \x00\
-\x00 \x1d\xf7\xbe\xa3W\x01\x00\x00\x80\x8c\xdd=\x07\xfc\
-z\x8f\xf8\xd7\x00\x00\x00ih\x9a&\x06\xeb\xb7\xd1\x02\
-\x04\x00\x00\x19{\xbb\x0d\xec\x8e1\x80;\x12\x00\xfd?\
-\x00\x00\x90\xa0\xcb\xe5\x12\x9fnpG\x02\xe0\x0e`\x00\
-\x00H\xd0]o\xea\xefH\x00\xee]0\x04\x00\x00L\
-\xe0\x9f\x7f\xfe\x89O\xb7\x88\xb3\x007\x88\x7f\x01\x00\x00\
-\x90\x92\xbb\xe6\x80oM\x00\xee\xea+\x02\x00\x00\xa6\x14\
-\xc2\xf5\x18\xb8\x7f\xe7\xd6\x16 \x03\x00\x00\x00\x90\xac\xdb\
-\xc3\xf5[\x13\x00+\x80\x00\x00 Yw\xbc\xaf\x8f\x95\
-\x80\xef\xb4m\x1b\xff\x02\x00\x00 1\xb7\x8f\x01\xbc\x84\
-\xff\xc4\xbf\xe8K///\xf1\x09\x00\x00H\xcf\x8d\x81\
-\xfdM-@\xfa\x7f\x00\x00 q7n\xed\xbf\xe3\x1e\
-\x00\x00\x00 Y7\xbe\xb5W\x01\x00\x00\x80\x12\xdc:\
-\x07\xfc6\x09\xf0\x8d\xf8S\x01\x00\x80T\xdd8\x07,\
-\x01\x00\x00\x80B\xdcr\x1d\xd8\xf7-@\xfa\x7f\x00\x00\
- \x0b!\x01\x88O\x9f\xfb>\x01p\x070\x00\x00d\
-\xe1\x96w\xf7\xdf'\x007\xae\x13\x02\x00\x00\xe6\xf5\xcf\
-?\xff\xc4\xa7/\xc4V\xa0\xcf\xc5\x9f\x07\x00\x00\xa4\xed\
-\x969\xe0o\x12\x80[\xba\x88\x00\x00\x80D|;\x07\
-\xfcM\x0b\x90\x01\x00\x00\x00\xc8\xc8\xb7\x01\xfc7\x09\x80\
-\x15@\x00\x00\x90\x91\xef\xdf\xe0\xc7J\xc0'\xda\xb6\x8d\
-?\x0f\x00\x00H\xde\xb7c\x00/\xe1?\xf1\xe7~\xe4\
-\xe5\xe5%>\x01\x00\x009\xf8:\xc2\xff\xaa\x05H\xff\
-\x0f\x00\x00d\xe7\xeb=\xfe\xdf\xdf\x03\x00\x00\x00d\xe4\
-\xeb\xf7\xf8*\x00\x00\x00P\x94o\xe6\x80\xdf&\x01>\
-\x16\x7f\x06\x00\x00\x90\x8f\xaf\xe7\x80%\x00\x00\x00P\x9a\
-/\xae\x03\xfb\xb4\x05H\xff\x0f\x00\x00d*$\x00\xf1\
-\xe9\x0f\x9f&\x00\xee\x00\x06\x00\x80L}\xf16\xff\xd3\
-\x04\xe0\xeb\xe5A\x00\x00@\xb2\xfe\xf9\xe7\x9f\xf8\xf4\xa7\
-\xd8\x0a\xf4\x87\xf8\xa7\x01\x00\x80\xdc|1\x07\xfc\xe9M\
-\xc0\xee\x00\x06\x00\x80|}\x16\xe7\x7f\xdc\x02\xa4\xff\x07\
-\x00\x00\xb2\xf6YH\xffq\x02`\x02\x18\x00\x00\xb2\xf6\
-\xd9\x22 \x15\x00\x00\x00(\xd0gs\xc0*\x00\x00\x00\
-P\xa0\xfb*\x00\x00\x00@\xd6>\xdd\x04\xfa\xb6\x0b\xe8\
-Z\xd34\xf1O\x03\x00\x00\x19\xfal\x13\xe8\xc7k@\
-\xed\x00\x05\x00\x80\xdc}\x18\xea\x7f\xd0\x02d\x02\x18\x00\
-\x00\x0a\xf0a`\xffA\x02`\x02\x18\x00\x00\x0a\xf0\xe1\
-\x1c\xb0!`\x00\x00(\xd3\x87s\xc0\x1f$\x00\xc7\xe3\
-1>\x01\x00\x00\xd9R\x01\x00\x00\x80\x8a|\xbc\x09\xf4\
-m\x17\xd0o\xec\x00\x05\x00\x80\x02|\xb8\x09\xf4\x835\
-\xa0v\x80\x02\x00@\x19\xfe\x8c\xf6\xb5\x00\x01\x00@\xb1\
-\xfe\xdc\x04z\x9d\x00\x98\x00\x06\x00\x80b\xfc9\x07\xac\
-\x02\x00\x00\x00\xc5\xfas\x0e\xf8:\x01p\x0b\x18\x00\x00\
-\x14\xe3\xfb\x0a\xc0\x87\xd7\x05\x03\x00\x009\xfa`\x13\xe8\
-\xdb.\xa0\x9f\xec\x00\x05\x00\x80b\xfc\xb9\x09\xf4z\x0d\
-\xa8\x1d\xa0\x00\x00P\x92\xab\x80\xdf\x100\x00\x00\x94\xec\
-\xaa\xc9\xff\xb7\x04\xc0\x040\x00\x00\x14\xe6j\x0e\xf8\xb7\
-\x04\xc0\x040\x00\x00\x14\xe6j\x0eX\x05\x00\x00\x00J\
-\xa6\x02\x00\x00\x00\x15\xf9\xaa\x02 \x01\x00\x00\x80\xc2\x5c\
-U\x00~[\x03j\x07(\x00\x00\x94\xe7\xd7\x98\xff\xb7\
-\x0a\x00\x00\x00P\x9e_;}~&\x00&\x80\x01\x00\
-\xa0H\xbfv\x01\xfdL\x00\x0c\x00\x00\x00@\xf1$\x00\
-\x00\x00P\xb8_\x17\x01i\x01\x02\x00\x80\xc2i\x01\x02\
-\x00\x80\x8a\xfcv\x15\xc0\xeb\xbf\xe2\x19\x00\x00(K\xd3\
-41\xe8\x7f}\xfdy\x0f\x80K\x00\x00\x00\xa0T\xef\
-a\x7fl\x012\x00\x00\x00\x00\x05{o\xf8\x8f\x09\x80\
-\x01\x00\x00\x00(\xd8\xfb\x1c\xb0\x04\x00\x00\x00\xca\xf7>\
-\x07\xac\x05\x08\x00\x00\xcaw]\x01\x00\x00\x00\x0a\xf6s\
-\x13\xe8\xdb. ;@\x01\x00\xa0d\xef\x9b@\xe3\x1a\
-P;@\x01\x00\xa0l}\xe4\xaf\x05\x08\x00\x00*\x22\
-\x01\x00\x00\x80\x8a\xfcH\x00\xec\x00\x05\x00\x80\xe2\xf5a\
-\xbf\x0a\x00\x00\x00T\xe4G\x02\xf0\xbe\x13\x14\x00\x00(\
-U\x1f\xf6\xab\x00\x00\x00@E\xcc\x00\x00\x00@ET\
-\x00\x00\x00\xa0\x0a\x86\x80\x01\x00\xa0:Z\x80\x00\x00\xa0\
-\x0a*\x00\x00\x00P\x9d\x1f\x09\x805\xa0\x00\x00P<\
-k@\x01\x00\xa0:f\x00\x00\x00\xa0\x22*\x00\x00\x00\
-P\x05C\xc0\x00\x00P\x91\x9f\x09\x80\x16 \x00\x00\xa8\
-\x84\x0a\x00\x00\x00T\xe1\xe7\x16 k@\x01\x00\xa0\x12\
-*\x00\x00\x00P\x93\xd7\xd7\xd7\xf8\x04\x00\x00\x14-\x04\
-\xff*\x00\x00\x00P\x11\x09\x00\x00\x00TD\x02\x00\x00\
-\x00\x15\xf9\x8fK\x00\x00\x00\xa0\x12!\xf8W\x01\x00\x00\
-\x80\x8a\xfc\xc7%\x00\x00\x00P\x0f\x15\x00\x00\x00\xa8\xc5\
-\xe5r1\x03\x00\x00\x00\x15Q\x01\x00\x00\x80Z\x18\x02\
-\x06\x00\x80\xbah\x01\x02\x00\x80Z\xa8\x00\x00\x00@]\
-\xac\x01\x05\x00\x80Z\xfc\xd8\x02\x14\x1f\x01\x00\x80\x0a\x98\
-\x01\x00\x00\x80\x8a\xa8\x00\x00\x00@-\x0c\x01\x03\x00@\
-E~$\x00Z\x80\x00\x00\xa0\x1e*\x00\x00\x00P\x8b\
-\xcb\xe5\xf2\xff\xc2\x1f\xfe\xef\xff\xfe\xaf?\x03\x00\x00\x05\
-\xfb\xdf\xff\xfd_\x15\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00HM\xd34\xf1\x09\x00\x00(Z\x08\
-\xfem\x01\x02\x00\x80\x8a\xfcg\xb1X\xc4G\x00\x00\xa0\
-h!\xf8W\x01\x00\x00\x80\x8aH\x00\x00\x00\xa0\x16?\
-f\x00\x0c\x01\x03\x00@=$\x00\x00\x00P\x11-@\
-\x00\x00P\x0bk@\x01\x00\xa0.\xd6\x80\x02\x00@-\
-\xac\x01\x05\x00\x80\xba\x18\x02\x06\x00\x80Z\x98\x01\x00\x00\
-\x80\xba\xa8\x00\x00\x00@ET\x00\x00\x00\xa0\x16?Z\
-\x80l\x01\x02\x00\x80z\xa8\x00\x00\x00@-\xac\x01\x05\
-\x00\x80\xca\xbc\xbe\xbe\xc6'\x00\x00\xa0h!\xf8W\x01\
-\x00\x00\x80\x8aH\x00\x00\x00\xa0\x22\x12\x00\x00\x00\xa8\xc8\
-\x8f\x04\xc0]`\x00\x00P\xbc>\xecW\x01\x00\x00\x80\
-\x8a\xfcH\x00\xdc\x05\x06\x00\x00\xc5\xeb\xc3~\x15\x00\x00\
-\x00\xa8\x88\x04\x00\x00\x00\xaa\xf0s\x06\xc0\x100\x00\x00\
-TB\x02\x00\x00\x00\x15\xd1\x02\x04\x00\x00U\xb0\x06\x14\
-\x00\x00\xaa\xf3#\x01\xb0\x06\x14\x00\x00\x8ag\x0d(\x00\
-\x00T\xc7\x100\x00\x00T\xc1\x0c\x00\x00\x00TG\x05\
-\x00\x00\x00*\xa2\x02\x00\x00\x00U\xf8\xd9\x02d\x0b\x10\
-\x00\x00TB\x05\x00\x00\x00\xaa`\x0d(\x00\x00T\xe7\
-\xe5\xf5\xf5\xf5\xc7\x1f^^\xfa3\x00\x00P\xa4>\xf2\
-W\x01\x00\x00\x80\x8aH\x00\x00\x00\xa0\x221\x01p\x15\
-\x00\x00\x00\xd4 &\x006\x81\x02\x00@\xc1V\xabU\
-\xff\x10\x13\x80\xbf\xfe\xfa\xab\x7f\x00\x00\x00\x0a\xa6\x02\x00\
-\x00\x00\xe5k\xdb\xb6\x7fP\x01\x00\x00\x80\xf2\xbd\x0f\xfd\
-\xaa\x00\x00\x00@\xf9\xde\x13\x80x\x11\xd8\x8f'w\x81\
-\x01\x00@\xa1\xde\xc3\xfeX\x01\x08l\x02\x05\x00\x80\xe2\
-\xfdL\x00t\x01\x01\x00@\x91\xde'\x80\x83\x9f\x09\x80\
-9`\x00\x00(\xd2\xaf\xcd>*\x00\x00\x00P8\x15\
-\x00\x00\x00\xa8\xc8\xc7\x15\x00\x00\x00\xa0H\xbf\xed\xfby\
-\xfd\xd7\xe5r\x89?\x04\x00\x00\x14$F\xfco~\xde\
-\x03\x10\xb8\x0a\x00\x00\x00\xca\xf3k\xcc\xff[\x0b\x90\xab\
-\x00\x00\x00\xa00\xbfN\x00\x07\xbf%\x00\x16\x01\x01\x00\
-@a\xae\xde\xf2\xff\x96\x00X\x04\x04\x00\x00\x85\xf9*\
-\x01P\x01\x00\x00\x80\xc2|\xd5\x02\xa4\x02\x00\x00\x00\x85\
-\xb9\x1e\xf4}\xdb\x05\x14\xd9\x04\x0a\x00\x00\x85\x89\xb1\xfe\
-\xbf~[\x03\x1a\xd8\x04\x0a\x00\x00%\xb9\x0a\xf8\x7fk\
-\x01\x0al\x02\x05\x00\x80b\xfc\x19\xde_'\x00\xe6\x80\
-\x01\x00\xa0\x18W\x13\xc0\xc1u\x02`\x0e\x18\x00\x00\x8a\
-\xa1\x02\x00\x00\x00\x15Q\x01\x00\x00\x80\xba\xbd\xed\x02\xfa\
-\xc9&P\x00\x00(F\x8c\xf2\x7fq\xbd\x064\xb0\x09\
-\x14\x00\x00\xca\xf0g\xb4\x7f\xdd\x02\x14\xd8\x04\x0a\x00\x00\
-\x05\xf80\xb0\xff \x010\x07\x0c\x00\x00\x05\xf8s\x02\
-8\xf8 \x010\x07\x0c\x00\x00\xa5R\x01\x00\x00\x802\
-\xadV\xab\xf8\xf4\x0b\x15\x00\x00\x00\xa8\xc9\xdb.\xa0\xdf\
-\xd8\x04\x0a\x00\x00\x05\x08\x81}\x0c\xf1\x7f\xf1\xc1\x1a\xd0\
-\xc0&P\x00\x00\xc8\xdd\x87\xa1\xfe\x07-@\x81M\xa0\
-\x00\x00\x90\xb5\xcfB\xfa\x8f\x13\x00s\xc0\x00\x00\x90\xb5\
-\x0fw\x80\x06\x1f'\x00\xe6\x80\x01\x00\xa0H*\x00\x00\
-\x00P \x15\x00\x00\x00\xa8\xc8\xa7c\xbdo\xbb\x80\xae\
-\xd9\x04\x0a\x00\x00Y\xfbp\x07h\xf0\xf1\x1a\xd0\xc0&\
-P\x00\x00\xc8\xd7gq\xfe\xc7-@\x81M\xa0\x00\x00\
-P\x9eO\x13\x00s\xc0\x00\x00\x90\xa9\xd5j\x15\x9f\xfe\
-\xf0i\x02`\x0e\x18\x00\x002\xf5E;\xcf\xa7\x09\xc0\
-\x17I\x03\x00\x00\x90\xb2\xcfv\x80\xfe\xf06\x0a\xfc\x01\
-\x8b\x80\x00\x00 S1\xa6\xff\xc8W\x7f\xce\x1c0\x00\
-\x00\xe4(\x06\xf4\x1f\xf9\xb4\x05(\xf8\xaap\x00\x00\x00\
-$\xe9\xebf~\x09\x00\x00\x00\x14\xe5\xf1\x04\xc0\x1c0\
-\x00\x00\x14\xe6\xd3\x9b\x80{\xee\x03\x06\x00\x80\xbc|\x1d\
-\xe1\x7fU\x01\x08\xcc\x01\x03\x00@F\xbem\xe3\xff&\
-\x01\xd0\x05\x04\x00\x00\x19\xf9\xf6\x0d\xfe7\x09\x809`\
-\x00\x00\xc8\xc8\xf7o\xf0\xdf\x96\x81~\xcau`\x00\x00\
-\x90\x91\x10\xc0\xc7P\xfe\x13\xdf$\x00\x811\x00\x00\x00\
-\xc8E\x0c\xe2?\xf7M\x0bP\xb0X,\xe2\x13\x00\x00\
-\x90\xb0[&x\xbfO\x00\xfe\xfa\xeb\xaf\xf8\x04\x00\x00\
-$\xec\x96\xe6\x9d\xef\x13\x00\x8b\x80\x00\x00 \x0b7\xad\
-\xf0\x89\xad@\x9f3\x07\x0c\x00\x00Y\x88\x11\xfc\x97n\
-\xfaI\xe6\x80\x01\x00 }1|\xff\xd2\xf7-@\x81\
-\xdb\x00\x00\x00 q7\xb6\xeeK\x00\x00\x00\xa0\x04C\
-&\x00\xe6\x80\x01\x00\xa0\x0c/\xaf\xaf\xaf\xf1\xf1K/\
-//\xf1\x09\x00\x00H\xcf\x8d\x81\xfdM\x15\x80\xc0\x1c\
-0\x00\x00$\xeb\xf6\xa6\xfd[\x13\x00]@\x00\x00\x90\
-\xac\xdb\xdf\xd7\xdf\x9a\x00\x98\x03\x06\x00\x80d\xdd\xf1\xbe\
-\xfem\x19\xe8\xf7\x5c\x07\x06\x00\x00\xc9\x0a\xe1z\x0c\xdc\
-\xbfsk\x02\x10\x18\x03\x00\x00\x804\xc5\x90\xfd\x06\xb7\
-\xb6\x00\x05\x8b\xc5\x22>\x01\x00\x00\xc9\xb8k^\xf7\x8e\
-\x04\xe0\xaf\xbf\xfe\x8aO\x00\x00@2\xeej\xd5\xb9#\
-\x01\xb0\x08\x08\x00\x00\x12t\xdf\xc2\x9e\xd8\x0at\x03s\
-\xc0\x00\x00\x90\xa0\x18\xaf\xdf\xe6\x8e\x0a@\xf3&\x1e\x00\
-\x00\x80\x0c\xdd\x91\x00\x04n\x03\x00\x00\x80\xa4\xdc\xdb\xa8\
-/\x01\x00\x00\x80\x8c\x8d\x9b\x00\x98\x03\x06\x00\x80\xac\xbd\
-\xbc\xbe\xbe\xc6\xc7\xdb\xbc\xbc\xbc\xc4'\x00\x00`n\xf7\
-\xc6\xf3\xf7U\x00\x02s\xc0\x00\x00\x90\x88\x07Z\xf4\xef\
-N\x00t\x01\x01\x00@\x22\x1ex;\x7fw\x02`\x0e\
-\x18\x00\x00\x12\xf1\xc8\xdb\xf9\xb7\xdb\x00\xee\xe0:0\x00\
-\x00HD\x08\xcec\x98~\xb3\xbb\x87\x80\x83\xc5b\xd1\
-u]<\x00\x00\x003y \x98\xbf\xbb\x05(\x08\x09\
-@|\x02\x00\x00f\xf2\xd8t\xee#\x09\x809`\x00\
-\x00\x98\xddca\xf9#-@]\xd7)\x02\x00\x00\xc0\
-\xbc\x1e\x88\xe4\x83G*\x00\xcd\x9bx\x00\x00\x00\xf2\xf1\
-H\x02\x10\xe8\x02\x02\x00\x80\x19=\x1e\x90\xbf>\xc42\
-P\x00\x00\x98\xd1\xe1p\x88\xa1\xf9\x9d\x1e\x99\x01\xe8Y\
-\x06\x0a\x00\x00sy8\x8c\x7f\xb0\x05(p%0\x00\
-\x00\xcc\xe2\xa9\x86\xfc\xb7:\xc0#N\xa7S\xfc[\x00\
-\x00\x00\x13z\xb8\xff'x\xbc\x05(xyy\x89O\
-\x00\x00\xc0T\x9e\x89\xe1\x1fo\x01\x0a\xec\x02\x02\x00\x80\
-\x89=\x19\x84K\x00\x00\x00 'O\x06\xe1O\xb5\x00\
-\xb9\x12\x18\x00\x00&\xf6L\x00\x1f<U\x01h\x9a\xc6\
-. \x00\x00\x98\xcc\xf3=8O%\x00\x81. \x00\
-\x00\x98\xcc\xf3\xe1\xf7S-@\x81. \x00\x00\x98\xcc\
-\x93\xd1{\xf0l\x05\xa0y\x13\x0f\x00\x00\xc0h\x06i\
-\xbf\x7f6\x01\x08t\x01\x01\x00\xc0\x04\x86y\xf3\xfe\xfa\
-\xb4\xcb\xe5\x12\xff^\x00\x00\xc0h\x9e\xb9\x00\xf8\xdd\xb3\
-3\x00\xbd\xc5b\xd1u]<\x00\x00\x00#\x18$t\
-\x1f\xa0\x05(\xb0\x0c\x14\x00\x00F5X\xe3\xfd[\x1d\
-\xe0Y\xa7\xd3)\xfe\xed\x00\x00\x80\x11\x0c\xd2\xff\x13\x0c\
-\xd3\x02\x14\xbc\xbc\xbc\xc4'\x00\x00`hC\xc5\xed\xc3\
-\xb4\x00\x05v\x01\x01\x00\xc0H\x06\x0c\xb6%\x00\x00\x00\
-\x90\xba\x01\x83\xed\xc1Z\x80\x5c\x09\x0c\x00\x00#\x19*\
-h\x0f\x06\xab\x004Mc\x17\x10\x00\x00\x0cn\xd8^\
-\x9b\xc1\x12\x80`\xb3\xd9\xc4'\x00\x00` \xc3&\x00\
-\x83\xb5\x00\x05\xba\x80\x00\x00`p\x03F\xec\xc1\x90\x15\
-\x80\xe6M<\x00\x00\x00O\x1b|\xd7\xce\x90\x09@\xb0\
-\xddn\xe3\x13\x00\x00\xf0\xb4\xd4\x13\x80\xc1\xff\xf7\x01\x00\
-\x00\x03\x1ar\x06\xa0\xb7X,\xba\xae\x8b\x07\x00\x00\xe0\
-\x09\x83\x87\xeb\x03W\x00\x02E\x00\x00\x00\x18\xc4\x18\xa1\
-\xb5\x04\x00\x00\x00\x125Fh=|\x0bP\xa0\x0b\x08\
-\x00\x00\x9e7F\xac>|\x05 p%0\x00\x00<\
-i\xa4\xce\x9aQ\x12\x00]@\x00\x00\xf0\xa4\x91\x82\xea\
-QZ\x80\x82\x97\x97\x97\xf8\x04\x00\x00\xdco\xa4@}\
-\x94\x0a@\xa0\x0b\x08\x00\x00\x1e6^O\xcdX\x09\xc0\
-f\xb3\x89O\x00\x00\xc0\x9d\xc6K\x00\xc6j\x01\xea\xba\
-n\xb1X\xc4\x03\x00\x00p\x8f\x91\xa2\xf4`\xac\x0a@\
-\xf3&\x1e\x00\x00\x80\x9b\x8d\xbaSg\xac\x04 \xd8n\
-\xb7\xf1\x09\x00\x00\xb8\xd9\xa8\x09\xc0X-@\x81. \
-\x00\x00x\xc0x!z0b\x05\xa0i\x9aQs\x17\
-\x00\x00(\xcf\xd8!\xf4\x88\x09@`\x17\x10\x00\x00\xdc\
-e\xf4w\xe8\xaf#3\x0a\x0c\x00\x007j\xdb6\x86\
-\xd1\xa3\x19\xb7\x02\x10\xecv\xbb\xf8\x04\x00\x00|i\x82\
-\x0e\x9a\x11\x87\x80\xdf\xbd\xbc\xbc\xc4'\x00\x00\xe0s\x13\
-\x04\xe7\xa3W\x00\x02\xa3\xc0\x00\x00\xf0\xadi\xc2\xe6)\
-*\x00\xf6\x81\x02\x00\xc0\xb7.\x97\xcb\x04\x03\xb4ST\
-\x00\xec\x03\x05\x00\x80\xaf\x85\x80y\x9a\xf59S$\x00\
-\x81\x04\x00\x00\x00\xbe0Y\xc0<E\x0bPo\xb1X\
-t]\x17\x0f\x00\x00\xc0\xbf\x9a\xa6\xb9\x5c.\xf10\xb2\
-\x89*\x00\x81}\xa0\x00\x00\xf0\xa1)C\xe5\xe9*\x00\
-\x81}\xa0\x00\x00\xf0\xa7)c\xf2\xe9*\x00\x81I\x00\
-\x00\x00\xb82u\x90\x1c\xb2\x8d\xc9L\xd6\xd8\x04\x00\x00\
-\xb98\x9dN1\x5c\x9e\xc4\xa4\x09@\xd0\xb6m\xfc\x07\
-\x05\x00\x80\xea\xadV\xab\x18(Oe\xd2\x16\xa0`\xb3\
-\xd9\xc4'\x00\x00\xa8\xde\xf4M\xf2\x93\x0e\x01\xf7\xec\x03\
-\x05\x00\x80\xde\xf4\xd1\xf8\xd4\x15\x80\xc0>P\x00\x00\x08\
-\x0e\x87C|\x9a\xd0\x0c\x15\x80\xae\xeb\x16\x8bE<\x00\
-\x00@\xad\xa6\x0f\xc5\x83\x19*\x00M\xd3\xd8\x07\x0a\x00\
-@\xe5f\x0b\x89C\xda1=\xfb@\x01\x00\xa8\xdc\xe1\
-p\x88\xc1\xf1\xb4\xe6I\x00\x82\xa6i\xe2?:\x00\x00\
-Tf\xfa\xed\x9f\xeffh\x01\xea\x19\x05\x06\x00\xa0Z\
-3\xb6\xc4\xcf0\x04\xfc\xce>P\x00\x00\xea4c\x10\
->[\x05 \xd8n\xb7\xf1\x09\x00\x00\xaa1o/\xcc\
-\x9c\x15\x00\xfb@\x01\x00\xa8\xd0\x8c\x11x0g\x05\xc0\
->P\x00\x00j3\x7f\x00\x1c\xf2\x8f\x19\xd9\x07\x0a\x00\
-@U\xe6\xda\xfe\xf9n\xe6\x04 \xb0\x0f\x14\x00\x80J\
-\xcc\xb8\xfd\xf3\xdd\x9c-@=\xfb@\x01\x00\xa8D\x0a\
-\x0d\xf0s\x0e\x01\xbf\xb3\x0f\x14\x00\x80\x1a\xa4\x10{\xcf\
-_\x01\x08\x8c\x02\x03\x00P\xbc\xcdf\x13\x9ff\x95D\
-\x05\xc0>P\x00\x00\x8a\x97B\xe0\x1d$Q\x01\xb0\x0f\
-\x14\x00\x80\xb2\xa5\x13\xee&\x91\x00\x04F\x81\x01\x00(\
-XB\xef\xbb_\x93a\x1f(\x00\x00E\x0a\xd1\x7f\x0c\
-y\x13\x90J\x05 P\x04\x00\x00\xa0HI\xb5\xbb'\
-1\x04\xfc\xce>P\x00\x00\xca\x93T\xc8\x9dP\x05 \
-h\xdb6>\x01\x00@\x11R\xdbv\x93V\x05\xc0>\
-P\x00\x00\x0a\x93T\xbc\x1d\xa4U\x01\xb0\x0f\x14\x00\x80\
-\x92$\x18\xdc\xa6U\x01\x08\x14\x01\x00\x00(\xc6\xe5r\
-Im\xd7eZ\x15\x80@\x11\x00\x00\x802\x84\xb06\
-\xc1M\xf7\xc9U\x00\x02E\x00\x00\x00\x0a\x90\xe0\xeb\xff\
- \xb9\x0a@\xa0\x08\x00\x00@\xee\xd2|\xfd\x1f\xa4X\
-\x01\x08\x14\x01\x00\x00\xc8Z\x9aav\x90b\x05 P\
-\x04\x00\x00 _)\x87\xb2\x89V\x00\x02E\x00\x00\x00\
-2\x95l\x8c\x1d$Z\x01\x08\x14\x01\x00\x00\xc8\xd1f\
-\xb3\x89OIJ\xb7\x02\x10(\x02\x00\x00\x90\x9d\x94\x03\
-\xec \xdd\x0a@\xa0\x08\x00\x00@^\x12\x7f\xfd\x1f$\
-]\x01\x08\x14\x01\x00\x00\xc8H\xe2\xd1u\x90t\x05 \
-h\x9a\xe6p8\xc4\x03\x00\x00$l\xb7\xdb\xc5\xa7\x84\
-\xa5^\x01\xe8-\x16\x8b\xae\xeb\xe2\x01\x00\x00\x92\x94E\
-h\x9dz\x05\xa0\x97E.\x05\x00@\xcdr\x09Y\xf3\
-\xa8\x00\x04\x8a\x00\x00\x00\xa4,\x97\xb8:\x8f\x0a@\xa0\
-\x08\x00\x00@\xb22\x1a[\xcd\xa6\x02\x10(\x02\x00\x00\
-\x90\xa6\x8c\x82\xeal*\x00\x81\x22\x00\x00\x00\x09\xcak\
-keN\x15\x80@\x11\x00\x00\x80\xa44Ms\xb9\x5c\
-\xe2!\x079U\x00\x02E\x00\x00\x00\x92\x92]\x80\x9a\
-Y\x05 P\x04\x00\x00 \x11\xd9\xbd\xfe\x0f2\xab\x00\
-\x04\x8a\x00\x00\x00$\x22\xc7\xd04\xbf\x0a@\xa0\x08\x00\
-\x00\xc0\xecr|\xfd\x1f\xe4W\x01\x08\x14\x01\x00\x00\x98\
-]\xa6Ai\x96\x15\x80@\x11\x00\x00\x80\x19\xb5m{\
-:\x9d\xe2!+YV\x00\x02E\x00\x00\x00f\xb4\xd9\
-l\xe2Snr\xad\x00\x04\x8a\x00\x00\x00\xcc\x22\xdf\xd7\
-\xffA\xae\x15\x80@\x11\x00\x00\x80Y\xe4\xfb\xfa?\xc8\
-\xb8\x02\x10(\x02\x00\x000\xb1\xd5ju8\x1c\xe2!\
-C\x19W\x00\x02E\x00\x00\x00&\x16\x12\x80\xf8\x94\xa9\
-\xd7\xcc\xb5m\x1b\xffI\x00\x00`d!\xfa\x8fah\
-\xb6\xf2\xae\x00\x04Y\xd7_\x00\x00\xc8K\xf6\xaf\xffs\
-o\x01\x0a\x9a\xa6)\xe0_\x03\x00\x00\xe9\x0ba\xa7\x04\
- \x09&\x01\x00\x00\x98@\x19\xef\x9dKH\x00\x14\x01\
-\x00\x00\x18\xdb\xdb\xdb\xff\x12b\xce\xbc\xd7\x80\xbe\xeb\xba\
-n\xb1X\xc4\x03\x00\x00\x0c\xedt:\x95\xb1~\xa6\x84\
-\x0a@\xa0\x08\x00\x00\xc0xB\xa8Y\xcc\xf2\xc9B*\
-\x00\x81\x22\x00\x00\x00#)\xe6\xf5\x7fPH\x05 P\
-\x04\x00\x00`\x0c%\xbd\xfe\x0f\xca\xa9\x00\x04\x8a\x00\x00\
-\x00\x0c\xeer\xb94M\x13\x0f\xf9+\xa7\x02\x10\x84\x7f\
-1V\x82\x02\x000\xa0\x10^\x96\x14\xfd\x07EU\x00\
-z\x8b\xc5\xa2\xeb\xbax\x00\x00\x80G\xb5m{:\x9d\
-\xe2\xa1\x14EU\x00z\x87\xc3!>\x01\x00\xc0\x13\xfe\
-\xfe\xfb\xef\xf8T\x90\x02\x13\x80\x90\xa8\x99\x06\x06\x00\xe0\
-I\x85\xcd\xfe\xbe+\xb0\x05\xa8\xa7\x11\x08\x00\x80g\x94\
-\x1a'\x17X\x01\xe8\x99\x06\x06\x00\xe0a%w\x95\x87\
-\xcc\xa6T\x1a\x81\x00\x00x@\x08#c@Y\xa2b\
-[\x80\x02\xd7\x02\x00\x00\xf0\x80\xc2\x16\xff_)\xb6\x05\
-(p-\x00\x00\x00\xf7*o\xf1\xff\x95\x92+\x00=\
-\xd3\xc0\x00\x00\xdc(\x84\xfe\x97\xcb%\x1e\x0aUr\x05\
-\xa0\xe7Z\x00\x00\x00nTC\xffH\xf9\x09\x80k\x01\
-\x00\x00\xb8E\x08\x1ak\x88\x1b\xcbo\x01\x0a\xba\xae\x0b\
-i\x80F \x00\x00\xbePC`\x1c\x94_\x01\x08L\
-\x03\x03\x00\xf0\xb5z\xfa\xc6\xab\xa8\x00\xf4\x96\xcb\xe5\xf9\
-|\x8e\x07\x00\x00\xf8\xd7j\xb5\x92\x00\x14\xc8\xb5\x00\x00\
-\x00|\xa8\xec\xc5\xffW\xaah\x01\xea\x85\x7f\xa9\x9b\xcd\
-&\x1e\x00\x00\xe0M\x08\x11\xeb\x89\xfe\x83\x8a*\x00=\
-\xd7\x02\x00\x00\xf0\xae\x86\xc5\xffW*\xaa\x00\xf4L\x03\
-\x03\x00\xf0\xae\xc6\xe0\xf0\xb5>5\xacw\x05\x00\xe0[\
-!,\x8c\x01bM\xaak\x01\x0aL\x03\x03\x00\x10T\
-\x18\x09\x07\xd5\xb5\x00\x05M\xd3\xd4\xb3\xe6\x09\x00\x80\x0f\
-U\x1b\x10\xd6X\x01\xe8\xb9\x16\x00\x00\xa0Zm\xdb\x9e\
-N\xa7x\xa8L\xbd\x09\x80F \x00\x80j\x85\xe8?\
-\xe4\x00\xf1P\x99\x1a[\x80z\xae\x05\x00\x00\xa8S\x08\
-\x02\xab\x8d\xfe\x83z+\x00=\xd7\x02\x00\x00T\xa5\xc2\
-\xc5\xffW\xea\xad\x00\xf4\x5c\x0b\x00\x00P\x15\xe1_\xed\
-\x09\xc0\xeaM<\x00\x00P4\xb1_P{\x0bP`\
-\x1a\x18\x00\xa0\x12\x97\xcb\xa5i\x9ax\xa8U\xed\x15\x80\
-\xc0\xb5\x00\x00\x005\xd8\xedv\xa2\xff@\x05 2\x0d\
-\x0c\x00P\xb0\x9a\x17\xff_Q\x01\x88\x5c\x0a\x06\x00P\
-\xb0\xbf\xff\xfe;>UO\x02\x105Mc\x22\x04\x00\
-\xa0H\x95/\xfe\xbf\xa2\x05\xe87\x1a\x81\x00\x00\x0ac\
-\xf1\xff\x15\x15\x80\xdf\xd8\x0b\x0b\x00P\x18\x01\xde\x15\x09\
-\xc0o\xac\x86\x05\x00(\x89\xe8\xeeOZ\x80\xae\xb9\x16\
-\x00\x00\xa0\x18\x16\xff\xffI\x05\xe0\x9ak\x01\x00\x00\xca\
-\x10\x82:\xd1\xff\x9f$\x00\x1fX\xadV\x9b\xcd&\x1e\
-\x00\x00\xc8P\x08\xe74\xff|H\x0b\xd0\xa7\x96\xcb\xa5\
-\xcb\x01\x00\x00r\xe4\xda\xaf/H\x00>\xd5u]\xf8\
-\xa5c+(\x00@^\xec\xfd\xfc\x9a\x16\xa0O\x19\x06\
-\x00\x00\xc8\x91\x10\xeek\x12\x80\xaf\xb4mkq,\x00\
-@FB\xf0\xe6\xd2\xdfo\xbc\xf2\x1d\x03\xc1\x00\x00Y\
-\x08a[\x0c\xe0\xf8\x9c\x19\x80\x9b\x18\x08\x06\x00H\x9c\
-\xc1\xdf\x1bI\x00nb \x18\x00 eM\xd3\x9c\xcf\
-g[\xffoa\x06\xe0&\x06\x82\x01\x00R\xe6\xce\xaf\
-\xdbI\x00ne \x18\x00 M\x06\x7f\xef\xa2\x05\xe8\
->\xeb\xf5\xfax<\xc6\x03\x00\x00s\xdbl6\xde\xd2\
-\xdeE\x02p7\x03\xc1\x00\x00\x890\xf8\xfb\x00\x09\xc0\
-\xdd\x0c\x04\x03\x00$\xe2r\xb9h\xfd\xbf\x97\x19\x80\xbb\
-\x19\x08\x06\x00H\xc1\xe9t\x12\xfd?@\x02\xf0\x08\x03\
-\xc1\x00\x00\xf32\xf8\xfb0-@\x8f3\x10\x0c\x000\
-\x8b\xd5j\xa5#\xe3a\x12\x80\xa7,\x16\x0b\xc3\x00\x00\
-\x00S2\xf8\xfb$\x09\xc0SB\xf4\x1fr\x80x\x00\
-\x00`|\x06\x7f\x9fd\x06\xe0)\xe1\x17\x9f\x04\x14\x00\
-`2n\xfc}\x9e\x04\xe0Y\x06\x82\x01\x00\xa6\x11\x82\
-\xae\xd5j\x15\x0f<J\x0b\xd00\x0c\x04\x03\x00\x8c\xca\
-\xe0\xefP$\x00\x831\x10\x0c\x000\x92\xa6i.\x97\
-K<\xf0\x1c-@\x839\x9f\xcf\xf1\x09\x00\x80A\x09\
-\xb4\x06$\x01\x18LHL\x95\xa5\x00\x00\x06g\xf0w\
-X\x12\x80!\xadV\xab\xcdf\x13\x0f\x00\x00<-\x04\
-W\x06\x7f\x87e\x06`x\x06\x82\x01\x00\x06a\xf0w\
-\x0c\x12\x80Q\x18\x08\x06\x00x\x92\xc1\xdf\x91h\x01\x1a\
-\x859\x15\x00\x80'\x09\xa8F\x22\x01\x18\x85\x81`\x00\
-\x80g\x18\xfc\x1d\x8f\x04`,\x06\x82\x01\x00\x1ec\xf0\
-wTf\x00\xc6\xb5\x5c.U\xaf\x00\x00ng\xf0w\
-l\x12\x80qu]\xd7\xb6\xad\x81`\x00\x80[\x18\xfc\
-\x9d\x80\x16\xa0q\x85_\xc4*\x00\x00\x007\xf2\xee\x7f\
-\x02\x12\x80\xd1\x19\x08\x06\x00\xb8E\x08\x99\xda\xb6\x8d\x07\
-F#\x01\x98\xc2j\xb5\xda\xedv\xf1\x00\x00\xc0\x1fB\
-\xb0d\xf0w\x1a\x12\x80\x89l\xde\xc4\x03\x00\x00\xbf\x10\
-)M\xc9\x10\xf0\xa4,\x05\x02\x00\xb8\xd2\xb6\xed\xe9t\
-\x8a\x07\xc6\xa7\x020\xa9\xf0\x8b[g\x1b\x00\xc0;\xd1\
-\xff\xf4T\x00\xa6f1(\x00@\xaf\xdf\x97\xe8\xc6\xdf\
-\x89I\x00f\x10\xa2\xff\xc5b\x11\x0f\x00\x00\xb5\xba\x5c\
-.\xa2\xff\xe9i\x01\x9aA\xf8\x85\xae\xd4\x05\x00T.\
-\x84C\xa2\xffYH\x00\xe6\xd1\xb6\xad\xcb\x01\x00\x80j\
-\xedv;\x83\x91s\x91\x00\xcc\xc6\xe5\x00\x00@\x9dB\
-\x08d\xe9\xe7\x8c$\x00s\xb2\xf2\x16\x00\xa8\x8d\xf8g\
-v\x86\x80\xe7\xb7^\xaf\x8f\xc7c<\x00\x00\x94k\xb5\
-Z\xe9\x82\x9e\x9d\x04 \x09.\x08\x03\x00\x8ag\xe5\x7f\
-\x22$\x00Ip9\x00\x00P\xb6\xa6i.\x97K<\
-0+3\x00I\x08\xbf%\xdc\x82\x01\x00\x14L\xb3C\
-:$\x00\xa9\x08\xd1\xbf\x968\x00\xa0HV\xfe'E\
-\x02\x90\x10\x97\x03\x00\x00\xe5\x09\xe1\x8d\x95\xffI\x91\x00\
-\xa4\xc5\xe5\x00\x00@IB`\x13\xc2\x9bx \x0d\x12\
-\x80\xe4X\x8e\x0b\x00\x94AT\x93&[\x80\x12\xe5r\
-\x00\x00 kV\xfe'K\x02\x90.\x97\x03\x00\x00\x99\
-\xb2\xf2?e\x12\x80\xa4-\x16\x0b\x97\x03\x00\x00y\xb1\
-\xf2?qf\x00\x92\xe6r\x00\x00 /!t\xd1\xc2\
-\x908\x09@\xd2\x5c\x0e\x00\x00\xe4%\x84.^_&\
-N\x02\x90:-t\x00@.\xac\xfc\xcf\x82\x04 \x03\
-\xe17\x92\xcb\x01\x00\x80\xc4Y\xf9\x9f\x0b\x09@\x1e\xac\
-\xd1\x05\x00R&V\xc9\x88\x04 \x1b!\xab\xf6\xfb\x0a\
-\x00HP\x08Qt+d\xc4\x1a\xd0\xcc\xb8\x1c\x00\x00\
-H\x8ay\xc5\xecH\x00\xf2\xe3r\x00\x00 \x11\xa2\xff\
-\x1ci\x01\xca\x8f\xcb\x01\x00\x80\x14\xd8W\x9e)\x15\x80\
-,u]\xb7X,\xe2\x01\x00`\x0e\xa7\xd3\xc9\xd2\xcf\
-\x1c\xa9\x00d)$\xdc\xcam\x00\xc0\x8cD\xff\xf9\x92\
-\x00\xe4\xca\xe5\x00\x00\xc0\x5cB\x10\x22\xfa\xcf\x97\x04 \
-cVn\x01\x00\xd3\xb3\x9a<w\x12\x80\xbc\xc9\x01\x00\
-\x80)\x89\xfe\x0b`\x08\xb8\x04\xe7\xf3y\xb9\x5c\xc6\x03\
-\x00\xc08\xf4\xfd\x97A\x05\xa0\x04\xe1\xb7b\xf8\x0di\
-7(\x000\x92\x10f\x5c.\x17\xd1\x7f\x19$\x00\x85\
-\x08\xbf!\xcf\xe7\xb3\xdf\x96\x00\xc0\xe0B\xf4\xef\x1a\xa2\
-\x92h\x01*\xcdr\xb9\x0c\xbfE\xe3\x01\x00\xe09}\
-\xa3A<P\x04\x15\x80\xd2\x84\xdf\xa2Fs\x00\x80A\
-\x84\xa0B\xf4_\x1e\x09@\x81\x8c\xe7\x03\x00\xcf\xb3l\
-\xb0TZ\x80\x8a\xb5\xdf\xef\xb7\xdbm<\x00\x00\xdc\xc3\
-\xfb\xc4\x82I\x00Jv<\x1e\xd7\xebu<\x00\x00\xdc\
-\xc6\xba\xcf\xb2i\x01*\xd9j\xb5\xb2\x1e\x14\x00\xb8]\
-\x08\x1bD\xff\xc5S\x01(_\xd7u\xe1\xb7q\xf8\x1a\
-\xcf\x00\x00\x1f\xb1\xee\xb3\x12*\x00\xe5\x0b\xbf\x8d\xdd\xdc\
-\x01\x00|-\x84\x0a!`\x10\xfd\xd7@\x02P\x8b\xd3\
-\xe9\xb4Z\xad\xe2\x01\x00\xe0\x17}\xdbp<P:\x09\
-@E\x0e\x87\x83q~\x00\xe0J\x08\x0fB\x90\x10\x0f\
-T\xc0\x0c@u\xac\x07\x05\x00\xdeY\xf7Y!\x09@\
-\x8d\xac\x07\x05\x00\x82\xc3\xe1\xa0C\xb8B\x12\x80J\x9d\
-\xcf\xe7\xe5r\x19\x0f\x00@e\x9a\xa6\x09\xd1\xbf\x1d!\
-u\x92\x00\xd4\xcbzP\x00\xa8\x93u\x9f\x953\x04\x5c\
-/\xebA\x01\xa0B\xe1\xa3_\xf4_9\x09@\xed\xac\
-\x07\x05\x80z\xf4\xeb>E\xff\x95\x93\x00`=(\x00\
-T\xc1\xbaOzf\x00\x88\xac\x07\x05\x80\x82Y\xf7\xc9\
-;\x09\x00?\xc9\x01\x00\xa0H\xd6}\xf2+\x09\x00\xbf\
-\xb1\x1e\x14\x00\x0as:\x9d\xec\xfc\xe0W\x12\x00\xaeY\
-\x0f\x0a\x00e\xb0\xee\x93\x0f\x19\x02\xe6Z\xff\xcd\xc2\xab\
-\x02\x00\xc8\x9au\x9f|F\x05\x80O-\x97\xcb\xf0\x8d\
-#\x1e\x00\x80|\x84\xe8\xfft:\xc5\x03\xfcN\x05\x80\
-O\x85o\x1c\xd6\x05\x00@v\xc2\xc7\xb7\xe8\x9f/\xa8\
-\x00\xf0\x0d\xab\x81\x00 #\xd6}\xf2-\x09\x00\xdf;\
-\x1e\x8f\xeb\xf5:\x1e\x00\x80TY\xf7\xc9-$\x00\xdc\
-\xe4|>\x87\x1c\xc0j \x00H\x93\x85?\xdc\xce\x0c\
-\x007i\xdb\xf6r\xb9x\xa9\x00\x00\x09\xb2\xf0\x87\xbb\
-H\x00\xb8\xc3\xe1p\xd0V\x08\x00I\xe9G~E\xff\
-\xdcN\x0b\x10w3\x12\x00\x00\x89\xd0\xf4\xcf\x03$\x00\
-<\xc2m\xc1\x000/M\xff<L\x0b\x10\x8f\x08\xdf\
-n\x8c\x04\x00\xc0\x5c\xc2Gp\xf8 \x16\xfd\xf3\x18\x09\
-\x00\x8f3\x12\x00\x00\xd3\x0b\x1f\xbe\xe1#8\x1e\xe0~\
-Z\x80x\x96\x91\x00\x00\x98\x8c\xa6\x7f\x9e'\x01`\x00\
-F\x02\x00`l\x9a\xfe\x19\x8a\x16 \x06`$\x00\x00\
-F\xa5\xe9\x9f\x01I\x00\x18\xcc\xe1p\xd8\xedv\xf1\x00\
-\x00\x0c$|\xbcj\xfag@Z\x80\x18\x98\x91\x00\x00\
-\x18\xd0\xe9tj\xdb6\x1e`\x08\x12\x00\x86\xd7u]\
-\xc8\x01\xce\xe7s<\x03\x00\xf7\xd3\xf4\xcfH\xb4\x001\
-\xbc\xf0\xad\xeat:\x19\x09\x00\x80\x87i\xfag<\x12\
-\x00\xc6b$\x00\x00\x1e\xa3\xe9\x9fQi\x01b\x5c\xe7\
-\xf3y\xb9\x5c\xc6\x03\x00\xf0\xa5\xa6iB\xe8\xaf\xe9\x9f\
-Q\xa9\x000\xae\xf0-\xecr\xb9\xf8F\x06\x00\xdf\x0a\
-\x1f\x97\xe7\xf3\xd9\x87&c\x93\x000\xba~$`\xb3\
-\xd9\xc43\x00\xf0\x87\xd5j\x15>.5\xfd3\x01\x09\
-\x00\x13\xd9\xbd\x89\x07\x00\xe0\x17\x9a\xfe\x99\x92\x19\x00&\
-u>\x9f\xd7\xebu\xd7u\xf1\x0c\x00u\xd3\xf4\xcf\xf4\
-T\x00\x98\x94\xeeF\x00x\xe7c\x91YH\x00\x98\x9a\
-\x91\x00\x00\x08\xc2G\xa1\xa6\x7ff\xa1\x05\x88\xd9\xec\xf7\
-\xfb\xedv\x1b\x0f\x00P\x93\xddn\xe7]\x18s\x91\x00\
-0'#\x01\x00\xd4F\xd3?\xb3\x93\x000\xbf\xe5r\
-\x192\x81x\x00\x80r\x85\xb8?D\xff\xda~\x98\x97\
-\x19\x00\xe6g$\x00\x80\x1ah\xfa'\x11*\x00\xa4\xe2\
-x<\xae\xd7\xebx\x00\x80\xb2\x1c\x0e\x87\xd5j\x15\x0f\
-0+\x15\x00R\x11\xbe-^.\x17\xdf\x1c\x01(\x8c\
-\x0f8R\xa3\x02@r\x8e\xc7\xe3v\xbb5\x19\x0c@\
-\xee\x9a\xa6\xd9\xedvB\x7fR#\x01 Q!\x07\xd8\
-\xef\xf7\xf1\x00\x00\xb9\x09q\xff\xe1p\x88\x07H\x89\x04\
-\x80t\x9d\xcf\xe7\xff\xfe\xf7\xbf\x16\x04\x01\x90\x97\xa6i\
-\xc2\x87\x97a_\x92e\x06\x80t\xb5m{:\x9dv\
-\xbb]<\x03@\xf2\x0e\x87\xc3\xe5r\x11\xfd\x932\x09\
-\x00\xa9\xdbl6f\xa7\x00H\x9fa_r\xa1\x05\x88\
-l\x18\x0e\x06 M\x86}\xc9\x8b\x0a\x00\xd9\xe8\xdf\xac\
-\xb82\x0c\x80\xa4\xa8T\x93\x1d\x15\x00\xf2c8\x18\x80\
-\x14\xb4m{8\x1c\xb4\xfb\x93\x1d\x09\x00\xb9rs0\
-\x003r\xb3/\xf9\xd2\x02D\xae\xc2\xb7\xdd\x90\xbe\xfa\
-\xe6\x0b\xc0\xc4\xfa\x96T\x1f@\xe4K\x02@\xde\x0eo\
-\x94_\x01\x98@\xf8\xb8\xf1\xb9C\x01$\x00d\xaf\x7f\
-\x13c8\x18\x80Q\x19\xf6\xa5\x18f\x00(G\xd7u\
-\xdb\xed\xf6x<\xc63\x00\x0c\xc1\xb0/\x85\x91\x00P\
-\x1a\xc3\xc1\x00\x0c%\x04\xfd\x16\xfcS\x1e-@\x94&\
-|\x9b6\x1c\x0c\xc0\xf3\xc2G\xc9\xf9|\xf6\x81By\
-T\x00(\x96\x9b\x83\x01xL?\xec\xdb\xb6m<C\
-YT\x00(\xd6\xeam8x\xb7\xdb\xc53\x00\xdc \
-|p\x84\x8f\x0f\xd1?\x05\x93\x00P8K\x1b\x00\xb8\
-Q\xff\xe6\xc8Z9\x8a\xa7\x05\x88Z\x18\x0e\x06\xe03\
-\x86}\xa9\x8a\x04\x80\xba\x84\x1c\xc0\x9eP\x00~\x15\xe2\
-\xfe\xc3\xe1\x10\x0fP\x01-@\xd4%|\x8b?\x9dN\
-:;\x01\x08\x9a\xa6\x09\x1f\x0a\xa2\x7fj#\x01\xa0:\
-!\xfa\x0f\xdf\xee\x0d\x07\x03T\xce\xb0/\xd5\x92\x00P\
-)\xc3\xc1\x00\xd52\xecK\xe5\xcc\x00P\xbb\xf3\xf9\xbc\
-\xdf\xef\x0d\x06\x00\xd4 \x84\xfe\xbb\xdd\xaei\x9ax\x86\
-*I\x00\xe0\x07i\x00@\xd9\x84\xfe\xf0N\x02\x00?\
-\x85\x04\xa0\x17\xcf\x00\xe4O\xe8\x0fW$\x00p-&\
-\x01\xd2\x00\x80\xcc\xb5m{8\x1c\x84\xfepE\x02\x00\
-\x1f\x8bI\x804\x00 C!\xe8\xdf\xb9\xd8\x0b>!\
-\x01\x80\xaf\x84\x04`\xbf\xdf\x9f\xcf\xe7x\x06 mB\
-\x7f\xf8\x96\x04\x00\xbe'\x0d\x00H\x9f\xd0\x1fn$\x01\
-\x80[\x854`\xbb\xddv]\x17\xcf\x00\xa4A\xe8\x0f\
-w\x91\x00\xc0}\xa4\x01\x00\xe9\x10\xfa\xc3\x03$\x00\xf0\
-\x08i\x00\xc0\xbc\x84\xfe\xf00\x09\x00<.\xa4\x01\xeb\
-\xf5:\x1e\x00\x98\x84\xd0\x1f\x9e$\x01\x80gI\x03\x00\
-\xa6!\xf4\x87A\xfc'\xfe\x11xT\xf8(\x0a\x89t\
-\xf8L\x8ag\x00\x86\x16B\xff\xc3\xe1p\xb9\x5cD\xff\
-\xf0<\x15\x00\x18\xd2~\xbf\xdfn\xb7\xf1\x00\xc0\x10B\
-\xe8/\xee\x87\x01\xa9\x00\xc0\x906\x9bMH\xaa\xc3\xd7\
-x\x06\xe0\x09!\xee\xf7\xd6\x1f\x06\xa7\x02\x00c\xd9n\
-\xb7\xfb\xfd>\x1e\x00\xb8G\x08\xfaw\xbb]\xd34\xf1\
-\x0c\x0cG\x02\x00\xe3Z\xaf\xd7\xc7\xe31\x1e\x00\xf8\x8e\
-\xd0\x1f\xc6&\x01\x80)H\x03\x00\xbe%\xf4\x87i\x98\
-\x01\x80)X^\x01\xf0\x85\xf0\xed1|\x93\x0c\xdf*\
-E\xff0\x01\x15\x00\x98T\xd7u\xdb\xedV5\x00\xa0\
-\xe7\xad?LO\x02\x00\xf3\xd0\x14\x04\xd4,D\xfcm\
-\xdb\x0a\xfda\x16\x12\x00\x98S\xc8\x01z\xf1\x0cP\xba\
-\x10\xf1\x87\xb8_K$\xccH\x02\x00\xf3\x8bI\x804\
-\x00(\x9an\x1fH\x84\x04\x00\x12\xe2\xea\x00\xa0<!\
-\xe2\x0f\xa1\x7f\xf8\xfe&\xf4\x87DH\x00 9\xb1\x1c\
-\xa0 \x00dN\xb7\x0f\xa4I\x02\x00\x89\x8aI\x804\
-\x00\xc8\x90n\x1fH\x99\x04\x00R\xb7\xdf\xef\xb7\xdbm\
-<\x00$,D\xfc\xe1\xfbU\x88\xfe\x85\xfe\x902\x09\
-\x00\xe4!\x96\x03\x14\x04\x80$\xe9\xf6\x81\x8cH\x00 \
-'1\x09\x90\x06\x00\xc9\xd0\xed\x03\xd9\x91\x00@\x96B\
-\x0e\xb0^\xaf\xe3\x01`r\xfd+\xff\xb6m\x85\xfe\x90\
-\x1d\x09\x00d\xac\xaf\x06\x04\xf1\x0c0\xbe\x10\xf4o6\
-\x1b\xdd>\x90/\x09\x00d\xef|>\xef\xf7{i\x00\
-06\xdd>P\x06\x09\x00\x94#\xe4\x00\xdb\xed\xb6\xeb\
-\xbax\x06\x18\x82\x01_(\x8c\x04\x00J\xf3\xd6\x13\xf4\
-C<\x03<*\x04\xfd\xbdx\x06\x8a \x01\x802u\
-]\xb7\xddn\xa5\x01\xc0cB\xd0\xaf\xdb\x07J%\x01\
-\x80\xc2\x85\x1c`\xbf\xdf\x9f\xcf\xe7x\x06\xf8\x9cn\x1f\
-\xa8\x81\x04\x00\xaa\xf0\xd6\x13\xf4C<\x03\xfc.\x04\xfd\
-\x9b\xcd\xa6m\xdbx\x06\xca%\x01\x80\xba\xc4<@&\
-\x00\xbci\x9af\xbb\xdd\x86\xe8_\xb7\x0f\xd4C\x02\x00\
-\x95\x8ay\x80L\x00\xaa\xd4\xef\xf2w\x8d\x17\xd4I\x02\
-\x00\xb5\x8by\x80L\x00J\x17b\xfd\x10\xf1\xaf\xde\xc4\
-\x1f\x02\xaa$\x01\x00\xa2\x98\x07\xc8\x04\xa0,!\xee\xef\
-\x83~\xfd\xfd@O\x02\x00\x5c\xebs\x00\xc9\x00dM\
-s?\xf0\x19\x09\x00\xf0\x95>\x0d\x08\xe2\x19H\x9b\xe6\
-~\xe0[\x12\x00\xe0&1\x0f\x90\x09@\x92\xde\x9b|\
-\xc4\xfd\xc0\xb7$\x00\xc0}b\x1e \x13\x80\xb9\x85X\
-\xff\xfd}\x7f\xfc!\x80\x1bH\x00\x80\x07\xf5i@\xd7\
-u\xae\x19\x86)\x85\xb8\x7f\xb5Zm\xb7[/\xfb\x81\
-\xc7H\x00\x80\x01\xf4\xc9@\x10\xcf\xc0\xd0\xda\x7f7x\
-\x8a\xfb\x81'I\x00\x80!\xc5<@&\x00\x03\xe9\x83\
-~\xcd\xfd\xc0\x80$\x00\xc0(b\x1e \x13\x80\xfbi\
-\xee\x07F%\x01\x00\xc6\x15\xf3\x00\x99\x00|Gs?\
-0\x0d\x09\x000\x9d\x98\x0aH\x06\xe0_!\xd6_,\
-\x16}\x9f\x8f\xb8\x1f\x98\x86\x04\x00\x98A\xbf;(d\
-\x02\x96\x08Q\xa1\xfeM\x7f\xfbF\xd0\x0fLO\x02\x00\
-\xcc\xaf\xaf\x09\xbc\xd5\x06\x14\x07(P\x88\xf2\xfbp\xdf\
-k~ \x05\x12\x00 9!\x0d8\x9f\xcf]\xd7\xc9\
-\x07\xc8T\x88\xf2\x17\x8b\xc5_\x7f\xfd\x15\x22\xfe\xf0 \
-\xe8\x07\x92\x22\x01\x00\x92\xa6Y\x88\x5c\x84(_c\x0f\
-\x90\x05\x09\x00\x90\x93\xbe&\x10\xbe\xf6\x0f0\xa3\x10\xe5\
-\xf7\xe1\xbe\xc6\x1e /\x12\x00 c!\x0d\xd0,\xc4\
-dB\x94\xaf\xb1\x07(\x80\x04\x00(\x84f!\xc6\x10\
-\xa2|\x8d=@a$\x00@\x99\xfa\x9a@\xf8\xda?\
-\xc0\x8dB\x94\xdf\x87\xfb\x1a{\x80RI\x00\x80*\x84\
-4@\xb3\x10\x1f\x0aQ\xbe\xc6\x1e\xa0*\x12\x00\xa0F\
-}\x9b\xd0{\xb3P\xff\xdc\xff)\x0a\xf6\x1e\xeb\xbf\x7f\
-\x15\xee\x03\x15\x92\x00\x00D\xef\xf9@_%\x90\x15d\
-M\xac\x0f\xf0\x19\x09\x00\xc07~\xcd\x07d\x05\x09\x12\
-\xeb\x03\xdcE\x02\x00\xf0\x88_\xf3\x81\xfe!\xfe\x09\xc6\
-$\xd6\x07x\x9e\x04\x00`0\xbf\xe6\x03\xb2\x82g\x5c\
-\x05\xfa\xe1G\xc4\xfa\x00C\x91\x00\x00\x8c\xeb\xaaJ`\
-\x0d\xd1\x15/\xf5\x01&&\x01\x00\x98M\xc8\x0a\xc2\xd7\
-\xcb\xe5\xf2\xfe\xfc\xfep\xcb\x0f&\xa2\x8f\xd7C\xe0\xfe\
-~|\x8f\xe0\xfb\x1f\xec\x8f\xfd\xd7_\x7fZ\xff\x00\xc0\
-\xc4$\x00\x00\x19\xbb=[\xf8\xf0\x07\x83?\xe3\xf2\xf7\
-\xd0\x5c\xf8\x0eP\xa0\xff\xf9\x9f\xff\x0f\x18T\x8f\xec\x03\
-\x9fX\x82\x00\x00\x00\x00IEND\xaeB`\x82\
-"
+# Local project
+from misc.Functions import ProjectException
+
+# Python standard libraries
+from os import path
 
-qt_resource_name = b"\
-\x00\x05\
-\x00s\x8a#\
-\x00m\
-\x00a\x00s\x00k\x00s\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x0a\
-\x03\x88\x10S\
-\x00a\
-\x00n\x00i\x00m\x00a\x00t\x00i\x00o\x00n\x00s\
-\x00\x0c\
-\x0b\x0f-\x90\
-\x00l\
-\x00o\x00a\x00d\x00i\x00n\x00g\x00.\x00w\x00e\x00b\x00p\
-\x00\x0a\
-\x0fnN\xdf\
-\x00p\
-\x00y\x00t\x00h\x00o\x00n\x00.\x00i\x00c\x00o\
-\x00\x08\
-\x0b\x07Z'\
-\x00e\
-\x00d\x00i\x00t\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x00\xc1\x0b\xe7\
-\x00g\
-\x00e\x00n\x00e\x00r\x00i\x00c\x00_\x00u\x00s\x00e\x00r\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x08\x94`G\
-\x00s\
-\x00e\x00a\x00r\x00c\x00h\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x0c\xad\x0f\x07\
-\x00d\
-\x00e\x00l\x00e\x00t\x00e\x00.\x00p\x00n\x00g\
-\x00\x09\
-\x02\xf7\xaeG\
-\x00v\
-\x00a\x00l\x00i\x00d\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x08#\x8e\x07\
-\x00n\
-\x00o\x00t\x00_\x00v\x00a\x00l\x00i\x00d\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x05\xb3\x09'\
-\x00u\
-\x00s\x00e\x00r\x00_\x00p\x00i\x00c\x00_\x00m\x00a\x00s\x00k\x00.\x00p\x00n\x00g\
-\
-"
 
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x07\x00\x00\x00\x06\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x05\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00 \x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00:\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01s$_N'\
-\x00\x00\x01\x1a\x00\x00\x00\x00\x00\x01\x00\x02\x08\x15\
-\x00\x00\x01s\x10+\x0b\xd4\
-\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x01\xe6\x16\
-\x00\x00\x01r\x81\x19n\xb4\
-\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x01\xff7\
-\x00\x00\x01s\x10+\x0b\xd5\
-\x00\x00\x00\xfa\x00\x00\x00\x00\x00\x01\x00\x02\x02\xd3\
-\x00\x00\x01s\x10+\x0b\xd4\
-\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x01\xef\xbc\
-\x00\x00\x01r\x81\x11`z\
-\x00\x00\x00r\x00\x00\x00\x00\x00\x01\x00\x01\xde\xf0\
-\x00\x00\x01r\x90\xd0\x00\xbc\
-\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x01\xf8\x98\
-\x00\x00\x01r\x90\xcf~\x0b\
-\x00\x00\x00X\x00\x01\x00\x00\x00\x01\x00\x01\xafL\
-\x00\x00\x01rz\xcf$\xe8\
-"
+fullpath_rcc = path.join(path.dirname(path.abspath(__file__)), "resources.rcc")
+
 
 def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    if not QtCore.QResource.registerResource(fullpath_rcc):
+        raise ProjectException(f"Could not register {fullpath_rcc}")
+
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    QtCore.QResource.unregisterResource(fullpath_rcc)
+
 
 qInitResources()
@@ -6,20 +6,29 @@ This main function will initialize PySide2 & Main and manage the starting of the
 # PySide2
 from PySide2 import QtWidgets
 
+# Local project
+import misc.Constants as ProjectConstants
+
 # Python standard libraries
 import locale
+from os import environ
 
 
-# TODO Maybe look into Qt model/view because management of contacts, wallets and addresses is getting out of hand
-#  especially in TransactionWindow
 # TODO deploying on linux is a NIGHTMARE. Find a way to freeze the app for Windows/MacOS/Linux.
-# TODO make so that every operation that calls algosdk happen on a thread and the application displays the loading icon
 def main():
     locale.setlocale(locale.LC_ALL, '')
     # Manager of all things regarding a widget-based Qt5 app.
     #  Eg.: mainloop, events, initialization, finalization, ...
     app = QtWidgets.QApplication([])
 
+    # Opt-in watchdog that reports stalls of the main loop.
+    watchdog = None
+    if ProjectConstants.envvar_watchdog in environ:
+        from misc.Watchdog import EventLoopWatchdog
+
+        watchdog = EventLoopWatchdog(int(environ[ProjectConstants.envvar_watchdog]))
+        watchdog.start()
+
     # This import has to be done here because there are several static resources inside this package which
     #  will be loaded during the import of the package itself. So because most misc are PySide2 objects
     #  QApplication needs to be running to perform all task needed.
@@ -31,7 +40,12 @@ def main():
     main_window.show()
 
     # Enter main loop.
-    return app.exec_()
+    return_code = app.exec_()
+
+    if watchdog:
+        watchdog.stop()
+
+    return return_code
 
 
 if __name__ == '__main__':
@@ -0,0 +1,76 @@
+"""
+This file contains the service that saves settings in background shortly after they change.
+"""
+
+
+# PySide2
+from PySide2 import QtCore
+
+# Local project
+import misc.Constants as ProjectConstants
+from misc.Codec import settings_snapshot, write_settings_snapshot
+from misc.DataStructures import DictJsonSettings
+from misc.Functions import find_main_window
+
+# Python standard libraries
+from functools import partial
+from os import path
+from sys import stderr
+
+
+class SettingsAutosave(QtCore.QObject):
+    """
+    This class saves settings once they stop changing for ProjectConstants.autosave_delay_ms.
+
+    The snapshot of what changed is taken in the GUI thread, it's as big as the changes. It's then written in the
+    "persistence" thread pool (see misc.Codec.write_settings_snapshot) so the GUI never waits for the disk.
+    That pool has a single thread so snapshots are written in the order they were taken.
+    """
+    def __init__(self, parent: QtCore.QObject, file: str, settings: DictJsonSettings):
+        super().__init__(parent)
+
+        self.file = file
+        self.settings = settings
+        # After a failed write the journal might be missing some changes so the next save writes the whole file.
+        self.rewrite = False
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(ProjectConstants.autosave_delay_ms)
+        self.timer.timeout.connect(self.save)
+
+        # Every change restarts the timer.
+        self.settings.set_listener(self.timer.start)
+
+    @QtCore.Slot()
+    def save(self):
+        if not self.settings.has_changed():
+            return
+
+        whole, lines = settings_snapshot(self.file, self.settings, self.rewrite)
+        self.rewrite = False
+        find_main_window().start_worker(
+            partial(write_settings_snapshot, self.file, whole, lines), None, self.save_error,
+            service="persistence", timeout=None
+        )
+
+    @QtCore.Slot(Exception)
+    def save_error(self, e: Exception):
+        if __debug__:
+            print(type(e), str(e), file=stderr)
+        print("Could not save {}".format(path.basename(self.file)), file=stderr)
+
+        # The save is tried again after the usual delay.
+        self.rewrite = True
+        self.settings.set_changed()
+
+    def flush(self):
+        """
+        This method saves right away any change that is waiting for the timer.
+
+        Once it returns every snapshot has been handed to the thread pool. It's meant to be called when the application
+        is closing, the thread pool has to be waited for.
+        """
+        self.settings.set_listener(None)
+        self.timer.stop()
+        self.save()
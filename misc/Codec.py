@@ -0,0 +1,354 @@
+"""
+This file contains the encoders and decoders of contacts.json and settings.json.
+
+Both files start with a header that names the format and its version. Files written by older versions of this
+application (jsonpickle, version 1) are migrated the first time they are loaded. The old file is kept aside as a backup.
+
+contacts.json is written as lines:
+    {"format": "algorand-wallet-manager/contacts", "version": 2, "fields": ["pic_name", "name", "info", "pic_hash"]}
+    [["pic_name", "name", "info", "pic_hash"], ...]
+    ...
+Every line after the header holds a chunk of contacts with their fields in the order given by the header. This way the
+file is parsed a chunk at a time (see iter_contacts) and it's much smaller than one object per contact.
+
+settings.json is a single JSON object:
+    {"format": "algorand-wallet-manager/settings", "version": 2, "settings": {...}}
+Changes made since then are appended to settings.json.journal, one per line:
+    {"format": "algorand-wallet-manager/settings-journal", "version": 2}
+    {"op": "set", "key": "selected", "value": 1}
+    {"op": "delete", "key": "local"}
+The journal is replayed over settings.json when it's loaded. Once it grows big enough, settings.json is written again
+as a whole and the journal is removed. (See settings_snapshot)
+"""
+
+
+# Local project
+from misc.DataStructures import ListJsonContacts, DictJsonSettings
+from misc.Entities import Contact
+
+# Python standard libraries
+import json
+from itertools import islice
+from os import O_RDONLY, close, fsync, name, open as os_open, path, remove, replace
+from shutil import copyfile
+from sys import stderr
+from typing import Iterable, Iterator, List, Tuple
+
+
+format_contacts = "algorand-wallet-manager/contacts"
+format_settings = "algorand-wallet-manager/settings"
+format_settings_journal = "algorand-wallet-manager/settings-journal"
+# Version of both formats written by this application. Version 1 is the one written with jsonpickle.
+format_version = 2
+
+contact_fields = ["pic_name", "name", "info", "pic_hash"]
+# Contacts on each line of contacts.json.
+contacts_per_line = 1000
+
+# Once the journal is this big (bytes), settings.json is written again as a whole.
+journal_compact_size = 16 * 1024
+
+encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+class CodecError(Exception):
+    """
+    Raised when a file is not in a format that this application can read.
+    """
+
+
+def encode_contacts(contacts: Iterable[Contact]) -> Iterator[str]:
+    """
+    This function returns the lines of contacts.json, newline included.
+    """
+    yield encoder.encode({"format": format_contacts, "version": format_version, "fields": contact_fields}) + "\n"
+
+    contacts = iter(contacts)
+    while True:
+        chunk = [
+            [contact.pic_name, contact.name, contact.info, contact.pic_hash]
+            for contact in islice(contacts, contacts_per_line)
+        ]
+        if not chunk:
+            return
+        yield encoder.encode(chunk) + "\n"
+
+
+def check_header(header: object, expected_format: str):
+    if not isinstance(header, dict) or header.get("format") != expected_format:
+        raise CodecError(f"Not a {expected_format} file")
+    if header.get("version", 0) > format_version:
+        raise CodecError(
+            f"The file was written by a newer version of this application. (version {header.get('version')})"
+        )
+
+
+def iter_contacts(lines: Iterable[str]) -> Iterator[List[Contact]]:
+    """
+    This function decodes the lines of contacts.json and yields contacts one chunk at a time.
+    """
+    lines = iter(lines)
+    header = json.loads(next(lines, "null"))
+    check_header(header, format_contacts)
+
+    # Fields might be in a different order or missing in future versions.
+    positions = [header["fields"].index(field) if field in header["fields"] else None for field in contact_fields]
+    if positions == list(range(len(contact_fields))):
+        for line in lines:
+            if line.strip():
+                yield [Contact(*row) for row in json.loads(line)]
+    else:
+        for line in lines:
+            if line.strip():
+                yield [
+                    Contact(*(row[position] if position is not None else None for position in positions))
+                    for row in json.loads(line)
+                ]
+
+
+def encode_settings(settings: DictJsonSettings) -> str:
+    return json.dumps(
+        {"format": format_settings, "version": format_version, "settings": dict(settings)},
+        indent=4, ensure_ascii=False
+    ) + "\n"
+
+
+def decode_settings(text: str) -> DictJsonSettings:
+    document = json.loads(text)
+    check_header(document, format_settings)
+
+    settings = DictJsonSettings()
+    # Settings added in newer versions keep their default value.
+    settings.update(document["settings"])
+    return settings
+
+
+def journal_file(file: str) -> str:
+    return file + ".journal"
+
+
+def encode_settings_changes(settings: DictJsonSettings) -> Iterator[str]:
+    """
+    This function returns the journal lines of the changes made to settings since settings.save_state(), newline
+    included.
+    """
+    for key, kind in settings.changes().items():
+        if kind == settings.deleted:
+            yield encoder.encode({"op": "delete", "key": key}) + "\n"
+        else:
+            yield encoder.encode({"op": "set", "key": key, "value": settings[key]}) + "\n"
+
+
+def replay_settings_journal(settings: DictJsonSettings, lines: Iterable[str]) -> bool:
+    """
+    This function applies the journal lines to settings.
+
+    It returns False if the last line was cut short. (i.e.: the application crashed while appending it)
+    That change is lost, the ones before it are applied.
+    """
+    lines = iter(lines)
+    header = next(lines, None)
+    if header is None:
+        return True
+    try:
+        header = json.loads(header)
+    except ValueError:
+        return False
+    check_header(header, format_settings_journal)
+
+    for line in lines:
+        try:
+            change = json.loads(line)
+        except ValueError:
+            return False
+        if change["op"] == "set":
+            settings[change["key"]] = change["value"]
+        elif change["op"] == "delete":
+            settings.pop(change["key"], None)
+        if not line.endswith("\n"):
+            return False
+    return True
+
+
+def is_jsonpickle(file: str) -> bool:
+    """
+    This function tells if file was written with jsonpickle by an older version of this application.
+    """
+    with open(file, encoding="utf-8") as f:
+        text = f.read(4096)
+    return '"py/object"' in text
+
+
+def migrate(file: str, structure: object, dump: callable):
+    """
+    This function writes structure, read from a jsonpickle file, with the current format. The old file is kept aside.
+    """
+    backup = file + ".v1.bak"
+    copyfile(file, backup)
+    dump(file, structure)
+    # A single write so that messages from other threads can't end up in the middle of it.
+    stderr.write("Migrated {} to version {}. The old file is {}\n".format(
+        path.basename(file), format_version, path.basename(backup)
+    ))
+
+
+def load_jsonpickle(file: str) -> object:
+    # jsonpickle is only needed for files written by older versions.
+    import jsonpickle
+
+    with open(file, encoding="utf-8") as f:
+        return jsonpickle.decode(f.read())
+
+
+def load_contacts_file(file: str) -> ListJsonContacts:
+    """
+    This function returns the contacts in file.
+
+    Errors are raised to the caller. This runs in the background thread of misc.Database.ContactLoader, which hands
+    them over to the GUI thread.
+    """
+    if is_jsonpickle(file):
+        contacts = load_jsonpickle(file)
+        migrate(file, contacts, dump_contacts_file)
+        return contacts
+
+    contacts = ListJsonContacts()
+    with open(file, encoding="utf-8") as f:
+        for chunk in iter_contacts(f):
+            contacts.extend(chunk)
+    return contacts
+
+
+def load_settings_file(file: str) -> DictJsonSettings:
+    """
+    This function returns the settings in file.
+
+    Any error during this function results in the application quitting.
+    """
+    try:
+        if is_jsonpickle(file):
+            settings = load_jsonpickle(file)
+            migrate(file, settings, dump_settings_file)
+            return settings
+
+        with open(file, encoding="utf-8") as f:
+            settings = decode_settings(f.read())
+
+        journal = journal_file(file)
+        if path.exists(journal):
+            with open(journal, encoding="utf-8") as f:
+                complete = replay_settings_journal(settings, f)
+            # New changes can't be appended after a line cut short.
+            if not complete:
+                write_settings_snapshot(file, True, [encode_settings(settings)])
+        return settings
+    except Exception as e:
+        stderr.write("Could not load {}\n{}\n".format(path.basename(file), e))
+        quit()
+
+
+def write_lines(file: str, lines: Iterable[str]):
+    """
+    This function writes the file aside and then moves it. This way a failed write leaves the old file in place.
+
+    The file is flushed to disk before it's moved and the move is flushed after. Otherwise a crash of the system might
+    leave an empty file in place of both the old and the new one.
+    """
+    with open(file + ".tmp", 'w', encoding="utf-8") as f:
+        f.writelines(lines)
+        f.flush()
+        fsync(f.fileno())
+    replace(file + ".tmp", file)
+    sync_folder(path.dirname(path.abspath(file)))
+
+
+def append_lines(file: str, lines: Iterable[str], header: str):
+    """
+    This function appends lines to file and flushes them to disk. A new file starts with header.
+    """
+    with open(file, 'a', encoding="utf-8") as f:
+        if f.tell() == 0:
+            f.write(header)
+        f.writelines(lines)
+        f.flush()
+        fsync(f.fileno())
+
+
+def sync_folder(folder: str):
+    """
+    This function flushes to disk the entries of folder. (i.e.: a file that was just renamed)
+    """
+    # Folders can't be opened on Windows where renames are flushed by the filesystem anyway.
+    if name == "nt":
+        return
+    descriptor = os_open(folder, O_RDONLY)
+    try:
+        fsync(descriptor)
+    finally:
+        close(descriptor)
+
+
+def dump_contacts_file(file: str, contacts: Iterable[Contact]):
+    """
+    This function writes contacts to file.
+
+    Any error during this function WILL NOT result in the application quitting. Although the application might
+    be in the stage of closing anyway if it's trying to save to disk.
+    """
+    try:
+        write_lines(file, encode_contacts(contacts))
+    except Exception as e:
+        stderr.write("Could not dump {}\n{}\n".format(path.basename(file), e))
+
+
+def dump_settings_file(file: str, settings: DictJsonSettings):
+    """
+    This function writes settings to file.
+
+    Any error during this function WILL NOT result in the application quitting.
+    """
+    try:
+        write_settings_snapshot(file, True, [encode_settings(settings)])
+    except Exception as e:
+        stderr.write("Could not dump {}\n{}\n".format(path.basename(file), e))
+
+
+def settings_snapshot(file: str, settings: DictJsonSettings, whole: bool = False) -> Tuple[bool, List[str]]:
+    """
+    This function returns what has to be written to save settings: either the whole file or the journal lines of the
+    changes made since settings.save_state(). Then it calls settings.save_state().
+
+    It's meant to be called where settings are changed (the GUI thread) so that the writing can happen anywhere else.
+    (See write_settings_snapshot)
+    """
+    journal = journal_file(file)
+    whole = whole or not path.exists(file) or path.exists(journal) and path.getsize(journal) >= journal_compact_size
+    lines = [encode_settings(settings)] if whole else list(encode_settings_changes(settings))
+    settings.save_state()
+    return whole, lines
+
+
+def write_settings_snapshot(file: str, whole: bool, lines: List[str]):
+    """
+    This function writes what settings_snapshot returned. Snapshots must be written in the order they were taken.
+    """
+    if whole:
+        write_lines(file, lines)
+        if path.exists(journal_file(file)):
+            remove(journal_file(file))
+    else:
+        header = encoder.encode({"format": format_settings_journal, "version": format_version}) + "\n"
+        append_lines(journal_file(file), lines, header)
+
+
+def save_settings_file(file: str, settings: DictJsonSettings):
+    """
+    This function saves the changes made to settings since settings.save_state(). They are appended to the journal
+    of file so that saving takes as long as the changes and not the whole settings.
+
+    Any error during this function WILL NOT result in the application quitting.
+    """
+    try:
+        write_settings_snapshot(file, *settings_snapshot(file, settings))
+    except Exception as e:
+        stderr.write("Could not save {}\n{}\n".format(path.basename(file), e))
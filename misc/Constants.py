@@ -9,8 +9,23 @@ from os import path
 #   Software data paths & filenames
 path_user_data = path.abspath(path.join(path.expanduser("~"), ".algorand-wallet-manager"))
 filename_contacts_json = "contacts.json"
+filename_contacts_db = "contacts.sqlite3"
 filename_settings_json = "settings.json"
 folder_thumbnails = "thumbnails"
+folder_thumbnail_cache = "thumbnail_cache"
+filename_thumbnail_atlas = "thumbnails.atlas"
+
+#   Contact thumbnails
+#    Side in pixels of the profile picture shown in the contact list.
+thumbnail_size = 40
+#    Bump this whenever the way thumbnails are derived changes. Old thumbnails will be derived again.
+thumbnail_version = 1
+
+#   Environment variables
+#    Set it to a number of milliseconds to report every time the GUI doesn't process events for that long.
+envvar_watchdog = "ALGORAND_WALLET_MANAGER_WATCHDOG_MS"
+#    Set it to 1 to keep all contact thumbnails in a single file. (See misc.Storage)
+envvar_thumbnail_atlas = "ALGORAND_WALLET_MANAGER_THUMBNAIL_ATLAS"
 
 #   Algorand node paths & filenames
 filename_algod_net = "algod.net"
@@ -20,8 +35,25 @@ filename_algod_token = "algod.token"
 filename_kmd_net = "kmd-v0.5/kmd.net"
 filename_kmd_token = "kmd-v0.5/kmd.token"
 
+#   Timeouts (seconds)
+#    Any call to the node issued through MainWindow.start_worker has to be done within this time.
+timeout_node_call = 30
+#    Closing the application doesn't wait for background tasks longer than this.
+timeout_shutdown = 3
+#   Settings are saved once they stop changing for this long. (milliseconds)
+autosave_delay_ms = 1000
+
+#   Concurrency
+#    Maximum number of calls in flight toward each service. This way a slow service can't take threads from the others.
+#     Contact thumbnails are read from the disk in a pool of their own.
+#     Settings are saved by a single thread so that writes happen in order.
+max_threads_per_service = {"kmd": 4, "algod": 4, "indexer": 2, "thumbnails": 2, "persistence": 1}
+
 # Composite constants
 #   Software data paths & filenames
 fullpath_contacts_json = path.join(path_user_data, filename_contacts_json)
+fullpath_contacts_db = path.join(path_user_data, filename_contacts_db)
 fullpath_settings_json = path.join(path_user_data, filename_settings_json)
 fullpath_thumbnails = path.join(path_user_data, folder_thumbnails)
+fullpath_thumbnail_cache = path.join(path_user_data, folder_thumbnail_cache)
+fullpath_thumbnail_atlas = path.join(fullpath_thumbnail_cache, filename_thumbnail_atlas)
@@ -3,7 +3,8 @@ This file contains some classes that implement functionality for some data struc
 """
 
 
-from typing import Dict
+from typing import Callable, Dict, Hashable, Optional
+from collections import Counter
 from collections.abc import MutableSequence, MutableMapping
 
 
@@ -16,17 +17,33 @@ class ChangeDetectable:
     I'm going to use this for a MutableSequence and a MutableMapping so i'm not going to write abstract methods that
     have to be defined because write operation on data structure differ. I'm going to rely on the child classes
     to implement correctly their version of write operation that correctly signal the changed flag.
+
+    Child classes that are saved a piece at a time also record what changed with record_change(). changes() then
+    tells, for every key, if it was inserted, updated or deleted since save_state(). This way only the changes need to
+    be saved.
+
+    A listener can be set with set_listener() to be called at every change. (i.e.: to save changes shortly after)
     """
+    inserted = "inserted"
+    updated = "updated"
+    deleted = "deleted"
 
     def __init__(self):
         self._changed = False
+        self._changes = dict()
+        self._listener = None
 
     def __getstate__(self) -> Dict:
         """
-        We hide this runtime flag from being saved in persistent memory when jsonpickle.encode() is called.
+        We hide these runtime records from the state of the object. (i.e.: copy.copy, pickle)
+        contacts.json and settings.json are written by misc.Codec in its versioned format and contacts by
+        misc.Database in SQLite. Both write only the fields they name so they never see these records either.
+        __setstate__ is still used when misc.Codec reads a jsonpickle file of an older version.
         """
         result = self.__dict__.copy()
-        del result["_changed"]
+        result.pop("_changed", None)
+        result.pop("_changes", None)
+        result.pop("_listener", None)
         return result
 
     def __setstate__(self, state: Dict):
@@ -34,35 +51,86 @@ class ChangeDetectable:
         This method has to be implemented because __getstate__ is.
         """
         self.__dict__.update(state)
+        self._changed = False
+        self._changes = dict()
+        self._listener = None
 
     def save_state(self):
         self._changed = False
+        self._changes.clear()
 
     def set_changed(self):
         self._changed = True
+        if self._listener:
+            self._listener()
+
+    def set_listener(self, listener: Optional[Callable[[], None]]):
+        self._listener = listener
 
     def has_changed(self) -> bool:
         return self._changed
 
+    def record_change(self, key: Hashable, kind: str):
+        """
+        This method records that key was inserted, updated or deleted. Consecutive changes of the same key are merged.
+        """
+        previous = self._changes.get(key)
+        if previous == self.inserted:
+            # Something that was never saved doesn't need to be deleted. Updated, it's still new.
+            if kind == self.deleted:
+                del self._changes[key]
+        elif previous == self.deleted and kind == self.inserted:
+            self._changes[key] = self.updated
+        else:
+            self._changes[key] = kind
+
+        self.set_changed()
+
+    def changes(self) -> Dict[Hashable, str]:
+        return dict(self._changes)
+
 
 class ListJsonContacts(MutableSequence, ChangeDetectable):
     """
     This class implements a list-like object that is used to hold the content of contacts.json file and is able to
     tell if content is changed.
+
+    Changes are not recorded one by one. Every change is already written to the contact database as it's made.
+    (See misc.Database)
+    It also counts how many contacts use each picture since contacts with the same picture share the same file.
     """
     def __init__(self):
         super().__init__()
         self._list = list()
+        self._picture_references = Counter()
+
+    def __getstate__(self) -> Dict:
+        """
+        References are not saved, they are counted again when the file is loaded.
+        """
+        result = super().__getstate__()
+        del result["_picture_references"]
+        return result
+
+    def __setstate__(self, state: Dict):
+        super().__setstate__(state)
+        self._picture_references = Counter(contact.pic_name for contact in self._list if contact.pic_name)
 
     def __getitem__(self, item):
         return self._list.__getitem__(item)
 
     def __setitem__(self, key, value):
-        self._list.__setitem__(key, value)
+        old_items = self._list[key] if isinstance(key, slice) else [self._list[key]]
+        new_items = list(value) if isinstance(key, slice) else [value]
+        self._list.__setitem__(key, new_items if isinstance(key, slice) else value)
+        self._forget_pictures(old_items)
+        self._count_pictures(new_items)
         self.set_changed()
 
     def __delitem__(self, key):
+        old_items = self._list[key] if isinstance(key, slice) else [self._list[key]]
         self._list.__delitem__(key)
+        self._forget_pictures(old_items)
         self.set_changed()
 
     def __len__(self):
@@ -70,13 +138,48 @@ class ListJsonContacts(MutableSequence, ChangeDetectable):
 
     def insert(self, index, item):
         self._list.insert(index, item)
+        self._count_pictures([item])
+        self.set_changed()
+
+    def extend(self, items):
+        """
+        This overridden method adds all items at once instead of inserting them one by one.
+        """
+        items = list(items)
+        self._list.extend(items)
+        self._count_pictures(items)
         self.set_changed()
 
+    def picture_references(self, pic_name: str) -> int:
+        """
+        This method returns how many contacts use the picture pic_name.
+        """
+        return self._picture_references[pic_name] if pic_name else 0
+
+    def uses_thumbnail(self, pic_hash: str) -> bool:
+        """
+        This method tells if any contact uses the thumbnail of pic_hash.
+
+        Contacts saved before pictures were named after their hash can have different pictures with the same content,
+        they share the thumbnail. It's not counted like pictures because pic_hash is set in place once the thumbnail is
+        derived. It's only needed when a picture is not used anymore.
+        """
+        return pic_hash is not None and any(contact.pic_hash == pic_hash for contact in self._list)
+
+    def _count_pictures(self, contacts):
+        self._picture_references.update(contact.pic_name for contact in contacts if contact.pic_name)
+
+    def _forget_pictures(self, contacts):
+        self._picture_references.subtract(contact.pic_name for contact in contacts if contact.pic_name)
+
 
 class DictJsonSettings(MutableMapping, ChangeDetectable):
     """
     This class implements a dict-like object that is used to hold the content of settings.json file and is able to tell
     if content is changed.
+
+    Only assignments to top level keys are detected. Nested values have to be assigned as a whole.
+    (i.e.: settings["algod"] = {...} instead of settings["algod"]["url"] = ...)
     """
     def __init__(self):
         super().__init__()
@@ -92,12 +195,17 @@ class DictJsonSettings(MutableMapping, ChangeDetectable):
         return self._dict.__getitem__(key)
 
     def __setitem__(self, key, value):
+        kind = self.updated if key in self._dict else self.inserted
+        # Writing the same value again is not a change.
+        if kind == self.updated and self._dict[key] == value:
+            return
+        # The listener has to find the new value already in place.
         self._dict.__setitem__(key, value)
-        self.set_changed()
+        self.record_change(key, kind)
 
     def __delitem__(self, key):
         self._dict.__delitem__(key)
-        self.set_changed()
+        self.record_change(key, self.deleted)
 
     def __iter__(self):
         return self._dict.__iter__()
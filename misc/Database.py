@@ -0,0 +1,228 @@
+"""
+This file contains the store of contacts backed by an SQLite database.
+
+Every change is written as soon as it's made, one row at a time. Saving never depends on how many contacts there are
+and a crash can only lose the change being written.
+"""
+
+
+# Local project
+from misc.Codec import load_contacts_file
+from misc.DataStructures import ListJsonContacts
+from misc.Entities import Contact
+
+# Python standard libraries
+import sqlite3
+from os import path, remove, replace
+from sys import stderr
+from threading import Event, RLock, Thread
+from typing import Iterable, List, Tuple
+
+
+class ContactDatabase:
+    """
+    This class reads and writes contacts in an SQLite database.
+
+    Contacts read from here carry the id of their row. (Contact.row_id) That's how a contact is updated or deleted.
+    The schema version is kept in PRAGMA user_version. It's safe to use from any thread.
+    """
+    schema_version = 1
+    schema = [
+        """
+        CREATE TABLE IF NOT EXISTS contacts (
+            id INTEGER PRIMARY KEY,
+            pic_name TEXT,
+            name TEXT NOT NULL,
+            info TEXT NOT NULL,
+            pic_hash TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS contacts_name ON contacts (name)",
+        "CREATE INDEX IF NOT EXISTS contacts_info ON contacts (info)",
+    ]
+
+    def __init__(self, file: str):
+        self.file = file
+        self.lock = RLock()
+
+        # The connection is shared between threads but only used by one at a time.
+        self.connection = sqlite3.connect(file, check_same_thread=False)
+        # With a write-ahead log a commit only appends to the log. Every commit is flushed to disk so that not even a
+        #  crash of the system loses a change. Commits happen once per edit so that's cheap.
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=FULL")
+        self.migrate()
+
+    def migrate(self):
+        """
+        This method brings the schema of the database up to date.
+        """
+        with self.lock, self.connection:
+            version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+            if version > self.schema_version:
+                raise sqlite3.DatabaseError(
+                    f"The database was written by a newer version of this application. (schema {version})"
+                )
+            if version < self.schema_version:
+                for statement in self.schema:
+                    self.connection.execute(statement)
+                # PRAGMA doesn't accept parameters.
+                self.connection.execute(f"PRAGMA user_version={self.schema_version:d}")
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    def contacts(self) -> List[Contact]:
+        """
+        This method returns all contacts in the order they were added.
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT id, pic_name, name, info, pic_hash FROM contacts ORDER BY id")
+            return [self.contact_from_row(row) for row in rows]
+
+    @staticmethod
+    def contact_from_row(row: tuple) -> Contact:
+        contact = Contact(row[1], row[2], row[3], row[4])
+        contact.row_id = row[0]
+        return contact
+
+    def add(self, contact: Contact):
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO contacts (pic_name, name, info, pic_hash) VALUES (?, ?, ?, ?)",
+                (contact.pic_name, contact.name, contact.info, contact.pic_hash)
+            )
+            contact.row_id = cursor.lastrowid
+
+    def add_many(self, contacts: Iterable[Contact]):
+        """
+        This method adds all contacts inside a single transaction. (i.e.: importing an address book)
+        """
+        with self.lock, self.connection:
+            for contact in contacts:
+                cursor = self.connection.execute(
+                    "INSERT INTO contacts (pic_name, name, info, pic_hash) VALUES (?, ?, ?, ?)",
+                    (contact.pic_name, contact.name, contact.info, contact.pic_hash)
+                )
+                contact.row_id = cursor.lastrowid
+
+    def replace(self, old_contact: Contact, new_contact: Contact):
+        """
+        This method writes new_contact in the row of old_contact.
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE contacts SET pic_name = ?, name = ?, info = ?, pic_hash = ? WHERE id = ?",
+                (new_contact.pic_name, new_contact.name, new_contact.info, new_contact.pic_hash, old_contact.row_id)
+            )
+            new_contact.row_id = old_contact.row_id
+            if old_contact is not new_contact:
+                old_contact.row_id = None
+
+    def update(self, contact: Contact):
+        self.replace(contact, contact)
+
+    def remove(self, contact: Contact):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM contacts WHERE id = ?", (contact.row_id, ))
+            contact.row_id = None
+
+
+def open_contact_database(file: str, json_file: str) -> ContactDatabase:
+    """
+    This function opens the database of contacts. If there's none yet, contacts are imported from json_file which is
+    where older versions of this application kept them. json_file is then renamed and kept as a backup.
+
+    The import is done aside so that a failure in the middle of it leaves no database and it's tried again next time.
+    Errors are raised to the caller.
+    """
+    if not path.exists(file) and path.exists(json_file):
+        temp_file = file + ".import"
+        if path.exists(temp_file):
+            remove(temp_file)
+
+        try:
+            database = ContactDatabase(temp_file)
+            try:
+                contacts = load_contacts_file(json_file)
+                database.add_many(contacts)
+            finally:
+                database.close()
+            replace(temp_file, file)
+        finally:
+            # Only left if the import failed.
+            if path.exists(temp_file):
+                remove(temp_file)
+
+        replace(json_file, json_file + ".imported")
+        # A single write since this runs in the background. (See ContactLoader)
+        stderr.write("Imported {} contacts from {}\n".format(len(contacts), path.basename(json_file)))
+
+    return ContactDatabase(file)
+
+
+# The ContactLoader started by MainWindow.initialize, None until then.
+#  (See start_contact_loader and ContactsWindow.wait_for_contacts)
+contact_loader = None
+
+
+class ContactLoader:
+    """
+    This class opens the database of contacts and reads all of them in a background thread.
+
+    This way the main window is built while contacts are loaded. Whoever needs contacts calls result() which only
+    blocks if they are not loaded yet.
+    """
+    def __init__(self, file: str, json_file: str):
+        self.file = file
+        self.json_file = json_file
+
+        self.database = None
+        self.contacts = None
+        # The exception raised while loading, if any.
+        self.error = None
+
+        self.done = Event()
+        self.thread = Thread(target=self.load, name="ContactLoader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def load(self):
+        """
+        This method runs in the background thread.
+        """
+        try:
+            self.database = open_contact_database(self.file, self.json_file)
+            self.contacts = ListJsonContacts()
+            self.contacts.extend(self.database.contacts())
+            self.contacts.save_state()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done.set()
+
+    def result(self) -> Tuple[ContactDatabase, ListJsonContacts]:
+        """
+        This method waits for the load to be over and returns the database and its contacts.
+
+        If the load failed its error is raised here.
+        """
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.database, self.contacts
+
+
+def start_contact_loader(file: str, json_file: str):
+    """
+    This function starts loading contacts in background. Once done they are found in contact_loader.
+    """
+    global contact_loader
+    contact_loader = ContactLoader(file, json_file)
+    contact_loader.start()
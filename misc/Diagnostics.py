@@ -0,0 +1,142 @@
+"""
+This file contains the in-memory records of calls to the node and of the workers that issue them.
+
+Nothing here is saved to disk. It's meant to tell whether slowness comes from the application, kmd or algod.
+"""
+
+
+# Python standard libraries
+import re
+from collections import deque, namedtuple
+from math import ceil
+from threading import Lock
+from typing import Dict, List
+
+
+# A single HTTP request to the node.
+#  service: "kmd", "algod", "indexer" or "unknown"
+#  endpoint: method and path of the request with variable parts replaced. (i.e.: "GET /v2/accounts/{address}")
+#  duration: seconds
+#  payload: bytes sent plus bytes received
+#  outcome: "ok", "http <status code>" or the name of the exception raised
+CallRecord = namedtuple("CallRecord", ["service", "endpoint", "duration", "payload", "outcome"])
+
+
+class CallLog:
+    """
+    This class is a ring buffer that holds the last max_records calls to the node. It's safe to use from any thread.
+    """
+    # Variable parts of a path are replaced so that calls to the same endpoint are grouped together.
+    path_placeholders = [
+        (re.compile(r"/[A-Z2-7]{58}(?=/|$)"), "/{address}"),
+        (re.compile(r"/[A-Z2-7]{52}(?=/|$)"), "/{txid}"),
+        (re.compile(r"/[0-9]+(?=/|$)"), "/{id}")
+    ]
+
+    def __init__(self, max_records: int = 5000):
+        self._records = deque(maxlen=max_records)
+        self._lock = Lock()
+
+    @staticmethod
+    def endpoint(method: str, path: str) -> str:
+        path = path.split("?")[0]
+        for pattern, placeholder in CallLog.path_placeholders:
+            path = pattern.sub(placeholder, path)
+        return f"{method} {path}"
+
+    def record(self, service: str, method: str, path: str, duration: float, payload: int, outcome: str):
+        with self._lock:
+            self._records.append(
+                CallRecord(service, self.endpoint(method, path), duration, payload, outcome)
+            )
+
+    def snapshot(self) -> List[CallRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def summary(self) -> List[Dict]:
+        """
+        This method returns, for every (service, endpoint), number of calls, errors, average payload and
+        p50/p95/p99 durations in milliseconds. Slowest endpoints come first.
+        """
+        groups = dict()
+        for record in self.snapshot():
+            groups.setdefault((record.service, record.endpoint), list()).append(record)
+
+        result = list()
+        for (service, endpoint), records in groups.items():
+            durations = sorted(record.duration * 1000 for record in records)
+            result.append({
+                "service": service,
+                "endpoint": endpoint,
+                "calls": len(records),
+                "errors": sum(1 for record in records if record.outcome != "ok"),
+                "payload": sum(record.payload for record in records) // len(records),
+                "p50": percentile(durations, 50),
+                "p95": percentile(durations, 95),
+                "p99": percentile(durations, 99)
+            })
+
+        return sorted(result, key=lambda row: row["p95"], reverse=True)
+
+
+class WorkerStats:
+    """
+    This class counts, for every service, workers waiting in queue and workers running. It also counts how many keyed
+    calls were served by a call already in flight. It's safe to use from any thread.
+    """
+    def __init__(self):
+        self._queued = dict()
+        self._running = dict()
+        self._keyed_calls = 0
+        self._coalesced_calls = 0
+        self._lock = Lock()
+
+    def worker_queued(self, service: str):
+        with self._lock:
+            self._queued[service] = self._queued.get(service, 0) + 1
+
+    def worker_started(self, service: str):
+        with self._lock:
+            self._queued[service] = self._queued.get(service, 0) - 1
+            self._running[service] = self._running.get(service, 0) + 1
+
+    def worker_finished(self, service: str):
+        with self._lock:
+            self._running[service] = self._running.get(service, 0) - 1
+
+    def keyed_call(self, coalesced: bool):
+        with self._lock:
+            self._keyed_calls += 1
+            self._coalesced_calls += coalesced
+
+    def queued(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._queued)
+
+    def running(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._running)
+
+    def coalesced_rate(self) -> float:
+        with self._lock:
+            return self._coalesced_calls / self._keyed_calls if self._keyed_calls else 0.0
+
+    def keyed_calls(self) -> int:
+        with self._lock:
+            return self._keyed_calls
+
+
+def percentile(sorted_values: List[float], p: int) -> float:
+    """
+    This function returns the nearest-rank percentile p of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(ceil(p / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+# Single instances shared by the whole application.
+call_log = CallLog()
+worker_stats = WorkerStats()
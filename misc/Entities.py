@@ -10,25 +10,50 @@ from algosdk.wallet import Wallet as AlgosdkWallet
 
 # Local Project
 import misc.Constants as ProjectConstants
+from misc.Transport import CancelToken, call_context
+from misc.Diagnostics import worker_stats
+from misc.Storage import thumbnail_store
 
 # Python standard libraries
 from os import path, remove
 from sys import stderr
+from threading import RLock, Timer
+from time import time, monotonic
 from typing import Dict
+from weakref import WeakMethod
 
 
 class Contact:
     """
     Object that represents a single contact in the contact list.
+
+    pic_name is the file of the picture chosen by the user. pic_hash is the hash of its content and it's the key of the
+    derived thumbnail in misc.Storage.thumbnail_store().
+    row_id is the row of the contact in misc.Database.ContactDatabase once it's saved there.
     """
-    def __init__(self, pic_name: str, name: str, info: str):
+    # Contacts saved before thumbnails were cached don't have this attribute. They find it here.
+    pic_hash = None
+    row_id = None
+
+    def __init__(self, pic_name: str, name: str, info: str, pic_hash: str = None):
         self.pic_name = pic_name
         self.name = name
         self.info = info
+        self.pic_hash = pic_hash
+
+    @staticmethod
+    def thumbnail_file_name(pic_hash: str) -> str:
+        """
+        This method returns the file name of a thumbnail. Size and version are part of it so that a thumbnail derived
+        in another way is never mistaken for the current one.
+        """
+        return f"{pic_hash}-{ProjectConstants.thumbnail_size}px-v{ProjectConstants.thumbnail_version}.png"
 
-    def release(self):
+    def release(self, keep_thumbnail: bool = False):
         """
-        Method to destroy profile picture on disk.
+        Method to destroy profile picture and its thumbnail on disk. The thumbnail is kept if other contacts with a
+        different picture of the same content use it.
+        (See misc.DataStructures.ListJsonContacts.uses_thumbnail)
         """
         if self.pic_name:
             try:
@@ -38,6 +63,104 @@ class Contact:
                     print(type(e), str(e), file=stderr)
                 print("Could not delete profile picture for %s" % self.name, file=stderr)
 
+        if self.pic_hash and not keep_thumbnail:
+            try:
+                thumbnail_store().discard(self.thumbnail_file_name(self.pic_hash))
+            except Exception as e:
+                if __debug__:
+                    print(type(e), str(e), file=stderr)
+
+
+class LeasedAlgosdkWallet(AlgosdkWallet):
+    """
+    This class is an algosdk.wallet.Wallet that keeps track of when its kmd handle expires.
+
+    algosdk.wallet.Wallet renews the handle before every single operation which doubles the round trips to kmd.
+    Here the handle is renewed in background shortly before it runs out so that operations can use it right away.
+    If the lease is over anyway (i.e.: background renewal failed) we fall back on algosdk behaviour.
+    """
+    # kmd gives out handles that last this long. It's only used until kmd tells us the real expiration.
+    default_lease_seconds = 60
+    # The handle is renewed when there are less than this many seconds left.
+    renew_margin_seconds = 15
+
+    def __init__(self, wallet_name: str, wallet_pswd: str, kmd_client, driver_name: str = "sqlite", mdk: str = None):
+        # These have to exist before super().__init__() because it gets a handle.
+        self.expires_at = 0.0
+        self.lease_lock = RLock()
+        self.renew_timer = None
+
+        super().__init__(wallet_name, wallet_pswd, kmd_client, driver_name, mdk)
+
+        # algosdk.wallet.Wallet.__init__ doesn't use init_handle() so we start the lease here.
+        self.set_lease(self.default_lease_seconds)
+
+    def set_lease(self, expires_seconds: int):
+        """
+        This method records the new expiration of the handle and schedules its renewal in background.
+        """
+        with self.lease_lock:
+            self.expires_at = time() + expires_seconds
+
+            if self.renew_timer:
+                self.renew_timer.cancel()
+
+            # The timer only holds a weak reference so that a forgotten wallet is not kept alive (and renewed) forever.
+            self.renew_timer = Timer(
+                max(expires_seconds - self.renew_margin_seconds, 0),
+                LeasedAlgosdkWallet.renew_in_background,
+                (WeakMethod(self.renew_handle), )
+            )
+            self.renew_timer.daemon = True
+            self.renew_timer.start()
+
+    def stop_lease(self):
+        """
+        This method stops background renewal. The handle will eventually expire on kmd side.
+        """
+        with self.lease_lock:
+            if self.renew_timer:
+                self.renew_timer.cancel()
+                self.renew_timer = None
+            self.expires_at = 0.0
+
+    @staticmethod
+    def renew_in_background(weak_renew_handle: WeakMethod):
+        renew_handle = weak_renew_handle()
+        if renew_handle is None:
+            return
+
+        try:
+            with call_context(service="kmd"):
+                renew_handle()
+        except Exception as e:
+            if __debug__:
+                print(type(e), str(e), file=stderr)
+            # The next operation will get a new handle.
+            renew_handle.__self__.expires_at = 0.0
+
+    def automate_handle(self) -> bool:
+        """
+        This overridden method only goes to kmd if the handle is missing or about to expire.
+        """
+        with self.lease_lock:
+            if self.handle is not None and time() < self.expires_at - self.renew_margin_seconds:
+                return True
+
+            return super().automate_handle()
+
+    def init_handle(self) -> bool:
+        with self.lease_lock:
+            super().init_handle()
+            self.set_lease(self.default_lease_seconds)
+            return True
+
+    def renew_handle(self) -> Dict:
+        with self.lease_lock:
+            resp = super().renew_handle()
+            self.set_lease(resp["expires_seconds"])
+            return resp
+
 
 class Wallet:
     """
@@ -45,27 +168,43 @@ class Wallet:
 
     It just holds 2 properties:
         1. The dict returned from algosdk call
-        2. algosdk.wallet.Wallet for when the wallet is unlocked with its password
+        2. LeasedAlgosdkWallet for when the wallet is unlocked with its password
     """
     def __init__(self, info: Dict):
         self.info = info
         self.algo_wallet = None
 
-    def unlock(self, algo_wallet: AlgosdkWallet):
+    def unlock(self, algo_wallet: LeasedAlgosdkWallet):
         self.algo_wallet = algo_wallet
 
     def lock(self):
+        if self.algo_wallet:
+            self.algo_wallet.stop_lease()
         self.algo_wallet = None
 
 
+class WorkerPriority:
+    """
+    Priorities of AlgorandWorker inside a thread pool. Workers with higher priority are started first.
+    """
+    # Things that the user didn't ask for. (i.e.: refreshing data)
+    background = 0
+    # Things that the user is going to look at. (i.e.: filling a list)
+    foreground = 1
+    # Things that the user asked for and is waiting on. (i.e.: unlocking a wallet)
+    interactive = 2
+
+
 class AlgorandWorkerSignals(QtCore.QObject):
     """
     QObject with custom signals.
 
     This is used in AlgorandWorker to signal a success with return value or an error.
+    AlgorandStreamWorker also signals partial results with progress.
     """
     success = QtCore.Signal(object)
     error = QtCore.Signal(Exception)
+    progress = QtCore.Signal(list)
 
 
 class AlgorandWorker(QtCore.QRunnable):
@@ -75,6 +214,9 @@ class AlgorandWorker(QtCore.QRunnable):
     We use this instead of a separate class for every piece of code we could ever need to run.
     As long as it's a simple blocking call with a return value this is fine. Just connect to result signal with the
     function that process the return value.
+
+    A worker also carries a cancel token and optionally a deadline. Every request to the node made by fn is bounded by
+    the deadline and is refused once the worker is cancelled. A cancelled worker never emits its signals.
     """
     def __init__(self, fn: callable, *args, **kwargs):
         super().__init__()
@@ -84,15 +226,96 @@ class AlgorandWorker(QtCore.QRunnable):
         self.kwargs = kwargs
         self.signals = AlgorandWorkerSignals()
 
+        self.cancel_token = CancelToken()
+        self.deadline = None
+        # Name of the service that fn talks to. It's only used to keep records.
+        self.service = None
+
+    def set_timeout(self, seconds: float):
+        """
+        This method sets the deadline of this worker to some seconds from now. Time spent in queue counts.
+        """
+        self.deadline = monotonic() + seconds
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
     def run(self):
         """
         This overridden method calls a callable fn with args, kwargs parameters.
 
         This method gets called once this object is inside a QThreadPool.
         """
+        worker_stats.worker_started(self.service)
         try:
-            result = self.fn(*self.args, **self.kwargs)
+            self.run_fn()
+        finally:
+            worker_stats.worker_finished(self.service)
+
+    def run_fn(self):
+        if self.cancel_token.is_cancelled():
+            return
+
+        try:
+            if self.deadline is not None and monotonic() >= self.deadline:
+                raise TimeoutError("The call was waiting in queue for too long")
+
+            with call_context(self.deadline, self.cancel_token, self.service):
+                result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            if not self.cancel_token.is_cancelled():
+                self.signals.error.emit(e)
+        else:
+            if not self.cancel_token.is_cancelled():
+                self.signals.success.emit(result)
+
+
+class AlgorandStreamWorker(AlgorandWorker):
+    """
+    This class is used to run a generator in a thread using QThreadPool and deliver its items as they come.
+
+    Items are sent in batches through the progress signal. The first item is sent as soon as it's ready, after that
+    a batch is sent at most every min_progress_interval seconds so that the GUI thread doesn't get flooded.
+    Once the generator is exhausted success is emitted with the total number of items.
+    """
+    min_progress_interval = 0.05
+
+    def run_fn(self):
+        """
+        This overridden method iterates over the generator returned by fn with args, kwargs parameters.
+        """
+        if self.cancel_token.is_cancelled():
+            return
+
+        batch = list()
+        count = 0
+        # So that the first item is sent right away.
+        last_emit = monotonic() - self.min_progress_interval
+
+        try:
+            if self.deadline is not None and monotonic() >= self.deadline:
+                raise TimeoutError("The call was waiting in queue for too long")
+
+            with call_context(self.deadline, self.cancel_token, self.service):
+                for item in self.fn(*self.args, **self.kwargs):
+                    if self.cancel_token.is_cancelled():
+                        return
+
+                    batch.append(item)
+                    count += 1
+
+                    if monotonic() - last_emit >= self.min_progress_interval:
+                        self.signals.progress.emit(batch)
+                        batch = list()
+                        last_emit = monotonic()
         except Exception as e:
-            self.signals.error.emit(e)
+            if not self.cancel_token.is_cancelled():
+                # Whatever arrived before the error is still good.
+                if batch:
+                    self.signals.progress.emit(batch)
+                self.signals.error.emit(e)
         else:
-            self.signals.success.emit(result)
+            if not self.cancel_token.is_cancelled():
+                if batch:
+                    self.signals.progress.emit(batch)
+                self.signals.success.emit(count)
@@ -0,0 +1,105 @@
+"""
+This file contains subclasses of PySide2 models that are used throughout this project.
+"""
+
+
+# PySide2
+from PySide2 import QtCore
+
+# Python standard libraries
+from typing import Any, Callable, Iterable, List
+
+
+class ObjectListModel(QtCore.QAbstractListModel):
+    """
+    This class is a list model that holds plain Python objects. (i.e.: Wallet, Contact, str)
+
+    A view only asks for the rows it is displaying so a row in this model costs nothing more than the object itself.
+    Delegates get the object back through ObjectRole. DisplayRole is the text produced by display(object) which is
+    also what the view uses for keyboard search.
+    Objects are kept in the order they are given. (i.e.: search results come already ranked)
+    """
+    ObjectRole = QtCore.Qt.UserRole
+
+    def __init__(self, parent: QtCore.QObject = None, display: Callable[[Any], str] = str):
+        super().__init__(parent)
+
+        self.display = display
+
+        self._objects = list()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        # This is a list so only the invisible root has children.
+        return 0 if parent.isValid() else len(self._objects)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        if role == ObjectListModel.ObjectRole:
+            return self._objects[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return self.display(self._objects[index.row()])
+
+        return None
+
+    def object_at(self, row: int) -> Any:
+        return self._objects[row]
+
+    def objects(self) -> List[Any]:
+        return list(self._objects)
+
+    def row_of(self, obj: Any) -> int:
+        return self._objects.index(obj)
+
+    def add(self, obj: Any) -> int:
+        """
+        This method adds a single object at the end and returns its row.
+        """
+        row = len(self._objects)
+
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._objects.append(obj)
+        self.endInsertRows()
+
+        return row
+
+    def extend(self, objects: Iterable[Any]):
+        """
+        This method adds many objects at once. Views are notified a single time.
+        """
+        objects = list(objects)
+        if not objects:
+            return
+
+        first = len(self._objects)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(objects) - 1)
+        self._objects.extend(objects)
+        self.endInsertRows()
+
+    def set_objects(self, objects: Iterable[Any]):
+        """
+        This method replaces all objects at once. It's meant for content that changes as a whole. (i.e.: search results)
+        """
+        self.beginResetModel()
+        self._objects = list(objects)
+        self.endResetModel()
+
+    def remove(self, obj: Any):
+        row = self.row_of(obj)
+
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._objects[row]
+        self.endRemoveRows()
+
+    def refresh(self, obj: Any):
+        """
+        This method tells views that obj changed and has to be painted again.
+        """
+        index = self.index(self.row_of(obj))
+        self.dataChanged.emit(index, index)
+
+    def clear(self):
+        self.beginResetModel()
+        self._objects.clear()
+        self.endResetModel()
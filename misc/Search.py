@@ -0,0 +1,544 @@
+"""
+This file contains the search index used to filter contacts while the user types.
+
+Nothing here depends on Qt so that it can be measured on its own.
+"""
+
+
+# Python standard libraries
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import chain, compress, islice, permutations
+from operator import not_
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # misc.Entities needs PySide2. It's only imported for type hints.
+    from misc.Entities import Contact
+
+
+class ContactIndex:
+    """
+    This class is a search index over contacts.
+
+    A query is split into words. A contact matches if every word can be given its own substring of the name or the
+    beginning of the address. (Both case insensitive) Two words can't share the same characters so "an an" doesn't
+    match "Anna" while "a a" does.
+    Results are sorted by relevance and then by name, but only as far as the user sees them. See search().
+    - Names are indexed by trigrams. Words of at least three characters only look at contacts that have all their
+      trigrams.
+    - Addresses are kept sorted which makes a compact prefix trie: every prefix is a contiguous range found with
+      binary search.
+    - The last result is remembered. When the user keeps typing, the new query can only match a subset of it so only
+      that subset is checked.
+    Adding or removing a contact keeps the index up to date.
+    """
+    ngram_length = 3
+
+    # Points for every character of a query word depending on where it matches.
+    score_name_start = 3
+    score_word_start = 2
+    score_inside_word = 1
+    score_address_start = 2
+    # Points for every character of the query when all its words appear in the name in the same order, one after
+    #  the other.
+    score_contiguous = 1
+    # Only this many rows at the top, the ones the user actually sees, are sorted by relevance.
+    visible_rows = 50
+    # Looking for the top rows stops after this many results. (See rank)
+    rank_limit = 1000
+    # A result with more than this fraction of all contacts is not narrowed. Checking every contact is faster.
+    narrow_fraction = 0.25
+    # Queries with up to this many words are checked for overlaps with a single regular expression. (See fit_pattern)
+    max_pattern_words = 4
+
+    def __init__(self, contacts: Iterable["Contact"] = ()):
+        # Contacts sorted by name, case insensitive. This is the order in which results are shown.
+        #  Names beginning the same way are next to each other so they are a contiguous range of rows.
+        self._contacts = sorted(contacts, key=self.sort_key)
+        self._sort_keys = [self.sort_key(contact) for contact in self._contacts]
+        self._lower_name_list = [lower_name for lower_name, _ in self._sort_keys]
+        # Position of every contact in self._contacts. It's rebuilt only when needed after a change.
+        self._positions = None
+
+        self._lower_names = dict()
+        self._lower_addresses = dict()
+        self._ngrams = dict()
+        for contact in self._contacts:
+            self.index(contact)
+
+        # Lowercase addresses sorted and the contact for each one of them.
+        address_contacts = sorted(self._contacts, key=self._lower_addresses.get)
+        self._addresses = [self._lower_addresses[contact] for contact in address_contacts]
+        self._address_contacts = address_contacts
+
+        self._last_words = None
+        self._last_result = None
+        self._last_ranking = None
+
+        # Ready for the first keystroke.
+        self.positions()
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+    def contacts(self) -> List["Contact"]:
+        """
+        This method returns all contacts sorted by name.
+        """
+        return list(self._contacts)
+
+    def index(self, contact: "Contact"):
+        lower_name = contact.name.lower()
+        self._lower_names[contact] = lower_name
+        self._lower_addresses[contact] = contact.info.lower()
+        for ngram in self.ngrams(lower_name):
+            self._ngrams.setdefault(ngram, set()).add(contact)
+
+    def add(self, contact: "Contact"):
+        sort_key = self.sort_key(contact)
+        row = bisect_right(self._sort_keys, sort_key)
+        self._contacts.insert(row, contact)
+        self._sort_keys.insert(row, sort_key)
+
+        self.index(contact)
+        self._lower_name_list.insert(row, self._lower_names[contact])
+
+        address = self._lower_addresses[contact]
+        row = bisect_right(self._addresses, address)
+        self._addresses.insert(row, address)
+        self._address_contacts.insert(row, contact)
+
+        self._positions = None
+        self.forget_last_search()
+
+    def remove(self, contact: "Contact"):
+        row = bisect_left(self._sort_keys, self.sort_key(contact))
+        while self._contacts[row] is not contact:
+            row += 1
+        del self._contacts[row]
+        del self._sort_keys[row]
+        del self._lower_name_list[row]
+
+        lower_name = self._lower_names.pop(contact)
+        for ngram in self.ngrams(lower_name):
+            self._ngrams[ngram].discard(contact)
+            if not self._ngrams[ngram]:
+                del self._ngrams[ngram]
+
+        row = bisect_left(self._addresses, self._lower_addresses.pop(contact))
+        while self._address_contacts[row] is not contact:
+            row += 1
+        del self._addresses[row]
+        del self._address_contacts[row]
+
+        self._positions = None
+        self.forget_last_search()
+
+    @staticmethod
+    def sort_key(contact: "Contact") -> Tuple[str, str]:
+        return contact.name.lower(), contact.name
+
+    def forget_last_search(self):
+        self._last_words, self._last_result, self._last_ranking = None, None, None
+
+    @staticmethod
+    def ngrams(text: str) -> Set[str]:
+        return {text[i:i + ContactIndex.ngram_length] for i in range(len(text) - ContactIndex.ngram_length + 1)}
+
+    @staticmethod
+    def split(query: str) -> List[str]:
+        return [word for word in query.lower().split(' ') if word]
+
+    def search(self, query: str) -> List["Contact"]:
+        """
+        This method returns the contacts that match query sorted by relevance and then by name.
+
+        Only the top visible_rows are sorted by relevance, the rest stay in alphabetical order. The top rows are looked
+        for among at most rank_limit results, so with many results a relevant contact might be left below them. This
+        way the time of a keystroke is the time of matching. (See rank)
+        """
+        words = self.split(query)
+        if not words:
+            self.forget_last_search()
+            return self.contacts()
+
+        # i.e.: a space typed after the last word.
+        if words == self._last_words:
+            return list(self._last_ranking)
+
+        if self.narrows_last_search(words) and len(self._last_result) <= len(self._contacts) * self.narrow_fraction:
+            # Words that didn't change already match every contact of the last result.
+            last_words = self._last_words + [None] * (len(words) - len(self._last_words))
+            result = self.filter(self._last_result, [word for word, last in zip(words, last_words) if word != last])
+        else:
+            # The longest word is the most selective one.
+            longest = max(words, key=len)
+            if len(longest) >= self.ngram_length:
+                result = self.filter(self.lookup(longest), words)
+            else:
+                # Too short for trigrams. Every contact has to be checked.
+                other_words = list(words)
+                other_words.remove(longest)
+                result = self.filter(self.scan(longest), other_words)
+
+        overlap = self.may_overlap(words)
+        if overlap:
+            # Every word has a substring but they might be sharing it. Only contacts where each word can have its own
+            #  are kept.
+            result = self.keep_fitting(result, words)
+
+        if len(words) == 1:
+            ranking = self.rank_single_word(result, words[0])
+        else:
+            ranking = self.rank(result, words, overlap)
+
+        # Results are also kept in alphabetical order. This way the next keystroke can narrow them.
+        self._last_words, self._last_result, self._last_ranking = words, result, ranking
+        return list(ranking)
+
+    def rank_single_word(self, contacts: List["Contact"], word: str) -> List["Contact"]:
+        """
+        This method moves to the top the contacts whose name begins with word and, if they don't fill the visible
+        rows, the first contacts where word begins another word of the name or the address.
+
+        The relevance is the same as rank() without computing any score.
+        """
+        # Names beginning with word are a contiguous range of rows and all of them match.
+        first_row = bisect_left(self._lower_name_list, word)
+        last_row = bisect_left(self._lower_name_list, word + "\uffff")
+        start = self.result_row(contacts, first_row)
+        end = start + last_row - first_row
+        name_start = contacts[start:end]
+        others = contacts[:start] + contacts[end:]
+
+        missing = self.visible_rows - len(name_start)
+        if missing <= 0:
+            return name_start + others
+
+        lower_names, lower_addresses = self._lower_names, self._lower_addresses
+        space_word = " " + word
+        word_start = list()
+        checked = 0
+        for contact in islice(others, self.rank_limit):
+            checked += 1
+            if space_word in lower_names[contact] or lower_addresses[contact].startswith(word):
+                word_start.append(contact)
+                if len(word_start) == missing:
+                    break
+
+        moved = set(word_start)
+        return name_start + word_start + [contact for contact in others[:checked] if contact not in moved] + \
+            others[checked:]
+
+    def rank(self, contacts: List["Contact"], words: List[str], overlap: bool) -> List["Contact"]:
+        """
+        This method moves to the top, sorted by relevance, the visible_rows most relevant contacts.
+
+        Every word gets the best of its substrings: the beginning of the name is better than the beginning of another
+        word, which is better than the inside of a word. The beginning of the address counts as the beginning of a word.
+        Contacts whose name begins with a word are scored first, then the others in alphabetical order. Scoring stops
+        when visible_rows of them get the best score possible (see best_score) or after rank_limit of them.
+        When words can overlap, scores ignore it: two words might be given the same substring. Only the top rows are
+        then sorted again by their exact relevance, so a contact just below them might deserve to be among them.
+        (See assign)
+        """
+        phrase = " ".join(words)
+        contiguous = len(phrase) * self.score_contiguous
+        # (word, " " + word, points at the beginning of the name, of a word or of the address, inside a word)
+        points = [
+            (
+                word, " " + word, self.score_name_start * len(word),
+                max(self.score_word_start, self.score_address_start) * len(word), self.score_inside_word * len(word)
+            )
+            for word in words
+        ]
+        best = self.best_score(words)
+
+        # Names beginning with a word are a contiguous range of rows.
+        name_starts = list()
+        for word in sorted(set(words), key=len, reverse=True):
+            first_row = bisect_left(self._lower_name_list, word)
+            last_row = bisect_left(self._lower_name_list, word + "\uffff")
+            name_starts.append(contacts[self.result_row(contacts, first_row):self.result_row(contacts, last_row)])
+
+        lower_names, lower_addresses = self._lower_names, self._lower_addresses
+        scores = dict()
+        best_found = 0
+        for contact in chain(*name_starts, contacts):
+            if contact in scores:
+                continue
+            lower_name, lower_address = lower_names[contact], lower_addresses[contact]
+            total = contiguous if phrase in lower_name else 0
+            for word, space_word, name_start, word_start, inside_word in points:
+                if lower_name.startswith(word):
+                    total += name_start
+                elif lower_address.startswith(word) or space_word in lower_name:
+                    total += word_start
+                else:
+                    total += inside_word
+            scores[contact] = total
+            if total == best:
+                best_found += 1
+            if best_found == self.visible_rows or len(scores) == self.rank_limit:
+                break
+
+        # Equally relevant contacts remain in alphabetical order.
+        top = sorted(scores, key=self.positions().__getitem__)
+        top.sort(key=scores.__getitem__, reverse=True)
+        del top[self.visible_rows:]
+        if overlap:
+            top.sort(key=self.positions().__getitem__)
+            exact = {contact: self.assign(words, lower_names[contact], lower_addresses[contact]) for contact in top}
+            top.sort(key=exact.__getitem__, reverse=True)
+
+        moved = set(top)
+        return top + [contact for contact in contacts if contact not in moved]
+
+    @staticmethod
+    def best_score(words: List[str]) -> int:
+        """
+        This method returns the highest score that rank() can give for words.
+
+        Only words that begin the longest of them that begins the name get the points of the name beginning.
+        """
+        best = 0
+        for first in words:
+            total = len(" ".join(words)) * ContactIndex.score_contiguous
+            for word in words:
+                if first.startswith(word):
+                    total += ContactIndex.score_name_start * len(word)
+                else:
+                    total += max(ContactIndex.score_word_start, ContactIndex.score_address_start) * len(word)
+            best = max(best, total)
+        return best
+
+    def result_row(self, contacts: List["Contact"], row: int) -> int:
+        """
+        This method returns where the contact at row, or the first one after it, is among contacts. They have to be
+        in alphabetical order.
+        """
+        positions = self.positions()
+        first, last = 0, len(contacts)
+        while first < last:
+            middle = (first + last) // 2
+            if positions[contacts[middle]] < row:
+                first = middle + 1
+            else:
+                last = middle
+        return first
+
+    def narrows_last_search(self, words: List[str]) -> bool:
+        """
+        This method tells if the result of words is surely a subset of the last result.
+
+        That's the case if every word of the last query is the beginning of the word in the same place now. More words
+        can only narrow the result.
+        """
+        if self._last_words is None or len(words) < len(self._last_words):
+            return False
+        return all(word.startswith(last_word) for word, last_word in zip(words, self._last_words))
+
+    @staticmethod
+    def may_overlap(words: List[str]) -> bool:
+        """
+        This method tells if two words of the query could ever match overlapping substrings.
+
+        That can only happen if a word contains another one or if the end of a word is the beginning of another one.
+        Otherwise any substring found for each word is automatically distinct from the others.
+        """
+        for i, word in enumerate(words):
+            for other in words[i + 1:]:
+                if word in other or other in word:
+                    return True
+                for length in range(1, min(len(word), len(other))):
+                    if word.endswith(other[:length]) or other.endswith(word[:length]):
+                        return True
+        return False
+
+    def keep_fitting(self, contacts: List["Contact"], words: List[str]) -> List["Contact"]:
+        """
+        This method returns, in the same order, the contacts where each word can have its own substring.
+        """
+        lower_names, lower_addresses = self._lower_names, self._lower_addresses
+        if len(words) > self.max_pattern_words:
+            return [contact for contact in contacts if self.fits(words, lower_names[contact], lower_addresses[contact])]
+
+        # A word can also take the beginning of the address. The others then share the name.
+        # Names are matched inside map() and compress(), without going through contacts one by one in Python.
+        names = list(map(lower_names.__getitem__, contacts))
+        # Matches are turned into booleans right away. Keeping thousands of them alive would wake up the garbage
+        #  collector.
+        fitting = list(map(bool, map(self.fit_pattern(tuple(words)).search, names)))
+        # Only the contacts rejected by their name are checked again giving a word the address. Patterns are made
+        #  beforehand, objects made for every contact would wake up the garbage collector too.
+        address_options = [
+            (word, self.fit_pattern(tuple(words[:i] + words[i + 1:]))) for i, word in enumerate(words)
+        ]
+        for row in compress(range(len(contacts)), map(not_, fitting)):
+            lower_address = lower_addresses[contacts[row]]
+            for word, pattern in address_options:
+                if lower_address.startswith(word) and pattern.search(names[row]):
+                    fitting[row] = True
+                    break
+        return list(compress(contacts, fitting))
+
+    @staticmethod
+    @lru_cache(64)
+    def fit_pattern(words: Tuple[str, ...]) -> Pattern:
+        """
+        This method returns a regular expression that matches names where each word has its own substring.
+
+        That's the case if the words appear one after the other, in some order, without sharing characters. So the
+        expression tries every order. (i.e.: "an a" becomes "an.*a|a.*an")
+        """
+        orders = sorted(set(permutations(re.escape(word) for word in words)))
+        return re.compile("|".join(".*".join(order) for order in orders))
+
+    @staticmethod
+    def position_score(lower_name: str, start: int) -> int:
+        if start == 0:
+            return ContactIndex.score_name_start
+        if lower_name[start - 1] == ' ':
+            return ContactIndex.score_word_start
+        return ContactIndex.score_inside_word
+
+    @staticmethod
+    def contiguity_score(words: List[str], lower_name: str) -> int:
+        if len(words) < 2:
+            return 0
+        phrase = " ".join(words)
+        return len(phrase) * ContactIndex.score_contiguous if phrase in lower_name else 0
+
+    @staticmethod
+    def fits(words: List[str], lower_name: str, lower_address: str) -> bool:
+        """
+        This method tells if each word can have its own substring. It's used for queries with too many words for
+        fit_pattern().
+
+        Most of the times taking the first free substring of every word, longest words first, is enough. Only when
+        that fails all the ways are tried with assign().
+        """
+        free_name, address_free = lower_name, True
+        for word in sorted(words, key=len, reverse=True):
+            start = free_name.find(word)
+            if start != -1:
+                # Characters taken are replaced by a space which can't be part of a word.
+                free_name = free_name[:start] + ' ' * len(word) + free_name[start + len(word):]
+            elif address_free and lower_address.startswith(word):
+                address_free = False
+            else:
+                return ContactIndex.assign(words, lower_name, lower_address) is not None
+        return True
+
+    @staticmethod
+    def assign(words: List[str], lower_name: str, lower_address: str) -> Optional[int]:
+        """
+        This method gives each word its own substring, with no characters in common with the others, so that the
+        total relevance is the highest. It returns that relevance or None if there's no way to do it.
+
+        The address comes right after the name, this way a word matching its beginning is just another substring.
+        """
+        address_start = len(lower_name) + 1
+
+        options = list()
+        for word in words:
+            length = len(word)
+            # (points, start, end) of every substring matching word.
+            substrings = list()
+            start = lower_name.find(word)
+            while start != -1:
+                substrings.append(
+                    (ContactIndex.position_score(lower_name, start) * length, start, start + length)
+                )
+                start = lower_name.find(word, start + 1)
+            if lower_address.startswith(word):
+                substrings.append(
+                    (ContactIndex.score_address_start * length, address_start, address_start + length)
+                )
+            if not substrings:
+                return None
+
+            substrings.sort(reverse=True)
+            options.append(substrings)
+
+        # Words with fewer choices go first. This way dead ends are found sooner.
+        options.sort(key=len)
+
+        best = ContactIndex.best_assignment(options, 0, ())
+        if best is None:
+            return None
+        return best + ContactIndex.contiguity_score(words, lower_name)
+
+    @staticmethod
+    def best_assignment(options: List[List[Tuple[int, int, int]]], i: int, taken: Tuple[Tuple[int, int], ...]) \
+            -> Optional[int]:
+        """
+        This method returns the most points that words from the i-th onward can get without using taken characters.
+        """
+        if i == len(options):
+            return 0
+
+        best = None
+        for points, start, end in options[i]:
+            for taken_start, taken_end in taken:
+                if start < taken_end and taken_start < end:
+                    break
+            else:
+                rest = ContactIndex.best_assignment(options, i + 1, taken + ((start, end),))
+                if rest is not None and (best is None or points + rest > best):
+                    best = points + rest
+        return best
+
+    def positions(self) -> Dict["Contact", int]:
+        """
+        This method returns the position of every contact in the list sorted by name.
+        """
+        if self._positions is None:
+            self._positions = {contact: i for i, contact in enumerate(self._contacts)}
+        return self._positions
+
+    def address_matches(self, word: str) -> List["Contact"]:
+        """
+        This method returns the contacts whose address begins with word.
+        """
+        first, last = bisect_left(self._addresses, word), bisect_left(self._addresses, word + "\uffff")
+        return self._address_contacts[first:last]
+
+    def lookup(self, word: str) -> List["Contact"]:
+        """
+        This method returns, sorted by name, a superset of the contacts matching word using the indexes.
+
+        word has to be at least ngram_length long.
+        """
+        sets = sorted((self._ngrams.get(ngram, set()) for ngram in self.ngrams(word)), key=len)
+        result = set(sets[0]).intersection(*sets[1:])
+        result.update(self.address_matches(word))
+
+        # Sorting few contacts is cheap. Many contacts are taken in order from the sorted list instead.
+        if len(result) < len(self._contacts) // 8:
+            return sorted(result, key=self.positions().__getitem__)
+        return [contact for contact in self._contacts if contact in result]
+
+    def scan(self, word: str) -> List["Contact"]:
+        """
+        This method returns, sorted by name, the contacts matching word checking all of them.
+        """
+        mask = [word in lower_name for lower_name in self._lower_name_list]
+        positions = self.positions()
+        for contact in self.address_matches(word):
+            mask[positions[contact]] = True
+        return list(compress(self._contacts, mask))
+
+    def filter(self, contacts: List["Contact"], words: List[str]) -> List["Contact"]:
+        """
+        This method returns, in the same order, the contacts that really match every word.
+        """
+        lower_names = self._lower_names
+        for word in words:
+            address_matches = set(self.address_matches(word))
+            contacts = [
+                contact for contact in contacts if word in lower_names[contact] or contact in address_matches
+            ]
+        return contacts
@@ -0,0 +1,307 @@
+"""
+This file contains the stores that keep contact thumbnails on disk.
+
+By default every thumbnail is a file of its own. Setting the environment variable named in
+ProjectConstants.envvar_thumbnail_atlas to 1 packs all of them in a single file instead. That saves thousands of
+open/stat/read system calls when Contacts is opened, which matters on network home directories.
+
+Nothing here depends on Qt. Thumbnails are stored as encoded bytes (PNG) and keys are file names.
+(See misc.Entities.Contact.thumbnail_file_name)
+"""
+
+
+# Local project
+import misc.Constants as ProjectConstants
+
+# Python standard libraries
+import mmap
+import struct
+from functools import lru_cache
+from os import environ, fsync, path, remove, replace
+from sys import stderr
+from threading import RLock, Thread
+from typing import Dict, Optional, Tuple
+
+
+class FileThumbnailStore:
+    """
+    This class keeps every thumbnail in a file of its own inside folder.
+    """
+    def __init__(self, folder: str):
+        self.folder = folder
+
+    def __contains__(self, key: str) -> bool:
+        return path.exists(path.join(self.folder, key))
+
+    def read(self, key: str) -> Optional[bytes]:
+        try:
+            with open(path.join(self.folder, key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, key: str, data: bytes):
+        # Written aside and then moved so that a thumbnail is never found half written.
+        file = path.join(self.folder, key)
+        with open(file + ".tmp", 'wb') as f:
+            f.write(data)
+        replace(file + ".tmp", file)
+
+    def discard(self, key: str):
+        file = path.join(self.folder, key)
+        if path.exists(file):
+            remove(file)
+
+
+class ThumbnailAtlas:
+    """
+    This class keeps every thumbnail inside a single file which is read through mmap.
+
+    The file is a sequence of records: header, key (UTF-8) and data. Headers tell if the record is live or free so
+    the offset index is rebuilt with a single pass over the mapped file when it's opened. A record cut short by a crash
+    is dropped.
+    Thumbnails are only appended. The map is extended the first time a thumbnail beyond its end is read. A discarded one
+    is marked as free in place and its bytes are given back by compaction which runs in a background thread once free
+    bytes are a good part of the file.
+    It's safe to use from any thread.
+    """
+    # magic, state, length of the key, length of the data
+    record_header = struct.Struct("<4sBHI")
+    magic = b"THMB"
+    state_free = 0
+    state_live = 1
+
+    # Compaction starts when free bytes are at least this fraction of the file and at least compaction_min_bytes.
+    compaction_ratio = 0.5
+    compaction_min_bytes = 2**20
+
+    def __init__(self, file: str):
+        self.file = file
+        self.lock = RLock()
+
+        # key -> (offset of the record, offset of the data, length of the data)
+        self.index: Dict[str, Tuple[int, int, int]] = dict()
+        # Size of the file. The map can be shorter.
+        self.size = 0
+        self.free_bytes = 0
+        self.compacting = False
+
+        self.f = None
+        self.map = None
+        with self.lock:
+            self.open()
+        self.compact_if_needed()
+
+    def open(self):
+        """
+        This method opens the file, maps it and rebuilds the index. The lock must be held.
+        """
+        if not path.exists(self.file):
+            open(self.file, 'wb').close()
+        self.f = open(self.file, 'r+b')
+        self.remap()
+
+        self.index.clear()
+        self.free_bytes = 0
+        size = len(self.map) if self.map else 0
+        offset = 0
+        while offset + self.record_header.size <= size:
+            magic, state, key_length, data_length = self.record_header.unpack_from(self.map, offset)
+            key_offset = offset + self.record_header.size
+            data_offset = key_offset + key_length
+            end = data_offset + data_length
+            if magic != self.magic or end > size:
+                break
+
+            if state == self.state_live:
+                key = bytes(self.map[key_offset:data_offset]).decode()
+                self.index[key] = (offset, data_offset, data_length)
+            else:
+                self.free_bytes += end - offset
+            offset = end
+
+        if offset < size:
+            # Whatever follows the last complete record was being written when the application stopped.
+            print("Dropping {} bytes at the end of {}".format(size - offset, self.file), file=stderr)
+            self.close_map()
+            self.f.truncate(offset)
+            self.remap()
+        self.size = offset
+
+    def remap(self):
+        self.close_map()
+        self.f.seek(0, 2)
+        # An empty file can't be mapped.
+        if self.f.tell():
+            self.map = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close_map(self):
+        if self.map:
+            self.map.close()
+            self.map = None
+
+    def close(self):
+        with self.lock:
+            self.close_map()
+            if self.f:
+                self.f.close()
+                self.f = None
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            return key in self.index
+
+    def read(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return None
+            _, data_offset, data_length = entry
+            if self.map is None or data_offset + data_length > len(self.map):
+                # Stored after the file was last mapped.
+                self.remap()
+            return self.map[data_offset:data_offset + data_length]
+
+    def store(self, key: str, data: bytes):
+        """
+        This method appends a thumbnail. Keys are derived from the content so a key that is already there is skipped.
+        """
+        encoded_key = key.encode()
+        with self.lock:
+            if key in self.index:
+                return
+
+            offset = self.size
+            self.f.seek(offset)
+            self.write_record(self.f, encoded_key, data)
+            # read() maps the file again only when it needs this thumbnail.
+            self.f.flush()
+
+            data_offset = offset + self.record_header.size + len(encoded_key)
+            self.index[key] = (offset, data_offset, len(data))
+            self.size = data_offset + len(data)
+
+    def write_record(self, f, encoded_key: bytes, data: bytes):
+        f.write(self.record_header.pack(self.magic, self.state_live, len(encoded_key), len(data)))
+        f.write(encoded_key)
+        f.write(data)
+
+    def discard(self, key: str):
+        """
+        This method marks a thumbnail as free. Its bytes stay in the file until the next compaction.
+        """
+        with self.lock:
+            entry = self.index.pop(key, None)
+            if entry is None:
+                return
+
+            offset, data_offset, data_length = entry
+            # The state is the byte right after the magic.
+            self.f.seek(offset + len(self.magic))
+            self.f.write(bytes([self.state_free]))
+            self.f.flush()
+            self.free_bytes += data_offset + data_length - offset
+
+        self.compact_if_needed()
+
+    def compact_if_needed(self):
+        with self.lock:
+            if (
+                    self.compacting or
+                    self.free_bytes < self.compaction_min_bytes or
+                    self.free_bytes < self.size * self.compaction_ratio
+            ):
+                return
+            self.compacting = True
+
+        Thread(target=self.compact, name="ThumbnailAtlasCompaction", daemon=True).start()
+
+    def compact(self):
+        """
+        This method rewrites the file with live thumbnails only.
+
+        Thumbnails are copied without holding the lock since records are never changed once written, only marked as
+        free. The lock is taken at the end to copy what was stored meanwhile and to swap the files.
+        The new file is complete on disk before it takes the place of the old one so a crash leaves one or the other.
+        """
+        temp_file = self.file + ".compact"
+        try:
+            with self.lock:
+                snapshot = dict(self.index)
+
+            # key -> offset of the record in the new file
+            copied = dict()
+            with open(self.file, 'rb') as source, open(temp_file, 'wb') as f:
+                for key, (_, data_offset, data_length) in snapshot.items():
+                    source.seek(data_offset)
+                    copied[key] = f.tell()
+                    self.write_record(f, key.encode(), source.read(data_length))
+                f.flush()
+                fsync(f.fileno())
+
+            with self.lock:
+                with open(self.file, 'rb') as source, open(temp_file, 'r+b') as f:
+                    f.seek(0, 2)
+                    for key, (_, data_offset, data_length) in self.index.items():
+                        if key not in snapshot:
+                            source.seek(data_offset)
+                            self.write_record(f, key.encode(), source.read(data_length))
+                    for key in snapshot.keys() - self.index.keys():
+                        # The state is the byte right after the magic.
+                        f.seek(copied[key] + len(self.magic))
+                        f.write(bytes([self.state_free]))
+                    f.flush()
+                    fsync(f.fileno())
+
+                # Windows doesn't replace a file that is open.
+                self.close()
+                replace(temp_file, self.file)
+                self.open()
+        except Exception as e:
+            if __debug__:
+                print(type(e), str(e), file=stderr)
+            print("Could not compact {}".format(self.file), file=stderr)
+            with self.lock:
+                if self.f is None:
+                    self.open()
+        finally:
+            self.compacting = False
+
+
+class AtlasThumbnailStore(ThumbnailAtlas):
+    """
+    This class is a ThumbnailAtlas that takes over thumbnails previously saved as files.
+
+    A thumbnail missing from the atlas is looked for among the files. If found, it's moved into the atlas.
+    """
+    def __init__(self, file: str, file_store: FileThumbnailStore):
+        super().__init__(file)
+
+        self.file_store = file_store
+
+    def __contains__(self, key: str) -> bool:
+        return super().__contains__(key) or key in self.file_store
+
+    def read(self, key: str) -> Optional[bytes]:
+        data = super().read(key)
+        if data is None:
+            data = self.file_store.read(key)
+            if data is not None:
+                self.store(key, data)
+                self.file_store.discard(key)
+        return data
+
+    def discard(self, key: str):
+        super().discard(key)
+        self.file_store.discard(key)
+
+
+@lru_cache(1)
+def thumbnail_store():
+    """
+    This function returns the store of contact thumbnails chosen for this run of the application.
+    """
+    file_store = FileThumbnailStore(ProjectConstants.fullpath_thumbnail_cache)
+    if environ.get(ProjectConstants.envvar_thumbnail_atlas) == "1":
+        return AtlasThumbnailStore(ProjectConstants.fullpath_thumbnail_atlas, file_store)
+    return file_store
@@ -0,0 +1,357 @@
+"""
+This file contains the HTTP transport shared by kmd, algod and indexer clients.
+
+algosdk issues every request through urllib.request.urlopen which opens a brand new connection each time. Every call
+to the node pays again for the TCP handshake (and TLS handshake if any). Here we keep a bounded pool of keep-alive
+connections for each endpoint and we route algosdk requests through it.
+"""
+
+
+# Algorand
+import algosdk.kmd
+import algosdk.v2client.algod
+import algosdk.v2client.indexer
+
+# Local project
+from misc.Diagnostics import call_log
+
+# Python standard libraries
+import http.client
+import socket
+from contextlib import contextmanager
+from io import BytesIO
+from queue import LifoQueue, Empty
+from threading import BoundedSemaphore, Event, Lock, local
+from time import monotonic
+from typing import Dict, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request
+
+
+class CallCancelled(Exception):
+    """
+    Exception raised when a request is about to be sent on behalf of a call that has been cancelled.
+    """
+    pass
+
+
+class CancelToken:
+    """
+    This class is a flag that a thread can raise to tell another one that its work is not needed anymore.
+
+    A token can have a parent. Cancelling the parent cancels all its children at once.
+    """
+    def __init__(self, parent: "CancelToken" = None):
+        self.parent = parent
+        self._event = Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._event.is_set() or (self.parent is not None and self.parent.is_cancelled())
+
+
+# Each worker thread sets here the deadline, the cancel token and the service of the call it is running.
+#  This way every request issued by algosdk on behalf of that call can be bounded in time, stopped and recorded.
+_call_context = local()
+
+
+@contextmanager
+def call_context(deadline: float = None, cancel_token: CancelToken = None, service: str = None):
+    """
+    Context manager that binds a deadline (in time.monotonic() seconds), a cancel token and the name of the service
+    to the current thread.
+    """
+    _call_context.deadline, _call_context.cancel_token, _call_context.service = deadline, cancel_token, service
+    try:
+        yield
+    finally:
+        _call_context.deadline, _call_context.cancel_token, _call_context.service = None, None, None
+
+
+def request_timeout(default: float = None) -> float:
+    """
+    This function returns the timeout for the next request in the current thread.
+
+    It raises CallCancelled if the call has been cancelled and socket.timeout if its deadline has passed.
+    """
+    cancel_token = getattr(_call_context, "cancel_token", None)
+    if cancel_token and cancel_token.is_cancelled():
+        raise CallCancelled("The call has been cancelled")
+
+    deadline = getattr(_call_context, "deadline", None)
+    if deadline is None:
+        return default
+
+    remaining = deadline - monotonic()
+    if remaining <= 0:
+        raise socket.timeout("The call took too long")
+
+    return remaining if default is None else min(remaining, default)
+
+
+class PooledResponse:
+    """
+    Response object with the subset of http.client.HTTPResponse interface that algosdk uses.
+
+    The body is always read completely before the connection goes back to the pool so this object owns its data.
+    """
+    def __init__(self, url: str, status: int, reason: str, headers: http.client.HTTPMessage, data: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.fp = BytesIO(data)
+
+    def read(self, *args) -> bytes:
+        return self.fp.read(*args)
+
+    def getcode(self) -> int:
+        return self.status
+
+    def info(self) -> http.client.HTTPMessage:
+        return self.headers
+
+    def close(self):
+        self.fp.close()
+
+
+class ConnectionPool:
+    """
+    This class holds keep-alive connections toward a single (scheme, host, port).
+
+    At most max_size connections exist at the same time. A thread that asks for a connection while all of them are
+    busy waits until one is given back. This makes it safe to share a pool between all workers in a QThreadPool.
+    """
+    # These are the errors we get when the node closed an idle keep-alive connection on its side.
+    #  The node might have received the request anyway if the error came while waiting for the response.
+    stale_connection_errors = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+    # Requests that the node can receive twice with the same outcome. Only these are sent again once written.
+    idempotent_methods = {"GET", "HEAD", "DELETE"}
+
+    def __init__(self, scheme: str, host: str, port: int, max_size: int = 4, timeout: float = None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+        self._slots = BoundedSemaphore(max_size)
+        # Last in first out so that we keep reusing the connection that most likely is still alive.
+        self._idle = LifoQueue()
+        # Connections that are waiting for the node. We need them to abort pending requests.
+        self._in_use = set()
+        self._in_use_lock = Lock()
+
+    def new_connection(self) -> http.client.HTTPConnection:
+        connection_type = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return connection_type(self.host, self.port, timeout=self.timeout)
+
+    def request(self, method: str, url: str, body: bytes = None, headers: Dict = None) \
+            -> Tuple[int, str, http.client.HTTPMessage, bytes]:
+        """
+        This method issues a request and returns (status, reason, headers, body) of the response.
+        """
+        # Waiting for a free connection counts against the deadline too.
+        if not self._slots.acquire(timeout=request_timeout(self.timeout)):
+            raise socket.timeout("The call took too long waiting for a connection")
+        try:
+            # The call might have been cancelled, or run out of time, while waiting.
+            timeout = request_timeout(self.timeout)
+
+            try:
+                connection, reused = self._idle.get_nowait(), True
+            except Empty:
+                connection, reused = self.new_connection(), False
+
+            written = False
+            try:
+                with self._tracked(connection):
+                    self._send(connection, method, url, body, headers, timeout)
+                    written = True
+                    response = self._receive(connection)
+            except self.stale_connection_errors:
+                connection.close()
+                # A fresh connection can't be stale. A request that was written might have reached the node already,
+                #  sending it again must do no harm.
+                if not reused or (written and method not in self.idempotent_methods):
+                    raise
+                # The request might have been aborted on purpose. In that case the call is cancelled and this raises.
+                timeout = request_timeout(self.timeout)
+                connection = self.new_connection()
+                try:
+                    with self._tracked(connection):
+                        self._send(connection, method, url, body, headers, timeout)
+                        response = self._receive(connection)
+                except Exception:
+                    connection.close()
+                    raise
+            except Exception:
+                connection.close()
+                raise
+
+            status, reason, response_headers, data, will_close = response
+            if will_close:
+                connection.close()
+            else:
+                self._idle.put(connection)
+        finally:
+            self._slots.release()
+
+        return status, reason, response_headers, data
+
+    @contextmanager
+    def _tracked(self, connection: http.client.HTTPConnection):
+        with self._in_use_lock:
+            self._in_use.add(connection)
+        try:
+            yield
+        finally:
+            with self._in_use_lock:
+                self._in_use.discard(connection)
+
+    @staticmethod
+    def _send(connection: http.client.HTTPConnection, method: str, url: str, body: bytes, headers: Dict,
+              timeout: float):
+        # The timeout applies to every single blocking operation on the socket. (connect, send, recv)
+        connection.timeout = timeout
+        if connection.sock is None:
+            connection.connect()
+            # On a long lived connection Nagle's algorithm and delayed ACK would stall small requests for ~40 ms.
+            connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            connection.sock.settimeout(timeout)
+
+        # algosdk gives us a bytearray. http.client only sends headers and body together if the body is bytes.
+        if isinstance(body, bytearray):
+            body = bytes(body)
+
+        connection.request(method, url, body=body, headers=headers or {})
+
+    @staticmethod
+    def _receive(connection: http.client.HTTPConnection) -> Tuple:
+        response = connection.getresponse()
+        # The whole body has to be read before the connection can be used again.
+        data = response.read()
+        return response.status, response.reason, response.headers, data, response.will_close
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                break
+
+    def abort(self):
+        """
+        This method makes every request waiting for the node fail right away.
+
+        Shutting down the socket wakes up the thread blocked on it. That thread will then close the connection.
+        """
+        with self._in_use_lock:
+            for connection in self._in_use:
+                try:
+                    connection.sock.shutdown(socket.SHUT_RDWR)
+                except (AttributeError, OSError):
+                    pass
+
+
+class PoolManager:
+    """
+    This class maps every endpoint to its own ConnectionPool and exposes a drop-in replacement for urlopen.
+    """
+    def __init__(self, max_size: int = 4, timeout: float = None):
+        self.max_size = max_size
+        self.timeout = timeout
+
+        self._pools = dict()
+        self._lock = Lock()
+
+    def get_pool(self, scheme: str, host: str, port: int) -> ConnectionPool:
+        key = (scheme, host, port)
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = ConnectionPool(scheme, host, port, self.max_size, self.timeout)
+            return self._pools[key]
+
+    def urlopen(self, request: Request, data: bytes = None, timeout: float = None) -> PooledResponse:
+        """
+        This method has the same behaviour as urllib.request.urlopen as far as algosdk is concerned.
+
+        It raises HTTPError for status codes >= 400 and URLError if the node can't be reached.
+        """
+        # timeout is accepted for the sake of compatibility. Pools have their own.
+        if isinstance(request, str):
+            request = Request(request, data)
+        elif data is not None:
+            request.data = data
+
+        split_url = urlsplit(request.full_url)
+        scheme = split_url.scheme or "http"
+        port = split_url.port or (443 if scheme == "https" else 80)
+        path = split_url.path or "/"
+        if split_url.query:
+            path += "?" + split_url.query
+
+        headers = dict(request.header_items())
+        # We are going to reuse the connection. urllib always asks for it to be closed.
+        headers["Connection"] = "keep-alive"
+        if request.data is not None and "Content-type" not in headers:
+            headers["Content-type"] = "application/x-www-form-urlencoded"
+
+        start = monotonic()
+        status, body, outcome = None, b"", None
+        try:
+            status, reason, response_headers, body = self.get_pool(scheme, split_url.hostname, port).request(
+                request.get_method(), path, request.data, headers
+            )
+        except OSError as e:
+            outcome = type(e).__name__
+            raise URLError(e)
+        except Exception as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            call_log.record(
+                getattr(_call_context, "service", None) or "unknown", request.get_method(), path,
+                monotonic() - start, len(request.data or b"") + len(body),
+                outcome or ("ok" if status < 400 else f"http {status}")
+            )
+
+        if status >= 400:
+            raise HTTPError(request.full_url, status, reason, response_headers, BytesIO(body))
+
+        return PooledResponse(request.full_url, status, reason, response_headers, body)
+
+    def abort(self):
+        """
+        This method aborts every request in flight toward any endpoint.
+        """
+        with self._lock:
+            for pool in self._pools.values():
+                pool.abort()
+
+    def clear(self):
+        """
+        This method closes every idle connection and forgets all pools. This is needed when endpoints change.
+        """
+        with self._lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+
+
+# This is the single transport shared by all clients in the application.
+#  A node that doesn't answer for this many seconds on a socket is considered hung.
+pool_manager = PoolManager(timeout=10)
+
+
+def install():
+    """
+    This function makes kmd, algod and indexer clients send their requests through pool_manager.
+
+    algosdk doesn't allow to plug in a transport so we rebind the urlopen name that each client module imported.
+    """
+    for module in [algosdk.kmd, algosdk.v2client.algod, algosdk.v2client.indexer]:
+        module.urlopen = pool_manager.urlopen
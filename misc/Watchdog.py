@@ -0,0 +1,93 @@
+"""
+This file contains a watchdog that reports when the Qt main loop stops processing events.
+
+It's opt-in. main.py starts it when the environment variable named in ProjectConstants.envvar_watchdog is set to the
+number of milliseconds after which the GUI is considered stalled.
+"""
+
+
+# PySide2
+from PySide2 import QtCore
+
+# Python standard libraries
+import sys
+import traceback
+from os import path
+from threading import Event, Thread, get_ident
+from time import monotonic
+
+
+class EventLoopWatchdog:
+    """
+    This class detects stalls of the Qt main loop.
+
+    A QTimer in the main thread keeps updating a heartbeat. A background thread checks it and, if the heartbeat is older
+    than threshold_ms, captures the Python stack of the main thread right away. Once the main loop is back the stall
+    is reported on stderr with its duration, the slot that caused it and the captured stack.
+    """
+    project_path = path.dirname(path.dirname(path.abspath(__file__)))
+
+    def __init__(self, threshold_ms: int):
+        self.threshold = threshold_ms / 1000
+        # We want to notice a stall well before it's over.
+        self.check_interval = max(self.threshold / 4, 0.005)
+
+        self.main_thread_id = get_ident()
+        self.last_beat = monotonic()
+
+        self.heartbeat_timer = QtCore.QTimer()
+        self.heartbeat_timer.timeout.connect(self.beat)
+
+        self.stop_event = Event()
+        self.thread = Thread(target=self.watch, name="EventLoopWatchdog", daemon=True)
+
+    def start(self):
+        self.last_beat = monotonic()
+        self.heartbeat_timer.start(int(self.check_interval * 1000))
+        self.thread.start()
+
+    def stop(self):
+        self.heartbeat_timer.stop()
+        self.stop_event.set()
+
+    def beat(self):
+        self.last_beat = monotonic()
+
+    def watch(self):
+        """
+        This method runs in the background thread until stop() is called.
+        """
+        stall_start, stack = None, None
+
+        while not self.stop_event.wait(self.check_interval):
+            last_beat = self.last_beat
+
+            if stall_start is None:
+                # The heartbeat timer itself is late by up to one interval even when everything is fine.
+                if monotonic() - last_beat > self.threshold + self.check_interval:
+                    stall_start = last_beat
+                    frame = sys._current_frames().get(self.main_thread_id)
+                    stack = traceback.extract_stack(frame) if frame else traceback.StackSummary()
+            elif last_beat != stall_start:
+                self.report(last_beat - stall_start, stack)
+                stall_start, stack = None, None
+
+    def report(self, duration: float, stack: traceback.StackSummary):
+        print(
+            "GUI stalled for {:.0f} ms in {}\n{}".format(
+                duration * 1000, self.responsible_slot(stack), "".join(stack.format())
+            ),
+            file=sys.stderr
+        )
+
+    def responsible_slot(self, stack: traceback.StackSummary) -> str:
+        """
+        This method returns the first frame of this project that was called by the main loop.
+
+        The frames before it belong to main.py, which is waiting inside app.exec_().
+        """
+        for frame in stack:
+            if frame.filename.startswith(self.project_path) and path.basename(frame.filename) != "main.py":
+                return "{} ({}:{})".format(frame.name, path.relpath(frame.filename, self.project_path), frame.lineno)
+
+        return "unknown slot"
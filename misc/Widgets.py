@@ -6,41 +6,58 @@ This file contains subclasses of PySide2 widgets that are used throughout this p
 # PySide2
 from PySide2 import QtWidgets, QtCore, QtGui
 
+# Local project
+from misc.Models import ObjectListModel
+
 # Python standard libraries
-from typing import Type
+from typing import Any
 
 
-class CustomListWidget(QtWidgets.QListWidget):
+class CustomListView(QtWidgets.QListView):
     """
-    This class is used to implement a QListWidget with some common code used in the project.
+    This class is used to implement a QListView with some common code used in the project.
+
+    Lists in this project show an ObjectListModel. Rows are painted by the delegate of the view so there is no widget
+    for each row.
     """
     def __init__(self, parent: QtWidgets.QWidget):
         super().__init__(parent)
 
-        self.item_type = QtWidgets.QListWidgetItem
         self.timer = None
+        self.loading_widget = None
+
+        # All rows in a list have the same height. This way the view doesn't ask the size of every single row.
+        self.setUniformItemSizes(True)
+
+    def count(self) -> int:
+        return self.model().rowCount() if self.model() else 0
 
-    def set_item_type(self, item_type: Type[QtWidgets.QListWidgetItem]):
-        self.item_type = item_type
+    def current_object(self) -> Any:
+        index = self.currentIndex()
+        return index.data(ObjectListModel.ObjectRole) if index.isValid() else None
+
+    def object_at(self, pos: QtCore.QPoint) -> Any:
+        index = self.indexAt(pos)
+        return index.data(ObjectListModel.ObjectRole) if index.isValid() else None
+
+    def set_current_row(self, row: int):
+        self.setCurrentIndex(self.model().index(row, 0))
 
     def activate_timer(self):
         # We make a LoadingWidget appear after a fixed amount of time. Making it appear instantly would cause weird
         #  effects on the GUI.
         self.timer = QtCore.QTimer()
         self.timer.setSingleShot(True)
-        self.timer.timeout.connect(lambda: self.add_widget(LoadingWidget(self)))
+        self.timer.timeout.connect(self.show_loading)
         self.timer.start(300)
 
-    def add_widget(self, widget: QtWidgets.QWidget):
+    def show_loading(self):
         """
-        This method adds a widget to the list using the custom QListWidgetItem specified in the constructor.
-
-        This method avoids code duplication.
+        This method shows a LoadingWidget on top of the list where the first row would be.
         """
-        item = self.item_type()
-        item.setSizeHint(widget.minimumSizeHint())
-        self.addItem(item)
-        self.setItemWidget(item, widget)
+        self.loading_widget = LoadingWidget(self.viewport())
+        self.loading_widget.setGeometry(0, 0, self.viewport().width(), self.loading_widget.sizeHint().height())
+        self.loading_widget.show()
 
     def clear_loading(self):
         """
@@ -49,8 +66,9 @@ class CustomListWidget(QtWidgets.QListWidget):
         if self.timer and self.timer.isActive():
             self.timer.stop()
             self.timer.timeout.disconnect()
-        elif isinstance(self.itemWidget(self.item(0)), LoadingWidget):
-            self.takeItem(0)
+        elif self.loading_widget:
+            self.loading_widget.close()
+            self.loading_widget = None
 
 
 class StackedQueuedWidget(QtWidgets.QStackedWidget):
@@ -1,5 +1,6 @@
 """
-This file is a script that compiles all .ui files and .qrc files in this project folder and subfolders into a .py file.
+This file is a script that compiles all .ui files in this project folder and subfolders into a .py file and all .qrc
+files into a binary .rcc file.
 This is for the convenience of development only. Once this application is not on development there's no need to run
 this script before main.py
 
@@ -14,7 +15,8 @@ import os
 
 compile_cmds = {
     "ui": lambda source, destination: os.system(f"pyside2-ui {source} -o {destination}"),
-    "rcc": lambda source, destination: os.system(f"pyside2-rcc {source} -o {destination}")
+    # Resources are registered at run time from the binary file. (See graphics/resources.py)
+    "rcc": lambda source, destination: os.system(f"pyside2-rcc -binary {source} -o {destination}")
 }
 
 
@@ -27,7 +29,7 @@ for dirpath, dirnames, filenames in os.walk(os.path.join(os.path.dirname(__file_
 
     # For every .ui file we should check if it has to be recompiled into a new .py file.
     #  (Either .py file doesn't exists or it's older than .ui file)
-    # Same reasoning for every .qrc file.
+    # Same reasoning for every .qrc file and its .rcc file.
     for filename in filenames:
         if filename[-3:] == ".ui" or filename[-4:] == ".qrc":
             qt_fullpath = os.path.join(dirpath, filename)
@@ -35,7 +37,7 @@ for dirpath, dirnames, filenames in os.walk(os.path.join(os.path.dirname(__file_
                 py_fullpath = os.path.join(dirpath, filename[:-3] + ".py")
                 compile_cmd = compile_cmds["ui"]
             else:
-                py_fullpath = os.path.join(dirpath, filename[:-4] + ".py")
+                py_fullpath = os.path.join(dirpath, filename[:-4] + ".rcc")
                 compile_cmd = compile_cmds["rcc"]
 
             # If there is a newer .py file of a .ui file then skip. Otherwise compile.